@@ -0,0 +1,537 @@
+"""
+News retention and roll-ups.
+
+With ``NEWS_PARTITIONING`` enabled, news chunks are stored in weekly
+partitions (``app/vector_db/partitioned_store.py``). Once a week is older
+than ``NEWS_RETENTION_WEEKS``, its chunks are rolled up into daily trend
+aggregates (article, ticker, topic and source counts) plus the week's
+headlines, kept in the partition catalog database, and the partition's
+collection is deleted, after being exported to gzip-compressed JSON Lines
+when ``NEWS_RETENTION_ACTION=archive``. Trend reports combine the chunks of
+live partitions with the roll-ups of expired ones, so the vector store stays
+bounded while long-range trends remain available.
+"""
+
+import gzip
+import json
+import sqlite3
+import threading
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.utils.config import config
+from app.utils.logger import get_logger
+from app.vector_db import (
+    TimePartitionedStore,
+    VectorStore,
+    create_vector_store,
+    news_partitions,
+)
+from app.vector_db.partitioned_store import partition_bounds
+
+logger = get_logger(__name__)
+
+# Headlines kept per rolled-up week
+MAX_HEADLINES = 10
+
+# Entries listed per ranking in period summaries
+SUMMARY_TOP_N = 5
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS news_rollups (
+    collection TEXT NOT NULL,
+    day TEXT NOT NULL,
+    partition TEXT NOT NULL,
+    articles INTEGER NOT NULL,
+    tickers TEXT NOT NULL,
+    keywords TEXT NOT NULL,
+    sources TEXT NOT NULL,
+    PRIMARY KEY (collection, day)
+);
+CREATE TABLE IF NOT EXISTS news_period_summaries (
+    collection TEXT NOT NULL,
+    partition TEXT NOT NULL,
+    period_start TEXT NOT NULL,
+    period_end TEXT NOT NULL,
+    headlines TEXT NOT NULL,
+    archive_path TEXT,
+    rolled_up_at TEXT NOT NULL,
+    PRIMARY KEY (collection, partition)
+);
+"""
+
+
+class NewsRetentionError(Exception):
+    """Custom exception for news retention errors."""
+
+    pass
+
+
+def _top(counts: Dict[str, int], n: int = SUMMARY_TOP_N) -> List[List[Any]]:
+    """Most frequent entries of a count dictionary as [name, count] pairs."""
+    return [[name, count] for name, count in Counter(counts).most_common(n)]
+
+
+class NewsRollupStore:
+    """
+    SQLite store of rolled-up news aggregates.
+
+    Daily rows hold article, ticker, topic and source counts; period rows
+    hold the headlines of each expired week. Rolling up a partition again
+    (e.g. after late articles recreated an expired week) adds to the
+    stored counts.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Initialize roll-up store.
+
+        Args:
+            db_path: Path to SQLite database file
+                (default: config.news_partition_db)
+
+        Raises:
+            NewsRetentionError: If the store cannot be opened
+        """
+        self.db_path = Path(db_path or config.news_partition_db)
+        self._lock = threading.Lock()
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                str(self.db_path), check_same_thread=False, isolation_level=None
+            )
+            self._conn.row_factory = sqlite3.Row
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+        except sqlite3.Error as e:
+            raise NewsRetentionError(
+                f"Failed to open news roll-up store {self.db_path}: {str(e)}"
+            ) from e
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def save_rollup(
+        self,
+        collection: str,
+        partition: str,
+        days: Iterable[Dict[str, Any]],
+        headlines: List[str],
+        archive_path: Optional[str] = None,
+    ) -> None:
+        """
+        Store the roll-up of one partition, adding to any earlier roll-up.
+
+        Args:
+            collection: Partitioned collection name
+            partition: Partition name (e.g. "2026w42")
+            days: Daily aggregates with keys day (YYYY-MM-DD), articles,
+                tickers, keywords and sources
+            headlines: Headlines of the week, newest first
+            archive_path: Path of the partition's archive, if archived
+
+        Raises:
+            NewsRetentionError: If the roll-up cannot be written
+        """
+        start, end = partition_bounds(partition)
+        try:
+            with self._lock:
+                self._conn.execute("BEGIN")
+                try:
+                    for day in days:
+                        row = self._conn.execute(
+                            "SELECT articles, tickers, keywords, sources "
+                            "FROM news_rollups WHERE collection = ? AND day = ?",
+                            (collection, day["day"]),
+                        ).fetchone()
+                        articles = day["articles"]
+                        counts = {
+                            field: Counter(day[field])
+                            for field in ("tickers", "keywords", "sources")
+                        }
+                        if row is not None:
+                            articles += row["articles"]
+                            for field, counter in counts.items():
+                                counter.update(json.loads(row[field]))
+                        self._conn.execute(
+                            "INSERT OR REPLACE INTO news_rollups (collection, day, "
+                            "partition, articles, tickers, keywords, sources) "
+                            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                            (
+                                collection,
+                                day["day"],
+                                partition,
+                                articles,
+                                *(
+                                    json.dumps(dict(counts[field]))
+                                    for field in ("tickers", "keywords", "sources")
+                                ),
+                            ),
+                        )
+
+                    row = self._conn.execute(
+                        "SELECT headlines, archive_path FROM news_period_summaries "
+                        "WHERE collection = ? AND partition = ?",
+                        (collection, partition),
+                    ).fetchone()
+                    if row is not None:
+                        headlines = list(
+                            dict.fromkeys(json.loads(row["headlines"]) + headlines)
+                        )
+                        archive_path = archive_path or row["archive_path"]
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO news_period_summaries (collection, "
+                        "partition, period_start, period_end, headlines, "
+                        "archive_path, rolled_up_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            collection,
+                            partition,
+                            start.date().isoformat(),
+                            (end - timedelta(days=1)).date().isoformat(),
+                            json.dumps(headlines[:MAX_HEADLINES]),
+                            archive_path,
+                            datetime.now(timezone.utc).isoformat(),
+                        ),
+                    )
+                    self._conn.execute("COMMIT")
+                except BaseException:
+                    self._conn.execute("ROLLBACK")
+                    raise
+        except sqlite3.Error as e:
+            raise NewsRetentionError(
+                f"Failed to store roll-up of news partition {partition}: {str(e)}"
+            ) from e
+        logger.debug(f"Stored roll-up of news partition {collection}_{partition}")
+
+    def get_daily(
+        self,
+        collection: str,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        exclude_partitions: Iterable[str] = (),
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve daily aggregates, oldest first.
+
+        Args:
+            collection: Partitioned collection name
+            date_from: First day (ISO date or datetime, day precision)
+            date_to: Last day (ISO date or datetime, day precision)
+            exclude_partitions: Partitions to skip (e.g. ones still live)
+
+        Returns:
+            List of dictionaries with keys date (datetime), partition,
+            articles, tickers, keywords and sources
+
+        Raises:
+            NewsRetentionError: If the aggregates cannot be read
+        """
+        query = "SELECT * FROM news_rollups WHERE collection = ?"
+        params: List[Any] = [collection]
+        if date_from:
+            query += " AND day >= ?"
+            params.append(date_from[:10])
+        if date_to:
+            query += " AND day <= ?"
+            params.append(date_to[:10])
+        try:
+            with self._lock:
+                rows = self._conn.execute(query + " ORDER BY day", params).fetchall()
+        except sqlite3.Error as e:
+            raise NewsRetentionError(f"Failed to read news roll-ups: {str(e)}") from e
+
+        excluded = set(exclude_partitions)
+        return [
+            {
+                "date": datetime.fromisoformat(row["day"]),
+                "partition": row["partition"],
+                "articles": row["articles"],
+                "tickers": json.loads(row["tickers"]),
+                "keywords": json.loads(row["keywords"]),
+                "sources": json.loads(row["sources"]),
+            }
+            for row in rows
+            if row["partition"] not in excluded
+        ]
+
+    def get_summaries(
+        self,
+        collection: str,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve summaries of rolled-up weeks overlapping a date range.
+
+        Args:
+            collection: Partitioned collection name
+            date_from: Start of the range (ISO date or datetime)
+            date_to: End of the range (ISO date or datetime)
+
+        Returns:
+            List of dictionaries with keys partition, period_start,
+            period_end, articles, top_tickers, top_topics, top_sources,
+            headlines, archive_path and summary, oldest first
+
+        Raises:
+            NewsRetentionError: If the summaries cannot be read
+        """
+        query = "SELECT * FROM news_period_summaries WHERE collection = ?"
+        params: List[Any] = [collection]
+        if date_from:
+            query += " AND period_end >= ?"
+            params.append(date_from[:10])
+        if date_to:
+            query += " AND period_start <= ?"
+            params.append(date_to[:10])
+        try:
+            with self._lock:
+                rows = self._conn.execute(
+                    query + " ORDER BY period_start", params
+                ).fetchall()
+        except sqlite3.Error as e:
+            raise NewsRetentionError(
+                f"Failed to read news period summaries: {str(e)}"
+            ) from e
+
+        summaries = []
+        for row in rows:
+            days = self.get_daily(collection, row["period_start"], row["period_end"])
+            totals: Dict[str, Counter] = {
+                field: Counter() for field in ("tickers", "keywords", "sources")
+            }
+            for day in days:
+                for field, counter in totals.items():
+                    counter.update(day[field])
+            summary = {
+                "partition": row["partition"],
+                "period_start": row["period_start"],
+                "period_end": row["period_end"],
+                "articles": sum(day["articles"] for day in days),
+                "top_tickers": _top(totals["tickers"]),
+                "top_topics": _top(totals["keywords"]),
+                "top_sources": _top(totals["sources"]),
+                "headlines": json.loads(row["headlines"]),
+                "archive_path": row["archive_path"],
+            }
+            summary["summary"] = self._summary_text(summary)
+            summaries.append(summary)
+        return summaries
+
+    @staticmethod
+    def _summary_text(summary: Dict[str, Any]) -> str:
+        """Render a period summary as one paragraph."""
+        parts = [
+            f"{summary['period_start']} to {summary['period_end']}: "
+            f"{summary['articles']} news articles."
+        ]
+        for label, key in (
+            ("Top tickers", "top_tickers"),
+            ("Top topics", "top_topics"),
+        ):
+            if summary[key]:
+                ranked = ", ".join(f"{name} ({count})" for name, count in summary[key])
+                parts.append(f"{label}: {ranked}.")
+        if summary["headlines"]:
+            parts.append(f"Headlines: {'; '.join(summary['headlines'])}.")
+        return " ".join(parts)
+
+
+class NewsRetentionManager:
+    """
+    Applies the news retention policy to a partitioned news store.
+
+    Expired weekly partitions are rolled up, optionally archived, and
+    dropped.
+    """
+
+    def __init__(
+        self,
+        chroma_store: Optional[VectorStore] = None,
+        rollup_store: Optional[NewsRollupStore] = None,
+        retention_weeks: Optional[int] = None,
+        action: Optional[str] = None,
+        archive_dir: Optional[str] = None,
+    ):
+        """
+        Initialize retention manager.
+
+        Args:
+            chroma_store: Vector store holding the news (default: the
+                configured "documents" store)
+            rollup_store: Roll-up store (default: one at config.news_partition_db)
+            retention_weeks: Weeks of raw chunks to keep
+                (default: config.news_retention_weeks)
+            action: "drop" or "archive" (default: config.news_retention_action)
+            archive_dir: Archive directory (default: config.news_archive_dir)
+
+        Raises:
+            NewsRetentionError: If news partitioning is not enabled or the
+                action is invalid
+        """
+        store = chroma_store or create_vector_store(collection_name="documents")
+        partitions = news_partitions(store)
+        if partitions is None:
+            raise NewsRetentionError(
+                "News partitioning is not enabled (set NEWS_PARTITIONING=true)"
+            )
+        self.partitions: TimePartitionedStore = partitions
+        self.rollup_store = rollup_store or NewsRollupStore(
+            str(self.partitions.catalog_path)
+        )
+        self.retention_weeks = retention_weeks or config.news_retention_weeks
+        self.action = (action or config.news_retention_action).lower()
+        if self.action not in ("drop", "archive"):
+            raise NewsRetentionError(
+                f"Invalid retention action: {self.action}. Must be drop or archive"
+            )
+        self.archive_dir = Path(archive_dir or config.news_archive_dir)
+
+    def expired_partitions(self, now: Optional[datetime] = None) -> List[str]:
+        """
+        Partitions whose articles are all older than the retention period.
+
+        Args:
+            now: Current time, naive UTC (default: now)
+
+        Returns:
+            List of partition names, oldest first
+        """
+        now = now or datetime.now(timezone.utc).replace(tzinfo=None)
+        return self.partitions.expired_partitions(
+            now - timedelta(weeks=self.retention_weeks)
+        )
+
+    def rollup(self, partition: str) -> Dict[str, Any]:
+        """
+        Aggregate the news articles of a partition.
+
+        Args:
+            partition: Partition name
+
+        Returns:
+            Dictionary with keys days (daily aggregates, see
+            NewsRollupStore.save_rollup) and headlines (newest first)
+        """
+        # Imported here: news_trends reads roll-ups from this module
+        from app.analysis.news_trends import NewsTrendsAnalyzer
+
+        analyzer = NewsTrendsAnalyzer(chroma_store=self.partitions.shards[partition])
+        articles = analyzer.get_news_articles()
+
+        days: Dict[str, Dict[str, Any]] = {}
+        start, _ = partition_bounds(partition)
+        for article in articles:
+            date = article["date"]
+            day = (date.date() if date else start.date()).isoformat()
+            aggregate = days.setdefault(
+                day,
+                {
+                    "day": day,
+                    "articles": 0,
+                    "tickers": Counter(),
+                    "keywords": Counter(),
+                    "sources": Counter(),
+                },
+            )
+            aggregate["articles"] += 1
+            aggregate["tickers"].update(article["tickers"])
+            aggregate["keywords"].update(
+                analyzer._extract_keywords(
+                    f"{article['title']} {article['content']}",
+                    config.news_trends_min_word_length,
+                )
+            )
+            if article["source"]:
+                aggregate["sources"][article["source"]] += 1
+
+        headlines = list(
+            dict.fromkeys(article["title"] for article in articles if article["title"])
+        )
+        return {
+            "days": [days[day] for day in sorted(days)],
+            "headlines": headlines[:MAX_HEADLINES],
+        }
+
+    def archive(self, partition: str) -> Path:
+        """
+        Export a partition's chunks to gzip-compressed JSON Lines.
+
+        Each line holds a chunk's id, document and metadata; embeddings are
+        not archived, re-embed chunks when restoring them.
+
+        Args:
+            partition: Partition name
+
+        Returns:
+            Path of the archive file
+        """
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        path = self.archive_dir / (
+            f"{self.partitions.collection_name}_{partition}.jsonl.gz"
+        )
+        stored = self.partitions.shards[partition].get_all()
+        # Append, so a week recreated by late articles extends its archive
+        with gzip.open(path, "at", encoding="utf-8") as f:
+            for doc_id, document, metadata in zip(
+                stored["ids"], stored["documents"], stored["metadatas"]
+            ):
+                record = {"id": doc_id, "document": document, "metadata": metadata}
+                f.write(json.dumps(record, default=str) + "\n")
+        logger.info(f"Archived {len(stored['ids'])} news chunks to {path}")
+        return path
+
+    def apply_retention(
+        self, now: Optional[datetime] = None, dry_run: bool = False
+    ) -> List[str]:
+        """
+        Roll up, archive (if configured) and drop expired partitions.
+
+        Args:
+            now: Current time, naive UTC (default: now)
+            dry_run: Only list the partitions that would expire
+
+        Returns:
+            Names of the expired partitions
+
+        Raises:
+            NewsRetentionError: If a partition cannot be rolled up or dropped
+        """
+        expired = self.expired_partitions(now)
+        if dry_run:
+            return expired
+
+        for partition in expired:
+            try:
+                rollup = self.rollup(partition)
+                archive_path = (
+                    str(self.archive(partition)) if self.action == "archive" else None
+                )
+                self.rollup_store.save_rollup(
+                    self.partitions.collection_name,
+                    partition,
+                    rollup["days"],
+                    rollup["headlines"],
+                    archive_path=archive_path,
+                )
+                self.partitions.drop_partition(partition)
+            except NewsRetentionError:
+                raise
+            except Exception as e:
+                logger.error(
+                    f"Failed to expire news partition {partition}: {str(e)}",
+                    exc_info=True,
+                )
+                raise NewsRetentionError(
+                    f"Failed to expire news partition {partition}: {str(e)}"
+                ) from e
+            logger.info(
+                f"Expired news partition {partition} "
+                f"({sum(day['articles'] for day in rollup['days'])} articles, "
+                f"action={self.action})"
+            )
+        return expired
@@ -3,21 +3,35 @@ News trend analysis module.
 
 Analyzes news articles to identify trending topics, tickers, and patterns
 over time, providing insights into market sentiment and emerging themes.
+With news partitioning enabled, reads only the weekly partitions overlapping
+the requested dates and adds the roll-ups of expired weeks.
 """
 
 import re
 from collections import Counter
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import numpy as np
-import pandas as pd
 
+from app.analysis.news_retention import NewsRetentionError, NewsRollupStore
+from app.utils.lazy_imports import lazy_import
 from app.utils.logger import get_logger
-from app.vector_db.chroma_store import ChromaStore, ChromaStoreError
+from app.vector_db import (
+    VectorStore,
+    VectorStoreError,
+    create_vector_store,
+    news_partitions,
+)
+from app.vector_db.partitioned_store import parse_date
 
 logger = get_logger(__name__)
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+_pd = lazy_import("pandas")
+
 
 class NewsTrendsError(Exception):
     """Custom exception for news trends analysis errors."""
@@ -88,19 +102,19 @@ class NewsTrendsAnalyzer:
 
     def __init__(
         self,
-        chroma_store: Optional[ChromaStore] = None,
+        chroma_store: Optional[VectorStore] = None,
         collection_name: str = "documents",
     ):
         """
         Initialize news trends analyzer.
 
         Args:
-            chroma_store: Optional ChromaStore instance.
-                If None, creates a new instance.
-            collection_name: Name of ChromaDB collection (default: "documents")
+            chroma_store: Optional VectorStore instance.
+                If None, creates one with the configured backend.
+            collection_name: Name of vector store collection (default: "documents")
         """
         if chroma_store is None:
-            self.chroma_store = ChromaStore(collection_name=collection_name)
+            self.chroma_store = create_vector_store(collection_name=collection_name)
         else:
             self.chroma_store = chroma_store
 
@@ -113,7 +127,7 @@ class NewsTrendsAnalyzer:
         limit: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
-        Retrieve news articles from ChromaDB.
+        Retrieve news articles from the vector store.
 
         Args:
             date_from: Start date in ISO format (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS)
@@ -135,18 +149,25 @@ class NewsTrendsAnalyzer:
             # Build where filter for news articles
             where_filter: Dict[str, Any] = {"type": "news_article"}
 
+            # Partitioned news stores match date ranges on a numeric
+            # timestamp and read only the overlapping weeks; other stores
+            # keep dates as strings, which metadata filters can't compare
+            # as ranges, so we'll also filter by date after retrieval
+            if news_partitions(self.chroma_store) is not None:
+                conditions = [where_filter]
+                for operator, value in (("$gte", date_from), ("$lte", date_to)):
+                    if value and parse_date(value) is not None:
+                        conditions.append({"date": {operator: value}})
+                if len(conditions) > 1:
+                    where_filter = {"$and": conditions}
+
             # Get all news articles matching filter
-            collection = self.chroma_store.collection
-            if collection is None:
-                raise NewsTrendsError("Collection is not initialized")
-
-            # Use get() with where filter to retrieve all matching articles
-            # Note: ChromaDB doesn't support complex date range queries directly,
-            # so we'll filter by date after retrieval
-            results = collection.get(
-                where=where_filter,
-                include=["metadatas", "documents"],
-            )
+            results = self.chroma_store.get_all(where=where_filter)
+
+            # Date filter bounds, compared in UTC so dates with and without
+            # a timezone can be mixed
+            earliest = parse_date(date_from) if date_from else None
+            latest = parse_date(date_to) if date_to else None
 
             # Convert to list of article dictionaries
             articles = []
@@ -173,25 +194,11 @@ class NewsTrendsAnalyzer:
                     article_date = None
 
                 # Apply date filters if provided
-                if date_from and article_date:
-                    try:
-                        date_from_dt = datetime.fromisoformat(
-                            date_from.replace("Z", "+00:00")
-                        )
-                        if article_date < date_from_dt:
-                            continue
-                    except (ValueError, AttributeError):
-                        pass
-
-                if date_to and article_date:
-                    try:
-                        date_to_dt = datetime.fromisoformat(
-                            date_to.replace("Z", "+00:00")
-                        )
-                        if article_date > date_to_dt:
-                            continue
-                    except (ValueError, AttributeError):
-                        pass
+                published = parse_date(article_date)
+                if published and earliest and published < earliest:
+                    continue
+                if published and latest and published > latest:
+                    continue
 
                 article = {
                     "id": doc_id,
@@ -219,13 +226,126 @@ class NewsTrendsAnalyzer:
             logger.info(f"Retrieved {len(articles)} news articles")
             return articles
 
-        except ChromaStoreError as e:
-            logger.error(f"ChromaDB error retrieving news articles: {str(e)}")
+        except VectorStoreError as e:
+            logger.error(f"Vector store error retrieving news articles: {str(e)}")
             raise NewsTrendsError(f"Failed to retrieve news articles: {str(e)}") from e
         except Exception as e:
             logger.error(f"Error retrieving news articles: {str(e)}", exc_info=True)
             raise NewsTrendsError(f"Failed to retrieve news articles: {str(e)}") from e
 
+    def get_rollups(
+        self,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve daily roll-ups of expired news partitions.
+
+        Args:
+            date_from: Start date in ISO format (day precision)
+            date_to: End date in ISO format (day precision)
+
+        Returns:
+            List of daily aggregates (see NewsRollupStore.get_daily); empty
+            if news is not partitioned
+
+        Raises:
+            NewsTrendsError: If the roll-ups cannot be read
+        """
+        partitions = news_partitions(self.chroma_store)
+        if partitions is None:
+            return []
+        try:
+            rollup_store = NewsRollupStore(str(partitions.catalog_path))
+            try:
+                return rollup_store.get_daily(
+                    partitions.collection_name,
+                    date_from=date_from,
+                    date_to=date_to,
+                    exclude_partitions=partitions.partitions(),
+                )
+            finally:
+                rollup_store.close()
+        except (NewsRetentionError, VectorStoreError) as e:
+            logger.error(f"Error retrieving news roll-ups: {str(e)}")
+            raise NewsTrendsError(f"Failed to retrieve news roll-ups: {str(e)}") from e
+
+    def get_period_summaries(
+        self,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve summaries of expired news weeks.
+
+        Args:
+            date_from: Start date in ISO format
+            date_to: End date in ISO format
+
+        Returns:
+            List of weekly summaries (see NewsRollupStore.get_summaries);
+            empty if news is not partitioned
+
+        Raises:
+            NewsTrendsError: If the summaries cannot be read
+        """
+        partitions = news_partitions(self.chroma_store)
+        if partitions is None:
+            return []
+        try:
+            rollup_store = NewsRollupStore(str(partitions.catalog_path))
+            try:
+                return rollup_store.get_summaries(
+                    partitions.collection_name, date_from=date_from, date_to=date_to
+                )
+            finally:
+                rollup_store.close()
+        except NewsRetentionError as e:
+            logger.error(f"Error retrieving news period summaries: {str(e)}")
+            raise NewsTrendsError(
+                f"Failed to retrieve news period summaries: {str(e)}"
+            ) from e
+
+    def _rollup_rows(
+        self,
+        rollups: Optional[List[Dict[str, Any]]],
+        articles: List[Dict[str, Any]],
+        field: Optional[str] = None,
+        column: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Rows of rolled-up counts to combine with rows built from articles.
+
+        Roll-up days take the timezone of the article dates so both can be
+        grouped together.
+
+        Args:
+            rollups: Daily roll-ups (see get_rollups)
+            articles: Article dictionaries the rows are combined with
+            field: Roll-up counts to expand ("tickers" or "keywords");
+                None for article counts
+            column: Column name for the counted values
+
+        Returns:
+            List of row dictionaries with date, count and (if field is
+            given) the column
+        """
+        tzinfo = next(
+            (article["date"].tzinfo for article in articles if article.get("date")),
+            None,
+        )
+        rows: List[Dict[str, Any]] = []
+        for rollup in rollups or []:
+            date = rollup["date"].replace(tzinfo=tzinfo)
+            if field is None:
+                rows.append({"date": date, "count": rollup["articles"]})
+            else:
+                rows.extend(
+                    {"date": date, column or field: value, "count": count}
+                    for value, count in rollup[field].items()
+                )
+        return rows
+
     def _parse_tickers(self, tickers_str: str) -> List[str]:
         """
         Parse ticker symbols from comma-separated string.
@@ -248,7 +368,8 @@ class NewsTrendsAnalyzer:
         articles: List[Dict[str, Any]],
         period: str = "daily",
         top_n: int = 10,
-    ) -> pd.DataFrame:
+        rollups: Optional[List[Dict[str, Any]]] = None,
+    ) -> "pd.DataFrame":
         """
         Analyze trending tickers over time periods.
 
@@ -256,15 +377,16 @@ class NewsTrendsAnalyzer:
             articles: List of article dictionaries
             period: Time period for aggregation ('hourly', 'daily', 'weekly', 'monthly')
             top_n: Number of top trending tickers to return
+            rollups: Optional daily roll-ups of expired news (see get_rollups)
 
         Returns:
             DataFrame with columns: period, ticker, count, growth_rate, momentum
         """
         logger.debug(f"Analyzing ticker trends: period={period}, top_n={top_n}")
 
-        if not articles:
+        if not articles and not rollups:
             logger.warning("No articles provided for ticker trend analysis")
-            return pd.DataFrame(
+            return _pd.DataFrame(
                 columns=["period", "ticker", "count", "growth_rate", "momentum"]
             )
 
@@ -278,15 +400,16 @@ class NewsTrendsAnalyzer:
             tickers = article.get("tickers", [])
 
             for ticker in tickers:
-                data.append({"date": date, "ticker": ticker})
+                data.append({"date": date, "ticker": ticker, "count": 1})
+        data.extend(self._rollup_rows(rollups, articles, "tickers", "ticker"))
 
         if not data:
             logger.warning("No ticker data found in articles")
-            return pd.DataFrame(
+            return _pd.DataFrame(
                 columns=["period", "ticker", "count", "growth_rate", "momentum"]
             )
 
-        df = pd.DataFrame(data)
+        df = _pd.DataFrame(data)
 
         # Set date as index and resample by period
         df.set_index("date", inplace=True)
@@ -302,9 +425,7 @@ class NewsTrendsAnalyzer:
 
         # Count ticker mentions per period
         ticker_counts = (
-            df.groupby([pd.Grouper(freq=freq), "ticker"])
-            .size()
-            .reset_index(name="count")
+            df.groupby([_pd.Grouper(freq=freq), "ticker"])["count"].sum().reset_index()
         )
         ticker_counts.columns = ["period", "ticker", "count"]
 
@@ -349,7 +470,8 @@ class NewsTrendsAnalyzer:
         period: str = "daily",
         top_n: int = 10,
         min_word_length: int = 4,
-    ) -> pd.DataFrame:
+        rollups: Optional[List[Dict[str, Any]]] = None,
+    ) -> "pd.DataFrame":
         """
         Analyze trending topics/keywords over time periods.
 
@@ -358,6 +480,7 @@ class NewsTrendsAnalyzer:
             period: Time period for aggregation ('hourly', 'daily', 'weekly', 'monthly')
             top_n: Number of top trending topics to return
             min_word_length: Minimum word length for keyword extraction
+            rollups: Optional daily roll-ups of expired news (see get_rollups)
 
         Returns:
             DataFrame with columns: period, keyword, count, growth_rate, momentum
@@ -367,9 +490,9 @@ class NewsTrendsAnalyzer:
             f"min_word_length={min_word_length}"
         )
 
-        if not articles:
+        if not articles and not rollups:
             logger.warning("No articles provided for topic trend analysis")
-            return pd.DataFrame(
+            return _pd.DataFrame(
                 columns=["period", "keyword", "count", "growth_rate", "momentum"]
             )
 
@@ -385,15 +508,16 @@ class NewsTrendsAnalyzer:
             keywords = self._extract_keywords(text, min_word_length)
 
             for keyword in keywords:
-                data.append({"date": date, "keyword": keyword})
+                data.append({"date": date, "keyword": keyword, "count": 1})
+        data.extend(self._rollup_rows(rollups, articles, "keywords", "keyword"))
 
         if not data:
             logger.warning("No keyword data extracted from articles")
-            return pd.DataFrame(
+            return _pd.DataFrame(
                 columns=["period", "keyword", "count", "growth_rate", "momentum"]
             )
 
-        df = pd.DataFrame(data)
+        df = _pd.DataFrame(data)
 
         # Set date as index and resample by period
         df.set_index("date", inplace=True)
@@ -409,9 +533,7 @@ class NewsTrendsAnalyzer:
 
         # Count keyword mentions per period
         keyword_counts = (
-            df.groupby([pd.Grouper(freq=freq), "keyword"])
-            .size()
-            .reset_index(name="count")
+            df.groupby([_pd.Grouper(freq=freq), "keyword"])["count"].sum().reset_index()
         )
         keyword_counts.columns = ["period", "keyword", "count"]
 
@@ -489,34 +611,37 @@ class NewsTrendsAnalyzer:
         self,
         articles: List[Dict[str, Any]],
         period: str = "daily",
-    ) -> pd.DataFrame:
+        rollups: Optional[List[Dict[str, Any]]] = None,
+    ) -> "pd.DataFrame":
         """
         Analyze news volume trends over time.
 
         Args:
             articles: List of article dictionaries
             period: Time period for aggregation ('hourly', 'daily', 'weekly', 'monthly')
+            rollups: Optional daily roll-ups of expired news (see get_rollups)
 
         Returns:
             DataFrame with columns: period, volume, growth_rate
         """
         logger.debug(f"Analyzing volume trends: period={period}")
 
-        if not articles:
+        if not articles and not rollups:
             logger.warning("No articles provided for volume trend analysis")
-            return pd.DataFrame(columns=["period", "volume", "growth_rate"])
+            return _pd.DataFrame(columns=["period", "volume", "growth_rate"])
 
         # Create DataFrame with dates
         data = []
         for article in articles:
             if article.get("date"):
-                data.append({"date": article["date"]})
+                data.append({"date": article["date"], "count": 1})
+        data.extend(self._rollup_rows(rollups, articles))
 
         if not data:
             logger.warning("No date data found in articles")
-            return pd.DataFrame(columns=["period", "volume", "growth_rate"])
+            return _pd.DataFrame(columns=["period", "volume", "growth_rate"])
 
-        df = pd.DataFrame(data)
+        df = _pd.DataFrame(data)
 
         # Set date as index and resample by period
         df.set_index("date", inplace=True)
@@ -531,7 +656,7 @@ class NewsTrendsAnalyzer:
         freq = period_map.get(period.lower(), "D")
 
         # Count articles per period
-        volume = df.resample(freq).size().reset_index(name="volume")
+        volume = df.resample(freq)["count"].sum().reset_index(name="volume")
         volume.columns = ["period", "volume"]
 
         # Calculate growth rate
@@ -549,6 +674,7 @@ class NewsTrendsAnalyzer:
         period: str = "daily",
         top_n: int = 10,
         min_mentions: int = 2,
+        rollups: Optional[List[Dict[str, Any]]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Get top trending tickers based on frequency and growth.
@@ -558,6 +684,7 @@ class NewsTrendsAnalyzer:
             period: Time period for analysis ('hourly', 'daily', 'weekly', 'monthly')
             top_n: Number of top tickers to return
             min_mentions: Minimum number of mentions to include
+            rollups: Optional daily roll-ups of expired news (see get_rollups)
 
         Returns:
             List of dictionaries with ticker, total_count, recent_count, growth_rate
@@ -567,11 +694,13 @@ class NewsTrendsAnalyzer:
             f"min_mentions={min_mentions}"
         )
 
-        if not articles:
+        if not articles and not rollups:
             return []
 
         # Analyze ticker trends
-        ticker_trends = self.analyze_ticker_trends(articles, period=period, top_n=top_n)
+        ticker_trends = self.analyze_ticker_trends(
+            articles, period=period, top_n=top_n, rollups=rollups
+        )
 
         if ticker_trends.empty:
             return []
@@ -622,6 +751,7 @@ class NewsTrendsAnalyzer:
         period: str = "daily",
         top_n: int = 10,
         min_mentions: int = 3,
+        rollups: Optional[List[Dict[str, Any]]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Get top trending topics/keywords based on frequency and growth.
@@ -631,6 +761,7 @@ class NewsTrendsAnalyzer:
             period: Time period for analysis ('hourly', 'daily', 'weekly', 'monthly')
             top_n: Number of top topics to return
             min_mentions: Minimum number of mentions to include
+            rollups: Optional daily roll-ups of expired news (see get_rollups)
 
         Returns:
             List of dictionaries with keyword, total_count, recent_count, growth_rate
@@ -640,11 +771,13 @@ class NewsTrendsAnalyzer:
             f"min_mentions={min_mentions}"
         )
 
-        if not articles:
+        if not articles and not rollups:
             return []
 
         # Analyze topic trends
-        topic_trends = self.analyze_topic_trends(articles, period=period, top_n=top_n)
+        topic_trends = self.analyze_topic_trends(
+            articles, period=period, top_n=top_n, rollups=rollups
+        )
 
         if topic_trends.empty:
             return []
@@ -708,7 +841,9 @@ class NewsTrendsAnalyzer:
             top_topics: Number of top topics to include
 
         Returns:
-            Dictionary with trend analysis results
+            Dictionary with trend analysis results; with news partitioning,
+            expired weeks in the range are covered by their roll-ups
+            (rolled_up_articles) and summaries (period_summaries)
         """
         logger.info(
             f"Generating trend report: date_from={date_from}, date_to={date_to}, "
@@ -717,34 +852,38 @@ class NewsTrendsAnalyzer:
 
         # Retrieve articles
         articles = self.get_news_articles(date_from=date_from, date_to=date_to)
+        rollups = self.get_rollups(date_from=date_from, date_to=date_to)
+        rolled_up_articles = sum(rollup["articles"] for rollup in rollups)
 
-        if not articles:
+        if not articles and not rollups:
             logger.warning("No articles found for trend report")
             return {
                 "period": period,
                 "date_from": date_from,
                 "date_to": date_to,
                 "total_articles": 0,
-                "ticker_trends": pd.DataFrame(),
-                "topic_trends": pd.DataFrame(),
-                "volume_trends": pd.DataFrame(),
+                "ticker_trends": _pd.DataFrame(),
+                "topic_trends": _pd.DataFrame(),
+                "volume_trends": _pd.DataFrame(),
                 "trending_tickers": [],
                 "trending_topics": [],
             }
 
         # Analyze trends
         ticker_trends = self.analyze_ticker_trends(
-            articles, period=period, top_n=top_tickers
+            articles, period=period, top_n=top_tickers, rollups=rollups
         )
         topic_trends = self.analyze_topic_trends(
-            articles, period=period, top_n=top_topics
+            articles, period=period, top_n=top_topics, rollups=rollups
+        )
+        volume_trends = self.analyze_volume_trends(
+            articles, period=period, rollups=rollups
         )
-        volume_trends = self.analyze_volume_trends(articles, period=period)
         trending_tickers = self.get_trending_tickers(
-            articles, period=period, top_n=top_tickers
+            articles, period=period, top_n=top_tickers, rollups=rollups
         )
         trending_topics = self.get_trending_topics(
-            articles, period=period, top_n=top_topics
+            articles, period=period, top_n=top_topics, rollups=rollups
         )
 
         # Build report
@@ -752,14 +891,22 @@ class NewsTrendsAnalyzer:
             "period": period,
             "date_from": date_from,
             "date_to": date_to,
-            "total_articles": len(articles),
+            "total_articles": len(articles) + rolled_up_articles,
             "ticker_trends": ticker_trends,
             "topic_trends": topic_trends,
             "volume_trends": volume_trends,
             "trending_tickers": trending_tickers,
             "trending_topics": trending_topics,
         }
+        if rollups:
+            report["rolled_up_articles"] = rolled_up_articles
+            report["period_summaries"] = self.get_period_summaries(
+                date_from=date_from, date_to=date_to
+            )
 
-        logger.info(f"Generated trend report: {len(articles)} articles analyzed")
+        logger.info(
+            f"Generated trend report: {len(articles)} articles analyzed"
+            + (f", {rolled_up_articles} from roll-ups" if rollups else "")
+        )
 
         return report
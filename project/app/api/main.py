@@ -13,7 +13,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse  # noqa: E501
 
 from app.api.middleware import RateLimitMiddleware, RequestLoggingMiddleware
-from app.api.routes import documents, health, ingestion, query, trends
+from app.api.routes import documents, health, ingestion, jobs, query, trends
 from app.utils.config import config
 from app.utils.logger import get_logger
 
@@ -44,10 +44,40 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     else:
         logger.warning("API key authentication disabled (no API_KEY configured)")
 
+    if config.ingestion_jobs_resume_on_startup:
+        try:
+            from app.services.ingestion_jobs import get_job_manager
+
+            get_job_manager().resume_unfinished_jobs()
+        except Exception as e:
+            logger.error(f"Failed to resume ingestion jobs: {str(e)}", exc_info=True)
+
+    if config.health_check_enabled:
+        from app.api.routes.query import get_rag_system
+        from app.utils.health import get_health_monitor
+
+        # Hands the RAG system's vector store to the monitor before it starts
+        try:
+            get_rag_system()
+        except Exception as e:
+            logger.error(f"Failed to initialize RAG system: {str(e)}", exc_info=True)
+        get_health_monitor().start()
+
     yield
 
     # Shutdown
     logger.info("FastAPI application shutting down")
+    from app.utils.health import stop_health_monitor
+
+    stop_health_monitor()
+
+    from app.services.ingestion_jobs import shutdown_job_manager
+
+    shutdown_job_manager()
+
+    from app.api.routes.ingestion import close_ingestion_pipeline
+
+    close_ingestion_pipeline()
 
 
 # Create FastAPI application
@@ -81,6 +111,7 @@ app.add_middleware(RequestLoggingMiddleware)
 # Include routers
 app.include_router(query.router, prefix="/api/v1")
 app.include_router(ingestion.router, prefix="/api/v1")
+app.include_router(jobs.router, prefix="/api/v1")
 app.include_router(documents.router, prefix="/api/v1")
 app.include_router(health.router, prefix="/api/v1")
 app.include_router(trends.router, prefix="/api/v1")
@@ -103,6 +134,7 @@ async def root() -> dict:
         "endpoints": {
             "query": "/api/v1/query",
             "ingest": "/api/v1/ingest",
+            "jobs": "/api/v1/jobs",
             "documents": "/api/v1/documents",
             "health": "/api/v1/health",
             "metrics": "/api/v1/health/metrics",
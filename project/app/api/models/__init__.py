@@ -11,6 +11,11 @@ from app.api.models.ingestion import (
     IngestionRequest,
     IngestionResponse,
 )
+from app.api.models.jobs import (
+    JobItemStatus,
+    JobStatusResponse,
+    JobSubmitRequest,
+)
 from app.api.models.query import (
     QueryRequest,
     QueryResponse,
@@ -23,6 +28,9 @@ __all__ = [
     "SourceMetadata",
     "IngestionRequest",
     "IngestionResponse",
+    "JobSubmitRequest",
+    "JobStatusResponse",
+    "JobItemStatus",
     "DocumentListResponse",
     "DocumentDetailResponse",
     "DocumentMetadata",
@@ -0,0 +1,92 @@
+"""
+Bulk ingestion job API request/response models.
+"""
+
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class JobSubmitRequest(BaseModel):
+    """Bulk ingestion job submission model."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "file_paths": [
+                    "data/documents/AAPL_10-K_2023.txt",
+                    "data/documents/MSFT_10-K_2023.txt",
+                ],
+                "tickers": ["AAPL", "MSFT"],
+                "feed_urls": ["https://www.cnbc.com/id/100003114/device/rss/rss.html"],
+                "store_embeddings": True,
+            }
+        }
+    )
+
+    file_paths: List[str] = Field(
+        default_factory=list, description="Document file paths to ingest"
+    )
+    tickers: List[str] = Field(
+        default_factory=list, description="Stock ticker symbols to ingest"
+    )
+    feed_urls: List[str] = Field(
+        default_factory=list, description="RSS feed URLs to ingest"
+    )
+    store_embeddings: bool = Field(
+        True, description="Whether to store embeddings in ChromaDB"
+    )
+
+
+class JobItemStatus(BaseModel):
+    """Status of a single job item."""
+
+    seq: int = Field(..., ge=0, description="Item position within the job")
+    kind: str = Field(..., description="Item kind (document, ticker, feed)")
+    target: str = Field(..., description="File path, ticker symbol, or feed URL")
+    status: str = Field(..., description="Item status")
+    chunks_created: int = Field(0, ge=0, description="Number of chunks created")
+    attempts: int = Field(0, ge=0, description="Number of processing attempts")
+    error: Optional[str] = Field(None, description="Error message if item failed")
+    updated_at: str = Field(..., description="Last update time (ISO 8601)")
+
+
+class JobStatusResponse(BaseModel):
+    """Bulk ingestion job status response model."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "job_id": "3f2b9c0e6d0a4c6e9f1d2b7a8c9e0f11",
+                "status": "running",
+                "total_items": 10000,
+                "completed_items": 8999,
+                "failed_items": 1,
+                "pending_items": 1000,
+                "chunks_created": 412345,
+                "created_at": "2025-01-27T10:00:00+00:00",
+                "updated_at": "2025-01-27T12:30:00+00:00",
+                "error": None,
+                "items": None,
+            }
+        }
+    )
+
+    job_id: str = Field(..., description="Job ID")
+    status: str = Field(
+        ...,
+        description=(
+            "Job status (pending, running, completed, completed_with_errors, failed)"
+        ),
+    )
+    total_items: int = Field(..., ge=0, description="Total number of items")
+    completed_items: int = Field(..., ge=0, description="Items completed")
+    failed_items: int = Field(..., ge=0, description="Items failed")
+    pending_items: int = Field(..., ge=0, description="Items not yet processed")
+    chunks_created: int = Field(..., ge=0, description="Total chunks created")
+    created_at: str = Field(..., description="Job creation time (ISO 8601)")
+    updated_at: str = Field(..., description="Last progress update (ISO 8601)")
+    error: Optional[str] = Field(None, description="Error message if job failed")
+    items: Optional[List[JobItemStatus]] = Field(
+        None, description="Per-item status (first 100 items, if requested)"
+    )
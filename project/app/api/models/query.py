@@ -110,6 +110,10 @@ class QueryRequest(BaseModel):
         True,
         description="Enable automatic query parsing for filters and Boolean operators",
     )
+    include_timings: Optional[bool] = Field(
+        False,
+        description="Include per-stage latency breakdown in the response",
+    )
 
 
 class QueryResponse(BaseModel):
@@ -150,3 +154,11 @@ class QueryResponse(BaseModel):
     parsed_query: Optional[Dict[str, Any]] = Field(
         None, description="Parsed query information (if query parsing enabled)"
     )
+    timings: Optional[Dict[str, float]] = Field(
+        None,
+        description=(
+            "Stage durations in milliseconds (parse, embed_query, "
+            "vector_search, bm25, rerank, format_context, llm, total; "
+            "if include_timings)"
+        ),
+    )
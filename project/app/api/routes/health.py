@@ -1,10 +1,13 @@
 """
 Health check API routes.
+
+Served from the background health monitor's cached snapshot, so probes do
+not touch the vector store or Ollama.
 """
 
 from fastapi import APIRouter
 
-from app.utils.health import get_health_status
+from app.utils.health import get_health_status, get_readiness_status
 from app.utils.metrics import get_metrics
 
 router = APIRouter(prefix="/health", tags=["health"])
@@ -16,7 +19,7 @@ async def health_check() -> dict:
     Comprehensive health check endpoint.
 
     Returns:
-        Health status with component details
+        Cached health status with component details and snapshot age
     """
     return get_health_status()
 
@@ -38,22 +41,9 @@ async def readiness() -> dict:
     Readiness probe endpoint (is the application ready to serve requests).
 
     Returns:
-        Readiness status
+        Readiness status from the cached health snapshot
     """
-    health_status = get_health_status()
-    components = health_status.get("components", {})
-
-    # Check critical components
-    chromadb_status = components.get("chromadb", {}).get("status", "unknown")
-    ollama_status = components.get("ollama", {}).get("status", "unknown")
-
-    if chromadb_status != "healthy":
-        return {"status": "not_ready", "reason": "ChromaDB not available"}
-
-    if ollama_status != "healthy":
-        return {"status": "not_ready", "reason": "Ollama service not available"}
-
-    return {"status": "ready"}
+    return get_readiness_status()
 
 
 @router.get("/metrics")
@@ -14,6 +14,7 @@ from app.ingestion.pipeline import (
     create_pipeline,
 )
 from app.utils.config import config
+from app.utils.file_streaming import UploadTooLargeError, save_upload_stream
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -38,6 +39,14 @@ def get_ingestion_pipeline() -> IngestionPipeline:
     return _ingestion_pipeline
 
 
+def close_ingestion_pipeline() -> None:
+    """Close the API's ingestion pipeline, if it was created."""
+    global _ingestion_pipeline
+    if _ingestion_pipeline is not None:
+        _ingestion_pipeline.close()
+        _ingestion_pipeline = None
+
+
 @router.post("", response_model=IngestionResponse, status_code=status.HTTP_201_CREATED)
 async def ingest_document(
     fastapi_request: Request,
@@ -86,19 +95,31 @@ async def ingest_document(
                 ),
             )
 
-        # Handle file upload
-        if file:
-            # Save uploaded file temporarily
-            upload_dir = config.DOCUMENTS_DIR
-            upload_dir.mkdir(parents=True, exist_ok=True)
-
-            file_path_obj = upload_dir / file.filename
-            with open(file_path_obj, "wb") as f:
-                content = await file.read()
-                f.write(content)
+        max_size = config.max_document_size_mb * 1024 * 1024
+        content_hash = None
 
-            file_path = str(file_path_obj)
-            logger.info(f"Saved uploaded file to: {file_path}")
+        # Handle file upload: stream to disk in chunks, hashing as we go, so
+        # the upload is never held in memory as a whole
+        if file:
+            try:
+                stored = await save_upload_stream(
+                    file,
+                    config.DOCUMENTS_DIR,
+                    max_bytes=max_size,
+                    chunk_bytes=config.ingestion_upload_chunk_bytes,
+                )
+            except UploadTooLargeError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=str(e),
+                ) from e
+
+            file_path = str(stored.path)
+            content_hash = stored.content_hash
+            logger.info(
+                f"Saved uploaded file to: {file_path} "
+                f"({stored.size_bytes} bytes, sha256={content_hash[:12]})"
+            )
 
         # Validate file path
         if not file_path:
@@ -116,7 +137,6 @@ async def ingest_document(
 
         # Check file size
         file_size = file_path_obj.stat().st_size
-        max_size = config.max_document_size_mb * 1024 * 1024
         if file_size > max_size:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -128,7 +148,10 @@ async def ingest_document(
 
         # Process document
         chunk_ids = pipeline.process_document(
-            file_path=file_path_obj, store_embeddings=store_embeddings
+            file_path=file_path_obj,
+            store_embeddings=store_embeddings,
+            content_hash=content_hash,
+            skip_duplicates=config.ingestion_dedup_enabled,
         )
 
         logger.info(
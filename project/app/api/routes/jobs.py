@@ -0,0 +1,95 @@
+"""
+Bulk ingestion job API routes.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.api.auth import verify_api_key
+from app.api.models.jobs import JobStatusResponse, JobSubmitRequest
+from app.services.ingestion_jobs import (
+    IngestionJobError,
+    IngestionJobManager,
+    get_job_manager,
+)
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+@router.post("", response_model=JobStatusResponse, status_code=status.HTTP_202_ACCEPTED)
+async def submit_job(
+    request: JobSubmitRequest,
+    manager: IngestionJobManager = Depends(get_job_manager),  # noqa: B008
+    api_key: str = Depends(verify_api_key),  # noqa: B008
+) -> JobStatusResponse:
+    """
+    Submit a bulk ingestion job.
+
+    The batch is journaled and processed by background workers; poll
+    ``GET /jobs/{job_id}`` for progress.
+
+    Args:
+        request: Job submission with file paths, tickers, and feed URLs
+        manager: Ingestion job manager (dependency injection)
+        api_key: Verified API key (dependency injection)
+
+    Returns:
+        Initial job status
+
+    Raises:
+        HTTPException: If the job is empty or cannot be submitted
+    """
+    try:
+        job_id = manager.submit(
+            file_paths=request.file_paths,
+            tickers=request.tickers,
+            feed_urls=request.feed_urls,
+            store_embeddings=request.store_embeddings,
+        )
+        return JobStatusResponse(**manager.get_job(job_id))
+    except IngestionJobError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+    except Exception as e:
+        logger.error(f"Unexpected error submitting job: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error during job submission",
+        ) from e
+
+
+@router.get(
+    "/{job_id}", response_model=JobStatusResponse, status_code=status.HTTP_200_OK
+)
+async def get_job(
+    job_id: str,
+    include_items: bool = False,
+    manager: IngestionJobManager = Depends(get_job_manager),  # noqa: B008
+    api_key: str = Depends(verify_api_key),  # noqa: B008
+) -> JobStatusResponse:
+    """
+    Get progress of a bulk ingestion job.
+
+    Args:
+        job_id: Job ID
+        include_items: Include per-item status (first 100 items)
+        manager: Ingestion job manager (dependency injection)
+        api_key: Verified API key (dependency injection)
+
+    Returns:
+        Job status with item counts
+
+    Raises:
+        HTTPException: If the job does not exist
+    """
+    try:
+        return JobStatusResponse(**manager.get_job(job_id, include_items=include_items))
+    except IngestionJobError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        ) from e
@@ -7,6 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from app.api.auth import verify_api_key
 from app.api.models.query import QueryRequest, QueryResponse, SourceMetadata
 from app.rag.chain import RAGQueryError, RAGQuerySystem, create_rag_system
+from app.utils.health import get_health_monitor
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -21,6 +22,9 @@ def get_rag_system() -> RAGQuerySystem:
     """
     Get or create RAG query system instance.
 
+    The health monitor checks the system's vector store rather than opening
+    its own.
+
     Returns:
         RAGQuerySystem instance
     """
@@ -28,6 +32,9 @@ def get_rag_system() -> RAGQuerySystem:
     if _rag_system is None:
         logger.info("Initializing RAG query system for API")
         _rag_system = create_rag_system()
+        store = getattr(_rag_system, "chroma_store", None)
+        if store is not None:
+            get_health_monitor().set_store(store)
     return _rag_system
 
 
@@ -66,6 +73,7 @@ async def query(
             conversation_history=request.conversation_history,
             filters=filters_dict,
             enable_query_parsing=request.enable_query_parsing,
+            include_timings=bool(request.include_timings),
         )
 
         # Convert sources to SourceMetadata models
@@ -89,6 +97,7 @@ async def query(
             chunks_used=result.get("chunks_used", 0),
             error=result.get("error"),
             parsed_query=result.get("parsed_query"),
+            timings=result.get("timings"),
         )
 
         logger.info(
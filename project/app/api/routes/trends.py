@@ -150,13 +150,18 @@ async def get_trending_tickers(
 
         # Get articles
         articles = analyzer.get_news_articles(date_from=date_from, date_to=date_to)
+        rollups = analyzer.get_rollups(date_from=date_from, date_to=date_to)
 
-        if not articles:
+        if not articles and not rollups:
             return []
 
         # Get trending tickers
         trending = analyzer.get_trending_tickers(
-            articles, period=period, top_n=top_n, min_mentions=min_mentions
+            articles,
+            period=period,
+            top_n=top_n,
+            min_mentions=min_mentions,
+            rollups=rollups,
         )
 
         # Convert to response models
@@ -247,13 +252,18 @@ async def get_trending_topics(
 
         # Get articles
         articles = analyzer.get_news_articles(date_from=date_from, date_to=date_to)
+        rollups = analyzer.get_rollups(date_from=date_from, date_to=date_to)
 
-        if not articles:
+        if not articles and not rollups:
             return []
 
         # Get trending topics
         trending = analyzer.get_trending_topics(
-            articles, period=period, top_n=top_n, min_mentions=min_mentions
+            articles,
+            period=period,
+            top_n=top_n,
+            min_mentions=min_mentions,
+            rollups=rollups,
         )
 
         # Convert to response models
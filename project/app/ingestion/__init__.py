@@ -2,49 +2,70 @@
 Document ingestion pipeline module.
 
 Handles loading and processing of financial documents (PDF, Markdown, text).
+
+Submodules are imported on first attribute access, so importing one fetcher
+(``from app.ingestion.fred_fetcher import FREDFetcher``) does not load every
+other fetcher and its dependencies.
 """
 
-from app.ingestion.document_loader import (
-    DocumentIngestionError,
-    DocumentLoader,
-)
-from app.ingestion.edgar_fetcher import (
-    EdgarFetcher,
-    EdgarFetcherError,
-    create_edgar_fetcher,
-)
-from app.ingestion.news_fetcher import NewsFetcher, NewsFetcherError
-from app.ingestion.news_scraper import NewsScraper, NewsScraperError
-from app.ingestion.pipeline import (
-    IngestionPipeline,
-    IngestionPipelineError,
-    create_pipeline,
-)
-from app.ingestion.rss_parser import RSSParser, RSSParserError
-from app.ingestion.stock_data_normalizer import StockDataNormalizer
-from app.ingestion.transcript_fetcher import (
-    TranscriptFetcher,
-    TranscriptFetcherError,
-)
-from app.ingestion.transcript_parser import (
-    TranscriptParser,
-    TranscriptParserError,
-)
-from app.ingestion.yfinance_fetcher import (
-    YFinanceFetcher,
-    YFinanceFetcherError,
-)
+from app.utils.lazy_imports import is_available, lazy_exports
 
-# Enhanced EDGAR parsers (TASK-032)
-try:
-    from app.ingestion.def14a_parser import Def14AParser, Def14AParserError
-    from app.ingestion.form4_parser import Form4Parser, Form4ParserError
-    from app.ingestion.forms1_parser import FormS1Parser, FormS1ParserError
-    from app.ingestion.xbrl_parser import XBRLParser, XBRLParserError
+_EXPORTS = {
+    "DocumentIngestionError": "app.ingestion.document_loader",
+    "DocumentLoader": "app.ingestion.document_loader",
+    "EdgarFetcher": "app.ingestion.edgar_fetcher",
+    "EdgarFetcherError": "app.ingestion.edgar_fetcher",
+    "create_edgar_fetcher": "app.ingestion.edgar_fetcher",
+    "CompanyDirectoryError": "app.ingestion.sec_company_directory",
+    "SECCompanyDirectory": "app.ingestion.sec_company_directory",
+    "get_company_directory": "app.ingestion.sec_company_directory",
+    "ExtractedDocument": "app.ingestion.html_extractor",
+    "HtmlExtractionError": "app.ingestion.html_extractor",
+    "HtmlTextExtractor": "app.ingestion.html_extractor",
+    "extract_html": "app.ingestion.html_extractor",
+    "XBRLFact": "app.ingestion.xbrl_parser",
+    "iter_xbrl_facts": "app.ingestion.xbrl_parser",
+    "XBRLFactStore": "app.ingestion.xbrl_fact_store",
+    "XBRLFactStoreError": "app.ingestion.xbrl_fact_store",
+    "TimeSeriesStore": "app.ingestion.timeseries_store",
+    "TimeSeriesStoreError": "app.ingestion.timeseries_store",
+    "CommunicationIndex": "app.ingestion.central_bank_index",
+    "CommunicationIndexError": "app.ingestion.central_bank_index",
+    "get_timeseries_store": "app.ingestion.timeseries_store",
+    "NewsFetcher": "app.ingestion.news_fetcher",
+    "NewsFetcherError": "app.ingestion.news_fetcher",
+    "NewsScraper": "app.ingestion.news_scraper",
+    "NewsScraperError": "app.ingestion.news_scraper",
+    "IngestionPipeline": "app.ingestion.pipeline",
+    "IngestionPipelineError": "app.ingestion.pipeline",
+    "create_pipeline": "app.ingestion.pipeline",
+    "RSSParser": "app.ingestion.rss_parser",
+    "RSSParserError": "app.ingestion.rss_parser",
+    "StockDataNormalizer": "app.ingestion.stock_data_normalizer",
+    "TranscriptFetcher": "app.ingestion.transcript_fetcher",
+    "TranscriptFetcherError": "app.ingestion.transcript_fetcher",
+    "TranscriptParser": "app.ingestion.transcript_parser",
+    "TranscriptParserError": "app.ingestion.transcript_parser",
+    "YFinanceFetcher": "app.ingestion.yfinance_fetcher",
+    "YFinanceFetcherError": "app.ingestion.yfinance_fetcher",
+}
 
-    ENHANCED_PARSERS_AVAILABLE = True
-except ImportError:
-    ENHANCED_PARSERS_AVAILABLE = False
+# Enhanced EDGAR parsers (TASK-032)
+ENHANCED_PARSERS_AVAILABLE = is_available("bs4")
+if ENHANCED_PARSERS_AVAILABLE:
+    _EXPORTS.update(
+        {
+            "Def14AParser": "app.ingestion.def14a_parser",
+            "Def14AParserError": "app.ingestion.def14a_parser",
+            "Form4Parser": "app.ingestion.form4_parser",
+            "Form4ParserError": "app.ingestion.form4_parser",
+            "FormS1Parser": "app.ingestion.forms1_parser",
+            "FormS1ParserError": "app.ingestion.forms1_parser",
+            "XBRLParser": "app.ingestion.xbrl_parser",
+            "XBRLParserError": "app.ingestion.xbrl_parser",
+        }
+    )
+else:
     # Define placeholders for type checking
     Def14AParser = None
     Def14AParserError = None
@@ -55,6 +76,8 @@ except ImportError:
     XBRLParser = None
     XBRLParserError = None
 
+__getattr__, __dir__ = lazy_exports(globals(), _EXPORTS)
+
 __all__ = [
     "DocumentLoader",
     "DocumentIngestionError",
@@ -64,6 +87,22 @@ __all__ = [
     "EdgarFetcher",
     "EdgarFetcherError",
     "create_edgar_fetcher",
+    "CompanyDirectoryError",
+    "SECCompanyDirectory",
+    "get_company_directory",
+    "ExtractedDocument",
+    "HtmlExtractionError",
+    "HtmlTextExtractor",
+    "extract_html",
+    "XBRLFact",
+    "iter_xbrl_facts",
+    "XBRLFactStore",
+    "XBRLFactStoreError",
+    "TimeSeriesStore",
+    "TimeSeriesStoreError",
+    "CommunicationIndex",
+    "CommunicationIndexError",
+    "get_timeseries_store",
     "YFinanceFetcher",
     "YFinanceFetcherError",
     "StockDataNormalizer",
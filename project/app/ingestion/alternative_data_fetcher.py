@@ -6,13 +6,13 @@ supply chain activity, and IPO/secondary offering information.
 """
 
 import re
-import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 import requests
 from langchain_core.documents import Document
 
+from app.utils.http_client import create_http_session, delay_to_rate
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -67,7 +67,10 @@ class AlternativeDataFetcher:
         self.supply_chain_enabled = supply_chain_enabled
         self.ipo_enabled = ipo_enabled
         self.rate_limit_delay = rate_limit_delay
-        self.session = requests.Session()
+        # Shared cached session; throttled per host on cache misses only
+        self.session = create_http_session(
+            requests_per_second=delay_to_rate(self.rate_limit_delay)
+        )
 
         # Initialize EDGAR fetcher for Form S-1 (if enabled)
         self.edgar_fetcher = None
@@ -121,8 +124,6 @@ class AlternativeDataFetcher:
         """
         try:
             logger.debug(f"Making request to alternative data API: {url}")
-            time.sleep(self.rate_limit_delay)  # Rate limiting
-
             request_headers = {"Accept": "application/json"}
             if headers:
                 request_headers.update(headers)
@@ -6,19 +6,42 @@ press conference transcripts, interest rate decisions, and forward guidance
 through web scraping and API access.
 """
 
+import hashlib
 import re
-import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Any, Dict, List, Optional
 
 import requests
 from bs4 import BeautifulSoup
 from langchain_core.documents import Document
 
+from app.ingestion.central_bank_index import (
+    CommunicationIndex,
+    CommunicationIndexError,
+)
 from app.utils.config import config
+from app.utils.http_client import create_http_session, delay_to_rate
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_DATE_RE = re.compile(r"(\d{1,2}/\d{1,2}/\d{4})")
+# FOMC document URLs embed the meeting date (fomcminutes20250129.htm)
+_URL_DATE_RE = re.compile(r"((?:19|20)\d{6})")
+
+
+def _link_date(url: str, link_text: str) -> str:
+    """Return the YYYYMMDD date of a linked document, or "" if unknown."""
+    match = _URL_DATE_RE.search(url)
+    if match:
+        return match.group(1)
+    match = _DATE_RE.search(link_text)
+    if match:
+        month, day, year = match.group(1).split("/")
+        return f"{year}{int(month):02d}{int(day):02d}"
+    return ""
+
 
 class CentralBankFetcherError(Exception):
     """Custom exception for central bank fetcher errors."""
@@ -65,6 +88,9 @@ class CentralBankFetcher:
         self,
         rate_limit_delay: Optional[float] = None,
         use_web_scraping: bool = True,
+        max_workers: Optional[int] = None,
+        index: Optional[CommunicationIndex] = None,
+        revalidate_limit: Optional[int] = None,
     ):
         """
         Initialize central bank fetcher.
@@ -72,6 +98,11 @@ class CentralBankFetcher:
         Args:
             rate_limit_delay: Delay between requests in seconds (default: from config)
             use_web_scraping: Whether to use web scraping (default: True)
+            max_workers: Concurrent document downloads (default: from config)
+            index: Index of ingested communications (default: CommunicationIndex
+                at the config path if central_bank_index_enabled, else none)
+            revalidate_limit: Indexed links revalidated per refresh, most
+                recent first (default: from config)
         """
         self.rate_limit_delay = (
             rate_limit_delay
@@ -79,7 +110,22 @@ class CentralBankFetcher:
             else config.central_bank_rate_limit_seconds
         )
         self.use_web_scraping = use_web_scraping
-        self.session = requests.Session()
+        self.max_workers = max_workers or config.central_bank_max_workers
+        self.revalidate_limit = (
+            revalidate_limit
+            if revalidate_limit is not None
+            else config.central_bank_revalidate_limit
+        )
+        self.index = index
+        if self.index is None and config.central_bank_index_enabled:
+            try:
+                self.index = CommunicationIndex()
+            except CommunicationIndexError as e:
+                logger.warning(f"Communication index unavailable: {str(e)}")
+        # Shared cached session; throttled per host on cache misses only
+        self.session = create_http_session(
+            requests_per_second=delay_to_rate(self.rate_limit_delay)
+        )
         self.session.headers.update(
             {
                 "User-Agent": (
@@ -95,15 +141,11 @@ class CentralBankFetcher:
 
         logger.info("Central Bank API client initialized")
 
-    def _apply_rate_limit(self) -> None:
-        """Apply rate limiting delay between requests."""
-        if self.rate_limit_delay > 0:
-            time.sleep(self.rate_limit_delay)
-
     def _make_request(
         self,
         url: str,
         params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
     ) -> requests.Response:
         """
         Make HTTP request with error handling.
@@ -111,6 +153,7 @@ class CentralBankFetcher:
         Args:
             url: URL to request
             params: Query parameters
+            headers: Extra request headers (e.g. conditional request headers)
 
         Returns:
             Response object
@@ -119,8 +162,7 @@ class CentralBankFetcher:
             CentralBankFetcherError: If request fails
         """
         try:
-            self._apply_rate_limit()
-            response = self.session.get(url, params=params, timeout=30)
+            response = self.session.get(url, params=params, headers=headers, timeout=30)
             response.raise_for_status()
             return response
         except requests.exceptions.RequestException as e:
@@ -148,6 +190,7 @@ class CentralBankFetcher:
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
         limit: Optional[int] = None,
+        only_new: bool = False,
     ) -> List[Dict[str, Any]]:
         """
         Fetch FOMC statements.
@@ -156,6 +199,8 @@ class CentralBankFetcher:
             start_date: Start date (YYYY-MM-DD format, optional)
             end_date: End date (YYYY-MM-DD format, optional)
             limit: Maximum number of statements to fetch (optional)
+            only_new: Skip statements recorded in the communication index
+                unless they have been revised
 
         Returns:
             List of statement dictionaries
@@ -163,92 +208,23 @@ class CentralBankFetcher:
         Raises:
             CentralBankFetcherError: If fetching fails
         """
-        if not self.use_web_scraping:
-            raise CentralBankFetcherError("Web scraping is disabled")
-
-        logger.info("Fetching FOMC statements")
-        try:
-            # Fetch the FOMC calendar page
-            response = self._make_request(self.FOMC_STATEMENTS_URL)
-            soup = self._parse_html(response.text)
-
-            statements = []
-            # Find statement links (simplified example - structure may vary)
+        return self._harvest(
+            "fomc_statement",
+            "FOMC statements",
+            self.FOMC_STATEMENTS_URL,
             # FOMC website structure may change, so this needs to be adapted
-            statement_links = soup.find_all(
-                "a", href=re.compile(r"/monetarypolicy/fomc.*\.htm")
-            )
-
-            for link in statement_links[:limit] if limit else statement_links:
-                try:
-                    href = link.get("href", "")
-                    if not href.startswith("http"):
-                        href = f"{self.FOMC_BASE_URL}{href}"
-
-                    # Fetch individual statement
-                    statement_response = self._make_request(href)
-                    statement_soup = self._parse_html(statement_response.text)
-
-                    # Extract statement content
-                    content_div = statement_soup.find(
-                        "div", class_=re.compile(r"col|content|statement")
-                    )
-                    if not content_div:
-                        content_div = statement_soup.find(
-                            "div", id=re.compile(r"content|main")
-                        )
-
-                    content = (
-                        content_div.get_text(separator="\n", strip=True)
-                        if content_div
-                        else ""
-                    )
-
-                    # Extract date from link text or page
-                    date_text = link.get_text(strip=True)
-                    date_match = re.search(r"(\d{1,2}/\d{1,2}/\d{4})", date_text)
-                    if not date_match:
-                        # Try to find date in the page
-                        date_elem = statement_soup.find("time") or statement_soup.find(
-                            "span", class_=re.compile(r"date")
-                        )
-                        if date_elem:
-                            date_text = date_elem.get_text(strip=True)
-                            date_match = re.search(
-                                r"(\d{1,2}/\d{1,2}/\d{4})", date_text
-                            )
-
-                    statement_date = date_match.group(1) if date_match else None
-
-                    if content:
-                        statements.append(
-                            {
-                                "type": "fomc_statement",
-                                "bank": "Federal Reserve",
-                                "date": statement_date,
-                                "url": href,
-                                "content": content,
-                                "title": link.get_text(strip=True),
-                            }
-                        )
-                except Exception as e:
-                    logger.warning(f"Failed to fetch statement from {href}: {str(e)}")
-                    continue
-
-            logger.info(f"Successfully fetched {len(statements)} FOMC statements")
-            return statements
-
-        except Exception as e:
-            logger.error(f"Error fetching FOMC statements: {str(e)}", exc_info=True)
-            raise CentralBankFetcherError(
-                f"Error fetching FOMC statements: {str(e)}"
-            ) from e
+            link_pattern=r"/monetarypolicy/fomc.*\.htm",
+            content_pattern=r"col|content|statement",
+            limit=limit,
+            only_new=only_new,
+        )
 
     def fetch_fomc_minutes(
         self,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
         limit: Optional[int] = None,
+        only_new: bool = False,
     ) -> List[Dict[str, Any]]:
         """
         Fetch FOMC meeting minutes.
@@ -257,6 +233,8 @@ class CentralBankFetcher:
             start_date: Start date (YYYY-MM-DD format, optional)
             end_date: End date (YYYY-MM-DD format, optional)
             limit: Maximum number of minutes to fetch (optional)
+            only_new: Skip minutes recorded in the communication index
+                unless they have been revised
 
         Returns:
             List of minutes dictionaries
@@ -264,81 +242,22 @@ class CentralBankFetcher:
         Raises:
             CentralBankFetcherError: If fetching fails
         """
-        if not self.use_web_scraping:
-            raise CentralBankFetcherError("Web scraping is disabled")
-
-        logger.info("Fetching FOMC meeting minutes")
-        try:
-            # Fetch the FOMC historical page
-            response = self._make_request(self.FOMC_MINUTES_URL)
-            soup = self._parse_html(response.text)
-
-            minutes = []
-            # Find minutes links
-            minutes_links = soup.find_all(
-                "a", href=re.compile(r"/monetarypolicy/fomcminutes.*\.htm")
-            )
-
-            for link in minutes_links[:limit] if limit else minutes_links:
-                try:
-                    href = link.get("href", "")
-                    if not href.startswith("http"):
-                        href = f"{self.FOMC_BASE_URL}{href}"
-
-                    # Fetch individual minutes
-                    minutes_response = self._make_request(href)
-                    minutes_soup = self._parse_html(minutes_response.text)
-
-                    # Extract minutes content
-                    content_div = minutes_soup.find(
-                        "div", class_=re.compile(r"col|content|minutes")
-                    )
-                    if not content_div:
-                        content_div = minutes_soup.find(
-                            "div", id=re.compile(r"content|main")
-                        )
-
-                    content = (
-                        content_div.get_text(separator="\n", strip=True)
-                        if content_div
-                        else ""
-                    )
-
-                    # Extract date
-                    date_text = link.get_text(strip=True)
-                    date_match = re.search(r"(\d{1,2}/\d{1,2}/\d{4})", date_text)
-
-                    minutes_date = date_match.group(1) if date_match else None
-
-                    if content:
-                        minutes.append(
-                            {
-                                "type": "fomc_minutes",
-                                "bank": "Federal Reserve",
-                                "date": minutes_date,
-                                "url": href,
-                                "content": content,
-                                "title": link.get_text(strip=True),
-                            }
-                        )
-                except Exception as e:
-                    logger.warning(f"Failed to fetch minutes from {href}: {str(e)}")
-                    continue
-
-            logger.info(f"Successfully fetched {len(minutes)} FOMC meeting minutes")
-            return minutes
-
-        except Exception as e:
-            logger.error(f"Error fetching FOMC minutes: {str(e)}", exc_info=True)
-            raise CentralBankFetcherError(
-                f"Error fetching FOMC minutes: {str(e)}"
-            ) from e
+        return self._harvest(
+            "fomc_minutes",
+            "FOMC meeting minutes",
+            self.FOMC_MINUTES_URL,
+            link_pattern=r"/monetarypolicy/fomcminutes.*\.htm",
+            content_pattern=r"col|content|minutes",
+            limit=limit,
+            only_new=only_new,
+        )
 
     def fetch_fomc_press_conferences(
         self,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
         limit: Optional[int] = None,
+        only_new: bool = False,
     ) -> List[Dict[str, Any]]:
         """
         Fetch FOMC press conference transcripts.
@@ -347,87 +266,242 @@ class CentralBankFetcher:
             start_date: Start date (YYYY-MM-DD format, optional)
             end_date: End date (YYYY-MM-DD format, optional)
             limit: Maximum number of transcripts to fetch (optional)
+            only_new: Skip transcripts recorded in the communication index
+                unless they have been revised
 
         Returns:
             List of press conference dictionaries
 
+        Raises:
+            CentralBankFetcherError: If fetching fails
+        """
+        return self._harvest(
+            "fomc_press_conference",
+            "FOMC press conference transcripts",
+            self.FOMC_PRESS_CONFERENCES_URL,
+            link_pattern=r"/monetarypolicy/fomcpresconf.*\.htm",
+            content_pattern=r"col|content|transcript",
+            limit=limit,
+            only_new=only_new,
+        )
+
+    def _harvest(
+        self,
+        comm_type: str,
+        label: str,
+        index_url: str,
+        link_pattern: str,
+        content_pattern: str,
+        limit: Optional[int],
+        only_new: bool,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch the communications linked from an index page.
+
+        The linked documents are fetched concurrently; the shared session
+        throttles requests per host, so max_workers overlaps request latency
+        without exceeding the configured rate.
+
+        With only_new, links that are not indexed are fetched first. The
+        revalidate_limit most recent indexed links are then revalidated with
+        a conditional request built from the stored ETag/Last-Modified; a 304
+        or an unchanged content hash skips the link, and a changed hash
+        returns the document with revised=True. Older indexed links are not
+        requested.
+
+        Args:
+            comm_type: Communication type stored in each result
+            label: Description used in log messages
+            index_url: Index page listing the communications
+            link_pattern: Regex matching links to communications
+            content_pattern: Regex matching the class of the content div
+            limit: Maximum number of communications to fetch (optional)
+            only_new: Skip links (and content) in the communication index
+                unless the document at the link has changed
+
+        Returns:
+            List of communication dictionaries (new links first with only_new,
+            otherwise in index page order)
+
         Raises:
             CentralBankFetcherError: If fetching fails
         """
         if not self.use_web_scraping:
             raise CentralBankFetcherError("Web scraping is disabled")
 
-        logger.info("Fetching FOMC press conference transcripts")
+        logger.info(f"Fetching {label}")
         try:
-            # Fetch the FOMC press conferences page
-            response = self._make_request(self.FOMC_PRESS_CONFERENCES_URL)
+            # Fetch the index page
+            response = self._make_request(index_url)
             soup = self._parse_html(response.text)
 
-            transcripts = []
-            # Find transcript links
-            transcript_links = soup.find_all(
-                "a", href=re.compile(r"/monetarypolicy/fomcpresconf.*\.htm")
+            # Collect each linked document once, keeping the link text
+            links: Dict[str, str] = {}
+            for link in soup.find_all("a", href=re.compile(link_pattern)):
+                href = link.get("href")
+                if not isinstance(href, str):
+                    continue
+                if not href.startswith("http"):
+                    href = f"{self.FOMC_BASE_URL}{href}"
+                links.setdefault(href, link.get_text(strip=True))
+
+            urls = list(links)
+            indexed: Dict[str, Dict[str, str]] = {}
+            if only_new and self.index is not None:
+                indexed = self.index.lookup(urls)
+                new_urls = [url for url in urls if url not in indexed]
+                # Revisions follow publication closely, so only the most
+                # recent indexed links are revalidated, after the new ones
+                recent = sorted(
+                    (url for url in urls if url in indexed),
+                    key=lambda url: _link_date(url, links[url]),
+                    reverse=True,
+                )[: self.revalidate_limit]
+                logger.info(
+                    f"{len(new_urls)} of {len(links)} {label} links are new, "
+                    f"revalidating {len(recent)} indexed links"
+                )
+                urls = new_urls + recent
+            if limit:
+                urls = urls[:limit]
+            if not urls:
+                return []
+
+            fetch = partial(
+                self._fetch_communication,
+                comm_type=comm_type,
+                content_pattern=content_pattern,
             )
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(urls)),
+                thread_name_prefix="central-bank",
+            ) as executor:
+                communications = [
+                    comm
+                    for comm in executor.map(
+                        fetch,
+                        urls,
+                        [links[u] for u in urls],
+                        [indexed.get(u) for u in urls],
+                    )
+                    if comm
+                ]
+
+            if only_new and self.index is not None:
+                # Same document published under another URL
+                known = self.index.known_hashes(
+                    comm["content_hash"] for comm in communications
+                )
+                communications = [
+                    comm for comm in communications if comm["content_hash"] not in known
+                ]
+                revised = sum(1 for comm in communications if comm.get("revised"))
+                if revised:
+                    logger.info(f"{revised} indexed {label} have been revised")
+
+            logger.info(f"Successfully fetched {len(communications)} {label}")
+            return communications
 
-            for link in transcript_links[:limit] if limit else transcript_links:
-                try:
-                    href = link.get("href", "")
-                    if not href.startswith("http"):
-                        href = f"{self.FOMC_BASE_URL}{href}"
-
-                    # Fetch individual transcript
-                    transcript_response = self._make_request(href)
-                    transcript_soup = self._parse_html(transcript_response.text)
+        except Exception as e:
+            logger.error(f"Error fetching {label}: {str(e)}", exc_info=True)
+            raise CentralBankFetcherError(f"Error fetching {label}: {str(e)}") from e
 
-                    # Extract transcript content
-                    content_div = transcript_soup.find(
-                        "div", class_=re.compile(r"col|content|transcript")
-                    )
-                    if not content_div:
-                        content_div = transcript_soup.find(
-                            "div", id=re.compile(r"content|main")
-                        )
-
-                    content = (
-                        content_div.get_text(separator="\n", strip=True)
-                        if content_div
-                        else ""
-                    )
+    def _fetch_communication(
+        self,
+        url: str,
+        link_text: str,
+        indexed: Optional[Dict[str, str]],
+        comm_type: str,
+        content_pattern: str,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fetch and extract one communication.
 
-                    # Extract date
-                    date_text = link.get_text(strip=True)
-                    date_match = re.search(r"(\d{1,2}/\d{1,2}/\d{4})", date_text)
-
-                    transcript_date = date_match.group(1) if date_match else None
-
-                    if content:
-                        transcripts.append(
-                            {
-                                "type": "fomc_press_conference",
-                                "bank": "Federal Reserve",
-                                "date": transcript_date,
-                                "url": href,
-                                "content": content,
-                                "title": link.get_text(strip=True),
-                            }
-                        )
-                except Exception as e:
-                    logger.warning(f"Failed to fetch transcript from {href}: {str(e)}")
-                    continue
+        Args:
+            url: Document URL
+            link_text: Text of the index page link
+            indexed: Index entry of an already ingested URL (content_hash,
+                etag, last_modified), or None for a new link
+            comm_type: Communication type
+            content_pattern: Regex matching the class of the content div
 
-            logger.info(
-                f"Successfully fetched {len(transcripts)} "
-                f"FOMC press conference transcripts"
+        Returns:
+            Communication dictionary, or None if it has no content, cannot be
+            fetched, or is indexed and unchanged
+        """
+        headers: Dict[str, str] = {}
+        if indexed:
+            if indexed.get("etag"):
+                headers["If-None-Match"] = indexed["etag"]
+            if indexed.get("last_modified"):
+                headers["If-Modified-Since"] = indexed["last_modified"]
+        try:
+            response = self._make_request(url, headers=headers or None)
+            if response.status_code == 304:
+                return None
+            page = self._parse_html(response.text)
+
+            # Extract content
+            content_div = page.find("div", class_=re.compile(content_pattern))
+            if not content_div:
+                content_div = page.find("div", id=re.compile(r"content|main"))
+            content = (
+                content_div.get_text(separator="\n", strip=True) if content_div else ""
             )
-            return transcripts
-
+            if not content:
+                return None
+
+            # Extract date from link text or page
+            date_match = _DATE_RE.search(link_text)
+            if not date_match:
+                date_elem = page.find("time") or page.find(
+                    "span", class_=re.compile(r"date")
+                )
+                if date_elem:
+                    date_match = _DATE_RE.search(date_elem.get_text(strip=True))
+
+            content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+            if indexed and indexed.get("content_hash") == content_hash:
+                return None
+
+            return {
+                "type": comm_type,
+                "bank": "Federal Reserve",
+                "date": date_match.group(1) if date_match else None,
+                "url": url,
+                "content": content,
+                "title": link_text,
+                "content_hash": content_hash,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "revised": indexed is not None,
+            }
         except Exception as e:
-            logger.error(
-                f"Error fetching FOMC press conferences: {str(e)}", exc_info=True
-            )
-            raise CentralBankFetcherError(
-                f"Error fetching FOMC press conferences: {str(e)}"
-            ) from e
+            logger.warning(f"Failed to fetch {comm_type} from {url}: {str(e)}")
+            return None
+
+    def mark_ingested(self, communications: List[Dict[str, Any]]) -> int:
+        """
+        Record communications in the communication index.
+
+        Called once communications are stored, so fetches with only_new
+        skip them from then on.
+
+        Args:
+            communications: Communications returned by the fetch methods
+
+        Returns:
+            Number of communications recorded (0 without an index)
+
+        Raises:
+            CentralBankFetcherError: If the index cannot be updated
+        """
+        if self.index is None:
+            return 0
+        try:
+            return self.index.add(communications)
+        except CommunicationIndexError as e:
+            raise CentralBankFetcherError(str(e)) from e
 
     def extract_forward_guidance(self, content: str) -> List[str]:
         """
@@ -0,0 +1,209 @@
+"""
+Persisted index of ingested central bank communications.
+
+Records the URL, content hash and HTTP validators (ETag, Last-Modified) of
+every FOMC statement, minutes and press conference transcript that has been
+ingested. Refreshes fetch links that are not in the index yet, revalidate
+recent indexed links with conditional requests so a revised document at the
+same URL is picked up, and skip documents whose content was already ingested
+under another URL.
+"""
+
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Set
+
+from app.utils.config import config
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Keys per SQLite lookup (stays below the host parameter limit)
+_LOOKUP_BATCH = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS communications (
+    url TEXT PRIMARY KEY,
+    comm_type TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    title TEXT NOT NULL DEFAULT '',
+    date TEXT NOT NULL DEFAULT '',
+    ingested_at TEXT NOT NULL,
+    etag TEXT NOT NULL DEFAULT '',
+    last_modified TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_communications_hash
+    ON communications (content_hash);
+"""
+
+
+class CommunicationIndexError(Exception):
+    """Custom exception for communication index errors."""
+
+    pass
+
+
+class CommunicationIndex:
+    """
+    SQLite-backed index of ingested central bank communication URLs.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Initialize communication index.
+
+        Args:
+            db_path: Path to SQLite database file (default: from config)
+
+        Raises:
+            CommunicationIndexError: If the index cannot be opened
+        """
+        self.db_path = Path(db_path or config.central_bank_index_path)
+        self._lock = threading.Lock()
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                str(self.db_path), check_same_thread=False, isolation_level=None
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+        except sqlite3.Error as e:
+            raise CommunicationIndexError(
+                f"Failed to open communication index {self.db_path}: {str(e)}"
+            ) from e
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _existing(self, column: str, values: Iterable[str]) -> Set[str]:
+        """Return the values of column that are stored."""
+        keys = list(dict.fromkeys(values))
+        found: Set[str] = set()
+        try:
+            with self._lock:
+                for start in range(0, len(keys), _LOOKUP_BATCH):
+                    batch = keys[start : start + _LOOKUP_BATCH]
+                    rows = self._conn.execute(
+                        f"SELECT {column} FROM communications WHERE {column} IN "
+                        f"({', '.join('?' * len(batch))})",
+                        batch,
+                    ).fetchall()
+                    found.update(row[0] for row in rows)
+        except sqlite3.Error as e:
+            raise CommunicationIndexError(
+                f"Failed to query communication index: {str(e)}"
+            ) from e
+        return found
+
+    def lookup(self, urls: Iterable[str]) -> Dict[str, Dict[str, str]]:
+        """
+        Return the stored content hash and validators of indexed URLs.
+
+        Args:
+            urls: Communication URLs
+
+        Returns:
+            Dict mapping each indexed URL to its content_hash, etag and
+            last_modified (empty strings when the server sent no validator)
+
+        Raises:
+            CommunicationIndexError: If the lookup fails
+        """
+        keys = list(dict.fromkeys(urls))
+        found: Dict[str, Dict[str, str]] = {}
+        try:
+            with self._lock:
+                for start in range(0, len(keys), _LOOKUP_BATCH):
+                    batch = keys[start : start + _LOOKUP_BATCH]
+                    rows = self._conn.execute(
+                        "SELECT url, content_hash, etag, last_modified "
+                        "FROM communications WHERE url IN "
+                        f"({', '.join('?' * len(batch))})",
+                        batch,
+                    ).fetchall()
+                    for url, content_hash, etag, last_modified in rows:
+                        found[url] = {
+                            "content_hash": content_hash,
+                            "etag": etag,
+                            "last_modified": last_modified,
+                        }
+        except sqlite3.Error as e:
+            raise CommunicationIndexError(
+                f"Failed to query communication index: {str(e)}"
+            ) from e
+        return found
+
+    def known_hashes(self, content_hashes: Iterable[str]) -> Set[str]:
+        """
+        Return the content hashes that are already indexed.
+
+        Args:
+            content_hashes: Content hashes to check
+
+        Returns:
+            Set of indexed content hashes
+
+        Raises:
+            CommunicationIndexError: If the lookup fails
+        """
+        return self._existing("content_hash", content_hashes)
+
+    def add(self, communications: Iterable[Dict[str, Any]]) -> int:
+        """
+        Record ingested communications.
+
+        Args:
+            communications: Communication dicts with url, type and
+                content_hash (title, date, etag and last_modified are stored
+                if present); a URL already indexed is replaced, so a revised
+                document supersedes its previous version
+
+        Returns:
+            Number of communications recorded
+
+        Raises:
+            CommunicationIndexError: If the index cannot be written
+        """
+        ingested_at = datetime.now(timezone.utc).isoformat()
+        rows = [
+            (
+                comm["url"],
+                comm.get("type", ""),
+                comm["content_hash"],
+                comm.get("title") or "",
+                comm.get("date") or "",
+                ingested_at,
+                comm.get("etag") or "",
+                comm.get("last_modified") or "",
+            )
+            for comm in communications
+            if comm.get("url") and comm.get("content_hash")
+        ]
+        if not rows:
+            return 0
+        try:
+            with self._lock:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO communications (url, comm_type, "
+                    "content_hash, title, date, ingested_at, etag, last_modified) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+        except sqlite3.Error as e:
+            raise CommunicationIndexError(
+                f"Failed to update communication index: {str(e)}"
+            ) from e
+        logger.debug(f"Indexed {len(rows)} central bank communications")
+        return len(rows)
+
+    def count(self) -> int:
+        """Return the number of indexed communications."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM communications").fetchone()[
+                0
+            ]
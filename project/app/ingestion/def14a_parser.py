@@ -6,10 +6,9 @@ board member information, and shareholder proposals.
 """
 
 import re
-from typing import Any, Dict, List, Optional
-
-from bs4 import BeautifulSoup
+from typing import Any, Dict, List, Optional, Union
 
+from app.ingestion.html_extractor import ExtractedDocument, extract_document
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -34,13 +33,16 @@ class Def14AParser:
         self.logger = logger
 
     def parse(
-        self, html_content: str, metadata: Optional[Dict[str, Any]] = None
+        self,
+        html_content: Union[str, ExtractedDocument],
+        metadata: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """
         Parse DEF 14A HTML content and extract proxy statement data.
 
         Args:
-            html_content: HTML content of DEF 14A filing
+            html_content: HTML content of DEF 14A filing, or the filing already
+                extracted by the shared HTML engine (parsed once per filing)
             metadata: Optional metadata dictionary (ticker, CIK, filing date, etc.)
 
         Returns:
@@ -50,14 +52,18 @@ class Def14AParser:
             Def14AParserError: If parsing fails
         """
         try:
-            soup = BeautifulSoup(html_content, "html.parser")
+            document = (
+                html_content
+                if isinstance(html_content, ExtractedDocument)
+                else extract_document(html_content)
+            )
 
             # Extract sections
-            company_info = self._extract_company_info(soup)
-            voting_items = self._extract_voting_items(soup)
-            executive_compensation = self._extract_executive_compensation(soup)
-            board_members = self._extract_board_members(soup)
-            shareholder_proposals = self._extract_shareholder_proposals(soup)
+            company_info = self._extract_company_info(document)
+            voting_items = self._extract_voting_items(document)
+            executive_compensation = self._extract_executive_compensation(document)
+            board_members = self._extract_board_members(document)
+            shareholder_proposals = self._extract_shareholder_proposals(document)
 
             # Convert to text format
             text_content = self._convert_to_text(
@@ -101,11 +107,11 @@ class Def14AParser:
             self.logger.error(f"Failed to parse DEF 14A: {str(e)}", exc_info=True)
             raise Def14AParserError(f"Failed to parse DEF 14A: {str(e)}") from e
 
-    def _extract_company_info(self, soup: BeautifulSoup) -> Dict[str, str]:
+    def _extract_company_info(self, document: ExtractedDocument) -> Dict[str, str]:
         """Extract company information from DEF 14A."""
         info = {"name": "", "ticker": "", "cik": "", "meeting_date": ""}
 
-        text = soup.get_text()
+        text = document.text
 
         # Company name
         name_match = re.search(
@@ -139,10 +145,12 @@ class Def14AParser:
 
         return info
 
-    def _extract_voting_items(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+    def _extract_voting_items(
+        self, document: ExtractedDocument
+    ) -> List[Dict[str, Any]]:
         """Extract voting items/proposals from DEF 14A."""
         voting_items = []
-        text = soup.get_text()
+        text = document.text
 
         # Look for proposal sections
         proposal_pattern = re.compile(
@@ -171,7 +179,9 @@ class Def14AParser:
 
         return voting_items
 
-    def _extract_executive_compensation(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_executive_compensation(
+        self, document: ExtractedDocument
+    ) -> Dict[str, Any]:
         """Extract executive compensation information."""
         compensation = {
             "ceo_total": "",
@@ -179,7 +189,7 @@ class Def14AParser:
             "named_executives": [],
         }
 
-        text = soup.get_text()
+        text = document.text
 
         # Look for compensation tables
         comp_section = re.search(
@@ -211,10 +221,12 @@ class Def14AParser:
 
         return compensation
 
-    def _extract_board_members(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
+    def _extract_board_members(
+        self, document: ExtractedDocument
+    ) -> List[Dict[str, str]]:
         """Extract board member information."""
         board_members = []
-        text = soup.get_text()
+        text = document.text
 
         # Look for director information
         director_section = re.search(
@@ -238,10 +250,10 @@ class Def14AParser:
 
         return board_members[:20]  # Limit to 20
 
-    def _extract_shareholder_proposals(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_shareholder_proposals(self, document: ExtractedDocument) -> List[str]:
         """Extract shareholder proposals."""
         proposals = []
-        text = soup.get_text()
+        text = document.text
 
         # Look for shareholder proposal section
         shareholder_section = re.search(
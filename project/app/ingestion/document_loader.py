@@ -7,7 +7,8 @@ for the RAG system.
 
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, NamedTuple, Optional, Tuple
 
 from langchain_community.document_loaders import TextLoader
 from langchain_core.documents import Document
@@ -18,6 +19,10 @@ from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Document metadata key holding (title, start, end) section offsets into
+# page_content; chunk_document splits within sections and drops the key
+SECTION_OFFSETS_KEY = "section_offsets"
+
 
 class DocumentIngestionError(Exception):
     """Custom exception for document ingestion errors."""
@@ -25,6 +30,29 @@ class DocumentIngestionError(Exception):
     pass
 
 
+class DocumentChunk(NamedTuple):
+    """
+    A chunk of a streamed document.
+
+    All chunks of a document reference the same read-only parent metadata
+    mapping; the per-chunk metadata dict is only built when the chunk is
+    converted for embedding/storage.
+    """
+
+    text: str
+    chunk_index: int
+    parent_metadata: Mapping[str, Any]
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Merged parent metadata plus chunk_index."""
+        return {**self.parent_metadata, "chunk_index": self.chunk_index}
+
+    def to_document(self) -> Document:
+        """Convert to a LangChain Document."""
+        return Document(page_content=self.text, metadata=self.metadata)
+
+
 class DocumentLoader:
     """
     Document loader for processing text and Markdown files.
@@ -32,18 +60,23 @@ class DocumentLoader:
     Supports:
     - Text files (.txt)
     - Markdown files (.md)
-    - File size validation (max 10MB)
-    - Document chunking with metadata
+    - File size validation (config.max_document_size_mb)
+    - Streaming chunking with bounded memory
     - Error handling for corrupted/unsupported files
     """
 
-    # Maximum file size in bytes (10MB)
-    MAX_FILE_SIZE_BYTES = 10 * 1024 * 1024
+    # Characters read per window by the streaming splitter (1M chars)
+    STREAM_WINDOW_CHARS = 1024 * 1024
+
+    # Trailing chunks of each window held back and re-split with the next
+    # window, so chunk boundaries do not depend on where a window ends
+    STREAM_HOLDBACK_CHUNKS = 2
 
     def __init__(
         self,
         chunk_size: Optional[int] = None,
         chunk_overlap: Optional[int] = None,
+        max_file_size_bytes: Optional[int] = None,
     ):
         """
         Initialize document loader.
@@ -53,10 +86,16 @@ class DocumentLoader:
                 If None, uses config.RAG_CHUNK_SIZE (default: 800)
             chunk_overlap: Overlap between chunks in characters.
                 If None, uses config.RAG_CHUNK_OVERLAP (default: 150)
+            max_file_size_bytes: Maximum accepted file size in bytes.
+                If None, uses config.max_document_size_mb
         """
         # Use optimized defaults from config if not provided
         self.chunk_size = chunk_size or config.RAG_CHUNK_SIZE
         self.chunk_overlap = chunk_overlap or config.RAG_CHUNK_OVERLAP
+        # Files are streamed, so the limit is a policy cap, not a memory bound
+        self.max_file_size_bytes = (
+            max_file_size_bytes or config.max_document_size_mb * 1024 * 1024
+        )
         self.text_splitter = RecursiveCharacterTextSplitter(
             chunk_size=self.chunk_size,
             chunk_overlap=self.chunk_overlap,
@@ -86,14 +125,14 @@ class DocumentLoader:
 
         # Check file size
         file_size = file_path.stat().st_size
-        if file_size > self.MAX_FILE_SIZE_BYTES:
+        if file_size > self.max_file_size_bytes:
             logger.warning(
                 f"File size ({file_size} bytes) exceeds maximum "
-                f"allowed size ({self.MAX_FILE_SIZE_BYTES} bytes): {file_path}"
+                f"allowed size ({self.max_file_size_bytes} bytes): {file_path}"
             )
             raise DocumentIngestionError(
                 f"File size ({file_size} bytes) exceeds maximum "
-                f"allowed size ({self.MAX_FILE_SIZE_BYTES} bytes)"
+                f"allowed size ({self.max_file_size_bytes} bytes)"
             )
 
         # Check file extension
@@ -224,6 +263,153 @@ class DocumentLoader:
         logger.debug(f"Document loaded successfully: {file_path} (type: {file_type})")
         return document
 
+    def _document_metadata(self, file_path: Path) -> Dict[str, Any]:
+        """
+        Build parent metadata for a document file.
+
+        Args:
+            file_path: Path to the document file
+
+        Returns:
+            Metadata dictionary shared by all chunks of the document
+        """
+        return {
+            "source": str(file_path),
+            "filename": file_path.name,
+            "type": self._get_file_type(file_path),
+            "date": datetime.now().isoformat(),
+        }
+
+    def _iter_text_windows(self, file_path: Path) -> Iterator[str]:
+        """
+        Read a UTF-8 file in fixed-size character windows.
+
+        Args:
+            file_path: Path to the text file
+
+        Yields:
+            Consecutive text windows of at most STREAM_WINDOW_CHARS characters
+
+        Raises:
+            DocumentIngestionError: If the file cannot be read or decoded
+        """
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                while True:
+                    window = f.read(self.STREAM_WINDOW_CHARS)
+                    if not window:
+                        return
+                    yield window
+        except (OSError, UnicodeDecodeError) as e:
+            logger.error(f"Error reading file {file_path}: {str(e)}", exc_info=True)
+            raise DocumentIngestionError(
+                f"Error loading text file {file_path}: {str(e)}"
+            ) from e
+
+    def iter_text_chunks(self, file_path: Path) -> Iterator[str]:
+        """
+        Split a file into text chunks without loading the whole file.
+
+        The file is read in windows; each window (plus the carried-over tail
+        of the previous one) is split with the configured text splitter. The
+        last STREAM_HOLDBACK_CHUNKS chunks of a window are not emitted but
+        carried into the next window, so memory stays bounded by the window
+        size and chunk boundaries match a whole-file split except in rare
+        cases near window edges. Files smaller than one window are split
+        exactly like chunk_document().
+
+        Args:
+            file_path: Path to the text or Markdown file
+
+        Yields:
+            Chunk texts in document order
+
+        Raises:
+            DocumentIngestionError: If the file cannot be read or decoded
+        """
+        carry = ""
+        for window in self._iter_text_windows(file_path):
+            buffer = carry + window
+            pieces = self.text_splitter.split_text(buffer)
+            if len(pieces) <= self.STREAM_HOLDBACK_CHUNKS:
+                carry = buffer
+                continue
+
+            # Locate the first held-back chunk so the carry starts exactly there
+            cursor = 0
+            carry_start: Optional[int] = None
+            emit_count = len(pieces) - self.STREAM_HOLDBACK_CHUNKS
+            for idx, piece in enumerate(pieces):
+                position = buffer.find(piece, cursor)
+                if position < 0:
+                    break
+                if idx == emit_count:
+                    carry_start = position
+                    break
+                cursor = position + 1
+
+            if carry_start is None:
+                # Could not align chunks with the buffer; keep accumulating
+                carry = buffer
+                continue
+
+            yield from pieces[:emit_count]
+            carry = buffer[carry_start:]
+
+        if carry:
+            yield from self.text_splitter.split_text(carry)
+
+    def iter_document_chunks(
+        self, file_path: Path, metadata: Optional[Dict[str, Any]] = None
+    ) -> Iterator[DocumentChunk]:
+        """
+        Validate a file and lazily yield its chunks.
+
+        Chunks share one read-only parent metadata mapping, so memory per
+        chunk is just its text. Intended to be consumed in embedding batches.
+
+        Args:
+            file_path: Path to the document file
+            metadata: Extra metadata merged into every chunk (e.g. content_hash)
+
+        Yields:
+            DocumentChunk objects in document order
+
+        Raises:
+            DocumentIngestionError: If validation or reading fails
+        """
+        self._validate_file(file_path)
+        parent_metadata = self._document_metadata(file_path)
+        if metadata:
+            parent_metadata.update(metadata)
+        shared_metadata = MappingProxyType(parent_metadata)
+
+        logger.info(f"Streaming document chunks: {file_path}")
+        count = 0
+        for idx, text in enumerate(self.iter_text_chunks(file_path)):
+            count += 1
+            yield DocumentChunk(text, idx, shared_metadata)
+        logger.info(f"Document chunked into {count} chunks")
+
+    def iter_chunks(
+        self, file_path: Path, metadata: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Document]:
+        """
+        Validate a file and stream it as chunk Documents.
+
+        Args:
+            file_path: Path to the document file
+            metadata: Extra metadata merged into every chunk (e.g. content_hash)
+
+        Yields:
+            Document chunks with source metadata and chunk_index
+
+        Raises:
+            DocumentIngestionError: If validation or reading fails
+        """
+        for chunk in self.iter_document_chunks(file_path, metadata=metadata):
+            yield chunk.to_document()
+
     def chunk_document(self, document: Document) -> List[Document]:
         """
         Split a document into chunks with metadata.
@@ -231,32 +417,78 @@ class DocumentLoader:
         Args:
             document: Document object to chunk
 
+        If the metadata carries section offsets (SECTION_OFFSETS_KEY), each
+        section is split separately so no chunk spans a section boundary, and
+        every chunk records its section title.
+
         Returns:
             List of Document chunks with metadata including chunk_index
         """
         logger.debug(
             f"Chunking document (source: {document.metadata.get('source', 'unknown')})"
         )
-        # Split document into chunks
-        chunks = self.text_splitter.split_documents([document])
+        # Split text and build one metadata dict per chunk (split_documents
+        # would deep-copy the parent metadata and then update it again)
+        parent_metadata = document.metadata
+        sections = parent_metadata.get(SECTION_OFFSETS_KEY)
+        if not sections:
+            return self._build_chunks(
+                self.text_splitter.split_text(document.page_content),
+                parent_metadata,
+            )
 
-        # Add chunk_index to metadata
-        for idx, chunk in enumerate(chunks):
-            chunk.metadata["chunk_index"] = idx
-            # Preserve original metadata
-            chunk.metadata.update(document.metadata)
+        parent_metadata = {
+            k: v for k, v in parent_metadata.items() if k != SECTION_OFFSETS_KEY
+        }
+        text = document.page_content
+        # Untitled spans cover text outside any section (preamble, appended data)
+        spans: List[Tuple[Optional[str], int, int]] = []
+        position = 0
+        for title, start, end in sections:
+            spans.append((None, position, start))
+            spans.append((title, start, end))
+            position = max(position, end)
+        spans.append((None, position, len(text)))
+        pieces = [
+            (title, piece)
+            for title, start, end in spans
+            for piece in self.text_splitter.split_text(text[start:end])
+        ]
+
+        chunks = self._build_chunks([t for _, t in pieces], parent_metadata)
+        for chunk, (title, _) in zip(chunks, pieces):
+            if title:
+                chunk.metadata["section"] = title
+        return chunks
+
+    def _build_chunks(
+        self, texts: List[str], parent_metadata: Mapping[str, Any]
+    ) -> List[Document]:
+        """Wrap split texts in Documents with chunk_index metadata."""
+        chunks = [
+            Document(
+                page_content=text,
+                metadata={"chunk_index": idx, **parent_metadata},
+            )
+            for idx, text in enumerate(texts)
+        ]
 
         logger.info(f"Document chunked into {len(chunks)} chunks")
         return chunks
 
-    def process_document(self, file_path: Path) -> List[Document]:
+    def process_document(
+        self, file_path: Path, metadata: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
         """
-        Process a document: load, validate, and chunk.
+        Process a document: validate and chunk.
 
-        This is the main entry point for document processing.
+        This is the main entry point for document processing. The file is
+        split through the streaming splitter, so the full document text is
+        never held in memory alongside its chunks.
 
         Args:
             file_path: Path to the document file
+            metadata: Extra metadata merged into every chunk (optional)
 
         Returns:
             List of Document chunks with metadata
@@ -264,13 +496,7 @@ class DocumentLoader:
         Raises:
             DocumentIngestionError: If document processing fails
         """
-        # Load document
-        document = self.load_document(file_path)
-
-        # Chunk document
-        chunks = self.chunk_document(document)
-
-        return chunks
+        return list(self.iter_chunks(file_path, metadata=metadata))
 
     def process_documents(self, file_paths: List[Path]) -> List[Document]:
         """
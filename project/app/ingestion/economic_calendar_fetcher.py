@@ -5,13 +5,13 @@ Fetches economic calendar data from Trading Economics API or alternative sources
 to provide macroeconomic indicators and events for financial analysis.
 """
 
-import time
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
 import requests
 
 from app.utils.config import config
+from app.utils.http_client import create_http_session, delay_to_rate
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -61,7 +61,10 @@ class EconomicCalendarFetcher:
             if use_trading_economics is not None
             else config.economic_calendar_use_trading_economics
         )
-        self.session = requests.Session()
+        # Shared cached session; throttled per host on cache misses only
+        self.session = create_http_session(
+            requests_per_second=delay_to_rate(self.rate_limit_delay)
+        )
         self.session.headers.update(
             {
                 "User-Agent": (
@@ -94,7 +97,6 @@ class EconomicCalendarFetcher:
             EconomicCalendarFetcherError: If request fails
         """
         try:
-            time.sleep(self.rate_limit_delay)
             request_headers = self.session.headers.copy()
             if headers:
                 request_headers.update(headers)
@@ -6,15 +6,25 @@ to text format for RAG ingestion.
 """
 
 import json
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import requests
 from langchain_core.documents import Document
 
+from app.ingestion.document_loader import SECTION_OFFSETS_KEY
+from app.ingestion.html_extractor import ExtractedDocument, extract_document
+from app.ingestion.sec_company_directory import (
+    SECCompanyDirectory,
+    get_company_directory,
+)
+from app.utils.config import config
+from app.utils.http_client import create_http_session
 from app.utils.logger import get_logger
+from app.utils.rate_limiter import get_rate_limiter
 
 logger = get_logger(__name__)
 
@@ -23,7 +33,8 @@ try:
     from app.ingestion.def14a_parser import Def14AParser
     from app.ingestion.form4_parser import Form4Parser
     from app.ingestion.forms1_parser import FormS1Parser
-    from app.ingestion.xbrl_parser import XBRLParser
+    from app.ingestion.xbrl_fact_store import XBRLFactStore
+    from app.ingestion.xbrl_parser import XBRLParser, iter_xbrl_facts
 
     ENHANCED_PARSERS_AVAILABLE = True
 except ImportError:
@@ -42,29 +53,60 @@ class EdgarFetcher:
     SEC EDGAR data fetcher.
 
     Fetches filings from SEC EDGAR using free public APIs.
-    Respects rate limits (10 requests per second).
+    Respects rate limits (10 requests per second) through a token bucket
+    shared by every fetcher instance and worker thread in the process.
+    Responses go through the shared HTTP cache, so archive documents are
+    downloaded once.
     """
 
     BASE_URL = "https://data.sec.gov"
     USER_AGENT = (
         "Financial Research Assistant (contact@example.com)"  # SEC requires user agent
     )
+    # Key of the process-wide limiter shared by all SEC requests
+    RATE_LIMITER_KEY = "sec.gov"
+    # Form types whose parsers need element lookups on the parsed tree
+    TREE_FORM_TYPES = frozenset({"4"})
 
     def __init__(
-        self, rate_limit_delay: float = 0.1, use_enhanced_parsing: bool = True
+        self,
+        rate_limit_delay: float = 0.1,
+        use_enhanced_parsing: bool = True,
+        max_workers: Optional[int] = None,
+        company_directory: Optional[SECCompanyDirectory] = None,
+        fact_store: Optional["XBRLFactStore"] = None,
     ):
         """
         Initialize EDGAR fetcher.
 
         Args:
-            rate_limit_delay: Delay between requests in seconds
-                (default: 0.1 for 10 req/sec)
+            rate_limit_delay: Minimum average interval between requests in
+                seconds (default: 0.1 for 10 req/sec). The resulting rate is
+                capped at config.edgar_requests_per_second.
             use_enhanced_parsing: Whether to use enhanced parsers
                 for Form 4, S-1, DEF 14A, XBRL
+            max_workers: Concurrent download threads for
+                fetch_filings_to_documents. If None, uses config.edgar_max_workers
+            company_directory: Ticker/CIK directory
+                (default: shared SECCompanyDirectory)
+            fact_store: Store for numeric XBRL facts (default: opened on first
+                use at config.xbrl_fact_store_path if
+                config.xbrl_fact_store_enabled)
         """
         self.rate_limit_delay = rate_limit_delay
         self.use_enhanced_parsing = use_enhanced_parsing and ENHANCED_PARSERS_AVAILABLE
-        self.session = requests.Session()
+        self.max_workers = max_workers or config.edgar_max_workers
+        self.company_directory = company_directory or get_company_directory()
+        self._fact_store = fact_store
+
+        requests_per_second = config.edgar_requests_per_second
+        if rate_limit_delay > 0:
+            requests_per_second = min(requests_per_second, 1.0 / rate_limit_delay)
+        self.rate_limiter = get_rate_limiter(self.RATE_LIMITER_KEY, requests_per_second)
+
+        # Shared cached session reused by all worker threads: archive files
+        # are cached forever and only network requests consume SEC tokens
+        self.session = create_http_session(rate_limiter=self.rate_limiter)
         self.session.headers.update(
             {
                 "User-Agent": self.USER_AGENT,
@@ -99,7 +141,6 @@ class EdgarFetcher:
         """
         try:
             logger.debug(f"Making request to SEC EDGAR: {url}")
-            time.sleep(self.rate_limit_delay)  # Rate limiting
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
             logger.debug(f"Successfully fetched from SEC EDGAR: {url}")
@@ -121,69 +162,36 @@ class EdgarFetcher:
         """
         Get company CIK (Central Index Key) from ticker symbol.
 
+        Uses the shared SEC company directory, which is downloaded at most
+        once per refresh interval rather than once per unknown ticker.
+
         Args:
             ticker: Stock ticker symbol (e.g., "AAPL")
 
         Returns:
             CIK as zero-padded string, or None if not found
-
-        Raises:
-            EdgarFetcherError: If lookup fails
         """
-        # Common ticker-to-CIK mapping for major companies
-        # This avoids API dependency issues and provides reliable lookups
-        TICKER_TO_CIK = {
-            "AAPL": "0000320193",  # Apple Inc.
-            "MSFT": "0000789019",  # Microsoft Corporation
-            "GOOGL": "0001652044",  # Alphabet Inc.
-            "AMZN": "0001018724",  # Amazon.com Inc.
-            "META": "0001326801",  # Meta Platforms Inc.
-            "TSLA": "0001318605",  # Tesla, Inc.
-            "NVDA": "0001045810",  # NVIDIA Corporation
-            "JPM": "0000019617",  # JPMorgan Chase & Co.
-            "V": "0001403161",  # Visa Inc.
-            "JNJ": "0000200406",  # Johnson & Johnson
-            "WMT": "0000104169",  # Walmart Inc.
-            "PG": "0000080424",  # Procter & Gamble Co.
-            "MA": "0001141391",  # Mastercard Inc.
-            "HD": "0000354950",  # The Home Depot, Inc.
-            "DIS": "0001001039",  # The Walt Disney Company
-            "BAC": "0000070858",  # Bank of America Corp.
-            "XOM": "0000034088",  # Exxon Mobil Corporation
-            "VZ": "0000732712",  # Verizon Communications Inc.
-            "CVX": "0000093410",  # Chevron Corporation
-            "KO": "0000021344",  # The Coca-Cola Company
-        }
-
         logger.debug(f"Looking up CIK for ticker: {ticker}")
-        ticker_upper = ticker.upper()
-        if ticker_upper in TICKER_TO_CIK:
-            cik = TICKER_TO_CIK[ticker_upper]
-            logger.debug(f"Found CIK {cik} for ticker {ticker} from mapping")
-            return cik
+        cik = self.company_directory.get_cik(ticker)
+        if cik is None:
+            logger.warning(f"CIK not found for ticker: {ticker}")
+        return cik
 
-        # Fallback: Try API lookup if ticker not in mapping
-        try:
-            logger.debug(f"Ticker {ticker} not in mapping, trying API lookup")
-            # SEC provides company tickers JSON (may require authentication)
-            url = f"{self.BASE_URL}/files/company_tickers.json"
-            data = self._make_request(url)
-
-            # Search for ticker
-            for entry in data.values():
-                if isinstance(entry, dict) and entry.get("ticker") == ticker_upper:
-                    cik = str(entry.get("cik_str", ""))
-                    # Pad CIK to 10 digits
-                    cik_padded = cik.zfill(10)
-                    logger.debug(f"Found CIK {cik_padded} for ticker {ticker} from API")
-                    return cik_padded
-        except Exception as e:
-            # API lookup failed, but we already tried the mapping
-            logger.warning(f"API lookup failed for ticker {ticker}: {str(e)}")
-            pass
+    def get_company_ciks(self, tickers: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Get CIKs for many ticker symbols in one directory lookup.
 
-        logger.warning(f"CIK not found for ticker: {ticker}")
-        return None
+        Args:
+            tickers: Stock ticker symbols
+
+        Returns:
+            Mapping of each ticker to its zero-padded CIK (None if not found)
+        """
+        ciks = self.company_directory.get_ciks(tickers)
+        missing = [ticker for ticker, cik in ciks.items() if cik is None]
+        if missing:
+            logger.warning(f"CIK not found for tickers: {missing}")
+        return ciks
 
     def get_filing_history(self, cik: str) -> Dict[str, Any]:
         """
@@ -275,6 +283,25 @@ class EdgarFetcher:
         """
         Download filing text content.
 
+        Args:
+            cik: Company CIK (10-digit zero-padded)
+            accession_number: Filing accession number (e.g., "0000950170-23-027789")
+            form_type: Form type (e.g., "10-K")
+
+        Returns:
+            Filing text content
+
+        Raises:
+            EdgarFetcherError: If download fails
+        """
+        return self.download_filing(cik, accession_number, form_type).text
+
+    def download_filing(
+        self, cik: str, accession_number: str, form_type: str
+    ) -> ExtractedDocument:
+        """
+        Download a filing and extract its text once with the shared HTML engine.
+
         Based on SEC EDGAR API structure:
         - Base URL: https://www.sec.gov/Archives/edgar/data/
         - Path: {CIK}/{ACCESSION-NUMBER-WITH-DASHES}/filename
@@ -286,7 +313,7 @@ class EdgarFetcher:
             form_type: Form type (e.g., "10-K")
 
         Returns:
-            Filing text content
+            ExtractedDocument with filing text and section offsets
 
         Raises:
             EdgarFetcherError: If download fails
@@ -321,7 +348,6 @@ class EdgarFetcher:
             # Try index.json without dashes first (most common format)
             for index_url in [index_url_no_dashes, index_url_with_dashes]:
                 try:
-                    time.sleep(self.rate_limit_delay)
                     response = self.session.get(index_url, timeout=30)
                     if response.status_code == 200:
                         index_data = response.json()
@@ -388,44 +414,23 @@ class EdgarFetcher:
             for doc_name in document_names:
                 url = f"{base_url}/{cik}/{acc_path_no_dashes}/{doc_name}"
                 try:
-                    time.sleep(self.rate_limit_delay)
                     response = self.session.get(url, timeout=30)
                     if response.status_code == 200:
-                        text = response.text
-
-                        # If HTML, extract text content
-                        if doc_name.endswith(".htm") or doc_name.endswith(".html"):
-                            import re
-                            from html import unescape
-
-                            # Remove script and style tags
-                            text = re.sub(
-                                r"<script[^>]*>.*?</script>",
-                                "",
-                                text,
-                                flags=re.DOTALL | re.IGNORECASE,
-                            )
-                            text = re.sub(
-                                r"<style[^>]*>.*?</style>",
-                                "",
-                                text,
-                                flags=re.DOTALL | re.IGNORECASE,
-                            )
-                            # Remove HTML tags but preserve structure
-                            text = re.sub(r"<[^>]+>", " ", text)
-                            # Decode HTML entities
-                            text = unescape(text)
-                            # Clean up whitespace
-                            text = re.sub(r"\s+", " ", text)
-                            text = text.strip()
+                        # Sniff HTML by content: .txt submissions often
+                        # embed HTML documents
+                        document = extract_document(
+                            response.text,
+                            keep_tree=form_type.upper() in self.TREE_FORM_TYPES,
+                        )
 
                         # Validate content length
-                        if text and len(text.strip()) > 100:
+                        if len(document.text.strip()) > 100:
                             logger.info(
                                 f"Successfully downloaded filing "
-                                f"{accession_number} ({len(text)} chars)"
+                                f"{accession_number} ({len(document.text)} chars, "
+                                f"{len(document.sections)} sections)"
                             )
-                            return text
+                            return document
                 except requests.exceptions.RequestException:
                     continue
                 except Exception:
@@ -458,6 +463,10 @@ class EdgarFetcher:
         """
         Fetch EDGAR filings and convert to Document objects.
 
+        Tickers and filings are fetched concurrently on up to max_workers
+        threads. All requests share the SEC rate limiter and the pooled,
+        cached HTTP session; documents are returned in ticker order, then filing order.
+
         Args:
             tickers: List of stock ticker symbols
             form_types: List of form types to fetch (e.g., ["10-K", "10-Q", "8-K"])
@@ -474,116 +483,207 @@ class EdgarFetcher:
             form_types = ["10-K", "10-Q", "8-K", "4", "S-1", "DEF 14A"]
 
         logger.info(f"Fetching filings for {len(tickers)} tickers: {tickers}")
-        documents = []
         total_companies = len(tickers)
 
-        for idx, ticker in enumerate(tickers, 1):
-            try:
-                logger.info(f"[{idx}/{total_companies}] Processing {ticker}...")
-
-                # Get CIK for ticker
-                cik = self.get_company_cik(ticker)
-                if not cik:
-                    logger.warning(f"CIK not found for ticker {ticker}, skipping")
-                    continue
-                logger.info(f"Found CIK {cik} for ticker {ticker}")
+        # Resolve all CIKs up front: refreshes the directory at most once,
+        # so per-ticker lookups below are in-memory
+        self.get_company_ciks(tickers)
+
+        # Requests run on a thread pool; the shared token bucket keeps the
+        # combined rate at SEC's cap, so throughput is bounded by the cap
+        # rather than by per-request latency.
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="edgar"
+        ) as executor:
+            # Phase 1: resolve CIKs and filing lists for all tickers
+            list_filings = partial(
+                self._list_ticker_filings,
+                total_companies=total_companies,
+                form_types=form_types,
+                max_filings=max_filings_per_company,
+            )
+            listings = list(
+                executor.map(list_filings, range(1, total_companies + 1), tickers)
+            )
 
-                # Get recent filings
-                filings = self.get_recent_filings(
-                    cik, form_types=form_types, max_filings=max_filings_per_company
+            # Phase 2: download every filing of every ticker concurrently
+            futures = [
+                (
+                    ticker,
+                    [
+                        executor.submit(
+                            self._fetch_filing_document,
+                            ticker,
+                            cik,
+                            filing,
+                            filing_idx,
+                            len(filings),
+                        )
+                        for filing_idx, filing in enumerate(filings, 1)
+                    ],
                 )
+                for ticker, cik, filings in listings
+                # Tickers without a CIK never have filings; skip them explicitly
+                if cik is not None and filings
+            ]
 
-                if not filings:
-                    logger.warning(f"No filings found for {ticker}")
-                    continue
+            # Collect in ticker/filing order so output is deterministic
+            documents = []
+            for ticker, ticker_futures in futures:
+                ticker_docs = [
+                    doc for doc in (f.result() for f in ticker_futures) if doc
+                ]
+                documents.extend(ticker_docs)
+                logger.info(f"Completed {ticker}: {len(ticker_docs)} filings fetched")
 
-                # Download each filing
-                logger.info(f"Downloading {len(filings)} filings for {ticker}")
-                for filing_idx, filing in enumerate(filings, 1):
-                    try:
-                        logger.debug(
-                            f"[{filing_idx}/{len(filings)}] "
-                            f"Downloading {filing['form']} "
-                            f"({filing['date']}) for {ticker}"
-                        )
+        logger.info(f"Completed fetching filings: {len(documents)} documents total")
+        return documents
 
-                        # Download filing text
-                        content = self.download_filing_text(
-                            cik, filing["accession_number"], filing["form"]
-                        )
+    def _list_ticker_filings(
+        self,
+        idx: int,
+        ticker: str,
+        total_companies: int,
+        form_types: List[str],
+        max_filings: int,
+    ) -> Tuple[str, Optional[str], List[Dict[str, Any]]]:
+        """
+        Resolve a ticker's CIK and its recent filings.
 
-                        if not content or len(content.strip()) < 100:
-                            logger.warning(
-                                f"Insufficient content for {ticker} {filing['form']} "
-                                f"({filing['date']})"
-                            )
-                            continue
+        Args:
+            idx: 1-based position of the ticker (for progress logging)
+            ticker: Stock ticker symbol
+            total_companies: Total number of tickers (for progress logging)
+            form_types: Form types to include
+            max_filings: Maximum filings to return
 
-                        # Enhanced parsing for specific form types
-                        enhanced_metadata = {
-                            "source": f"SEC EDGAR - {ticker}",
-                            "filename": (
-                                f"{ticker}_{filing['form']}_{filing['date']}.txt"
-                            ),
-                            "type": "edgar_filing",
-                            "ticker": ticker,
-                            "cik": cik,
-                            "form_type": filing["form"],
-                            "filing_date": filing["date"],
-                            "accession_number": filing["accession_number"],
-                            "date": datetime.now().isoformat(),
-                        }
+        Returns:
+            Tuple of (ticker, CIK or None, filings); filings is empty when the
+            ticker cannot be processed
+        """
+        try:
+            logger.info(f"[{idx}/{total_companies}] Processing {ticker}...")
 
-                        # Apply enhanced parsing if available
-                        if self.use_enhanced_parsing:
-                            try:
-                                parsed_data = self._parse_enhanced_form(
-                                    filing["form"], content, enhanced_metadata
-                                )
-                                if parsed_data:
-                                    content = parsed_data.get("text_content", content)
-                                    enhanced_metadata.update(
-                                        parsed_data.get("metadata", {})
-                                    )
-                            except Exception as e:
-                                logger.warning(
-                                    f"Enhanced parsing failed for "
-                                    f"{filing['form']}: {str(e)}. "
-                                    "Using basic content."
-                                )
-
-                        # Create Document object
-                        doc = Document(
-                            page_content=content,
-                            metadata=enhanced_metadata,
-                        )
-                        documents.append(doc)
-                        content_size = len(content) // 1024  # Size in KB
-                        logger.info(
-                            f"Downloaded {ticker} {filing['form']} ({filing['date']}): "
-                            f"{content_size} KB"
-                        )
+            # Get CIK for ticker
+            cik = self.get_company_cik(ticker)
+            if not cik:
+                logger.warning(f"CIK not found for ticker {ticker}, skipping")
+                return ticker, None, []
+            logger.info(f"Found CIK {cik} for ticker {ticker}")
 
-                    except Exception as e:
-                        logger.error(
-                            f"Error downloading {ticker} "
-                            f"{filing['form']} ({filing['date']}): "
-                            f"{str(e)}",
-                            exc_info=True,
-                        )
-                        continue
+            # Get recent filings
+            filings = self.get_recent_filings(
+                cik, form_types=form_types, max_filings=max_filings
+            )
+
+            if not filings:
+                logger.warning(f"No filings found for {ticker}")
+                return ticker, cik, []
+
+            logger.info(f"Downloading {len(filings)} filings for {ticker}")
+            return ticker, cik, filings
+
+        except Exception as e:
+            logger.error(f"Failed to process {ticker}: {str(e)}", exc_info=True)
+            return ticker, None, []
+
+    def _fetch_filing_document(
+        self,
+        ticker: str,
+        cik: str,
+        filing: Dict[str, Any],
+        filing_idx: int,
+        total_filings: int,
+    ) -> Optional[Document]:
+        """
+        Download one filing and convert it to a Document.
+
+        Args:
+            ticker: Stock ticker symbol
+            cik: Company CIK
+            filing: Filing dictionary from get_recent_filings
+            filing_idx: 1-based position of the filing (for progress logging)
+            total_filings: Number of filings for the ticker
+
+        Returns:
+            Document, or None if the filing could not be downloaded or is empty
+        """
+        try:
+            logger.debug(
+                f"[{filing_idx}/{total_filings}] "
+                f"Downloading {filing['form']} "
+                f"({filing['date']}) for {ticker}"
+            )
 
-                ticker_docs = len(
-                    [d for d in documents if d.metadata.get("ticker") == ticker]
+            # Download and extract the filing once; parsers reuse it
+            filing_document = self.download_filing(
+                cik, filing["accession_number"], filing["form"]
+            )
+            content = filing_document.text
+
+            if not content or len(content.strip()) < 100:
+                logger.warning(
+                    f"Insufficient content for {ticker} {filing['form']} "
+                    f"({filing['date']})"
                 )
-                logger.info(f"Completed {ticker}: {ticker_docs} filings fetched")
+                return None
+
+            # Enhanced parsing for specific form types
+            enhanced_metadata = {
+                "source": f"SEC EDGAR - {ticker}",
+                "filename": f"{ticker}_{filing['form']}_{filing['date']}.txt",
+                "type": "edgar_filing",
+                "ticker": ticker,
+                "cik": cik,
+                "form_type": filing["form"],
+                "filing_date": filing["date"],
+                "accession_number": filing["accession_number"],
+                "date": datetime.now().isoformat(),
+            }
 
-            except Exception as e:
-                logger.error(f"Failed to process {ticker}: {str(e)}", exc_info=True)
-                continue
+            # Apply enhanced parsing if available
+            if self.use_enhanced_parsing:
+                try:
+                    parsed_data = self._parse_enhanced_form(
+                        filing["form"], filing_document, enhanced_metadata
+                    )
+                    if parsed_data:
+                        content = parsed_data.get("text_content", content)
+                        enhanced_metadata.update(parsed_data.get("metadata", {}))
+                except Exception as e:
+                    logger.warning(
+                        f"Enhanced parsing failed for "
+                        f"{filing['form']}: {str(e)}. "
+                        "Using basic content."
+                    )
 
-        logger.info(f"Completed fetching filings: {len(documents)} documents total")
-        return documents
+            # Section offsets stay valid while the extracted text is a prefix
+            # (enhanced parsers may replace it; XBRL data is appended)
+            if filing_document.sections and content.startswith(filing_document.text):
+                enhanced_metadata[SECTION_OFFSETS_KEY] = (
+                    filing_document.section_offsets()
+                )
+
+            # Create Document object
+            doc = Document(
+                page_content=content,
+                metadata=enhanced_metadata,
+            )
+            content_size = len(content) // 1024  # Size in KB
+            logger.info(
+                f"Downloaded {ticker} {filing['form']} ({filing['date']}): "
+                f"{content_size} KB"
+            )
+            return doc
+
+        except Exception as e:
+            logger.error(
+                f"Error downloading {ticker} "
+                f"{filing['form']} ({filing['date']}): "
+                f"{str(e)}",
+                exc_info=True,
+            )
+            return None
 
     def save_filings_to_files(
         self, documents: List[Document], output_dir: Path
@@ -618,14 +718,18 @@ class EdgarFetcher:
         return saved_paths
 
     def _parse_enhanced_form(
-        self, form_type: str, content: str, metadata: Dict[str, Any]
+        self,
+        form_type: str,
+        content: Union[str, ExtractedDocument],
+        metadata: Dict[str, Any],
     ) -> Optional[Dict[str, Any]]:
         """
         Parse enhanced form types using specialized parsers.
 
         Args:
             form_type: Form type (e.g., "4", "S-1", "DEF 14A")
-            content: Filing content (HTML/text)
+            content: Filing content (HTML/text), or the extracted filing
+                shared by all parsers
             metadata: Base metadata dictionary
 
         Returns:
@@ -634,6 +738,7 @@ class EdgarFetcher:
         if not self.use_enhanced_parsing:
             return None
 
+        text = content.text if isinstance(content, ExtractedDocument) else content
         try:
             form_type_upper = form_type.upper()
 
@@ -641,7 +746,7 @@ class EdgarFetcher:
             if form_type_upper == "4" and self.form4_parser:
                 parsed = self.form4_parser.parse(content, metadata)
                 return {
-                    "text_content": parsed.get("text_content", content),
+                    "text_content": parsed.get("text_content", text),
                     "metadata": parsed.get("metadata", {}),
                 }
 
@@ -649,7 +754,7 @@ class EdgarFetcher:
             if form_type_upper in ("S-1", "S1") and self.forms1_parser:
                 parsed = self.forms1_parser.parse(content, metadata)
                 return {
-                    "text_content": parsed.get("text_content", content),
+                    "text_content": parsed.get("text_content", text),
                     "metadata": parsed.get("metadata", {}),
                 }
 
@@ -657,12 +762,16 @@ class EdgarFetcher:
             if form_type_upper in ("DEF 14A", "DEF14A", "14A") and self.def14a_parser:
                 parsed = self.def14a_parser.parse(content, metadata)
                 return {
-                    "text_content": parsed.get("text_content", content),
+                    "text_content": parsed.get("text_content", text),
                     "metadata": parsed.get("metadata", {}),
                 }
 
             # XBRL parsing (for 10-K, 10-Q with XBRL attachments)
-            if form_type_upper in ("10-K", "10-Q") and self.xbrl_parser:
+            if (
+                form_type_upper in ("10-K", "10-Q")
+                and self.xbrl_parser
+                and config.edgar_xbrl_enabled
+            ):
                 # Try to download XBRL file
                 try:
                     xbrl_content = self._download_xbrl_file(
@@ -670,10 +779,11 @@ class EdgarFetcher:
                         metadata.get("accession_number", ""),
                     )
                     if xbrl_content:
+                        self._store_xbrl_facts(xbrl_content, metadata)
                         parsed = self.xbrl_parser.parse(xbrl_content, metadata)
                         # Merge XBRL text with HTML content
                         combined_content = (
-                            f"{content}\n\n--- XBRL FINANCIAL DATA ---\n"
+                            f"{text}\n\n--- XBRL FINANCIAL DATA ---\n"
                             f"{parsed.get('text_content', '')}"
                         )
                         return {
@@ -690,6 +800,47 @@ class EdgarFetcher:
 
         return None
 
+    @property
+    def fact_store(self) -> Optional["XBRLFactStore"]:
+        """XBRL fact store, opened on first use (None if disabled)."""
+        if self._fact_store is None and config.xbrl_fact_store_enabled:
+            self._fact_store = XBRLFactStore()
+        return self._fact_store
+
+    def _store_xbrl_facts(self, xbrl_content: bytes, metadata: Dict[str, Any]) -> int:
+        """
+        Stream numeric facts from an XBRL instance into the fact store.
+
+        Failures are logged and do not affect document ingestion.
+
+        Args:
+            xbrl_content: XBRL instance or zip archive
+            metadata: Filing metadata (cik, ticker, accession_number, ...)
+
+        Returns:
+            Number of facts stored
+        """
+        try:
+            store = self.fact_store
+            if store is None:
+                return 0
+            count = store.add_facts(
+                iter_xbrl_facts(xbrl_content),
+                cik=metadata.get("cik", ""),
+                ticker=metadata.get("ticker", ""),
+                accession=metadata.get("accession_number", ""),
+                form_type=metadata.get("form_type", ""),
+                filing_date=metadata.get("filing_date", ""),
+            )
+            logger.info(
+                f"Stored {count} XBRL facts for {metadata.get('ticker', '')} "
+                f"{metadata.get('form_type', '')}"
+            )
+            return count
+        except Exception as e:
+            logger.warning(f"Failed to store XBRL facts: {str(e)}")
+            return 0
+
     def _download_xbrl_file(self, cik: str, accession_number: str) -> Optional[bytes]:
         """
         Download XBRL file for a filing (if available).
@@ -716,7 +867,6 @@ class EdgarFetcher:
             for xbrl_name in xbrl_names:
                 url = f"{base_url}/{cik}/{acc_path_no_dashes}/{xbrl_name}"
                 try:
-                    time.sleep(self.rate_limit_delay)
                     response = self.session.get(url, timeout=30)
                     if response.status_code == 200:
                         logger.debug(f"Downloaded XBRL file: {xbrl_name}")
@@ -736,7 +886,7 @@ def create_edgar_fetcher(rate_limit_delay: float = 0.1) -> EdgarFetcher:
     Create an EDGAR fetcher instance.
 
     Args:
-        rate_limit_delay: Delay between requests in seconds
+        rate_limit_delay: Minimum average interval between requests in seconds
 
     Returns:
         EdgarFetcher instance
@@ -5,13 +5,13 @@ Fetches ESG ratings and data from various providers including
 MSCI, Sustainalytics, and CDP (Carbon Disclosure Project).
 """
 
-import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 import requests
 from langchain_core.documents import Document
 
+from app.utils.http_client import create_http_session, delay_to_rate
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -54,7 +54,10 @@ class ESGFetcher:
         self.sustainalytics_enabled = sustainalytics_enabled
         self.cdp_enabled = cdp_enabled
         self.rate_limit_delay = rate_limit_delay
-        self.session = requests.Session()
+        # Shared cached session; throttled per host on cache misses only
+        self.session = create_http_session(
+            requests_per_second=delay_to_rate(self.rate_limit_delay)
+        )
 
         # Initialize API clients if credentials are available
         import os
@@ -106,8 +109,6 @@ class ESGFetcher:
         """
         try:
             logger.debug(f"Making request to ESG API: {url}")
-            time.sleep(self.rate_limit_delay)  # Rate limiting
-
             request_headers = {"Accept": "application/json"}
             if headers:
                 request_headers.update(headers)
@@ -6,10 +6,9 @@ including transaction dates, types, share amounts, prices, and insider informati
 """
 
 import re
-from typing import Any, Dict, List, Optional
-
-from bs4 import BeautifulSoup
+from typing import Any, Dict, List, Optional, Union
 
+from app.ingestion.html_extractor import ExtractedDocument, extract_document
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -34,13 +33,16 @@ class Form4Parser:
         self.logger = logger
 
     def parse(
-        self, html_content: str, metadata: Optional[Dict[str, Any]] = None
+        self,
+        html_content: Union[str, ExtractedDocument],
+        metadata: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """
         Parse Form 4 HTML content and extract insider trading data.
 
         Args:
-            html_content: HTML content of Form 4 filing
+            html_content: HTML content of Form 4 filing, or the filing already
+                extracted by the shared HTML engine (parsed once per filing)
             metadata: Optional metadata dictionary (ticker, CIK, filing date, etc.)
 
         Returns:
@@ -60,12 +62,16 @@ class Form4Parser:
             Form4ParserError: If parsing fails
         """
         try:
-            soup = BeautifulSoup(html_content, "html.parser")
+            document = (
+                html_content
+                if isinstance(html_content, ExtractedDocument)
+                else extract_document(html_content, keep_tree=True)
+            )
 
             # Extract basic information
-            issuer_info = self._extract_issuer_info(soup)
-            insider_info = self._extract_insider_info(soup)
-            transactions = self._extract_transactions(soup)
+            issuer_info = self._extract_issuer_info(document)
+            insider_info = self._extract_insider_info(document)
+            transactions = self._extract_transactions(document)
 
             # Convert to text format for RAG
             text_content = self._convert_to_text(
@@ -103,7 +109,7 @@ class Form4Parser:
             self.logger.error(f"Failed to parse Form 4: {str(e)}", exc_info=True)
             raise Form4ParserError(f"Failed to parse Form 4: {str(e)}") from e
 
-    def _extract_issuer_info(self, soup: BeautifulSoup) -> Dict[str, str]:
+    def _extract_issuer_info(self, document: ExtractedDocument) -> Dict[str, str]:
         """Extract issuer (company) information from Form 4."""
         issuer_info = {"name": "", "ticker": "", "cik": ""}
 
@@ -115,7 +121,7 @@ class Form4Parser:
         ]
 
         for pattern in issuer_name_patterns:
-            match = re.search(pattern, soup.get_text(), re.IGNORECASE)
+            match = re.search(pattern, document.text, re.IGNORECASE)
             if match:
                 issuer_info["name"] = match.group(1).strip()
                 break
@@ -127,7 +133,7 @@ class Form4Parser:
         ]
 
         for pattern in ticker_patterns:
-            match = re.search(pattern, soup.get_text(), re.IGNORECASE)
+            match = re.search(pattern, document.text, re.IGNORECASE)
             if match:
                 issuer_info["ticker"] = match.group(1).strip()
                 break
@@ -139,14 +145,14 @@ class Form4Parser:
         ]
 
         for pattern in cik_patterns:
-            match = re.search(pattern, soup.get_text(), re.IGNORECASE)
+            match = re.search(pattern, document.text, re.IGNORECASE)
             if match:
                 issuer_info["cik"] = match.group(1).strip().zfill(10)
                 break
 
         return issuer_info
 
-    def _extract_insider_info(self, soup: BeautifulSoup) -> Dict[str, str]:
+    def _extract_insider_info(self, document: ExtractedDocument) -> Dict[str, str]:
         """Extract insider (reporting person) information from Form 4."""
         insider_info = {"name": "", "position": "", "relationship": ""}
 
@@ -158,7 +164,7 @@ class Form4Parser:
         ]
 
         for pattern in name_patterns:
-            match = re.search(pattern, soup.get_text(), re.IGNORECASE)
+            match = re.search(pattern, document.text, re.IGNORECASE)
             if match:
                 insider_info["name"] = match.group(1).strip()
                 break
@@ -172,14 +178,16 @@ class Form4Parser:
         ]
 
         for pattern in position_patterns:
-            match = re.search(pattern, soup.get_text(), re.IGNORECASE)
+            match = re.search(pattern, document.text, re.IGNORECASE)
             if match:
                 insider_info["position"] = match.group(1).strip()
                 break
 
         return insider_info
 
-    def _extract_transactions(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+    def _extract_transactions(
+        self, document: ExtractedDocument
+    ) -> List[Dict[str, Any]]:
         """
         Extract transaction data from Form 4.
 
@@ -194,7 +202,7 @@ class Form4Parser:
 
         # Look for transaction tables or structured data
         # Form 4 typically has transaction tables with specific patterns
-        text = soup.get_text()
+        text = document.text
 
         # Pattern for transaction rows (simplified - real Form 4s have structured XML)
         # This is a basic extraction - real implementation would parse XML structure
@@ -229,19 +237,19 @@ class Form4Parser:
 
         # If no transactions found via pattern, try XML structure
         if not transactions:
-            transactions = self._extract_transactions_from_xml(soup)
+            transactions = self._extract_transactions_from_xml(document)
 
         return transactions
 
     def _extract_transactions_from_xml(
-        self, soup: BeautifulSoup
+        self, document: ExtractedDocument
     ) -> List[Dict[str, Any]]:
         """Extract transactions from XML structure in Form 4."""
         transactions = []
 
         # Look for XML transaction elements
-        transaction_elements = soup.find_all(
-            ["nonDerivativeTransaction", "derivativeTransaction"]
+        transaction_elements = document.iter_elements(
+            "nonDerivativeTransaction", "derivativeTransaction"
         )
 
         for elem in transaction_elements:
@@ -271,8 +279,8 @@ class Form4Parser:
 
     def _extract_xml_text(self, element, tag_name: str) -> str:
         """Extract text from XML element by tag name."""
-        tag = element.find(tag_name)
-        return tag.get_text(strip=True) if tag else ""
+        tag = next(element.iter(tag_name.lower()), None)
+        return "".join(tag.itertext()).strip() if tag is not None else ""
 
     def _get_transaction_type(self, code: str) -> str:
         """Convert transaction code to human-readable type."""
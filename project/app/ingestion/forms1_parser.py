@@ -6,10 +6,9 @@ use of proceeds, and risk factors.
 """
 
 import re
-from typing import Any, Dict, List, Optional
-
-from bs4 import BeautifulSoup
+from typing import Any, Dict, List, Optional, Union
 
+from app.ingestion.html_extractor import ExtractedDocument, extract_document
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -34,13 +33,16 @@ class FormS1Parser:
         self.logger = logger
 
     def parse(
-        self, html_content: str, metadata: Optional[Dict[str, Any]] = None
+        self,
+        html_content: Union[str, ExtractedDocument],
+        metadata: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """
         Parse Form S-1 HTML content and extract IPO data.
 
         Args:
-            html_content: HTML content of Form S-1 filing
+            html_content: HTML content of Form S-1 filing, or the filing already
+                extracted by the shared HTML engine (parsed once per filing)
             metadata: Optional metadata dictionary (ticker, CIK, filing date, etc.)
 
         Returns:
@@ -50,13 +52,17 @@ class FormS1Parser:
             FormS1ParserError: If parsing fails
         """
         try:
-            soup = BeautifulSoup(html_content, "html.parser")
+            document = (
+                html_content
+                if isinstance(html_content, ExtractedDocument)
+                else extract_document(html_content)
+            )
 
             # Extract sections
-            company_info = self._extract_company_info(soup)
-            offering_info = self._extract_offering_info(soup)
-            use_of_proceeds = self._extract_use_of_proceeds(soup)
-            risk_factors = self._extract_risk_factors(soup)
+            company_info = self._extract_company_info(document)
+            offering_info = self._extract_offering_info(document)
+            use_of_proceeds = self._extract_use_of_proceeds(document)
+            risk_factors = self._extract_risk_factors(document)
 
             # Convert to text format
             text_content = self._convert_to_text(
@@ -90,11 +96,11 @@ class FormS1Parser:
             self.logger.error(f"Failed to parse Form S-1: {str(e)}", exc_info=True)
             raise FormS1ParserError(f"Failed to parse Form S-1: {str(e)}") from e
 
-    def _extract_company_info(self, soup: BeautifulSoup) -> Dict[str, str]:
+    def _extract_company_info(self, document: ExtractedDocument) -> Dict[str, str]:
         """Extract company information from Form S-1."""
         info = {"name": "", "ticker": "", "cik": "", "industry": "", "state": ""}
 
-        text = soup.get_text()
+        text = document.text
 
         # Company name
         name_patterns = [
@@ -121,7 +127,7 @@ class FormS1Parser:
 
         return info
 
-    def _extract_offering_info(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_offering_info(self, document: ExtractedDocument) -> Dict[str, Any]:
         """Extract offering details from Form S-1."""
         info = {
             "type": "",
@@ -131,7 +137,7 @@ class FormS1Parser:
             "underwriters": [],
         }
 
-        text = soup.get_text()
+        text = document.text
 
         # Offering type
         if re.search(r"Initial.*?Public.*?Offering", text, re.IGNORECASE):
@@ -164,9 +170,9 @@ class FormS1Parser:
 
         return info
 
-    def _extract_use_of_proceeds(self, soup: BeautifulSoup) -> str:
+    def _extract_use_of_proceeds(self, document: ExtractedDocument) -> str:
         """Extract use of proceeds section."""
-        text = soup.get_text()
+        text = document.text
 
         # Look for "Use of Proceeds" section
         use_pattern = re.compile(
@@ -179,10 +185,10 @@ class FormS1Parser:
 
         return ""
 
-    def _extract_risk_factors(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_risk_factors(self, document: ExtractedDocument) -> List[str]:
         """Extract risk factors from Form S-1."""
         risk_factors = []
-        text = soup.get_text()
+        text = document.text
 
         # Look for "Risk Factors" section
         risk_pattern = re.compile(
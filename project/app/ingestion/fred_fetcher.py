@@ -6,13 +6,22 @@ to provide comprehensive macroeconomic indicators for financial analysis.
 """
 
 import time
-from typing import Any, Dict, List, Optional
-
-from fredapi import Fred
-
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.ingestion.timeseries_store import (
+    VALUE_COLUMN,
+    TimeSeriesStore,
+    TimeSeriesStoreError,
+    get_timeseries_store,
+    series_key,
+)
 from app.utils.config import config
+from app.utils.lazy_imports import lazy_attr
 from app.utils.logger import get_logger
 
+# fredapi imports pandas; resolve it when the client is first created
+Fred = lazy_attr("fredapi", "Fred")
+
 logger = get_logger(__name__)
 
 
@@ -35,6 +44,7 @@ class FREDFetcher:
         self,
         api_key: Optional[str] = None,
         rate_limit_delay: Optional[float] = None,
+        timeseries_store: Optional[TimeSeriesStore] = None,
     ):
         """
         Initialize FRED fetcher.
@@ -42,6 +52,8 @@ class FREDFetcher:
         Args:
             api_key: FRED API key (default: from config)
             rate_limit_delay: Delay between requests in seconds (default: from config)
+            timeseries_store: Local store that series are synced into
+                (default: shared store, None if disabled)
         """
         self.api_key = api_key if api_key is not None else config.fred_api_key
         self.rate_limit_delay = (
@@ -49,6 +61,7 @@ class FREDFetcher:
             if rate_limit_delay is not None
             else config.fred_rate_limit_seconds
         )
+        self.timeseries_store = timeseries_store or get_timeseries_store()
 
         if not self.api_key:
             logger.warning(
@@ -79,6 +92,16 @@ class FREDFetcher:
         if self.fred is None:
             raise FREDFetcherError("FRED API client not initialized")
 
+    def _client(self) -> Any:
+        """
+        Return the FRED API client.
+
+        Raises:
+            FREDFetcherError: If API key is missing or client not initialized
+        """
+        self._check_api_available()
+        return self.fred
+
     def _apply_rate_limit(self) -> None:
         """Apply rate limiting delay between requests."""
         if self.rate_limit_delay > 0:
@@ -95,6 +118,10 @@ class FREDFetcher:
         """
         Fetch a time series by series ID.
 
+        With the time-series store enabled, only observations from the last
+        stored date onwards are requested and merged into the store, and the
+        returned data is read from the store.
+
         Args:
             series_id: FRED series ID (e.g., 'GDP', 'UNRATE', 'FEDFUNDS')
             start_date: Start date (YYYY-MM-DD format, optional)
@@ -113,16 +140,20 @@ class FREDFetcher:
 
         logger.info(f"Fetching FRED series: {series_id}")
         try:
-            self._apply_rate_limit()
-
-            # Fetch series data
-            data = self.fred.get_series(
-                series_id,
-                start=start_date,
-                end=end_date,
-                frequency=frequency,
-                aggregation_method=aggregation_method,
-            )
+            synced = False
+            if self.timeseries_store is not None:
+                try:
+                    data, metadata = self._sync_series(
+                        series_id, start_date, end_date, frequency, aggregation_method
+                    )
+                    synced = True
+                except TimeSeriesStoreError as e:
+                    logger.warning(f"Time-series store not used: {str(e)}")
+            if not synced:
+                data = self._download_series(
+                    series_id, start_date, end_date, frequency, aggregation_method
+                )
+                metadata = None
 
             if data is None or data.empty:
                 logger.warning(f"No data returned for series {series_id}")
@@ -134,22 +165,8 @@ class FREDFetcher:
                 }
 
             # Fetch series info for metadata
-            self._apply_rate_limit()
-            try:
-                series_info = self.fred.get_series_info(series_id)
-                metadata = {
-                    "title": series_info.get("title", ""),
-                    "units": series_info.get("units", ""),
-                    "frequency": series_info.get("frequency", ""),
-                    "seasonal_adjustment": series_info.get("seasonal_adjustment", ""),
-                    "last_updated": series_info.get("last_updated", ""),
-                    "observation_start": series_info.get("observation_start", ""),
-                    "observation_end": series_info.get("observation_end", ""),
-                    "notes": series_info.get("notes", ""),
-                }
-            except Exception as e:
-                logger.warning(f"Failed to fetch series info for {series_id}: {str(e)}")
-                metadata = {}
+            if metadata is None:
+                metadata = self._fetch_series_info(series_id)
 
             logger.info(
                 f"Successfully fetched {len(data)} observations for series {series_id}"
@@ -171,6 +188,87 @@ class FREDFetcher:
                 f"Error fetching FRED series {series_id}: {str(e)}"
             ) from e
 
+    def _download_series(
+        self,
+        series_id: str,
+        start_date: Optional[Any],
+        end_date: Optional[str],
+        frequency: Optional[str],
+        aggregation_method: Optional[str],
+    ) -> Any:
+        """Request observations of a series from the FRED API."""
+        self._apply_rate_limit()
+        if start_date is not None and hasattr(start_date, "strftime"):
+            start_date = start_date.strftime("%Y-%m-%d")
+        return self._client().get_series(
+            series_id,
+            start=start_date,
+            end=end_date,
+            frequency=frequency,
+            aggregation_method=aggregation_method,
+        )
+
+    def _sync_series(
+        self,
+        series_id: str,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        frequency: Optional[str],
+        aggregation_method: Optional[str],
+    ) -> Tuple[Any, Optional[Dict[str, Any]]]:
+        """
+        Sync a series into the time-series store and read it back.
+
+        Returns:
+            Tuple of (stored observations in the requested range, series info
+            or None if it still has to be fetched)
+        """
+        store = self.timeseries_store
+        if store is None:
+            raise FREDFetcherError("Time-series store is disabled")
+        key = series_key(series_id, frequency, aggregation_method)
+        previous_last = store.last_index("fred", key)
+        store.sync(
+            "fred",
+            key,
+            lambda since: self._download_series(
+                series_id, since, end_date, frequency, aggregation_method
+            ),
+            start=start_date,
+            end=end_date,
+        )
+        stored = store.read("fred", key, start=start_date, end=end_date)
+        if stored is None or stored.empty:
+            return None, None
+        data = stored[VALUE_COLUMN].rename(None)
+
+        # Series info only changes when new observations are published
+        series_info = store.read_metadata("fred", key).get("series_info")
+        if series_info is None or store.last_index("fred", key) != previous_last:
+            series_info = self._fetch_series_info(series_id)
+            if series_info:
+                store.merge("fred", key, None, metadata={"series_info": series_info})
+        return data, series_info
+
+    def _fetch_series_info(self, series_id: str) -> Dict[str, Any]:
+        """Fetch series metadata ({} on failure)."""
+        self._apply_rate_limit()
+        try:
+            series_info = self._client().get_series_info(series_id)
+            return {
+                "title": series_info.get("title", ""),
+                "units": series_info.get("units", ""),
+                "frequency": series_info.get("frequency", ""),
+                "seasonal_adjustment": series_info.get("seasonal_adjustment", ""),
+                "last_updated": series_info.get("last_updated", ""),
+                "observation_start": series_info.get("observation_start", ""),
+                "observation_end": series_info.get("observation_end", ""),
+                "notes": series_info.get("notes", ""),
+            }
+        except Exception as e:
+            logger.warning(f"Failed to fetch series info for {series_id}: {str(e)}")
+            return {}
+
     def fetch_multiple_series(
         self,
         series_ids: List[str],
@@ -240,7 +338,7 @@ class FREDFetcher:
             self._apply_rate_limit()
 
             # Search for series
-            search_results = self.fred.search(search_text)
+            search_results = self._client().search(search_text)
 
             if search_results is None or search_results.empty:
                 logger.info(f"No series found for search: '{search_text}'")
@@ -0,0 +1,414 @@
+"""
+Structure-preserving HTML to text extraction.
+
+Shared extraction engine for SEC filings and other HTML documents. Markup is
+fed in chunks to lxml's streaming HTML parser and converted to text in a
+single pass:
+
+- block elements become paragraphs separated by blank lines
+- tables become one line per row with cells joined by " | "
+- headings (``<h1>``-``<h6>`` and SEC "PART I" / "Item 1A." lines) start
+  sections whose character offsets are recorded for downstream chunking
+- scripts, styles, document heads and hidden inline-XBRL headers are dropped
+
+A filing is parsed once and the resulting ExtractedDocument is shared by
+all form parsers.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Iterator, List, Optional, Tuple, Union
+
+from lxml import etree
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# BeautifulSoup tree builder for callers that need CSS selectors
+SOUP_PARSER = "lxml"
+
+# Bytes fed to the streaming parser per step
+FEED_CHUNK_SIZE = 1024 * 1024
+
+SKIP_TAGS = frozenset(
+    {"script", "style", "head", "noscript", "template", "iframe", "ix:header"}
+)
+BLOCK_TAGS = frozenset(
+    {
+        "address", "article", "aside", "blockquote", "body", "caption",
+        "center", "dd", "div", "dl", "dt", "fieldset", "figcaption", "figure",
+        "footer", "form", "header", "hr", "html", "li", "main", "nav", "ol",
+        "p", "pre", "section", "ul",
+    }
+)  # fmt: skip
+HEADING_TAGS = {f"h{level}": level for level in range(1, 7)}
+CELL_TAGS = frozenset({"td", "th"})
+
+# SEC filings rarely use <h*> tags; their sections are short "PART II" or
+# "Item 7." paragraphs instead
+SECTION_HEADING_RE = re.compile(
+    r"^(?:(PART)\s+[IVX]+\b|ITEM\s+\d{1,2}[A-Z]?(?:[.:\s]|$))", re.IGNORECASE
+)
+MAX_SECTION_HEADING_LENGTH = 150
+
+_HTML_SNIFF_RE = re.compile(
+    rb"<(?:!doctype\s+html|html|body|div|p|table|span|font)[\s>]", re.IGNORECASE
+)
+_DISPLAY_NONE_RE = re.compile(r"display\s*:\s*none", re.IGNORECASE)
+
+
+class HtmlExtractionError(Exception):
+    """Custom exception for HTML extraction errors."""
+
+    pass
+
+
+@dataclass(frozen=True)
+class DocumentSection:
+    """A titled span of extracted text, as character offsets."""
+
+    title: str
+    level: int
+    start: int
+    end: int
+
+
+@dataclass
+class ExtractedDocument:
+    """
+    Text extracted from an HTML (or plain-text) document.
+
+    Attributes:
+        text: Extracted text with paragraph and table-row structure
+        sections: Sections in document order; offsets index into text
+        table_count: Number of top-level tables converted to rows
+        root: Parsed lxml tree, only kept when requested (keep_tree=True)
+    """
+
+    text: str
+    sections: List[DocumentSection] = field(default_factory=list)
+    table_count: int = 0
+    root: Optional[Any] = field(default=None, repr=False)
+
+    @classmethod
+    def from_text(cls, text: str) -> "ExtractedDocument":
+        """
+        Wrap plain text, detecting SEC section headings line by line.
+
+        Args:
+            text: Plain document text
+
+        Returns:
+            ExtractedDocument with section offsets
+        """
+        starts: List[Tuple[str, int, int]] = []
+        offset = 0
+        for line in text.splitlines(keepends=True):
+            title = line.strip()
+            level = _section_level(title)
+            if level:
+                starts.append((title, level, offset))
+            offset += len(line)
+        return cls(text=text, sections=_close_sections(starts, len(text)))
+
+    def section_text(self, section: DocumentSection) -> str:
+        """Return the text of a section (heading included)."""
+        return self.text[section.start : section.end]
+
+    def iter_sections(self) -> Iterator[Tuple[str, str]]:
+        """
+        Yield (title, text) for every section, in order.
+
+        Text before the first section is yielded with an empty title, so the
+        concatenated texts cover the whole document.
+        """
+        first_start = self.sections[0].start if self.sections else len(self.text)
+        if self.text[:first_start].strip():
+            yield "", self.text[:first_start]
+        for section in self.sections:
+            yield section.title, self.section_text(section)
+
+    def section_offsets(self) -> List[Tuple[str, int, int]]:
+        """Return sections as (title, start, end) tuples for document metadata."""
+        return [(s.title, s.start, s.end) for s in self.sections]
+
+    def iter_elements(self, *tags: str) -> Iterator[Any]:
+        """
+        Iterate over parsed elements by tag name (requires keep_tree=True).
+
+        lxml's HTML parser lowercases tag names, so tags are matched
+        case-insensitively.
+
+        Args:
+            *tags: Tag names to match
+
+        Returns:
+            Iterator of lxml elements (empty if the tree was not kept)
+        """
+        if self.root is None:
+            return iter(())
+        return self.root.iter(*(tag.lower() for tag in tags))
+
+
+def _section_level(line: str) -> int:
+    """Return the section level of an SEC heading line (0 if not a heading)."""
+    if not line or len(line) > MAX_SECTION_HEADING_LENGTH:
+        return 0
+    match = SECTION_HEADING_RE.match(line)
+    if not match:
+        return 0
+    return 1 if match.group(1) else 2
+
+
+def _close_sections(
+    starts: List[Tuple[str, int, int]], text_length: int
+) -> List[DocumentSection]:
+    """Turn (title, level, start) tuples into sections ending at the next start."""
+    ends = [start for _, _, start in starts[1:]] + [text_length]
+    return [
+        DocumentSection(title=title, level=level, start=start, end=end)
+        for (title, level, start), end in zip(starts, ends)
+    ]
+
+
+def _tag_name(element: Any) -> str:
+    """Return an element's tag name, or "" for comments and PIs."""
+    tag = element.tag
+    return tag.lower() if isinstance(tag, str) else ""
+
+
+def looks_like_html(content: Union[str, bytes]) -> bool:
+    """
+    Sniff whether content is HTML (independent of the file extension).
+
+    Args:
+        content: Document content
+
+    Returns:
+        True if HTML markup appears near the start of the content
+    """
+    head = content[:65536]
+    if isinstance(head, str):
+        head = head.encode("utf-8", errors="ignore")
+    return bool(_HTML_SNIFF_RE.search(head))
+
+
+class HtmlTextExtractor:
+    """
+    Single-pass, streaming HTML to text converter.
+
+    Elements are discarded as soon as their text has been emitted, so memory
+    stays proportional to the output text rather than the parse tree, unless
+    keep_tree is set.
+    """
+
+    def __init__(self, keep_tree: bool = False):
+        """
+        Initialize extractor.
+
+        Args:
+            keep_tree: Keep the parsed tree on the result (for parsers that
+                need element lookups, e.g. Form 4 XML transactions)
+        """
+        self.keep_tree = keep_tree
+
+    def extract(self, markup: Union[str, bytes]) -> ExtractedDocument:
+        """
+        Extract text and section offsets from HTML.
+
+        Args:
+            markup: HTML document
+
+        Returns:
+            ExtractedDocument
+
+        Raises:
+            HtmlExtractionError: If the markup cannot be parsed
+        """
+        if markup is None:
+            raise HtmlExtractionError("No HTML content to extract")
+        if isinstance(markup, str):
+            markup = markup.encode("utf-8")
+        if not markup.strip():
+            return ExtractedDocument(text="")
+
+        state = _ExtractionState()
+        parser = etree.HTMLPullParser(
+            events=("start", "end"), encoding="utf-8", remove_comments=True
+        )
+        try:
+            for offset in range(0, len(markup), FEED_CHUNK_SIZE):
+                parser.feed(markup[offset : offset + FEED_CHUNK_SIZE])
+                self._consume(parser.read_events(), state)
+            root = parser.close()
+            self._consume(parser.read_events(), state)
+        except etree.LxmlError as e:
+            raise HtmlExtractionError(f"Failed to parse HTML: {str(e)}") from e
+
+        state.break_line()
+        text = "".join(state.parts).rstrip() + "\n" if state.parts else ""
+        return ExtractedDocument(
+            text=text,
+            sections=_close_sections(state.section_starts, len(text)),
+            table_count=state.table_count,
+            root=root if self.keep_tree else None,
+        )
+
+    def _consume(self, events, state: "_ExtractionState") -> None:
+        """Process parser events, emitting text that precedes each event."""
+        for event, element in events:
+            tag = _tag_name(element)
+            if event == "start":
+                parent = element.getparent()
+                previous = element.getprevious()
+                if previous is not None:
+                    state.add_text(previous.tail)
+                elif parent is not None:
+                    state.add_text(parent.text)
+                if parent is not None and not self.keep_tree:
+                    # Earlier siblings and their tails have been emitted
+                    while previous is not None:
+                        parent.remove(previous)
+                        previous = element.getprevious()
+                state.start(tag, element)
+            else:
+                state.add_text(element[-1].tail if len(element) else element.text)
+                state.end(tag)
+                if not self.keep_tree:
+                    element.clear(keep_tail=True)
+
+
+class _ExtractionState:
+    """Output buffer and layout state for one extraction."""
+
+    def __init__(self):
+        self.parts: List[str] = []
+        self.length = 0
+        self.section_starts: List[Tuple[str, int, int]] = []
+        self.table_count = 0
+        self.skip_depth = 0
+        self.table_depth = 0
+        self.heading_level = 0
+        self.line: List[str] = []
+        self.row: List[str] = []
+        self.cell: Optional[List[str]] = None
+
+    def add_text(self, text: Optional[str]) -> None:
+        if not text or self.skip_depth:
+            return
+        if self.cell is not None:
+            self.cell.append(text)
+        elif not self.table_depth:
+            self.line.append(text)
+
+    def start(self, tag: str, element: Any) -> None:
+        if self.skip_depth or tag in SKIP_TAGS:
+            self.skip_depth += 1
+            return
+        style = element.get("style")
+        if style and _DISPLAY_NONE_RE.search(style):
+            self.skip_depth += 1
+            return
+
+        if tag == "table":
+            self.table_depth += 1
+            if self.table_depth == 1:
+                self.break_line()
+                self.table_count += 1
+                self.row = []
+        elif self.table_depth == 1 and tag == "tr":
+            self.row = []
+        elif self.table_depth == 1 and tag in CELL_TAGS:
+            self.cell = []
+        elif tag in HEADING_TAGS:
+            self.break_line()
+            self.heading_level = HEADING_TAGS[tag]
+        elif tag in BLOCK_TAGS or tag == "br":
+            self.break_line()
+
+    def end(self, tag: str) -> None:
+        if self.skip_depth:
+            self.skip_depth -= 1
+            return
+
+        if tag == "table":
+            self.table_depth -= 1
+            if self.table_depth == 0:
+                self.cell = None
+                self._append("\n")
+        elif self.table_depth == 1 and tag in CELL_TAGS:
+            if self.cell is not None:
+                self.row.append(" ".join("".join(self.cell).split()))
+            self.cell = None
+        elif self.table_depth == 1 and tag == "tr":
+            if any(self.row):
+                self._append(" | ".join(self.row) + "\n")
+            self.row = []
+        elif tag in HEADING_TAGS:
+            self.break_line(heading_level=self.heading_level)
+            self.heading_level = 0
+        elif tag in BLOCK_TAGS:
+            self.break_line()
+
+    def break_line(self, heading_level: int = 0) -> None:
+        """End the current paragraph (inside a cell: a space)."""
+        if self.cell is not None:
+            self.cell.append(" ")
+            return
+        text = " ".join("".join(self.line).split())
+        self.line = []
+        if not text:
+            return
+        level = heading_level or _section_level(text)
+        if level:
+            self.section_starts.append((text, level, self.length))
+        self._append(text + "\n\n")
+
+    def _append(self, text: str) -> None:
+        self.parts.append(text)
+        self.length += len(text)
+
+
+def extract_html(
+    markup: Union[str, bytes], keep_tree: bool = False
+) -> ExtractedDocument:
+    """
+    Extract structured text from HTML with the shared engine.
+
+    Args:
+        markup: HTML document
+        keep_tree: Keep the parsed tree on the result
+
+    Returns:
+        ExtractedDocument
+
+    Raises:
+        HtmlExtractionError: If the markup cannot be parsed
+    """
+    return HtmlTextExtractor(keep_tree=keep_tree).extract(markup)
+
+
+def extract_document(
+    content: Union[str, bytes], keep_tree: bool = False
+) -> ExtractedDocument:
+    """
+    Extract an HTML or plain-text document, sniffing the content type.
+
+    Args:
+        content: Document content
+        keep_tree: Keep the parsed tree on the result (HTML only)
+
+    Returns:
+        ExtractedDocument
+
+    Raises:
+        HtmlExtractionError: If the content is missing or cannot be parsed
+    """
+    if content is None:
+        raise HtmlExtractionError("No content to extract")
+    if looks_like_html(content):
+        return extract_html(content, keep_tree=keep_tree)
+    if isinstance(content, bytes):
+        content = content.decode("utf-8", errors="replace")
+    return ExtractedDocument.from_text(content)
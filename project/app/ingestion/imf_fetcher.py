@@ -6,15 +6,26 @@ International Financial Statistics, GDP, inflation, unemployment, and trade bala
 data for 188+ countries.
 """
 
-import time
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-import pandas as pd
 import requests
 
+from app.ingestion.timeseries_store import (
+    TimeSeriesStore,
+    TimeSeriesStoreError,
+    get_timeseries_store,
+    series_key,
+)
 from app.utils.config import config
+from app.utils.http_client import create_http_session, delay_to_rate
+from app.utils.lazy_imports import lazy_import
 from app.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+_pd = lazy_import("pandas")
+
 logger = get_logger(__name__)
 
 
@@ -39,19 +50,26 @@ class IMFFetcher:
     def __init__(
         self,
         rate_limit_delay: Optional[float] = None,
+        timeseries_store: Optional[TimeSeriesStore] = None,
     ):
         """
         Initialize IMF fetcher.
 
         Args:
             rate_limit_delay: Delay between requests in seconds (default: from config)
+            timeseries_store: Local store that indicators are synced into
+                (default: shared store, None if disabled)
         """
         self.rate_limit_delay = (
             rate_limit_delay
             if rate_limit_delay is not None
             else config.imf_rate_limit_seconds
         )
-        self.session = requests.Session()
+        self.timeseries_store = timeseries_store or get_timeseries_store()
+        # Shared cached session; throttled per host on cache misses only
+        self.session = create_http_session(
+            requests_per_second=delay_to_rate(self.rate_limit_delay)
+        )
         self.session.headers.update(
             {
                 "User-Agent": (
@@ -65,11 +83,6 @@ class IMFFetcher:
 
         logger.info("IMF API client initialized")
 
-    def _apply_rate_limit(self) -> None:
-        """Apply rate limiting delay between requests."""
-        if self.rate_limit_delay > 0:
-            time.sleep(self.rate_limit_delay)
-
     def _make_request(
         self,
         endpoint: str,
@@ -90,7 +103,6 @@ class IMFFetcher:
         """
         url = f"{self.IMF_BASE_URL}/{endpoint}"
         try:
-            self._apply_rate_limit()
             response = self.session.get(url, params=params, timeout=30)
             response.raise_for_status()
             return response.json()
@@ -108,6 +120,10 @@ class IMFFetcher:
         """
         Fetch indicator data by indicator code.
 
+        With the time-series store enabled, only years from the last stored
+        year onwards are requested and merged into the store, and the
+        returned data is read from the store.
+
         Args:
             indicator_code: IMF indicator code (e.g., 'NGDP_RPCH' for GDP growth)
             country_codes: List of country ISO codes (e.g., ['US', 'CN'], optional)
@@ -122,20 +138,21 @@ class IMFFetcher:
         """
         logger.info(f"Fetching IMF indicator: {indicator_code}")
         try:
-            # IMF API endpoint structure: /indicators/{indicator_code}
-            endpoint = f"indicators/{indicator_code}"
-            params = {}
-
-            if country_codes:
-                params["countries"] = ",".join(country_codes)
-            if start_year:
-                params["startPeriod"] = str(start_year)
-            if end_year:
-                params["endPeriod"] = str(end_year)
-
-            response_data = self._make_request(endpoint, params=params)
+            synced = False
+            if self.timeseries_store is not None:
+                try:
+                    df, metadata = self._sync_indicator(
+                        indicator_code, country_codes, start_year, end_year
+                    )
+                    synced = True
+                except TimeSeriesStoreError as e:
+                    logger.warning(f"Time-series store not used: {str(e)}")
+            if not synced:
+                df, metadata = self._download_indicator(
+                    indicator_code, country_codes, start_year, end_year
+                )
 
-            if not response_data or "values" not in response_data:
+            if df is None or df.empty:
                 logger.warning(f"No data returned for indicator {indicator_code}")
                 return {
                     "indicator_code": indicator_code,
@@ -144,38 +161,6 @@ class IMFFetcher:
                     "error": "No data available",
                 }
 
-            # Parse response data
-            values = response_data.get("values", {})
-            metadata = response_data.get("metadata", {})
-
-            # Convert to DataFrame for easier handling
-            data_list = []
-            for country, country_data in values.items():
-                if isinstance(country_data, dict):
-                    for year, value in country_data.items():
-                        data_list.append(
-                            {
-                                "country": country,
-                                "year": int(year) if year.isdigit() else year,
-                                "value": value,
-                            }
-                        )
-
-            if not data_list:
-                logger.warning(f"No data points found for indicator {indicator_code}")
-                return {
-                    "indicator_code": indicator_code,
-                    "data": None,
-                    "metadata": {},
-                    "error": "No data available",
-                }
-
-            # Create DataFrame
-            df = pd.DataFrame(data_list)
-            df = df.pivot_table(
-                index="year", columns="country", values="value", aggfunc="first"
-            )
-
             logger.info(
                 f"Successfully fetched {len(df)} years of data "
                 f"for indicator {indicator_code}"
@@ -199,6 +184,101 @@ class IMFFetcher:
                 f"Error fetching IMF indicator {indicator_code}: {str(e)}"
             ) from e
 
+    def _download_indicator(
+        self,
+        indicator_code: str,
+        country_codes: Optional[List[str]],
+        start_year: Optional[int],
+        end_year: Optional[int],
+    ) -> Tuple[Optional["pd.DataFrame"], Dict[str, Any]]:
+        """
+        Request indicator data from the IMF API.
+
+        Returns:
+            Tuple of (year x country DataFrame or None if no data, metadata)
+        """
+        # IMF API endpoint structure: /indicators/{indicator_code}
+        endpoint = f"indicators/{indicator_code}"
+        params = {}
+
+        if country_codes:
+            params["countries"] = ",".join(country_codes)
+        if start_year:
+            params["startPeriod"] = str(start_year)
+        if end_year:
+            params["endPeriod"] = str(end_year)
+
+        response_data = self._make_request(endpoint, params=params)
+
+        if not response_data or "values" not in response_data:
+            return None, {}
+
+        # Parse response data
+        values = response_data.get("values", {})
+        metadata = response_data.get("metadata", {})
+
+        # Convert to DataFrame for easier handling
+        data_list = []
+        for country, country_data in values.items():
+            if isinstance(country_data, dict):
+                for year, value in country_data.items():
+                    data_list.append(
+                        {
+                            "country": country,
+                            "year": int(year) if year.isdigit() else year,
+                            "value": value,
+                        }
+                    )
+
+        if not data_list:
+            return None, metadata
+
+        df = _pd.DataFrame(data_list)
+        df = df.pivot_table(
+            index="year", columns="country", values="value", aggfunc="first"
+        )
+        return df, metadata
+
+    def _sync_indicator(
+        self,
+        indicator_code: str,
+        country_codes: Optional[List[str]],
+        start_year: Optional[int],
+        end_year: Optional[int],
+    ) -> Tuple[Optional["pd.DataFrame"], Dict[str, Any]]:
+        """
+        Sync an indicator into the time-series store and read it back.
+
+        Returns:
+            Tuple of (stored year x country DataFrame or None, metadata)
+        """
+        store = self.timeseries_store
+        if store is None:
+            raise IMFFetcherError("Time-series store is disabled")
+        key = series_key(
+            indicator_code, "-".join(sorted(country_codes)) if country_codes else "all"
+        )
+        responses: List[Dict[str, Any]] = []
+
+        def fetch(since: Optional[Any]) -> Optional["pd.DataFrame"]:
+            df, metadata = self._download_indicator(
+                indicator_code,
+                country_codes,
+                int(since) if since is not None else None,
+                end_year,
+            )
+            responses.append(metadata)
+            return df
+
+        store.sync("imf", key, fetch, start=start_year, end=end_year)
+        if responses and responses[0]:
+            store.merge("imf", key, None, metadata={"indicator_metadata": responses[0]})
+            metadata = responses[0]
+        else:
+            metadata = store.read_metadata("imf", key).get("indicator_metadata", {})
+        stored = store.read("imf", key, start=start_year, end=end_year)
+        return stored, metadata
+
     def fetch_multiple_indicators(
         self,
         indicator_codes: List[str],
@@ -340,7 +420,7 @@ class IMFFetcher:
         metadata = indicator_data.get("metadata", {})
         data = indicator_data.get("data")
 
-        if data is None or (isinstance(data, pd.DataFrame) and data.empty):
+        if data is None or (isinstance(data, _pd.DataFrame) and data.empty):
             return f"IMF Indicator: {indicator_code}\nNo data available"
 
         # Build formatted text
@@ -352,7 +432,7 @@ class IMFFetcher:
         ]
 
         # Add data summary
-        if isinstance(data, pd.DataFrame):
+        if isinstance(data, _pd.DataFrame):
             text_parts.append("\nData Coverage:")
             text_parts.append(f"  Countries: {len(data.columns)}")
             text_parts.append(f"  Years: {len(data.index)}")
@@ -396,7 +476,7 @@ class IMFFetcher:
         data = indicator_data.get("data")
 
         # Calculate data points
-        if isinstance(data, pd.DataFrame):
+        if isinstance(data, _pd.DataFrame):
             data_points = len(data) * len(data.columns) if not data.empty else 0
         elif data is not None and hasattr(data, "__len__"):
             data_points = len(data)
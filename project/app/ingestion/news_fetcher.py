@@ -324,12 +324,16 @@ class NewsFetcher:
 
         return unique_articles
 
-    def to_documents(self, articles: List[Dict]) -> List[Document]:
+    def to_documents(
+        self, articles: List[Dict], summarize: bool = True
+    ) -> List[Document]:
         """
         Convert article dictionaries to LangChain Document objects.
 
         Args:
             articles: List of article dictionaries
+            summarize: Summarize articles first if a summarizer is set
+                (False when summaries are attached later)
 
         Returns:
             List of Document objects with metadata
@@ -337,7 +341,7 @@ class NewsFetcher:
         documents = []
 
         # Summarize articles if summarizer is available
-        if self.summarizer:
+        if self.summarizer and summarize:
             logger.debug("Summarizing articles before document conversion")
             articles = self.summarizer.summarize_articles(articles)
 
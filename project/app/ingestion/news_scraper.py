@@ -6,7 +6,6 @@ Reuters, Bloomberg, CNBC, and other sources with rate limiting
 and proper error handling.
 """
 
-import time
 from datetime import datetime
 from typing import Dict, List, Optional
 from urllib.parse import urlparse
@@ -14,6 +13,8 @@ from urllib.parse import urlparse
 import requests
 from bs4 import BeautifulSoup
 
+from app.ingestion.html_extractor import SOUP_PARSER
+from app.utils.http_client import create_http_session, delay_to_rate
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -70,7 +71,7 @@ class NewsScraper:
         Initialize news scraper.
 
         Args:
-            rate_limit_seconds: Minimum seconds between requests
+            rate_limit_seconds: Minimum seconds between requests to a host
             timeout: Request timeout in seconds
             max_retries: Maximum retry attempts for failed requests
             respect_robots_txt: Whether to respect robots.txt (default: True)
@@ -79,32 +80,22 @@ class NewsScraper:
         self.timeout = timeout
         self.max_retries = max_retries
         self.respect_robots_txt = respect_robots_txt
-        self.last_request_time: Optional[float] = None
 
-        # Setup session with retry strategy
-        self.session = requests.Session()
+        # Setup shared cached session with retry strategy; requests are
+        # throttled per host (on cache misses only)
         retry_strategy = requests.adapters.Retry(
             total=max_retries,
             backoff_factor=1,
             status_forcelist=[429, 500, 502, 503, 504],
         )
         adapter = requests.adapters.HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        self.session = create_http_session(
+            requests_per_second=delay_to_rate(rate_limit_seconds), adapter=adapter
+        )
 
         # Set user agent
         self.session.headers.update({"User-Agent": self.USER_AGENT})
 
-    def _rate_limit(self) -> None:
-        """Enforce rate limiting between requests."""
-        if self.last_request_time is not None:
-            elapsed = time.time() - self.last_request_time
-            if elapsed < self.rate_limit_seconds:
-                sleep_time = self.rate_limit_seconds - elapsed
-                logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-                time.sleep(sleep_time)
-        self.last_request_time = time.time()
-
     def scrape_article(self, article_url: str) -> Optional[Dict]:
         """
         Scrape article content from URL.
@@ -118,8 +109,6 @@ class NewsScraper:
         Raises:
             NewsScraperError: If scraping fails critically
         """
-        self._rate_limit()
-
         logger.info(f"Scraping article: {article_url}")
 
         try:
@@ -127,8 +116,9 @@ class NewsScraper:
             response = self.session.get(article_url, timeout=self.timeout)
             response.raise_for_status()
 
-            # Parse HTML
-            soup = BeautifulSoup(response.content, "html.parser")
+            # Parse HTML once with the lxml tree builder; all extractors
+            # below share the tree
+            soup = BeautifulSoup(response.content, SOUP_PARSER)
 
             # Determine source from URL
             source = self._determine_source(article_url)
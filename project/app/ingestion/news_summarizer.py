@@ -2,10 +2,18 @@
 News summarization module.
 
 Generates concise summaries of financial news articles using LLM-based
-summarization with prompt engineering for financial domain.
+summarization with prompt engineering for financial domain. Batches of
+articles are summarized with concurrent LLM requests, and summaries are
+cached by content hash and model so syndicated stories that appear in
+several feeds (or in every poll) are summarized once.
 """
 
-from typing import Dict, List, Optional
+import hashlib
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
 
 from app.rag.llm_factory import get_llm
 from app.utils.config import config
@@ -13,6 +21,23 @@ from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Articles longer than this are truncated before summarization
+# (roughly 800-1000 words)
+MAX_ARTICLE_CHARS = 4000
+
+# Keys per SQLite lookup (stays below the host parameter limit)
+_CACHE_LOOKUP_BATCH = 500
+
+_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS summaries (
+    content_hash TEXT NOT NULL,
+    model TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    PRIMARY KEY (content_hash, model)
+);
+"""
+
 
 class NewsSummarizerError(Exception):
     """Custom exception for news summarizer errors."""
@@ -20,6 +45,109 @@ class NewsSummarizerError(Exception):
     pass
 
 
+class NewsSummaryCache:
+    """
+    SQLite-backed cache of article summaries.
+
+    Entries are keyed by the hash of the summarization prompt (article
+    content plus prompt settings) and the model that produced them.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Initialize summary cache.
+
+        Args:
+            db_path: Path to SQLite database file (default: from config)
+
+        Raises:
+            NewsSummarizerError: If the cache cannot be opened
+        """
+        self.db_path = Path(db_path or config.news_summarization_cache_path)
+        self._lock = threading.Lock()
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                str(self.db_path), check_same_thread=False, isolation_level=None
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_CACHE_SCHEMA)
+        except sqlite3.Error as e:
+            raise NewsSummarizerError(
+                f"Failed to open summary cache {self.db_path}: {str(e)}"
+            ) from e
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def get_many(self, content_hashes: Iterable[str], model: str) -> Dict[str, str]:
+        """
+        Look up cached summaries.
+
+        Args:
+            content_hashes: Content hashes to look up
+            model: Model identifier
+
+        Returns:
+            Dict mapping content hash to summary for the cached entries
+
+        Raises:
+            NewsSummarizerError: If the lookup fails
+        """
+        keys = list(dict.fromkeys(content_hashes))
+        found: Dict[str, str] = {}
+        try:
+            with self._lock:
+                for start in range(0, len(keys), _CACHE_LOOKUP_BATCH):
+                    batch = keys[start : start + _CACHE_LOOKUP_BATCH]
+                    rows = self._conn.execute(
+                        "SELECT content_hash, summary FROM summaries "
+                        "WHERE model = ? AND content_hash IN "
+                        f"({', '.join('?' * len(batch))})",
+                        [model, *batch],
+                    ).fetchall()
+                    found.update(rows)
+        except sqlite3.Error as e:
+            raise NewsSummarizerError(f"Failed to read summary cache: {str(e)}") from e
+        return found
+
+    def put_many(self, summaries: Dict[str, str], model: str) -> None:
+        """
+        Store summaries.
+
+        Args:
+            summaries: Dict mapping content hash to summary
+            model: Model identifier
+
+        Raises:
+            NewsSummarizerError: If the summaries cannot be written
+        """
+        if not summaries:
+            return
+        created_at = datetime.now(timezone.utc).isoformat()
+        rows = [
+            (content_hash, model, summary, created_at)
+            for content_hash, summary in summaries.items()
+        ]
+        try:
+            with self._lock:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO summaries "
+                    "(content_hash, model, summary, created_at) VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+        except sqlite3.Error as e:
+            raise NewsSummarizerError(f"Failed to write summary cache: {str(e)}") from e
+
+    def count(self) -> int:
+        """Return the number of cached summaries."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM summaries").fetchone()[0]
+
+
 class NewsSummarizer:
     """
     News article summarizer using LLM-based summarization.
@@ -53,6 +181,8 @@ Summary:"""
         target_words: int = 150,
         min_words: int = 50,
         max_words: int = 200,
+        max_concurrency: Optional[int] = None,
+        cache: Optional[NewsSummaryCache] = None,
     ):
         """
         Initialize news summarizer.
@@ -64,6 +194,10 @@ Summary:"""
             target_words: Target summary length in words (default: 150)
             min_words: Minimum summary length in words (default: 50)
             max_words: Maximum summary length in words (default: 200)
+            max_concurrency: Maximum concurrent LLM requests in
+                summarize_articles() (default: from config)
+            cache: Summary cache (default: NewsSummaryCache at the config
+                path if news_summarization_cache_enabled, else no cache)
 
         Raises:
             NewsSummarizerError: If initialization fails
@@ -72,6 +206,10 @@ Summary:"""
         self.target_words = target_words
         self.min_words = min_words
         self.max_words = max_words
+        self.max_concurrency = (
+            max_concurrency or config.news_summarization_max_concurrency
+        )
+        self.cache = cache
 
         if not enabled:
             logger.info("News summarization is disabled")
@@ -95,6 +233,128 @@ Summary:"""
                 f"Failed to initialize NewsSummarizer: {str(e)}"
             ) from e
 
+        # Cached summaries are only reused for the model that wrote them
+        model_name = getattr(self.llm, "model_name", None) or getattr(
+            self.llm, "model", None
+        )
+        if not isinstance(model_name, str):
+            model_name = llm_model or "default"
+        self.model_id = f"{provider}:{model_name}"
+
+        if self.cache is None and config.news_summarization_cache_enabled:
+            try:
+                self.cache = NewsSummaryCache()
+            except NewsSummarizerError as e:
+                logger.warning(f"Summary cache unavailable: {str(e)}")
+
+    def _build_prompt(self, article: Dict) -> Optional[str]:
+        """
+        Build the summarization prompt for an article.
+
+        Args:
+            article: Article dictionary with 'title' and 'content' keys
+
+        Returns:
+            Prompt string, or None if the article has no content
+        """
+        # Extract article content
+        title = article.get("title", "")
+        content = article.get("content", "")
+
+        if not content:
+            logger.warning("Article has no content, cannot summarize")
+            return None
+
+        # Combine title and content
+        article_content = f"{title}\n\n{content}".strip()
+
+        if not article_content:
+            logger.warning("Article content is empty, cannot summarize")
+            return None
+
+        # Truncate very long articles to avoid token limits
+        if len(article_content) > MAX_ARTICLE_CHARS:
+            logger.debug(
+                f"Article is long ({len(article_content)} chars), "
+                f"truncating to {MAX_ARTICLE_CHARS} chars"
+            )
+            article_content = article_content[:MAX_ARTICLE_CHARS] + "..."
+
+        return self.SUMMARY_PROMPT_TEMPLATE.format(
+            target_words=self.target_words,
+            article_content=article_content,
+        )
+
+    @staticmethod
+    def _content_hash(prompt: str) -> str:
+        """Return the cache key of a prompt (covers content and settings)."""
+        return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+    def _clean_summary(self, summary: Any) -> Optional[str]:
+        """
+        Extract and validate the summary text of an LLM response.
+
+        Args:
+            summary: LLM response (message, string or other object)
+
+        Returns:
+            Summary text truncated to max_words, or None if empty
+        """
+        # Extract summary text (handle different LLM response formats)
+        if hasattr(summary, "content"):
+            summary_text = summary.content
+        elif isinstance(summary, str):
+            summary_text = summary
+        else:
+            summary_text = str(summary)
+
+        # Clean and validate summary
+        summary_text = summary_text.strip()
+
+        if not summary_text:
+            logger.warning("Generated summary is empty")
+            return None
+
+        # Validate word count
+        word_count = len(summary_text.split())
+        if word_count < self.min_words:
+            logger.warning(
+                f"Summary is too short ({word_count} words, "
+                f"minimum {self.min_words}), but returning it"
+            )
+        elif word_count > self.max_words:
+            logger.warning(
+                f"Summary is too long ({word_count} words, "
+                f"maximum {self.max_words}), truncating"
+            )
+            # Truncate to max_words
+            words = summary_text.split()
+            summary_text = " ".join(words[: self.max_words])
+
+        logger.debug(
+            f"Generated summary: {len(summary_text)} chars, " f"{word_count} words"
+        )
+        return summary_text
+
+    def _cached(self, content_hashes: Iterable[str]) -> Dict[str, str]:
+        """Return cached summaries ({} without a usable cache)."""
+        if self.cache is None:
+            return {}
+        try:
+            return self.cache.get_many(content_hashes, self.model_id)
+        except NewsSummarizerError as e:
+            logger.warning(str(e))
+            return {}
+
+    def _store(self, summaries: Dict[str, str]) -> None:
+        """Add summaries to the cache, if any."""
+        if self.cache is None:
+            return
+        try:
+            self.cache.put_many(summaries, self.model_id)
+        except NewsSummarizerError as e:
+            logger.warning(str(e))
+
     def summarize_article(self, article: Dict) -> Optional[str]:
         """
         Summarize a single news article.
@@ -113,74 +373,22 @@ Summary:"""
             return None
 
         try:
-            # Extract article content
-            title = article.get("title", "")
-            content = article.get("content", "")
-
-            if not content:
-                logger.warning("Article has no content, cannot summarize")
+            prompt = self._build_prompt(article)
+            if prompt is None:
                 return None
 
-            # Combine title and content
-            article_content = f"{title}\n\n{content}".strip()
-
-            if not article_content:
-                logger.warning("Article content is empty, cannot summarize")
-                return None
-
-            # Truncate very long articles to avoid token limits
-            # Keep first 4000 characters (roughly 800-1000 words)
-            if len(article_content) > 4000:
-                logger.debug(
-                    f"Article is long ({len(article_content)} chars), "
-                    "truncating to 4000 chars"
-                )
-                article_content = article_content[:4000] + "..."
-
-            # Build prompt
-            prompt = self.SUMMARY_PROMPT_TEMPLATE.format(
-                target_words=self.target_words,
-                article_content=article_content,
-            )
+            content_hash = self._content_hash(prompt)
+            cached = self._cached([content_hash])
+            if content_hash in cached:
+                logger.debug("Using cached article summary")
+                return cached[content_hash]
 
             # Generate summary
+            title = article.get("title", "")
             logger.debug(f"Generating summary for article: {title[:50]}...")
-            summary = self.llm.invoke(prompt)
-
-            # Extract summary text (handle different LLM response formats)
-            if hasattr(summary, "content"):
-                summary_text = summary.content
-            elif isinstance(summary, str):
-                summary_text = summary
-            else:
-                summary_text = str(summary)
-
-            # Clean and validate summary
-            summary_text = summary_text.strip()
-
-            if not summary_text:
-                logger.warning("Generated summary is empty")
-                return None
-
-            # Validate word count
-            word_count = len(summary_text.split())
-            if word_count < self.min_words:
-                logger.warning(
-                    f"Summary is too short ({word_count} words, "
-                    f"minimum {self.min_words}), but returning it"
-                )
-            elif word_count > self.max_words:
-                logger.warning(
-                    f"Summary is too long ({word_count} words, "
-                    f"maximum {self.max_words}), truncating"
-                )
-                # Truncate to max_words
-                words = summary_text.split()
-                summary_text = " ".join(words[: self.max_words])
-
-            logger.debug(
-                f"Generated summary: {len(summary_text)} chars, " f"{word_count} words"
-            )
+            summary_text = self._clean_summary(self.llm.invoke(prompt))
+            if summary_text:
+                self._store({content_hash: summary_text})
             return summary_text
 
         except Exception as e:
@@ -192,42 +400,70 @@ Summary:"""
         """
         Summarize multiple news articles.
 
+        Cached summaries are reused; the remaining distinct articles are
+        summarized with one LLM batch call running up to max_concurrency
+        requests at a time. Articles whose summarization fails are returned
+        without a summary.
+
         Args:
             articles: List of article dictionaries
 
         Returns:
-            List of article dictionaries with 'summary' key added to metadata
+            List of article dictionaries with 'summary' key added
         """
-        if not self.enabled:
+        if not self.enabled or self.llm is None:
             logger.debug("Summarization is disabled, skipping batch")
             return articles
 
         logger.info(f"Summarizing {len(articles)} articles")
-        summarized_articles = []
 
-        for i, article in enumerate(articles, 1):
+        # Identical (e.g. syndicated) articles share one prompt
+        prompts: Dict[str, str] = {}
+        article_hashes: List[Optional[str]] = []
+        for article in articles:
+            prompt = self._build_prompt(article)
+            content_hash = self._content_hash(prompt) if prompt else None
+            if content_hash:
+                prompts[content_hash] = prompt
+            article_hashes.append(content_hash)
+
+        summaries = self._cached(prompts)
+        cache_hits = len(summaries)
+        pending = [key for key in prompts if key not in summaries]
+
+        if pending:
+            logger.debug(
+                f"Generating {len(pending)} summaries "
+                f"(max_concurrency={self.max_concurrency})"
+            )
             try:
-                summary = self.summarize_article(article)
-                if summary:
-                    article["summary"] = summary
-                    logger.debug(
-                        f"Article {i}/{len(articles)} summarized: "
-                        f"{article.get('title', 'Unknown')[:50]}..."
-                    )
-                else:
-                    logger.debug(
-                        f"Article {i}/{len(articles)} summary failed: "
-                        f"{article.get('title', 'Unknown')[:50]}..."
-                    )
-                summarized_articles.append(article)
+                responses = self.llm.batch(
+                    [prompts[key] for key in pending],
+                    config={"max_concurrency": self.max_concurrency},
+                    return_exceptions=True,
+                )
             except Exception as e:
-                logger.error(f"Error summarizing article {i}/{len(articles)}: {str(e)}")
-                # Continue with next article even if one fails
-                summarized_articles.append(article)
-
-        successful = sum(1 for a in summarized_articles if a.get("summary"))
+                logger.error(f"Batch summarization failed: {str(e)}")
+                responses = [e] * len(pending)
+
+            generated: Dict[str, str] = {}
+            for key, response in zip(pending, responses):
+                if isinstance(response, Exception):
+                    logger.error(f"Failed to summarize article: {str(response)}")
+                    continue
+                summary_text = self._clean_summary(response)
+                if summary_text:
+                    generated[key] = summary_text
+            self._store(generated)
+            summaries.update(generated)
+
+        for article, content_hash in zip(articles, article_hashes):
+            if content_hash in summaries:
+                article["summary"] = summaries[content_hash]
+
+        successful = sum(1 for a in articles if a.get("summary"))
         logger.info(
             f"Summarization complete: {successful}/{len(articles)} "
-            "articles summarized"
+            f"articles summarized ({cache_hits} from cache)"
         )
-        return summarized_articles
+        return articles
@@ -37,7 +37,7 @@ from app.ingestion.yfinance_fetcher import YFinanceFetcher
 from app.rag.embedding_factory import EmbeddingError, EmbeddingGenerator
 from app.utils.config import config
 from app.utils.logger import get_logger
-from app.vector_db import ChromaStore, ChromaStoreError
+from app.vector_db import VectorStoreError, create_vector_store
 
 logger = get_logger(__name__)
 
@@ -78,7 +78,7 @@ class IngestionPipeline:
             chunk_overlap=chunk_overlap,
         )
         self.embedding_generator = EmbeddingGenerator(provider=embedding_provider)
-        self.chroma_store = ChromaStore(collection_name=collection_name)
+        self.chroma_store = create_vector_store(collection_name=collection_name)
 
         # Initialize document processor
         self.document_processor = DocumentProcessor(
@@ -298,7 +298,11 @@ class IngestionPipeline:
         )
 
     def process_document(
-        self, file_path: Path, store_embeddings: bool = True
+        self,
+        file_path: Path,
+        store_embeddings: bool = True,
+        content_hash: Optional[str] = None,
+        skip_duplicates: bool = False,
     ) -> List[str]:
         """
         Process a single document: load, chunk, embed, and store.
@@ -306,6 +310,9 @@ class IngestionPipeline:
         Args:
             file_path: Path to the document file
             store_embeddings: Whether to store embeddings in ChromaDB (default: True)
+            content_hash: Precomputed SHA-256 of the file content (optional)
+            skip_duplicates: Return existing chunk IDs instead of re-ingesting
+                content that is already stored (default: False)
 
         Returns:
             List of document chunk IDs stored in ChromaDB
@@ -314,7 +321,10 @@ class IngestionPipeline:
             IngestionPipelineError: If processing fails
         """
         return self.document_processor.process_document(
-            file_path, store_embeddings=store_embeddings
+            file_path,
+            store_embeddings=store_embeddings,
+            content_hash=content_hash,
+            skip_duplicates=skip_duplicates,
         )
 
     def process_documents(
@@ -369,6 +379,15 @@ class IngestionPipeline:
         """
         return self.document_processor.enrich_with_sentiment(document)
 
+    def close(self) -> None:
+        """
+        Release background resources held by the processors.
+
+        Waits for deferred news summaries to finish.
+        """
+        if self.news_processor is not None:
+            self.news_processor.close()
+
     def get_document_count(self) -> int:
         """
         Get the number of documents stored in ChromaDB.
@@ -423,7 +442,7 @@ class IngestionPipeline:
         except EmbeddingError as e:
             logger.error(f"Query embedding failed: {str(e)}", exc_info=True)
             raise IngestionPipelineError(f"Query embedding failed: {str(e)}") from e
-        except ChromaStoreError as e:
+        except VectorStoreError as e:
             logger.error(f"ChromaDB search failed: {str(e)}", exc_info=True)
             raise IngestionPipelineError(f"ChromaDB search failed: {str(e)}") from e
         except Exception as e:
@@ -705,6 +724,7 @@ class IngestionPipeline:
         end_date: Optional[str] = None,
         limit: Optional[int] = None,
         store_embeddings: bool = True,
+        only_new: bool = True,
     ) -> List[str]:
         """
         Process central bank communications through the ingestion pipeline.
@@ -717,6 +737,8 @@ class IngestionPipeline:
             end_date: End date (YYYY-MM-DD format, optional)
             limit: Maximum number of communications per type (optional)
             store_embeddings: Whether to store embeddings in ChromaDB (default: True)
+            only_new: Only fetch communications that are not in the
+                communication index yet (default: True)
 
         Returns:
             List of document chunk IDs stored in ChromaDB
@@ -730,6 +752,7 @@ class IngestionPipeline:
             end_date=end_date,
             limit=limit,
             store_embeddings=store_embeddings,
+            only_new=only_new,
         )
 
     def process_social_media(
@@ -49,7 +49,7 @@ class AlternativeDataProcessor(BaseProcessor):
         Args:
             document_loader: DocumentLoader instance
             embedding_generator: EmbeddingGenerator instance
-            chroma_store: ChromaStore instance
+            chroma_store: VectorStore instance
             social_media_fetcher: Optional SocialMediaFetcher instance
             esg_fetcher: Optional ESGFetcher instance
             alternative_data_fetcher: Optional AlternativeDataFetcher instance
@@ -13,7 +13,8 @@ from app.ingestion.sentiment_analyzer import SentimentAnalyzer
 from app.rag.embedding_factory import EmbeddingGenerator
 from app.utils.document_processors import generate_and_store_embeddings
 from app.utils.logger import get_logger
-from app.vector_db import ChromaStore
+from app.utils.tracing import stage
+from app.vector_db import VectorStore
 
 logger = get_logger(__name__)
 
@@ -30,7 +31,7 @@ class BaseProcessor:
         self,
         document_loader: DocumentLoader,
         embedding_generator: EmbeddingGenerator,
-        chroma_store: ChromaStore,
+        chroma_store: VectorStore,
         sentiment_analyzer: Optional[SentimentAnalyzer] = None,
     ):
         """
@@ -39,7 +40,7 @@ class BaseProcessor:
         Args:
             document_loader: DocumentLoader instance for chunking
             embedding_generator: EmbeddingGenerator instance for embeddings
-            chroma_store: ChromaStore instance for storage
+            chroma_store: VectorStore instance for storage
             sentiment_analyzer: Optional SentimentAnalyzer for enrichment
         """
         self.document_loader = document_loader
@@ -160,9 +161,11 @@ class BaseProcessor:
                 )
                 # Enrich document with sentiment analysis if enabled
                 if self.sentiment_analyzer is not None:
-                    doc = self.enrich_with_sentiment(doc)
+                    with stage("sentiment"):
+                        doc = self.enrich_with_sentiment(doc)
                 # Chunk the document
-                chunks = self.document_loader.chunk_document(doc)
+                with stage("chunk"):
+                    chunks = self.document_loader.chunk_document(doc)
                 all_chunks.extend(chunks)
             except Exception as e:
                 logger.warning(
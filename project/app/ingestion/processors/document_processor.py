@@ -5,11 +5,12 @@ Handles processing of documents from file paths.
 """
 
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from app.ingestion.document_loader import DocumentIngestionError
 from app.ingestion.processors.base_processor import BaseProcessor
 from app.rag.embedding_factory import EmbeddingError
+from app.utils.file_streaming import hash_file
 from app.utils.logger import get_logger
 from app.utils.metrics import (
     document_ingestion_duration_seconds,
@@ -18,7 +19,8 @@ from app.utils.metrics import (
     track_duration,
     track_error,
 )
-from app.vector_db import ChromaStoreError
+from app.utils.tracing import stage
+from app.vector_db import VectorStoreError
 
 logger = get_logger(__name__)
 
@@ -30,15 +32,39 @@ class DocumentProcessor(BaseProcessor):
     Handles loading, chunking, embedding, and storage of documents from file paths.
     """
 
+    def find_ingested(self, content_hash: str) -> List[str]:
+        """
+        Find chunk IDs of an already-ingested document by content hash.
+
+        Args:
+            content_hash: SHA-256 hash of the document file content
+
+        Returns:
+            List of existing chunk IDs (empty if the content is new)
+        """
+        return self.chroma_store.get_ids_by_metadata({"content_hash": content_hash})
+
     def process_document(
-        self, file_path: Path, store_embeddings: bool = True
+        self,
+        file_path: Path,
+        store_embeddings: bool = True,
+        content_hash: Optional[str] = None,
+        skip_duplicates: bool = False,
     ) -> List[str]:
         """
         Process a single document: load, chunk, embed, and store.
 
+        Every chunk is tagged with the SHA-256 ``content_hash`` of the file.
+        With skip_duplicates, a file whose content was already ingested is
+        not re-embedded and the existing chunk IDs are returned instead.
+
         Args:
             file_path: Path to the document file
             store_embeddings: Whether to store embeddings in ChromaDB (default: True)
+            content_hash: Precomputed SHA-256 of the file (computed by
+                streaming the file if not provided)
+            skip_duplicates: Skip documents whose content hash is already
+                stored in ChromaDB (default: False)
 
         Returns:
             List of document chunk IDs stored in ChromaDB
@@ -50,28 +76,37 @@ class DocumentProcessor(BaseProcessor):
 
         logger.info(f"Processing document: {file_path}")
         try:
-            # Track document size
-            file_size = file_path.stat().st_size if file_path.exists() else 0
-            document_size_bytes.observe(file_size)
+            # Track document size and hash the content
+            with stage("load"):
+                file_size = file_path.stat().st_size if file_path.exists() else 0
+                document_size_bytes.observe(file_size)
+
+                if content_hash is None and file_path.is_file():
+                    content_hash = hash_file(file_path)
+
+            if skip_duplicates and content_hash and store_embeddings:
+                existing_ids = self.find_ingested(content_hash)
+                if existing_ids:
+                    logger.info(
+                        f"Skipping {file_path}: content already ingested "
+                        f"({len(existing_ids)} chunks, hash={content_hash[:12]})"
+                    )
+                    return existing_ids
 
             # Track ingestion duration
             with track_duration(document_ingestion_duration_seconds):
-                # Step 1: Load and chunk document
-                logger.debug(f"Loading and chunking document: {file_path}")
-                chunks = self.document_loader.process_document(file_path)
-
-                if not chunks:
-                    logger.error(f"No chunks generated from {file_path}")
-                    raise IngestionPipelineError(
-                        f"No chunks generated from {file_path}"
-                    )
-
-                logger.info(f"Generated {len(chunks)} chunks from document")
-
-                # Step 2: Generate embeddings and store (chunks are already created)
-                from app.utils.document_processors import generate_and_store_embeddings
+                # Chunks are streamed from disk straight into embedding batches,
+                # so memory stays bounded regardless of document size
+                from app.utils.document_processors import (
+                    generate_and_store_embeddings_streaming,
+                )
 
-                return generate_and_store_embeddings(
+                logger.debug(f"Streaming chunks into embedding batches: {file_path}")
+                chunks = self.document_loader.iter_document_chunks(
+                    file_path,
+                    metadata={"content_hash": content_hash} if content_hash else None,
+                )
+                ids = generate_and_store_embeddings_streaming(
                     chunks=chunks,
                     embedding_generator=self.embedding_generator,
                     chroma_store=self.chroma_store,
@@ -79,6 +114,15 @@ class DocumentProcessor(BaseProcessor):
                     source_name="document",
                 )
 
+                if not ids:
+                    logger.error(f"No chunks generated from {file_path}")
+                    raise IngestionPipelineError(
+                        f"No chunks generated from {file_path}"
+                    )
+
+                logger.info(f"Ingested {len(ids)} chunks from document")
+                return ids
+
         except DocumentIngestionError as e:
             logger.error(f"Document ingestion failed: {str(e)}", exc_info=True)
             track_error(document_ingestion_total)
@@ -89,7 +133,7 @@ class DocumentProcessor(BaseProcessor):
             raise IngestionPipelineError(
                 f"Embedding generation failed: {str(e)}"
             ) from e
-        except ChromaStoreError as e:
+        except VectorStoreError as e:
             logger.error(f"ChromaDB storage failed: {str(e)}", exc_info=True)
             track_error(document_ingestion_total)
             raise IngestionPipelineError(f"ChromaDB storage failed: {str(e)}") from e
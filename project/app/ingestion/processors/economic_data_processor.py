@@ -32,7 +32,8 @@ from app.rag.embedding_factory import EmbeddingError
 from app.utils.config import config
 from app.utils.logger import get_logger
 from app.utils.metrics import document_ingestion_total, track_error
-from app.vector_db import ChromaStoreError
+from app.utils.tracing import stage
+from app.vector_db import VectorStoreError
 
 logger = get_logger(__name__)
 
@@ -63,7 +64,7 @@ class EconomicDataProcessor(BaseProcessor):
         Args:
             document_loader: DocumentLoader instance
             embedding_generator: EmbeddingGenerator instance
-            chroma_store: ChromaStore instance
+            chroma_store: VectorStore instance
             economic_calendar_fetcher: Optional EconomicCalendarFetcher instance
             fred_fetcher: Optional FREDFetcher instance
             world_bank_fetcher: Optional WorldBankFetcher instance
@@ -100,9 +101,10 @@ class EconomicDataProcessor(BaseProcessor):
 
         # Chunk documents
         all_chunks = []
-        for doc in documents:
-            chunks = self.document_loader.chunk_document(doc)
-            all_chunks.extend(chunks)
+        with stage("chunk"):
+            for doc in documents:
+                chunks = self.document_loader.chunk_document(doc)
+                all_chunks.extend(chunks)
 
         if not all_chunks:
             logger.warning(f"No chunks generated from {source_name}")
@@ -159,12 +161,13 @@ class EconomicDataProcessor(BaseProcessor):
         try:
             # Step 1: Fetch economic calendar events
             logger.debug("Fetching economic calendar events")
-            events = self.economic_calendar_fetcher.fetch_calendar(
-                start_date=start_date,
-                end_date=end_date,
-                country=country,
-                importance=importance,
-            )
+            with stage("fetch"):
+                events = self.economic_calendar_fetcher.fetch_calendar(
+                    start_date=start_date,
+                    end_date=end_date,
+                    country=country,
+                    importance=importance,
+                )
 
             if not events:
                 logger.warning("No economic calendar events fetched")
@@ -173,13 +176,13 @@ class EconomicDataProcessor(BaseProcessor):
             # Step 2: Convert to Document objects
             logger.debug(f"Converting {len(events)} events to Document objects")
             documents = []
-            for event in events:
-                formatted_text = self.economic_calendar_fetcher.format_event_for_rag(
-                    event
-                )
-                metadata = self.economic_calendar_fetcher.get_event_metadata(event)
-                document = Document(page_content=formatted_text, metadata=metadata)
-                documents.append(document)
+            with stage("parse"):
+                for event in events:
+                    fetcher = self.economic_calendar_fetcher
+                    formatted_text = fetcher.format_event_for_rag(event)
+                    metadata = fetcher.get_event_metadata(event)
+                    document = Document(page_content=formatted_text, metadata=metadata)
+                    documents.append(document)
 
             # Step 3: Process documents
             return self._process_fetched_documents(
@@ -198,7 +201,7 @@ class EconomicDataProcessor(BaseProcessor):
             raise IngestionPipelineError(
                 f"Embedding generation failed: {str(e)}"
             ) from e
-        except ChromaStoreError as e:
+        except VectorStoreError as e:
             logger.error(f"ChromaDB storage failed: {str(e)}", exc_info=True)
             track_error(document_ingestion_total)
             raise IngestionPipelineError(f"ChromaDB storage failed: {str(e)}") from e
@@ -248,9 +251,10 @@ class EconomicDataProcessor(BaseProcessor):
         try:
             # Step 1: Fetch FRED series data
             logger.debug(f"Fetching FRED series: {series_ids}")
-            series_data = self.fred_fetcher.fetch_multiple_series(
-                series_ids, start_date=start_date, end_date=end_date
-            )
+            with stage("fetch"):
+                series_data = self.fred_fetcher.fetch_multiple_series(
+                    series_ids, start_date=start_date, end_date=end_date
+                )
 
             if not series_data:
                 logger.warning("No FRED series data fetched")
@@ -259,15 +263,18 @@ class EconomicDataProcessor(BaseProcessor):
             # Step 2: Convert to Document objects
             logger.debug(f"Converting {len(series_data)} series to Document objects")
             documents = []
-            for series_id, data in series_data.items():
-                if data.get("data") is None:
-                    logger.warning(f"Skipping series {series_id}: no data available")
-                    continue
+            with stage("parse"):
+                for series_id, data in series_data.items():
+                    if data.get("data") is None:
+                        logger.warning(
+                            f"Skipping series {series_id}: no data available"
+                        )
+                        continue
 
-                formatted_text = self.fred_fetcher.format_series_for_rag(data)
-                metadata = self.fred_fetcher.get_series_metadata(data)
-                document = Document(page_content=formatted_text, metadata=metadata)
-                documents.append(document)
+                    formatted_text = self.fred_fetcher.format_series_for_rag(data)
+                    metadata = self.fred_fetcher.get_series_metadata(data)
+                    document = Document(page_content=formatted_text, metadata=metadata)
+                    documents.append(document)
 
             # Step 3: Process documents
             return self._process_fetched_documents(
@@ -284,7 +291,7 @@ class EconomicDataProcessor(BaseProcessor):
             raise IngestionPipelineError(
                 f"Embedding generation failed: {str(e)}"
             ) from e
-        except ChromaStoreError as e:
+        except VectorStoreError as e:
             logger.error(f"ChromaDB storage failed: {str(e)}", exc_info=True)
             track_error(document_ingestion_total)
             raise IngestionPipelineError(f"ChromaDB storage failed: {str(e)}") from e
@@ -333,12 +340,13 @@ class EconomicDataProcessor(BaseProcessor):
         try:
             # Step 1: Fetch World Bank indicator data
             logger.debug(f"Fetching World Bank indicators: {indicator_codes}")
-            indicator_data = self.world_bank_fetcher.fetch_multiple_indicators(
-                indicator_codes,
-                country_codes=country_codes,
-                start_year=start_year,
-                end_year=end_year,
-            )
+            with stage("fetch"):
+                indicator_data = self.world_bank_fetcher.fetch_multiple_indicators(
+                    indicator_codes,
+                    country_codes=country_codes,
+                    start_year=start_year,
+                    end_year=end_year,
+                )
 
             if not indicator_data:
                 logger.warning("No World Bank indicator data fetched")
@@ -349,17 +357,19 @@ class EconomicDataProcessor(BaseProcessor):
                 f"Converting {len(indicator_data)} indicators to Document objects"
             )
             documents = []
-            for indicator_code, data in indicator_data.items():
-                if data.get("data") is None:
-                    logger.warning(
-                        f"Skipping indicator {indicator_code}: no data available"
-                    )
-                    continue
+            with stage("parse"):
+                for indicator_code, data in indicator_data.items():
+                    if data.get("data") is None:
+                        logger.warning(
+                            f"Skipping indicator {indicator_code}: no data available"
+                        )
+                        continue
 
-                formatted_text = self.world_bank_fetcher.format_indicator_for_rag(data)
-                metadata = self.world_bank_fetcher.get_indicator_metadata(data)
-                document = Document(page_content=formatted_text, metadata=metadata)
-                documents.append(document)
+                    fetcher = self.world_bank_fetcher
+                    formatted_text = fetcher.format_indicator_for_rag(data)
+                    metadata = fetcher.get_indicator_metadata(data)
+                    document = Document(page_content=formatted_text, metadata=metadata)
+                    documents.append(document)
 
             # Step 3: Process documents
             return self._process_fetched_documents(
@@ -376,7 +386,7 @@ class EconomicDataProcessor(BaseProcessor):
             raise IngestionPipelineError(
                 f"Embedding generation failed: {str(e)}"
             ) from e
-        except ChromaStoreError as e:
+        except VectorStoreError as e:
             logger.error(f"ChromaDB storage failed: {str(e)}", exc_info=True)
             track_error(document_ingestion_total)
             raise IngestionPipelineError(f"ChromaDB storage failed: {str(e)}") from e
@@ -425,12 +435,13 @@ class EconomicDataProcessor(BaseProcessor):
         try:
             # Step 1: Fetch IMF indicator data
             logger.debug(f"Fetching IMF indicators: {indicator_codes}")
-            indicator_data = self.imf_fetcher.fetch_multiple_indicators(
-                indicator_codes,
-                country_codes=country_codes,
-                start_year=start_year,
-                end_year=end_year,
-            )
+            with stage("fetch"):
+                indicator_data = self.imf_fetcher.fetch_multiple_indicators(
+                    indicator_codes,
+                    country_codes=country_codes,
+                    start_year=start_year,
+                    end_year=end_year,
+                )
 
             if not indicator_data:
                 logger.warning("No IMF indicator data fetched")
@@ -441,17 +452,18 @@ class EconomicDataProcessor(BaseProcessor):
                 f"Converting {len(indicator_data)} indicators to Document objects"
             )
             documents = []
-            for indicator_code, data in indicator_data.items():
-                if data.get("data") is None:
-                    logger.warning(
-                        f"Skipping indicator {indicator_code}: no data available"
-                    )
-                    continue
+            with stage("parse"):
+                for indicator_code, data in indicator_data.items():
+                    if data.get("data") is None:
+                        logger.warning(
+                            f"Skipping indicator {indicator_code}: no data available"
+                        )
+                        continue
 
-                formatted_text = self.imf_fetcher.format_indicator_for_rag(data)
-                metadata = self.imf_fetcher.get_indicator_metadata(data)
-                document = Document(page_content=formatted_text, metadata=metadata)
-                documents.append(document)
+                    formatted_text = self.imf_fetcher.format_indicator_for_rag(data)
+                    metadata = self.imf_fetcher.get_indicator_metadata(data)
+                    document = Document(page_content=formatted_text, metadata=metadata)
+                    documents.append(document)
 
             # Step 3: Process documents
             return self._process_fetched_documents(
@@ -468,7 +480,7 @@ class EconomicDataProcessor(BaseProcessor):
             raise IngestionPipelineError(
                 f"Embedding generation failed: {str(e)}"
             ) from e
-        except ChromaStoreError as e:
+        except VectorStoreError as e:
             logger.error(f"ChromaDB storage failed: {str(e)}", exc_info=True)
             track_error(document_ingestion_total)
             raise IngestionPipelineError(f"ChromaDB storage failed: {str(e)}") from e
@@ -488,6 +500,7 @@ class EconomicDataProcessor(BaseProcessor):
         end_date: Optional[str] = None,
         limit: Optional[int] = None,
         store_embeddings: bool = True,
+        only_new: bool = True,
     ) -> List[str]:
         """
         Process central bank communications through the ingestion pipeline.
@@ -500,6 +513,8 @@ class EconomicDataProcessor(BaseProcessor):
             end_date: End date (YYYY-MM-DD format, optional)
             limit: Maximum number of communications per type (optional)
             store_embeddings: Whether to store embeddings in ChromaDB (default: True)
+            only_new: Only fetch communications that are not in the
+                communication index yet (default: True)
 
         Returns:
             List of document chunk IDs stored in ChromaDB
@@ -535,6 +550,7 @@ class EconomicDataProcessor(BaseProcessor):
                                 start_date=start_date,
                                 end_date=end_date,
                                 limit=limit,
+                                only_new=only_new,
                             )
                         )
                     elif comm_type == "fomc_minutes":
@@ -542,6 +558,7 @@ class EconomicDataProcessor(BaseProcessor):
                             start_date=start_date,
                             end_date=end_date,
                             limit=limit,
+                            only_new=only_new,
                         )
                     elif comm_type == "fomc_press_conference":
                         communications = (
@@ -549,6 +566,7 @@ class EconomicDataProcessor(BaseProcessor):
                                 start_date=start_date,
                                 end_date=end_date,
                                 limit=limit,
+                                only_new=only_new,
                             )
                         )
                     else:
@@ -573,13 +591,26 @@ class EconomicDataProcessor(BaseProcessor):
                 f"Converting {len(all_communications)} communications "
                 f"to Document objects"
             )
-            documents = self.central_bank_fetcher.to_documents(all_communications)
-
-            # Step 3: Process documents
-            return self._process_fetched_documents(
+            with stage("parse"):
+                documents = self.central_bank_fetcher.to_documents(all_communications)
+
+            # Step 3: Drop the chunks of revised communications, then store
+            if store_embeddings:
+                for comm in all_communications:
+                    if comm.get("revised"):
+                        self.chroma_store.delete_documents(where={"url": comm["url"]})
+            chunk_ids = self._process_fetched_documents(
                 documents, "central bank communications", store_embeddings
             )
 
+            # Step 4: Record stored communications so refreshes skip them
+            if store_embeddings:
+                try:
+                    self.central_bank_fetcher.mark_ingested(all_communications)
+                except CentralBankFetcherError as e:
+                    logger.warning(f"Failed to update communication index: {e}")
+            return chunk_ids
+
         except CentralBankFetcherError as e:
             logger.error(f"Central bank fetching failed: {str(e)}", exc_info=True)
             track_error(document_ingestion_total)
@@ -592,7 +623,7 @@ class EconomicDataProcessor(BaseProcessor):
             raise IngestionPipelineError(
                 f"Embedding generation failed: {str(e)}"
             ) from e
-        except ChromaStoreError as e:
+        except VectorStoreError as e:
             logger.error(f"ChromaDB storage failed: {str(e)}", exc_info=True)
             track_error(document_ingestion_total)
             raise IngestionPipelineError(f"ChromaDB storage failed: {str(e)}") from e
@@ -4,7 +4,8 @@ News processor for ingestion pipeline.
 Handles processing of financial news articles.
 """
 
-from typing import List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional
 
 from app.alerts.news_alerts import NewsAlertSystem
 from app.ingestion.news_fetcher import NewsFetcher, NewsFetcherError
@@ -13,7 +14,8 @@ from app.rag.embedding_factory import EmbeddingError
 from app.utils.config import config
 from app.utils.logger import get_logger
 from app.utils.metrics import document_ingestion_total, track_error
-from app.vector_db import ChromaStoreError
+from app.utils.tracing import stage
+from app.vector_db import VectorStoreError
 
 logger = get_logger(__name__)
 
@@ -40,7 +42,7 @@ class NewsProcessor(BaseProcessor):
         Args:
             document_loader: DocumentLoader instance
             embedding_generator: EmbeddingGenerator instance
-            chroma_store: ChromaStore instance
+            chroma_store: VectorStore instance
             news_fetcher: NewsFetcher instance
             news_alert_system: Optional NewsAlertSystem instance
             sentiment_analyzer: Optional SentimentAnalyzer instance
@@ -50,6 +52,10 @@ class NewsProcessor(BaseProcessor):
         )
         self.news_fetcher = news_fetcher
         self.news_alert_system = news_alert_system
+        # Deferred summarization (NEWS_SUMMARIZATION_DEFERRED) runs on one
+        # background thread; summary_future tracks the latest batch
+        self._summary_executor: Optional[ThreadPoolExecutor] = None
+        self.summary_future: Optional[Future] = None
 
     def process_news(
         self,
@@ -87,11 +93,12 @@ class NewsProcessor(BaseProcessor):
         try:
             # Step 1: Fetch news articles
             logger.debug("Fetching news articles")
-            articles = self.news_fetcher.fetch_news(
-                feed_urls=feed_urls,
-                article_urls=article_urls,
-                enhance_with_scraping=enhance_with_scraping,
-            )
+            with stage("fetch"):
+                articles = self.news_fetcher.fetch_news(
+                    feed_urls=feed_urls,
+                    article_urls=article_urls,
+                    enhance_with_scraping=enhance_with_scraping,
+                )
 
             if not articles:
                 logger.warning("No news articles fetched")
@@ -113,19 +120,39 @@ class NewsProcessor(BaseProcessor):
                         f"Alert checking failed (continuing with ingestion): {str(e)}"
                     )
 
-            # Step 2: Convert to Document objects
+            # Step 2: Convert to Document objects (in deferred mode, without
+            # waiting for summaries)
+            defer_summaries = (
+                config.news_summarization_deferred
+                and store_embeddings
+                and getattr(self.news_fetcher, "summarizer", None) is not None
+            )
             logger.debug(f"Converting {len(articles)} articles to Document objects")
-            documents = self.news_fetcher.to_documents(articles)
+            with stage("parse"):
+                documents = self.news_fetcher.to_documents(
+                    articles, summarize=not defer_summaries
+                )
 
             if not documents:
                 logger.warning("No documents generated from news articles")
                 return []
 
             # Step 3: Process documents (chunk, embed, store)
-            return self.process_documents_to_chunks(
+            chunk_ids = self.process_documents_to_chunks(
                 documents, store_embeddings=store_embeddings, source_name="news"
             )
 
+            # Step 4: Summarize in the background and attach to stored chunks
+            if defer_summaries and chunk_ids:
+                if self._summary_executor is None:
+                    self._summary_executor = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="news-summary"
+                    )
+                self.summary_future = self._summary_executor.submit(
+                    self._attach_summaries_in_background, articles, chunk_ids
+                )
+            return chunk_ids
+
         except NewsFetcherError as e:
             logger.error(f"News fetching failed: {str(e)}", exc_info=True)
             track_error(document_ingestion_total)
@@ -136,7 +163,7 @@ class NewsProcessor(BaseProcessor):
             raise IngestionPipelineError(
                 f"Embedding generation failed: {str(e)}"
             ) from e
-        except ChromaStoreError as e:
+        except VectorStoreError as e:
             logger.error(f"ChromaDB storage failed: {str(e)}", exc_info=True)
             track_error(document_ingestion_total)
             raise IngestionPipelineError(f"ChromaDB storage failed: {str(e)}") from e
@@ -146,3 +173,64 @@ class NewsProcessor(BaseProcessor):
             raise IngestionPipelineError(
                 f"Unexpected error processing news: {str(e)}"
             ) from e
+
+    def close(self) -> None:
+        """
+        Shut down the deferred-summary thread.
+
+        Waits for pending deferred summaries to finish so they are not lost
+        at exit. A later deferred batch starts a new thread.
+        """
+        executor = self._summary_executor
+        if executor is not None:
+            self._summary_executor = None
+            executor.shutdown(wait=True)
+
+    def attach_summaries(self, articles: List[Dict], chunk_ids: List[str]) -> int:
+        """
+        Summarize stored articles and add the summaries to their chunks.
+
+        Args:
+            articles: Article dictionaries that were stored without summaries
+            chunk_ids: IDs of the stored chunks of these articles
+
+        Returns:
+            Number of chunks updated
+
+        Raises:
+            VectorStoreError: If the chunks cannot be read or updated
+        """
+        summarizer = self.news_fetcher.summarizer
+        summarizer.summarize_articles(articles)
+        summaries = {
+            article["url"]: article["summary"]
+            for article in articles
+            if article.get("url") and article.get("summary")
+        }
+        if not summaries:
+            return 0
+
+        stored = self.chroma_store.get_by_ids(chunk_ids)
+        ids = []
+        metadatas = []
+        for chunk_id, metadata in zip(stored["ids"], stored["metadatas"]):
+            summary = summaries.get((metadata or {}).get("url"))
+            if summary:
+                ids.append(chunk_id)
+                metadatas.append({**metadata, "summary": summary})
+        if ids:
+            self.chroma_store.update_documents(ids, metadatas=metadatas)
+        logger.info(
+            f"Attached summaries of {len(summaries)} articles to {len(ids)} chunks"
+        )
+        return len(ids)
+
+    def _attach_summaries_in_background(
+        self, articles: List[Dict], chunk_ids: List[str]
+    ) -> int:
+        """Run attach_summaries() on the background thread, logging failures."""
+        try:
+            return self.attach_summaries(articles, chunk_ids)
+        except Exception as e:
+            logger.error(f"Deferred news summarization failed: {str(e)}", exc_info=True)
+            return 0
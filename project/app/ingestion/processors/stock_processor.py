@@ -4,7 +4,7 @@ Stock data processor for ingestion pipeline.
 Handles processing of stock data from yfinance.
 """
 
-from typing import List
+from typing import Any, Dict, List, Optional
 
 from langchain_core.documents import Document
 
@@ -15,7 +15,8 @@ from app.rag.embedding_factory import EmbeddingError
 from app.utils.config import config
 from app.utils.logger import get_logger
 from app.utils.metrics import document_ingestion_total, track_error
-from app.vector_db import ChromaStoreError
+from app.utils.tracing import stage
+from app.vector_db import VectorStoreError
 
 logger = get_logger(__name__)
 
@@ -42,7 +43,7 @@ class StockProcessor(BaseProcessor):
         Args:
             document_loader: DocumentLoader instance
             embedding_generator: EmbeddingGenerator instance
-            chroma_store: ChromaStore instance
+            chroma_store: VectorStore instance
             yfinance_fetcher: YFinanceFetcher instance
             stock_normalizer: StockDataNormalizer instance
             sentiment_analyzer: Optional SentimentAnalyzer instance
@@ -87,54 +88,21 @@ class StockProcessor(BaseProcessor):
         try:
             # Step 1: Fetch stock data
             logger.debug(f"Fetching stock data for {ticker_symbol}")
-            stock_data = self.yfinance_fetcher.fetch_all_data(
-                ticker_symbol, include_history=include_history
-            )
+            with stage("fetch"):
+                stock_data = self.yfinance_fetcher.fetch_all_data(
+                    ticker_symbol, include_history=include_history
+                )
 
             # Step 2: Normalize data to text documents
             logger.debug(f"Normalizing stock data for {ticker_symbol}")
-            normalized_docs = self.stock_normalizer.normalize_all_data(
-                stock_data, ticker_symbol
-            )
-
-            if not normalized_docs:
-                logger.warning(
-                    f"No documents generated from stock data for {ticker_symbol}"
+            with stage("parse"):
+                normalized_docs = self.stock_normalizer.normalize_all_data(
+                    stock_data, ticker_symbol
                 )
-                return []
-
-            # Step 3: Convert to LangChain Document objects
-            documents = [
-                Document(page_content=doc["text"], metadata=doc["metadata"])
-                for doc in normalized_docs
-            ]
 
-            # Step 4: Chunk documents and process
-            all_chunks = []
-            for doc in documents:
-                chunks = self.document_loader.chunk_document(doc)
-                all_chunks.extend(chunks)
-
-            if not all_chunks:
-                logger.warning(
-                    f"No chunks generated from stock data for {ticker_symbol}"
-                )
-                return []
-
-            logger.info(
-                f"Generated {len(all_chunks)} chunks from stock data "
-                f"for {ticker_symbol}"
-            )
-
-            # Step 5: Generate embeddings and store using utility
-            from app.utils.document_processors import generate_and_store_embeddings
-
-            return generate_and_store_embeddings(
-                chunks=all_chunks,
-                embedding_generator=self.embedding_generator,
-                chroma_store=self.chroma_store,
-                store_embeddings=store_embeddings,
-                source_name=f"stock data ({ticker_symbol})",
+            # Steps 3-5: Chunk, embed and store
+            return self._store_normalized(
+                normalized_docs, ticker_symbol, store_embeddings
             )
 
         except YFinanceFetcherError as e:
@@ -147,7 +115,7 @@ class StockProcessor(BaseProcessor):
             raise IngestionPipelineError(
                 f"Embedding generation failed: {str(e)}"
             ) from e
-        except ChromaStoreError as e:
+        except VectorStoreError as e:
             logger.error(f"ChromaDB storage failed: {str(e)}", exc_info=True)
             track_error(document_ingestion_total)
             raise IngestionPipelineError(f"ChromaDB storage failed: {str(e)}") from e
@@ -160,6 +128,95 @@ class StockProcessor(BaseProcessor):
                 f"Unexpected error processing stock data: {str(e)}"
             ) from e
 
+    def _store_per_ticker(
+        self, normalized_docs: List[Dict[str, Any]], store_embeddings: bool
+    ) -> List[str]:
+        """
+        Store normalized stock documents one ticker at a time.
+
+        Args:
+            normalized_docs: Documents from StockDataNormalizer
+            store_embeddings: Whether to store embeddings in ChromaDB
+
+        Returns:
+            List of document chunk IDs stored for the tickers that succeeded
+
+        Raises:
+            EmbeddingError: If every ticker failed to embed
+            VectorStoreError: If every ticker failed to store
+        """
+        docs_by_ticker: Dict[str, List[Dict[str, Any]]] = {}
+        for doc in normalized_docs:
+            docs_by_ticker.setdefault(doc["metadata"].get("ticker", ""), []).append(doc)
+
+        all_ids: List[str] = []
+        failed: List[str] = []
+        last_error: Optional[Exception] = None
+        for ticker, docs in docs_by_ticker.items():
+            try:
+                all_ids.extend(self._store_normalized(docs, ticker, store_embeddings))
+            except (EmbeddingError, VectorStoreError, ValueError) as e:
+                logger.warning(f"Failed to store stock data for {ticker}: {str(e)}")
+                failed.append(ticker)
+                last_error = e
+
+        if failed:
+            logger.warning(f"Skipped {len(failed)} tickers that failed: {failed}")
+            if len(failed) == len(docs_by_ticker) and last_error is not None:
+                raise last_error
+        return all_ids
+
+    def _store_normalized(
+        self,
+        normalized_docs: List[Dict[str, Any]],
+        label: str,
+        store_embeddings: bool,
+    ) -> List[str]:
+        """
+        Chunk normalized stock documents, embed them and store them.
+
+        Args:
+            normalized_docs: Documents from StockDataNormalizer
+            label: Tickers the documents belong to (for logging)
+            store_embeddings: Whether to store embeddings in ChromaDB
+
+        Returns:
+            List of document chunk IDs stored in ChromaDB
+        """
+        if not normalized_docs:
+            logger.warning(f"No documents generated from stock data for {label}")
+            return []
+
+        # Convert to LangChain Document objects
+        documents = [
+            Document(page_content=doc["text"], metadata=doc["metadata"])
+            for doc in normalized_docs
+        ]
+
+        # Chunk documents
+        all_chunks = []
+        with stage("chunk"):
+            for doc in documents:
+                chunks = self.document_loader.chunk_document(doc)
+                all_chunks.extend(chunks)
+
+        if not all_chunks:
+            logger.warning(f"No chunks generated from stock data for {label}")
+            return []
+
+        logger.info(f"Generated {len(all_chunks)} chunks from stock data for {label}")
+
+        # Generate embeddings and store using utility
+        from app.utils.document_processors import generate_and_store_embeddings
+
+        return generate_and_store_embeddings(
+            chunks=all_chunks,
+            embedding_generator=self.embedding_generator,
+            chroma_store=self.chroma_store,
+            store_embeddings=store_embeddings,
+            source_name=f"stock data ({label})",
+        )
+
     def process_stock_tickers(
         self,
         ticker_symbols: List[str],
@@ -169,6 +226,12 @@ class StockProcessor(BaseProcessor):
         """
         Process stock data for multiple ticker symbols.
 
+        Data for all tickers is fetched in bulk (batched price history
+        downloads, concurrent per-ticker requests), normalized as one batch
+        and embedded together. Tickers whose data cannot be fetched are
+        skipped. If embedding or storing the batch fails, each ticker is
+        stored on its own and only the tickers that still fail are skipped.
+
         Args:
             ticker_symbols: List of stock ticker symbols
             include_history: Whether to include historical price data (default: True)
@@ -182,22 +245,59 @@ class StockProcessor(BaseProcessor):
         """
         from app.ingestion.pipeline import IngestionPipelineError
 
-        all_ids = []
+        if not config.yfinance_enabled:
+            raise IngestionPipelineError(
+                "yfinance integration is disabled in configuration"
+            )
+
+        if self.yfinance_fetcher is None:
+            raise IngestionPipelineError("yfinance fetcher is not initialized")
 
         logger.info(f"Processing stock data for {len(ticker_symbols)} tickers")
-        for idx, ticker in enumerate(ticker_symbols, 1):
+        try:
+            with stage("fetch"):
+                stock_data = self.yfinance_fetcher.fetch_bulk_data(
+                    ticker_symbols, include_history=include_history
+                )
+            skipped = [t for t in ticker_symbols if t not in stock_data]
+            if skipped:
+                logger.warning(f"Skipping tickers without data: {skipped}")
+
+            with stage("parse"):
+                normalized_docs = self.stock_normalizer.normalize_batch(stock_data)
             try:
-                logger.info(f"Processing ticker {idx}/{len(ticker_symbols)}: {ticker}")
-                ids = self.process_stock_data(
-                    ticker,
-                    include_history=include_history,
-                    store_embeddings=store_embeddings,
+                all_ids = self._store_normalized(
+                    normalized_docs, f"{len(stock_data)} tickers", store_embeddings
+                )
+            except (EmbeddingError, VectorStoreError, ValueError) as e:
+                logger.warning(
+                    f"Storing {len(stock_data)} tickers as one batch failed, "
+                    f"storing them individually: {str(e)}"
                 )
-                all_ids.extend(ids)
-            except IngestionPipelineError as e:
-                # Log error but continue processing other tickers
-                logger.warning(f"Failed to process {ticker}: {str(e)}")
-                continue
+                all_ids = self._store_per_ticker(normalized_docs, store_embeddings)
+
+        except YFinanceFetcherError as e:
+            logger.error(f"yfinance fetching failed: {str(e)}", exc_info=True)
+            track_error(document_ingestion_total)
+            raise IngestionPipelineError(f"yfinance fetching failed: {str(e)}") from e
+        except EmbeddingError as e:
+            logger.error(f"Embedding generation failed: {str(e)}", exc_info=True)
+            track_error(document_ingestion_total)
+            raise IngestionPipelineError(
+                f"Embedding generation failed: {str(e)}"
+            ) from e
+        except VectorStoreError as e:
+            logger.error(f"ChromaDB storage failed: {str(e)}", exc_info=True)
+            track_error(document_ingestion_total)
+            raise IngestionPipelineError(f"ChromaDB storage failed: {str(e)}") from e
+        except Exception as e:
+            logger.error(
+                f"Unexpected error processing stock data: {str(e)}", exc_info=True
+            )
+            track_error(document_ingestion_total)
+            raise IngestionPipelineError(
+                f"Unexpected error processing stock data: {str(e)}"
+            ) from e
 
         logger.info(
             f"Completed processing {len(ticker_symbols)} tickers, "
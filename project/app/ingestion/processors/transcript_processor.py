@@ -4,10 +4,11 @@ Transcript processor for ingestion pipeline.
 Handles processing of earnings call transcripts.
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from langchain_core.documents import Document
 
+from app.ingestion.document_loader import SECTION_OFFSETS_KEY
 from app.ingestion.processors.base_processor import BaseProcessor
 from app.ingestion.transcript_fetcher import TranscriptFetcher, TranscriptFetcherError
 from app.ingestion.transcript_parser import TranscriptParser, TranscriptParserError
@@ -15,11 +16,49 @@ from app.rag.embedding_factory import EmbeddingError
 from app.utils.config import config
 from app.utils.logger import get_logger
 from app.utils.metrics import document_ingestion_total, track_error
-from app.vector_db import ChromaStoreError
+from app.utils.tracing import stage
+from app.vector_db import VectorStoreError
 
 logger = get_logger(__name__)
 
 
+def _turn_sections(
+    turns: List[Dict[str, Any]], offset: int, max_length: int
+) -> List[Tuple[str, int, int]]:
+    """
+    Group consecutive speaker turns into chunking sections.
+
+    Short turns ("Thank you.") are merged with their neighbours up to
+    max_length characters so they do not become chunks of their own, while
+    longer turns get sections of their own and are never split mid-chunk
+    with another speaker.
+
+    Args:
+        turns: Turn dicts (speaker, start, end) from TranscriptParser
+        offset: Position of the transcript text in the document
+        max_length: Maximum length of a merged section
+
+    Returns:
+        (title, start, end) sections; titles list the speakers
+    """
+    sections: List[Tuple[str, int, int]] = []
+    speakers: List[str] = []
+    start: Optional[int] = None
+    end: Optional[int] = None
+    for turn in turns:
+        if start is not None and end is not None and turn["end"] - start > max_length:
+            sections.append((", ".join(speakers), offset + start, offset + end))
+            start = None
+        if start is None:
+            start, speakers = turn["start"], []
+        if turn["speaker"] not in speakers:
+            speakers.append(turn["speaker"])
+        end = turn["end"]
+    if start is not None and end is not None:
+        sections.append((", ".join(speakers), offset + start, offset + end))
+    return sections
+
+
 class TranscriptProcessor(BaseProcessor):
     """
     Processor for earnings call transcript ingestion.
@@ -42,7 +81,7 @@ class TranscriptProcessor(BaseProcessor):
         Args:
             document_loader: DocumentLoader instance
             embedding_generator: EmbeddingGenerator instance
-            chroma_store: ChromaStore instance
+            chroma_store: VectorStore instance
             transcript_fetcher: TranscriptFetcher instance
             transcript_parser: TranscriptParser instance
             sentiment_analyzer: Optional SentimentAnalyzer instance
@@ -91,9 +130,10 @@ class TranscriptProcessor(BaseProcessor):
         try:
             # Step 1: Fetch transcript
             logger.debug(f"Fetching transcript for {ticker}")
-            transcript_data = self.transcript_fetcher.fetch_transcript(
-                ticker, date=date, source=source
-            )
+            with stage("fetch"):
+                transcript_data = self.transcript_fetcher.fetch_transcript(
+                    ticker, date=date, source=source
+                )
 
             if not transcript_data:
                 logger.warning(f"No transcript found for {ticker} on {date}")
@@ -101,12 +141,15 @@ class TranscriptProcessor(BaseProcessor):
 
             # Step 2: Parse transcript
             logger.debug(f"Parsing transcript for {ticker}")
-            parsed_transcript = self.transcript_parser.parse_transcript(transcript_data)
+            with stage("parse"):
+                parsed_transcript = self.transcript_parser.parse_transcript(
+                    transcript_data
+                )
 
-            # Step 3: Format for RAG ingestion
-            formatted_text = self.transcript_parser.format_transcript_for_rag(
-                parsed_transcript
-            )
+                # Step 3: Format for RAG ingestion
+                formatted_text = self.transcript_parser.format_transcript_for_rag(
+                    parsed_transcript
+                )
 
             # Step 4: Create Document object with metadata
             metadata = {
@@ -138,10 +181,21 @@ class TranscriptProcessor(BaseProcessor):
                 "guidance_count": len(parsed_transcript.get("forward_guidance", [])),
             }
 
+            # Split along speaker turns; the full transcript ends the text
+            turns = parsed_transcript.get("turns")
+            transcript_text = parsed_transcript.get("transcript_text", "")
+            if turns and formatted_text.endswith(transcript_text):
+                metadata[SECTION_OFFSETS_KEY] = _turn_sections(
+                    turns,
+                    offset=len(formatted_text) - len(transcript_text),
+                    max_length=self.document_loader.chunk_size,
+                )
+
             document = Document(page_content=formatted_text, metadata=metadata)
 
             # Step 5: Chunk document and process
-            chunks = self.document_loader.chunk_document(document)
+            with stage("chunk"):
+                chunks = self.document_loader.chunk_document(document)
 
             if not chunks:
                 logger.warning(f"No chunks generated from transcript for {ticker}")
@@ -174,7 +228,7 @@ class TranscriptProcessor(BaseProcessor):
             raise IngestionPipelineError(
                 f"Embedding generation failed: {str(e)}"
             ) from e
-        except ChromaStoreError as e:
+        except VectorStoreError as e:
             logger.error(f"ChromaDB storage failed: {str(e)}", exc_info=True)
             track_error(document_ingestion_total)
             raise IngestionPipelineError(f"ChromaDB storage failed: {str(e)}") from e
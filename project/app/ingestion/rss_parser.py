@@ -10,12 +10,13 @@ from datetime import datetime
 from typing import Dict, List, Optional
 from urllib.parse import urlparse
 
-import feedparser
-
+from app.utils.lazy_imports import lazy_import
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+feedparser = lazy_import("feedparser")
+
 
 class RSSParserError(Exception):
     """Custom exception for RSS parser errors."""
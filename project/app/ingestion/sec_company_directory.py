@@ -0,0 +1,325 @@
+"""
+SEC ticker/CIK/company-name directory.
+
+Loads SEC's ``company_tickers.json`` once into an in-memory hash map,
+persists it to disk, and refreshes it with a conditional GET when it is
+older than config.sec_company_directory_refresh_hours. A small built-in
+table of major companies keeps lookups working offline and provides the
+display names used in RAG source headers.
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Union
+
+import requests
+
+from app.utils.config import config
+from app.utils.http_client import CachedSession, create_http_session
+from app.utils.logger import get_logger
+from app.utils.rate_limiter import get_rate_limiter
+
+logger = get_logger(__name__)
+
+COMPANY_TICKERS_URL = "https://www.sec.gov/files/company_tickers.json"
+
+# Major companies: (CIK, display name). Used before the first download,
+# when SEC is unreachable, and as preferred display names.
+BUILTIN_COMPANIES: Dict[str, tuple] = {
+    "AAPL": ("0000320193", "Apple Inc."),
+    "MSFT": ("0000789019", "Microsoft Corporation"),
+    "GOOGL": ("0001652044", "Alphabet Inc."),
+    "AMZN": ("0001018724", "Amazon.com Inc."),
+    "META": ("0001326801", "Meta Platforms Inc."),
+    "TSLA": ("0001318605", "Tesla, Inc."),
+    "NVDA": ("0001045810", "NVIDIA Corporation"),
+    "JPM": ("0000019617", "JPMorgan Chase & Co."),
+    "V": ("0001403161", "Visa Inc."),
+    "JNJ": ("0000200406", "Johnson & Johnson"),
+    "WMT": ("0000104169", "Walmart Inc."),
+    "PG": ("0000080424", "Procter & Gamble Co."),
+    "MA": ("0001141391", "Mastercard Inc."),
+    "HD": ("0000354950", "The Home Depot, Inc."),
+    "DIS": ("0001001039", "The Walt Disney Company"),
+    "BAC": ("0000070858", "Bank of America Corp."),
+    "XOM": ("0000034088", "Exxon Mobil Corporation"),
+    "VZ": ("0000732712", "Verizon Communications Inc."),
+    "CVX": ("0000093410", "Chevron Corporation"),
+    "KO": ("0000021344", "The Coca-Cola Company"),
+}
+
+
+class CompanyDirectoryError(Exception):
+    """Custom exception for company directory errors."""
+
+    pass
+
+
+@dataclass(frozen=True)
+class CompanyInfo:
+    """A directory entry."""
+
+    ticker: str
+    cik: str
+    name: str
+
+
+class SECCompanyDirectory:
+    """
+    Persistent, periodically refreshed ticker -> CIK/name directory.
+
+    Lookups are O(1) dictionary reads. CIK lookups refresh a stale directory
+    first (at most once per refresh interval, with a back-off after
+    failures), so changed CIK mappings are picked up for known tickers too;
+    name lookups never touch the network.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        refresh_hours: Optional[float] = None,
+        session: Optional[Union[requests.Session, CachedSession]] = None,
+    ):
+        """
+        Initialize directory.
+
+        Args:
+            path: JSON file the directory is persisted to.
+                If None, uses config.sec_company_directory_path
+            refresh_hours: Age after which the directory is refreshed.
+                If None, uses config.sec_company_directory_refresh_hours
+            session: HTTP session (default: shared session on the SEC
+                rate limiter, without the response cache since the directory
+                persists itself)
+        """
+        self.path = Path(path or config.sec_company_directory_path)
+        self.refresh_seconds = (
+            refresh_hours
+            if refresh_hours is not None
+            else config.sec_company_directory_refresh_hours
+        ) * 3600
+        if session is None:
+            session = create_http_session(
+                rate_limiter=get_rate_limiter(
+                    "sec.gov", config.edgar_requests_per_second
+                ),
+                cache_enabled=False,
+            )
+            session.headers.update(
+                {"User-Agent": "Financial Research Assistant (contact@example.com)"}
+            )
+        self.session: Union[requests.Session, CachedSession] = session
+
+        self._companies: Dict[str, CompanyInfo] = {
+            ticker: CompanyInfo(ticker, cik, name)
+            for ticker, (cik, name) in BUILTIN_COMPANIES.items()
+        }
+        self._fetched_at = 0.0
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        self._loaded = False
+        # After a failed refresh, don't retry before this time
+        self._retry_after = 0.0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return len(self._companies)
+
+    @property
+    def is_stale(self) -> bool:
+        """True if the directory has not been refreshed within the interval."""
+        return time.time() - self._fetched_at >= self.refresh_seconds
+
+    def _ensure_loaded(self) -> None:
+        """Load the persisted directory on first use."""
+        with self._lock:
+            if self._loaded:
+                return
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                self._merge(data.get("companies", {}))
+                self._fetched_at = float(data.get("fetched_at", 0.0))
+                self._etag = data.get("etag")
+                self._last_modified = data.get("last_modified")
+                logger.debug(
+                    f"Loaded {len(self._companies)} companies from {self.path}"
+                )
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError, TypeError) as e:
+                logger.warning(
+                    f"Ignoring unreadable company directory {self.path}: {e}"
+                )
+            self._loaded = True
+
+    def _merge(self, companies: Dict[str, list]) -> None:
+        """Merge ticker -> [cik, name] rows; built-in names are kept."""
+        for ticker, (cik, name) in companies.items():
+            builtin = BUILTIN_COMPANIES.get(ticker)
+            self._companies[ticker] = CompanyInfo(
+                ticker, cik, builtin[1] if builtin else name
+            )
+
+    def _persist(self, companies: Dict[str, list]) -> None:
+        """Atomically write the directory to disk."""
+        payload = {
+            "fetched_at": self._fetched_at,
+            "etag": self._etag,
+            "last_modified": self._last_modified,
+            "companies": companies,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f".{self.path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def _parse(data: Dict[str, dict]) -> Dict[str, list]:
+        """Convert SEC company_tickers.json to ticker -> [cik, name]."""
+        companies: Dict[str, list] = {}
+        for entry in data.values():
+            if not isinstance(entry, dict) or not entry.get("ticker"):
+                continue
+            ticker = str(entry["ticker"]).upper()
+            # First entry wins (SEC lists the primary share class first)
+            if ticker not in companies:
+                companies[ticker] = [
+                    str(entry.get("cik_str", "")).zfill(10),
+                    entry.get("title", ""),
+                ]
+        return companies
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Refresh the directory from SEC with a conditional GET.
+
+        Args:
+            force: Refresh even if the directory is not stale
+
+        Returns:
+            True if the directory is up to date after the call
+
+        Raises:
+            CompanyDirectoryError: If the download or parsing fails
+        """
+        self._ensure_loaded()
+        with self._lock:
+            if not force and not self.is_stale:
+                return True
+
+            headers = {}
+            if self._etag:
+                headers["If-None-Match"] = self._etag
+            if self._last_modified:
+                headers["If-Modified-Since"] = self._last_modified
+
+            logger.info("Refreshing SEC company directory")
+            try:
+                response = self.session.get(
+                    COMPANY_TICKERS_URL, headers=headers, timeout=30
+                )
+                if response.status_code == 304:
+                    self._fetched_at = time.time()
+                    companies = {t: [c.cik, c.name] for t, c in self._companies.items()}
+                    self._persist(companies)
+                    logger.debug("SEC company directory not modified")
+                    return True
+                response.raise_for_status()
+                companies = self._parse(response.json())
+            except (requests.exceptions.RequestException, ValueError) as e:
+                self._retry_after = time.time() + min(self.refresh_seconds, 300)
+                raise CompanyDirectoryError(
+                    f"Failed to refresh SEC company directory: {str(e)}"
+                ) from e
+
+            self._merge(companies)
+            self._fetched_at = time.time()
+            self._etag = response.headers.get("ETag")
+            self._last_modified = response.headers.get("Last-Modified")
+            try:
+                self._persist(companies)
+            except OSError as e:
+                logger.warning(f"Failed to persist company directory: {e}")
+            logger.info(f"SEC company directory refreshed: {len(companies)} tickers")
+            return True
+
+    def get(self, ticker: str) -> Optional[CompanyInfo]:
+        """
+        Look up a ticker without touching the network.
+
+        Args:
+            ticker: Stock ticker symbol (case-insensitive)
+
+        Returns:
+            CompanyInfo, or None if unknown
+        """
+        self._ensure_loaded()
+        return self._companies.get(ticker.upper())
+
+    def get_company_name(self, ticker: str) -> Optional[str]:
+        """Return the company name for a ticker (no network access)."""
+        info = self.get(ticker)
+        return info.name if info else None
+
+    def get_ciks(self, tickers: Iterable[str]) -> Dict[str, Optional[str]]:
+        """
+        Look up CIKs for many tickers.
+
+        If the directory is stale, it is refreshed once before the lookup,
+        whether or not the tickers are already known, so changed CIK
+        mappings are picked up. After a failed refresh, further attempts are
+        suppressed for a few minutes and the cached entries are used.
+
+        Args:
+            tickers: Stock ticker symbols (case-insensitive)
+
+        Returns:
+            Mapping of each input ticker to its zero-padded CIK (or None)
+        """
+        tickers = list(tickers)
+        self._ensure_loaded()
+        if self.is_stale and time.time() >= self._retry_after:
+            try:
+                self.refresh()
+            except CompanyDirectoryError as e:
+                logger.warning(str(e))
+
+        result: Dict[str, Optional[str]] = {}
+        for ticker in tickers:
+            info = self._companies.get(ticker.upper())
+            result[ticker] = info.cik if info else None
+        return result
+
+    def get_cik(self, ticker: str) -> Optional[str]:
+        """Look up the CIK for one ticker (see get_ciks)."""
+        return self.get_ciks([ticker])[ticker]
+
+
+_directory: Optional[SECCompanyDirectory] = None
+_directory_lock = threading.Lock()
+
+
+def get_company_directory() -> SECCompanyDirectory:
+    """Return the process-wide company directory."""
+    global _directory
+    with _directory_lock:
+        if _directory is None:
+            _directory = SECCompanyDirectory()
+        return _directory
+
+
+def reset_company_directory() -> None:
+    """Drop the process-wide company directory (used by tests)."""
+    global _directory
+    with _directory_lock:
+        _directory = None
@@ -8,36 +8,37 @@ for financial text including earnings calls, MD&A sections, and news articles.
 import re
 from typing import Any, Dict, List, Optional
 
+from app.utils.lazy_imports import is_available, lazy_attr, lazy_import
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-# Try to import optional dependencies
-try:
-    import torch
-    from transformers import AutoModelForSequenceClassification, AutoTokenizer
-
-    TRANSFORMERS_AVAILABLE = True
-except ImportError:
-    TRANSFORMERS_AVAILABLE = False
+# Optional dependencies are checked without importing them; torch/transformers
+# and textblob (nltk) are only loaded when an analyzer actually uses them.
+TRANSFORMERS_AVAILABLE = is_available("torch", "transformers")
+if TRANSFORMERS_AVAILABLE:
+    torch = lazy_import("torch")
+    AutoTokenizer = lazy_attr("transformers", "AutoTokenizer")
+    AutoModelForSequenceClassification = lazy_attr(
+        "transformers", "AutoModelForSequenceClassification"
+    )
+else:
     logger.warning("transformers library not available. FinBERT will be disabled.")
 
-try:
-    from textblob import TextBlob
-
-    TEXTBLOB_AVAILABLE = True
-except ImportError:
-    TEXTBLOB_AVAILABLE = False
+TEXTBLOB_AVAILABLE = is_available("textblob")
+if TEXTBLOB_AVAILABLE:
+    TextBlob = lazy_attr("textblob", "TextBlob")
+else:
     logger.warning(
         "textblob library not available. TextBlob sentiment will be disabled."
     )
 
-try:
-    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-
-    VADER_AVAILABLE = True
-except ImportError:
-    VADER_AVAILABLE = False
+VADER_AVAILABLE = is_available("vaderSentiment")
+if VADER_AVAILABLE:
+    SentimentIntensityAnalyzer = lazy_attr(
+        "vaderSentiment.vaderSentiment", "SentimentIntensityAnalyzer"
+    )
+else:
     logger.warning(
         "vaderSentiment library not available. VADER sentiment will be disabled."
     )
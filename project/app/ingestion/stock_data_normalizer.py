@@ -3,15 +3,23 @@ Stock data normalization module.
 
 Converts yfinance stock data into text format suitable for vector storage
 and RAG queries. Handles various data types and formats them consistently.
+
+Tabular data is formatted column-wise (one format pass per column, joined
+with vectorized string concatenation) rather than row by row, and price
+histories of many tickers are formatted in a single pass.
 """
 
 from datetime import datetime
-from typing import Any, Dict, List
-
-import pandas as pd
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
+from app.utils.lazy_imports import lazy_import
 from app.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+_pd = lazy_import("pandas")
+
 logger = get_logger(__name__)
 
 
@@ -21,6 +29,55 @@ class StockDataNormalizerError(Exception):
     pass
 
 
+def _format_dates(index: "pd.Index") -> "pd.Index":
+    """Format index values as YYYY-MM-DD where they are dates, else as str."""
+    if isinstance(index, _pd.DatetimeIndex):
+        # Wall-clock dates via numpy day precision (much faster than strftime)
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        return _pd.Index(index.to_numpy().astype("datetime64[D]").astype(str))
+    return index.map(
+        lambda value: (
+            value.strftime("%Y-%m-%d") if hasattr(value, "strftime") else str(value)
+        )
+    )
+
+
+def _format_values(values: "pd.Series", template: str) -> "pd.Series":
+    """
+    Format a column with a str.format template.
+
+    Numbers are formatted with the template; other values (e.g. strings in
+    an object column) are converted with str().
+    """
+    formatter = template.format
+    if _pd.api.types.is_numeric_dtype(values.dtype) and not (
+        _pd.api.types.is_bool_dtype(values.dtype)
+    ):
+        return values.map(formatter)
+    return values.map(
+        lambda value: (
+            formatter(value) if isinstance(value, (int, float)) else str(value)
+        )
+    )
+
+
+def _column_text(
+    frame: "pd.DataFrame", column: str, template: Optional[str] = None
+) -> "pd.Series":
+    """Return a formatted column, or "N/A" for every row if it is missing."""
+    if column not in frame.columns:
+        return _pd.Series("N/A", index=frame.index, dtype=object)
+    if template is None:
+        return frame[column].map(str)
+    return _format_values(frame[column], template)
+
+
+def _prefixed_lines(dates: "pd.Index", text: "pd.Series") -> List[str]:
+    """Build "  <date>: <text>" lines."""
+    return ("  " + _pd.Series(dates, index=text.index) + ": " + text).tolist()
+
+
 class StockDataNormalizer:
     """
     Normalizes stock data from yfinance into text format.
@@ -107,7 +164,7 @@ class StockDataNormalizer:
 
     @staticmethod
     def normalize_historical_prices(
-        history: pd.DataFrame, ticker_symbol: str, max_rows: int = 100
+        history: "pd.DataFrame", ticker_symbol: str, max_rows: int = 100
     ) -> str:
         """
         Normalize historical price DataFrame to text format.
@@ -122,49 +179,125 @@ class StockDataNormalizer:
         """
         if history.empty:
             return f"No historical price data available for {ticker_symbol}"
+        return StockDataNormalizer.normalize_historical_prices_batch(
+            {ticker_symbol: history}, max_rows=max_rows
+        )[ticker_symbol]
 
-        lines = [f"Historical Price Data for {ticker_symbol}"]
-        lines.append(f"Period: {history.index[0]} to {history.index[-1]}")
-        lines.append(f"Total Trading Days: {len(history)}")
-
-        # Summary Statistics
-        if "Close" in history.columns:
-            close_prices = history["Close"]
-            lines.append("\nPrice Summary:")
-            lines.append(f"  Current Price: ${close_prices.iloc[-1]:.2f}")
-            lines.append(f"  Highest Price: ${close_prices.max():.2f}")
-            lines.append(f"  Lowest Price: ${close_prices.min():.2f}")
-            lines.append(f"  Average Price: ${close_prices.mean():.2f}")
-
-        if "Volume" in history.columns:
-            volumes = history["Volume"]
-            lines.append("\nVolume Summary:")
-            lines.append(f"  Average Volume: {volumes.mean():,.0f}")
-            lines.append(f"  Highest Volume: {volumes.max():,.0f}")
-
-        # Recent Price Data (last N rows)
-        lines.append("\nRecent Price History:")
-        recent = history.tail(min(max_rows, len(history)))
-        for date, row in recent.iterrows():
-            date_str = (
-                date.strftime("%Y-%m-%d") if hasattr(date, "strftime") else str(date)
-            )
-            close = row.get("Close", "N/A")
-            volume = row.get("Volume", "N/A")
-            if isinstance(close, (int, float)):
-                close_str = f"${close:.2f}"
-            else:
-                close_str = str(close)
-            if isinstance(volume, (int, float)):
-                volume_str = f"{volume:,.0f}"
+    @staticmethod
+    def normalize_historical_prices_batch(
+        histories: Dict[str, "pd.DataFrame"], max_rows: int = 100
+    ) -> Dict[str, str]:
+        """
+        Normalize the price histories of many tickers in one pass.
+
+        Summary statistics are computed with one grouped aggregation over
+        all tickers, and the recent-history lines of all tickers are
+        formatted together, so the cost does not grow with per-row Python
+        work.
+
+        Args:
+            histories: Dictionary mapping ticker symbol to OHLCV DataFrame
+            max_rows: Maximum number of recent rows listed per ticker
+
+        Returns:
+            Dictionary mapping ticker symbol to formatted text (same text as
+            normalize_historical_prices)
+        """
+        texts: Dict[str, str] = {}
+        frames = {}
+        for ticker_symbol, history in histories.items():
+            if history.empty:
+                texts[ticker_symbol] = (
+                    f"No historical price data available for {ticker_symbol}"
+                )
             else:
-                volume_str = str(volume)
-            lines.append(f"  {date_str}: Close={close_str}, Volume={volume_str}")
+                frames[ticker_symbol] = history
+        if not frames:
+            return texts
+
+        tickers = list(frames)
+        stats: Dict[str, Dict[str, List[float]]] = {}
+        for column, aggregations in (
+            ("Close", ("last", "max", "min", "mean")),
+            ("Volume", ("mean", "max")),
+        ):
+            # Only tickers that have the column get its summary
+            present = [t for t in tickers if column in frames[t].columns]
+            if not present:
+                continue
+            values = _pd.concat(
+                [frames[t][column].reset_index(drop=True) for t in present],
+                keys=present,
+            )
+            grouped = values.groupby(level=0, sort=False)
+            stats[column] = {
+                name: (
+                    grouped.nth(-1) if name == "last" else grouped.agg(name)
+                ).tolist()
+                for name in aggregations
+            }
+            stats[column]["tickers"] = present
+
+        # Recent rows of all tickers, formatted column-wise in one pass
+        recent = _pd.concat(
+            [frames[t].tail(min(max_rows, len(frames[t]))) for t in tickers],
+            keys=tickers,
+        )
+        has_close = recent.index.get_level_values(0).isin(
+            stats.get("Close", {}).get("tickers", [])
+        )
+        has_volume = recent.index.get_level_values(0).isin(
+            stats.get("Volume", {}).get("tickers", [])
+        )
+        close = _column_text(recent, "Close", "${:.2f}").where(has_close, "N/A")
+        volume = _column_text(recent, "Volume", "{:,.0f}").where(has_volume, "N/A")
+        row_lines = _prefixed_lines(
+            _format_dates(recent.index.get_level_values(1)),
+            "Close=" + close + ", Volume=" + volume,
+        )
+        lengths = [min(max_rows, len(frames[t])) for t in tickers]
+
+        summaries: Dict[str, List[str]] = {t: [] for t in tickers}
+        close_stats = stats.get("Close")
+        if close_stats:
+            for i, ticker_symbol in enumerate(close_stats["tickers"]):
+                summaries[ticker_symbol].extend(
+                    [
+                        "\nPrice Summary:",
+                        f"  Current Price: ${close_stats['last'][i]:.2f}",
+                        f"  Highest Price: ${close_stats['max'][i]:.2f}",
+                        f"  Lowest Price: ${close_stats['min'][i]:.2f}",
+                        f"  Average Price: ${close_stats['mean'][i]:.2f}",
+                    ]
+                )
+        volume_stats = stats.get("Volume")
+        if volume_stats:
+            for i, ticker_symbol in enumerate(volume_stats["tickers"]):
+                summaries[ticker_symbol].extend(
+                    [
+                        "\nVolume Summary:",
+                        f"  Average Volume: {volume_stats['mean'][i]:,.0f}",
+                        f"  Highest Volume: {volume_stats['max'][i]:,.0f}",
+                    ]
+                )
 
-        return "\n".join(lines)
+        offset = 0
+        for ticker_symbol, length in zip(tickers, lengths):
+            history = frames[ticker_symbol]
+            lines = [
+                f"Historical Price Data for {ticker_symbol}",
+                f"Period: {history.index[0]} to {history.index[-1]}",
+                f"Total Trading Days: {len(history)}",
+                *summaries[ticker_symbol],
+                "\nRecent Price History:",
+                *row_lines[offset : offset + length],
+            ]
+            offset += length
+            texts[ticker_symbol] = "\n".join(lines)
+        return {t: texts[t] for t in histories}
 
     @staticmethod
-    def normalize_dividends(dividends: pd.Series, ticker_symbol: str) -> str:
+    def normalize_dividends(dividends: "pd.Series", ticker_symbol: str) -> str:
         """
         Normalize dividend Series to text format.
 
@@ -190,16 +323,13 @@ class StockDataNormalizer:
         # Recent dividends
         lines.append("\nRecent Dividend Payments:")
         recent = dividends.tail(min(20, len(dividends)))
-        for date, amount in recent.items():
-            date_str = (
-                date.strftime("%Y-%m-%d") if hasattr(date, "strftime") else str(date)
-            )
-            lines.append(f"  {date_str}: ${amount:.2f}")
+        amounts = _format_values(recent, "${:.2f}")
+        lines.extend(_prefixed_lines(_format_dates(recent.index), amounts))
 
         return "\n".join(lines)
 
     @staticmethod
-    def normalize_earnings(earnings: pd.DataFrame, ticker_symbol: str) -> str:
+    def normalize_earnings(earnings: "pd.DataFrame", ticker_symbol: str) -> str:
         """
         Normalize earnings DataFrame to text format.
 
@@ -215,29 +345,22 @@ class StockDataNormalizer:
 
         lines = [f"Earnings Data for {ticker_symbol}"]
 
-        # Format earnings data
-        for index, row in earnings.iterrows():
-            period = str(index)
-            if "Revenue" in earnings.columns:
-                revenue = row.get("Revenue", "N/A")
-                if isinstance(revenue, (int, float)):
-                    revenue_str = f"${revenue:,.0f}"
-                else:
-                    revenue_str = str(revenue)
-                lines.append(f"  {period}: Revenue={revenue_str}")
-            if "Earnings" in earnings.columns:
-                earnings_val = row.get("Earnings", "N/A")
-                if isinstance(earnings_val, (int, float)):
-                    earnings_str = f"${earnings_val:,.0f}"
-                else:
-                    earnings_str = str(earnings_val)
-                lines.append(f"  {period}: Earnings={earnings_str}")
+        # Format earnings data: per period, a Revenue line then an Earnings line
+        periods = earnings.index.map(str)
+        columns = [
+            _prefixed_lines(
+                periods, f"{column}=" + _column_text(earnings, column, "${:,.0f}")
+            )
+            for column in ("Revenue", "Earnings")
+            if column in earnings.columns
+        ]
+        lines.extend(line for period_lines in zip(*columns) for line in period_lines)
 
         return "\n".join(lines)
 
     @staticmethod
     def normalize_recommendations(
-        recommendations: pd.DataFrame, ticker_symbol: str
+        recommendations: "pd.DataFrame", ticker_symbol: str
     ) -> str:
         """
         Normalize recommendations DataFrame to text format.
@@ -265,23 +388,26 @@ class StockDataNormalizer:
         # Recent recommendations
         lines.append("\nRecent Recommendations:")
         recent = recommendations.tail(min(10, len(recommendations)))
-        for date, row in recent.iterrows():
-            date_str = (
-                date.strftime("%Y-%m-%d") if hasattr(date, "strftime") else str(date)
-            )
-            firm = row.get("Firm", "N/A")
-            to_grade = row.get("To Grade", "N/A")
-            from_grade = row.get("From Grade", "N/A")
-            action = row.get("Action", "N/A")
-            lines.append(
-                f"  {date_str}: {firm} - {action} from {from_grade} to {to_grade}"
+        lines.extend(
+            _prefixed_lines(
+                _format_dates(recent.index),
+                _column_text(recent, "Firm")
+                + " - "
+                + _column_text(recent, "Action")
+                + " from "
+                + _column_text(recent, "From Grade")
+                + " to "
+                + _column_text(recent, "To Grade"),
             )
+        )
 
         return "\n".join(lines)
 
     @staticmethod
     def normalize_all_data(
-        data: Dict[str, Any], ticker_symbol: str
+        data: Dict[str, Any],
+        ticker_symbol: str,
+        history_text: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         Normalize all stock data into a list of text documents.
@@ -289,6 +415,8 @@ class StockDataNormalizer:
         Args:
             data: Dictionary containing all fetched data (from fetch_all_data)
             ticker_symbol: Stock ticker symbol
+            history_text: Already normalized price history (optional; used by
+                normalize_batch)
 
         Returns:
             List of dictionaries, each containing:
@@ -324,9 +452,10 @@ class StockDataNormalizer:
         # Normalize historical prices
         if "history" in data and not data["history"].empty:
             try:
-                history_text = StockDataNormalizer.normalize_historical_prices(
-                    data["history"], ticker_symbol
-                )
+                if history_text is None:
+                    history_text = StockDataNormalizer.normalize_historical_prices(
+                        data["history"], ticker_symbol
+                    )
                 documents.append(
                     {
                         "text": history_text,
@@ -413,5 +542,48 @@ class StockDataNormalizer:
                     f"Failed to normalize recommendations for {ticker_symbol}: {str(e)}"
                 )
 
-        logger.info(f"Normalized {len(documents)} documents for {ticker_symbol}")
+        logger.debug(f"Normalized {len(documents)} documents for {ticker_symbol}")
+        return documents
+
+    @staticmethod
+    def normalize_batch(
+        data_by_ticker: Dict[str, Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Normalize the data of many tickers into one list of text documents.
+
+        Price histories of all tickers are normalized in one pass with
+        normalize_historical_prices_batch.
+
+        Args:
+            data_by_ticker: Dictionary mapping ticker symbol to its data
+                (from YFinanceFetcher.fetch_bulk_data)
+
+        Returns:
+            Documents of all tickers, in ticker order (see normalize_all_data)
+        """
+        histories = {
+            ticker_symbol: data["history"]
+            for ticker_symbol, data in data_by_ticker.items()
+            if "history" in data and not data["history"].empty
+        }
+        history_texts: Dict[str, str] = {}
+        try:
+            history_texts = StockDataNormalizer.normalize_historical_prices_batch(
+                histories
+            )
+        except Exception as e:
+            # Fall back to per-ticker normalization, which isolates failures
+            logger.warning(f"Batch history normalization failed: {str(e)}")
+
+        documents = []
+        for ticker_symbol, data in data_by_ticker.items():
+            documents.extend(
+                StockDataNormalizer.normalize_all_data(
+                    data, ticker_symbol, history_text=history_texts.get(ticker_symbol)
+                )
+            )
+        logger.info(
+            f"Normalized {len(documents)} documents for {len(data_by_ticker)} tickers"
+        )
         return documents
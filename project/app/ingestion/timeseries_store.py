@@ -0,0 +1,374 @@
+"""
+Local columnar store for economic and market time series.
+
+Each series is kept as one Parquet file per source, e.g.
+``data/timeseries/fred/UNRATE.parquet`` or
+``data/timeseries/yfinance/AAPL_1d.parquet``, next to a small JSON sidecar
+with series metadata and the range that has been synced. Fetchers request
+only observations from the last stored date onwards and merge them in, so
+daily refreshes transfer a few rows instead of full histories, while
+normalizers and analytics read the complete stored data.
+"""
+
+import json
+import os
+import re
+import threading
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, Union
+
+from app.utils.config import config
+from app.utils.lazy_imports import is_available, lazy_import
+from app.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+_pd = lazy_import("pandas")
+
+logger = get_logger(__name__)
+
+# Column used when a Series is stored as a single-column frame
+VALUE_COLUMN = "value"
+
+_UNSAFE_KEY_RE = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+class TimeSeriesStoreError(Exception):
+    """Custom exception for time-series store errors."""
+
+    pass
+
+
+def series_key(*parts: Any) -> str:
+    """
+    Build a file-safe series key from its identifying parts.
+
+    Args:
+        *parts: Identifying parts (series ID, interval, countries, ...);
+            None parts are skipped
+
+    Returns:
+        Key such as "AAPL_1d" or "NY.GDP.MKTP.CD_CHN-USA"
+    """
+    return "_".join(
+        _UNSAFE_KEY_RE.sub("-", str(part)).strip("-")
+        for part in parts
+        if part is not None
+    )
+
+
+def _as_frame(data: Union["pd.DataFrame", "pd.Series"]) -> "pd.DataFrame":
+    """Return data as a DataFrame with string column names."""
+    if isinstance(data, _pd.Series):
+        frame = data.to_frame(VALUE_COLUMN)
+    else:
+        frame = data.copy()
+    frame.columns = [str(column) for column in frame.columns]
+    return frame
+
+
+class TimeSeriesStore:
+    """
+    Parquet-backed store of date- or year-indexed series.
+
+    Values fetched later replace stored values for the same index, so
+    revised observations are picked up when they are re-fetched.
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        """
+        Initialize time-series store.
+
+        Args:
+            root: Root directory (default: config.timeseries_store_dir)
+
+        Raises:
+            TimeSeriesStoreError: If no Parquet engine is installed
+        """
+        if not is_available("pyarrow"):
+            raise TimeSeriesStoreError(
+                "pyarrow is required for the time-series store. "
+                "Install with: pip install pyarrow"
+            )
+        self.root = Path(root or config.timeseries_store_dir)
+        self._lock = threading.Lock()
+
+    def _paths(self, source: str, key: str) -> Tuple[Path, Path]:
+        """Return the (data, metadata) file paths of a series."""
+        directory = self.root / series_key(source)
+        name = series_key(key)
+        return directory / f"{name}.parquet", directory / f"{name}.json"
+
+    def read(
+        self,
+        source: str,
+        key: str,
+        start: Optional[Any] = None,
+        end: Optional[Any] = None,
+    ) -> Optional["pd.DataFrame"]:
+        """
+        Read a stored series.
+
+        Args:
+            source: Data source (e.g. "fred", "yfinance")
+            key: Series key within the source
+            start: First index value to include (optional)
+            end: Last index value to include (optional)
+
+        Returns:
+            DataFrame sorted by index, or None if the series is not stored
+
+        Raises:
+            TimeSeriesStoreError: If the file cannot be read
+        """
+        data_path, _ = self._paths(source, key)
+        if not data_path.exists():
+            return None
+        try:
+            data = _pd.read_parquet(data_path)
+        except Exception as e:
+            raise TimeSeriesStoreError(
+                f"Failed to read time series {source}/{key}: {str(e)}"
+            ) from e
+        return _slice(data, start, end)
+
+    def read_metadata(self, source: str, key: str) -> Dict[str, Any]:
+        """Return the stored metadata of a series ({} if none)."""
+        _, meta_path = self._paths(source, key)
+        try:
+            return json.loads(meta_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable metadata {meta_path}: {e}")
+            return {}
+
+    def last_index(self, source: str, key: str) -> Optional[Any]:
+        """Return the last stored index value (date or year), or None."""
+        data = self.read(source, key)
+        if data is None or data.empty:
+            return None
+        return data.index.max()
+
+    def merge(
+        self,
+        source: str,
+        key: str,
+        data: Union["pd.DataFrame", "pd.Series", None],
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Optional["pd.DataFrame"]:
+        """
+        Merge new observations into a stored series.
+
+        Args:
+            source: Data source
+            key: Series key within the source
+            data: New observations (may be None or empty)
+            metadata: Series metadata to store (replaces the stored entries
+                with the same keys)
+
+        Returns:
+            The full stored series after the merge (None if nothing stored)
+
+        Raises:
+            TimeSeriesStoreError: If the series cannot be written
+        """
+        data_path, meta_path = self._paths(source, key)
+        with self._lock:
+            stored = self.read(source, key)
+            if data is not None and len(data):
+                new = _as_frame(data)
+                if stored is None or stored.empty:
+                    merged = new
+                else:
+                    merged = new.combine_first(stored)
+                merged = merged[~merged.index.duplicated(keep="last")].sort_index()
+                try:
+                    data_path.parent.mkdir(parents=True, exist_ok=True)
+                    _atomic_write(data_path, lambda tmp: merged.to_parquet(tmp))
+                except Exception as e:
+                    raise TimeSeriesStoreError(
+                        f"Failed to write time series {source}/{key}: {str(e)}"
+                    ) from e
+                stored = merged
+            if metadata:
+                stored_meta = self.read_metadata(source, key)
+                stored_meta.update(metadata)
+                try:
+                    meta_path.parent.mkdir(parents=True, exist_ok=True)
+                    _atomic_write(
+                        meta_path,
+                        lambda tmp: tmp.write_text(
+                            json.dumps(stored_meta, default=str), encoding="utf-8"
+                        ),
+                    )
+                except OSError as e:
+                    raise TimeSeriesStoreError(
+                        f"Failed to write metadata for {source}/{key}: {str(e)}"
+                    ) from e
+        return stored
+
+    def plan_sync(
+        self,
+        source: str,
+        key: str,
+        start: Optional[Any] = None,
+        end: Optional[Any] = None,
+    ) -> Tuple[Optional[Any], bool, bool]:
+        """
+        Work out what sync() would request for a series.
+
+        Lets callers batch the requests of many series (e.g. one download
+        for all tickers that were last synced on the same day) and pass the
+        results to sync() afterwards.
+
+        Args:
+            source: Data source
+            key: Series key within the source
+            start: First index value the caller needs (None: full history)
+            end: Last index value the caller needs (None: up to the present)
+
+        Returns:
+            Tuple of (first index value to request: the last stored value if
+            the stored series covers start, else start; whether a request is
+            needed at all; whether the request resumes from the last stored
+            value)
+
+        Raises:
+            TimeSeriesStoreError: If the store cannot be read
+        """
+        stored_meta = self.read_metadata(source, key)
+        since = start
+        incremental = False
+        if "synced_from" in stored_meta:
+            synced_from = stored_meta["synced_from"]
+            covered = synced_from is None or (
+                start is not None and str(start) >= synced_from
+            )
+            last = self.last_index(source, key) if covered else None
+            if last is not None:
+                since = last
+                incremental = True
+        up_to_date = (
+            incremental
+            and end is not None
+            and since >= _coerce(end, _pd.Index([since]))
+        )
+        return since, not up_to_date, incremental
+
+    def sync(
+        self,
+        source: str,
+        key: str,
+        fetch: Callable[[Optional[Any]], Union["pd.DataFrame", "pd.Series", None]],
+        start: Optional[Any] = None,
+        end: Optional[Any] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional["pd.DataFrame"], int]:
+        """
+        Bring a stored series up to date with an incremental fetch.
+
+        If the stored series already covers the requested start, fetch is
+        called with the last stored index value, so only the latest
+        observation (which may have been revised) and newer ones are
+        transferred; if it also reaches end, nothing is fetched. Otherwise
+        fetch is called with start.
+
+        Args:
+            source: Data source
+            key: Series key within the source
+            fetch: Callable taking the first index value to request
+                (None for the full history) and returning new observations
+            start: First index value the caller needs (None: full history)
+            end: Last index value the caller needs (None: up to the present)
+            metadata: Series metadata to store
+
+        Returns:
+            Tuple of (full stored series, number of rows fetched)
+
+        Raises:
+            TimeSeriesStoreError: If the store cannot be read or written
+        """
+        stored_meta = self.read_metadata(source, key)
+        since, needed, incremental = self.plan_sync(source, key, start=start, end=end)
+
+        new = fetch(since) if needed else None
+        fetched = len(new) if new is not None else 0
+        logger.debug(
+            f"Synced {source}/{key}: {fetched} rows fetched "
+            f"({'from ' + str(since) if incremental else 'full range'})"
+        )
+
+        sync_meta = dict(metadata or {})
+        sync_meta["synced_at"] = datetime.now(timezone.utc).isoformat()
+        if not incremental:
+            # The stored range now starts at the earlier of both requests
+            # (None: full history)
+            previous = stored_meta.get("synced_from", str(start))
+            if start is None or previous is None:
+                sync_meta["synced_from"] = None
+            else:
+                sync_meta["synced_from"] = min(str(start), previous)
+        return self.merge(source, key, new, metadata=sync_meta), fetched
+
+
+def _slice(
+    data: "pd.DataFrame", start: Optional[Any], end: Optional[Any]
+) -> "pd.DataFrame":
+    """Return rows with start <= index <= end."""
+    if start is not None:
+        data = data[data.index >= _coerce(start, data.index)]
+    if end is not None:
+        data = data[data.index <= _coerce(end, data.index)]
+    return data
+
+
+def _coerce(value: Any, index: "pd.Index") -> Any:
+    """Convert a bound to the type of a (possibly tz-aware) datetime index."""
+    if isinstance(index, _pd.DatetimeIndex):
+        timestamp = _pd.Timestamp(value)
+        if index.tz is not None and timestamp.tz is None:
+            timestamp = timestamp.tz_localize(index.tz)
+        elif index.tz is None and timestamp.tz is not None:
+            timestamp = timestamp.tz_localize(None)
+        return timestamp
+    return value
+
+
+def _atomic_write(path: Path, write: Callable[[Path], Any]) -> None:
+    """Write a file via a temporary sibling and rename it into place."""
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+_store: Optional[TimeSeriesStore] = None
+_store_lock = threading.Lock()
+
+
+def get_timeseries_store() -> Optional[TimeSeriesStore]:
+    """
+    Return the process-wide time-series store.
+
+    Returns:
+        TimeSeriesStore, or None if the store is disabled or pyarrow is
+        not installed
+    """
+    global _store
+    if not config.timeseries_store_enabled:
+        return None
+    with _store_lock:
+        if _store is None or _store.root != Path(config.timeseries_store_dir):
+            try:
+                _store = TimeSeriesStore()
+            except TimeSeriesStoreError as e:
+                logger.warning(f"Time-series store unavailable: {str(e)}")
+                return None
+        return _store
@@ -8,7 +8,6 @@ This implementation uses legitimate APIs and public sources only.
 """
 
 import re
-import time
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
@@ -16,6 +15,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from app.utils.config import config
+from app.utils.http_client import create_http_session, delay_to_rate
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -72,7 +72,10 @@ class TranscriptFetcher:
             else config.transcript_use_web_scraping
         )
         self.api_key = api_key if api_key is not None else config.api_ninjas_api_key
-        self.session = requests.Session()
+        # Shared cached session; throttled per host on cache misses only
+        self.session = create_http_session(
+            requests_per_second=delay_to_rate(self.rate_limit_delay)
+        )
         self.session.headers.update(
             {
                 "User-Agent": (
@@ -108,7 +111,6 @@ class TranscriptFetcher:
             TranscriptFetcherError: If request fails
         """
         try:
-            time.sleep(self.rate_limit_delay)
             request_headers = self.session.headers.copy()
             if headers:
                 request_headers.update(headers)
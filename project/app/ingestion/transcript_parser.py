@@ -2,19 +2,44 @@
 Earnings call transcript parser.
 
 Parses earnings call transcripts to extract:
+- Speaker turns (offsets of each speaker's statements)
 - Speaker information and roles
 - Q&A sections
 - Management commentary
 - Forward guidance statements
 """
 
+import bisect
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
 
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Statements shorter than this are not kept as management commentary
+MIN_COMMENTARY_LENGTH = 50
+
+_SENTENCE_END_RE = re.compile(r"[.!?]+")
+_NUMBER_RE = re.compile(r"\$?[\d,]+\.?\d*")
+_TIMEFRAME_RE = re.compile(
+    r"(?:q[1-4]|quarter|year|fiscal|annual|monthly)", re.IGNORECASE
+)
+
+
+def _lowercase(text: str) -> str:
+    """
+    Lowercase text for case-insensitive matching with aligned offsets.
+
+    Matching lowercased text with case-sensitive patterns is much faster
+    than re.IGNORECASE on long transcripts.
+    """
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        # Some characters lowercase to several; keep offsets aligned
+        lowered = "".join(char.lower()[0] for char in text)
+    return lowered
+
 
 class TranscriptParserError(Exception):
     """Custom exception for transcript parser errors."""
@@ -22,6 +47,21 @@ class TranscriptParserError(Exception):
     pass
 
 
+class SpeakerTurn(NamedTuple):
+    """
+    One speaker turn: the span from a speaker label to the next label.
+
+    Offsets index into the transcript text, so transcript_text[start:end] is
+    the full turn (label included) and transcript_text[text_start:end] is
+    what the speaker said.
+    """
+
+    speaker: str
+    start: int
+    end: int
+    text_start: int
+
+
 class TranscriptParser:
     """
     Earnings call transcript parser.
@@ -96,38 +136,150 @@ class TranscriptParser:
             r"guidance\s+for)",
             re.IGNORECASE,
         )
+        # Case-sensitive variant for lowercased text
+        self.guidance_keyword_pattern = re.compile(
+            self.forward_guidance_pattern.pattern
+        )
+        # Analyst firms (group 1) and analyst cues (group 2) used to classify
+        # the speakers mentioned before them on the same line (matched at
+        # word starts, against lowercased text)
+        self.analyst_cue_pattern = re.compile(
+            rf"\b(?:({'|'.join(map(re.escape, self.ANALYST_COMPANIES))})"
+            r"|(analyst|question))"
+        )
 
-    def parse_speakers(self, transcript_text: str) -> List[Dict[str, Any]]:
+    def segment_turns(self, transcript_text: str) -> List[SpeakerTurn]:
         """
-        Parse and identify speakers from transcript.
+        Split a transcript into speaker turns in a single pass.
 
         Args:
             transcript_text: Raw transcript text
 
         Returns:
-            List of speaker dictionaries with name, role, and company
+            Speaker turns in transcript order; text before the first speaker
+            label is not part of any turn
         """
-        speakers = []
-        seen_speakers = set()
+        matches = list(self.speaker_pattern.finditer(transcript_text))
+        ends = [match.start() for match in matches[1:]] + [len(transcript_text)]
+        return [
+            SpeakerTurn(match.group(1).strip(), match.start(), end, match.end())
+            for match, end in zip(matches, ends)
+        ]
+
+    @staticmethod
+    def index_turns(turns: Iterable[SpeakerTurn]) -> Dict[str, List[SpeakerTurn]]:
+        """
+        Group speaker turns by speaker.
 
-        # Find all speaker mentions
-        matches = self.speaker_pattern.finditer(transcript_text)
-        for match in matches:
-            speaker_name = match.group(1).strip()
-            if speaker_name.lower() not in seen_speakers:
-                seen_speakers.add(speaker_name.lower())
+        Args:
+            turns: Speaker turns from segment_turns()
 
-                # Classify speaker role
-                role = self._classify_speaker_role(speaker_name, transcript_text)
-                company = self._extract_speaker_company(speaker_name, transcript_text)
+        Returns:
+            Dict mapping each speaker name (as first seen; names differing
+            only in case are merged) to their turns, in order of first turn
+        """
+        index: Dict[str, List[SpeakerTurn]] = {}
+        names: Dict[str, str] = {}
+        for turn in turns:
+            name = names.setdefault(turn.speaker.lower(), turn.speaker)
+            index.setdefault(name, []).append(turn)
+        return index
+
+    def _scan_analyst_cues(
+        self, speaker_names: Iterable[str], transcript_text: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Find analyst firms and cues following speaker mentions.
 
-                speakers.append(
-                    {
-                        "name": speaker_name,
-                        "role": role,
-                        "company": company,
-                    }
-                )
+        A speaker counts as an analyst if an analyst firm, "analyst" or
+        "question" follows a mention of their name on the same line (their
+        own label line, or e.g. the operator introducing them). The text is
+        scanned once for cues and only lines with a cue are searched for
+        names, instead of running one regex per speaker over the whole text.
+
+        Args:
+            speaker_names: Speaker names
+            transcript_text: Full transcript text
+
+        Returns:
+            Dict mapping lowercase speaker name to {"analyst": bool,
+            "company": first analyst firm mentioned after the name or None}
+        """
+        names = sorted({name.lower() for name in speaker_names}, key=len, reverse=True)
+        found: Dict[str, Dict[str, Any]] = {
+            name: {"analyst": False, "company": None} for name in names
+        }
+        if not names:
+            return found
+        name_pattern = re.compile("|".join(map(re.escape, names)))
+        text = _lowercase(transcript_text)
+
+        last_line = -1
+        for cue in self.analyst_cue_pattern.finditer(text):
+            line_start = text.rfind("\n", 0, cue.start()) + 1
+            if line_start == last_line:
+                # Every cue on a line is handled with its first one
+                continue
+            last_line = line_start
+            line_end = text.find("\n", cue.start())
+            if line_end == -1:
+                line_end = len(text)
+            line = text[line_start:line_end]
+            cues = [
+                (match.start(), match.group(1))
+                for match in self.analyst_cue_pattern.finditer(line)
+            ]
+            for mention in name_pattern.finditer(line):
+                entry = found[mention.group(0)]
+                following = [
+                    firm for position, firm in cues if position >= mention.end()
+                ]
+                if not following:
+                    continue
+                entry["analyst"] = True
+                if entry["company"] is None:
+                    firm = next((firm for firm in following if firm), None)
+                    if firm:
+                        entry["company"] = firm.title()
+        return found
+
+    def _role_from_name(self, speaker_name: str) -> Optional[str]:
+        """Return the role implied by the speaker label itself, if any."""
+        name_lower = speaker_name.lower()
+        if "operator" in name_lower:
+            return "operator"
+        if any(title in name_lower for title in self.MANAGEMENT_TITLES):
+            return "management"
+        return None
+
+    def parse_speakers(
+        self,
+        transcript_text: str,
+        turns: Optional[List[SpeakerTurn]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Parse and identify speakers from transcript.
+
+        Args:
+            transcript_text: Raw transcript text
+            turns: Speaker turns from segment_turns() (segmented if omitted)
+
+        Returns:
+            List of speaker dictionaries with name, role, and company
+        """
+        if turns is None:
+            turns = self.segment_turns(transcript_text)
+        index = self.index_turns(turns)
+        cues = self._scan_analyst_cues(index, transcript_text)
+
+        speakers = []
+        for name in index:
+            cue = cues[name.lower()]
+            role = self._role_from_name(name)
+            if role is None:
+                # Default to management (heuristic - could be improved with NLP)
+                role = "analyst" if cue["analyst"] else "management"
+            speakers.append({"name": name, "role": role, "company": cue["company"]})
 
         logger.debug(f"Identified {len(speakers)} unique speakers")
         return speakers
@@ -143,36 +295,11 @@ class TranscriptParser:
         Returns:
             Role classification string
         """
-        # Check for operator
-        if "operator" in speaker_name.lower():
-            return "operator"
-
-        # Check for management titles in context around speaker name
-        name_lower = speaker_name.lower()
-        for title in self.MANAGEMENT_TITLES:  # noqa: B007
-            if title in name_lower:
-                return "management"
-
-        # Check for analyst companies
-        # Look for speaker name followed by company name
-        pattern = re.compile(
-            rf"{re.escape(speaker_name)}.*?({'|'.join(self.ANALYST_COMPANIES)})",
-            re.IGNORECASE,
-        )
-        if pattern.search(transcript_text):
-            return "analyst"
-
-        # Check if speaker is mentioned with "analyst" or "question"
-        analyst_pattern = re.compile(
-            rf"{re.escape(speaker_name)}.*?(?:analyst|question)",
-            re.IGNORECASE,
-        )
-        if analyst_pattern.search(transcript_text):
-            return "analyst"
-
-        # Default to management if company context suggests it
-        # (This is a heuristic - could be improved with NLP)
-        return "management"
+        role = self._role_from_name(speaker_name)
+        if role is not None:
+            return role
+        cue = self._scan_analyst_cues([speaker_name], transcript_text)
+        return "analyst" if cue[speaker_name.lower()]["analyst"] else "management"
 
     def _extract_speaker_company(
         self, speaker_name: str, transcript_text: str
@@ -187,16 +314,8 @@ class TranscriptParser:
         Returns:
             Company name or None
         """
-        # Look for company name after speaker name
-        pattern = re.compile(
-            rf"{re.escape(speaker_name)}.*?((?:{'|'.join(self.ANALYST_COMPANIES)}))",
-            re.IGNORECASE,
-        )
-        match = pattern.search(transcript_text)
-        if match:
-            return match.group(1).title()
-
-        return None
+        cue = self._scan_analyst_cues([speaker_name], transcript_text)
+        return cue[speaker_name.lower()]["company"]
 
     def extract_qa_sections(self, transcript_text: str) -> List[Dict[str, Any]]:
         """
@@ -208,7 +327,7 @@ class TranscriptParser:
         Returns:
             List of Q&A section dictionaries
         """
-        qa_sections = []
+        qa_sections: List[Dict[str, Any]] = []
 
         # Find Q&A section markers
         qa_markers = self.qa_pattern.finditer(transcript_text)
@@ -243,8 +362,67 @@ class TranscriptParser:
         logger.debug(f"Extracted {len(qa_sections)} Q&A sections")
         return qa_sections
 
+    def extract_qa_from_turns(
+        self,
+        transcript_text: str,
+        turns: List[SpeakerTurn],
+        speakers: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Pair analyst questions with management answers from speaker turns.
+
+        Turns before the first Q&A marker (prepared remarks) are skipped if
+        the transcript has one. Each analyst turn is a question; the
+        management turns that follow it, up to the next analyst or operator
+        turn, form its answer.
+
+        Args:
+            transcript_text: Raw transcript text
+            turns: Speaker turns from segment_turns()
+            speakers: Speakers from parse_speakers()
+
+        Returns:
+            List of Q&A dictionaries (empty if no analyst spoke)
+        """
+        roles = {s["name"].lower(): s["role"] for s in speakers}
+        marker = self.qa_pattern.search(transcript_text)
+        qa_start = marker.start() if marker else 0
+
+        qa_sections: List[Dict[str, Any]] = []
+        answers: List[str] = []
+        for turn in turns:
+            if turn.end <= qa_start:
+                continue
+            role = roles.get(turn.speaker.lower())
+            statement = transcript_text[turn.text_start : turn.end].strip()
+            if role == "analyst":
+                if qa_sections:
+                    qa_sections[-1]["answer"] = "\n".join(answers)
+                answers = []
+                qa_sections.append(
+                    {
+                        "question_number": len(qa_sections) + 1,
+                        "question": statement,
+                        "answer": "",
+                        "analyst": turn.speaker,
+                    }
+                )
+            elif role == "management" and qa_sections:
+                answers.append(f"{turn.speaker}: {statement}")
+            elif role == "operator" and qa_sections:
+                qa_sections[-1]["answer"] = "\n".join(answers)
+                answers = []
+        if qa_sections and answers:
+            qa_sections[-1]["answer"] = "\n".join(answers)
+
+        logger.debug(f"Extracted {len(qa_sections)} Q&A pairs from speaker turns")
+        return qa_sections
+
     def extract_management_commentary(
-        self, transcript_text: str, speakers: List[Dict[str, Any]]
+        self,
+        transcript_text: str,
+        speakers: List[Dict[str, Any]],
+        turns: Optional[List[SpeakerTurn]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Extract management commentary sections.
@@ -252,39 +430,36 @@ class TranscriptParser:
         Args:
             transcript_text: Raw transcript text
             speakers: List of identified speakers
+            turns: Speaker turns from segment_turns() (segmented if omitted)
 
         Returns:
-            List of management commentary dictionaries
+            List of management commentary dictionaries, in transcript order
         """
-        commentary = []
+        commentary: List[Dict[str, Any]] = []
 
         # Get management speaker names
-        management_speakers = [s["name"] for s in speakers if s["role"] == "management"]
+        management_speakers = {
+            s["name"].lower() for s in speakers if s["role"] == "management"
+        }
 
         if not management_speakers:
             logger.debug("No management speakers identified")
             return commentary
 
-        # Extract statements by management speakers
-        for speaker in management_speakers:
-            # Find all statements by this speaker
-            pattern = re.compile(
-                rf"^{re.escape(speaker)}\s*[:-]\s*(.+?)"
-                rf"(?=^{re.escape(speaker)}|^[A-Z][a-z]+|$)",
-                re.MULTILINE | re.DOTALL,
-            )
-            matches = pattern.finditer(transcript_text)
-
-            for match in matches:
-                statement = match.group(1).strip()
-                if len(statement) > 50:  # Filter out very short statements
-                    commentary.append(
-                        {
-                            "speaker": speaker,
-                            "commentary": statement,
-                            "length": len(statement),
-                        }
-                    )
+        if turns is None:
+            turns = self.segment_turns(transcript_text)
+        for turn in turns:
+            if turn.speaker.lower() not in management_speakers:
+                continue
+            statement = transcript_text[turn.text_start : turn.end].strip()
+            if len(statement) > MIN_COMMENTARY_LENGTH:
+                commentary.append(
+                    {
+                        "speaker": turn.speaker,
+                        "commentary": statement,
+                        "length": len(statement),
+                    }
+                )
 
         logger.debug(f"Extracted {len(commentary)} management commentary sections")
         return commentary
@@ -301,25 +476,32 @@ class TranscriptParser:
         """
         guidance_statements = []
 
-        # Find sentences containing guidance keywords
-        sentences = re.split(r"[.!?]+", transcript_text)
-        for sentence in sentences:
-            if self.forward_guidance_pattern.search(sentence):
-                # Extract numbers and timeframes
-                numbers = re.findall(r"\$?[\d,]+\.?\d*", sentence)
-                timeframes = re.findall(
-                    r"(?:q[1-4]|quarter|year|fiscal|annual|monthly)",
-                    sentence,
-                    re.IGNORECASE,
-                )
-
-                guidance_statements.append(
-                    {
-                        "statement": sentence.strip(),
-                        "numbers": numbers,
-                        "timeframes": timeframes,
-                    }
-                )
+        # Find guidance keywords in one pass and take the sentences around
+        # them, instead of searching every sentence separately
+        text = _lowercase(transcript_text)
+        boundaries = list(_SENTENCE_END_RE.finditer(text))
+        boundary_starts = [match.start() for match in boundaries]
+        sentence_end = -1
+        for keyword in self.guidance_keyword_pattern.finditer(text):
+            if keyword.start() < sentence_end:
+                # Sentence already taken for an earlier keyword
+                continue
+            position = bisect.bisect_left(boundary_starts, keyword.start())
+            sentence_start = boundaries[position - 1].end() if position else 0
+            sentence_end = (
+                boundary_starts[position]
+                if position < len(boundaries)
+                else len(transcript_text)
+            )
+            sentence = transcript_text[sentence_start:sentence_end]
+            guidance_statements.append(
+                {
+                    "statement": sentence.strip(),
+                    # Extract numbers and timeframes
+                    "numbers": _NUMBER_RE.findall(sentence),
+                    "timeframes": _TIMEFRAME_RE.findall(sentence),
+                }
+            )
 
         logger.debug(
             f"Extracted {len(guidance_statements)} forward guidance statements"
@@ -348,21 +530,26 @@ class TranscriptParser:
                 f"Parsing transcript for {transcript_data.get('ticker', 'unknown')}"
             )
 
-            # Parse speakers
-            speakers = self.parse_speakers(transcript_text)
+            # Segment into speaker turns once; speakers, Q&A and commentary
+            # are derived from the turns
+            turns = self.segment_turns(transcript_text)
+            speakers = self.parse_speakers(transcript_text, turns=turns)
 
-            # Extract Q&A sections
-            qa_sections = self.extract_qa_sections(transcript_text)
+            # Extract Q&A sections (marker-based if no analyst turns)
+            qa_sections = self.extract_qa_from_turns(
+                transcript_text, turns, speakers
+            ) or self.extract_qa_sections(transcript_text)
 
             # Extract management commentary
             management_commentary = self.extract_management_commentary(
-                transcript_text, speakers
+                transcript_text, speakers, turns=turns
             )
 
             # Extract forward guidance
             forward_guidance = self.extract_forward_guidance(transcript_text)
 
             # Build parsed transcript structure
+            roles = {s["name"].lower(): s["role"] for s in speakers}
             parsed_transcript = {
                 "ticker": transcript_data.get("ticker"),
                 "date": transcript_data.get("date"),
@@ -375,6 +562,15 @@ class TranscriptParser:
                 "management_commentary": management_commentary,
                 "forward_guidance": forward_guidance,
                 "transcript_text": transcript_text,
+                "turns": [
+                    {
+                        "speaker": turn.speaker,
+                        "role": roles[turn.speaker.lower()],
+                        "start": turn.start,
+                        "end": turn.end,
+                    }
+                    for turn in turns
+                ],
                 "metadata": {
                     "total_speakers": len(speakers),
                     "management_speakers": len(
@@ -387,6 +583,7 @@ class TranscriptParser:
                     "commentary_count": len(management_commentary),
                     "guidance_count": len(forward_guidance),
                     "transcript_length": len(transcript_text),
+                    "turn_count": len(turns),
                 },
             }
 
@@ -6,17 +6,47 @@ inflation, unemployment, trade balance, and other indicators for 188+ countries.
 """
 
 import time
-from typing import Any, Dict, List, Optional
-
-import pandas as pd
-import world_bank_data as wb
-
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.ingestion.timeseries_store import (
+    TimeSeriesStore,
+    TimeSeriesStoreError,
+    get_timeseries_store,
+    series_key,
+)
 from app.utils.config import config
+from app.utils.lazy_imports import lazy_import
 from app.utils.logger import get_logger
 
+pd = lazy_import("pandas")
+wb = lazy_import("world_bank_data")
+
 logger = get_logger(__name__)
 
 
+def _to_year_frame(data: Any) -> Any:
+    """
+    Reshape a world_bank_data series into a year x country DataFrame.
+
+    get_series returns a Series indexed by (Country, Series, Year); the
+    formatter and the time-series store expect years as rows and countries
+    as columns. DataFrames are returned unchanged.
+    """
+    if not isinstance(data, pd.Series) or not isinstance(data.index, pd.MultiIndex):
+        return data
+    names = list(data.index.names)
+    if "Year" not in names or "Country" not in names:
+        return data
+    frame = data.rename("value").reset_index()
+    frame["Year"] = pd.to_numeric(frame["Year"], errors="coerce")
+    frame = frame.dropna(subset=["Year"])
+    frame["Year"] = frame["Year"].astype(int)
+    return frame.pivot_table(
+        index="Year", columns="Country", values="value", aggfunc="first"
+    ).rename_axis(index=None, columns=None)
+
+
 class WorldBankFetcherError(Exception):
     """Custom exception for World Bank fetcher errors."""
 
@@ -35,18 +65,22 @@ class WorldBankFetcher:
     def __init__(
         self,
         rate_limit_delay: Optional[float] = None,
+        timeseries_store: Optional[TimeSeriesStore] = None,
     ):
         """
         Initialize World Bank fetcher.
 
         Args:
             rate_limit_delay: Delay between requests in seconds (default: from config)
+            timeseries_store: Local store that indicators are synced into
+                (default: shared store, None if disabled)
         """
         self.rate_limit_delay = (
             rate_limit_delay
             if rate_limit_delay is not None
             else config.world_bank_rate_limit_seconds
         )
+        self.timeseries_store = timeseries_store or get_timeseries_store()
 
         try:
             # Test API access by fetching countries list
@@ -73,6 +107,10 @@ class WorldBankFetcher:
         """
         Fetch indicator data by indicator code.
 
+        With the time-series store enabled, only years from the last stored
+        year onwards are requested and merged into the store, and the
+        returned data is read from the store.
+
         Args:
             indicator_code: World Bank indicator code (e.g., 'NY.GDP.MKTP.CD' for GDP)
             country_codes: List of country ISO codes (e.g., ['USA', 'CHN'], optional)
@@ -87,15 +125,18 @@ class WorldBankFetcher:
         """
         logger.info(f"Fetching World Bank indicator: {indicator_code}")
         try:
-            self._apply_rate_limit()
-
-            # Fetch indicator data
-            if country_codes:
-                # Fetch for specific countries
-                data = wb.get_series(indicator_code, country=country_codes)
-            else:
-                # Fetch for all countries
-                data = wb.get_series(indicator_code)
+            synced = False
+            metadata = None
+            if self.timeseries_store is not None:
+                try:
+                    data, metadata = self._sync_indicator(
+                        indicator_code, country_codes, start_year, end_year
+                    )
+                    synced = True
+                except TimeSeriesStoreError as e:
+                    logger.warning(f"Time-series store not used: {str(e)}")
+            if not synced:
+                data = self._download_indicator(indicator_code, country_codes)
 
             if data is None or (isinstance(data, pd.DataFrame) and data.empty):
                 logger.warning(f"No data returned for indicator {indicator_code}")
@@ -115,25 +156,8 @@ class WorldBankFetcher:
                         data = data[data.index <= end_year]
 
             # Fetch indicator metadata
-            self._apply_rate_limit()
-            try:
-                indicators = wb.get_indicators(indicator_code)
-                if indicators is not None and not indicators.empty:
-                    indicator_info = indicators.iloc[0].to_dict()
-                    metadata = {
-                        "name": indicator_info.get("name", ""),
-                        "source": indicator_info.get("source", ""),
-                        "topic": indicator_info.get("topic", ""),
-                        "unit": indicator_info.get("unit", ""),
-                        "note": indicator_info.get("note", ""),
-                    }
-                else:
-                    metadata = {}
-            except Exception as e:
-                logger.warning(
-                    f"Failed to fetch indicator info for {indicator_code}: {str(e)}"
-                )
-                metadata = {}
+            if metadata is None:
+                metadata = self._fetch_indicator_info(indicator_code)
 
             # Get data shape info
             if isinstance(data, pd.DataFrame):
@@ -164,6 +188,87 @@ class WorldBankFetcher:
                 f"Error fetching World Bank indicator {indicator_code}: {str(e)}"
             ) from e
 
+    def _download_indicator(
+        self,
+        indicator_code: str,
+        country_codes: Optional[List[str]],
+        start_year: Optional[int] = None,
+        end_year: Optional[int] = None,
+    ) -> Any:
+        """Request indicator data from the World Bank API."""
+        self._apply_rate_limit()
+        kwargs: Dict[str, Any] = {}
+        if country_codes:
+            # Fetch for specific countries (default: all countries)
+            kwargs["country"] = country_codes
+        if start_year is not None:
+            kwargs["date"] = f"{start_year}:{end_year or datetime.now().year}"
+        return _to_year_frame(wb.get_series(indicator_code, **kwargs))
+
+    def _sync_indicator(
+        self,
+        indicator_code: str,
+        country_codes: Optional[List[str]],
+        start_year: Optional[int],
+        end_year: Optional[int],
+    ) -> Tuple[Any, Optional[Dict[str, Any]]]:
+        """
+        Sync an indicator into the time-series store and read it back.
+
+        Returns:
+            Tuple of (stored year x country data, indicator info or None if
+            it still has to be fetched)
+        """
+        store = self.timeseries_store
+        if store is None:
+            raise WorldBankFetcherError("Time-series store is disabled")
+        key = series_key(
+            indicator_code, "-".join(sorted(country_codes)) if country_codes else "all"
+        )
+        _, fetched = store.sync(
+            "world_bank",
+            key,
+            lambda since: self._download_indicator(
+                indicator_code,
+                country_codes,
+                int(since) if since is not None else None,
+                end_year,
+            ),
+            start=start_year,
+            end=end_year,
+        )
+        stored = store.read("world_bank", key, start=start_year, end=end_year)
+        if stored is None or stored.empty:
+            return None, None
+
+        info = store.read_metadata("world_bank", key).get("indicator_info")
+        if info is None or fetched:
+            info = self._fetch_indicator_info(indicator_code)
+            if info:
+                store.merge("world_bank", key, None, metadata={"indicator_info": info})
+        return stored, info
+
+    def _fetch_indicator_info(self, indicator_code: str) -> Dict[str, Any]:
+        """Fetch indicator metadata ({} on failure)."""
+        self._apply_rate_limit()
+        try:
+            indicators = wb.get_indicators(indicator_code)
+            if indicators is None or indicators.empty:
+                return {}
+            indicator_info = indicators.iloc[0].to_dict()
+            return {
+                "name": indicator_info.get("name", ""),
+                "source": indicator_info.get("source", ""),
+                "topic": indicator_info.get("topic", ""),
+                "unit": indicator_info.get("unit", ""),
+                "note": indicator_info.get("note", ""),
+            }
+        except Exception as e:
+            logger.warning(
+                f"Failed to fetch indicator info for {indicator_code}: {str(e)}"
+            )
+            return {}
+
     def fetch_multiple_indicators(
         self,
         indicator_codes: List[str],
@@ -0,0 +1,256 @@
+"""
+Local store of numeric XBRL facts.
+
+Facts streamed out of XBRL instances during EDGAR ingestion are kept in a
+columnar SQLite table of (cik, ticker, concept, period, unit, value,
+accession), so exact figures such as "Apple revenue 2023" can be looked up
+directly instead of being flattened into text chunks and retrieved through
+the vector store.
+"""
+
+import sqlite3
+import threading
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+
+from app.ingestion.xbrl_parser import XBRLFact
+from app.utils.config import config
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Period filters for lookups
+PERIOD_INSTANT = "instant"
+PERIOD_ANNUAL = "annual"
+PERIOD_QUARTERLY = "quarterly"
+
+# Duration ranges (days) accepted for annual and quarterly periods; fiscal
+# years ending on a weekday vary between 52 and 53 weeks
+_PERIOD_DAYS = {
+    PERIOD_ANNUAL: (350, 380),
+    PERIOD_QUARTERLY: (80, 100),
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS facts (
+    cik TEXT NOT NULL,
+    ticker TEXT NOT NULL,
+    concept TEXT NOT NULL,
+    period_start TEXT NOT NULL,
+    period_end TEXT NOT NULL,
+    duration_days INTEGER NOT NULL,
+    unit TEXT NOT NULL,
+    value REAL NOT NULL,
+    accession TEXT NOT NULL,
+    form_type TEXT NOT NULL DEFAULT '',
+    filing_date TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (cik, concept, period_start, period_end, unit, accession)
+);
+CREATE INDEX IF NOT EXISTS idx_facts_lookup ON facts (ticker, concept, period_end);
+"""
+
+
+class XBRLFactStoreError(Exception):
+    """Custom exception for XBRL fact store errors."""
+
+    pass
+
+
+def _duration_days(start: Optional[str], end: str) -> int:
+    """Return the length of a period in days (0 for instants)."""
+    if not start:
+        return 0
+    try:
+        return (date.fromisoformat(end[:10]) - date.fromisoformat(start[:10])).days
+    except ValueError:
+        return 0
+
+
+class XBRLFactStore:
+    """
+    SQLite-backed store of numeric XBRL facts.
+
+    Instant facts (balance sheet items) are stored with an empty
+    period_start. Re-ingesting a filing replaces its facts, and amended
+    filings are kept alongside the originals; lookups prefer the most
+    recently filed value for a period.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Initialize fact store.
+
+        Args:
+            db_path: Path to SQLite database file (default: from config)
+
+        Raises:
+            XBRLFactStoreError: If the store cannot be opened
+        """
+        self.db_path = Path(db_path or config.xbrl_fact_store_path)
+        self._lock = threading.Lock()
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                str(self.db_path), check_same_thread=False, isolation_level=None
+            )
+            self._conn.row_factory = sqlite3.Row
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+        except sqlite3.Error as e:
+            raise XBRLFactStoreError(
+                f"Failed to open XBRL fact store {self.db_path}: {str(e)}"
+            ) from e
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def add_facts(
+        self,
+        facts: Iterable[XBRLFact],
+        cik: str,
+        ticker: str,
+        accession: str,
+        form_type: str = "",
+        filing_date: str = "",
+    ) -> int:
+        """
+        Store the facts of one filing.
+
+        Args:
+            facts: Numeric facts from the filing's XBRL instance
+            cik: Company CIK
+            ticker: Stock ticker symbol
+            accession: Filing accession number
+            form_type: Filing form type (e.g. "10-K")
+            filing_date: Filing date (YYYY-MM-DD)
+
+        Returns:
+            Number of facts written
+
+        Raises:
+            XBRLFactStoreError: If the facts cannot be written
+        """
+        rows = [
+            (
+                cik,
+                ticker.upper(),
+                fact.concept,
+                fact.period_start or "",
+                fact.period_end,
+                _duration_days(fact.period_start, fact.period_end),
+                fact.unit,
+                fact.value,
+                accession,
+                form_type,
+                filing_date,
+            )
+            for fact in facts
+        ]
+        if not rows:
+            return 0
+        try:
+            with self._lock:
+                self._conn.execute("BEGIN")
+                try:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO facts (cik, ticker, concept, "
+                        "period_start, period_end, duration_days, unit, value, "
+                        "accession, form_type, filing_date) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        rows,
+                    )
+                    self._conn.execute("COMMIT")
+                except BaseException:
+                    self._conn.execute("ROLLBACK")
+                    raise
+        except sqlite3.Error as e:
+            raise XBRLFactStoreError(f"Failed to store XBRL facts: {str(e)}") from e
+        logger.debug(f"Stored {len(rows)} XBRL facts for {ticker} ({accession})")
+        return len(rows)
+
+    def get_facts(
+        self,
+        ticker: str,
+        concepts: Sequence[str],
+        period: Optional[str] = None,
+        year: Optional[int] = None,
+        limit: int = 10,
+    ) -> List[Dict[str, Any]]:
+        """
+        Look up facts for a company, one value per period.
+
+        Concepts are tried in order and the first concept with any matching
+        fact is used, so callers can list preferred tags before fallbacks
+        (e.g. "Revenues" before "SalesRevenueNet").
+
+        Args:
+            ticker: Stock ticker symbol (case-insensitive)
+            concepts: Concept local names in order of preference
+            period: PERIOD_INSTANT, PERIOD_ANNUAL, PERIOD_QUARTERLY or None (any)
+            year: Only periods ending in this calendar year
+            limit: Maximum number of periods returned
+
+        Returns:
+            Fact dicts, most recent period first; for each period the value
+            from the most recent filing wins
+
+        Raises:
+            XBRLFactStoreError: If the lookup fails
+        """
+        clauses = ["ticker = ?", "concept = ?"]
+        params: List[Any] = [ticker.upper()]
+        if period == PERIOD_INSTANT:
+            clauses.append("duration_days = 0")
+        elif period in _PERIOD_DAYS:
+            clauses.append("duration_days BETWEEN ? AND ?")
+            params.extend(_PERIOD_DAYS[period])
+        if year is not None:
+            clauses.append("period_end LIKE ?")
+            params.append(f"{int(year)}-%")
+
+        query = (
+            "SELECT * FROM facts WHERE "
+            + " AND ".join(clauses)
+            + " ORDER BY period_end DESC, duration_days DESC, filing_date DESC"
+        )
+        try:
+            with self._lock:
+                for concept in concepts:
+                    rows = self._conn.execute(
+                        query, [params[0], concept, *params[1:]]
+                    ).fetchall()
+                    if rows:
+                        return self._latest_per_period(rows, limit)
+        except sqlite3.Error as e:
+            raise XBRLFactStoreError(f"Failed to query XBRL facts: {str(e)}") from e
+        return []
+
+    @staticmethod
+    def _latest_per_period(rows: List[sqlite3.Row], limit: int) -> List[Dict]:
+        """Keep the first (most recently filed) row for each period and unit."""
+        seen: Set[tuple] = set()
+        facts: List[Dict[str, Any]] = []
+        for row in rows:
+            key = (row["period_start"], row["period_end"], row["unit"])
+            if key in seen:
+                continue
+            seen.add(key)
+            facts.append(dict(row))
+            if len(facts) >= limit:
+                break
+        return facts
+
+    def tickers(self) -> Set[str]:
+        """Return the tickers that have stored facts."""
+        with self._lock:
+            rows = self._conn.execute("SELECT DISTINCT ticker FROM facts").fetchall()
+        return {row["ticker"] for row in rows}
+
+    def count(self) -> int:
+        """Return the number of stored facts."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM facts").fetchone()[0]
@@ -7,20 +7,22 @@ income statement, and cash flow statement data.
 
 import io
 import zipfile
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
 from zipfile import ZipFile
 
+from lxml import etree
+
+from app.utils.lazy_imports import is_available, lazy_import
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-# Try to import arelle - make it optional for graceful degradation
-try:
-    from arelle import Cntlr, ModelManager
-
-    ARELLE_AVAILABLE = True
-except ImportError:
-    ARELLE_AVAILABLE = False
+# Arelle is optional and slow to import; check for it without loading it
+ARELLE_AVAILABLE = is_available("arelle")
+if ARELLE_AVAILABLE:
+    Cntlr = lazy_import("arelle.Cntlr")
+    ModelManager = lazy_import("arelle.ModelManager")
+else:
     logger.warning(
         "Arelle library not available. XBRL parsing will be limited. "
         "Install with: pip install arelle"
@@ -33,6 +35,146 @@ class XBRLParserError(Exception):
     pass
 
 
+class XBRLFact(NamedTuple):
+    """A numeric fact from an XBRL instance (non-dimensional contexts only)."""
+
+    concept: str
+    value: float
+    unit: str
+    period_start: Optional[str]  # None for instant facts
+    period_end: str
+
+
+# Linkbase/schema members of XBRL archives that are not instance documents
+_NON_INSTANCE_SUFFIXES = ("_cal.xml", "_def.xml", "_lab.xml", "_pre.xml", ".xsd")
+
+
+def _local_name(tag: Any) -> str:
+    """Return the local part of a (possibly namespaced) element tag."""
+    if not isinstance(tag, str):
+        return ""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _read_instance(xbrl_content: bytes) -> bytes:
+    """Return the XBRL instance document from raw content or a zip archive."""
+    if xbrl_content[:2] != b"PK":  # ZIP file signature
+        return xbrl_content
+    try:
+        with ZipFile(io.BytesIO(xbrl_content)) as zip_file:
+            names = zip_file.namelist()
+            instances = [n for n in names if n.endswith(".xbrl")] or [
+                n
+                for n in names
+                if n.endswith(".xml") and not n.endswith(_NON_INSTANCE_SUFFIXES)
+            ]
+            if not instances:
+                raise XBRLParserError("No XBRL instance found in archive")
+            return zip_file.read(instances[0])
+    except zipfile.BadZipFile as e:
+        raise XBRLParserError(f"Invalid zip file: {str(e)}") from e
+
+
+def iter_xbrl_facts(xbrl_content: bytes) -> Iterator[XBRLFact]:
+    """
+    Stream numeric facts out of an XBRL instance.
+
+    Parses the instance with lxml's iterparse in one pass, releasing each
+    top-level element once it has been read, instead of loading a full
+    taxonomy-aware model. Facts with dimensional contexts (segments or
+    scenarios) are skipped so that only consolidated values remain.
+
+    Args:
+        xbrl_content: XBRL instance (.xbrl/.xml) or zip archive containing one
+
+    Yields:
+        XBRLFact for every numeric, non-nil, non-dimensional fact
+
+    Raises:
+        XBRLParserError: If the content is not a parseable XBRL instance
+    """
+    instance = _read_instance(xbrl_content)
+    contexts: Dict[str, Optional[Tuple[Optional[str], str]]] = {}
+    units: Dict[str, str] = {}
+    raw_facts: List[Tuple[str, str, str, str]] = []
+
+    try:
+        for _, element in etree.iterparse(
+            io.BytesIO(instance), events=("end",), huge_tree=True
+        ):
+            parent = element.getparent()
+            # Only top-level children of <xbrl> are contexts, units and facts
+            if parent is None or parent.getparent() is not None:
+                continue
+            name = _local_name(element.tag)
+            if name == "context":
+                contexts[element.get("id", "")] = _read_period(element)
+            elif name == "unit":
+                units[element.get("id", "")] = _read_unit(element)
+            elif element.get("unitRef") is not None and element.get("contextRef"):
+                nil = element.get("{http://www.w3.org/2001/XMLSchema-instance}nil")
+                if nil != "true" and element.text and element.text.strip():
+                    raw_facts.append(
+                        (
+                            name,
+                            element.get("contextRef"),
+                            element.get("unitRef"),
+                            element.text.strip(),
+                        )
+                    )
+            element.clear()
+            while element.getprevious() is not None:
+                del parent[0]
+    except etree.XMLSyntaxError as e:
+        raise XBRLParserError(f"Invalid XBRL instance: {str(e)}") from e
+
+    # Contexts and units may follow the facts that reference them
+    for concept, context_ref, unit_ref, text in raw_facts:
+        period = contexts.get(context_ref)
+        if period is None:
+            continue
+        try:
+            value = float(text)
+        except ValueError:
+            continue
+        yield XBRLFact(
+            concept=concept,
+            value=value,
+            unit=units.get(unit_ref, unit_ref),
+            period_start=period[0],
+            period_end=period[1],
+        )
+
+
+def _read_period(context: Any) -> Optional[Tuple[Optional[str], str]]:
+    """Return (start, end) of a context, or None if it is dimensional."""
+    start = end = None
+    for child in context.iter():
+        name = _local_name(child.tag)
+        if name in ("segment", "scenario"):
+            return None
+        if name == "instant" or name == "endDate":
+            end = (child.text or "").strip()
+        elif name == "startDate":
+            start = (child.text or "").strip()
+    return (start, end) if end else None
+
+
+def _read_unit(unit: Any) -> str:
+    """Return a unit as e.g. "USD" or "USD/shares"."""
+    numerator: List[str] = []
+    denominator: List[str] = []
+    target = numerator
+    for child in unit.iter():
+        name = _local_name(child.tag)
+        if name == "unitDenominator":
+            target = denominator
+        elif name == "measure" and child.text:
+            target.append(child.text.strip().rsplit(":", 1)[-1])
+    unit_name = "*".join(numerator)
+    return f"{unit_name}/{'*'.join(denominator)}" if denominator else unit_name
+
+
 class XBRLParser:
     """
     Parser for XBRL financial statements.
@@ -99,6 +241,25 @@ class XBRLParser:
                     f"Fallback also failed: {str(fallback_error)}"
                 ) from fallback_error
 
+    def extract_facts(self, xbrl_content: bytes) -> List[XBRLFact]:
+        """
+        Extract numeric facts with the streaming instance parser.
+
+        Does not require Arelle.
+
+        Args:
+            xbrl_content: XBRL file content (bytes) - .xbrl/.xml file or .zip archive
+
+        Returns:
+            List of XBRLFact
+
+        Raises:
+            XBRLParserError: If the content is not a parseable XBRL instance
+        """
+        facts = list(iter_xbrl_facts(xbrl_content))
+        self.logger.debug(f"Extracted {len(facts)} numeric XBRL facts")
+        return facts
+
     def _parse_with_arelle(
         self, xbrl_content: bytes, metadata: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
@@ -5,17 +5,78 @@ Fetches stock market data and financial metrics from Yahoo Finance using yfinanc
 Supports rate limiting and error handling for robust data fetching.
 """
 
+import re
 import time
-from typing import Any, Dict, Optional
-
-import pandas as pd
-import yfinance as yf
-
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from app.ingestion.timeseries_store import (
+    TimeSeriesStore,
+    TimeSeriesStoreError,
+    get_timeseries_store,
+    series_key,
+)
 from app.utils.config import config
+from app.utils.lazy_imports import lazy_import
 from app.utils.logger import get_logger
+from app.utils.rate_limiter import get_rate_limiter
+from app.utils.tracing import map_in_context
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+_pd = lazy_import("pandas")
+yf = lazy_import("yfinance")
 
 logger = get_logger(__name__)
 
+# Intervals kept in the time-series store; intraday bars are only available
+# for recent days and are always fetched directly
+STORED_INTERVALS = frozenset({"1d", "5d", "1wk", "1mo", "3mo"})
+
+_PERIOD_RE = re.compile(r"^(\d+)(d|mo|y)$")
+_PERIOD_UNITS = {"d": "days", "mo": "months", "y": "years"}
+
+
+def _period_start(period: str) -> Optional[str]:
+    """
+    Return the first date (YYYY-MM-DD) covered by a yfinance period.
+
+    Args:
+        period: yfinance period (e.g. "5d", "6mo", "1y", "ytd", "max")
+
+    Returns:
+        Start date, or None for the full history ("max" or unknown periods)
+    """
+    today = _pd.Timestamp(datetime.now().date())
+    if period == "ytd":
+        return f"{today.year}-01-01"
+    match = _PERIOD_RE.match(period or "")
+    if not match:
+        return None
+    offset = _pd.DateOffset(**{_PERIOD_UNITS[match.group(2)]: int(match.group(1))})
+    return (today - offset).strftime("%Y-%m-%d")
+
+
+def _downloaded_bars(
+    history: Optional["pd.DataFrame"],
+) -> Callable[[Optional[Any]], Optional["pd.DataFrame"]]:
+    """
+    Return a store fetch callable that yields bars downloaded in advance.
+
+    Args:
+        history: Bars already downloaded for the series (None if up to date)
+
+    Returns:
+        Fetch callable for TimeSeriesStore.sync that ignores its start
+    """
+
+    def fetch(_since: Optional[Any]) -> Optional["pd.DataFrame"]:
+        return history
+
+    return fetch
+
 
 class YFinanceFetcherError(Exception):
     """Custom exception for yfinance fetching errors."""
@@ -35,19 +96,42 @@ class YFinanceFetcher:
     - Earnings data
     - Analyst recommendations
     - Company information
+
+    Single-ticker methods are spaced by rate_limit_seconds. The bulk methods
+    (fetch_bulk_history, fetch_bulk_data) download price histories for many
+    tickers per request and fetch the remaining per-ticker data on a thread
+    pool that shares one token-bucket limiter.
     """
 
-    def __init__(self, rate_limit_seconds: Optional[float] = None):
+    # Key of the process-wide limiter shared by bulk requests
+    RATE_LIMITER_KEY = "finance.yahoo.com"
+
+    def __init__(
+        self,
+        rate_limit_seconds: Optional[float] = None,
+        timeseries_store: Optional[TimeSeriesStore] = None,
+        max_workers: Optional[int] = None,
+    ):
         """
         Initialize yfinance fetcher.
 
         Args:
             rate_limit_seconds: Rate limit between API calls in seconds.
                 If None, uses config.yfinance_rate_limit_seconds
+            timeseries_store: Local store that daily and longer price
+                histories are synced into (default: shared store, None if
+                disabled)
+            max_workers: Concurrent threads for per-ticker data in bulk
+                fetches. If None, uses config.yfinance_max_workers
         """
         self.rate_limit_seconds = (
             rate_limit_seconds or config.yfinance_rate_limit_seconds
         )
+        self.timeseries_store = timeseries_store or get_timeseries_store()
+        self.max_workers = max_workers or config.yfinance_max_workers
+        self.rate_limiter = get_rate_limiter(
+            self.RATE_LIMITER_KEY, config.yfinance_requests_per_second
+        )
         self._last_request_time: Optional[float] = None
 
     def _apply_rate_limit(self) -> None:
@@ -108,10 +192,14 @@ class YFinanceFetcher:
         interval: Optional[str] = None,
         start: Optional[str] = None,
         end: Optional[str] = None,
-    ) -> pd.DataFrame:
+    ) -> "pd.DataFrame":
         """
         Fetch historical price data (OHLCV) for a ticker.
 
+        Daily and longer intervals are synced into the time-series store when
+        it is enabled: only bars from the last stored date onwards are
+        requested, and the requested range is read back from the store.
+
         Args:
             ticker_symbol: Stock ticker symbol
             period: Period for historical data
@@ -137,21 +225,20 @@ class YFinanceFetcher:
         )
         self._apply_rate_limit()
 
+        interval = interval or config.yfinance_history_interval
         try:
             ticker = yf.Ticker(ticker_symbol)
 
-            # Use period/interval or start/end
-            if start and end:
-                history = ticker.history(
-                    start=start,
-                    end=end,
-                    interval=interval or config.yfinance_history_interval,
-                )
-            else:
-                history = ticker.history(
-                    period=period or config.yfinance_history_period,
-                    interval=interval or config.yfinance_history_interval,
-                )
+            history = None
+            if self.timeseries_store is not None and interval in STORED_INTERVALS:
+                try:
+                    history = self._sync_history(
+                        ticker, ticker_symbol, period, interval, start, end
+                    )
+                except TimeSeriesStoreError as e:
+                    logger.warning(f"Time-series store not used: {str(e)}")
+            if history is None:
+                history = self._download_history(ticker, period, interval, start, end)
 
             if history.empty:
                 raise YFinanceFetcherError(
@@ -173,7 +260,62 @@ class YFinanceFetcher:
                 f"Failed to fetch historical prices for {ticker_symbol}: {str(e)}"
             ) from e
 
-    def fetch_dividends(self, ticker_symbol: str) -> pd.Series:
+    @staticmethod
+    def _download_history(
+        ticker: Any,
+        period: Optional[str],
+        interval: str,
+        start: Optional[str],
+        end: Optional[str],
+    ) -> "pd.DataFrame":
+        """Request price history, by start/end if both are given."""
+        # Use period/interval or start/end
+        if start and end:
+            return ticker.history(start=start, end=end, interval=interval)
+        return ticker.history(
+            period=period or config.yfinance_history_period, interval=interval
+        )
+
+    def _sync_history(
+        self,
+        ticker: Any,
+        ticker_symbol: str,
+        period: Optional[str],
+        interval: str,
+        start: Optional[str],
+        end: Optional[str],
+    ) -> "pd.DataFrame":
+        """
+        Sync a price history into the time-series store and read it back.
+
+        Returns:
+            Stored bars for the requested range (empty if none)
+        """
+        store = self.timeseries_store
+        if store is None:
+            raise YFinanceFetcherError("Time-series store is disabled")
+        key = series_key(ticker_symbol.upper(), interval)
+        if start and end:
+            # yfinance treats end as exclusive
+            last_day = (_pd.Timestamp(end) - _pd.Timedelta(days=1)).strftime("%Y-%m-%d")
+        else:
+            start = _period_start(period or config.yfinance_history_period)
+            end = last_day = None
+
+        def fetch(since: Optional[Any]) -> "pd.DataFrame":
+            if since is start:
+                return self._download_history(ticker, period, interval, start, end)
+            return ticker.history(
+                start=_pd.Timestamp(since).strftime("%Y-%m-%d"),
+                end=end,
+                interval=interval,
+            )
+
+        store.sync("yfinance", key, fetch, start=start, end=last_day)
+        stored = store.read("yfinance", key, start=start, end=last_day)
+        return stored if stored is not None else _pd.DataFrame()
+
+    def fetch_dividends(self, ticker_symbol: str) -> "pd.Series":
         """
         Fetch dividend history for a ticker.
 
@@ -195,7 +337,7 @@ class YFinanceFetcher:
 
             if dividends.empty:
                 logger.warning(f"No dividend data available for ticker {ticker_symbol}")
-                return pd.Series(dtype=float)
+                return _pd.Series(dtype=float)
 
             logger.debug(
                 f"Successfully fetched {len(dividends)} dividend records "
@@ -212,7 +354,7 @@ class YFinanceFetcher:
                 f"Failed to fetch dividends for {ticker_symbol}: {str(e)}"
             ) from e
 
-    def fetch_earnings(self, ticker_symbol: str) -> pd.DataFrame:
+    def fetch_earnings(self, ticker_symbol: str) -> "pd.DataFrame":
         """
         Fetch earnings data for a ticker.
 
@@ -234,7 +376,7 @@ class YFinanceFetcher:
 
             if earnings.empty:
                 logger.warning(f"No earnings data available for ticker {ticker_symbol}")
-                return pd.DataFrame()
+                return _pd.DataFrame()
 
             logger.debug(
                 f"Successfully fetched earnings data for {ticker_symbol}: "
@@ -251,7 +393,7 @@ class YFinanceFetcher:
                 f"Failed to fetch earnings for {ticker_symbol}: {str(e)}"
             ) from e
 
-    def fetch_recommendations(self, ticker_symbol: str) -> pd.DataFrame:
+    def fetch_recommendations(self, ticker_symbol: str) -> "pd.DataFrame":
         """
         Fetch analyst recommendations for a ticker.
 
@@ -275,7 +417,7 @@ class YFinanceFetcher:
                 logger.warning(
                     f"No recommendations data available for ticker {ticker_symbol}"
                 )
-                return pd.DataFrame()
+                return _pd.DataFrame()
 
             logger.debug(
                 f"Successfully fetched {len(recommendations)} recommendations "
@@ -329,21 +471,21 @@ class YFinanceFetcher:
                 result["dividends"] = self.fetch_dividends(ticker_symbol)
             except YFinanceFetcherError as e:
                 logger.warning(f"Failed to fetch dividends: {str(e)}")
-                result["dividends"] = pd.Series(dtype=float)
+                result["dividends"] = _pd.Series(dtype=float)
 
             # Fetch earnings
             try:
                 result["earnings"] = self.fetch_earnings(ticker_symbol)
             except YFinanceFetcherError as e:
                 logger.warning(f"Failed to fetch earnings: {str(e)}")
-                result["earnings"] = pd.DataFrame()
+                result["earnings"] = _pd.DataFrame()
 
             # Fetch recommendations
             try:
                 result["recommendations"] = self.fetch_recommendations(ticker_symbol)
             except YFinanceFetcherError as e:
                 logger.warning(f"Failed to fetch recommendations: {str(e)}")
-                result["recommendations"] = pd.DataFrame()
+                result["recommendations"] = _pd.DataFrame()
 
             logger.info(f"Successfully fetched all data for {ticker_symbol}")
             return result
@@ -356,3 +498,262 @@ class YFinanceFetcher:
             raise YFinanceFetcherError(
                 f"Failed to fetch all data for {ticker_symbol}: {str(e)}"
             ) from e
+
+    def fetch_bulk_history(
+        self,
+        ticker_symbols: List[str],
+        period: Optional[str] = None,
+        interval: Optional[str] = None,
+    ) -> Dict[str, "pd.DataFrame"]:
+        """
+        Fetch price histories for many tickers with batched downloads.
+
+        Tickers are downloaded config.yfinance_bulk_batch_size at a time with
+        yf.download (which fetches the batch on its own threads). With the
+        time-series store enabled, tickers are grouped by their last stored
+        date so each group only requests new bars, and up-to-date tickers are
+        read from the store without a request. If a batch download fails,
+        its tickers are fetched one by one; tickers that still fail are
+        logged and omitted.
+
+        Args:
+            ticker_symbols: Stock ticker symbols
+            period: Period for historical data
+                (If None, uses config.yfinance_history_period)
+            interval: Interval for historical data
+                (If None, uses config.yfinance_history_interval)
+
+        Returns:
+            Dictionary mapping ticker symbol to its price history; tickers
+            without data or whose download failed are omitted
+        """
+        period = period or config.yfinance_history_period
+        interval = interval or config.yfinance_history_interval
+        symbols = list(dict.fromkeys(ticker_symbols))
+        logger.info(
+            f"Fetching historical prices for {len(symbols)} tickers: "
+            f"period={period}, interval={interval}"
+        )
+
+        store = self.timeseries_store
+        start = _period_start(period)
+        # First date to request -> tickers; None requests the whole period
+        groups: Dict[Any, List[str]] = {}
+        stored_symbols: List[str] = []
+        for symbol in symbols:
+            since = None
+            if store is not None and interval in STORED_INTERVALS:
+                try:
+                    since, needed, incremental = store.plan_sync(
+                        "yfinance", series_key(symbol.upper(), interval), start=start
+                    )
+                    stored_symbols.append(symbol)
+                    if not needed:
+                        continue
+                    if not incremental:
+                        since = None
+                except TimeSeriesStoreError as e:
+                    logger.warning(f"Time-series store not used for {symbol}: {e}")
+            groups.setdefault(since, []).append(symbol)
+
+        downloaded: Dict[str, "pd.DataFrame"] = {}
+        failed: List[str] = []
+        batch_size = config.yfinance_bulk_batch_size
+        for since, group in groups.items():
+            for offset in range(0, len(group), batch_size):
+                batch = group[offset : offset + batch_size]
+                frames, batch_failed = self._download_batch(
+                    batch, period, interval, since
+                )
+                downloaded.update(frames)
+                failed.extend(batch_failed)
+        if failed:
+            logger.warning(
+                f"Failed to fetch historical prices for {len(failed)} tickers: "
+                f"{failed}"
+            )
+
+        histories: Dict[str, "pd.DataFrame"] = {}
+        for symbol in symbols:
+            if symbol in failed:
+                # Not synced: the store must not record a range it never got
+                continue
+            history = downloaded.get(symbol)
+            if store is not None and symbol in stored_symbols:
+                key = series_key(symbol.upper(), interval)
+                try:
+                    # Merges the bars downloaded above (nothing if up to date)
+                    store.sync("yfinance", key, _downloaded_bars(history), start=start)
+                    history = store.read("yfinance", key, start=start)
+                except TimeSeriesStoreError as e:
+                    logger.warning(f"Time-series store not used for {symbol}: {e}")
+            if history is not None and not history.empty:
+                histories[symbol] = history
+
+        logger.info(
+            f"Fetched historical prices for {len(histories)} of "
+            f"{len(symbols)} tickers"
+        )
+        return histories
+
+    def _download_batch(
+        self,
+        batch: List[str],
+        period: str,
+        interval: str,
+        since: Optional[Any],
+    ) -> Tuple[Dict[str, "pd.DataFrame"], List[str]]:
+        """
+        Download one batch of tickers and split it into per-ticker frames.
+
+        If the batch download fails, each ticker is fetched on its own so one
+        bad symbol does not lose the whole batch.
+
+        Returns:
+            Tuple of (ticker -> non-empty price history, tickers that failed)
+        """
+        self.rate_limiter.acquire()
+        kwargs: Dict[str, Any] = {"interval": interval}
+        if since is None:
+            kwargs["period"] = period
+        else:
+            kwargs["start"] = _pd.Timestamp(since).strftime("%Y-%m-%d")
+        try:
+            frame = yf.download(
+                batch,
+                group_by="ticker",
+                actions=True,
+                auto_adjust=True,
+                threads=True,
+                progress=False,
+                **kwargs,
+            )
+        except Exception as e:
+            logger.warning(
+                f"Batch download failed for {batch}, fetching tickers "
+                f"individually: {str(e)}"
+            )
+        else:
+            return _split_download(frame, batch), []
+
+        frames: Dict[str, "pd.DataFrame"] = {}
+        failed: List[str] = []
+        for symbol in batch:
+            try:
+                self.rate_limiter.acquire()
+                history = yf.Ticker(symbol).history(**kwargs)
+            except Exception as e:
+                logger.warning(
+                    f"Failed to fetch historical prices for {symbol}: {str(e)}"
+                )
+                failed.append(symbol)
+                continue
+            if history is not None and not history.empty:
+                frames[symbol] = history.dropna(how="all")
+        return frames, failed
+
+    def _fetch_ticker_details(self, ticker_symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch info, dividends, earnings and recommendations for one ticker.
+
+        Every request draws from the shared limiter, and one Ticker object
+        (and yfinance's shared session) is reused for all of them.
+
+        Returns:
+            Data dictionary, or None if the ticker info is unavailable
+        """
+        ticker = yf.Ticker(ticker_symbol)
+        try:
+            self.rate_limiter.acquire()
+            info = ticker.info
+        except Exception as e:
+            logger.warning(f"Failed to fetch ticker info for {ticker_symbol}: {e}")
+            return None
+        if not info:
+            logger.warning(f"No information available for ticker {ticker_symbol}")
+            return None
+
+        result: Dict[str, Any] = {"info": info}
+        for name, empty in (
+            ("dividends", lambda: _pd.Series(dtype=float)),
+            ("earnings", _pd.DataFrame),
+            ("recommendations", _pd.DataFrame),
+        ):
+            try:
+                self.rate_limiter.acquire()
+                value = getattr(ticker, name)
+            except Exception as e:
+                logger.warning(f"Failed to fetch {name} for {ticker_symbol}: {e}")
+                value = None
+            result[name] = value if value is not None and not value.empty else empty()
+        return result
+
+    def fetch_bulk_data(
+        self, ticker_symbols: List[str], include_history: bool = True
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch all available data for many tickers.
+
+        Bulk counterpart of fetch_all_data: price histories come from
+        fetch_bulk_history, and the per-ticker data is fetched concurrently
+        on up to max_workers threads under the shared rate limiter.
+
+        Args:
+            ticker_symbols: Stock ticker symbols
+            include_history: Whether to include historical price data (default: True)
+
+        Returns:
+            Dictionary mapping ticker symbol to the fetch_all_data dictionary,
+            in input order; tickers whose info cannot be fetched are omitted
+        """
+        symbols = list(dict.fromkeys(ticker_symbols))
+        logger.info(f"Fetching all data for {len(symbols)} tickers")
+        histories = self.fetch_bulk_history(symbols) if include_history else {}
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="yfinance"
+        ) as executor:
+            details = map_in_context(executor, self._fetch_ticker_details, symbols)
+
+        results: Dict[str, Dict[str, Any]] = {}
+        for symbol, data in zip(symbols, details):
+            if data is None:
+                continue
+            if include_history:
+                data["history"] = histories.get(symbol, _pd.DataFrame())
+            results[symbol] = data
+
+        logger.info(f"Fetched all data for {len(results)} of {len(symbols)} tickers")
+        return results
+
+
+def _split_download(frame: "pd.DataFrame", batch: List[str]) -> Dict[str, Any]:
+    """
+    Split a yf.download result into per-ticker frames.
+
+    Args:
+        frame: Download result; columns are (ticker, field) with
+            group_by="ticker", or plain fields for a single ticker in older
+            yfinance versions
+        batch: Requested ticker symbols
+
+    Returns:
+        Dictionary mapping each requested ticker symbol (as given) to its
+        non-empty rows; yfinance's upper-case columns are matched
+        case-insensitively
+    """
+    if frame is None or frame.empty:
+        return {}
+    if not isinstance(frame.columns, _pd.MultiIndex):
+        return {batch[0]: frame.dropna(how="all")} if len(batch) == 1 else {}
+    tickers = set(frame.columns.get_level_values(0))
+    split = {}
+    for symbol in batch:
+        column = symbol if symbol in tickers else symbol.upper()
+        if column not in tickers:
+            continue
+        data = frame[column].dropna(how="all")
+        if not data.empty:
+            data.columns.name = None
+            split[symbol] = data
+    return split
@@ -2,20 +2,28 @@
 RAG (Retrieval-Augmented Generation) chain implementation.
 
 Handles query processing, document retrieval, and answer generation.
+
+Exports are resolved on first access so that importing a lightweight
+submodule does not load the LLM and embedding client libraries.
 """
 
-from app.rag.chain import (
-    RAGQueryError,
-    RAGQuerySystem,
-    create_rag_system,
-)
-from app.rag.embedding_factory import (
-    EmbeddingError,
-    EmbeddingFactory,
-    EmbeddingGenerator,
-    get_embedding_generator,
+from app.utils.lazy_imports import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    globals(),
+    {
+        "RAGQueryError": "app.rag.chain",
+        "RAGQuerySystem": "app.rag.chain",
+        "create_rag_system": "app.rag.chain",
+        "EmbeddingError": "app.rag.embedding_factory",
+        "EmbeddingFactory": "app.rag.embedding_factory",
+        "EmbeddingGenerator": "app.rag.embedding_factory",
+        "get_embedding_generator": "app.rag.embedding_factory",
+        "FactLookup": "app.rag.fact_lookup",
+        "create_ollama_llm": "app.rag.llm_factory",
+        "get_llm": "app.rag.llm_factory",
+    },
 )
-from app.rag.llm_factory import create_ollama_llm, get_llm
 
 __all__ = [
     "RAGQuerySystem",
@@ -27,4 +35,5 @@ __all__ = [
     "EmbeddingFactory",
     "EmbeddingGenerator",
     "get_embedding_generator",
+    "FactLookup",
 ]
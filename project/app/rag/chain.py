@@ -11,9 +11,10 @@ from typing import Any, Dict, List, Optional
 from langchain_core.documents import Document
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.runnables import RunnablePassthrough
 
+from app.ingestion.sec_company_directory import get_company_directory
 from app.rag.embedding_factory import EmbeddingError, EmbeddingGenerator
+from app.rag.fact_lookup import FactLookup
 from app.rag.filter_builder import FilterBuilder
 from app.rag.llm_factory import get_llm
 from app.rag.prompt_engineering import PromptEngineer
@@ -25,14 +26,17 @@ from app.utils.conversation_memory import get_conversation_context
 from app.utils.langchain_memory import ConversationBufferMemory
 from app.utils.logger import get_logger
 from app.utils.metrics import (
+    estimate_tokens,
     rag_context_chunks_retrieved,
     rag_queries_total,
     rag_query_duration_seconds,
+    rag_query_tokens,
     track_duration,
     track_error,
     track_success,
 )
-from app.vector_db import ChromaStore, ChromaStoreError
+from app.utils.tracing import stage, start_trace
+from app.vector_db import VectorStoreError, create_vector_store
 
 logger = get_logger(__name__)
 
@@ -94,8 +98,8 @@ class RAGQuerySystem:
             emb_provider = embedding_provider or config.EMBEDDING_PROVIDER
             logger.debug(f"Creating embedding generator with provider={emb_provider}")
             self.embedding_generator = EmbeddingGenerator(provider=embedding_provider)
-            logger.debug(f"Creating ChromaDB store with collection={collection_name}")
-            self.chroma_store = ChromaStore(collection_name=collection_name)
+            logger.debug(f"Creating vector store with collection={collection_name}")
+            self.chroma_store = create_vector_store(collection_name=collection_name)
 
             # Initialize optimization components
             self.query_refiner = QueryRefiner(
@@ -110,6 +114,11 @@ class RAGQuerySystem:
             self.query_parser = QueryParser()
             self.filter_builder = FilterBuilder()
 
+            # Numeric fact questions are answered from the XBRL fact store
+            self.fact_lookup = (
+                FactLookup() if config.rag_numeric_lookup_enabled else None
+            )
+
             # Initialize retrieval optimizer if optimizations are enabled
             self.use_optimizations = (
                 config.rag_use_hybrid_search or config.rag_use_reranking
@@ -248,19 +257,7 @@ Answer:"""
                 source_info.append(f"Company: {company_name}")
             elif ticker:
                 # Map ticker to company name for better readability
-                ticker_to_company = {
-                    "AAPL": "Apple Inc.",
-                    "MSFT": "Microsoft Corporation",
-                    "GOOGL": "Alphabet Inc.",
-                    "AMZN": "Amazon.com Inc.",
-                    "META": "Meta Platforms Inc.",
-                    "TSLA": "Tesla, Inc.",
-                    "NVDA": "NVIDIA Corporation",
-                    "JPM": "JPMorgan Chase & Co.",
-                    "V": "Visa Inc.",
-                    "JNJ": "Johnson & Johnson",
-                }
-                company = ticker_to_company.get(ticker, ticker)
+                company = get_company_directory().get_company_name(ticker) or ticker
                 source_info.append(f"Company: {company} ({ticker})")
             elif filename:
                 source_info.append(f"Source: {filename}")
@@ -325,12 +322,13 @@ Answer:"""
         if self.use_optimizations and self.retrieval_optimizer:
             try:
                 # Refine query first
-                refined_query = self.query_refiner.refine_query(question)
+                with stage("refine"):
+                    refined_query = self.query_refiner.refine_query(question)
                 logger.debug(f"Refined query: '{refined_query[:50]}...'")
 
                 # Use optimized retrieval
                 documents = self.retrieval_optimizer.retrieve(
-                    refined_query, top_k=self.top_k
+                    refined_query, top_k=self.top_k, where=final_where_filter
                 )
                 logger.info(
                     f"Retrieved {len(documents)} documents using optimized retrieval"
@@ -349,7 +347,8 @@ Answer:"""
         # Fallback to basic retrieval
         try:
             # Refine query for better retrieval
-            refined_query = self.query_refiner.refine_query(question)
+            with stage("refine"):
+                refined_query = self.query_refiner.refine_query(question)
             question_lower = refined_query.lower()
             enhanced_question = refined_query
 
@@ -371,7 +370,10 @@ Answer:"""
 
             # Generate query embedding
             logger.debug("Generating query embedding")
-            query_embedding = self.embedding_generator.embed_query(enhanced_question)
+            with stage("embed_query"):
+                query_embedding = self.embedding_generator.embed_query(
+                    enhanced_question
+                )
 
             # Search ChromaDB - retrieve more results to find SEC EDGAR docs
             retrieval_count = min(self.top_k * 3, 30)
@@ -379,11 +381,12 @@ Answer:"""
                 f"Querying ChromaDB: retrieval_count={retrieval_count}, "
                 f"top_k={self.top_k}"
             )
-            results = self.chroma_store.query_by_embedding(
-                query_embedding=query_embedding,
-                n_results=retrieval_count,
-                where=final_where_filter,
-            )
+            with stage("vector_search", n_results=retrieval_count):
+                results = self.chroma_store.query_by_embedding(
+                    query_embedding=query_embedding,
+                    n_results=retrieval_count,
+                    where=final_where_filter,
+                )
 
             # Convert to Document objects and prioritize SEC EDGAR documents
             documents = []
@@ -420,7 +423,7 @@ Answer:"""
         except EmbeddingError as e:
             logger.error(f"Failed to generate query embedding: {str(e)}", exc_info=True)
             raise RAGQueryError(f"Failed to generate query embedding: {str(e)}") from e
-        except ChromaStoreError as e:
+        except VectorStoreError as e:
             logger.error(
                 f"Failed to retrieve context from ChromaDB: {str(e)}", exc_info=True
             )
@@ -439,26 +442,14 @@ Answer:"""
         """
         Build RAG chain using LangChain Expression Language.
 
+        The chain expects the question, the formatted context and the
+        conversation history as inputs; query() retrieves and formats the
+        context beforehand, so the chain only runs the prompt and the LLM.
+
         Returns:
             Configured RAG chain
         """
-
-        # Build chain using RunnablePassthrough.assign for context retrieval
-        # The lambda captures self to access retrieval methods
-        def format_context(x: Dict[str, Any]) -> str:
-            """Retrieve and format context for the question."""
-            question = x["question"]
-            docs = self._retrieve_context(question)
-            return self._format_docs(docs)
-
-        chain = (
-            RunnablePassthrough.assign(context=format_context)
-            | self.prompt_template
-            | self.llm
-            | StrOutputParser()
-        )
-
-        return chain
+        return self.prompt_template | self.llm | StrOutputParser()
 
     def query(
         self,
@@ -469,10 +460,14 @@ Answer:"""
         sentiment_filter: Optional[str] = None,
         filters: Optional[Dict[str, Any]] = None,
         enable_query_parsing: bool = True,
+        include_timings: bool = False,
     ) -> Dict[str, Any]:
         """
         Process a natural language query and generate an answer.
 
+        Each stage is recorded as a span of a "rag.query" trace and exported
+        to the configured trace exporters (see app.utils.tracing).
+
         Args:
             question: User's natural language question
             top_k: Override default top_k for this query (optional)
@@ -492,6 +487,7 @@ Answer:"""
                 - metadata: Custom metadata filters
             enable_query_parsing: Whether to parse query for filters and
                 Boolean operators
+            include_timings: Whether to add the per-stage timings to the result
 
         Returns:
             Dictionary with keys:
@@ -500,6 +496,11 @@ Answer:"""
                 - chunks_used: Number of chunks used
                 - error: Error message if query failed (optional)
                 - parsed_query: Parsed query information (if parsing enabled)
+                - numeric_lookup: True if the answer came directly from the
+                  XBRL fact store (no retrieval or LLM call)
+                - timings: Stage durations in milliseconds, e.g.
+                  {"parse": 0.4, "embed_query": 35.2, "llm": 812.0,
+                  "total": 861.3} (if include_timings)
 
         Raises:
             RAGQueryError: If query processing fails
@@ -508,15 +509,45 @@ Answer:"""
             logger.error("Empty question provided")
             raise RAGQueryError("Question cannot be empty")
 
+        with start_trace("rag.query") as trace:
+            result = self._run_query(
+                question,
+                top_k=top_k,
+                conversation_history=conversation_history,
+                sentiment_filter=sentiment_filter,
+                filters=filters,
+                enable_query_parsing=enable_query_parsing,
+            )
+        if include_timings:
+            result["timings"] = trace.timings()
+        return result
+
+    def _run_query(
+        self,
+        question: str,
+        top_k: Optional[int],
+        conversation_history: Optional[List[Dict[str, Any]]],
+        sentiment_filter: Optional[str],
+        filters: Optional[Dict[str, Any]],
+        enable_query_parsing: bool,
+    ) -> Dict[str, Any]:
+        """
+        Run the query stages (see query() for arguments and result).
+
+        Raises:
+            RAGQueryError: If query processing fails
+        """
         logger.info(f"Processing query: '{question[:50]}...'")
         try:
             # Parse query and extract filters if enabled
             parsed_query_info = None
             where_filter = None
+            original_question = question
 
             if enable_query_parsing:
                 try:
-                    parsed = self.query_parser.parse(question, extract_filters=True)
+                    with stage("parse"):
+                        parsed = self.query_parser.parse(question, extract_filters=True)
                     parsed_query_info = parsed
                     question = parsed["query_text"]  # Use cleaned query text
 
@@ -533,6 +564,31 @@ Answer:"""
                     )
                     # Continue with original query if parsing fails
 
+            # Exact numeric lookups skip embedding, retrieval and the LLM.
+            # Follow-up questions need the conversation, so they use RAG.
+            if (
+                self.fact_lookup
+                and not filters
+                and not sentiment_filter
+                and not conversation_history
+            ):
+                try:
+                    with stage("fact_lookup"):
+                        result = self.fact_lookup.answer(original_question)
+                except Exception as e:
+                    logger.warning(f"Numeric fact lookup failed: {str(e)}")
+                    result = None
+                if result:
+                    if config.conversation_use_langchain_memory and self.memory:
+                        self.memory.save_context(
+                            inputs={"input": question},
+                            outputs={"output": result["answer"]},
+                        )
+                    track_success(rag_queries_total)
+                    if parsed_query_info:
+                        result["parsed_query"] = parsed_query_info
+                    return result
+
             # Apply explicit filters if provided
             if filters:
                 explicit_where = self.filter_builder.build_where_clause(filters)
@@ -548,9 +604,12 @@ Answer:"""
             current_top_k = top_k if top_k is not None else self.top_k
 
             # Track query duration
-            with track_duration(
-                rag_query_duration_seconds,
-                {"provider": self.embedding_generator.provider},
+            with (
+                stage("retrieve"),
+                track_duration(
+                    rag_query_duration_seconds,
+                    {"provider": self.embedding_generator.provider},
+                ),
             ):
                 # Retrieve context
                 if top_k != self.top_k:
@@ -594,7 +653,8 @@ Answer:"""
 
             # Format context
             logger.debug("Formatting context documents")
-            context = self._format_docs(retrieved_docs)
+            with stage("format_context", chunks=len(retrieved_docs)):
+                context = self._format_docs(retrieved_docs)
 
             # Get conversation context - use LangChain memory if enabled
             conversation_context = None
@@ -660,15 +720,20 @@ Answer:"""
             # Generate answer using LLM
             logger.debug("Generating answer using LLM")
             try:
-                response = self.chain.invoke(
-                    {
-                        "question": question,
-                        "context": context,
-                        "conversation_history": conversation_history_str,
-                    }
-                )
+                with stage("llm"):
+                    response = self.chain.invoke(
+                        {
+                            "question": question,
+                            "context": context,
+                            "conversation_history": conversation_history_str,
+                        }
+                    )
                 answer = response if isinstance(response, str) else str(response)
                 logger.info(f"Successfully generated answer ({len(answer)} chars)")
+                rag_query_tokens.labels(type="query").observe(estimate_tokens(question))
+                rag_query_tokens.labels(type="response").observe(
+                    estimate_tokens(answer)
+                )
 
                 # Save to LangChain memory if enabled
                 if config.conversation_use_langchain_memory and self.memory:
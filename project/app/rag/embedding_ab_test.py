@@ -14,15 +14,17 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import numpy as np
-from scipy import stats
 
 from app.rag.chain import RAGQueryError, RAGQuerySystem
 from app.rag.embedding_factory import EmbeddingError, EmbeddingGenerator
+from app.utils.lazy_imports import lazy_import
 from app.utils.logger import get_logger
 from app.vector_db import ChromaStore
 
 logger = get_logger(__name__)
 
+stats = lazy_import("scipy.stats")
+
 
 @dataclass
 class QueryResult:
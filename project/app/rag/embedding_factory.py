@@ -5,23 +5,41 @@ Supports OpenAI, Ollama, and FinBERT embedding models with batch processing
 and error handling.
 """
 
-from typing import List, Optional
-
-try:
-    from langchain_openai import OpenAIEmbeddings
-except ImportError:
-    # Fallback to langchain_community for older versions
-    from langchain_community.embeddings import (  # type: ignore[assignment]
-        OpenAIEmbeddings,
-    )
+import time
+from typing import TYPE_CHECKING, Callable, List, Optional, TypeVar
 
 from langchain_core.embeddings import Embeddings
 
 from app.utils.config import config
+from app.utils.lazy_imports import lazy_attr
 from app.utils.logger import get_logger
+from app.utils.metrics import (
+    embedding_batch_size,
+    embedding_dimensions,
+    embedding_request_duration_seconds,
+    embedding_requests_total,
+    embedding_tokens_total,
+    estimate_tokens,
+    track_error,
+    track_success,
+)
+
+if TYPE_CHECKING:
+    import langchain_openai
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+# langchain_openai (and its openai/tiktoken stack) is only loaded when an
+# OpenAI embedding model is created. Fall back to langchain_community for
+# older versions.
+OpenAIEmbeddings = lazy_attr(
+    "langchain_openai",
+    "OpenAIEmbeddings",
+    fallbacks=("langchain_community.embeddings",),
+)
+
 
 class EmbeddingError(Exception):
     """Custom exception for embedding generation errors."""
@@ -168,7 +186,7 @@ class EmbeddingFactory:
             )
 
     @staticmethod
-    def _create_openai_embeddings() -> OpenAIEmbeddings:
+    def _create_openai_embeddings() -> "langchain_openai.OpenAIEmbeddings":
         """
         Create OpenAI embeddings instance.
 
@@ -193,7 +211,7 @@ class EmbeddingFactory:
                 openai_api_key=config.OPENAI_API_KEY,
                 chunk_size=1000,
                 max_retries=3,
-            )  # type: ignore[call-arg]
+            )
             logger.info("OpenAI embeddings instance created successfully")
             return embeddings
         except Exception as e:
@@ -284,6 +302,41 @@ class EmbeddingGenerator:
         self.provider = provider or config.EMBEDDING_PROVIDER
         self.embeddings = EmbeddingFactory.create_embeddings(self.provider)
 
+    def _instrumented(self, texts: List[str], call: Callable[[], T]) -> T:
+        """
+        Run an embedding call and record its metrics.
+
+        Records request count and status, duration, batch size, estimated
+        input tokens and embedding dimensions, labelled by provider.
+
+        Args:
+            texts: Texts sent in the request
+            call: Function performing the request
+
+        Returns:
+            Result of call
+        """
+        labels = {"provider": self.provider}
+        embedding_batch_size.labels(**labels).observe(len(texts))
+        embedding_tokens_total.labels(**labels).inc(
+            sum(estimate_tokens(text) for text in texts)
+        )
+        start = time.perf_counter()
+        try:
+            result = call()
+        except Exception:
+            track_error(embedding_requests_total, dict(labels))
+            raise
+        finally:
+            embedding_request_duration_seconds.labels(**labels).observe(
+                time.perf_counter() - start
+            )
+        track_success(embedding_requests_total, dict(labels))
+        vector = result[0] if result and isinstance(result[0], list) else result
+        if vector:
+            embedding_dimensions.labels(**labels).observe(len(vector))
+        return result
+
     def embed_query(self, text: str) -> List[float]:
         """
         Generate embedding for a single query text.
@@ -299,7 +352,9 @@ class EmbeddingGenerator:
         """
         logger.debug(f"Generating query embedding for text: '{text[:50]}...'")
         try:
-            embedding = self.embeddings.embed_query(text)
+            embedding = self._instrumented(
+                [text], lambda: self.embeddings.embed_query(text)
+            )
             logger.debug(f"Generated query embedding (dimensions: {len(embedding)})")
             return embedding
         except Exception as e:
@@ -325,7 +380,9 @@ class EmbeddingGenerator:
 
         logger.debug(f"Generating embeddings for {len(texts)} documents")
         try:
-            embeddings = self.embeddings.embed_documents(texts)
+            embeddings = self._instrumented(
+                texts, lambda: self.embeddings.embed_documents(texts)
+            )
             logger.info(f"Generated {len(embeddings)} document embeddings")
             return embeddings
         except Exception as e:
@@ -0,0 +1,406 @@
+"""
+Direct answers to numeric fact questions from the XBRL fact store.
+
+Questions such as "What was Apple's revenue in 2023?" or "MSFT total assets"
+ask for a single reported figure. They are answered with the exact value
+from the local XBRL fact store, without embedding the question, searching
+the vector store or calling the LLM. Anything that needs interpretation
+(why, compare, trend, ...) falls through to the regular RAG pipeline.
+"""
+
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from app.ingestion.sec_company_directory import (
+    SECCompanyDirectory,
+    get_company_directory,
+)
+from app.ingestion.xbrl_fact_store import (
+    PERIOD_ANNUAL,
+    PERIOD_INSTANT,
+    PERIOD_QUARTERLY,
+    XBRLFactStore,
+)
+from app.utils.config import config
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# (phrase pattern, label, concepts in order of preference, instant?).
+# More specific phrases come first ("net income" before "income").
+METRICS: List[Tuple[str, str, Tuple[str, ...], bool]] = [
+    (
+        r"net income|net earnings|net profit|net loss",
+        "net income",
+        (
+            "NetIncomeLoss",
+            "ProfitLoss",
+            "NetIncomeLossAvailableToCommonStockholdersBasic",
+        ),
+        False,
+    ),
+    (
+        r"operating income|operating profit|income from operations",
+        "operating income",
+        ("OperatingIncomeLoss",),
+        False,
+    ),
+    (r"gross profit|gross margin", "gross profit", ("GrossProfit",), False),
+    (
+        r"operating cash flow|cash flow from operations|"
+        r"cash provided by operating activities",
+        "operating cash flow",
+        (
+            "NetCashProvidedByUsedInOperatingActivities",
+            "NetCashProvidedByUsedInOperatingActivitiesContinuingOperations",
+        ),
+        False,
+    ),
+    (
+        r"diluted eps|diluted earnings per share|earnings per share|\beps\b",
+        "diluted EPS",
+        ("EarningsPerShareDiluted", "EarningsPerShareBasic"),
+        False,
+    ),
+    (
+        r"r&d|research and development",
+        "research and development expense",
+        ("ResearchAndDevelopmentExpense",),
+        False,
+    ),
+    (
+        r"revenues?|net sales|total sales|sales",
+        "revenue",
+        (
+            "Revenues",
+            "RevenueFromContractWithCustomerExcludingAssessedTax",
+            "SalesRevenueNet",
+            "RevenueFromContractWithCustomerIncludingAssessedTax",
+        ),
+        False,
+    ),
+    (r"total assets|\bassets\b", "total assets", ("Assets",), True),
+    (r"total liabilities|\bliabilities\b", "total liabilities", ("Liabilities",), True),
+    (
+        r"(?:stockholders|shareholders)'?\s*equity|total equity",
+        "stockholders' equity",
+        (
+            "StockholdersEquity",
+            "StockholdersEquityIncludingPortionAttributableToNoncontrollingInterest",
+        ),
+        True,
+    ),
+    (
+        r"cash and cash equivalents|cash on hand|\bcash\b",
+        "cash and cash equivalents",
+        (
+            "CashAndCashEquivalentsAtCarryingValue",
+            "CashCashEquivalentsRestrictedCashAndRestrictedCashEquivalents",
+        ),
+        True,
+    ),
+    (
+        r"long[- ]term debt",
+        "long-term debt",
+        ("LongTermDebtNoncurrent", "LongTermDebt"),
+        True,
+    ),
+]
+
+# Questions that need interpretation rather than a single reported figure
+ANALYTICAL_RE = re.compile(
+    r"\b(?:why|explain|compare|comparison|versus|vs\.?|trend|trends|impact|"
+    r"driv(?:e|es|er|ers|en)|outlook|forecast|guidance|risks?|strategy|"
+    r"summari[sz]e|discuss|growth|change|changed|how did|how does)\b",
+    re.IGNORECASE,
+)
+_TICKER_RE = re.compile(r"(?<![\w$])\$?([A-Z]{1,5}(?:[.-][A-Z])?)\b")
+_YEAR_RE = re.compile(r"\b(?:FY\s?)?((?:19|20)\d{2})\b", re.IGNORECASE)
+_QUARTER_RE = re.compile(r"\bQ[1-4]\b|\bquarter(?:ly)?\b", re.IGNORECASE)
+_WORD_RE = re.compile(r"[a-z][a-z0-9&.-]*")
+
+_STATE_SUFFIX_RE = re.compile(r"/[a-z]{2,3}/")
+
+# Legal-form words dropped from company names before matching
+_NAME_STOPWORDS = frozenset(
+    {
+        "the",
+        "inc",
+        "corp",
+        "co",
+        "company",
+        "corporation",
+        "incorporated",
+        "ltd",
+        "plc",
+        "llc",
+        "lp",
+        "sa",
+        "nv",
+        "ag",
+        "holdings",
+        "holding",
+        "group",
+        "class",
+    }
+)
+
+# Words that also appear in unrelated questions or in many company names.
+# A company is only matched on one of these as part of its full name
+# ("bank of america", "home depot"), never on the word alone.
+_GENERIC_NAME_WORDS = frozenset(
+    {
+        "american",
+        "america",
+        "bank",
+        "bancorp",
+        "capital",
+        "first",
+        "general",
+        "global",
+        "home",
+        "international",
+        "national",
+        "united",
+        "financial",
+        "trust",
+        "energy",
+        "health",
+        "technologies",
+        "technology",
+        "systems",
+        "services",
+        "industries",
+        "resources",
+        "partners",
+        "realty",
+        "new",
+        "target",
+        "best",
+        "express",
+    }
+)
+
+_COMPILED_METRICS = [
+    (re.compile(pattern, re.IGNORECASE), label, concepts, instant)
+    for pattern, label, concepts, instant in METRICS
+]
+
+
+def _format_value(value: float, unit: str) -> str:
+    """Format a fact value for display."""
+    if unit == "USD":
+        text = f"${value:,.0f}"
+        magnitude = abs(value)
+        for scale, word in ((1e12, "trillion"), (1e9, "billion"), (1e6, "million")):
+            if magnitude >= scale:
+                return f"{text} (${value / scale:,.2f} {word})"
+        return text
+    if unit == "USD/shares":
+        return f"${value:,.2f} per share"
+    return f"{value:,.10g} {unit}"
+
+
+class FactLookup:
+    """
+    Answer numeric fact questions from the XBRL fact store.
+
+    The store is opened on first use and only if it exists, so systems
+    that never ingested XBRL data pay nothing beyond a path check.
+    """
+
+    def __init__(
+        self,
+        store: Optional[XBRLFactStore] = None,
+        company_directory: Optional[SECCompanyDirectory] = None,
+    ):
+        """
+        Initialize fact lookup.
+
+        Args:
+            store: XBRL fact store (default: config.xbrl_fact_store_path)
+            company_directory: Directory used to match company names
+                (default: shared SECCompanyDirectory)
+        """
+        self._store = store
+        self.company_directory = company_directory or get_company_directory()
+        self._names: Dict[str, Optional[str]] = {}
+        self._name_tickers: Set[str] = set()
+
+    @property
+    def store(self) -> Optional[XBRLFactStore]:
+        """Fact store, or None if nothing has been ingested yet."""
+        if self._store is None and Path(config.xbrl_fact_store_path).exists():
+            self._store = XBRLFactStore()
+        return self._store
+
+    @staticmethod
+    def _name_words(name: str) -> List[str]:
+        """Split a company name into lowercase words without legal forms."""
+        name = _STATE_SUFFIX_RE.sub(" ", name.lower())
+        words = [word.rstrip(".,") for word in _WORD_RE.findall(name)]
+        return [word for word in words if word and word not in _NAME_STOPWORDS]
+
+    def _company_names(self, tickers: Set[str]) -> Dict[str, Optional[str]]:
+        """
+        Map company-name phrases to stored tickers.
+
+        Each company is matched on its full name without legal forms
+        ("bank of america") and on its first word when that word is
+        distinctive ("microsoft"). Phrases shared by several stored
+        companies map to None.
+        """
+        if tickers != self._name_tickers:
+            names: Dict[str, Optional[str]] = {}
+            for ticker in sorted(tickers):
+                words = self._name_words(
+                    self.company_directory.get_company_name(ticker) or ""
+                )
+                if not words:
+                    continue
+                phrases = {" ".join(words)}
+                if words[0] not in _GENERIC_NAME_WORDS and len(words[0]) > 2:
+                    phrases.add(words[0])
+                if len(words) == 1 and words[0] in _GENERIC_NAME_WORDS:
+                    phrases.clear()
+                for phrase in phrases:
+                    names[phrase] = (
+                        ticker if names.get(phrase, ticker) == ticker else None
+                    )
+            self._names = names
+            self._name_tickers = set(tickers)
+        return self._names
+
+    def _find_tickers(self, question: str, stored: Set[str]) -> Optional[List[str]]:
+        """
+        Return stored tickers mentioned by symbol or company name.
+
+        Returns None if a mentioned name belongs to several stored companies.
+        """
+        found: List[str] = []
+        for match in _TICKER_RE.finditer(question):
+            symbol = match.group(1)
+            # Single letters only count as tickers when written as $V
+            if len(symbol) == 1 and not match.group(0).startswith("$"):
+                continue
+            if symbol in stored and symbol not in found:
+                found.append(symbol)
+        names = self._company_names(stored)
+        if not names:
+            return found
+        longest = max(phrase.count(" ") for phrase in names) + 1
+        words = [word.rstrip(".,") for word in _WORD_RE.findall(question.lower())]
+        i = 0
+        while i < len(words):
+            # Longest phrase first, so "bank of america" wins over "bank"
+            for size in range(min(longest, len(words) - i), 0, -1):
+                phrase = " ".join(words[i : i + size])
+                if phrase in names:
+                    ticker = names[phrase]
+                    if ticker is None:
+                        return None
+                    if ticker not in found:
+                        found.append(ticker)
+                    i += size
+                    break
+            else:
+                i += 1
+        return found
+
+    @staticmethod
+    def _find_metric(question: str) -> Optional[Tuple[str, Tuple[str, ...], bool]]:
+        """Return (label, concepts, instant) of the first metric mentioned."""
+        for pattern, label, concepts, instant in _COMPILED_METRICS:
+            if pattern.search(question):
+                return label, concepts, instant
+        return None
+
+    def answer(self, question: str) -> Optional[Dict[str, Any]]:
+        """
+        Answer a numeric fact question if it can be answered exactly.
+
+        Args:
+            question: User's natural language question
+
+        Returns:
+            Result dict in the RAGQuerySystem.query format (answer, sources,
+            chunks_used, numeric_lookup), or None if the question is not a
+            simple fact lookup or a requested value is not stored
+        """
+        if ANALYTICAL_RE.search(question):
+            return None
+        metric = self._find_metric(question)
+        if metric is None:
+            return None
+        store = self.store
+        if store is None:
+            return None
+        tickers = self._find_tickers(question, store.tickers())
+        if not tickers:
+            # No company, or a name shared by several companies
+            return None
+
+        label, concepts, instant = metric
+        year_match = _YEAR_RE.search(question)
+        year = int(year_match.group(1)) if year_match else None
+        if instant:
+            period = PERIOD_INSTANT
+        elif _QUARTER_RE.search(question):
+            period = PERIOD_QUARTERLY
+        else:
+            period = PERIOD_ANNUAL
+
+        lines: List[str] = []
+        sources: List[Dict[str, Any]] = []
+        for ticker in tickers:
+            facts = store.get_facts(ticker, concepts, period=period, year=year, limit=1)
+            if not facts:
+                # Partial answers would hide the missing company; use RAG
+                return None
+            fact = facts[0]
+            lines.append(self._describe(fact, label, period))
+            sources.append(
+                {
+                    "type": "xbrl_fact",
+                    "source": f"SEC XBRL - {ticker}",
+                    "ticker": ticker,
+                    "cik": fact["cik"],
+                    "concept": fact["concept"],
+                    "period_start": fact["period_start"] or None,
+                    "period_end": fact["period_end"],
+                    "unit": fact["unit"],
+                    "value": fact["value"],
+                    "form_type": fact["form_type"],
+                    "filing_date": fact["filing_date"],
+                    "accession_number": fact["accession"],
+                }
+            )
+
+        logger.info(f"Answered numeric lookup from XBRL facts: {label} {tickers}")
+        return {
+            "answer": "\n".join(lines),
+            "sources": sources,
+            "chunks_used": 0,
+            "numeric_lookup": True,
+        }
+
+    def _describe(self, fact: Dict[str, Any], label: str, period: str) -> str:
+        """Build the answer sentence for one fact."""
+        ticker = fact["ticker"]
+        name = self.company_directory.get_company_name(ticker)
+        company = f"{name} ({ticker})" if name else ticker
+        if period == PERIOD_INSTANT:
+            when = f"as of {fact['period_end']}"
+        elif period == PERIOD_QUARTERLY:
+            when = f"for the quarter ended {fact['period_end']}"
+        else:
+            when = f"for the fiscal year ended {fact['period_end']}"
+        filing = fact["form_type"] or "filing"
+        if fact["filing_date"]:
+            filing = f"{filing} filed {fact['filing_date']}"
+        return (
+            f"{company} reported {label} of "
+            f"{_format_value(fact['value'], fact['unit'])} {when} "
+            f"(XBRL {fact['concept']}, {filing})."
+        )
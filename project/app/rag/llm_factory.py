@@ -4,45 +4,179 @@ LLM factory module.
 Creates and configures LLM instances based on configuration.
 """
 
+import threading
+import time
 import warnings
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
 
-# Try to use langchain-ollama (recommended), fallback to langchain-community
-try:
-    from langchain_ollama import OllamaLLM
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
 
+from app.utils.config import config
+from app.utils.lazy_imports import LazyAttribute, is_available, lazy_attr
+from app.utils.logger import get_logger
+from app.utils.metrics import (
+    estimate_tokens,
+    llm_request_duration_seconds,
+    llm_requests_total,
+    llm_tokens_total,
+    track_error,
+    track_success,
+)
+
+# Provider classes are resolved on first use so importing the factory does not
+# load every LLM client library.
+# Prefer langchain-ollama (recommended), fallback to langchain-community
+if is_available("langchain_ollama"):
     OLLAMA_AVAILABLE = True
-    OLLAMA_CLASS = OllamaLLM
-except ImportError:
+    OLLAMA_CLASS = lazy_attr("langchain_ollama", "OllamaLLM")
+else:
     # Fallback to deprecated langchain-community
-    from langchain_community.llms import Ollama
-
     OLLAMA_AVAILABLE = False
-    OLLAMA_CLASS = Ollama
+    OLLAMA_CLASS = lazy_attr("langchain_community.llms", "Ollama")
     # Suppress deprecation warning for compatibility
     warnings.filterwarnings(
         "ignore", category=DeprecationWarning, module="langchain_community.llms"
     )
 
-# Try to use langchain-openai (recommended), fallback to langchain-community
-try:
-    from langchain_openai import ChatOpenAI
-
+# Prefer langchain-openai (recommended), fallback to langchain-community
+OPENAI_CLASS: Optional[LazyAttribute]
+if is_available("langchain_openai"):
     OPENAI_AVAILABLE = True
-    OPENAI_CLASS = ChatOpenAI
-except ImportError:
-    try:
-        from langchain_community.chat_models import ChatOpenAI
+    OPENAI_CLASS = lazy_attr("langchain_openai", "ChatOpenAI")
+elif is_available("langchain_community"):
+    OPENAI_AVAILABLE = True
+    OPENAI_CLASS = lazy_attr("langchain_community.chat_models", "ChatOpenAI")
+else:
+    OPENAI_AVAILABLE = False
+    OPENAI_CLASS = None
 
-        OPENAI_AVAILABLE = True
-        OPENAI_CLASS = ChatOpenAI
-    except ImportError:
-        OPENAI_AVAILABLE = False
-        OPENAI_CLASS = None
+logger = get_logger(__name__)
 
-from app.utils.config import config
-from app.utils.logger import get_logger
 
-logger = get_logger(__name__)
+def _usage_from_result(response: LLMResult) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Extract (prompt, completion) token counts reported by the provider.
+
+    Checks OpenAI-style llm_output["token_usage"], chat message
+    usage_metadata and Ollama generation_info (prompt_eval_count,
+    eval_count).
+
+    Returns:
+        Tuple of token counts; None where the provider reported nothing
+    """
+    usage = (response.llm_output or {}).get("token_usage") or {}
+    if usage.get("prompt_tokens") is not None:
+        return usage.get("prompt_tokens"), usage.get("completion_tokens")
+
+    prompt_tokens = completion_tokens = None
+    for generations in response.generations:
+        for generation in generations:
+            message_usage = getattr(
+                getattr(generation, "message", None), "usage_metadata", None
+            )
+            info = generation.generation_info or {}
+            if message_usage:
+                prompt = message_usage.get("input_tokens")
+                completion = message_usage.get("output_tokens")
+            else:
+                prompt = info.get("prompt_eval_count")
+                completion = info.get("eval_count")
+            if prompt is not None:
+                prompt_tokens = (prompt_tokens or 0) + prompt
+            if completion is not None:
+                completion_tokens = (completion_tokens or 0) + completion
+    return prompt_tokens, completion_tokens
+
+
+class LLMMetricsCallbackHandler(BaseCallbackHandler):
+    """
+    Record LLM request metrics for every invocation of an LLM.
+
+    Attached by get_llm(), so invoke(), batch() and LCEL chains are all
+    covered. Token counts come from the provider's usage report; when a
+    provider reports none, they are estimated from the prompt and
+    completion text.
+    """
+
+    def __init__(self, provider: str, model: str):
+        """
+        Initialize handler.
+
+        Args:
+            provider: LLM provider label
+            model: Model name label
+        """
+        self.labels = {"provider": provider, "model": model}
+        self._runs: Dict[UUID, Tuple[float, int]] = {}
+        self._lock = threading.Lock()
+
+    def _start(self, run_id: UUID, prompt_text: str) -> None:
+        """Remember the start time and estimated prompt tokens of a run."""
+        with self._lock:
+            self._runs[run_id] = (time.perf_counter(), estimate_tokens(prompt_text))
+
+    def _finish(self, run_id: UUID) -> Tuple[Optional[float], int]:
+        """Return (duration, estimated prompt tokens) of a run and forget it."""
+        with self._lock:
+            started = self._runs.pop(run_id, None)
+        if started is None:
+            return None, 0
+        start, prompt_estimate = started
+        duration = time.perf_counter() - start
+        llm_request_duration_seconds.labels(**self.labels).observe(duration)
+        return duration, prompt_estimate
+
+    def on_llm_start(
+        self, serialized: Dict[str, Any], prompts: List[str], *, run_id: UUID, **kwargs
+    ) -> None:
+        """Start timing a completion request."""
+        self._start(run_id, "".join(prompts))
+
+    def on_chat_model_start(
+        self,
+        serialized: Dict[str, Any],
+        messages: List[List[Any]],
+        *,
+        run_id: UUID,
+        **kwargs,
+    ) -> None:
+        """Start timing a chat request."""
+        text = "".join(
+            str(getattr(message, "content", message))
+            for batch in messages
+            for message in batch
+        )
+        self._start(run_id, text)
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs) -> None:
+        """Record a successful request and its token usage."""
+        _, prompt_estimate = self._finish(run_id)
+        track_success(llm_requests_total, dict(self.labels))
+        prompt_tokens, completion_tokens = _usage_from_result(response)
+        if prompt_tokens is None:
+            prompt_tokens = prompt_estimate
+        if completion_tokens is None:
+            completion_tokens = sum(
+                estimate_tokens(generation.text)
+                for generations in response.generations
+                for generation in generations
+            )
+        llm_tokens_total.labels(**self.labels, type="input").inc(prompt_tokens)
+        llm_tokens_total.labels(**self.labels, type="output").inc(completion_tokens)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs) -> None:
+        """Record a failed request."""
+        self._finish(run_id)
+        track_error(llm_requests_total, dict(self.labels))
+
+
+def _with_metrics(llm: Any, provider: str, model: str) -> Any:
+    """Attach an LLMMetricsCallbackHandler to an LLM instance."""
+    handler = LLMMetricsCallbackHandler(provider=provider, model=model)
+    llm.callbacks = [*(llm.callbacks or []), handler]
+    return llm
 
 
 def create_ollama_llm():
@@ -75,7 +209,7 @@ def create_ollama_llm():
         )
 
     logger.info(f"Ollama LLM created successfully: model={ollama_config['model']}")
-    return llm
+    return _with_metrics(llm, "ollama", ollama_config["model"])
 
 
 def create_openai_llm(model: str = "gpt-4o-mini", temperature: float = 0.7):
@@ -92,7 +226,7 @@ def create_openai_llm(model: str = "gpt-4o-mini", temperature: float = 0.7):
     Raises:
         ValueError: If OpenAI is not available or API key is missing
     """
-    if not OPENAI_AVAILABLE:
+    if not OPENAI_AVAILABLE or OPENAI_CLASS is None:
         raise ValueError(
             "OpenAI LLM not available. Please install langchain-openai "
             "or langchain-community"
@@ -113,7 +247,7 @@ def create_openai_llm(model: str = "gpt-4o-mini", temperature: float = 0.7):
             max_retries=3,
         )
         logger.info(f"OpenAI LLM created successfully: model={model}")
-        return llm
+        return _with_metrics(llm, "openai", model)
     except Exception as e:
         logger.error(f"Failed to create OpenAI LLM: {str(e)}", exc_info=True)
         raise ValueError(f"Failed to create OpenAI LLM: {str(e)}") from e
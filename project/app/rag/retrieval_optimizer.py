@@ -5,18 +5,27 @@ Implements hybrid search (semantic + keyword/BM25), reranking,
 and multi-stage retrieval for improved answer quality.
 """
 
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from langchain_core.documents import Document
-from rank_bm25 import BM25Okapi
-from sentence_transformers import CrossEncoder
 
 from app.rag.embedding_factory import EmbeddingGenerator
+from app.utils.lazy_imports import lazy_attr
 from app.utils.logger import get_logger
-from app.vector_db import ChromaStore, ChromaStoreError
+from app.utils.tracing import stage
+from app.vector_db import ShardedStore, VectorStore, VectorStoreError
+from app.vector_db.sharded_store import metadata_matches
+
+if TYPE_CHECKING:
+    import rank_bm25
+    import sentence_transformers
 
 logger = get_logger(__name__)
 
+# sentence-transformers pulls in torch; only load it when reranking is used
+BM25Okapi = lazy_attr("rank_bm25", "BM25Okapi")
+CrossEncoder = lazy_attr("sentence_transformers", "CrossEncoder")
+
 
 class RetrievalOptimizerError(Exception):
     """Custom exception for retrieval optimization errors."""
@@ -33,11 +42,13 @@ class RetrievalOptimizer:
     - Reciprocal Rank Fusion (RRF) for result merging
     - Cross-encoder reranking for relevance
     - Multi-stage retrieval (broad → refined)
+    - Metadata filters; with a sharded store, semantic search and BM25 only
+      touch the shards a filter can match
     """
 
     def __init__(
         self,
-        chroma_store: ChromaStore,
+        chroma_store: VectorStore,
         embedding_generator: EmbeddingGenerator,
         use_hybrid_search: bool = True,
         use_reranking: bool = True,
@@ -65,7 +76,7 @@ class RetrievalOptimizer:
         self.top_k_final = top_k_final
 
         # Initialize reranker if enabled
-        self.reranker: Optional[CrossEncoder] = None
+        self.reranker: Optional["sentence_transformers.CrossEncoder"] = None
         if self.use_reranking:
             try:
                 logger.info(f"Loading reranking model: {rerank_model}")
@@ -79,10 +90,11 @@ class RetrievalOptimizer:
                 self.use_reranking = False
                 self.reranker = None
 
-        # BM25 index (built from documents as needed)
-        self.bm25_index: Optional[BM25Okapi] = None
-        self.bm25_documents: List[str] = []
-        self.bm25_document_map: Dict[str, Document] = {}
+        # BM25 indexes (built from documents as needed): one per shard of a
+        # sharded store, a single one (key None) otherwise
+        self.bm25_indexes: Dict[
+            Optional[str], Tuple["rank_bm25.BM25Okapi", List[Document]]
+        ] = {}
 
         logger.info(
             f"RetrievalOptimizer initialized: hybrid_search={use_hybrid_search}, "
@@ -94,6 +106,7 @@ class RetrievalOptimizer:
         self,
         query: str,
         top_k: Optional[int] = None,
+        where: Optional[Dict[str, Any]] = None,
     ) -> List[Document]:
         """
         Retrieve documents using optimized retrieval pipeline.
@@ -106,6 +119,8 @@ class RetrievalOptimizer:
         Args:
             query: User query
             top_k: Override final top_k (optional)
+            where: Optional metadata filter dictionary (e.g. parsed query
+                filters)
 
         Returns:
             List of retrieved Document objects
@@ -122,9 +137,13 @@ class RetrievalOptimizer:
         try:
             # Stage 1: Initial retrieval (broad, high recall)
             if self.use_hybrid_search:
-                initial_docs = self._hybrid_retrieve(query, self.top_k_initial)
+                initial_docs = self._hybrid_retrieve(
+                    query, self.top_k_initial, where=where
+                )
             else:
-                initial_docs = self._semantic_retrieve(query, self.top_k_initial)
+                initial_docs = self._semantic_retrieve(
+                    query, self.top_k_initial, where=where
+                )
 
             if not initial_docs:
                 logger.warning("No documents retrieved in initial stage")
@@ -149,13 +168,16 @@ class RetrievalOptimizer:
                 f"Retrieval optimization failed: {str(e)}"
             ) from e
 
-    def _semantic_retrieve(self, query: str, top_k: int) -> List[Document]:
+    def _semantic_retrieve(
+        self, query: str, top_k: int, where: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
         """
         Semantic retrieval using vector similarity.
 
         Args:
             query: User query
             top_k: Number of results to retrieve
+            where: Optional metadata filter dictionary
 
         Returns:
             List of Document objects
@@ -164,13 +186,16 @@ class RetrievalOptimizer:
 
         try:
             # Generate query embedding
-            query_embedding = self.embedding_generator.embed_query(query)
+            with stage("embed_query"):
+                query_embedding = self.embedding_generator.embed_query(query)
 
             # Query ChromaDB
-            results = self.chroma_store.query_by_embedding(
-                query_embedding=query_embedding,
-                n_results=top_k,
-            )
+            with stage("vector_search", n_results=top_k):
+                results = self.chroma_store.query_by_embedding(
+                    query_embedding=query_embedding,
+                    n_results=top_k,
+                    where=where,
+                )
 
             # Convert to Document objects
             documents = []
@@ -187,20 +212,37 @@ class RetrievalOptimizer:
 
             return documents
 
-        except ChromaStoreError as e:
+        except VectorStoreError as e:
             logger.error(f"Semantic retrieval failed: {str(e)}", exc_info=True)
             raise RetrievalOptimizerError(f"Semantic retrieval failed: {str(e)}") from e
 
-    def _build_bm25_index(self) -> None:
-        """Build BM25 index from all documents in ChromaDB."""
-        if self.bm25_index is not None:
+    def _bm25_shards(self, where: Optional[Dict[str, Any]]) -> List[Optional[str]]:
+        """BM25 indexes a query searches: the matching shards, or the store."""
+        if isinstance(self.chroma_store, ShardedStore):
+            return list(self.chroma_store.shards_for(where))
+        return [None]
+
+    def _build_bm25_index(self, shard: Optional[str] = None) -> None:
+        """
+        Build the BM25 index of one shard, or of the whole store.
+
+        Args:
+            shard: Shard name of a sharded store (None = the whole store)
+        """
+        if shard in self.bm25_indexes:
             return  # Index already built
 
-        logger.debug("Building BM25 index from ChromaDB documents")
+        store = self.chroma_store
+        if shard is not None and isinstance(store, ShardedStore):
+            store = store.shards[shard]
+        logger.debug(
+            "Building BM25 index from ChromaDB documents"
+            + (f" (shard '{shard}')" if shard else "")
+        )
 
         try:
             # Get all documents from ChromaDB
-            all_docs = self.chroma_store.get_all()
+            all_docs = store.get_all()
 
             if not all_docs["documents"]:
                 logger.warning("No documents in ChromaDB for BM25 index")
@@ -221,9 +263,7 @@ class RetrievalOptimizer:
                 )
 
             # Build BM25 index
-            self.bm25_index = BM25Okapi(texts)
-            self.bm25_documents = all_docs["documents"]
-            self.bm25_document_map = dict(enumerate(documents))
+            self.bm25_indexes[shard] = (BM25Okapi(texts), documents)
 
             logger.info(f"BM25 index built with {len(texts)} documents")
 
@@ -233,24 +273,36 @@ class RetrievalOptimizer:
                 f"Failed to build BM25 index: {str(e)}"
             ) from e
 
-    def _bm25_retrieve(self, query: str, top_k: int) -> List[Document]:
+    def _bm25_retrieve(
+        self, query: str, top_k: int, where: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
         """
         BM25 keyword-based retrieval.
 
+        With a sharded store only the shards the filter can match are
+        searched. Each shard's index has its own IDF, so scores are scaled by
+        the best score in their shard before the results are merged.
+
         Args:
             query: User query
             top_k: Number of results to retrieve
+            where: Optional metadata filter dictionary
 
         Returns:
             List of Document objects
         """
         logger.debug(f"BM25 retrieval: top_k={top_k}")
 
-        # Build index if not exists
-        if self.bm25_index is None:
-            self._build_bm25_index()
+        # Build indexes if not exists
+        shards = self._bm25_shards(where)
+        missing = [shard for shard in shards if shard not in self.bm25_indexes]
+        if missing:
+            with stage("bm25_index"):
+                for shard in missing:
+                    self._build_bm25_index(shard)
 
-        if self.bm25_index is None:
+        indexes = [self.bm25_indexes[s] for s in shards if s in self.bm25_indexes]
+        if not indexes:
             logger.warning("BM25 index not available, returning empty results")
             return []
 
@@ -258,22 +310,24 @@ class RetrievalOptimizer:
             # Tokenize query
             query_tokens = query.lower().split()
 
-            # Get BM25 scores
-            scores = self.bm25_index.get_scores(query_tokens)
-
-            # Get top-k document indices
-            top_indices = sorted(
-                range(len(scores)),
-                key=lambda i: scores[i],
-                reverse=True,
-            )[:top_k]
-
-            # Retrieve documents
-            documents = [
-                self.bm25_document_map[idx]
-                for idx in top_indices
-                if idx in self.bm25_document_map
-            ]
+            scored: List[Tuple[float, Document]] = []
+            with stage("bm25", documents=sum(len(docs) for _, docs in indexes)):
+                for index, documents in indexes:
+                    # Get BM25 scores
+                    scores = index.get_scores(query_tokens)
+                    matched = [
+                        (float(score), document)
+                        for score, document in zip(scores, documents)
+                        if where is None or metadata_matches(document.metadata, where)
+                    ]
+                    best = max((score for score, _ in matched), default=0.0)
+                    if len(indexes) > 1 and best > 0:
+                        matched = [(score / best, doc) for score, doc in matched]
+                    scored.extend(matched)
+
+                # Get top-k documents
+                scored.sort(key=lambda item: item[0], reverse=True)
+            documents = [document for _, document in scored[:top_k]]
 
             logger.debug(f"BM25 retrieved {len(documents)} documents")
             return documents
@@ -282,7 +336,9 @@ class RetrievalOptimizer:
             logger.error(f"BM25 retrieval failed: {str(e)}", exc_info=True)
             raise RetrievalOptimizerError(f"BM25 retrieval failed: {str(e)}") from e
 
-    def _hybrid_retrieve(self, query: str, top_k: int) -> List[Document]:
+    def _hybrid_retrieve(
+        self, query: str, top_k: int, where: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
         """
         Hybrid retrieval combining semantic and BM25 search.
 
@@ -291,6 +347,7 @@ class RetrievalOptimizer:
         Args:
             query: User query
             top_k: Number of results to retrieve
+            where: Optional metadata filter dictionary
 
         Returns:
             List of Document objects
@@ -299,8 +356,8 @@ class RetrievalOptimizer:
 
         try:
             # Retrieve from both methods
-            semantic_docs = self._semantic_retrieve(query, top_k)
-            bm25_docs = self._bm25_retrieve(query, top_k)
+            semantic_docs = self._semantic_retrieve(query, top_k, where=where)
+            bm25_docs = self._bm25_retrieve(query, top_k, where=where)
 
             # Merge using Reciprocal Rank Fusion
             merged_docs = self._reciprocal_rank_fusion(semantic_docs, bm25_docs, top_k)
@@ -316,7 +373,7 @@ class RetrievalOptimizer:
             logger.error(f"Hybrid retrieval failed: {str(e)}", exc_info=True)
             # Fallback to semantic only
             logger.warning("Falling back to semantic retrieval only")
-            return self._semantic_retrieve(query, top_k)
+            return self._semantic_retrieve(query, top_k, where=where)
 
     def _reciprocal_rank_fusion(
         self,
@@ -394,7 +451,8 @@ class RetrievalOptimizer:
             pairs = [[query, doc.page_content] for doc in documents]
 
             # Get reranking scores
-            scores = self.reranker.predict(pairs)
+            with stage("rerank", documents=len(pairs)):
+                scores = self.reranker.predict(pairs)
 
             # Sort documents by score
             scored_docs = list(zip(documents, scores))
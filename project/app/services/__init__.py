@@ -5,6 +5,19 @@ This module contains services that run in the background to perform
 automated tasks such as news monitoring, scheduled jobs, etc.
 """
 
+from app.services.ingestion_jobs import (
+    IngestionJobError,
+    IngestionJobManager,
+    JobJournal,
+    get_job_manager,
+)
 from app.services.news_monitor import NewsMonitor, NewsMonitorError
 
-__all__ = ["NewsMonitor", "NewsMonitorError"]
+__all__ = [
+    "NewsMonitor",
+    "NewsMonitorError",
+    "IngestionJobManager",
+    "IngestionJobError",
+    "JobJournal",
+    "get_job_manager",
+]
@@ -0,0 +1,644 @@
+"""
+Resumable bulk ingestion jobs.
+
+A job is a batch of work items (document paths, stock tickers, RSS feeds)
+processed in the background by a small worker pool. Per-item status is
+checkpointed to a local SQLite journal after every item, so a restarted
+process resumes unfinished jobs from the first item that did not complete
+instead of starting over. A job whose in-flight item has already been
+attempted max_attempts times (e.g. an item that crashes the process) is
+marked failed instead of being resumed again.
+"""
+
+import json
+import sqlite3
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set
+
+from app.utils.config import config
+from app.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from app.ingestion.pipeline import IngestionPipeline
+
+logger = get_logger(__name__)
+
+# Job and item states
+STATUS_PENDING = "pending"
+STATUS_RUNNING = "running"
+STATUS_COMPLETED = "completed"
+STATUS_FAILED = "failed"
+STATUS_COMPLETED_WITH_ERRORS = "completed_with_errors"
+
+# Supported item kinds
+ITEM_DOCUMENT = "document"
+ITEM_TICKER = "ticker"
+ITEM_FEED = "feed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    options TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    error TEXT
+);
+CREATE TABLE IF NOT EXISTS job_items (
+    job_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    target TEXT NOT NULL,
+    status TEXT NOT NULL,
+    chunks_created INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (job_id, seq)
+);
+CREATE INDEX IF NOT EXISTS idx_job_items_status ON job_items (job_id, status);
+"""
+
+
+class IngestionJobError(Exception):
+    """Custom exception for ingestion job errors."""
+
+    pass
+
+
+def _now() -> str:
+    """Return the current UTC time as an ISO 8601 string."""
+    return datetime.now(timezone.utc).isoformat()
+
+
+class JobJournal:
+    """
+    SQLite-backed journal of ingestion jobs and their items.
+
+    Only status and chunk counts are persisted per item (not chunk IDs), so
+    memory and journal size stay bounded for very large batches.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Initialize job journal.
+
+        Args:
+            db_path: Path to SQLite database file (default: from config)
+
+        Raises:
+            IngestionJobError: If the journal cannot be opened
+        """
+        self.db_path = Path(db_path or config.ingestion_jobs_db_path)
+        self._lock = threading.Lock()
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                str(self.db_path), check_same_thread=False, isolation_level=None
+            )
+            self._conn.row_factory = sqlite3.Row
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+        except sqlite3.Error as e:
+            raise IngestionJobError(
+                f"Failed to open job journal {self.db_path}: {str(e)}"
+            ) from e
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def create_job(self, items: List[Dict[str, str]], options: Dict[str, Any]) -> str:
+        """
+        Record a new job and its items.
+
+        Args:
+            items: List of {"kind": ..., "target": ...} work items
+            options: Job-level processing options (e.g. store_embeddings)
+
+        Returns:
+            New job ID
+        """
+        job_id = uuid.uuid4().hex
+        now = _now()
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.execute(
+                "INSERT INTO jobs (job_id, status, options, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (job_id, STATUS_PENDING, json.dumps(options), now, now),
+            )
+            self._conn.executemany(
+                "INSERT INTO job_items (job_id, seq, kind, target, status, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (job_id, seq, item["kind"], item["target"], STATUS_PENDING, now)
+                    for seq, item in enumerate(items)
+                ],
+            )
+        return job_id
+
+    def set_job_status(
+        self, job_id: str, status: str, error: Optional[str] = None
+    ) -> None:
+        """
+        Update the status of a job.
+
+        Args:
+            job_id: Job ID
+            status: New status
+            error: Optional error message
+        """
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, updated_at = ? "
+                "WHERE job_id = ?",
+                (status, error, _now(), job_id),
+            )
+
+    def checkpoint_item(
+        self,
+        job_id: str,
+        seq: int,
+        status: str,
+        chunks_created: int = 0,
+        error: Optional[str] = None,
+    ) -> None:
+        """
+        Persist the status of a single item.
+
+        Args:
+            job_id: Job ID
+            seq: Item sequence number within the job
+            status: New item status
+            chunks_created: Number of chunks stored for the item
+            error: Optional error message
+        """
+        now = _now()
+        attempt_increment = 1 if status == STATUS_RUNNING else 0
+        with self._lock:
+            self._conn.execute(
+                "UPDATE job_items SET status = ?, chunks_created = ?, error = ?, "
+                "attempts = attempts + ?, updated_at = ? "
+                "WHERE job_id = ? AND seq = ?",
+                (status, chunks_created, error, attempt_increment, now, job_id, seq),
+            )
+            self._conn.execute(
+                "UPDATE jobs SET updated_at = ? WHERE job_id = ?", (now, job_id)
+            )
+
+    def next_items(self, job_id: str, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Fetch the next unfinished items of a job, in submission order.
+
+        Args:
+            job_id: Job ID
+            limit: Maximum number of items to return
+
+        Returns:
+            List of item dictionaries (seq, kind, target)
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT seq, kind, target FROM job_items "
+                "WHERE job_id = ? AND status IN (?, ?) ORDER BY seq LIMIT ?",
+                (job_id, STATUS_PENDING, STATUS_RUNNING, limit),
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def exhausted_items(self, job_id: str, max_attempts: int) -> List[Dict[str, Any]]:
+        """
+        List unfinished items that have used up their attempts.
+
+        Args:
+            job_id: Job ID
+            max_attempts: Maximum number of attempts per item
+
+        Returns:
+            List of item dictionaries (seq, kind, target, attempts)
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT seq, kind, target, attempts FROM job_items "
+                "WHERE job_id = ? AND status IN (?, ?) AND attempts >= ? "
+                "ORDER BY seq",
+                (job_id, STATUS_PENDING, STATUS_RUNNING, max_attempts),
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a job with aggregated item progress.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            Job dictionary, or None if the job does not exist
+        """
+        with self._lock:
+            job = self._conn.execute(
+                "SELECT * FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+            if job is None:
+                return None
+            counts = self._conn.execute(
+                "SELECT status, COUNT(*) AS n, SUM(chunks_created) AS chunks "
+                "FROM job_items WHERE job_id = ? GROUP BY status",
+                (job_id,),
+            ).fetchall()
+
+        by_status = {row["status"]: row["n"] for row in counts}
+        return {
+            "job_id": job["job_id"],
+            "status": job["status"],
+            "options": json.loads(job["options"]),
+            "created_at": job["created_at"],
+            "updated_at": job["updated_at"],
+            "error": job["error"],
+            "total_items": sum(by_status.values()),
+            "completed_items": by_status.get(STATUS_COMPLETED, 0),
+            "failed_items": by_status.get(STATUS_FAILED, 0),
+            "pending_items": by_status.get(STATUS_PENDING, 0)
+            + by_status.get(STATUS_RUNNING, 0),
+            "chunks_created": sum((row["chunks"] or 0) for row in counts),
+        }
+
+    def get_items(
+        self, job_id: str, status: Optional[str] = None, limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """
+        List items of a job.
+
+        Args:
+            job_id: Job ID
+            status: Optional status filter
+            limit: Maximum number of items to return
+
+        Returns:
+            List of item dictionaries
+        """
+        query = (
+            "SELECT seq, kind, target, status, chunks_created, attempts, error, "
+            "updated_at FROM job_items WHERE job_id = ?"
+        )
+        params: List[Any] = [job_id]
+        if status:
+            query += " AND status = ?"
+            params.append(status)
+        query += " ORDER BY seq LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def unfinished_job_ids(self) -> List[str]:
+        """
+        List jobs that have not reached a terminal state.
+
+        Returns:
+            List of job IDs, oldest first
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT job_id FROM jobs WHERE status IN (?, ?) ORDER BY created_at",
+                (STATUS_PENDING, STATUS_RUNNING),
+            ).fetchall()
+        return [row["job_id"] for row in rows]
+
+
+def _document_target(file_path: str) -> str:
+    """
+    Resolve a job file path, which must lie inside the documents directory.
+
+    Raises:
+        IngestionJobError: If the path resolves outside config.DOCUMENTS_DIR
+    """
+    path = Path(file_path).resolve()
+    if not path.is_relative_to(config.DOCUMENTS_DIR.resolve()):
+        raise IngestionJobError(
+            f"File path is outside the documents directory: {file_path}"
+        )
+    return str(path)
+
+
+class IngestionJobManager:
+    """
+    Background executor for resumable ingestion jobs.
+
+    Jobs are journaled before they are queued. Each worker processes one job
+    at a time, item by item, checkpointing after every item. Calling
+    resume_unfinished_jobs() after a restart re-queues every job that was
+    pending or running; items already completed or failed are skipped. Jobs
+    with an item that has reached max_attempts are marked failed instead.
+    """
+
+    def __init__(
+        self,
+        journal: Optional[JobJournal] = None,
+        pipeline_factory: Optional[Callable[[], Any]] = None,
+        max_workers: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+    ):
+        """
+        Initialize job manager.
+
+        Args:
+            journal: Job journal (default: JobJournal at config path)
+            pipeline_factory: Callable returning an IngestionPipeline
+                (default: app.ingestion.pipeline.create_pipeline). Called
+                lazily on first item so submitting jobs stays cheap.
+            max_workers: Number of concurrent jobs (default: from config)
+            max_attempts: Attempts per item before its job is marked failed
+                on resume (default: from config)
+        """
+        self.journal = journal or JobJournal()
+        self._pipeline_factory = pipeline_factory
+        self._pipeline: Optional["IngestionPipeline"] = None
+        self._pipeline_lock = threading.Lock()
+        self.max_workers = max_workers or config.ingestion_jobs_max_workers
+        self.max_attempts = max_attempts or config.ingestion_jobs_max_attempts
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="ingestion-job"
+        )
+        self._active: Set[str] = set()
+        self._active_lock = threading.Lock()
+        self._shutdown = threading.Event()
+
+    def _get_pipeline(self) -> Any:
+        """Create the ingestion pipeline on first use (shared by all workers)."""
+        if self._pipeline is None:
+            with self._pipeline_lock:
+                if self._pipeline is None:
+                    factory = self._pipeline_factory
+                    if factory is None:
+                        from app.ingestion.pipeline import create_pipeline
+
+                        factory = create_pipeline
+                    self._pipeline = factory()
+        return self._pipeline
+
+    def submit(
+        self,
+        file_paths: Optional[List[str]] = None,
+        tickers: Optional[List[str]] = None,
+        feed_urls: Optional[List[str]] = None,
+        store_embeddings: bool = True,
+    ) -> str:
+        """
+        Submit a batch ingestion job.
+
+        Args:
+            file_paths: Document file paths to ingest; each must resolve to
+                a file inside config.DOCUMENTS_DIR
+            tickers: Stock ticker symbols to ingest
+            feed_urls: RSS feed URLs to ingest
+            store_embeddings: Whether to store embeddings in ChromaDB
+
+        Returns:
+            Job ID
+
+        Raises:
+            IngestionJobError: If the batch is empty, a file path is outside
+                the documents directory, or the manager is shut down
+        """
+        if self._shutdown.is_set():
+            raise IngestionJobError("Job manager is shut down")
+
+        items = (
+            [
+                {"kind": ITEM_DOCUMENT, "target": _document_target(p)}
+                for p in file_paths or []
+            ]
+            + [{"kind": ITEM_TICKER, "target": t.upper()} for t in tickers or []]
+            + [{"kind": ITEM_FEED, "target": u} for u in feed_urls or []]
+        )
+        if not items:
+            raise IngestionJobError(
+                "Job must contain at least one file path, ticker, or feed URL"
+            )
+
+        job_id = self.journal.create_job(
+            items, options={"store_embeddings": store_embeddings}
+        )
+        logger.info(f"Submitted ingestion job {job_id} with {len(items)} items")
+        self._enqueue(job_id)
+        return job_id
+
+    def resume_unfinished_jobs(self) -> List[str]:
+        """
+        Re-queue jobs left pending or running by a previous process.
+
+        Jobs with an unfinished item that has already been attempted
+        max_attempts times are marked failed and not re-queued, so an item
+        that keeps crashing the process is not retried forever.
+
+        Returns:
+            List of resumed job IDs
+        """
+        job_ids = []
+        for job_id in self.journal.unfinished_job_ids():
+            exhausted = self.journal.exhausted_items(job_id, self.max_attempts)
+            if exhausted:
+                self._fail_exhausted_job(job_id, exhausted)
+                continue
+            self._enqueue(job_id)
+            job_ids.append(job_id)
+        if job_ids:
+            logger.info(f"Resuming {len(job_ids)} unfinished ingestion jobs")
+        return job_ids
+
+    def get_job(self, job_id: str, include_items: bool = False) -> Dict[str, Any]:
+        """
+        Get job status and progress.
+
+        Args:
+            job_id: Job ID
+            include_items: Include per-item status (first 100 items)
+
+        Returns:
+            Job dictionary
+
+        Raises:
+            IngestionJobError: If the job does not exist
+        """
+        job = self.journal.get_job(job_id)
+        if job is None:
+            raise IngestionJobError(f"Job not found: {job_id}")
+        if include_items:
+            job["items"] = self.journal.get_items(job_id)
+        return job
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop accepting jobs and stop workers after their current item.
+
+        Unfinished jobs stay pending/running in the journal and are picked up
+        by resume_unfinished_jobs() on the next start. The shared pipeline is
+        closed, which waits for its deferred news summaries.
+
+        Args:
+            wait: Wait for workers to finish their current item
+        """
+        self._shutdown.set()
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+        if self._pipeline is not None:
+            self._pipeline.close()
+
+    def _enqueue(self, job_id: str) -> None:
+        """Queue a job for execution unless it is already active."""
+        with self._active_lock:
+            if job_id in self._active:
+                return
+            self._active.add(job_id)
+        self._executor.submit(self._run_job, job_id)
+
+    def _fail_exhausted_job(self, job_id: str, items: List[Dict[str, Any]]) -> None:
+        """Mark items that used up their attempts, and their job, as failed."""
+        for item in items:
+            self.journal.checkpoint_item(
+                job_id,
+                item["seq"],
+                STATUS_FAILED,
+                error=f"Exceeded max attempts ({item['attempts']})",
+            )
+        first = items[0]
+        error = (
+            f"Item {first['seq']} ({first['kind']}={first['target']}) exceeded "
+            f"max attempts ({self.max_attempts})"
+        )
+        self.journal.set_job_status(job_id, STATUS_FAILED, error=error)
+        logger.error(f"Ingestion job {job_id} not resumed: {error}")
+
+    def _run_job(self, job_id: str) -> None:
+        """Process all unfinished items of a job, checkpointing each one."""
+        try:
+            job = self.journal.get_job(job_id)
+            if job is None:
+                return
+            store_embeddings = job["options"].get("store_embeddings", True)
+            self.journal.set_job_status(job_id, STATUS_RUNNING)
+
+            while not self._shutdown.is_set():
+                items = self.journal.next_items(job_id)
+                if not items:
+                    break
+                for item in items:
+                    if self._shutdown.is_set():
+                        logger.info(f"Job {job_id} interrupted by shutdown")
+                        return
+                    self._run_item(job_id, item, store_embeddings)
+            else:
+                return
+
+            job = self.journal.get_job(job_id)
+            final_status = (
+                STATUS_COMPLETED_WITH_ERRORS
+                if job and job["failed_items"]
+                else STATUS_COMPLETED
+            )
+            self.journal.set_job_status(job_id, final_status)
+            logger.info(
+                f"Ingestion job {job_id} finished: status={final_status}, "
+                f"completed={job['completed_items'] if job else 0}, "
+                f"failed={job['failed_items'] if job else 0}"
+            )
+        except Exception as e:
+            logger.error(f"Ingestion job {job_id} failed: {str(e)}", exc_info=True)
+            self.journal.set_job_status(job_id, STATUS_FAILED, error=str(e))
+        finally:
+            with self._active_lock:
+                self._active.discard(job_id)
+
+    def _run_item(
+        self, job_id: str, item: Dict[str, Any], store_embeddings: bool
+    ) -> None:
+        """Process one item and record its outcome in the journal."""
+        seq = item["seq"]
+        self.journal.checkpoint_item(job_id, seq, STATUS_RUNNING)
+        try:
+            chunk_ids = self._process_item(
+                item["kind"], item["target"], store_embeddings
+            )
+            self.journal.checkpoint_item(
+                job_id, seq, STATUS_COMPLETED, chunks_created=len(chunk_ids)
+            )
+        except Exception as e:
+            logger.warning(
+                f"Job {job_id} item {seq} ({item['kind']}={item['target']}) "
+                f"failed: {str(e)}"
+            )
+            self.journal.checkpoint_item(job_id, seq, STATUS_FAILED, error=str(e))
+
+    def _process_item(
+        self, kind: str, target: str, store_embeddings: bool
+    ) -> List[str]:
+        """
+        Dispatch a single item to the ingestion pipeline.
+
+        Args:
+            kind: Item kind (document, ticker, feed)
+            target: File path, ticker symbol, or feed URL
+            store_embeddings: Whether to store embeddings in ChromaDB
+
+        Returns:
+            List of chunk IDs created
+
+        Raises:
+            IngestionJobError: If the item kind is unknown
+        """
+        pipeline = self._get_pipeline()
+        if kind == ITEM_DOCUMENT:
+            return pipeline.process_document(
+                Path(target),
+                store_embeddings=store_embeddings,
+                skip_duplicates=config.ingestion_dedup_enabled,
+            )
+        if kind == ITEM_TICKER:
+            return pipeline.process_stock_data(
+                target, store_embeddings=store_embeddings
+            )
+        if kind == ITEM_FEED:
+            return pipeline.process_news(
+                feed_urls=[target], store_embeddings=store_embeddings
+            )
+        raise IngestionJobError(f"Unknown job item kind: {kind}")
+
+
+# Global job manager instance (lazy initialization)
+_job_manager: Optional[IngestionJobManager] = None
+_job_manager_lock = threading.Lock()
+
+
+def get_job_manager() -> IngestionJobManager:
+    """
+    Get or create the process-wide ingestion job manager.
+
+    Returns:
+        IngestionJobManager instance
+    """
+    global _job_manager
+    if _job_manager is None:
+        with _job_manager_lock:
+            if _job_manager is None:
+                _job_manager = IngestionJobManager()
+    return _job_manager
+
+
+def shutdown_job_manager() -> None:
+    """
+    Shut down the process-wide job manager, if it was created.
+
+    Unfinished jobs remain in the journal and resume on next start.
+    """
+    global _job_manager
+    with _job_manager_lock:
+        if _job_manager is not None:
+            _job_manager.shutdown(wait=False)
+            _job_manager = None
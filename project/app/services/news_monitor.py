@@ -3,22 +3,32 @@ Automated news monitoring service.
 
 Continuously monitors RSS feeds and news sources, automatically ingesting
 new articles and detecting relevant content based on configurable criteria.
+With news partitioning enabled, also applies the news retention policy once
+a day.
 """
 
 import threading
 from datetime import datetime
-from typing import Dict, List, Optional, Set
-
-from apscheduler.schedulers.background import BackgroundScheduler
-from apscheduler.triggers.interval import IntervalTrigger
+from typing import TYPE_CHECKING, Dict, List, Optional, Set
 
+from app.analysis.news_retention import NewsRetentionManager
 from app.ingestion.pipeline import IngestionPipeline, IngestionPipelineError
 from app.utils.config import config
+from app.utils.lazy_imports import lazy_attr
 from app.utils.logger import get_logger
-from app.vector_db.chroma_store import ChromaStore
+from app.vector_db import create_vector_store
+
+if TYPE_CHECKING:
+    from apscheduler.schedulers import background as apscheduler_background
 
 logger = get_logger(__name__)
 
+# The scheduler is only needed once monitoring is started
+BackgroundScheduler = lazy_attr(
+    "apscheduler.schedulers.background", "BackgroundScheduler"
+)
+IntervalTrigger = lazy_attr("apscheduler.triggers.interval", "IntervalTrigger")
+
 
 class NewsMonitorError(Exception):
     """Custom exception for news monitor errors."""
@@ -51,7 +61,7 @@ class NewsMonitor:
         Args:
             feed_urls: List of RSS feed URLs to monitor (default: from config)
             poll_interval_minutes: Polling interval in minutes (default: 30)
-            collection_name: ChromaDB collection name (default: "documents")
+            collection_name: Vector store collection name (default: "documents")
             enable_scraping: Whether to scrape full article content (default: True)
             filter_tickers: Optional list of ticker symbols to filter (default: None)
             filter_keywords: Optional list of keywords to filter (default: None)
@@ -77,7 +87,7 @@ class NewsMonitor:
         self.filter_categories = filter_categories or []
 
         # Service state
-        self.scheduler: Optional[BackgroundScheduler] = None
+        self.scheduler: Optional["apscheduler_background.BackgroundScheduler"] = None
         self.is_running = False
         self.is_paused = False
         self._shutdown_event = threading.Event()
@@ -107,14 +117,14 @@ class NewsMonitor:
                 f"Failed to initialize ingestion pipeline: {str(e)}"
             ) from e
 
-        # Initialize ChromaDB store for deduplication
+        # Initialize vector store for deduplication
         try:
-            logger.info("Initializing ChromaDB store for deduplication")
-            self.chroma_store = ChromaStore(collection_name=collection_name)
+            logger.info("Initializing vector store for deduplication")
+            self.chroma_store = create_vector_store(collection_name=collection_name)
         except Exception as e:
-            logger.error(f"Failed to initialize ChromaDB store: {str(e)}")
+            logger.error(f"Failed to initialize vector store: {str(e)}")
             raise NewsMonitorError(
-                f"Failed to initialize ChromaDB store: {str(e)}"
+                f"Failed to initialize vector store: {str(e)}"
             ) from e
 
         logger.info(
@@ -124,7 +134,7 @@ class NewsMonitor:
 
     def _check_article_exists(self, url: str) -> bool:
         """
-        Check if article URL already exists in ChromaDB.
+        Check if article URL already exists in the vector store.
 
         Args:
             url: Article URL to check
@@ -133,20 +143,12 @@ class NewsMonitor:
             True if article exists, False otherwise
         """
         try:
-            # Query ChromaDB for articles with this URL using metadata filter
-            results = self.chroma_store.query_by_text(
-                query_text=url[:50],  # Use first 50 chars as query
-                n_results=10,  # Get more results to check
-                where={"source_type": "news"},
+            # Exact metadata lookup (works without an embedding function)
+            ids = self.chroma_store.get_ids_by_metadata(
+                where={"$and": [{"type": "news_article"}, {"url": url}]},
+                limit=1,
             )
-
-            # Check if any results have matching URL in metadata
-            if results.get("metadatas"):
-                for metadata in results["metadatas"]:
-                    if metadata.get("url") == url:
-                        return True
-
-            return False
+            return bool(ids)
         except Exception as e:
             logger.warning(f"Error checking article existence: {str(e)}")
             # On error, assume article doesn't exist to avoid missing new articles
@@ -236,9 +238,9 @@ class NewsMonitor:
                             logger.debug(f"Article already processed: {article_url}")
                             continue
 
-                        # Check if article exists in ChromaDB
+                        # Check if article exists in the vector store
                         if self._check_article_exists(article_url):
-                            logger.debug(f"Article already in ChromaDB: {article_url}")
+                            logger.debug(f"Article already stored: {article_url}")
                             self.processed_urls.add(article_url)
                             continue
 
@@ -323,6 +325,21 @@ class NewsMonitor:
             self.stats["total_errors"] += 1
             self.stats["last_poll_success"] = False
 
+    def _apply_retention(self) -> None:
+        """
+        Expire news partitions older than the retention period.
+
+        This method is called daily by the scheduler when news partitioning
+        is enabled.
+        """
+        try:
+            expired = NewsRetentionManager(self.chroma_store).apply_retention()
+            if expired:
+                logger.info(f"Expired news partitions: {', '.join(expired)}")
+        except Exception as e:
+            logger.error(f"News retention failed: {str(e)}", exc_info=True)
+            self.stats["total_errors"] += 1
+
     def start(self) -> None:
         """
         Start the news monitoring service.
@@ -347,6 +364,14 @@ class NewsMonitor:
                 name="News Feed Polling",
                 replace_existing=True,
             )
+            if config.news_partitioning:
+                self.scheduler.add_job(
+                    func=self._apply_retention,
+                    trigger=IntervalTrigger(hours=24),
+                    id="news_retention",
+                    name="News Retention",
+                    replace_existing=True,
+                )
 
             # Start scheduler
             self.scheduler.start()
@@ -379,6 +404,8 @@ class NewsMonitor:
         try:
             if self.scheduler:
                 self.scheduler.shutdown(wait=True)
+            if self.pipeline is not None:
+                self.pipeline.close()
             self.is_running = False
             self._shutdown_event.set()
             logger.info("News monitoring service stopped")
@@ -9,7 +9,8 @@ from typing import Any, Dict, List
 
 import streamlit as st
 
-from app.vector_db.chroma_store import ChromaStore
+from app.ingestion.sec_company_directory import get_company_directory
+from app.vector_db import create_vector_store
 
 
 def get_available_tickers() -> List[Dict[str, Any]]:
@@ -21,22 +22,10 @@ def get_available_tickers() -> List[Dict[str, Any]]:
     """
     if "available_tickers" not in st.session_state:
         try:
-            store = ChromaStore()
+            store = create_vector_store()
             all_data = store.get_all()
 
-            # Ticker to company name mapping
-            ticker_to_company = {
-                "AAPL": "Apple Inc.",
-                "MSFT": "Microsoft Corporation",
-                "GOOGL": "Alphabet Inc.",
-                "AMZN": "Amazon.com Inc.",
-                "META": "Meta Platforms Inc.",
-                "TSLA": "Tesla, Inc.",
-                "NVDA": "NVIDIA Corporation",
-                "JPM": "JPMorgan Chase & Co.",
-                "V": "Visa Inc.",
-                "JNJ": "Johnson & Johnson",
-            }
+            directory = get_company_directory()
 
             # Get unique tickers and count documents
             ticker_counts = {}
@@ -48,7 +37,7 @@ def get_available_tickers() -> List[Dict[str, Any]]:
             # Create list of ticker info
             tickers = []
             for ticker in sorted(ticker_counts.keys()):
-                company_name = ticker_to_company.get(ticker, ticker)
+                company_name = directory.get_company_name(ticker) or ticker
                 count = ticker_counts[ticker]
                 tickers.append(
                     {"ticker": ticker, "company": company_name, "count": count}
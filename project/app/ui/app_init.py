@@ -8,6 +8,7 @@ import streamlit as st
 
 from app.rag import RAGQueryError, RAGQuerySystem, create_rag_system
 from app.ui.api_client import APIClient
+from app.utils.health import get_health_monitor
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -61,9 +62,12 @@ def initialize_rag_system(
             f"(provider={llm_provider}, model={llm_model})"
         )
         try:
-            st.session_state[cache_key] = create_rag_system(
+            rag_system = create_rag_system(
                 llm_provider=llm_provider, llm_model=llm_model
             )
+            st.session_state[cache_key] = rag_system
+            # Health checks use this store rather than opening their own
+            get_health_monitor().set_store(rag_system.chroma_store)
             logger.info("RAG system initialized successfully")
         except RAGQueryError as e:
             logger.error(f"Failed to initialize RAG system: {str(e)}", exc_info=True)
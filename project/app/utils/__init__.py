@@ -4,8 +4,6 @@ Utility functions and helpers.
 Common utilities used across the application.
 """
 
-# Lazy imports to avoid circular dependencies
-# Import document_processors last as it depends on app.rag which may import app.utils
 from app.utils.error_handlers import (
     handle_fetcher_errors,
     handle_ingestion_errors,
@@ -19,17 +17,22 @@ from app.utils.formatters import (
     format_metadata_section,
     format_time_series_for_rag,
 )
+from app.utils.lazy_imports import lazy_exports
+from app.utils.rate_limiter import TokenBucketRateLimiter, get_rate_limiter
 
-# Document processors import (has circular dependency risk)
-# Imported conditionally to avoid circular imports
-try:
-    from app.utils.document_processors import generate_and_store_embeddings
-except ImportError:
-    # If circular import occurs, this will be None and can be imported directly
-    generate_and_store_embeddings = None  # type: ignore
+# Document processors depend on app.rag (embeddings, LLM clients), which is
+# expensive to import and may import app.utils. Resolve on first access only.
+__getattr__, __dir__ = lazy_exports(
+    globals(),
+    {
+        "generate_and_store_embeddings": "app.utils.document_processors",
+        "create_http_session": "app.utils.http_client",
+    },
+)
 
 __all__ = [
     "generate_and_store_embeddings",
+    "create_http_session",
     "format_time_series_for_rag",
     "format_dataframe_for_rag",
     "format_event_for_rag",
@@ -39,4 +42,6 @@ __all__ = [
     "handle_fetcher_errors",
     "safe_execute",
     "log_and_track_error",
+    "TokenBucketRateLimiter",
+    "get_rate_limiter",
 ]
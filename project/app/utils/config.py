@@ -105,10 +105,109 @@ class Config(BaseSettings):
         alias="CHROMA_PERSIST_DIRECTORY",
         description="ChromaDB persist directory",
     )
+    chroma_hnsw_space: str = Field(
+        default="l2",
+        alias="CHROMA_HNSW_SPACE",
+        description="Distance space of new ChromaDB collections: l2, cosine or ip",
+    )
+    chroma_hnsw_m: int = Field(
+        default=16,
+        ge=2,
+        le=128,
+        alias="CHROMA_HNSW_M",
+        description="Neighbours per node (max_neighbors) of new ChromaDB collections",
+    )
+    chroma_hnsw_ef_construction: int = Field(
+        default=100,
+        ge=1,
+        alias="CHROMA_HNSW_EF_CONSTRUCTION",
+        description="HNSW candidate list size while inserting (new collections)",
+    )
+    chroma_hnsw_ef_search: int = Field(
+        default=100,
+        ge=1,
+        alias="CHROMA_HNSW_EF_SEARCH",
+        description="HNSW candidate list size while searching ChromaDB collections",
+    )
+
+    # Vector Store Configuration
+    vector_store_backend: str = Field(
+        default="chroma",
+        alias="VECTOR_STORE_BACKEND",
+        description="Vector store backend: chroma or hnsw",
+    )
+    vector_store_sharding: bool = Field(
+        default=False,
+        alias="VECTOR_STORE_SHARDING",
+        description=(
+            "Split collections into per-domain shards (filings, news, "
+            "transcripts, market, economic, alternative, general)"
+        ),
+    )
+    vector_store_shard_workers: int = Field(
+        default=4,
+        ge=1,
+        alias="VECTOR_STORE_SHARD_WORKERS",
+        description="Shards queried concurrently by one sharded store",
+    )
+    hnsw_store_dir: str = Field(
+        default="./data/hnsw",
+        alias="HNSW_STORE_DIR",
+        description="Directory of the HNSW store (one folder per collection)",
+    )
+    hnsw_store_space: str = Field(
+        default="l2",
+        alias="HNSW_STORE_SPACE",
+        description="Distance space of new HNSW collections: l2, cosine or ip",
+    )
+    hnsw_store_m: int = Field(
+        default=16,
+        ge=2,
+        le=128,
+        alias="HNSW_STORE_M",
+        description="Neighbours per HNSW node (2*M on the bottom layer)",
+    )
+    hnsw_store_ef_construction: int = Field(
+        default=100,
+        ge=1,
+        alias="HNSW_STORE_EF_CONSTRUCTION",
+        description="HNSW candidate list size while inserting",
+    )
+    hnsw_store_ef_search: int = Field(
+        default=64,
+        ge=1,
+        alias="HNSW_STORE_EF_SEARCH",
+        description="HNSW candidate list size while searching",
+    )
+    hnsw_store_read_only: bool = Field(
+        default=False,
+        alias="HNSW_STORE_READ_ONLY",
+        description="Open HNSW collections read-only (e.g. in API workers)",
+    )
+    hnsw_store_quantization: str = Field(
+        default="none",
+        alias="HNSW_STORE_QUANTIZATION",
+        description=(
+            "Vector codes new HNSW collections are searched with: none (float16) "
+            "or int8 (rescored with float16 vectors)"
+        ),
+    )
+    hnsw_store_rescore_factor: int = Field(
+        default=4,
+        ge=1,
+        alias="HNSW_STORE_RESCORE_FACTOR",
+        description="Candidates per result rescored by quantized HNSW search",
+    )
+    hnsw_store_sync_threshold: int = Field(
+        default=1000,
+        ge=1,
+        alias="HNSW_STORE_SYNC_THRESHOLD",
+        description="Vectors added to an HNSW collection before its index is saved",
+    )
 
     # Application Configuration
     max_document_size_mb: int = Field(
-        default=10,
+        default=200,
         ge=1,
         alias="MAX_DOCUMENT_SIZE_MB",
         description="Maximum document size in MB",
@@ -189,6 +288,21 @@ class Config(BaseSettings):
         alias="HEALTH_CHECK_PORT",
         description="Port for health check HTTP server",
     )
+    health_check_interval_seconds: float = Field(
+        default=15.0,
+        gt=0.0,
+        alias="HEALTH_CHECK_INTERVAL_SECONDS",
+        description="Seconds between background refreshes of component health",
+    )
+    health_check_stale_seconds: float = Field(
+        default=60.0,
+        gt=0.0,
+        alias="HEALTH_CHECK_STALE_SECONDS",
+        description=(
+            "Age after which the cached health snapshot is stale and "
+            "readiness probes fail"
+        ),
+    )
 
     # RAG Optimization Configuration
     rag_use_hybrid_search: bool = Field(
@@ -244,6 +358,32 @@ class Config(BaseSettings):
         alias="RAG_FEW_SHOT_EXAMPLES",
         description="Include few-shot examples in prompts",
     )
+    rag_numeric_lookup_enabled: bool = Field(
+        default=True,
+        alias="RAG_NUMERIC_LOOKUP_ENABLED",
+        description=(
+            "Answer numeric fact questions (e.g. 'AAPL revenue 2023') directly "
+            "from the XBRL fact store, skipping retrieval and the LLM"
+        ),
+    )
+    rag_tracing_enabled: bool = Field(
+        default=True,
+        alias="RAG_TRACING_ENABLED",
+        description="Export per-stage latency spans of RAG queries",
+    )
+    rag_tracing_exporters: str = Field(
+        default="prometheus",
+        alias="RAG_TRACING_EXPORTERS",
+        description=(
+            "Comma-separated trace exporters: 'prometheus' (stage histograms), "
+            "'otlp_file' (OTLP/JSON lines in RAG_TRACE_FILE)"
+        ),
+    )
+    rag_trace_file: str = Field(
+        default="./data/traces/rag_spans.jsonl",
+        alias="RAG_TRACE_FILE",
+        description="Output file of the otlp_file trace exporter",
+    )
 
     # Conversation Memory Configuration
     conversation_enabled: bool = Field(
@@ -372,6 +512,27 @@ class Config(BaseSettings):
             "(1m, 2m, 5m, 15m, 30m, 60m, 90m, 1h, 1d, 5d, 1wk, 1mo, 3mo)"
         ),
     )
+    yfinance_requests_per_second: float = Field(
+        default=25.0,
+        gt=0.0,
+        le=100.0,
+        alias="YFINANCE_REQUESTS_PER_SECOND",
+        description="Request rate shared by all threads in bulk yfinance fetches",
+    )
+    yfinance_max_workers: int = Field(
+        default=16,
+        ge=1,
+        le=64,
+        alias="YFINANCE_MAX_WORKERS",
+        description="Concurrent threads for per-ticker data in bulk yfinance fetches",
+    )
+    yfinance_bulk_batch_size: int = Field(
+        default=100,
+        ge=1,
+        le=1000,
+        alias="YFINANCE_BULK_BATCH_SIZE",
+        description="Tickers per batched multi-ticker price history download",
+    )
 
     # Enhanced EDGAR Integration Configuration (TASK-032)
     edgar_enhanced_parsing: bool = Field(
@@ -389,6 +550,46 @@ class Config(BaseSettings):
         alias="EDGAR_XBRL_ENABLED",
         description="Enable XBRL financial statement extraction",
     )
+    xbrl_fact_store_enabled: bool = Field(
+        default=True,
+        alias="XBRL_FACT_STORE_ENABLED",
+        description="Store numeric XBRL facts in the local fact store during ingestion",
+    )
+    xbrl_fact_store_path: str = Field(
+        default="./data/xbrl/xbrl_facts.db",
+        alias="XBRL_FACT_STORE_PATH",
+        description="Path to SQLite database of numeric XBRL facts",
+    )
+    edgar_requests_per_second: float = Field(
+        default=10.0,
+        gt=0.0,
+        le=10.0,
+        alias="EDGAR_REQUESTS_PER_SECOND",
+        description=(
+            "Request rate shared by all EDGAR fetchers and threads "
+            "(SEC fair-access limit is 10 req/s)"
+        ),
+    )
+    edgar_max_workers: int = Field(
+        default=8,
+        ge=1,
+        le=32,
+        alias="EDGAR_MAX_WORKERS",
+        description="Concurrent download threads for multi-ticker EDGAR harvesting",
+    )
+
+    # SEC Company Directory Configuration
+    sec_company_directory_path: str = Field(
+        default="./data/sec/company_tickers.json",
+        alias="SEC_COMPANY_DIRECTORY_PATH",
+        description="Persisted SEC ticker/CIK/company-name directory",
+    )
+    sec_company_directory_refresh_hours: float = Field(
+        default=24.0,
+        gt=0.0,
+        alias="SEC_COMPANY_DIRECTORY_REFRESH_HOURS",
+        description="Age after which the company directory is re-downloaded",
+    )
 
     # Earnings Call Transcripts Configuration (TASK-033)
     # Uses API Ninjas Earnings Call Transcript API (recommended)
@@ -477,6 +678,31 @@ class Config(BaseSettings):
             "LLM model for summarization. " "If empty, uses default for provider"
         ),
     )
+    news_summarization_max_concurrency: int = Field(
+        default=8,
+        ge=1,
+        le=64,
+        alias="NEWS_SUMMARIZATION_MAX_CONCURRENCY",
+        description="Maximum concurrent LLM requests when summarizing articles",
+    )
+    news_summarization_cache_enabled: bool = Field(
+        default=True,
+        alias="NEWS_SUMMARIZATION_CACHE_ENABLED",
+        description="Reuse stored summaries of identical article content",
+    )
+    news_summarization_cache_path: str = Field(
+        default="./data/news/summary_cache.db",
+        alias="NEWS_SUMMARIZATION_CACHE_PATH",
+        description="Path to SQLite cache of article summaries",
+    )
+    news_summarization_deferred: bool = Field(
+        default=False,
+        alias="NEWS_SUMMARIZATION_DEFERRED",
+        description=(
+            "Store news articles without waiting for summaries and attach "
+            "summaries to the stored chunks in the background"
+        ),
+    )
 
     # News Trend Analysis Configuration (TASK-047)
     news_trends_enabled: bool = Field(
@@ -521,6 +747,37 @@ class Config(BaseSettings):
         description="Minimum mentions to include in trending analysis (default: 2)",
     )
 
+    # News Partitioning Configuration
+    news_partitioning: bool = Field(
+        default=False,
+        alias="NEWS_PARTITIONING",
+        description=(
+            "Store news chunks in weekly partitions of the news shard "
+            "(enables vector store sharding)"
+        ),
+    )
+    news_partition_db: str = Field(
+        default="./data/news_partitions.db",
+        alias="NEWS_PARTITION_DB",
+        description="SQLite catalog of news partitions and their roll-ups",
+    )
+    news_retention_weeks: int = Field(
+        default=12,
+        ge=1,
+        alias="NEWS_RETENTION_WEEKS",
+        description="Weeks of raw news chunks kept before partitions expire",
+    )
+    news_retention_action: str = Field(
+        default="drop",
+        alias="NEWS_RETENTION_ACTION",
+        description="What happens to expired partitions: drop or archive",
+    )
+    news_archive_dir: str = Field(
+        default="./data/news_archive",
+        alias="NEWS_ARCHIVE_DIR",
+        description="Directory of archived news partitions (JSON Lines, gzip)",
+    )
+
     # Alternative Data Sources Configuration (TASK-044)
     social_media_enabled: bool = Field(
         default=False,
@@ -807,6 +1064,21 @@ class Config(BaseSettings):
         description="Rate limit between IMF API requests in seconds",
     )
 
+    # Time-Series Store Configuration
+    timeseries_store_enabled: bool = Field(
+        default=True,
+        alias="TIMESERIES_STORE_ENABLED",
+        description=(
+            "Keep FRED, World Bank, IMF and yfinance series in a local Parquet "
+            "store and fetch only new observations"
+        ),
+    )
+    timeseries_store_dir: str = Field(
+        default="./data/timeseries",
+        alias="TIMESERIES_STORE_DIR",
+        description="Directory of the local time-series store (one folder per source)",
+    )
+
     # Central Bank Data Configuration (TASK-038)
     central_bank_enabled: bool = Field(
         default=True,
@@ -828,6 +1100,40 @@ class Config(BaseSettings):
         alias="CENTRAL_BANK_USE_WEB_SCRAPING",
         description="Enable web scraping for central bank data (FOMC website)",
     )
+    central_bank_max_workers: int = Field(
+        default=4,
+        ge=1,
+        le=16,
+        alias="CENTRAL_BANK_MAX_WORKERS",
+        description=(
+            "Concurrent central bank document downloads "
+            "(requests stay within the per-host rate limit)"
+        ),
+    )
+    central_bank_index_enabled: bool = Field(
+        default=True,
+        alias="CENTRAL_BANK_INDEX_ENABLED",
+        description=(
+            "Record ingested communications so refreshes only fetch new documents"
+        ),
+    )
+    central_bank_index_path: str = Field(
+        default="./data/central_bank/communications.db",
+        alias="CENTRAL_BANK_INDEX_PATH",
+        description="SQLite index of ingested central bank communications",
+    )
+    # FOMC statements and minutes are occasionally revised in place, so they
+    # are not cached as immutable; recent ones are revalidated on refresh
+    central_bank_revalidate_limit: int = Field(
+        default=8,
+        ge=0,
+        le=1000,
+        alias="CENTRAL_BANK_REVALIDATE_LIMIT",
+        description=(
+            "Most recent indexed communications revalidated per refresh "
+            "to pick up revisions"
+        ),
+    )
 
     # Financial Sentiment Analysis Configuration (TASK-039)
     sentiment_enabled: bool = Field(
@@ -890,6 +1196,111 @@ class Config(BaseSettings):
         description="Minimum word length for keyword extraction",
     )
 
+    # Document Upload Configuration
+    ingestion_upload_chunk_bytes: int = Field(
+        default=1024 * 1024,
+        ge=4096,
+        le=64 * 1024 * 1024,
+        alias="INGESTION_UPLOAD_CHUNK_BYTES",
+        description="Read/write chunk size for streamed uploads in bytes",
+    )
+    ingestion_dedup_enabled: bool = Field(
+        default=True,
+        alias="INGESTION_DEDUP_ENABLED",
+        description=(
+            "Skip uploads and job files whose content hash is already ingested"
+        ),
+    )
+    ingestion_embedding_batch_size: int = Field(
+        default=64,
+        ge=1,
+        le=2048,
+        alias="INGESTION_EMBEDDING_BATCH_SIZE",
+        description=(
+            "Number of streamed document chunks embedded and stored per batch"
+        ),
+    )
+
+    # HTTP Client Cache Configuration
+    http_cache_enabled: bool = Field(
+        default=True,
+        alias="HTTP_CACHE_ENABLED",
+        description="Cache fetcher GET responses on disk",
+    )
+    http_cache_dir: str = Field(
+        default="./data/http_cache",
+        alias="HTTP_CACHE_DIR",
+        description="Directory of the content-addressed HTTP response cache",
+    )
+    http_cache_mode: str = Field(
+        default="normal",
+        alias="HTTP_CACHE_MODE",
+        description=(
+            "HTTP cache mode: normal (cache with TTL), record (always fetch and "
+            "store), replay (serve only from cache, no network)"
+        ),
+    )
+    http_cache_ttl_seconds: int = Field(
+        default=3600,
+        ge=0,
+        alias="HTTP_CACHE_TTL_SECONDS",
+        description="Freshness lifetime of mutable cached responses in seconds",
+    )
+    http_cache_immutable_patterns: str = Field(
+        default=r"^https://www\.sec\.gov/Archives/edgar/data/",
+        alias="HTTP_CACHE_IMMUTABLE_PATTERNS",
+        description=(
+            "Comma-separated URL regexes whose responses never change "
+            "and are cached forever"
+        ),
+    )
+    http_host_rate_limits: str = Field(
+        default="sec.gov=10",
+        alias="HTTP_HOST_RATE_LIMITS",
+        description=(
+            "Comma-separated host=requests_per_second limits shared by all "
+            "sessions (host matches its subdomains)"
+        ),
+    )
+    http_pool_connections: int = Field(
+        default=16,
+        ge=1,
+        alias="HTTP_POOL_CONNECTIONS",
+        description="Number of per-host connection pools kept by the shared adapter",
+    )
+    http_pool_maxsize: int = Field(
+        default=32,
+        ge=1,
+        alias="HTTP_POOL_MAXSIZE",
+        description="Maximum keep-alive connections per host pool",
+    )
+
+    # Bulk Ingestion Jobs Configuration
+    ingestion_jobs_db_path: str = Field(
+        default="./data/jobs/ingestion_jobs.db",
+        alias="INGESTION_JOBS_DB_PATH",
+        description="Path to SQLite journal for resumable ingestion jobs",
+    )
+    ingestion_jobs_max_workers: int = Field(
+        default=2,
+        ge=1,
+        le=32,
+        alias="INGESTION_JOBS_MAX_WORKERS",
+        description="Number of ingestion jobs processed concurrently",
+    )
+    ingestion_jobs_max_attempts: int = Field(
+        default=3,
+        ge=1,
+        le=100,
+        alias="INGESTION_JOBS_MAX_ATTEMPTS",
+        description="Attempts per job item before its job is marked failed on resume",
+    )
+    ingestion_jobs_resume_on_startup: bool = Field(
+        default=True,
+        alias="INGESTION_JOBS_RESUME_ON_STARTUP",
+        description="Resume unfinished ingestion jobs when the API starts",
+    )
+
     # Project paths (computed fields)
     _project_root: Optional[Path] = None
     _data_dir: Optional[Path] = None
@@ -914,6 +1325,79 @@ class Config(BaseSettings):
             return v.lower() in ("true", "1", "yes", "on")
         return bool(v)
 
+    @field_validator("http_cache_mode")
+    @classmethod
+    def validate_http_cache_mode(cls, v: str) -> str:
+        """Validate HTTP cache mode."""
+        valid_modes = {"normal", "record", "replay"}
+        v_lower = v.lower()
+        if v_lower not in valid_modes:
+            raise ValueError(
+                f"Invalid HTTP cache mode: {v}. Must be one of {valid_modes}"
+            )
+        return v_lower
+
+    @field_validator("chroma_hnsw_space")
+    @classmethod
+    def validate_chroma_hnsw_space(cls, v: str) -> str:
+        """Validate ChromaDB distance space."""
+        valid_spaces = {"l2", "cosine", "ip"}
+        v_lower = v.lower()
+        if v_lower not in valid_spaces:
+            raise ValueError(
+                f"Invalid ChromaDB HNSW space: {v}. Must be one of {valid_spaces}"
+            )
+        return v_lower
+
+    @field_validator("vector_store_backend")
+    @classmethod
+    def validate_vector_store_backend(cls, v: str) -> str:
+        """Validate vector store backend."""
+        valid_backends = {"chroma", "hnsw"}
+        v_lower = v.lower()
+        if v_lower not in valid_backends:
+            raise ValueError(
+                f"Invalid vector store backend: {v}. Must be one of {valid_backends}"
+            )
+        return v_lower
+
+    @field_validator("hnsw_store_space")
+    @classmethod
+    def validate_hnsw_store_space(cls, v: str) -> str:
+        """Validate HNSW distance space."""
+        valid_spaces = {"l2", "cosine", "ip"}
+        v_lower = v.lower()
+        if v_lower not in valid_spaces:
+            raise ValueError(
+                f"Invalid HNSW store space: {v}. Must be one of {valid_spaces}"
+            )
+        return v_lower
+
+    @field_validator("hnsw_store_quantization")
+    @classmethod
+    def validate_hnsw_store_quantization(cls, v: str) -> str:
+        """Validate HNSW quantization."""
+        valid_quantizations = {"none", "int8"}
+        v_lower = v.lower()
+        if v_lower not in valid_quantizations:
+            raise ValueError(
+                f"Invalid HNSW store quantization: {v}. "
+                f"Must be one of {valid_quantizations}"
+            )
+        return v_lower
+
+    @field_validator("news_retention_action")
+    @classmethod
+    def validate_news_retention_action(cls, v: str) -> str:
+        """Validate news retention action."""
+        valid_actions = {"drop", "archive"}
+        v_lower = v.lower()
+        if v_lower not in valid_actions:
+            raise ValueError(
+                f"Invalid news retention action: {v}. Must be one of {valid_actions}"
+            )
+        return v_lower
+
     @field_validator("log_level")
     @classmethod
     def validate_log_level(cls, v: str) -> str:
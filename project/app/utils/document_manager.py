@@ -12,7 +12,7 @@ from typing import Any, Dict, List, Optional
 
 from app.ingestion.pipeline import IngestionPipeline, IngestionPipelineError
 from app.utils.logger import get_logger
-from app.vector_db.chroma_store import ChromaStore, ChromaStoreError
+from app.vector_db import VectorStore, VectorStoreError, create_vector_store
 
 logger = get_logger(__name__)
 
@@ -32,19 +32,19 @@ class DocumentManager:
 
     def __init__(
         self,
-        chroma_store: Optional[ChromaStore] = None,
+        chroma_store: Optional[VectorStore] = None,
         ingestion_pipeline: Optional[IngestionPipeline] = None,
     ):
         """
         Initialize document manager.
 
         Args:
-            chroma_store: Optional ChromaStore instance.
-                If None, creates a new one.
+            chroma_store: Optional VectorStore instance.
+                If None, creates one with the configured backend.
             ingestion_pipeline: Optional IngestionPipeline instance.
                 If None, creates a new one.
         """
-        self.chroma_store = chroma_store or ChromaStore()
+        self.chroma_store = chroma_store or create_vector_store()
         # If ingestion pipeline is provided, use it;
         # otherwise create one that shares the same store
         if ingestion_pipeline is None:
@@ -93,7 +93,7 @@ class DocumentManager:
 
             logger.debug(f"Retrieved {len(documents)} documents")
             return documents
-        except ChromaStoreError as e:
+        except VectorStoreError as e:
             logger.error(f"Failed to get all documents: {str(e)}", exc_info=True)
             raise DocumentManagerError(f"Failed to get all documents: {str(e)}") from e
 
@@ -170,7 +170,7 @@ class DocumentManager:
                     "content": result["documents"][0] if result["documents"] else "",
                 }
             return None
-        except ChromaStoreError as e:
+        except VectorStoreError as e:
             logger.error(f"Failed to get document by ID: {str(e)}", exc_info=True)
             raise DocumentManagerError(f"Failed to get document by ID: {str(e)}") from e
 
@@ -194,7 +194,7 @@ class DocumentManager:
             deleted_count = self.chroma_store.delete_documents(ids=doc_ids)
             logger.info(f"Deleted {deleted_count} documents: {doc_ids}")
             return deleted_count
-        except ChromaStoreError as e:
+        except VectorStoreError as e:
             logger.error(f"Failed to delete documents: {str(e)}", exc_info=True)
             raise DocumentManagerError(f"Failed to delete documents: {str(e)}") from e
 
@@ -232,7 +232,7 @@ class DocumentManager:
                 f"form_type={form_type}"
             )
             return deleted_count
-        except (ChromaStoreError, ValueError) as e:
+        except (VectorStoreError, ValueError) as e:
             logger.error(
                 f"Failed to delete documents by metadata: {str(e)}", exc_info=True
             )
@@ -5,14 +5,20 @@ Provides common functions for chunking, embedding generation, and storage
 that are used across multiple data source processors.
 """
 
-from typing import List
+from itertools import islice
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from langchain_core.documents import Document
 
 from app.rag.embedding_factory import EmbeddingGenerator
+from app.utils.config import config
 from app.utils.logger import get_logger
 from app.utils.metrics import document_chunks_created
-from app.vector_db import ChromaStore, ChromaStoreError
+from app.utils.tracing import stage
+from app.vector_db import VectorStore, VectorStoreError
+
+if TYPE_CHECKING:
+    from app.ingestion.document_loader import DocumentChunk
 
 logger = get_logger(__name__)
 
@@ -20,7 +26,7 @@ logger = get_logger(__name__)
 def generate_and_store_embeddings(
     chunks: List[Document],
     embedding_generator: EmbeddingGenerator,
-    chroma_store: ChromaStore,
+    chroma_store: VectorStore,
     store_embeddings: bool = True,
     source_name: str = "documents",
 ) -> List[str]:
@@ -36,7 +42,7 @@ def generate_and_store_embeddings(
     Args:
         chunks: List of Document chunks to process
         embedding_generator: EmbeddingGenerator instance
-        chroma_store: ChromaStore instance
+        chroma_store: VectorStore instance
         store_embeddings: Whether to store embeddings in ChromaDB (default: True)
         source_name: Name of data source for logging (default: "documents")
 
@@ -46,7 +52,7 @@ def generate_and_store_embeddings(
     Raises:
         ValueError: If embedding count doesn't match chunk count
         EmbeddingError: If embedding generation fails
-        ChromaStoreError: If storage fails
+        VectorStoreError: If storage fails
     """
     if not chunks:
         logger.warning(f"No chunks provided for {source_name}")
@@ -54,7 +60,8 @@ def generate_and_store_embeddings(
 
     logger.debug(f"Generating embeddings for {len(chunks)} {source_name} chunks")
     texts = [chunk.page_content for chunk in chunks]
-    embeddings = embedding_generator.embed_documents(texts)
+    with stage("embed", chunks=len(chunks)):
+        embeddings = embedding_generator.embed_documents(texts)
 
     if len(embeddings) != len(chunks):
         error_msg = (
@@ -73,12 +80,13 @@ def generate_and_store_embeddings(
     if store_embeddings:
         logger.debug(f"Storing {len(chunks)} {source_name} chunks in ChromaDB")
         try:
-            ids = chroma_store.add_documents(chunks, embeddings)
+            with stage("write", chunks=len(chunks)):
+                ids = chroma_store.add_documents(chunks, embeddings)
             logger.info(
                 f"Successfully stored {len(ids)} {source_name} chunks in ChromaDB"
             )
             return ids
-        except ChromaStoreError as e:
+        except VectorStoreError as e:
             logger.error(f"ChromaDB storage failed for {source_name}: {str(e)}")
             raise
     else:
@@ -86,3 +94,107 @@ def generate_and_store_embeddings(
             f"Skipping ChromaDB storage for {source_name} (store_embeddings=False)"
         )
         return [f"chunk_{i}" for i in range(len(chunks))]
+
+
+def generate_and_store_embeddings_streaming(
+    chunks: Iterable[Union[Document, "DocumentChunk"]],
+    embedding_generator: EmbeddingGenerator,
+    chroma_store: VectorStore,
+    store_embeddings: bool = True,
+    source_name: str = "documents",
+    batch_size: Optional[int] = None,
+) -> List[str]:
+    """
+    Embed and store chunks from an iterator in fixed-size batches.
+
+    Only one batch of chunk texts and embeddings is held in memory at a time,
+    so documents of any size can be ingested with a bounded memory ceiling.
+    Accepts LangChain Documents or DocumentChunk objects from
+    DocumentLoader.iter_document_chunks().
+
+    If any batch fails, the chunks this call already stored are deleted
+    again before the error is re-raised. Otherwise a partially stored
+    document would carry its content_hash and be skipped as already
+    ingested on retry.
+
+    Args:
+        chunks: Iterable of chunks (consumed lazily)
+        embedding_generator: EmbeddingGenerator instance
+        chroma_store: VectorStore instance
+        store_embeddings: Whether to store embeddings in ChromaDB (default: True)
+        source_name: Name of data source for logging (default: "documents")
+        batch_size: Chunks per embedding batch.
+            If None, uses config.ingestion_embedding_batch_size
+
+    Returns:
+        List of document chunk IDs stored in ChromaDB (empty if no chunks)
+
+    Raises:
+        ValueError: If embedding count doesn't match chunk count
+        EmbeddingError: If embedding generation fails
+        VectorStoreError: If storage fails
+    """
+    batch_size = batch_size or config.ingestion_embedding_batch_size
+    iterator = iter(chunks)
+    all_ids: List[str] = []
+    total = 0
+
+    try:
+        while True:
+            with stage("chunk"):
+                batch = [
+                    chunk if isinstance(chunk, Document) else chunk.to_document()
+                    for chunk in islice(iterator, batch_size)
+                ]
+            if not batch:
+                break
+
+            texts = [chunk.page_content for chunk in batch]
+            with stage("embed", chunks=len(batch)):
+                embeddings = embedding_generator.embed_documents(texts)
+            if len(embeddings) != len(batch):
+                error_msg = (
+                    f"Embedding count ({len(embeddings)}) does not match "
+                    f"chunk count ({len(batch)}) for {source_name}"
+                )
+                logger.error(error_msg)
+                raise ValueError(error_msg)
+
+            if store_embeddings:
+                try:
+                    with stage("write", chunks=len(batch)):
+                        all_ids.extend(chroma_store.add_documents(batch, embeddings))
+                except VectorStoreError as e:
+                    logger.error(f"ChromaDB storage failed for {source_name}: {str(e)}")
+                    raise
+            else:
+                all_ids.extend(f"chunk_{total + i}" for i in range(len(batch)))
+
+            total += len(batch)
+            logger.debug(f"Embedded batch of {len(batch)} {source_name} chunks")
+    except Exception:
+        if store_embeddings and all_ids:
+            _rollback_stored_chunks(chroma_store, all_ids, source_name)
+        raise
+
+    if total:
+        document_chunks_created.observe(total)
+        logger.info(f"Processed {total} {source_name} chunks in streaming batches")
+    return all_ids
+
+
+def _rollback_stored_chunks(
+    chroma_store: VectorStore, ids: List[str], source_name: str
+) -> None:
+    """Delete chunks stored by a streaming ingestion that failed partway."""
+    try:
+        deleted = chroma_store.delete_documents(ids=ids)
+        logger.warning(
+            f"Rolled back {deleted} partially stored {source_name} chunks "
+            "after ingestion failure"
+        )
+    except (VectorStoreError, ValueError) as e:
+        logger.error(
+            f"Failed to roll back {len(ids)} partially stored {source_name} "
+            f"chunks: {str(e)}"
+        )
@@ -27,7 +27,7 @@ def handle_ingestion_errors(
     Decorator for consistent error handling in ingestion operations.
 
     Handles common exceptions (DocumentIngestionError, EmbeddingError,
-    ChromaStoreError) and provides standardized logging and error tracking.
+    VectorStoreError) and provides standardized logging and error tracking.
 
     Args:
         operation_name: Name of the operation for logging
@@ -46,7 +46,7 @@ def handle_ingestion_errors(
     """
     from app.ingestion.document_loader import DocumentIngestionError
     from app.rag.embedding_factory import EmbeddingError
-    from app.vector_db import ChromaStoreError
+    from app.vector_db import VectorStoreError
 
     def decorator(func: F) -> F:
         @functools.wraps(func)
@@ -90,10 +90,8 @@ def handle_ingestion_errors(
                     raise
                 return None
 
-            except ChromaStoreError as e:
-                log_message = (
-                    f"{operation_name} failed: ChromaDB storage error - {str(e)}"
-                )
+            except VectorStoreError as e:
+                log_message = f"{operation_name} failed: vector store error - {str(e)}"
                 if log_level == "error":
                     logger.error(log_message)
                 elif log_level == "warning":
@@ -0,0 +1,126 @@
+"""
+Streaming file utilities for document ingestion.
+
+Uploads are written to disk in fixed-size chunks while their SHA-256 content
+hash is computed incrementally, so memory use per upload is bounded by the
+chunk size rather than the file size. The hash is used to skip documents
+whose content has already been ingested.
+"""
+
+import hashlib
+import os
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Default read/write chunk size (1 MiB)
+DEFAULT_CHUNK_BYTES = 1024 * 1024
+
+
+class UploadTooLargeError(Exception):
+    """Raised when an upload exceeds the maximum allowed size."""
+
+    pass
+
+
+@dataclass(frozen=True)
+class StoredUpload:
+    """An upload persisted to disk."""
+
+    path: Path
+    content_hash: str
+    size_bytes: int
+
+
+def hash_file(file_path: Path, chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> str:
+    """
+    Compute the SHA-256 hash of a file without reading it into memory.
+
+    Args:
+        file_path: Path to the file
+        chunk_bytes: Read size in bytes
+
+    Returns:
+        Hex-encoded SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(chunk_bytes), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def safe_filename(filename: Optional[str], default: str = "upload.txt") -> str:
+    """
+    Strip directory components from a client-supplied filename.
+
+    Args:
+        filename: Filename from the client (may contain path separators)
+        default: Name to use if nothing usable remains
+
+    Returns:
+        Bare filename safe to join onto an upload directory
+    """
+    name = Path((filename or "").replace("\\", "/")).name
+    return name if name not in ("", ".", "..") else default
+
+
+async def save_upload_stream(
+    upload: Any,
+    dest_dir: Path,
+    max_bytes: Optional[int] = None,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+) -> StoredUpload:
+    """
+    Stream an uploaded file to disk, hashing it as it is written.
+
+    The upload is written to a temporary ``.part`` file in ``dest_dir`` and
+    renamed into place only once it has been fully received, so readers never
+    see partial files.
+
+    Args:
+        upload: Object with an async ``read(size)`` method and a ``filename``
+            attribute (e.g. FastAPI ``UploadFile``)
+        dest_dir: Directory to store the file in
+        max_bytes: Maximum allowed size in bytes (None = unlimited)
+        chunk_bytes: Read size in bytes
+
+    Returns:
+        StoredUpload with final path, content hash, and size
+
+    Raises:
+        UploadTooLargeError: If the upload exceeds max_bytes
+    """
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    final_path = dest_dir / safe_filename(getattr(upload, "filename", None))
+    part_path = dest_dir / f".{final_path.name}.{uuid.uuid4().hex}.part"
+
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with open(part_path, "wb") as f:
+            while True:
+                block = await upload.read(chunk_bytes)
+                if not block:
+                    break
+                size += len(block)
+                if max_bytes is not None and size > max_bytes:
+                    raise UploadTooLargeError(
+                        f"Upload exceeds maximum size ({max_bytes} bytes)"
+                    )
+                digest.update(block)
+                f.write(block)
+        os.replace(part_path, final_path)
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
+
+    logger.debug(f"Stored upload {final_path} ({size} bytes)")
+    return StoredUpload(
+        path=final_path, content_hash=digest.hexdigest(), size_bytes=size
+    )
@@ -6,12 +6,16 @@ events, etc.) into text suitable for RAG ingestion. These utilities reduce code
 duplication across data source fetchers.
 """
 
-from typing import Any, Dict, List, Optional
-
-import pandas as pd
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
+from app.utils.lazy_imports import lazy_import
 from app.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+_pd = lazy_import("pandas")
+
 logger = get_logger(__name__)
 
 
@@ -49,7 +53,7 @@ def format_metadata_section(
 def format_time_series_for_rag(
     series_id: str,
     metadata: Dict[str, Any],
-    data: pd.Series,
+    data: "pd.Series",
     source_name: str = "Time Series",
     metadata_fields: Optional[List[str]] = None,
     include_recent_points: int = 10,
@@ -126,7 +130,7 @@ def format_time_series_for_rag(
         text_parts.append("\nRecent Data Points:")
         recent_data = data.tail(include_recent_points)
         for date, value in recent_data.items():
-            if isinstance(date, pd.Timestamp):
+            if isinstance(date, _pd.Timestamp):
                 date_str = date.strftime("%Y-%m-%d")
             else:
                 date_str = str(date)
@@ -147,7 +151,7 @@ def format_time_series_for_rag(
 def format_dataframe_for_rag(
     indicator_code: str,
     metadata: Dict[str, Any],
-    data: pd.DataFrame,
+    data: "pd.DataFrame",
     source_name: str = "Indicator",
     metadata_fields: Optional[List[str]] = None,
     include_recent_data: bool = True,
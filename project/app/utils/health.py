@@ -9,15 +9,22 @@ Health checks verify:
 - Vector database status
 - System resources
 
+Component checks run on a background thread every
+``HEALTH_CHECK_INTERVAL_SECONDS`` against one shared vector store and HTTP
+session. Probes are answered from the cached snapshot, so they never wait
+on a slow dependency; a snapshot older than ``HEALTH_CHECK_STALE_SECONDS``
+is reported as stale and fails readiness.
+
 Health check server runs on a separate port and can be used by load balancers,
 monitoring systems, and orchestration platforms.
 """
 
 import json
+import threading
 import time
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from threading import Thread
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
 from app.utils.config import config
 from app.utils.logger import get_logger
@@ -29,6 +36,313 @@ logger = get_logger(__name__)
 _health_server: Optional[HTTPServer] = None
 _health_thread: Optional[Thread] = None
 
+# Process-wide health monitor
+_health_monitor: Optional["HealthMonitor"] = None
+_health_monitor_lock = threading.Lock()
+
+
+class HealthMonitor:
+    """
+    Background-refreshed cache of component health.
+
+    ``refresh`` runs the component checks and caches the result. ``snapshot``
+    and ``readiness`` only read the cache and its age, so a probe costs a
+    lock acquisition however slow a dependency is. The vector store is the
+    one its owner hands over with ``set_store``; the monitor never opens a
+    store of its own. The Ollama HTTP session is opened once and reused by
+    every refresh.
+    """
+
+    def __init__(
+        self,
+        interval_seconds: Optional[float] = None,
+        stale_seconds: Optional[float] = None,
+        store: Optional[Any] = None,
+    ):
+        """
+        Initialize health monitor.
+
+        Args:
+            interval_seconds: Seconds between background refreshes
+                (default: config.health_check_interval_seconds)
+            stale_seconds: Snapshot age after which it is stale
+                (default: config.health_check_stale_seconds)
+            store: Vector store to check (default: none until set_store is
+                called; the check reports the store as not initialized)
+        """
+        self.interval_seconds = float(
+            interval_seconds or config.health_check_interval_seconds
+        )
+        self.stale_seconds = float(stale_seconds or config.health_check_stale_seconds)
+        self._store = store
+        self._session: Optional[Any] = None
+        self._lock = threading.Lock()
+        self._snapshot: Optional[Dict] = None
+        self._stop_event: Optional[threading.Event] = None
+        self._thread: Optional[Thread] = None
+
+    def set_store(self, store: Any) -> None:
+        """
+        Check the vector store shared with the rest of the process.
+
+        Args:
+            store: Vector store shared with the rest of the process
+        """
+        self._store = store
+
+    def check_chromadb(self) -> Dict:
+        """Check ChromaDB connectivity and status."""
+        store = self._store
+        if store is None:
+            return {"status": "unhealthy", "error": "Vector store not initialized"}
+        try:
+            return {
+                "status": "healthy",
+                "document_count": store.count(),
+                "collection": store.collection_name,
+            }
+        except Exception as e:
+            logger.debug(f"ChromaDB health check failed: {e}")
+            return {"status": "unhealthy", "error": str(e)}
+
+    def check_ollama(self) -> Dict:
+        """Check Ollama service availability."""
+        try:
+            response = self._http().get(
+                f"{config.ollama_base_url}/api/tags",
+                timeout=2,
+            )
+            if response.status_code == 200:
+                models = response.json().get("models", [])
+                return {
+                    "status": "healthy",
+                    "base_url": config.ollama_base_url,
+                    "models_available": len(models),
+                }
+            else:
+                return {
+                    "status": "unhealthy",
+                    "error": f"Ollama returned status {response.status_code}",
+                }
+        except Exception as e:
+            logger.debug(f"Ollama health check failed: {e}")
+            return {"status": "unhealthy", "error": str(e)}
+
+    def check_openai(self) -> Dict:
+        """Check OpenAI API connectivity."""
+        if not config.openai_api_key:
+            return {"status": "unhealthy", "error": "OpenAI API key not configured"}
+
+        # Simple API check - verify API key is valid format
+        if not config.openai_api_key.startswith("sk-"):
+            return {
+                "status": "unhealthy",
+                "error": "OpenAI API key format invalid",
+            }
+
+        return {"status": "healthy", "api_key_configured": True}
+
+    def _http(self) -> Any:
+        """Return the session used for HTTP checks, on the shared pool."""
+        if self._session is None:
+            import requests
+
+            from app.utils.http_client import get_shared_adapter
+
+            session = requests.Session()
+            session.mount("https://", get_shared_adapter())
+            session.mount("http://", get_shared_adapter())
+            self._session = session
+        return self._session
+
+    def refresh(self) -> Dict:
+        """
+        Run the component checks and cache the result.
+
+        Returns:
+            Dictionary with health status and component details
+        """
+        started = time.time()
+        health_status: Dict[str, Any] = {"status": "healthy", "components": {}}
+
+        # Check ChromaDB
+        chromadb_status = self.check_chromadb()
+        health_status["components"]["chromadb"] = chromadb_status
+        if chromadb_status["status"] != "healthy":
+            health_status["status"] = "unhealthy"
+
+        # Check Ollama
+        ollama_status = self.check_ollama()
+        health_status["components"]["ollama"] = ollama_status
+        if ollama_status["status"] != "healthy" and config.llm_provider == "ollama":
+            health_status["status"] = "unhealthy"
+
+        # Check OpenAI (if configured)
+        if config.embedding_provider == "openai":
+            openai_status = self.check_openai()
+            health_status["components"]["openai"] = openai_status
+            if openai_status["status"] != "healthy":
+                health_status["status"] = "unhealthy"
+
+        health_status["timestamp"] = time.time()
+        health_status["check_duration_seconds"] = round(
+            health_status["timestamp"] - started, 3
+        )
+        with self._lock:
+            self._snapshot = health_status
+
+        # Update metrics
+        system_health_status.set(1 if health_status["status"] == "healthy" else 0)
+        update_uptime()
+
+        return health_status
+
+    def snapshot(self) -> Dict:
+        """
+        Return the cached health status. Never runs a check.
+
+        Returns:
+            Dictionary with health status, component details, and the time
+            (``checked_at``), age and staleness of the last refresh
+        """
+        with self._lock:
+            cached = self._snapshot
+        now = time.time()
+
+        if cached is None:
+            return {
+                "status": "unhealthy",
+                "timestamp": now,
+                "components": {},
+                "checked_at": None,
+                "age_seconds": None,
+                "stale": True,
+                "reason": "Health checks have not completed yet",
+            }
+
+        age = now - cached["timestamp"]
+        health_status = {
+            **cached,
+            "timestamp": now,
+            "checked_at": cached["timestamp"],
+            "age_seconds": round(age, 3),
+            "stale": age > self.stale_seconds,
+        }
+        if health_status["stale"]:
+            health_status["status"] = "unhealthy"
+            health_status["reason"] = (
+                f"Health checks are stale (last refreshed {age:.0f}s ago)"
+            )
+        return health_status
+
+    def readiness(self) -> Dict:
+        """
+        Return readiness derived from the cached health status.
+
+        Returns:
+            Dictionary with readiness status and snapshot age
+        """
+        health_status = self.snapshot()
+        components = health_status["components"]
+        readiness = {
+            "status": "ready",
+            "timestamp": health_status["timestamp"],
+            "checked_at": health_status["checked_at"],
+            "age_seconds": health_status["age_seconds"],
+            "stale": health_status["stale"],
+        }
+
+        # Check critical components
+        if health_status["stale"]:
+            readiness["status"] = "not_ready"
+            readiness["reason"] = health_status["reason"]
+        elif components["chromadb"]["status"] != "healthy":
+            readiness["status"] = "not_ready"
+            readiness["reason"] = "ChromaDB not available"
+        elif (
+            config.llm_provider == "ollama"
+            and components["ollama"]["status"] != "healthy"
+        ):
+            readiness["status"] = "not_ready"
+            readiness["reason"] = "Ollama service not available"
+
+        return readiness
+
+    @property
+    def running(self) -> bool:
+        """Whether the background refresh thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start refreshing in the background. No-op if already running."""
+        with self._lock:
+            if self.running:
+                return
+            self._stop_event = threading.Event()
+            self._thread = Thread(
+                target=self._run,
+                args=(self._stop_event,),
+                daemon=True,
+                name="HealthMonitor",
+            )
+            self._thread.start()
+        logger.info(
+            f"Health monitor started: refreshing every {self.interval_seconds}s"
+        )
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stop the background refresh.
+
+        Args:
+            timeout: Seconds to wait for an in-flight refresh to finish
+        """
+        with self._lock:
+            thread, stop_event = self._thread, self._stop_event
+            self._thread = None
+            self._stop_event = None
+        if stop_event is not None:
+            stop_event.set()
+        if thread is not None:
+            thread.join(timeout)
+            logger.info("Health monitor stopped")
+
+    def _run(self, stop_event: threading.Event) -> None:
+        """Refresh until stopped."""
+        while not stop_event.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.error(f"Health check refresh failed: {e}", exc_info=True)
+            stop_event.wait(self.interval_seconds)
+
+
+def get_health_monitor() -> HealthMonitor:
+    """
+    Get or create the process-wide health monitor.
+
+    Returns:
+        HealthMonitor instance
+    """
+    global _health_monitor
+    if _health_monitor is None:
+        with _health_monitor_lock:
+            if _health_monitor is None:
+                _health_monitor = HealthMonitor()
+    return _health_monitor
+
+
+def stop_health_monitor() -> None:
+    """
+    Stop the process-wide health monitor's background refresh, if running.
+
+    The monitor keeps its store and last snapshot, and restarts on the next
+    probe.
+    """
+    with _health_monitor_lock:
+        if _health_monitor is not None:
+            _health_monitor.stop()
+
 
 class HealthCheckHandler(BaseHTTPRequestHandler):
     """HTTP request handler for health check endpoints."""
@@ -67,125 +381,33 @@ class HealthCheckHandler(BaseHTTPRequestHandler):
 
     def _check_health(self) -> Dict:
         """
-        Perform comprehensive health check.
+        Get the cached comprehensive health status.
 
         Returns:
             Dictionary with health status and component details
         """
-        health_status = {
-            "status": "healthy",
-            "timestamp": time.time(),
-            "components": {},
-        }
-
-        # Check ChromaDB
-        chromadb_status = self._check_chromadb()
-        health_status["components"]["chromadb"] = chromadb_status
-        if chromadb_status["status"] != "healthy":
-            health_status["status"] = "unhealthy"
-
-        # Check Ollama
-        ollama_status = self._check_ollama()
-        health_status["components"]["ollama"] = ollama_status
-        if ollama_status["status"] != "healthy" and config.llm_provider == "ollama":
-            health_status["status"] = "unhealthy"
-
-        # Check OpenAI (if configured)
-        if config.embedding_provider == "openai":
-            openai_status = self._check_openai()
-            health_status["components"]["openai"] = openai_status
-            if openai_status["status"] != "healthy":
-                health_status["status"] = "unhealthy"
-
-        # Update metrics
-        system_health_status.set(1 if health_status["status"] == "healthy" else 0)
-        update_uptime()
-
-        return health_status
+        return get_health_status()
 
     def _check_readiness(self) -> Dict:
         """
-        Check if application is ready to serve requests.
+        Get the cached readiness status.
 
         Returns:
             Dictionary with readiness status
         """
-        readiness = {"status": "ready", "timestamp": time.time()}
-
-        # Check critical components
-        chromadb_status = self._check_chromadb()
-        if chromadb_status["status"] != "healthy":
-            readiness["status"] = "not_ready"
-            readiness["reason"] = "ChromaDB not available"
-
-        if config.llm_provider == "ollama":
-            ollama_status = self._check_ollama()
-            if ollama_status["status"] != "healthy":
-                readiness["status"] = "not_ready"
-                readiness["reason"] = "Ollama service not available"
-
-        return readiness
+        return get_readiness_status()
 
     def _check_chromadb(self) -> Dict:
-        """Check ChromaDB connectivity and status."""
-        try:
-            from app.vector_db import ChromaStore
-
-            store = ChromaStore()
-            count = store.count()
-            return {
-                "status": "healthy",
-                "document_count": count,
-                "collection": store.collection_name,
-            }
-        except Exception as e:
-            logger.debug(f"ChromaDB health check failed: {e}")
-            return {"status": "unhealthy", "error": str(e)}
+        """Check ChromaDB connectivity and status (bypasses the cache)."""
+        return get_health_monitor().check_chromadb()
 
     def _check_ollama(self) -> Dict:
-        """Check Ollama service availability."""
-        try:
-            import requests
-
-            response = requests.get(
-                f"{config.ollama_base_url}/api/tags",
-                timeout=2,
-            )
-            if response.status_code == 200:
-                models = response.json().get("models", [])
-                return {
-                    "status": "healthy",
-                    "base_url": config.ollama_base_url,
-                    "models_available": len(models),
-                }
-            else:
-                return {
-                    "status": "unhealthy",
-                    "error": f"Ollama returned status {response.status_code}",
-                }
-        except Exception as e:
-            logger.debug(f"Ollama health check failed: {e}")
-            return {"status": "unhealthy", "error": str(e)}
+        """Check Ollama service availability (bypasses the cache)."""
+        return get_health_monitor().check_ollama()
 
     def _check_openai(self) -> Dict:
-        """Check OpenAI API connectivity."""
-        try:
-            import requests  # noqa: F401
-
-            if not config.openai_api_key:
-                return {"status": "unhealthy", "error": "OpenAI API key not configured"}
-
-            # Simple API check - verify API key is valid format
-            if not config.openai_api_key.startswith("sk-"):
-                return {
-                    "status": "unhealthy",
-                    "error": "OpenAI API key format invalid",
-                }
-
-            return {"status": "healthy", "api_key_configured": True}
-        except Exception as e:
-            logger.debug(f"OpenAI health check failed: {e}")
-            return {"status": "unhealthy", "error": str(e)}
+        """Check OpenAI API connectivity (bypasses the cache)."""
+        return get_health_monitor().check_openai()
 
     def _send_response(self, status_code: int, data: Dict) -> None:
         """Send JSON response."""
@@ -197,7 +419,7 @@ class HealthCheckHandler(BaseHTTPRequestHandler):
 
 
 def start_health_check_server() -> None:
-    """Start health check HTTP server."""
+    """Start health check HTTP server and the background health monitor."""
     global _health_server, _health_thread
 
     if not config.health_check_enabled:
@@ -208,6 +430,7 @@ def start_health_check_server() -> None:
         logger.warning("Health check server already running")
         return
 
+    get_health_monitor().start()
     try:
         _health_server = HTTPServer(
             ("0.0.0.0", config.health_check_port), HealthCheckHandler
@@ -229,7 +452,7 @@ def start_health_check_server() -> None:
 
 
 def stop_health_check_server() -> None:
-    """Stop health check HTTP server."""
+    """Stop health check HTTP server and the background health monitor."""
     global _health_server, _health_thread
 
     if _health_server is not None:
@@ -238,117 +461,34 @@ def stop_health_check_server() -> None:
         _health_server = None
         _health_thread = None
         logger.info("Health check server stopped")
+    stop_health_monitor()
 
 
 def get_health_status() -> Dict:
     """
-    Get current health status (synchronous check).
+    Get the cached health status.
+
+    Starts the background health monitor on first use, so until its first
+    refresh completes the status is unhealthy with no components.
 
     Returns:
         Dictionary with health status
     """
+    monitor = get_health_monitor()
+    monitor.start()
+    return monitor.snapshot()
 
-    # Create a mock handler instance for health checking
-    # We can't use the real handler constructor, so we create a minimal instance
-    class MockHandler:
-        """Mock handler for health status checking."""
-
-        def _check_health(self) -> Dict:
-            """Perform comprehensive health check."""
-            health_status = {
-                "status": "healthy",
-                "timestamp": time.time(),
-                "components": {},
-            }
-
-            # Check ChromaDB
-            chromadb_status = self._check_chromadb()
-            health_status["components"]["chromadb"] = chromadb_status
-            if chromadb_status["status"] != "healthy":
-                health_status["status"] = "unhealthy"
-
-            # Check Ollama
-            ollama_status = self._check_ollama()
-            health_status["components"]["ollama"] = ollama_status
-            if ollama_status["status"] != "healthy" and config.llm_provider == "ollama":
-                health_status["status"] = "unhealthy"
-
-            # Check OpenAI (if configured)
-            if config.embedding_provider == "openai":
-                openai_status = self._check_openai()
-                health_status["components"]["openai"] = openai_status
-                if openai_status["status"] != "healthy":
-                    health_status["status"] = "unhealthy"
-
-            # Update metrics
-            system_health_status.set(1 if health_status["status"] == "healthy" else 0)
-            update_uptime()
-
-            return health_status
 
-        def _check_chromadb(self) -> Dict:
-            """Check ChromaDB connectivity and status."""
-            try:
-                from app.vector_db import ChromaStore
-
-                store = ChromaStore()
-                count = store.count()
-                return {
-                    "status": "healthy",
-                    "document_count": count,
-                    "collection": store.collection_name,
-                }
-            except Exception as e:
-                logger.debug(f"ChromaDB health check failed: {e}")
-                return {"status": "unhealthy", "error": str(e)}
-
-        def _check_ollama(self) -> Dict:
-            """Check Ollama service availability."""
-            try:
-                import requests
-
-                response = requests.get(
-                    f"{config.ollama_base_url}/api/tags",
-                    timeout=2,
-                )
-                if response.status_code == 200:
-                    models = response.json().get("models", [])
-                    return {
-                        "status": "healthy",
-                        "base_url": config.ollama_base_url,
-                        "models_available": len(models),
-                    }
-                else:
-                    return {
-                        "status": "unhealthy",
-                        "error": f"Ollama returned status {response.status_code}",
-                    }
-            except Exception as e:
-                logger.debug(f"Ollama health check failed: {e}")
-                return {"status": "unhealthy", "error": str(e)}
+def get_readiness_status() -> Dict:
+    """
+    Get the cached readiness status.
 
-        def _check_openai(self) -> Dict:
-            """Check OpenAI API connectivity."""
-            try:
-                import requests  # noqa: F401
-
-                if not config.openai_api_key:
-                    return {
-                        "status": "unhealthy",
-                        "error": "OpenAI API key not configured",
-                    }
-
-                # Simple API check - verify API key is valid format
-                if not config.openai_api_key.startswith("sk-"):
-                    return {
-                        "status": "unhealthy",
-                        "error": "OpenAI API key format invalid",
-                    }
-
-                return {"status": "healthy", "api_key_configured": True}
-            except Exception as e:
-                logger.debug(f"OpenAI health check failed: {e}")
-                return {"status": "unhealthy", "error": str(e)}
+    Starts the background health monitor on first use, so until its first
+    refresh completes the application is not ready.
 
-    handler = MockHandler()
-    return handler._check_health()
+    Returns:
+        Dictionary with readiness status
+    """
+    monitor = get_health_monitor()
+    monitor.start()
+    return monitor.readiness()
@@ -0,0 +1,501 @@
+"""
+Shared HTTP client with on-disk response cache, per-host rate limits, and
+offline record/replay.
+
+All fetchers create their sessions with create_http_session(). GET responses
+are stored in a content-addressed disk cache:
+
+- URLs matching config.http_cache_immutable_patterns (SEC archive files)
+  are cached forever.
+- Other responses are fresh for config.http_cache_ttl_seconds and then
+  revalidated with ETag/Last-Modified conditional requests.
+
+Network requests (never cache hits) draw from a process-wide token bucket
+per host, and all sessions share one pooled connection adapter.
+
+Cache modes (config.http_cache_mode):
+
+- ``normal``: serve fresh entries, fetch and store misses
+- ``record``: always fetch from the network and store every response
+- ``replay``: serve only from the cache; a miss raises HttpReplayMissError,
+  so benchmarks and tests run with no network access
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from app.utils.config import config
+from app.utils.logger import get_logger
+from app.utils.rate_limiter import TokenBucketRateLimiter, get_rate_limiter
+
+logger = get_logger(__name__)
+
+CACHE_MODE_NORMAL = "normal"
+CACHE_MODE_RECORD = "record"
+CACHE_MODE_REPLAY = "replay"
+CACHE_MODES = (CACHE_MODE_NORMAL, CACHE_MODE_RECORD, CACHE_MODE_REPLAY)
+
+# Headers that describe the wire encoding rather than the (decoded) body
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+# Query parameters whose values are redacted in stored cache entries
+_SECRET_PARAM_RE = re.compile(r"key|token|secret|password", re.IGNORECASE)
+
+
+class HttpReplayMissError(requests.exceptions.ConnectionError):
+    """Raised in replay mode when a request is not in the cache."""
+
+    pass
+
+
+@dataclass
+class CacheEntry:
+    """Metadata for a cached response; the body is stored by content hash."""
+
+    url: str
+    status_code: int
+    headers: Dict[str, str]
+    body_sha256: str
+    encoding: Optional[str]
+    stored_at: float
+    immutable: bool = False
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def is_fresh(self, ttl_seconds: float, now: Optional[float] = None) -> bool:
+        """Return True if the entry can be served without revalidation."""
+        if self.immutable:
+            return True
+        now = time.time() if now is None else now
+        return now - self.stored_at < ttl_seconds
+
+
+class HttpCache:
+    """
+    Content-addressed on-disk HTTP response cache.
+
+    Layout under ``root``::
+
+        entries/<k[:2]>/<k>.json   request key -> CacheEntry
+        blobs/<h[:2]>/<h>          response body by SHA-256
+
+    Identical bodies served from different URLs are stored once. All writes
+    go to a temporary file and are renamed into place, so concurrent
+    readers never see partial files.
+    """
+
+    def __init__(self, root: Path):
+        """
+        Initialize cache.
+
+        Args:
+            root: Cache directory (created if missing)
+        """
+        self.root = Path(root)
+        (self.root / "entries").mkdir(parents=True, exist_ok=True)
+        (self.root / "blobs").mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(method: str, url: str) -> str:
+        """Return the cache key for a request."""
+        return hashlib.sha256(f"{method.upper()} {url}".encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.root / "entries" / key[:2] / f"{key}.json"
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.root / "blobs" / digest[:2] / digest
+
+    @staticmethod
+    def _atomic_write(path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def get(self, key: str) -> Optional[Tuple[CacheEntry, bytes]]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from HttpCache.key()
+
+        Returns:
+            Tuple of (entry, body), or None if missing or unreadable
+        """
+        entry_path = self._entry_path(key)
+        try:
+            entry = CacheEntry(**json.loads(entry_path.read_text(encoding="utf-8")))
+            body = self._blob_path(entry.body_sha256).read_bytes()
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Ignoring corrupt HTTP cache entry {entry_path}: {e}")
+            return None
+        return entry, body
+
+    def put(self, key: str, entry: CacheEntry, body: bytes) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Cache key from HttpCache.key()
+            entry: Entry metadata (body_sha256 must match body)
+            body: Response body
+        """
+        blob_path = self._blob_path(entry.body_sha256)
+        if not blob_path.exists():
+            self._atomic_write(blob_path, body)
+        self._atomic_write(
+            self._entry_path(key), json.dumps(asdict(entry)).encode("utf-8")
+        )
+
+    def touch(self, key: str, entry: CacheEntry) -> None:
+        """Mark an entry as freshly revalidated."""
+        entry.stored_at = time.time()
+        self._atomic_write(
+            self._entry_path(key), json.dumps(asdict(entry)).encode("utf-8")
+        )
+
+
+def parse_host_rate_limits(spec: str) -> Dict[str, float]:
+    """
+    Parse a ``host=req_per_sec`` list.
+
+    Args:
+        spec: Comma-separated rules, e.g. "sec.gov=10,api.example.com=2"
+
+    Returns:
+        Mapping of host suffix to requests per second
+    """
+    limits: Dict[str, float] = {}
+    for rule in filter(None, (part.strip() for part in spec.split(","))):
+        host, _, rate = rule.partition("=")
+        try:
+            limits[host.strip().lower()] = float(rate)
+        except ValueError:
+            logger.warning(f"Ignoring invalid HTTP rate limit rule: {rule}")
+    return limits
+
+
+def compile_patterns(spec: str) -> List["re.Pattern[str]"]:
+    """Compile a comma-separated list of URL regexes."""
+    return [
+        re.compile(pattern)
+        for pattern in filter(None, (part.strip() for part in spec.split(",")))
+    ]
+
+
+_shared_adapter: Optional[HTTPAdapter] = None
+_shared_adapter_lock = threading.Lock()
+
+
+def get_shared_adapter() -> HTTPAdapter:
+    """Return the process-wide pooled connection adapter."""
+    global _shared_adapter
+    with _shared_adapter_lock:
+        if _shared_adapter is None:
+            _shared_adapter = HTTPAdapter(
+                pool_connections=config.http_pool_connections,
+                pool_maxsize=config.http_pool_maxsize,
+            )
+        return _shared_adapter
+
+
+class CachedSession:
+    """
+    requests.Session wrapper adding caching, per-host rate limits, and
+    record/replay.
+
+    Exposes the subset of the Session API used by fetchers (``get``,
+    ``request``, ``headers``, ``mount``, ``close``), so it is a drop-in
+    replacement for ``requests.Session()``.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[HttpCache] = None,
+        mode: str = CACHE_MODE_NORMAL,
+        ttl_seconds: Optional[float] = None,
+        immutable_patterns: Optional[List["re.Pattern[str]"]] = None,
+        host_rate_limits: Optional[Dict[str, float]] = None,
+        requests_per_second: Optional[float] = None,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None,
+        adapter: Optional[HTTPAdapter] = None,
+    ):
+        """
+        Initialize session.
+
+        Args:
+            cache: Response cache (None disables caching)
+            mode: Cache mode: "normal", "record", or "replay"
+            ttl_seconds: Freshness lifetime for mutable responses.
+                If None, uses config.http_cache_ttl_seconds
+            immutable_patterns: URL regexes whose responses never expire
+            host_rate_limits: Host suffix -> requests per second
+            requests_per_second: Rate for hosts without a host rule
+                (None = unlimited)
+            rate_limiter: Limiter used for every network request,
+                overriding host rules
+            adapter: Connection adapter to mount (default: shared pool)
+
+        Raises:
+            ValueError: If mode is invalid
+        """
+        if mode not in CACHE_MODES:
+            raise ValueError(
+                f"Invalid HTTP cache mode: {mode}. Must be one of {CACHE_MODES}"
+            )
+        self.cache = cache
+        self.mode = mode
+        self.ttl_seconds = (
+            config.http_cache_ttl_seconds if ttl_seconds is None else ttl_seconds
+        )
+        self.immutable_patterns = immutable_patterns or []
+        self.host_rate_limits = host_rate_limits or {}
+        self.requests_per_second = requests_per_second
+        self.rate_limiter = rate_limiter
+
+        self._session = requests.Session()
+        adapter = adapter or get_shared_adapter()
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    @property
+    def headers(self) -> Any:
+        """Default request headers (the wrapped session's headers)."""
+        return self._session.headers
+
+    def mount(self, prefix: str, adapter: HTTPAdapter) -> None:
+        """Mount a connection adapter on the wrapped session."""
+        self._session.mount(prefix, adapter)
+
+    def close(self) -> None:
+        """Close the wrapped session."""
+        self._session.close()
+
+    def is_immutable(self, url: str) -> bool:
+        """Return True if the URL's content never changes."""
+        return any(pattern.search(url) for pattern in self.immutable_patterns)
+
+    def _limiter_for(self, url: str) -> Optional[TokenBucketRateLimiter]:
+        """Return the shared limiter for a URL's host, if it is limited."""
+        if self.rate_limiter is not None:
+            return self.rate_limiter
+        host = (urlsplit(url).hostname or "").lower()
+        for suffix, rate in self.host_rate_limits.items():
+            if host == suffix or host.endswith(f".{suffix}"):
+                if self.requests_per_second:
+                    rate = min(rate, self.requests_per_second)
+                return get_rate_limiter(suffix, rate)
+        if self.requests_per_second:
+            return get_rate_limiter(host, self.requests_per_second)
+        return None
+
+    def throttle(self, url: str) -> float:
+        """
+        Wait for the rate limiter of a URL's host.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            Seconds spent waiting
+        """
+        limiter = self._limiter_for(url)
+        return limiter.acquire() if limiter else 0.0
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Send a request; GETs go through the cache.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Passed to requests.Session.request
+
+        Returns:
+            Response (possibly served from the cache)
+
+        Raises:
+            HttpReplayMissError: In replay mode when the response is not cached
+            requests.exceptions.RequestException: On network errors
+        """
+        if method.upper() == "GET":
+            return self.get(url, **kwargs)
+        self.throttle(url)
+        return self._session.request(method, url, **kwargs)
+
+    def get(
+        self, url: str, params: Optional[Any] = None, **kwargs: Any
+    ) -> requests.Response:
+        """
+        Send a GET request through the cache.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            **kwargs: Passed to requests.Session.get (headers, timeout, ...)
+
+        Returns:
+            Response (possibly served from the cache)
+
+        Raises:
+            HttpReplayMissError: In replay mode when the response is not cached
+            requests.exceptions.RequestException: On network errors
+        """
+        cache = self.cache
+        if cache is None or kwargs.get("stream"):
+            self.throttle(url)
+            return self._session.get(url, params=params, **kwargs)
+
+        full_url = requests.Request("GET", url, params=params).prepare().url or url
+        key = HttpCache.key("GET", full_url)
+        cached = cache.get(key)
+
+        if self.mode == CACHE_MODE_REPLAY:
+            if cached is None:
+                raise HttpReplayMissError(f"No recorded response for {full_url}")
+            logger.debug(f"HTTP cache replay: {full_url}")
+            return _build_response(cached[0], cached[1], full_url)
+
+        if cached is not None and self.mode == CACHE_MODE_NORMAL:
+            entry, body = cached
+            if entry.is_fresh(self.ttl_seconds):
+                logger.debug(f"HTTP cache hit: {full_url}")
+                return _build_response(entry, body, full_url)
+            kwargs["headers"] = _conditional_headers(entry, kwargs.get("headers"))
+
+        self.throttle(full_url)
+        response = self._session.get(url, params=params, **kwargs)
+
+        if response.status_code == 304 and cached is not None:
+            entry, body = cached
+            cache.touch(key, entry)
+            logger.debug(f"HTTP cache revalidated: {full_url}")
+            return _build_response(entry, body, full_url)
+        if _is_cacheable(response):
+            self._store(cache, key, full_url, response)
+        return response
+
+    def _store(
+        self, cache: HttpCache, key: str, full_url: str, response: requests.Response
+    ) -> None:
+        """Write a successful response to the cache."""
+        body = response.content
+        entry = CacheEntry(
+            url=_redact_url(full_url),
+            status_code=response.status_code,
+            headers={
+                k: v
+                for k, v in response.headers.items()
+                if k.lower() not in _DROPPED_HEADERS
+            },
+            body_sha256=hashlib.sha256(body).hexdigest(),
+            encoding=response.encoding,
+            stored_at=time.time(),
+            immutable=self.is_immutable(full_url),
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        try:
+            cache.put(key, entry, body)
+        except OSError as e:
+            logger.warning(f"Failed to cache response for {entry.url}: {e}")
+
+
+def _conditional_headers(
+    entry: CacheEntry, headers: Optional[Dict[str, str]]
+) -> Dict[str, str]:
+    """Add revalidation headers for a stale entry."""
+    result = dict(headers or {})
+    if entry.etag:
+        result["If-None-Match"] = entry.etag
+    if entry.last_modified:
+        result["If-Modified-Since"] = entry.last_modified
+    return result
+
+
+def _is_cacheable(response: requests.Response) -> bool:
+    """Return True for successful responses without no-store."""
+    cache_control = response.headers.get("Cache-Control", "").lower()
+    return response.status_code == 200 and "no-store" not in cache_control
+
+
+def _build_response(entry: CacheEntry, body: bytes, url: str) -> requests.Response:
+    """Rebuild a requests.Response from a cache entry."""
+    response = requests.Response()
+    response.status_code = entry.status_code
+    response._content = body
+    response.headers = CaseInsensitiveDict(entry.headers)
+    response.encoding = entry.encoding
+    response.url = url
+    response.reason = "OK"
+    response.from_cache = True  # type: ignore[attr-defined]
+    return response
+
+
+def _redact_url(url: str) -> str:
+    """Mask secret-looking query parameter values before storing a URL."""
+    parts = urlsplit(url)
+    if not parts.query:
+        return url
+    query = [
+        (name, "REDACTED" if _SECRET_PARAM_RE.search(name) else value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+    ]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def create_http_session(
+    requests_per_second: Optional[float] = None,
+    rate_limiter: Optional[TokenBucketRateLimiter] = None,
+    adapter: Optional[HTTPAdapter] = None,
+    cache_enabled: Optional[bool] = None,
+) -> CachedSession:
+    """
+    Create a session configured from application settings.
+
+    Args:
+        requests_per_second: Rate for hosts without a configured host rule
+            (None = unlimited)
+        rate_limiter: Limiter to use for every network request
+        adapter: Connection adapter (default: shared pool)
+        cache_enabled: Override config.http_cache_enabled
+
+    Returns:
+        CachedSession instance
+    """
+    enabled = config.http_cache_enabled if cache_enabled is None else cache_enabled
+    # Replay has nothing to serve without the cache
+    enabled = enabled or config.http_cache_mode == CACHE_MODE_REPLAY
+    return CachedSession(
+        cache=HttpCache(Path(config.http_cache_dir)) if enabled else None,
+        mode=config.http_cache_mode,
+        immutable_patterns=compile_patterns(config.http_cache_immutable_patterns),
+        host_rate_limits=parse_host_rate_limits(config.http_host_rate_limits),
+        requests_per_second=requests_per_second,
+        rate_limiter=rate_limiter,
+        adapter=adapter,
+    )
+
+
+def delay_to_rate(delay_seconds: Optional[float]) -> Optional[float]:
+    """Convert a per-request delay in seconds into requests per second."""
+    return 1.0 / delay_seconds if delay_seconds and delay_seconds > 0 else None
@@ -0,0 +1,235 @@
+"""
+Deferred import helpers.
+
+Heavy optional dependencies (torch/transformers, sentence-transformers, arelle,
+pandas, yfinance, apscheduler, feedparser, ...) are bound at module level
+through lightweight proxies so that importing an application module does not
+pay their import cost until the dependency is actually used.
+
+The proxies are ordinary module attributes, so existing call sites
+(``yf.Ticker(...)``, ``pd.DataFrame(...)``) and ``unittest.mock.patch``
+targets (``app.ingestion.yfinance_fetcher.yf``) keep working unchanged.
+
+Modules that also use the dependency in type annotations import the real
+module under ``TYPE_CHECKING`` and keep the proxy under a private name, so
+string annotations such as ``"pd.DataFrame"`` resolve for mypy::
+
+    if TYPE_CHECKING:
+        import pandas as pd
+
+    _pd = lazy_import("pandas")
+
+Example:
+    >>> from app.utils.lazy_imports import is_available, lazy_attr, lazy_import
+    >>> pd = lazy_import("pandas")  # nothing imported yet
+    >>> Fred = lazy_attr("fredapi", "Fred")
+    >>> FREDAPI_AVAILABLE = is_available("fredapi")
+
+Note:
+    This module must stay dependency-free (no config or logger imports) so it
+    can be used from any module without introducing import cycles.
+"""
+
+import importlib
+import importlib.util
+import threading
+import types
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+_import_lock = threading.RLock()
+
+
+def is_available(*module_names: str) -> bool:
+    """
+    Check whether modules can be imported, without importing them.
+
+    Uses ``importlib.util.find_spec`` so the check costs a filesystem lookup
+    instead of a full import.
+
+    Args:
+        *module_names: Top-level or dotted module names to check
+
+    Returns:
+        True if every module can be found, False otherwise
+    """
+    for module_name in module_names:
+        try:
+            if importlib.util.find_spec(module_name) is None:
+                return False
+        except (ImportError, ValueError):
+            return False
+    return True
+
+
+class LazyModule(types.ModuleType):
+    """
+    Module proxy that imports the real module on first attribute access.
+
+    Only used for module-level bindings of heavy dependencies
+    (``pd = lazy_import("pandas")``). After the first access the real module
+    is cached and attribute lookups are forwarded to it.
+    """
+
+    def __init__(self, module_name: str):
+        """
+        Initialize lazy module proxy.
+
+        Args:
+            module_name: Fully qualified module name to import on first use
+        """
+        super().__init__(module_name)
+        self.__dict__["_lazy_module_name"] = module_name
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self) -> types.ModuleType:
+        """Import and cache the wrapped module."""
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            with _import_lock:
+                module = self.__dict__["_lazy_module"]
+                if module is None:
+                    module = importlib.import_module(self.__dict__["_lazy_module_name"])
+                    self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, name: str) -> Any:
+        """Forward attribute access to the imported module."""
+        return getattr(self._load(), name)
+
+    def __dir__(self) -> List[str]:
+        """List attributes of the imported module."""
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        """Describe the proxy without triggering the import."""
+        state = "loaded" if self.__dict__["_lazy_module"] is not None else "deferred"
+        return f"<lazy module '{self.__dict__['_lazy_module_name']}' ({state})>"
+
+
+class LazyAttribute:
+    """
+    Proxy for a class or function exported by a heavy module.
+
+    Calling the proxy (or accessing any attribute on it) imports the module
+    and resolves the attribute. Alternative modules can be given for
+    dependencies that moved between packages (e.g. ``langchain_openai`` vs.
+    ``langchain_community``).
+    """
+
+    def __init__(self, module_names: Tuple[str, ...], attr_name: str):
+        """
+        Initialize lazy attribute proxy.
+
+        Args:
+            module_names: Candidate modules, tried in order
+            attr_name: Attribute to resolve from the first importable module
+        """
+        self._module_names = module_names
+        self._attr_name = attr_name
+        self._target: Optional[Any] = None
+
+    def resolve(self) -> Any:
+        """
+        Import the owning module and return the real attribute.
+
+        Returns:
+            The resolved class or function
+
+        Raises:
+            ImportError: If none of the candidate modules can be imported
+        """
+        if self._target is None:
+            with _import_lock:
+                if self._target is None:
+                    last_error: Optional[ImportError] = None
+                    for module_name in self._module_names:
+                        try:
+                            module = importlib.import_module(module_name)
+                            self._target = getattr(module, self._attr_name)
+                            break
+                        except (ImportError, AttributeError) as e:
+                            last_error = ImportError(
+                                f"Cannot import {self._attr_name} from "
+                                f"{module_name}: {e}"
+                            )
+                    if self._target is None:
+                        raise last_error or ImportError(self._attr_name)
+        return self._target
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        """Instantiate or call the resolved attribute."""
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        """Forward attribute access (e.g. classmethods) to the target."""
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def __repr__(self) -> str:
+        """Describe the proxy without triggering the import."""
+        state = "loaded" if self._target is not None else "deferred"
+        return f"<lazy attribute '{self._module_names[0]}.{self._attr_name}' ({state})>"
+
+
+def lazy_import(module_name: str) -> LazyModule:
+    """
+    Bind a module without importing it.
+
+    Args:
+        module_name: Fully qualified module name (e.g. 'yfinance')
+
+    Returns:
+        LazyModule proxy that imports the module on first attribute access
+    """
+    return LazyModule(module_name)
+
+
+def lazy_attr(
+    module_name: str, attr_name: str, fallbacks: Iterable[str] = ()
+) -> LazyAttribute:
+    """
+    Bind a class or function from a module without importing the module.
+
+    Args:
+        module_name: Module that defines the attribute
+        attr_name: Attribute name (e.g. 'CrossEncoder')
+        fallbacks: Alternative modules to try if the first cannot be imported
+
+    Returns:
+        LazyAttribute proxy that resolves on first call or attribute access
+    """
+    return LazyAttribute((module_name, *fallbacks), attr_name)
+
+
+def lazy_exports(
+    package_globals: Dict[str, Any], exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build PEP 562 ``__getattr__``/``__dir__`` hooks for package re-exports.
+
+    Lets a package ``__init__`` keep its public names
+    (``from app.ingestion import IngestionPipeline``) without importing every
+    submodule when only one of them is needed.
+
+    Args:
+        package_globals: The package's ``globals()``
+        exports: Mapping of exported name -> defining module
+
+    Returns:
+        Tuple of (``__getattr__``, ``__dir__``) functions for the package
+    """
+    package_name = package_globals["__name__"]
+
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module '{package_name}' has no attribute '{name}'")
+        value = getattr(importlib.import_module(module_name), name)
+        package_globals[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(package_globals) | set(exports))
+
+    return __getattr__, __dir__
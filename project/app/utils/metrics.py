@@ -57,6 +57,29 @@ rag_query_tokens = Histogram(
     registry=metrics_registry,
 )
 
+rag_stage_duration_seconds = Histogram(
+    "rag_stage_duration_seconds",
+    "Duration of RAG query stages in seconds",
+    ["stage"],  # stage: parse, embed_query, vector_search, bm25, rerank, llm, ...
+    buckets=[
+        0.001,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        2.5,
+        5.0,
+        10.0,
+        30.0,
+        float("inf"),
+    ],
+    registry=metrics_registry,
+)
+
 rag_context_chunks_retrieved = Histogram(
     "rag_context_chunks_retrieved",
     "Number of context chunks retrieved per query",
@@ -171,6 +194,21 @@ embedding_dimensions = Histogram(
     registry=metrics_registry,
 )
 
+embedding_batch_size = Histogram(
+    "embedding_batch_size",
+    "Number of texts per embedding request",
+    ["provider"],
+    buckets=[1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, float("inf")],
+    registry=metrics_registry,
+)
+
+embedding_tokens_total = Counter(
+    "embedding_tokens_total",
+    "Estimated number of tokens sent for embedding",
+    ["provider"],
+    registry=metrics_registry,
+)
+
 # System Health Metrics
 system_health_status = Gauge(
     "system_health_status",
@@ -286,6 +324,25 @@ def track_success(counter: Counter, labels: Optional[dict] = None) -> None:
     counter.labels(**labels).inc()
 
 
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens in a text.
+
+    Uses the common approximation of four characters per token for English
+    text, which is close enough for capacity planning without loading a
+    tokenizer for every provider.
+
+    Args:
+        text: Text to estimate
+
+    Returns:
+        Estimated token count (0 for empty text)
+    """
+    if not text:
+        return 0
+    return max(1, len(text) // 4)
+
+
 def get_metrics() -> bytes:
     """
     Get Prometheus metrics in text format.
@@ -0,0 +1,157 @@
+"""
+Thread-safe token-bucket rate limiting.
+
+A single limiter instance can be shared by any number of threads (and
+fetcher instances) so that their combined request rate stays under an
+upstream limit such as SEC EDGAR's 10 requests per second.
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class TokenBucketRateLimiter:
+    """
+    Token bucket limiter.
+
+    Tokens are added continuously at ``rate`` per second up to ``capacity``.
+    Each acquire() consumes tokens, blocking until enough are available.
+    With the default capacity of 1 requests are spaced evenly at ``rate``.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Initialize rate limiter.
+
+        Args:
+            rate: Tokens added per second (must be > 0)
+            capacity: Maximum burst size in tokens (default: 1)
+
+        Raises:
+            ValueError: If rate or capacity is not positive
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be > 0, got {rate}")
+        capacity = 1.0 if capacity is None else float(capacity)
+        if capacity <= 0:
+            raise ValueError(f"capacity must be > 0, got {capacity}")
+
+        self._rate = float(rate)
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Tokens added per second."""
+        return self._rate
+
+    def set_rate(self, rate: float) -> None:
+        """
+        Change the refill rate.
+
+        Args:
+            rate: New tokens per second (must be > 0)
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be > 0, got {rate}")
+        with self._lock:
+            self._refill()
+            self._rate = float(rate)
+
+    def _refill(self) -> None:
+        """Add tokens for the time elapsed since the last update (lock held)."""
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """
+        Consume tokens if available without blocking.
+
+        Args:
+            tokens: Number of tokens to consume
+
+        Returns:
+            True if the tokens were consumed
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Block until tokens are available, then consume them.
+
+        Tokens are reserved under the lock (the balance may go negative), so
+        concurrent callers are queued fairly and sleep outside the lock.
+
+        Args:
+            tokens: Number of tokens to consume
+
+        Returns:
+            Seconds spent waiting
+        """
+        if tokens > self.capacity:
+            raise ValueError(
+                f"Cannot acquire {tokens} tokens (capacity {self.capacity})"
+            )
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+_limiters: Dict[str, TokenBucketRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    key: str, rate: float, capacity: Optional[float] = None
+) -> TokenBucketRateLimiter:
+    """
+    Get the process-wide limiter for a key (e.g. an upstream host).
+
+    The first call creates the limiter. Later calls return the same instance;
+    if they ask for a lower rate the limiter is slowed down to it, so the
+    shared rate never exceeds what any caller requested.
+
+    Args:
+        key: Limiter name, usually the upstream host
+        rate: Requests per second
+        capacity: Burst size for a newly created limiter (default: 1)
+
+    Returns:
+        Shared TokenBucketRateLimiter
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = TokenBucketRateLimiter(rate, capacity)
+            _limiters[key] = limiter
+            logger.debug(f"Created rate limiter '{key}' at {rate} req/s")
+        elif rate < limiter.rate:
+            limiter.set_rate(rate)
+            logger.debug(f"Lowered rate limiter '{key}' to {rate} req/s")
+        return limiter
+
+
+def reset_rate_limiters() -> None:
+    """Drop all shared limiters (used by tests)."""
+    with _limiters_lock:
+        _limiters.clear()
@@ -0,0 +1,429 @@
+"""
+Span-style latency tracing for the RAG query path.
+
+``RAGQuerySystem.query`` opens a trace per query and each stage of the query
+path (query parsing, refinement, query embedding, vector search, BM25,
+reranking, context formatting, LLM generation) records a span in it through
+``stage()``. The ingestion processors record their stages (load, fetch,
+parse, sentiment, chunk, embed, write) the same way, which the ingestion
+benchmark traces. Stages called outside a trace cost a single context
+variable lookup.
+
+The active trace lives in a context variable, which worker threads do not
+inherit. Work handed to a thread pool goes through ``submit_in_context()``
+or ``map_in_context()`` so stages recorded by the workers land in the
+caller's trace, nested under the caller's open span.
+
+Finished traces are handed to pluggable exporters, selected with
+``RAG_TRACING_EXPORTERS``:
+
+- ``prometheus``: ``rag_stage_duration_seconds{stage=...}`` histograms
+- ``otlp_file``: one OTLP/JSON ``resourceSpans`` document per line in
+  ``RAG_TRACE_FILE``, readable by OpenTelemetry tooling without requiring
+  the OpenTelemetry SDK
+
+Example:
+    >>> with start_trace("rag.query") as trace:
+    ...     with stage("embed_query"):
+    ...         pass
+    >>> trace.timings()
+    {'embed_query': 0.01, 'total': 0.02}
+"""
+
+import contextvars
+import json
+import secrets
+import threading
+import time
+from concurrent.futures import Executor, Future
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from app.utils.config import config
+from app.utils.logger import get_logger
+from app.utils.metrics import rag_stage_duration_seconds
+
+logger = get_logger(__name__)
+
+# Name of the root span covering the whole trace in timings()
+TOTAL_STAGE = "total"
+
+_current_trace: ContextVar[Optional["QueryTrace"]] = ContextVar(
+    "rag_query_trace", default=None
+)
+# Innermost span opened in this context (the parent of the next span)
+_current_span: ContextVar[Optional["Span"]] = ContextVar("rag_query_span", default=None)
+
+
+@dataclass
+class Span:
+    """A timed stage of a trace."""
+
+    name: str
+    span_id: str
+    parent_id: Optional[str]
+    start_ns: int
+    end_ns: int = 0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration_seconds(self) -> float:
+        """Span duration in seconds."""
+        return (self.end_ns - self.start_ns) / 1e9
+
+
+class QueryTrace:
+    """
+    Spans recorded while processing one query.
+
+    Span start times use wall-clock nanoseconds (for exporters); durations
+    are measured with ``time.perf_counter_ns`` so clock adjustments do not
+    distort them. Spans may be recorded from several threads at once; each
+    is parented to the span open in the context that recorded it.
+    """
+
+    def __init__(self, name: str, attributes: Optional[Dict[str, Any]] = None):
+        """
+        Initialize trace and start its root span.
+
+        Args:
+            name: Root span name (e.g. "rag.query")
+            attributes: Root span attributes (optional)
+        """
+        self.trace_id = secrets.token_hex(16)
+        self._wall_offset_ns = time.time_ns() - time.perf_counter_ns()
+        self.root = Span(
+            name=name,
+            span_id=secrets.token_hex(8),
+            parent_id=None,
+            start_ns=self._now_ns(),
+            attributes=dict(attributes or {}),
+        )
+        self.spans: List[Span] = []
+        self._stack: List[Span] = [self.root]
+        self._lock = threading.Lock()
+
+    def _now_ns(self) -> int:
+        """Return wall-clock nanoseconds derived from the monotonic clock."""
+        return time.perf_counter_ns() + self._wall_offset_ns
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span]:
+        """
+        Record a span around a block.
+
+        Args:
+            name: Stage name
+            **attributes: Span attributes (e.g. n_results=20)
+
+        Yields:
+            The open span; attributes may be added while it runs
+        """
+        parent = _current_span.get()
+        with self._lock:
+            if parent is None or not any(open_ is parent for open_ in self._stack):
+                parent = self.root
+            span = Span(
+                name=name,
+                span_id=secrets.token_hex(8),
+                parent_id=parent.span_id,
+                start_ns=self._now_ns(),
+                attributes=attributes,
+            )
+            self._stack.append(span)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.attributes["error"] = type(e).__name__
+            raise
+        finally:
+            span.end_ns = self._now_ns()
+            _current_span.reset(token)
+            with self._lock:
+                self._stack.remove(span)
+                self.spans.append(span)
+
+    def finish(self) -> None:
+        """End the root span."""
+        if not self.root.end_ns:
+            self.root.end_ns = self._now_ns()
+
+    def timings(self) -> Dict[str, float]:
+        """
+        Return stage durations in milliseconds.
+
+        Durations of stages that ran more than once (e.g. embed_query on a
+        retrieval fallback) are summed. Stages are listed in the order they
+        started, followed by the total.
+
+        Returns:
+            Mapping of stage name to milliseconds, including "total"
+        """
+        totals: Dict[str, float] = {}
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: s.start_ns)
+        for span in spans:
+            totals[span.name] = totals.get(span.name, 0.0) + span.duration_seconds
+        end_ns = self.root.end_ns or self._now_ns()
+        totals[TOTAL_STAGE] = (end_ns - self.root.start_ns) / 1e9
+        return {name: round(seconds * 1000, 3) for name, seconds in totals.items()}
+
+
+class SpanExporter:
+    """Base class for trace exporters."""
+
+    def export(self, trace: QueryTrace) -> None:
+        """
+        Export a finished trace.
+
+        Args:
+            trace: Trace whose root span has ended
+        """
+        raise NotImplementedError
+
+
+class PrometheusSpanExporter(SpanExporter):
+    """Observe span durations in the rag_stage_duration_seconds histogram."""
+
+    def export(self, trace: QueryTrace) -> None:
+        """Observe every span and the root span (as stage "total")."""
+        for span in trace.spans:
+            rag_stage_duration_seconds.labels(stage=span.name).observe(
+                span.duration_seconds
+            )
+        rag_stage_duration_seconds.labels(stage=TOTAL_STAGE).observe(
+            trace.root.duration_seconds
+        )
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    """Encode an attribute value as an OTLP/JSON AnyValue."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        # OTLP/JSON encodes 64-bit integers as strings
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_span(trace_id: str, span: Span) -> Dict[str, Any]:
+    """Encode a span in OTLP/JSON form."""
+    encoded = {
+        "traceId": trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        # SPAN_KIND_INTERNAL
+        "kind": 1,
+        "startTimeUnixNano": str(span.start_ns),
+        "endTimeUnixNano": str(span.end_ns),
+        "attributes": [
+            {"key": key, "value": _otlp_value(value)}
+            for key, value in span.attributes.items()
+        ],
+    }
+    if span.parent_id:
+        encoded["parentSpanId"] = span.parent_id
+    if "error" in span.attributes:
+        # STATUS_CODE_ERROR
+        encoded["status"] = {"code": 2}
+    return encoded
+
+
+class OTLPFileSpanExporter(SpanExporter):
+    """
+    Append traces to a local file in OTLP/JSON format.
+
+    Each line is an ``ExportTraceServiceRequest`` JSON document (the format
+    of the OpenTelemetry collector file exporter), so traces can be replayed
+    into a collector or inspected with OpenTelemetry tooling.
+    """
+
+    def __init__(self, path: Optional[str] = None, service_name: str = "rag"):
+        """
+        Initialize file exporter.
+
+        Args:
+            path: Output file (default: config.rag_trace_file)
+            service_name: service.name resource attribute
+        """
+        self.path = Path(path or config.rag_trace_file)
+        self.service_name = service_name
+        self._lock = threading.Lock()
+
+    def export(self, trace: QueryTrace) -> None:
+        """Append the trace as one JSON line."""
+        document = {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            {
+                                "key": "service.name",
+                                "value": _otlp_value(self.service_name),
+                            }
+                        ]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": __name__},
+                            "spans": [
+                                _otlp_span(trace.trace_id, span)
+                                for span in [trace.root, *trace.spans]
+                            ],
+                        }
+                    ],
+                }
+            ]
+        }
+        line = json.dumps(document, separators=(",", ":")) + "\n"
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as handle:
+                handle.write(line)
+
+
+_EXPORTER_TYPES = {
+    "prometheus": PrometheusSpanExporter,
+    "otlp_file": OTLPFileSpanExporter,
+}
+
+_exporters: Optional[Tuple[Tuple[str, str], List[SpanExporter]]] = None
+_exporters_lock = threading.Lock()
+
+
+def get_exporters() -> List[SpanExporter]:
+    """
+    Return the exporters configured by RAG_TRACING_EXPORTERS.
+
+    Exporters are rebuilt when the exporter list or trace file changes, so
+    tests and long-running processes pick up configuration changes.
+
+    Returns:
+        List of exporters (empty if tracing is disabled)
+    """
+    global _exporters
+    if not config.rag_tracing_enabled:
+        return []
+    key = (config.rag_tracing_exporters, config.rag_trace_file)
+    with _exporters_lock:
+        if _exporters is None or _exporters[0] != key:
+            exporters: List[SpanExporter] = []
+            for name in config.rag_tracing_exporters.split(","):
+                name = name.strip().lower()
+                if not name:
+                    continue
+                exporter_type = _EXPORTER_TYPES.get(name)
+                if exporter_type is None:
+                    logger.warning(f"Unknown trace exporter ignored: {name}")
+                    continue
+                exporters.append(exporter_type())
+            _exporters = (key, exporters)
+        return _exporters[1]
+
+
+@contextmanager
+def start_trace(
+    name: str,
+    exporters: Optional[List[SpanExporter]] = None,
+    **attributes: Any,
+) -> Iterator[QueryTrace]:
+    """
+    Trace a block; stages called inside it are recorded in the trace.
+
+    The trace is exported when the block exits, also on errors. Exporter
+    failures are logged and never propagate to the caller.
+
+    Args:
+        name: Root span name
+        exporters: Exporters to use (default: get_exporters())
+        **attributes: Root span attributes
+
+    Yields:
+        The active QueryTrace
+    """
+    trace = QueryTrace(name, attributes)
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
+        trace.finish()
+        for exporter in get_exporters() if exporters is None else exporters:
+            try:
+                exporter.export(trace)
+            except Exception as e:
+                logger.warning(
+                    f"Trace export failed ({type(exporter).__name__}): {str(e)}"
+                )
+
+
+def current_trace() -> Optional[QueryTrace]:
+    """Return the trace active in this context, if any."""
+    return _current_trace.get()
+
+
+@contextmanager
+def stage(name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    """
+    Record a stage in the active trace; a no-op without one.
+
+    Args:
+        name: Stage name
+        **attributes: Span attributes
+
+    Yields:
+        The open span, or None outside a trace
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield None
+        return
+    with trace.span(name, **attributes) as span:
+        yield span
+
+
+def submit_in_context(
+    executor: Executor, fn: Callable[..., Any], *args: Any, **kwargs: Any
+) -> Future:
+    """
+    Submit a call that runs in a copy of the caller's context.
+
+    Stages recorded by the call join the caller's active trace.
+
+    Args:
+        executor: Executor to submit to
+        fn: Callable to run
+        *args: Positional arguments for fn
+        **kwargs: Keyword arguments for fn
+
+    Returns:
+        Future of the call
+    """
+    return executor.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+def map_in_context(
+    executor: Executor, fn: Callable[..., Any], *iterables: Iterable[Any]
+) -> List[Any]:
+    """
+    Context-propagating counterpart of ``list(executor.map(fn, ...))``.
+
+    Args:
+        executor: Executor to run the calls on
+        fn: Callable applied to the zipped items of iterables
+        *iterables: Argument iterables
+
+    Returns:
+        Results in input order
+
+    Raises:
+        Exception: The first exception raised by a call, in input order
+    """
+    futures = [submit_in_context(executor, fn, *args) for args in zip(*iterables)]
+    return [future.result() for future in futures]
@@ -1,9 +1,27 @@
 """
 Vector database integration module.
 
-Handles ChromaDB setup, storage, and retrieval of document embeddings.
+Handles vector store setup, storage, and retrieval of document embeddings
+with a configurable backend (ChromaDB or the in-process HNSW store),
+optionally sharded by data domain and with news partitioned by week.
 """
 
+from app.vector_db.base import VectorStore, VectorStoreError
 from app.vector_db.chroma_store import ChromaStore, ChromaStoreError
+from app.vector_db.factory import create_vector_store
+from app.vector_db.hnsw_store import HNSWStore, HNSWStoreError
+from app.vector_db.partitioned_store import TimePartitionedStore, news_partitions
+from app.vector_db.sharded_store import ShardedStore
 
-__all__ = ["ChromaStore", "ChromaStoreError"]
+__all__ = [
+    "VectorStore",
+    "VectorStoreError",
+    "ChromaStore",
+    "ChromaStoreError",
+    "HNSWStore",
+    "HNSWStoreError",
+    "ShardedStore",
+    "TimePartitionedStore",
+    "news_partitions",
+    "create_vector_store",
+]
@@ -0,0 +1,283 @@
+"""
+Vector store interface.
+
+Application code works against ``VectorStore`` and obtains stores from
+``create_vector_store`` (see ``app.vector_db.factory``), so the backend is a
+configuration choice (``VECTOR_STORE_BACKEND``):
+
+- ``chroma``: ChromaDB persistent collections (``ChromaStore``)
+- ``hnsw``: in-process hnswlib index (``HNSWStore``, requires the optional
+  hnswlib package)
+
+Result dictionaries, metadata filters (``where``) and document filters
+(``where_document``) use the ChromaDB formats for every backend.
+"""
+
+import functools
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional
+
+from langchain_core.documents import Document
+
+from app.utils.metrics import (
+    track_error,
+    track_success,
+    vector_db_operation_duration_seconds,
+    vector_db_operations_total,
+)
+
+
+class VectorStoreError(Exception):
+    """Custom exception for vector store operations."""
+
+    pass
+
+
+def instrumented(operation: str, resizes: bool = False) -> Callable:
+    """
+    Decorate a VectorStore method to record vector DB metrics.
+
+    Records vector_db_operations_total (with success/error status) and
+    vector_db_operation_duration_seconds for the operation. Methods that
+    change the number of stored documents refresh the collection size
+    gauge afterwards; reads never touch it, so the gauge costs one count
+    per write.
+
+    Args:
+        operation: Operation label (e.g. "add", "query", "delete")
+        resizes: Whether the method changes the collection size
+    """
+
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self: "VectorStore", *args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                result = method(self, *args, **kwargs)
+            except Exception:
+                track_error(vector_db_operations_total, {"operation": operation})
+                raise
+            finally:
+                vector_db_operation_duration_seconds.labels(
+                    operation=operation
+                ).observe(time.perf_counter() - start)
+            track_success(vector_db_operations_total, {"operation": operation})
+            if resizes:
+                self._refresh_size()
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+class VectorStore(ABC):
+    """
+    Collection of documents with embeddings and similarity search.
+
+    Attributes:
+        collection_name: Name of the collection
+    """
+
+    collection_name: str
+
+    @abstractmethod
+    def _refresh_size(self) -> None:
+        """Set the collection size gauge (called after resizing writes)."""
+
+    @abstractmethod
+    def add_documents(
+        self,
+        documents: List[Document],
+        embeddings: List[List[float]],
+        ids: Optional[List[str]] = None,
+    ) -> List[str]:
+        """
+        Add documents with embeddings.
+
+        Args:
+            documents: List of LangChain Document objects
+            embeddings: List of embedding vectors for each document
+            ids: Optional list of unique IDs. If None, generates UUIDs
+
+        Returns:
+            List of document IDs that were added
+
+        Raises:
+            VectorStoreError: If adding documents fails
+        """
+
+    @abstractmethod
+    def query_by_embedding(
+        self,
+        query_embedding: List[float],
+        n_results: int = 5,
+        where: Optional[Dict[str, Any]] = None,
+        where_document: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Query collection by embedding vector.
+
+        Args:
+            query_embedding: Query embedding vector
+            n_results: Number of results to return (default: 5)
+            where: Optional metadata filter dictionary
+            where_document: Optional document content filter
+
+        Returns:
+            Dictionary with keys: ids, distances, metadatas, documents
+            (nearest first)
+
+        Raises:
+            VectorStoreError: If query fails
+        """
+
+    @abstractmethod
+    def query_by_text(
+        self,
+        query_text: str,
+        n_results: int = 5,
+        where: Optional[Dict[str, Any]] = None,
+        where_document: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Query collection by text with the backend's own embedding function.
+
+        Args:
+            query_text: Query text string
+            n_results: Number of results to return (default: 5)
+            where: Optional metadata filter dictionary
+            where_document: Optional document content filter
+
+        Returns:
+            Dictionary with keys: ids, distances, metadatas, documents
+
+        Raises:
+            VectorStoreError: If query fails or the backend has no
+                embedding function
+        """
+
+    @abstractmethod
+    def get_by_ids(self, ids: List[str]) -> Dict[str, Any]:
+        """
+        Retrieve documents by their IDs.
+
+        Args:
+            ids: List of document IDs to retrieve
+
+        Returns:
+            Dictionary with keys: ids, metadatas, documents
+
+        Raises:
+            VectorStoreError: If retrieval fails
+        """
+
+    @abstractmethod
+    def get_ids_by_metadata(
+        self, where: Dict[str, Any], limit: Optional[int] = None
+    ) -> List[str]:
+        """
+        Retrieve IDs of documents matching a metadata filter.
+
+        Args:
+            where: Metadata filter dictionary (e.g. {"content_hash": "..."})
+            limit: Maximum number of IDs to return (None = all)
+
+        Returns:
+            List of matching document IDs
+
+        Raises:
+            VectorStoreError: If retrieval fails
+        """
+
+    @abstractmethod
+    def get_all(
+        self, where: Optional[Dict[str, Any]] = None, limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Retrieve all documents, optionally only those matching a filter.
+
+        Args:
+            where: Optional metadata filter dictionary
+            limit: Maximum number of documents to return (None = all)
+
+        Returns:
+            Dictionary with keys: ids, metadatas, documents
+
+        Raises:
+            VectorStoreError: If retrieval fails
+        """
+
+    @abstractmethod
+    def count(self) -> int:
+        """
+        Get the number of documents in the collection.
+
+        Returns:
+            Number of documents in the collection
+
+        Raises:
+            VectorStoreError: If count fails
+        """
+
+    @abstractmethod
+    def delete_collection(self) -> None:
+        """
+        Delete the collection.
+
+        Raises:
+            VectorStoreError: If deletion fails
+        """
+
+    @abstractmethod
+    def delete_documents(
+        self,
+        ids: Optional[List[str]] = None,
+        where: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """
+        Delete documents from the collection by IDs or metadata filter.
+
+        Args:
+            ids: Optional list of document IDs to delete
+            where: Optional metadata filter dictionary to delete matching documents
+
+        Returns:
+            Number of documents deleted
+
+        Raises:
+            VectorStoreError: If deletion fails
+            ValueError: If neither ids nor where is provided
+        """
+
+    @abstractmethod
+    def update_documents(
+        self,
+        ids: List[str],
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+        documents: Optional[List[str]] = None,
+        embeddings: Optional[List[List[float]]] = None,
+    ) -> None:
+        """
+        Update documents in the collection.
+
+        Args:
+            ids: List of document IDs to update
+            metadatas: Optional list of metadata dictionaries
+            documents: Optional list of document texts
+            embeddings: Optional list of embedding vectors
+
+        Raises:
+            VectorStoreError: If update fails
+            ValueError: If ids is empty or lengths don't match
+        """
+
+    @abstractmethod
+    def reset(self) -> None:
+        """
+        Reset the collection (delete all documents).
+
+        Raises:
+            VectorStoreError: If reset fails
+        """
@@ -6,35 +6,56 @@ Handles ChromaDB setup, document storage, and similarity search operations.
 
 import uuid
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-import chromadb
-from chromadb import Collection
 from langchain_core.documents import Document
 
 from app.utils.config import config
+from app.utils.lazy_imports import lazy_import
 from app.utils.logger import get_logger
+from app.utils.metrics import vector_db_collection_size
+from app.vector_db.base import VectorStore, VectorStoreError, instrumented
 
 logger = get_logger(__name__)
 
+if TYPE_CHECKING:
+    import chromadb
 
-class ChromaStoreError(Exception):
+# chromadb is imported when the first store is created
+_chromadb = lazy_import("chromadb")
+
+HNSW_SPACES = ("l2", "cosine", "ip")
+
+# Documents copied per batch when rebuilding a collection
+REBUILD_BATCH_SIZE = 1000
+
+
+class ChromaStoreError(VectorStoreError):
     """Custom exception for ChromaDB operations."""
 
     pass
 
 
-class ChromaStore:
+class ChromaStore(VectorStore):
     """
     ChromaDB vector store for document embeddings.
 
     Supports persistent storage and similarity search operations.
+
+    New collections are created with the configured HNSW index settings.
+    ChromaDB fixes the distance space, M and construction ef when a
+    collection is created; only the search ef can be changed afterwards
+    (``set_ef_search``), so the others take effect through ``rebuild``.
     """
 
     def __init__(
         self,
         collection_name: str = "documents",
         persist_directory: Optional[Path] = None,
+        space: Optional[str] = None,
+        m: Optional[int] = None,
+        ef_construction: Optional[int] = None,
+        ef_search: Optional[int] = None,
     ):
         """
         Initialize ChromaDB vector store.
@@ -43,8 +64,24 @@ class ChromaStore:
             collection_name: Name of the ChromaDB collection
             persist_directory: Directory for persistent storage.
                 If None, uses config.CHROMA_DB_DIR
+            space: Distance space of a new collection, "l2", "cosine" or "ip"
+                (default: config.chroma_hnsw_space)
+            m: Neighbours per HNSW node of a new collection
+                (default: config.chroma_hnsw_m)
+            ef_construction: HNSW candidate list size while inserting into a
+                new collection (default: config.chroma_hnsw_ef_construction)
+            ef_search: HNSW candidate list size while searching
+                (default: config.chroma_hnsw_ef_search)
         """
         self.collection_name = collection_name
+        self.space = (space or config.chroma_hnsw_space).lower()
+        self.m = m or config.chroma_hnsw_m
+        self.ef_construction = ef_construction or config.chroma_hnsw_ef_construction
+        self.ef_search = ef_search or config.chroma_hnsw_ef_search
+        if self.space not in HNSW_SPACES:
+            raise ChromaStoreError(
+                f"Invalid HNSW space: {self.space}. Must be one of {HNSW_SPACES}"
+            )
 
         # Use configured directory or provided path
         if persist_directory is None:
@@ -58,7 +95,7 @@ class ChromaStore:
             f"Initializing ChromaDB client: persist_directory={persist_directory}"
         )
         try:
-            self.client = chromadb.PersistentClient(
+            self.client = _chromadb.PersistentClient(
                 path=str(persist_directory),
             )
             logger.debug("ChromaDB client initialized successfully")
@@ -71,16 +108,44 @@ class ChromaStore:
             ) from e
 
         # Get or create collection
-        self.collection: Optional[Collection] = None
+        self.collection: Optional["chromadb.Collection"] = None
         self._ensure_collection()
 
+    def _refresh_size(self) -> None:
+        """Set the collection size gauge from the collection count."""
+        if self.collection is None:
+            vector_db_collection_size.labels(collection=self.collection_name).set(0)
+            return
+        try:
+            vector_db_collection_size.labels(collection=self.collection_name).set(
+                self.collection.count()
+            )
+        except Exception as e:
+            logger.debug(f"Could not refresh collection size metric: {str(e)}")
+
+    def _hnsw_configuration(self) -> Dict[str, Any]:
+        """ChromaDB HNSW configuration of collections created by this store."""
+        return {
+            "space": self.space,
+            "max_neighbors": self.m,
+            "ef_construction": self.ef_construction,
+            "ef_search": self.ef_search,
+        }
+
     def _ensure_collection(self) -> None:
-        """Ensure collection exists, create if it doesn't."""
+        """
+        Ensure collection exists, create if it doesn't.
+
+        An existing collection keeps the index settings it was created
+        with; a differing search ef is applied to it, differing creation
+        settings are logged.
+        """
         logger.debug(f"Ensuring collection exists: {self.collection_name}")
         try:
             self.collection = self.client.get_or_create_collection(
                 name=self.collection_name,
                 metadata={"description": "Document embeddings for RAG system"},
+                configuration={"hnsw": self._hnsw_configuration()},
             )
             if self.collection is None:
                 logger.error(
@@ -89,10 +154,10 @@ class ChromaStore:
                 raise ChromaStoreError(
                     f"Failed to get or create collection '{self.collection_name}'"
                 )
-            logger.info(
-                f"Collection '{self.collection_name}' ready "
-                f"(count: {self.collection.count()})"
-            )
+            self._check_index_settings()
+            count = self.collection.count()
+            vector_db_collection_size.labels(collection=self.collection_name).set(count)
+            logger.info(f"Collection '{self.collection_name}' ready (count: {count})")
         except Exception as e:
             logger.error(
                 f"Failed to get or create collection "
@@ -103,6 +168,186 @@ class ChromaStore:
                 f"Failed to get or create collection '{self.collection_name}': {str(e)}"
             ) from e
 
+    def _check_index_settings(self) -> None:
+        """Reconcile an existing collection's index with the requested one."""
+        settings = self.index_settings()
+        if settings["ef_search"] != self.ef_search:
+            self.set_ef_search(self.ef_search)
+        fixed = [
+            f"{key}={settings[key]} (requested {getattr(self, key)})"
+            for key in ("space", "m", "ef_construction")
+            if settings[key] != getattr(self, key)
+        ]
+        if fixed:
+            logger.warning(
+                f"Collection '{self.collection_name}' was created with "
+                f"{', '.join(fixed)}; rebuild it to apply the requested settings "
+                f"(scripts/tune_vector_index.py --rebuild)"
+            )
+
+    def index_settings(self) -> Dict[str, Any]:
+        """
+        Get the HNSW index settings of the collection.
+
+        Returns:
+            Dictionary with keys: space, m, ef_construction, ef_search
+
+        Raises:
+            ChromaStoreError: If the collection is not initialized
+        """
+        if self.collection is None:
+            raise ChromaStoreError("Collection is not initialized")
+
+        hnsw = self.collection.configuration.get("hnsw") or {}
+        return {
+            "space": hnsw.get("space", "l2"),
+            "m": hnsw.get("max_neighbors", 16),
+            "ef_construction": hnsw.get("ef_construction", 100),
+            "ef_search": hnsw.get("ef_search", 100),
+        }
+
+    def set_ef_search(self, ef_search: int) -> None:
+        """
+        Change the HNSW search candidate list size of the collection.
+
+        The setting is persisted with the collection. ChromaDB reads it when
+        it loads the index, so a process that has already searched the
+        collection keeps the previous value until it reopens it.
+
+        Args:
+            ef_search: Candidate list size while searching
+
+        Raises:
+            ChromaStoreError: If the change fails
+        """
+        if self.collection is None:
+            raise ChromaStoreError("Collection is not initialized")
+
+        try:
+            self.collection.modify(configuration={"hnsw": {"ef_search": ef_search}})
+            self.ef_search = ef_search
+            logger.info(
+                f"Set ef_search={ef_search} on collection '{self.collection_name}'"
+            )
+        except Exception as e:
+            logger.error(f"Failed to set ef_search: {str(e)}", exc_info=True)
+            raise ChromaStoreError(f"Failed to set ef_search: {str(e)}") from e
+
+    @instrumented("rebuild")
+    def rebuild(
+        self,
+        space: Optional[str] = None,
+        m: Optional[int] = None,
+        ef_construction: Optional[int] = None,
+        ef_search: Optional[int] = None,
+        batch_size: int = REBUILD_BATCH_SIZE,
+    ) -> int:
+        """
+        Rebuild the collection's index with new HNSW settings.
+
+        Documents, metadata and embeddings are copied into a new collection
+        created with the settings. The old collection is then renamed aside,
+        the new one takes its name and the old one is dropped; if the new
+        collection cannot be renamed, the old one gets its name back.
+        Embeddings are reused, nothing is re-embedded. Between the two
+        renames the collection name briefly does not resolve, so run
+        rebuilds while ingestion is stopped.
+
+        Args:
+            space: Distance space, "l2", "cosine" or "ip" (default: current)
+            m: Neighbours per HNSW node (default: current)
+            ef_construction: Candidate list size while inserting
+                (default: current)
+            ef_search: Candidate list size while searching (default: current)
+            batch_size: Documents copied per batch
+
+        Returns:
+            Number of documents copied
+
+        Raises:
+            ChromaStoreError: If the rebuild fails
+        """
+        if self.collection is None:
+            raise ChromaStoreError("Collection is not initialized")
+
+        current = self.index_settings()
+        space = (space or current["space"]).lower()
+        if space not in HNSW_SPACES:
+            raise ChromaStoreError(
+                f"Invalid HNSW space: {space}. Must be one of {HNSW_SPACES}"
+            )
+        m = m or current["m"]
+        ef_construction = ef_construction or current["ef_construction"]
+        ef_search = ef_search or current["ef_search"]
+        configuration = {
+            "space": space,
+            "max_neighbors": m,
+            "ef_construction": ef_construction,
+            "ef_search": ef_search,
+        }
+        rebuild_name = f"{self.collection_name}__rebuild"
+        previous_name = f"{self.collection_name}__previous"
+        logger.info(
+            f"Rebuilding collection '{self.collection_name}' with {configuration}"
+        )
+        try:
+            # A rebuild interrupted earlier leaves its partial copy behind
+            existing = {c.name for c in self.client.list_collections()}
+            for leftover in (rebuild_name, previous_name):
+                if leftover in existing:
+                    self.client.delete_collection(name=leftover)
+            target = self.client.create_collection(
+                name=rebuild_name,
+                metadata=self.collection.metadata,
+                configuration={"hnsw": configuration},
+            )
+            copied = 0
+            total = self.collection.count()
+            while copied < total:
+                batch = self.collection.get(
+                    limit=batch_size,
+                    offset=copied,
+                    include=["embeddings", "documents", "metadatas"],
+                )
+                if not batch["ids"]:
+                    break
+                target.add(
+                    ids=batch["ids"],
+                    embeddings=batch["embeddings"],
+                    documents=batch["documents"],
+                    metadatas=batch["metadatas"],
+                )
+                copied += len(batch["ids"])
+            if target.count() != total:
+                raise ChromaStoreError(f"Copied {target.count()} of {total} documents")
+            previous = self.collection
+            previous.modify(name=previous_name)
+            try:
+                target.modify(name=self.collection_name)
+            except Exception:
+                previous.modify(name=self.collection_name)
+                raise
+            self.collection = target
+        except Exception as e:
+            logger.error(f"Failed to rebuild collection: {str(e)}", exc_info=True)
+            raise ChromaStoreError(f"Failed to rebuild collection: {str(e)}") from e
+
+        try:
+            self.client.delete_collection(name=previous_name)
+        except Exception as e:
+            # The rebuilt collection is in place; the next rebuild drops it
+            logger.warning(
+                f"Failed to drop previous collection '{previous_name}': {str(e)}"
+            )
+
+        self.space = space
+        self.m = m
+        self.ef_construction = ef_construction
+        self.ef_search = ef_search
+        logger.info(f"Rebuilt collection '{self.collection_name}' ({copied} documents)")
+        return copied
+
+    @instrumented("add", resizes=True)
     def add_documents(
         self,
         documents: List[Document],
@@ -176,6 +421,7 @@ class ChromaStore:
                 f"Failed to add documents to ChromaDB: {str(e)}"
             ) from e
 
+    @instrumented("query")
     def query_by_embedding(
         self,
         query_embedding: List[float],
@@ -225,6 +471,7 @@ class ChromaStore:
             logger.error(f"Failed to query ChromaDB: {str(e)}", exc_info=True)
             raise ChromaStoreError(f"Failed to query ChromaDB: {str(e)}") from e
 
+    @instrumented("query")
     def query_by_text(
         self,
         query_text: str,
@@ -277,6 +524,7 @@ class ChromaStore:
             logger.error(f"Failed to query ChromaDB by text: {str(e)}", exc_info=True)
             raise ChromaStoreError(f"Failed to query ChromaDB by text: {str(e)}") from e
 
+    @instrumented("get")
     def get_by_ids(self, ids: List[str]) -> Dict[str, Any]:
         """
         Retrieve documents by their IDs.
@@ -310,10 +558,51 @@ class ChromaStore:
             logger.error(f"Failed to get documents by IDs: {str(e)}", exc_info=True)
             raise ChromaStoreError(f"Failed to get documents by IDs: {str(e)}") from e
 
-    def get_all(self) -> Dict[str, Any]:
+    @instrumented("get")
+    def get_ids_by_metadata(
+        self, where: Dict[str, Any], limit: Optional[int] = None
+    ) -> List[str]:
+        """
+        Retrieve IDs of documents matching a metadata filter.
+
+        Only IDs are fetched (no documents or embeddings), so this is cheap
+        enough for existence checks such as content-hash deduplication.
+
+        Args:
+            where: Metadata filter dictionary (e.g. {"content_hash": "..."})
+            limit: Maximum number of IDs to return (None = all)
+
+        Returns:
+            List of matching document IDs
+
+        Raises:
+            ChromaStoreError: If retrieval fails
+        """
+        if self.collection is None:
+            raise ChromaStoreError("Collection is not initialized")
+
+        try:
+            results = self.collection.get(where=where, limit=limit, include=[])
+            return list(results.get("ids", []))
+        except Exception as e:
+            logger.error(
+                f"Failed to get document IDs by metadata: {str(e)}", exc_info=True
+            )
+            raise ChromaStoreError(
+                f"Failed to get document IDs by metadata: {str(e)}"
+            ) from e
+
+    @instrumented("get")
+    def get_all(
+        self, where: Optional[Dict[str, Any]] = None, limit: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
         Retrieve all documents from the collection.
 
+        Args:
+            where: Optional metadata filter dictionary
+            limit: Maximum number of documents to return (None = all)
+
         Returns:
             Dictionary with keys: ids, metadatas, documents
 
@@ -325,9 +614,10 @@ class ChromaStore:
 
         logger.debug("Getting all documents from collection")
         try:
-            # Get all documents (ChromaDB doesn't have a direct "get all" method)
-            # We query with a large n_results or use get() with empty where clause
+            # get() without a filter returns every document
             results = self.collection.get(
+                where=where,
+                limit=limit,
                 include=["metadatas", "documents"],
             )
 
@@ -342,6 +632,7 @@ class ChromaStore:
             logger.error(f"Failed to get all documents: {str(e)}", exc_info=True)
             raise ChromaStoreError(f"Failed to get all documents: {str(e)}") from e
 
+    @instrumented("count")
     def count(self) -> int:
         """
         Get the number of documents in the collection.
@@ -357,6 +648,7 @@ class ChromaStore:
 
         try:
             count = self.collection.count()
+            vector_db_collection_size.labels(collection=self.collection_name).set(count)
             logger.debug(
                 f"Collection '{self.collection_name}' contains {count} documents"
             )
@@ -365,6 +657,7 @@ class ChromaStore:
             logger.error(f"Failed to count documents: {str(e)}", exc_info=True)
             raise ChromaStoreError(f"Failed to count documents: {str(e)}") from e
 
+    @instrumented("delete_collection", resizes=True)
     def delete_collection(self) -> None:
         """
         Delete the collection from ChromaDB.
@@ -386,6 +679,7 @@ class ChromaStore:
                 f"Failed to delete collection '{self.collection_name}': {str(e)}"
             ) from e
 
+    @instrumented("delete", resizes=True)
     def delete_documents(
         self,
         ids: Optional[List[str]] = None,
@@ -439,6 +733,7 @@ class ChromaStore:
             logger.error(f"Failed to delete documents: {str(e)}", exc_info=True)
             raise ChromaStoreError(f"Failed to delete documents: {str(e)}") from e
 
+    @instrumented("update")
     def update_documents(
         self,
         ids: List[str],
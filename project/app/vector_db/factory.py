@@ -0,0 +1,77 @@
+"""
+Vector store factory.
+
+Creates the configured vector store backend (``VECTOR_STORE_BACKEND``),
+split into per-domain shards when ``VECTOR_STORE_SHARDING`` is enabled and
+with the news shard split into weekly partitions when ``NEWS_PARTITIONING``
+is enabled.
+"""
+
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from app.utils.config import config
+from app.vector_db.base import VectorStore, VectorStoreError
+from app.vector_db.chroma_store import ChromaStore
+from app.vector_db.hnsw_store import HNSWStore
+from app.vector_db.partitioned_store import TimePartitionedStore
+from app.vector_db.sharded_store import ShardedStore
+
+BACKENDS: Dict[str, Callable[..., VectorStore]] = {
+    "chroma": ChromaStore,
+    "hnsw": HNSWStore,
+}
+
+
+def create_vector_store(
+    collection_name: str = "documents",
+    persist_directory: Optional[Path] = None,
+    backend: Optional[str] = None,
+    sharded: Optional[bool] = None,
+    partitioned: Optional[bool] = None,
+) -> VectorStore:
+    """
+    Create a vector store for a collection.
+
+    Args:
+        collection_name: Name of the collection
+        persist_directory: Storage directory (default: the backend's
+            configured directory)
+        backend: Backend name, "chroma" or "hnsw"
+            (default: config.vector_store_backend)
+        sharded: Split the collection into per-domain shards
+            (default: config.vector_store_sharding)
+        partitioned: Split the news shard into weekly partitions, which
+            implies sharding (default: config.news_partitioning)
+
+    Returns:
+        Vector store instance
+
+    Raises:
+        VectorStoreError: If the backend is unknown or the store cannot be opened
+    """
+    backend_name = (backend or config.vector_store_backend).lower()
+    if backend_name not in BACKENDS:
+        raise VectorStoreError(
+            f"Unknown vector store backend '{backend_name}', "
+            f"expected one of {sorted(BACKENDS)}"
+        )
+
+    def open_collection(name: str) -> VectorStore:
+        return BACKENDS[backend_name](
+            collection_name=name, persist_directory=persist_directory
+        )
+
+    if partitioned is None:
+        partitioned = config.news_partitioning
+    if sharded is None:
+        sharded = config.vector_store_sharding
+
+    def open_shard(name: str) -> VectorStore:
+        if partitioned and name == f"{collection_name}_news":
+            return TimePartitionedStore(name, open_collection)
+        return open_collection(name)
+
+    if sharded or partitioned:
+        return ShardedStore(collection_name, open_shard)
+    return open_collection(collection_name)
@@ -0,0 +1,1356 @@
+"""
+In-process HNSW vector store backed by hnswlib.
+
+A collection lives in ``HNSW_STORE_DIR/<collection_name>/``:
+
+- ``vectors.f16``: float16 vectors, one row per stored chunk
+- ``codes.u8`` and ``quantizer.f32``: 8-bit codes of the vectors and the
+  per-dimension offset and step they were encoded with (quantized
+  collections only)
+- ``index.bin``: hnswlib index (graph and float32 vectors), rewritten once
+  ``HNSW_STORE_SYNC_THRESHOLD`` vectors have been added since the last save
+- ``meta.db``: SQLite sidecar with IDs, texts, metadata (JSON), deleted
+  rows and the collection state (row counts, generation)
+
+Queries run hnswlib's HNSW search in the calling process, with no
+client/server round trip. hnswlib is an optional dependency; opening a
+collection without it raises HNSWStoreError. hnswlib keeps its graph and a
+float32 copy of the vectors in each process's memory. ``vectors.f16`` is
+memory-mapped read-only instead, so its pages live in the OS page cache and
+are shared by every process on the host; exact search over filtered rows
+reads the vectors from there.
+
+Rows are append-only: deletes tombstone rows (marked deleted in the index)
+and updated embeddings are inserted as new rows. Writers bump a generation
+counter in the sidecar when a write commits. Readers (also in other
+processes) load ``index.bin`` once and then add rows committed since from
+``vectors.f16`` and apply new tombstones, so several read-only API workers
+can serve a collection that an ingestion process writes to. Only one
+process should write to a collection at a time.
+
+Metadata (``where``) and document (``where_document``) filters use the
+ChromaDB syntax and are evaluated in SQLite. Selective filters are answered
+by exact search over the matching rows; broad ones by filtered HNSW search.
+
+Collections created with ``quantization="int8"`` search in two stages. The
+first stage ranks 8-bit scalar-quantized codes (one byte per dimension, a
+quarter of a float32 vector) to collect ``rescore_factor * k`` candidates:
+the hnswlib graph is built over the decoded codes, and exact search scans
+the memory-mapped ``codes.u8``. The candidates are then rescored with their
+float16 vectors, of which only the candidate rows of ``vectors.f16`` are
+read. The quantizer is fitted on the first QUANTIZER_MIN_ROWS vectors, when
+the index is rebuilt over the codes; smaller collections search the float16
+vectors directly. hnswlib still holds the decoded codes as float32, so
+quantization shrinks the shared files that exact search scans, not the
+per-process index.
+"""
+
+import json
+import os
+import shutil
+import sqlite3
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from langchain_core.documents import Document
+
+from app.utils.config import config
+from app.utils.lazy_imports import is_available, lazy_import
+from app.utils.logger import get_logger
+from app.utils.metrics import vector_db_collection_size
+from app.vector_db.base import VectorStore, VectorStoreError, instrumented
+
+hnswlib = lazy_import("hnswlib")
+
+logger = get_logger(__name__)
+
+SPACES = ("l2", "cosine", "ip")
+
+QUANTIZATIONS = ("none", "int8")
+
+# Vectors needed to fit the int8 quantizer's per-dimension ranges
+QUANTIZER_MIN_ROWS = 1000
+
+# Fraction of each dimension's sampled range added on both sides
+_QUANTIZER_MARGIN = 0.05
+
+# Largest sample the quantizer is fitted on
+_QUANTIZER_SAMPLE_ROWS = 100_000
+
+# Filters matching at most this many rows are answered by exact search
+EXACT_SEARCH_MAX_ROWS = 10_000
+
+# Smallest index capacity in rows (doubled whenever it is exceeded)
+_MIN_CAPACITY = 1024
+
+# Rows per SQLite lookup (stays below the host parameter limit)
+_LOOKUP_BATCH = 500
+
+_INDEX_FILE = "index.bin"
+_VECTORS_FILE = "vectors.f16"
+_CODES_FILE = "codes.u8"
+_QUANTIZER_FILE = "quantizer.f32"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    row INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    document TEXT NOT NULL DEFAULT '',
+    metadata TEXT NOT NULL DEFAULT '{}'
+);
+CREATE TABLE IF NOT EXISTS tombstones (row INTEGER PRIMARY KEY);
+CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+_COMPARISONS = {
+    "$eq": "=",
+    "$ne": "!=",
+    "$gt": ">",
+    "$gte": ">=",
+    "$lt": "<",
+    "$lte": "<=",
+}
+
+
+class HNSWStoreError(VectorStoreError):
+    """Custom exception for HNSW vector store operations."""
+
+    pass
+
+
+def _json_path(key: str) -> str:
+    """Return the SQLite JSON path of a metadata key."""
+    return '$."' + key.replace('"', '\\"') + '"'
+
+
+def where_to_sql(where: Dict[str, Any]) -> Tuple[str, List[Any]]:
+    """
+    Translate a ChromaDB metadata filter into a SQL condition.
+
+    Supports field equality, $eq, $ne, $gt, $gte, $lt, $lte, $in, $nin,
+    $and and $or. Several fields in one dictionary must all match.
+
+    Args:
+        where: Metadata filter dictionary
+
+    Returns:
+        Tuple of (SQL condition on the metadata column, parameters)
+
+    Raises:
+        HNSWStoreError: If the filter uses an unsupported operator
+    """
+    clauses: List[str] = []
+    params: List[Any] = []
+    for key, value in where.items():
+        if key in ("$and", "$or"):
+            parts = [where_to_sql(condition) for condition in value]
+            if not parts:
+                continue
+            joiner = " AND " if key == "$and" else " OR "
+            clauses.append("(" + joiner.join(sql for sql, _ in parts) + ")")
+            for _, part_params in parts:
+                params.extend(part_params)
+            continue
+        if key.startswith("$"):
+            raise HNSWStoreError(f"Unsupported filter operator: {key}")
+        field = "json_extract(metadata, ?)"
+        conditions = value if isinstance(value, dict) else {"$eq": value}
+        for operator, operand in conditions.items():
+            if operator in _COMPARISONS:
+                clauses.append(f"{field} {_COMPARISONS[operator]} ?")
+                params.extend([_json_path(key), operand])
+            elif operator in ("$in", "$nin"):
+                operands = list(operand)
+                negate = "NOT " if operator == "$nin" else ""
+                if not operands:
+                    clauses.append("1" if negate else "0")
+                    continue
+                placeholders = ", ".join("?" * len(operands))
+                clauses.append(f"{field} {negate}IN ({placeholders})")
+                params.extend([_json_path(key), *operands])
+            else:
+                raise HNSWStoreError(f"Unsupported filter operator: {operator}")
+    if not clauses:
+        return "1", []
+    return " AND ".join(clauses), params
+
+
+def where_document_to_sql(where_document: Dict[str, Any]) -> Tuple[str, List[Any]]:
+    """
+    Translate a ChromaDB document filter into a SQL condition.
+
+    Supports $contains, $not_contains, $and and $or (case-sensitive, like
+    ChromaDB).
+
+    Args:
+        where_document: Document content filter
+
+    Returns:
+        Tuple of (SQL condition on the document column, parameters)
+
+    Raises:
+        HNSWStoreError: If the filter uses an unsupported operator
+    """
+    clauses: List[str] = []
+    params: List[Any] = []
+    for operator, operand in where_document.items():
+        if operator in ("$and", "$or"):
+            parts = [where_document_to_sql(condition) for condition in operand]
+            if not parts:
+                continue
+            joiner = " AND " if operator == "$and" else " OR "
+            clauses.append("(" + joiner.join(sql for sql, _ in parts) + ")")
+            for _, part_params in parts:
+                params.extend(part_params)
+        elif operator == "$contains":
+            clauses.append("instr(document, ?) > 0")
+            params.append(operand)
+        elif operator == "$not_contains":
+            clauses.append("instr(document, ?) = 0")
+            params.append(operand)
+        else:
+            raise HNSWStoreError(f"Unsupported document filter operator: {operator}")
+    if not clauses:
+        return "1", []
+    return " AND ".join(clauses), params
+
+
+class HNSWStore(VectorStore):
+    """
+    HNSW vector store backed by an in-process hnswlib index.
+
+    Implements the VectorStore interface with ChromaDB-compatible results:
+    distances are squared L2 distances for the "l2" space and
+    1 - similarity for the "cosine" and "ip" spaces.
+    """
+
+    def __init__(
+        self,
+        collection_name: str = "documents",
+        persist_directory: Optional[Path] = None,
+        space: Optional[str] = None,
+        m: Optional[int] = None,
+        ef_construction: Optional[int] = None,
+        ef_search: Optional[int] = None,
+        read_only: Optional[bool] = None,
+        sync_threshold: Optional[int] = None,
+        quantization: Optional[str] = None,
+        rescore_factor: Optional[int] = None,
+    ):
+        """
+        Open or create a collection.
+
+        Index parameters of an existing collection are read from its
+        sidecar; space, m, ef_construction and quantization only apply to
+        new collections.
+
+        Args:
+            collection_name: Name of the collection
+            persist_directory: Directory holding the collections
+                (default: config.hnsw_store_dir)
+            space: Distance space "l2", "cosine" or "ip"
+                (default: config.hnsw_store_space)
+            m: Neighbours per node on upper layers, 2*m on layer 0
+                (default: config.hnsw_store_m)
+            ef_construction: Candidate list size while inserting
+                (default: config.hnsw_store_ef_construction)
+            ef_search: Candidate list size while searching
+                (default: config.hnsw_store_ef_search)
+            read_only: Open without write access, e.g. in API workers
+                (default: config.hnsw_store_read_only)
+            sync_threshold: Vectors added before index.bin is rewritten
+                (default: config.hnsw_store_sync_threshold)
+            quantization: Vector codes the first search stage ranks, "none"
+                (float16 vectors) or "int8" (default:
+                config.hnsw_store_quantization)
+            rescore_factor: Candidates per requested result that quantized
+                search rescores with the float16 vectors
+                (default: config.hnsw_store_rescore_factor)
+
+        Raises:
+            HNSWStoreError: If hnswlib is not installed or the collection
+                cannot be opened
+        """
+        if not is_available("hnswlib"):
+            raise HNSWStoreError(
+                "hnswlib is required for the HNSW vector store backend. "
+                "Install with: pip install hnswlib"
+            )
+        self.collection_name = collection_name
+        self.root = Path(persist_directory or config.hnsw_store_dir)
+        self.path = self.root / collection_name
+        self.ef_search = ef_search or config.hnsw_store_ef_search
+        self.sync_threshold = sync_threshold or config.hnsw_store_sync_threshold
+        self.rescore_factor = rescore_factor or config.hnsw_store_rescore_factor
+        self.read_only = config.hnsw_store_read_only if read_only is None else read_only
+        self._defaults = {
+            "space": space or config.hnsw_store_space,
+            "m": m or config.hnsw_store_m,
+            "ef_construction": ef_construction or config.hnsw_store_ef_construction,
+            "quantization": quantization or config.hnsw_store_quantization,
+        }
+        if self._defaults["space"] not in SPACES:
+            raise HNSWStoreError(
+                f"Invalid space '{self._defaults['space']}', expected one of {SPACES}"
+            )
+        if self._defaults["quantization"] not in QUANTIZATIONS:
+            raise HNSWStoreError(
+                f"Invalid quantization '{self._defaults['quantization']}', "
+                f"expected one of {QUANTIZATIONS}"
+            )
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._index: Any = None
+        self._vectors: Optional[np.ndarray] = None
+        self._codes: Optional[np.ndarray] = None
+        self._quantizer: Optional[np.ndarray] = None
+        self._index_quantized = False
+        self._generation = -1
+        logger.info(f"Opening HNSW collection: {self.path}")
+        self._open()
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _open(self) -> None:
+        """Open the sidecar and load the index."""
+        db_path = self.path / "meta.db"
+        try:
+            if self.read_only:
+                if not db_path.exists():
+                    raise HNSWStoreError(
+                        f"Collection '{self.collection_name}' does not exist in "
+                        f"{self.root}"
+                    )
+                conn = sqlite3.connect(
+                    f"file:{db_path}?mode=ro",
+                    uri=True,
+                    check_same_thread=False,
+                    isolation_level=None,
+                )
+            else:
+                self.path.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(
+                    str(db_path), check_same_thread=False, isolation_level=None
+                )
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.executescript(_SCHEMA)
+                conn.executemany(
+                    "INSERT OR IGNORE INTO state (key, value) VALUES (?, ?)",
+                    [
+                        ("space", self._defaults["space"]),
+                        ("m", str(self._defaults["m"])),
+                        ("ef_construction", str(self._defaults["ef_construction"])),
+                        ("quantization", str(self._defaults["quantization"])),
+                        ("quantizer_fitted", "0"),
+                        ("dimensions", "0"),
+                        ("rows", "0"),
+                        ("index_rows", "0"),
+                        ("generation", "0"),
+                    ],
+                )
+        except sqlite3.Error as e:
+            raise HNSWStoreError(
+                f"Failed to open HNSW collection '{self.collection_name}': {str(e)}"
+            ) from e
+        self._conn = conn
+        state = self._state()
+        self.space = state["space"]
+        self.m = int(state["m"])
+        self.ef_construction = int(state["ef_construction"])
+        self.quantization = state.get("quantization", "none")
+        self._index = None
+        self._quantizer = None
+        self._generation = -1
+        self._sync()
+        logger.info(
+            f"HNSW collection '{self.collection_name}' ready "
+            f"(rows: {self._rows}, space: {self.space}, m: {self.m}, "
+            f"quantization: {self.quantization})"
+        )
+
+    def _close(self) -> None:
+        """Close the sidecar and drop the in-memory index."""
+        if self._conn is not None:
+            self._conn.close()
+        self._conn = None
+        self._index = None
+        self._vectors = None
+        self._codes = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return the sidecar connection of an open collection."""
+        if self._conn is None:
+            raise HNSWStoreError("Collection is not initialized")
+        return self._conn
+
+    def _state(self) -> Dict[str, str]:
+        """Read the state table."""
+        rows = self._connection().execute("SELECT key, value FROM state").fetchall()
+        return dict(rows)
+
+    def _sync(self) -> None:
+        """Catch the in-memory index up with writes committed since the last sync."""
+        with self._lock:
+            state = self._state()
+            generation = int(state["generation"])
+            if generation == self._generation:
+                return
+            self._load(state)
+            self._generation = generation
+
+    def _load(self, state: Dict[str, str]) -> None:
+        """
+        Bring the in-memory index up to the committed state.
+
+        index.bin is loaded once (and again after the quantizer was fitted);
+        rows committed after it was saved, and rows added since the last
+        sync, are inserted from vectors.f16 or, once quantized, codes.u8.
+        """
+        self.dimensions = int(state["dimensions"])
+        rows = int(state["rows"])
+        if self.dimensions == 0:
+            self._index = None
+            self._vectors = None
+            self._codes = None
+            self._quantizer = None
+            self._rows = 0
+            self._deleted: Set[int] = set()
+            return
+        quantized = state.get("quantizer_fitted") == "1"
+        if quantized and self._quantizer is None:
+            self._quantizer = np.fromfile(
+                self.path / _QUANTIZER_FILE, dtype=np.float32
+            ).reshape(2, self.dimensions)
+        elif not quantized:
+            self._quantizer = None
+        if self._index is None or self._index_quantized != quantized:
+            self._index = self._new_index(rows, int(state["index_rows"]))
+            self._index_quantized = quantized
+            # A concurrent save may have stored more rows than committed above
+            self._rows = self._index.get_current_count()
+            self._deleted = set()
+        mapped = max(rows, self._rows)
+        self._vectors = self._map(_VECTORS_FILE, np.float16, mapped, self._vectors)
+        if quantized:
+            self._codes = self._map(_CODES_FILE, np.uint8, mapped, self._codes)
+        if rows > self._rows:
+            self._reserve(rows)
+            self._index.add_items(
+                self._index_vectors(self._rows, rows), np.arange(self._rows, rows)
+            )
+            self._rows = rows
+        tombstones = {
+            row for (row,) in self._connection().execute("SELECT row FROM tombstones")
+        }
+        for row in tombstones - self._deleted:
+            self._mark_deleted(row)
+
+    def _new_index(self, rows: int, index_rows: int) -> Any:
+        """Load index.bin (or start an empty index) with room for rows rows."""
+        index = hnswlib.Index(space=self.space, dim=self.dimensions)
+        capacity = max(rows, _MIN_CAPACITY)
+        if index_rows:
+            index.load_index(str(self.path / _INDEX_FILE), max_elements=capacity)
+        else:
+            index.init_index(
+                max_elements=capacity, M=self.m, ef_construction=self.ef_construction
+            )
+        index.set_ef(self.ef_search)
+        return index
+
+    def _map(
+        self,
+        name: str,
+        dtype: Any,
+        rows: int,
+        current: Optional[np.ndarray] = None,
+    ) -> Optional[np.ndarray]:
+        """Map the first rows rows of a vector file read-only (reusing current)."""
+        if rows == 0:
+            return None
+        if current is not None and len(current) == rows:
+            return current
+        try:
+            return np.memmap(
+                self.path / name, dtype=dtype, mode="r", shape=(rows, self.dimensions)
+            )
+        except (OSError, ValueError) as e:
+            raise HNSWStoreError(
+                f"{name} of collection '{self.collection_name}' is incomplete "
+                f"(expected {rows} rows): {str(e)}"
+            ) from e
+
+    def _write_rows(self, name: str, offset: int, vectors: np.ndarray) -> None:
+        """Write vectors to a vector file at row offset (over uncommitted rows)."""
+        path = self.path / name
+        with open(path, "r+b" if path.exists() else "wb") as handle:
+            handle.seek(offset * vectors.shape[1] * vectors.itemsize)
+            handle.write(np.ascontiguousarray(vectors).tobytes())
+            handle.truncate()
+
+    def _reserve(self, rows: int) -> None:
+        """Grow the index capacity to hold rows rows."""
+        capacity = self._index.get_max_elements()
+        if rows > capacity:
+            self._index.resize_index(max(rows, 2 * capacity))
+
+    def _mark_deleted(self, row: int) -> None:
+        """Mark a row deleted in the index (once)."""
+        try:
+            self._index.mark_deleted(row)
+        except RuntimeError:
+            # Already deleted in a saved index
+            pass
+        self._deleted.add(row)
+
+    def _commit(
+        self,
+        statements: Callable[[sqlite3.Connection], Any],
+        rows: Optional[int] = None,
+        index_rows: Optional[int] = None,
+    ) -> Any:
+        """
+        Commit sidecar changes with a new generation.
+
+        On failure the in-memory index is dropped and reloaded from the
+        committed state by the next sync.
+
+        Args:
+            statements: Function running the sidecar statements of the write
+            rows: New total row count (default: unchanged)
+            index_rows: Rows now contained in index.bin (default: unchanged)
+
+        Returns:
+            Return value of statements
+        """
+        conn = self._connection()
+        updates = [
+            (str(self.dimensions), "dimensions"),
+            (str(int(self._quantizer is not None)), "quantizer_fitted"),
+        ]
+        if rows is not None:
+            updates.append((str(rows), "rows"))
+        if index_rows is not None:
+            updates.append((str(index_rows), "index_rows"))
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            result = statements(conn)
+            conn.executemany("UPDATE state SET value = ? WHERE key = ?", updates)
+            conn.execute(
+                "UPDATE state SET value = CAST(value AS INTEGER) + 1 "
+                "WHERE key = 'generation'"
+            )
+            generation = int(
+                conn.execute(
+                    "SELECT value FROM state WHERE key = 'generation'"
+                ).fetchone()[0]
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            self._index = None
+            self._generation = -1
+            raise
+        # The in-memory index already reflects this write
+        self._generation = generation
+        return result
+
+    def _save_if_due(self) -> None:
+        """Rewrite index.bin once sync_threshold rows were added since its last save."""
+        index_rows = int(self._state()["index_rows"])
+        if self._rows - index_rows < self.sync_threshold:
+            return
+        self._save_index()
+        self._commit(lambda conn: None, index_rows=self._rows)
+
+    def _save_index(self) -> None:
+        """Write the in-memory index to index.bin atomically."""
+        logger.debug(
+            f"Saving HNSW index of '{self.collection_name}' ({self._rows} rows)"
+        )
+        temporary = self.path / f"{_INDEX_FILE}.tmp"
+        self._index.save_index(str(temporary))
+        os.replace(temporary, self.path / _INDEX_FILE)
+
+    def _check_writable(self) -> None:
+        if self.read_only:
+            raise HNSWStoreError(
+                f"Collection '{self.collection_name}' is opened read-only"
+            )
+
+    def _refresh_size(self) -> None:
+        """Set the collection size gauge from the live row count."""
+        if self._conn is None:
+            vector_db_collection_size.labels(collection=self.collection_name).set(0)
+            return
+        try:
+            vector_db_collection_size.labels(collection=self.collection_name).set(
+                self._live_count()
+            )
+        except Exception as e:
+            logger.debug(f"Could not refresh collection size metric: {str(e)}")
+
+    def _live_count(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def _prepare(self, vectors: Any) -> np.ndarray:
+        """
+        Convert vectors to a float32 array of the collection dimension.
+
+        Vectors are normalized in the cosine space, so stored vectors can be
+        compared by inner product.
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        dimensions = vectors.shape[-1]
+        if self.dimensions and dimensions != self.dimensions:
+            raise HNSWStoreError(
+                f"Embedding dimension {dimensions} does not match "
+                f"collection dimension {self.dimensions}"
+            )
+        if self.space == "cosine":
+            norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+            vectors = vectors / np.where(norms == 0, 1, norms)
+        return vectors
+
+    def _fit_quantizer(self, vectors: np.ndarray) -> np.ndarray:
+        """
+        Fit per-dimension 8-bit quantization ranges.
+
+        Args:
+            vectors: Sample of stored vectors
+
+        Returns:
+            Array of shape (2, dimensions) with each dimension's offset and
+            step (values beyond the widened sample range are clipped)
+        """
+        low = vectors.min(axis=0)
+        high = vectors.max(axis=0)
+        margin = (high - low) * _QUANTIZER_MARGIN
+        low, high = low - margin, high + margin
+        step = np.maximum(high - low, 1e-12) / 255
+        return np.stack([low, step]).astype(np.float32)
+
+    def _encode(self, quantizer: np.ndarray, vectors: np.ndarray) -> np.ndarray:
+        """Quantize vectors to 8-bit codes."""
+        codes = np.rint((vectors - quantizer[0]) / quantizer[1])
+        return np.clip(codes, 0, 255).astype(np.uint8)
+
+    def _index_vectors(self, start: int, end: int) -> np.ndarray:
+        """Vectors of rows start to end as indexed (decoded codes if quantized)."""
+        if self._quantizer is not None and self._codes is not None:
+            return self._codes[start:end] * self._quantizer[1] + self._quantizer[0]
+        if self._vectors is None:
+            raise HNSWStoreError("Collection has no stored vectors")
+        return self._vectors[start:end].astype(np.float32)
+
+    def _distances(
+        self, rows: Sequence[int], query: np.ndarray, exact: bool = False
+    ) -> np.ndarray:
+        """
+        Distances from a query to stored rows.
+
+        Args:
+            rows: Stored rows
+            query: Prepared query vector
+            exact: Use the float16 vectors even in a quantized collection
+
+        Returns:
+            Distance per row
+        """
+        if exact or self._quantizer is None or self._codes is None:
+            if self._vectors is None:
+                raise HNSWStoreError("Collection has no stored vectors")
+            vectors = self._vectors[rows].astype(np.float32)
+        else:
+            vectors = self._codes[rows] * self._quantizer[1] + self._quantizer[0]
+        if self.space == "l2":
+            diff = vectors - query
+            return np.einsum("ij,ij->i", diff, diff)
+        return 1.0 - vectors @ query
+
+    def _candidates(self, k: int) -> int:
+        """Return how many first-stage candidates to collect for k results."""
+        if self._quantizer is None:
+            return k
+        return k * max(self.rescore_factor, 1)
+
+    def _rescore(
+        self, query: np.ndarray, results: List[Tuple[float, int]], k: int
+    ) -> List[Tuple[float, int]]:
+        """
+        Re-rank first-stage results of a quantized collection with float16 vectors.
+
+        Args:
+            query: Prepared query vector
+            results: (approximate distance, row) candidates
+            k: Number of results to keep
+
+        Returns:
+            The k nearest candidates by float16 distance
+        """
+        if self._quantizer is None or not results:
+            return results[:k]
+        rows = sorted(row for _, row in results)
+        distances = self._distances(rows, query, exact=True)
+        return sorted(zip(distances.tolist(), rows))[:k]
+
+    def _search(
+        self, query: np.ndarray, k: int, allowed: Optional[Set[int]] = None
+    ) -> List[Tuple[float, int]]:
+        """Return the k nearest live (and allowed) rows as (distance, row) pairs."""
+        available = self._rows - len(self._deleted) if allowed is None else len(allowed)
+        k = min(k, available)
+        if k <= 0:
+            return []
+        candidates = min(self._candidates(k), available)
+        self._index.set_ef(max(self.ef_search, candidates))
+        try:
+            labels, distances = self._index.knn_query(
+                query,
+                k=candidates,
+                num_threads=1,
+                filter=None if allowed is None else allowed.__contains__,
+            )
+        except RuntimeError:
+            # The search reached fewer than k rows: fall back to exact search
+            if allowed is None:
+                rows = [row for row in range(self._rows) if row not in self._deleted]
+            else:
+                rows = sorted(allowed)
+            return self._exact_search(query, rows, k)
+        results = [
+            (float(distance), int(row))
+            for distance, row in zip(distances[0], labels[0])
+        ]
+        return self._rescore(query, results, k)
+
+    def _exact_search(
+        self, query: np.ndarray, rows: List[int], k: int
+    ) -> List[Tuple[float, int]]:
+        """Return the k nearest of the given rows by exhaustive search."""
+        if not rows or k <= 0:
+            return []
+        candidates = self._candidates(k)
+        distances = self._distances(rows, query)
+        if len(rows) > candidates:
+            nearest = np.argpartition(distances, candidates - 1)[:candidates]
+        else:
+            nearest = np.arange(len(rows))
+        results = sorted((float(distances[i]), rows[i]) for i in nearest)
+        return self._rescore(query, results, k)
+
+    # ------------------------------------------------------------------
+    # Sidecar helpers
+    # ------------------------------------------------------------------
+
+    def _filter_rows(
+        self,
+        where: Optional[Dict[str, Any]] = None,
+        where_document: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+    ) -> List[int]:
+        """Return rows of live documents matching the filters, in row order."""
+        sql, params = "SELECT row FROM items WHERE 1", []
+        if where:
+            condition, condition_params = where_to_sql(where)
+            sql += f" AND {condition}"
+            params.extend(condition_params)
+        if where_document:
+            condition, condition_params = where_document_to_sql(where_document)
+            sql += f" AND {condition}"
+            params.extend(condition_params)
+        sql += " ORDER BY row"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [row for (row,) in self._connection().execute(sql, params)]
+
+    def _fetch(
+        self, column: str, keys: Sequence[Any]
+    ) -> Dict[Any, Tuple[int, str, str, Dict[str, Any]]]:
+        """Fetch items by row or id, keyed by that column."""
+        found: Dict[Any, Tuple[int, str, str, Dict[str, Any]]] = {}
+        conn = self._connection()
+        keys = list(dict.fromkeys(keys))
+        for start in range(0, len(keys), _LOOKUP_BATCH):
+            batch = keys[start : start + _LOOKUP_BATCH]
+            placeholders = ", ".join("?" * len(batch))
+            for row, doc_id, document, metadata in conn.execute(
+                "SELECT row, id, document, metadata FROM items "
+                f"WHERE {column} IN ({placeholders})",
+                batch,
+            ):
+                key = row if column == "row" else doc_id
+                found[key] = (row, doc_id, document, json.loads(metadata))
+        return found
+
+    @staticmethod
+    def _clean_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Drop metadata values that ChromaDB would reject (None, containers)."""
+        return {
+            key: value
+            for key, value in metadata.items()
+            if isinstance(value, (str, int, float, bool))
+        }
+
+    def _append(self, vectors: np.ndarray) -> List[int]:
+        """Store vectors as new rows in vectors.f16 (and codes.u8) and the index."""
+        if self._index is None:
+            self.dimensions = vectors.shape[1]
+            self._index = self._new_index(len(vectors), 0)
+            self._index_quantized = False
+            self._rows = 0
+            self._deleted = set()
+        first = self._rows
+        end = first + len(vectors)
+        stored = vectors.astype(np.float16)
+        self._write_rows(_VECTORS_FILE, first, stored)
+        self._vectors = self._map(_VECTORS_FILE, np.float16, end, self._vectors)
+        if self._quantizer is not None:
+            codes = self._encode(self._quantizer, stored.astype(np.float32))
+            self._write_rows(_CODES_FILE, first, codes)
+            self._codes = self._map(_CODES_FILE, np.uint8, end, self._codes)
+        self._reserve(end)
+        rows = list(range(first, end))
+        # Index the stored values, like readers catching up do
+        self._index.add_items(self._index_vectors(first, end), rows)
+        self._rows = end
+        return rows
+
+    def _quantize_if_due(self) -> Optional[int]:
+        """
+        Fit the int8 quantizer once the collection holds QUANTIZER_MIN_ROWS.
+
+        Returns:
+            Rows in the rebuilt index.bin if the quantizer was fitted, else None
+        """
+        if (
+            self.quantization != "int8"
+            or self._quantizer is not None
+            or self._rows < QUANTIZER_MIN_ROWS
+            or self._vectors is None
+        ):
+            return None
+        rows = self._rows
+        logger.info(
+            f"Fitting int8 quantizer of HNSW collection '{self.collection_name}' "
+            f"on {rows} vectors"
+        )
+        stride = max(1, rows // _QUANTIZER_SAMPLE_ROWS)
+        quantizer = self._fit_quantizer(self._vectors[:rows:stride].astype(np.float32))
+        for start in range(0, rows, _MIN_CAPACITY):
+            end = min(start + _MIN_CAPACITY, rows)
+            self._write_rows(
+                _CODES_FILE,
+                start,
+                self._encode(quantizer, self._vectors[start:end].astype(np.float32)),
+            )
+        temporary = self.path / f"{_QUANTIZER_FILE}.tmp"
+        quantizer.tofile(temporary)
+        os.replace(temporary, self.path / _QUANTIZER_FILE)
+        self._quantizer = quantizer
+        self._codes = self._map(_CODES_FILE, np.uint8, rows, None)
+
+        # Rebuild the graph over the codes; readers reload it once committed
+        self._index = self._new_index(rows, 0)
+        self._index.add_items(self._index_vectors(0, rows), np.arange(rows))
+        for row in self._deleted:
+            self._index.mark_deleted(row)
+        self._index_quantized = True
+        self._save_index()
+        return rows
+
+    def _results(self, matches: List[Tuple[float, int]]) -> Dict[str, Any]:
+        """Build a query result from (distance, row) matches."""
+        items = self._fetch("row", [row for _, row in matches])
+        result: Dict[str, Any] = {
+            "ids": [],
+            "distances": [],
+            "metadatas": [],
+            "documents": [],
+        }
+        for distance, row in matches:
+            if row not in items:
+                continue
+            _, doc_id, document, metadata = items[row]
+            result["ids"].append(doc_id)
+            result["distances"].append(distance)
+            result["metadatas"].append(metadata)
+            result["documents"].append(document)
+        return result
+
+    # ------------------------------------------------------------------
+    # VectorStore interface
+    # ------------------------------------------------------------------
+
+    @instrumented("add", resizes=True)
+    def add_documents(
+        self,
+        documents: List[Document],
+        embeddings: List[List[float]],
+        ids: Optional[List[str]] = None,
+    ) -> List[str]:
+        """
+        Add documents with embeddings.
+
+        Documents whose ID is already stored are skipped, like in ChromaDB.
+
+        Args:
+            documents: List of LangChain Document objects
+            embeddings: List of embedding vectors for each document
+            ids: Optional list of unique IDs. If None, generates UUIDs
+
+        Returns:
+            List of document IDs that were added
+
+        Raises:
+            HNSWStoreError: If adding documents fails
+        """
+        logger.info(f"Adding {len(documents)} documents to HNSW store")
+        self._check_writable()
+        if not documents:
+            raise HNSWStoreError("Cannot add empty list of documents")
+        if len(documents) != len(embeddings):
+            raise HNSWStoreError(
+                f"Documents count ({len(documents)}) does not match "
+                f"embeddings count ({len(embeddings)})"
+            )
+        if ids is None:
+            ids = [str(uuid.uuid4()) for _ in documents]
+        if len(ids) != len(documents):
+            raise HNSWStoreError(
+                f"IDs count ({len(ids)}) does not match "
+                f"documents count ({len(documents)})"
+            )
+
+        with self._lock:
+            self._sync()
+            existing = self._fetch("id", ids)
+            seen = set(existing)
+            new = []
+            for index, doc_id in enumerate(ids):
+                if doc_id not in seen:
+                    seen.add(doc_id)
+                    new.append(index)
+            if len(new) < len(ids):
+                logger.warning(
+                    f"Skipped {len(ids) - len(new)} documents with existing IDs"
+                )
+            if not new:
+                return ids
+            try:
+                vectors = self._prepare([embeddings[i] for i in new])
+                rows = self._append(vectors)
+                index_rows = self._quantize_if_due()
+                items = [
+                    (
+                        row,
+                        ids[i],
+                        documents[i].page_content,
+                        json.dumps(self._clean_metadata(documents[i].metadata)),
+                    )
+                    for row, i in zip(rows, new)
+                ]
+                self._commit(
+                    lambda conn: conn.executemany(
+                        "INSERT INTO items (row, id, document, metadata) "
+                        "VALUES (?, ?, ?, ?)",
+                        items,
+                    ),
+                    rows=self._rows,
+                    index_rows=index_rows,
+                )
+                self._save_if_due()
+            except HNSWStoreError:
+                self._index = None
+                self._generation = -1
+                raise
+            except Exception as e:
+                self._index = None
+                self._generation = -1
+                logger.error(
+                    f"Failed to add documents to HNSW store: {str(e)}", exc_info=True
+                )
+                raise HNSWStoreError(
+                    f"Failed to add documents to HNSW store: {str(e)}"
+                ) from e
+        logger.info(f"Successfully added {len(new)} documents to HNSW store")
+        return ids
+
+    @instrumented("query")
+    def query_by_embedding(
+        self,
+        query_embedding: List[float],
+        n_results: int = 5,
+        where: Optional[Dict[str, Any]] = None,
+        where_document: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Query collection by embedding vector.
+
+        Filters matching up to EXACT_SEARCH_MAX_ROWS documents are answered
+        by exact search over those documents; otherwise the HNSW search
+        only returns matching documents.
+
+        Args:
+            query_embedding: Query embedding vector
+            n_results: Number of results to return (default: 5)
+            where: Optional metadata filter dictionary
+            where_document: Optional document content filter
+
+        Returns:
+            Dictionary with keys: ids, distances, metadatas, documents
+
+        Raises:
+            HNSWStoreError: If query fails
+        """
+        logger.debug(f"Querying HNSW store: n_results={n_results}")
+        try:
+            with self._lock:
+                self._sync()
+                if self._index is None:
+                    return {
+                        "ids": [],
+                        "distances": [],
+                        "metadatas": [],
+                        "documents": [],
+                    }
+                query = self._prepare(query_embedding)
+                if query.shape != (self.dimensions,):
+                    raise HNSWStoreError(
+                        f"Query dimension {query.shape[-1]} does not match "
+                        f"collection dimension {self.dimensions}"
+                    )
+                if where or where_document:
+                    allowed = self._filter_rows(where, where_document)
+                    if len(allowed) <= EXACT_SEARCH_MAX_ROWS:
+                        matches = self._exact_search(query, allowed, n_results)
+                    else:
+                        matches = self._search(query, n_results, set(allowed))
+                else:
+                    matches = self._search(query, n_results)
+                return self._results(matches)
+        except HNSWStoreError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to query HNSW store: {str(e)}", exc_info=True)
+            raise HNSWStoreError(f"Failed to query HNSW store: {str(e)}") from e
+
+    @instrumented("query")
+    def query_by_text(
+        self,
+        query_text: str,
+        n_results: int = 5,
+        where: Optional[Dict[str, Any]] = None,
+        where_document: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Not supported: the HNSW store has no embedding function.
+
+        Raises:
+            HNSWStoreError: Always; embed the query and use query_by_embedding
+        """
+        raise HNSWStoreError(
+            "The HNSW store has no embedding function; embed the query and use "
+            "query_by_embedding"
+        )
+
+    @instrumented("get")
+    def get_by_ids(self, ids: List[str]) -> Dict[str, Any]:
+        """
+        Retrieve documents by their IDs.
+
+        Args:
+            ids: List of document IDs to retrieve
+
+        Returns:
+            Dictionary with keys: ids, metadatas, documents (in input order;
+            unknown IDs are left out)
+
+        Raises:
+            HNSWStoreError: If retrieval fails
+        """
+        try:
+            items = self._fetch("id", ids)
+        except sqlite3.Error as e:
+            raise HNSWStoreError(f"Failed to get documents by IDs: {str(e)}") from e
+        found = [items[doc_id] for doc_id in dict.fromkeys(ids) if doc_id in items]
+        return {
+            "ids": [item[1] for item in found],
+            "metadatas": [item[3] for item in found],
+            "documents": [item[2] for item in found],
+        }
+
+    @instrumented("get")
+    def get_ids_by_metadata(
+        self, where: Dict[str, Any], limit: Optional[int] = None
+    ) -> List[str]:
+        """
+        Retrieve IDs of documents matching a metadata filter.
+
+        Args:
+            where: Metadata filter dictionary (e.g. {"content_hash": "..."})
+            limit: Maximum number of IDs to return (None = all)
+
+        Returns:
+            List of matching document IDs
+
+        Raises:
+            HNSWStoreError: If retrieval fails
+        """
+        condition, params = where_to_sql(where)
+        sql = f"SELECT id FROM items WHERE {condition} ORDER BY row"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        try:
+            return [doc_id for (doc_id,) in self._connection().execute(sql, params)]
+        except sqlite3.Error as e:
+            raise HNSWStoreError(
+                f"Failed to get document IDs by metadata: {str(e)}"
+            ) from e
+
+    @instrumented("get")
+    def get_all(
+        self, where: Optional[Dict[str, Any]] = None, limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Retrieve all documents, optionally only those matching a filter.
+
+        Args:
+            where: Optional metadata filter dictionary
+            limit: Maximum number of documents to return (None = all)
+
+        Returns:
+            Dictionary with keys: ids, metadatas, documents (in insertion order)
+
+        Raises:
+            HNSWStoreError: If retrieval fails
+        """
+        condition, params = where_to_sql(where or {})
+        sql = f"SELECT id, document, metadata FROM items WHERE {condition} ORDER BY row"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        try:
+            rows = self._connection().execute(sql, params).fetchall()
+        except sqlite3.Error as e:
+            raise HNSWStoreError(f"Failed to get all documents: {str(e)}") from e
+        return {
+            "ids": [doc_id for doc_id, _, _ in rows],
+            "metadatas": [json.loads(metadata) for _, _, metadata in rows],
+            "documents": [document for _, document, _ in rows],
+        }
+
+    @instrumented("count")
+    def count(self) -> int:
+        """
+        Get the number of documents in the collection.
+
+        Returns:
+            Number of documents in the collection
+
+        Raises:
+            HNSWStoreError: If count fails
+        """
+        try:
+            count = self._live_count()
+        except sqlite3.Error as e:
+            raise HNSWStoreError(f"Failed to count documents: {str(e)}") from e
+        vector_db_collection_size.labels(collection=self.collection_name).set(count)
+        return count
+
+    @instrumented("delete_collection", resizes=True)
+    def delete_collection(self) -> None:
+        """
+        Delete the collection directory.
+
+        Raises:
+            HNSWStoreError: If deletion fails
+        """
+        logger.info(f"Deleting HNSW collection '{self.collection_name}'")
+        self._check_writable()
+        with self._lock:
+            self._close()
+            try:
+                shutil.rmtree(self.path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                raise HNSWStoreError(
+                    f"Failed to delete collection '{self.collection_name}': {str(e)}"
+                ) from e
+
+    def _tombstone(self, conn: sqlite3.Connection, rows: Iterable[int]) -> None:
+        """Delete items and record their rows as tombstones."""
+        params = [(row,) for row in rows]
+        conn.executemany("DELETE FROM items WHERE row = ?", params)
+        conn.executemany("INSERT OR IGNORE INTO tombstones (row) VALUES (?)", params)
+
+    @instrumented("delete", resizes=True)
+    def delete_documents(
+        self,
+        ids: Optional[List[str]] = None,
+        where: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """
+        Delete documents from the collection by IDs or metadata filter.
+
+        Deleted rows are marked deleted in the index: they stay in the graph
+        for navigation and are never returned.
+
+        Args:
+            ids: Optional list of document IDs to delete
+            where: Optional metadata filter dictionary to delete matching documents
+
+        Returns:
+            Number of documents deleted
+
+        Raises:
+            HNSWStoreError: If deletion fails
+            ValueError: If neither ids nor where is provided
+        """
+        if ids is None and where is None:
+            raise ValueError("Either ids or where must be provided")
+        self._check_writable()
+        with self._lock:
+            self._sync()
+            try:
+                if ids is not None:
+                    rows = [item[0] for item in self._fetch("id", ids).values()]
+                else:
+                    rows = self._filter_rows(where)
+                if rows:
+                    self._commit(lambda conn: self._tombstone(conn, rows))
+                    for row in rows:
+                        self._mark_deleted(row)
+            except sqlite3.Error as e:
+                raise HNSWStoreError(f"Failed to delete documents: {str(e)}") from e
+        logger.info(f"Successfully deleted {len(rows)} documents")
+        return len(rows)
+
+    @instrumented("update")
+    def update_documents(
+        self,
+        ids: List[str],
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+        documents: Optional[List[str]] = None,
+        embeddings: Optional[List[List[float]]] = None,
+    ) -> None:
+        """
+        Update documents in the collection.
+
+        Metadata is merged into the stored metadata (None values remove
+        keys). Documents with new embeddings are re-inserted into the index
+        under the same ID.
+
+        Args:
+            ids: List of document IDs to update
+            metadatas: Optional list of metadata dictionaries
+            documents: Optional list of document texts
+            embeddings: Optional list of embedding vectors
+
+        Raises:
+            HNSWStoreError: If update fails
+            ValueError: If ids is empty or lengths don't match
+        """
+        if not ids:
+            raise ValueError("ids cannot be empty")
+        for name, values in (
+            ("metadatas", metadatas),
+            ("documents", documents),
+            ("embeddings", embeddings),
+        ):
+            if values and len(values) != len(ids):
+                raise ValueError(
+                    f"{name} count ({len(values)}) does not match "
+                    f"ids count ({len(ids)})"
+                )
+        self._check_writable()
+
+        logger.info(f"Updating {len(ids)} documents in HNSW store")
+        with self._lock:
+            self._sync()
+            try:
+                items = self._fetch("id", ids)
+                updates = []
+                for index, doc_id in enumerate(ids):
+                    if doc_id not in items:
+                        continue
+                    row, _, document, metadata = items[doc_id]
+                    if metadatas:
+                        metadata = {**metadata, **metadatas[index]}
+                    if documents:
+                        document = documents[index]
+                    updates.append((index, doc_id, row, document, metadata))
+                if not updates:
+                    return
+                new_rows: Dict[str, int] = {}
+                index_rows = None
+                if embeddings:
+                    vectors = self._prepare([embeddings[u[0]] for u in updates])
+                    rows = self._append(vectors)
+                    index_rows = self._quantize_if_due()
+                    new_rows = {u[1]: row for u, row in zip(updates, rows)}
+
+                def statements(conn: sqlite3.Connection) -> None:
+                    if new_rows:
+                        self._tombstone(conn, [u[2] for u in updates])
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO items (row, id, document, metadata) "
+                        "VALUES (?, ?, ?, ?)",
+                        [
+                            (
+                                new_rows.get(doc_id, row),
+                                doc_id,
+                                document,
+                                json.dumps(self._clean_metadata(metadata)),
+                            )
+                            for _, doc_id, row, document, metadata in updates
+                        ],
+                    )
+
+                self._commit(
+                    statements,
+                    rows=self._rows if new_rows else None,
+                    index_rows=index_rows,
+                )
+                if new_rows:
+                    for update in updates:
+                        self._mark_deleted(update[2])
+                    self._save_if_due()
+            except HNSWStoreError:
+                self._index = None
+                self._generation = -1
+                raise
+            except Exception as e:
+                self._index = None
+                self._generation = -1
+                logger.error(f"Failed to update documents: {str(e)}", exc_info=True)
+                raise HNSWStoreError(f"Failed to update documents: {str(e)}") from e
+        logger.info(f"Successfully updated {len(updates)} documents")
+
+    def reset(self) -> None:
+        """
+        Reset the collection (delete all documents).
+
+        Note: This deletes and recreates the collection.
+        """
+        logger.info(f"Resetting HNSW collection '{self.collection_name}'")
+        try:
+            self.delete_collection()
+            self._open()
+        except Exception as e:
+            logger.error(f"Failed to reset collection: {str(e)}", exc_info=True)
+            raise HNSWStoreError(f"Failed to reset collection: {str(e)}") from e
@@ -0,0 +1,506 @@
+"""
+Time-partitioned vector store for news.
+
+Splits a collection into weekly partitions, one backend collection per ISO
+week named ``<collection>_<year>w<week>`` (e.g. ``documents_news_2026w42``),
+by the ``date`` metadata of each document. Stored documents also get a
+numeric ``published_at`` (Unix seconds, UTC), and date range conditions in
+``where`` filters are matched against it, so every backend can filter date
+ranges. Queries go only to the partitions overlapping the date range of
+their filter, and an expired week is removed by deleting its collection
+instead of deleting its chunks one by one.
+
+Partitions are listed in a SQLite catalog (``NEWS_PARTITION_DB``), so every
+process sees the partitions other processes create or drop.
+"""
+
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from langchain_core.documents import Document
+
+from app.utils.config import config
+from app.utils.logger import get_logger
+from app.vector_db.base import VectorStore, VectorStoreError
+from app.vector_db.sharded_store import ShardedStore
+
+logger = get_logger(__name__)
+
+PARTITION_DAYS = 7
+
+# Metadata holding the publication date (ISO string) and its Unix timestamp
+DATE_FIELD = "date"
+TIMESTAMP_FIELD = "published_at"
+
+_RANGE_OPERATORS = ("$gt", "$gte", "$lt", "$lte")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS news_partitions (
+    collection TEXT NOT NULL,
+    partition TEXT NOT NULL,
+    PRIMARY KEY (collection, partition)
+);
+"""
+
+
+def parse_date(value: Any) -> Optional[datetime]:
+    """
+    Parse an ISO date string or Unix timestamp.
+
+    Args:
+        value: ISO date string, Unix timestamp or datetime
+
+    Returns:
+        Naive UTC datetime, or None if the value is not a date
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value, tz=timezone.utc).replace(tzinfo=None)
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, str) and value:
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    else:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _timestamp(moment: datetime) -> int:
+    """Unix timestamp of a naive UTC datetime."""
+    return int(moment.replace(tzinfo=timezone.utc).timestamp())
+
+
+def partition_for(moment: datetime) -> str:
+    """
+    Name of the weekly partition a point in time belongs to.
+
+    Args:
+        moment: Naive UTC datetime
+
+    Returns:
+        Partition name such as "2026w42" (ISO year and week)
+    """
+    year, week, _ = moment.isocalendar()
+    return f"{year}w{week:02d}"
+
+
+def partition_bounds(partition: str) -> Tuple[datetime, datetime]:
+    """
+    Time range covered by a partition.
+
+    Args:
+        partition: Partition name such as "2026w42"
+
+    Returns:
+        Tuple of (start, end): Monday 00:00 UTC and the following Monday
+    """
+    start = datetime.strptime(f"{partition}-1", "%Gw%V-%u")
+    return start, start + timedelta(days=PARTITION_DAYS)
+
+
+def date_window(
+    where: Optional[Dict[str, Any]],
+) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """
+    Publication date range a metadata filter restricts documents to.
+
+    Conditions on ``date`` or ``published_at`` bound the range; ``$and``
+    intersects ranges and ``$or`` takes their hull. Anything else leaves the
+    range open.
+
+    Args:
+        where: Metadata filter dictionary
+
+    Returns:
+        Tuple of (earliest, latest), None where unbounded
+    """
+    earliest: Optional[datetime] = None
+    latest: Optional[datetime] = None
+
+    def narrow(low: Optional[datetime], high: Optional[datetime]) -> None:
+        nonlocal earliest, latest
+        if low is not None and (earliest is None or low > earliest):
+            earliest = low
+        if high is not None and (latest is None or high < latest):
+            latest = high
+
+    for key, condition in (where or {}).items():
+        if key == "$and":
+            for clause in condition:
+                narrow(*date_window(clause))
+        elif key == "$or" and condition:
+            windows = [date_window(clause) for clause in condition]
+            # A clause without a bound leaves that side of the union open
+            lows = [low for low, _ in windows if low is not None]
+            highs = [high for _, high in windows if high is not None]
+            narrow(
+                min(lows) if len(lows) == len(windows) else None,
+                max(highs) if len(highs) == len(windows) else None,
+            )
+        elif key in (DATE_FIELD, TIMESTAMP_FIELD):
+            if not isinstance(condition, dict):
+                condition = {"$eq": condition}
+            for operator, operand in condition.items():
+                bound = parse_date(operand)
+                if bound is None:
+                    continue
+                if operator in ("$eq", "$gt", "$gte"):
+                    narrow(bound, None)
+                if operator in ("$eq", "$lt", "$lte"):
+                    narrow(None, bound)
+    return earliest, latest
+
+
+def _timestamp_range(condition: Any) -> Optional[Dict[str, int]]:
+    """Return a date range condition as published_at bounds, or None."""
+    if not isinstance(condition, dict) or not condition:
+        return None
+    bounds: Dict[str, int] = {}
+    for operator, operand in condition.items():
+        moment = parse_date(operand)
+        if operator not in _RANGE_OPERATORS or moment is None:
+            return None
+        bounds[operator] = _timestamp(moment)
+    return bounds
+
+
+def _translate(where: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Rewrite date range conditions as conditions on published_at."""
+    if not where:
+        return where
+    translated: Dict[str, Any] = {}
+    for key, condition in where.items():
+        bounds = _timestamp_range(condition) if key == DATE_FIELD else None
+        if key in ("$and", "$or"):
+            translated[key] = [_translate(clause) for clause in condition]
+        elif bounds is not None:
+            translated[TIMESTAMP_FIELD] = bounds
+        else:
+            translated[key] = condition
+    return translated
+
+
+class TimePartitionedStore(ShardedStore):
+    """
+    Vector store that splits a collection into weekly partitions.
+
+    Attributes:
+        collection_name: Base name of the collection
+        shards: Partition stores by partition name (e.g. "2026w42")
+        catalog_path: Path of the SQLite partition catalog
+    """
+
+    def __init__(
+        self,
+        collection_name: str,
+        open_collection: Callable[[str], VectorStore],
+        catalog_path: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ):
+        """
+        Initialize the partitioned store and open the cataloged partitions.
+
+        Args:
+            collection_name: Base name of the collection
+            open_collection: Opens a backend store for a collection name
+            catalog_path: Path of the SQLite partition catalog
+                (default: config.news_partition_db)
+            max_workers: Partitions queried concurrently
+                (default: config.vector_store_shard_workers)
+
+        Raises:
+            VectorStoreError: If the catalog cannot be opened
+        """
+        self.catalog_path = Path(catalog_path or config.news_partition_db)
+        self._lock = threading.Lock()
+        try:
+            self.catalog_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                str(self.catalog_path), check_same_thread=False, isolation_level=None
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+        except sqlite3.Error as e:
+            raise VectorStoreError(
+                f"Failed to open news partition catalog {self.catalog_path}: {str(e)}"
+            ) from e
+        self.collection_name = collection_name
+        super().__init__(
+            collection_name,
+            open_collection,
+            max_workers=max_workers,
+            shards=self._catalog(),
+        )
+
+    def _catalog(self) -> List[str]:
+        """Names of the cataloged partitions, oldest first."""
+        try:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT partition FROM news_partitions WHERE collection = ? "
+                    "ORDER BY partition",
+                    (self.collection_name,),
+                ).fetchall()
+        except sqlite3.Error as e:
+            raise VectorStoreError(
+                f"Failed to read news partition catalog: {str(e)}"
+            ) from e
+        return [row[0] for row in rows]
+
+    def _sync(self) -> None:
+        """Open partitions created and forget partitions dropped elsewhere."""
+        cataloged = self._catalog()
+        with self._lock:
+            self.shards = {
+                partition: self.shards.get(partition)
+                or self.open_collection(f"{self.collection_name}_{partition}")
+                for partition in cataloged
+            }
+
+    def partitions(self) -> List[str]:
+        """
+        Names of the partitions, oldest first.
+
+        Returns:
+            List of partition names (e.g. ["2026w41", "2026w42"])
+        """
+        self._sync()
+        return list(self.shards)
+
+    def shards_for(self, where: Optional[Dict[str, Any]]) -> List[str]:
+        """
+        Names of the partitions overlapping the filter's date range.
+
+        Args:
+            where: Metadata filter dictionary (None = all partitions)
+
+        Returns:
+            List of partition names, oldest first
+        """
+        earliest, latest = date_window(where)
+        selected = []
+        for partition in self.partitions():
+            start, end = partition_bounds(partition)
+            if (latest is None or start <= latest) and (
+                earliest is None or end > earliest
+            ):
+                selected.append(partition)
+        return selected
+
+    def _published(self, metadata: Optional[Dict[str, Any]]) -> datetime:
+        """Publication time of a document (now if its metadata has none)."""
+        metadata = metadata or {}
+        return (
+            parse_date(metadata.get(DATE_FIELD))
+            or parse_date(metadata.get(TIMESTAMP_FIELD))
+            or datetime.now(timezone.utc).replace(tzinfo=None)
+        )
+
+    def _route(self, metadata: Optional[Dict[str, Any]]) -> str:
+        """Name of the partition a document with this metadata is written to."""
+        return partition_for(self._published(metadata))
+
+    def _shard(self, shard: str) -> VectorStore:
+        """Store of a partition, created and cataloged on first write."""
+        with self._lock:
+            if shard not in self.shards:
+                try:
+                    self._conn.execute(
+                        "INSERT OR IGNORE INTO news_partitions (collection, partition) "
+                        "VALUES (?, ?)",
+                        (self.collection_name, shard),
+                    )
+                except sqlite3.Error as e:
+                    raise VectorStoreError(
+                        f"Failed to catalog news partition {shard}: {str(e)}"
+                    ) from e
+                self.shards[shard] = self.open_collection(
+                    f"{self.collection_name}_{shard}"
+                )
+                self.shards = dict(sorted(self.shards.items()))
+                logger.info(f"Created news partition '{self.collection_name}_{shard}'")
+            return self.shards[shard]
+
+    def _stamp(self, metadata: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Metadata with published_at set from its publication time."""
+        return {
+            **(metadata or {}),
+            TIMESTAMP_FIELD: _timestamp(self._published(metadata)),
+        }
+
+    def expired_partitions(self, before: datetime) -> List[str]:
+        """
+        Names of the partitions that end before a point in time.
+
+        Args:
+            before: Naive UTC datetime
+
+        Returns:
+            List of partition names, oldest first
+        """
+        return [
+            partition
+            for partition in self.partitions()
+            if partition_bounds(partition)[1] <= before
+        ]
+
+    def drop_partition(self, partition: str) -> None:
+        """
+        Delete a partition's collection and remove it from the catalog.
+
+        Args:
+            partition: Partition name
+
+        Raises:
+            VectorStoreError: If deletion fails
+        """
+        self._sync()
+        store = self.shards.get(partition)
+        if store is not None:
+            store.delete_collection()
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "DELETE FROM news_partitions "
+                    "WHERE collection = ? AND partition = ?",
+                    (self.collection_name, partition),
+                )
+                self.shards.pop(partition, None)
+        except sqlite3.Error as e:
+            raise VectorStoreError(
+                f"Failed to remove news partition {partition}: {str(e)}"
+            ) from e
+        logger.info(f"Dropped news partition '{self.collection_name}_{partition}'")
+
+    def add_documents(
+        self,
+        documents: List[Document],
+        embeddings: List[List[float]],
+        ids: Optional[List[str]] = None,
+    ) -> List[str]:
+        """
+        Add documents with embeddings, each to the partition of its date.
+
+        Args:
+            documents: List of LangChain Document objects
+            embeddings: List of embedding vectors for each document
+            ids: Optional list of unique IDs. If None, the partitions generate them
+
+        Returns:
+            List of document IDs that were added, in input order
+
+        Raises:
+            VectorStoreError: If adding documents fails
+        """
+        stamped = [
+            Document(
+                page_content=document.page_content,
+                metadata=self._stamp(document.metadata),
+            )
+            for document in documents
+        ]
+        return super().add_documents(stamped, embeddings, ids=ids)
+
+    def query_by_embedding(
+        self,
+        query_embedding: List[float],
+        n_results: int = 5,
+        where: Optional[Dict[str, Any]] = None,
+        where_document: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Query the partitions overlapping the filter's date range."""
+        return super().query_by_embedding(
+            query_embedding,
+            n_results=n_results,
+            where=_translate(where),
+            where_document=where_document,
+        )
+
+    def query_by_text(
+        self,
+        query_text: str,
+        n_results: int = 5,
+        where: Optional[Dict[str, Any]] = None,
+        where_document: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Query the partitions overlapping the filter's date range by text."""
+        return super().query_by_text(
+            query_text,
+            n_results=n_results,
+            where=_translate(where),
+            where_document=where_document,
+        )
+
+    def get_ids_by_metadata(
+        self, where: Dict[str, Any], limit: Optional[int] = None
+    ) -> List[str]:
+        """Retrieve IDs of documents matching a metadata filter."""
+        return super().get_ids_by_metadata(_translate(where) or where, limit=limit)
+
+    def get_all(
+        self, where: Optional[Dict[str, Any]] = None, limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Retrieve all documents of the partitions a filter can match."""
+        return super().get_all(where=_translate(where), limit=limit)
+
+    def delete_documents(
+        self,
+        ids: Optional[List[str]] = None,
+        where: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """Delete documents from the partitions by IDs or metadata filter."""
+        return super().delete_documents(ids=ids, where=_translate(where))
+
+    def update_documents(
+        self,
+        ids: List[str],
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+        documents: Optional[List[str]] = None,
+        embeddings: Optional[List[List[float]]] = None,
+    ) -> None:
+        """
+        Update documents in the partitions that hold them.
+
+        A changed ``date`` updates ``published_at``; documents stay in their
+        partition, re-add them to move them to another week.
+        """
+        if metadatas:
+            metadatas = [
+                (
+                    self._stamp(metadata)
+                    if metadata and DATE_FIELD in metadata
+                    else metadata
+                )
+                for metadata in metadatas
+            ]
+        super().update_documents(
+            ids, metadatas=metadatas, documents=documents, embeddings=embeddings
+        )
+
+
+def news_partitions(store: VectorStore) -> Optional[TimePartitionedStore]:
+    """
+    Partitioned news store of a vector store, if news is partitioned.
+
+    Args:
+        store: Vector store (a sharded store's news shard is checked)
+
+    Returns:
+        TimePartitionedStore holding the news, or None
+    """
+    if isinstance(store, TimePartitionedStore):
+        return store
+    if isinstance(store, ShardedStore):
+        news = store.shards.get("news")
+        if isinstance(news, TimePartitionedStore):
+            return news
+    return None
@@ -0,0 +1,607 @@
+"""
+Domain-sharded vector store.
+
+Keeps each data domain (filings, news, transcripts, market data, economic
+data, alternative data) in its own collection of the configured backend,
+named ``<collection>_<shard>``. Writes are routed by document metadata
+(``SHARD_ROUTES``); queries go to the shards their ``where`` filter can
+match, in parallel, and the results are merged by distance. A focused query
+such as ``{"type": "news_article"}`` searches only the news shard, and each
+shard is its own collection, so it can be tuned, rebuilt or compacted on
+its own.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from langchain_core.documents import Document
+
+from app.utils.config import config
+from app.utils.logger import get_logger
+from app.utils.tracing import map_in_context
+from app.vector_db.base import VectorStore, VectorStoreError
+
+logger = get_logger(__name__)
+
+# (shard, metadata key, values): documents go to the first matching route
+SHARD_ROUTES: List[Tuple[str, str, Tuple[str, ...]]] = [
+    ("filings", "type", ("edgar_filing", "form_s1", "xbrl_fact")),
+    ("news", "type", ("news_article",)),
+    (
+        "alternative",
+        "type",
+        ("esg_rating", "social_media_post", "job_posting", "supply_chain_activity"),
+    ),
+    ("transcripts", "transcript_type", ("earnings_call",)),
+    ("market", "source", ("yfinance",)),
+    (
+        "economic",
+        "source",
+        ("fred", "world_bank", "imf", "economic_calendar", "central_bank"),
+    ),
+]
+
+# Shard of documents no route matches (e.g. uploaded files)
+DEFAULT_SHARD = "general"
+
+SHARDS: Tuple[str, ...] = tuple(
+    dict.fromkeys([shard for shard, _, _ in SHARD_ROUTES] + [DEFAULT_SHARD])
+)
+
+_COMPARISONS: Dict[str, Callable[[Any, Any], bool]] = {
+    "$eq": lambda value, operand: value == operand,
+    "$ne": lambda value, operand: value != operand,
+    "$gt": lambda value, operand: value > operand,
+    "$gte": lambda value, operand: value >= operand,
+    "$lt": lambda value, operand: value < operand,
+    "$lte": lambda value, operand: value <= operand,
+    "$in": lambda value, operand: value in operand,
+    "$nin": lambda value, operand: value not in operand,
+}
+
+
+def shard_for(metadata: Optional[Dict[str, Any]]) -> str:
+    """
+    Route a document to its shard by metadata.
+
+    Args:
+        metadata: Document metadata
+
+    Returns:
+        Shard name
+    """
+    metadata = metadata or {}
+    for shard, key, values in SHARD_ROUTES:
+        if metadata.get(key) in values:
+            return shard
+    return DEFAULT_SHARD
+
+
+def _shards_for_value(key: str, value: Any) -> Set[str]:
+    """Shards that can hold documents whose metadata has key == value."""
+    shards: Set[str] = set()
+    for shard, route_key, values in SHARD_ROUTES:
+        if route_key != key:
+            shards.add(shard)
+        elif value in values:
+            # Documents matching this route never reach later routes
+            shards.add(shard)
+            return shards
+    shards.add(DEFAULT_SHARD)
+    return shards
+
+
+def shards_for(where: Optional[Dict[str, Any]]) -> Set[str]:
+    """
+    Find the shards a metadata filter can match documents in.
+
+    Equality and $in conditions on routing keys narrow the shards; other
+    conditions match in every shard. $and intersects and $or unites the
+    shards of its conditions, as do several fields in one dictionary.
+
+    Args:
+        where: ChromaDB metadata filter (None = all shards)
+
+    Returns:
+        Set of shard names
+    """
+    shards = set(SHARDS)
+    for key, condition in (where or {}).items():
+        if key == "$and":
+            for part in condition:
+                shards &= shards_for(part)
+        elif key == "$or" and condition:
+            shards &= set().union(*(shards_for(part) for part in condition))
+        elif isinstance(condition, dict):
+            if set(condition) == {"$eq"}:
+                shards &= _shards_for_value(key, condition["$eq"])
+            elif set(condition) == {"$in"}:
+                shards &= set().union(
+                    *(_shards_for_value(key, value) for value in condition["$in"])
+                )
+        else:
+            shards &= _shards_for_value(key, condition)
+    return shards
+
+
+def metadata_matches(
+    metadata: Optional[Dict[str, Any]], where: Optional[Dict[str, Any]]
+) -> bool:
+    """
+    Evaluate a ChromaDB metadata filter against one document's metadata.
+
+    Supports the operators of ``where_to_sql``. Like ChromaDB, a condition
+    on a missing field does not match.
+
+    Args:
+        metadata: Document metadata
+        where: Metadata filter dictionary (None matches everything)
+
+    Returns:
+        Whether the metadata matches
+
+    Raises:
+        VectorStoreError: If the filter uses an unsupported operator
+    """
+    metadata = metadata or {}
+    for key, condition in (where or {}).items():
+        if key == "$and":
+            if not all(metadata_matches(metadata, part) for part in condition):
+                return False
+            continue
+        if key == "$or":
+            if condition and not any(
+                metadata_matches(metadata, part) for part in condition
+            ):
+                return False
+            continue
+        if key.startswith("$"):
+            raise VectorStoreError(f"Unsupported filter operator: {key}")
+        if key not in metadata or metadata[key] is None:
+            return False
+        conditions = condition if isinstance(condition, dict) else {"$eq": condition}
+        for operator, operand in conditions.items():
+            if operator not in _COMPARISONS:
+                raise VectorStoreError(f"Unsupported filter operator: {operator}")
+            try:
+                if not _COMPARISONS[operator](metadata[key], operand):
+                    return False
+            except TypeError:
+                return False
+    return True
+
+
+class ShardedStore(VectorStore):
+    """
+    Vector store that splits a collection into per-domain shards.
+
+    Attributes:
+        collection_name: Base name of the collection
+        shards: Shard stores by shard name
+    """
+
+    def __init__(
+        self,
+        collection_name: str,
+        open_collection: Callable[[str], VectorStore],
+        max_workers: Optional[int] = None,
+        shards: Sequence[str] = SHARDS,
+    ):
+        """
+        Initialize the sharded store and open every shard.
+
+        Args:
+            collection_name: Base name of the collection
+            open_collection: Opens a backend store for a collection name
+            max_workers: Shards queried concurrently
+                (default: config.vector_store_shard_workers)
+            shards: Names of the shards to open (default: SHARDS)
+        """
+        self.collection_name = collection_name
+        self.open_collection = open_collection
+        self.shards: Dict[str, VectorStore] = {
+            shard: open_collection(f"{collection_name}_{shard}") for shard in shards
+        }
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or config.vector_store_shard_workers,
+            thread_name_prefix="vector-shard",
+        )
+        logger.info(
+            f"Sharded collection '{collection_name}' ready "
+            f"(shards: {', '.join(self.shards) or 'none'})"
+        )
+
+    def shards_for(self, where: Optional[Dict[str, Any]]) -> List[str]:
+        """
+        Names of the shards a metadata filter can match, in shard order.
+
+        Args:
+            where: Metadata filter dictionary (None = all shards)
+
+        Returns:
+            List of shard names
+        """
+        matching = shards_for(where)
+        return [shard for shard in self.shards if shard in matching]
+
+    def _route(self, metadata: Optional[Dict[str, Any]]) -> str:
+        """Name of the shard a document with this metadata is written to."""
+        return shard_for(metadata)
+
+    def _shard(self, shard: str) -> VectorStore:
+        """Store of a shard that documents are written to."""
+        return self.shards[shard]
+
+    def _fan_out(
+        self, shards: List[str], call: Callable[[VectorStore], Any]
+    ) -> List[Any]:
+        """Run call on each shard, in parallel when there are several."""
+        if len(shards) == 1:
+            return [call(self.shards[shards[0]])]
+        return map_in_context(
+            self._executor, lambda shard: call(self.shards[shard]), shards
+        )
+
+    def _owners(self, ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Find the shard of each existing ID (with its stored metadata)."""
+        shards = self.shards_for(None)
+        found = self._fan_out(shards, lambda store: store.get_by_ids(ids))
+        return {
+            shard: dict(zip(result["ids"], result["metadatas"]))
+            for shard, result in zip(shards, found)
+            if result["ids"]
+        }
+
+    def _refresh_size(self) -> None:
+        """Refresh the collection size gauge of every shard."""
+        for store in self.shards.values():
+            store._refresh_size()
+
+    def add_documents(
+        self,
+        documents: List[Document],
+        embeddings: List[List[float]],
+        ids: Optional[List[str]] = None,
+    ) -> List[str]:
+        """
+        Add documents with embeddings, each to the shard of its metadata.
+
+        Args:
+            documents: List of LangChain Document objects
+            embeddings: List of embedding vectors for each document
+            ids: Optional list of unique IDs. If None, the shards generate them
+
+        Returns:
+            List of document IDs that were added, in input order
+
+        Raises:
+            VectorStoreError: If adding documents fails
+        """
+        if not documents:
+            raise VectorStoreError("Cannot add empty list of documents")
+        if len(documents) != len(embeddings):
+            raise VectorStoreError(
+                f"Documents count ({len(documents)}) does not match "
+                f"embeddings count ({len(embeddings)})"
+            )
+        if ids is not None and len(ids) != len(documents):
+            raise VectorStoreError(
+                f"IDs count ({len(ids)}) does not match "
+                f"documents count ({len(documents)})"
+            )
+
+        rows_by_shard: Dict[str, List[int]] = {}
+        for row, document in enumerate(documents):
+            rows_by_shard.setdefault(self._route(document.metadata), []).append(row)
+
+        added: List[str] = [""] * len(documents)
+        for shard, rows in rows_by_shard.items():
+            shard_ids = self._shard(shard).add_documents(
+                [documents[row] for row in rows],
+                [embeddings[row] for row in rows],
+                ids=[ids[row] for row in rows] if ids is not None else None,
+            )
+            for row, doc_id in zip(rows, shard_ids):
+                added[row] = doc_id
+            logger.debug(f"Added {len(rows)} documents to shard '{shard}'")
+        return added
+
+    def _merge_queries(
+        self, results: List[Dict[str, Any]], n_results: int
+    ) -> Dict[str, Any]:
+        """Merge per-shard query results by distance, nearest first."""
+        hits = sorted(
+            (
+                (distance, doc_id, metadata, document)
+                for result in results
+                for doc_id, distance, metadata, document in zip(
+                    result["ids"],
+                    result["distances"],
+                    result["metadatas"],
+                    result["documents"],
+                )
+            ),
+            key=lambda hit: hit[0],
+        )[:n_results]
+        return {
+            "ids": [hit[1] for hit in hits],
+            "distances": [hit[0] for hit in hits],
+            "metadatas": [hit[2] for hit in hits],
+            "documents": [hit[3] for hit in hits],
+        }
+
+    def query_by_embedding(
+        self,
+        query_embedding: List[float],
+        n_results: int = 5,
+        where: Optional[Dict[str, Any]] = None,
+        where_document: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Query the shards the filter can match and merge by distance.
+
+        Args:
+            query_embedding: Query embedding vector
+            n_results: Number of results to return (default: 5)
+            where: Optional metadata filter dictionary
+            where_document: Optional document content filter
+
+        Returns:
+            Dictionary with keys: ids, distances, metadatas, documents
+
+        Raises:
+            VectorStoreError: If a shard query fails
+        """
+        shards = self.shards_for(where)
+        logger.debug(f"Querying shards {shards}: n_results={n_results}")
+        results = self._fan_out(
+            shards,
+            lambda store: store.query_by_embedding(
+                query_embedding,
+                n_results=n_results,
+                where=where,
+                where_document=where_document,
+            ),
+        )
+        return self._merge_queries(results, n_results)
+
+    def query_by_text(
+        self,
+        query_text: str,
+        n_results: int = 5,
+        where: Optional[Dict[str, Any]] = None,
+        where_document: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Query the shards by text and merge by distance.
+
+        Args:
+            query_text: Query text string
+            n_results: Number of results to return (default: 5)
+            where: Optional metadata filter dictionary
+            where_document: Optional document content filter
+
+        Returns:
+            Dictionary with keys: ids, distances, metadatas, documents
+
+        Raises:
+            VectorStoreError: If a shard query fails
+        """
+        results = self._fan_out(
+            self.shards_for(where),
+            lambda store: store.query_by_text(
+                query_text,
+                n_results=n_results,
+                where=where,
+                where_document=where_document,
+            ),
+        )
+        return self._merge_queries(results, n_results)
+
+    def get_by_ids(self, ids: List[str]) -> Dict[str, Any]:
+        """
+        Retrieve documents by their IDs from whichever shards hold them.
+
+        Args:
+            ids: List of document IDs to retrieve
+
+        Returns:
+            Dictionary with keys: ids, metadatas, documents (in the order
+            of ids, missing IDs omitted)
+
+        Raises:
+            VectorStoreError: If retrieval fails
+        """
+        found: Dict[str, Tuple[Any, Any]] = {}
+        results = self._fan_out(
+            self.shards_for(None), lambda store: store.get_by_ids(ids)
+        )
+        for result in results:
+            for doc_id, metadata, document in zip(
+                result["ids"], result["metadatas"], result["documents"]
+            ):
+                found[doc_id] = (metadata, document)
+        ordered = [doc_id for doc_id in dict.fromkeys(ids) if doc_id in found]
+        return {
+            "ids": ordered,
+            "metadatas": [found[doc_id][0] for doc_id in ordered],
+            "documents": [found[doc_id][1] for doc_id in ordered],
+        }
+
+    def get_ids_by_metadata(
+        self, where: Dict[str, Any], limit: Optional[int] = None
+    ) -> List[str]:
+        """
+        Retrieve IDs of documents matching a metadata filter.
+
+        Args:
+            where: Metadata filter dictionary (e.g. {"content_hash": "..."})
+            limit: Maximum number of IDs to return (None = all)
+
+        Returns:
+            List of matching document IDs
+
+        Raises:
+            VectorStoreError: If retrieval fails
+        """
+        ids: List[str] = []
+        for shard in self.shards_for(where):
+            remaining = None if limit is None else limit - len(ids)
+            if remaining == 0:
+                break
+            ids.extend(self.shards[shard].get_ids_by_metadata(where, limit=remaining))
+        return ids
+
+    def get_all(
+        self, where: Optional[Dict[str, Any]] = None, limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Retrieve all documents of the shards a filter can match.
+
+        Args:
+            where: Optional metadata filter dictionary
+            limit: Maximum number of documents to return (None = all)
+
+        Returns:
+            Dictionary with keys: ids, metadatas, documents
+
+        Raises:
+            VectorStoreError: If retrieval fails
+        """
+        merged: Dict[str, List[Any]] = {"ids": [], "metadatas": [], "documents": []}
+        for shard in self.shards_for(where):
+            remaining = None if limit is None else limit - len(merged["ids"])
+            if remaining == 0:
+                break
+            result = self.shards[shard].get_all(where=where, limit=remaining)
+            for key in merged:
+                merged[key].extend(result[key])
+        return merged
+
+    def count(self) -> int:
+        """
+        Get the number of documents in all shards.
+
+        Returns:
+            Number of documents in the collection
+
+        Raises:
+            VectorStoreError: If count fails
+        """
+        return sum(self.shards[shard].count() for shard in self.shards_for(None))
+
+    def delete_collection(self) -> None:
+        """
+        Delete every shard collection.
+
+        Raises:
+            VectorStoreError: If deletion fails
+        """
+        for shard in self.shards_for(None):
+            self.shards[shard].delete_collection()
+
+    def delete_documents(
+        self,
+        ids: Optional[List[str]] = None,
+        where: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """
+        Delete documents from the shards by IDs or metadata filter.
+
+        Args:
+            ids: Optional list of document IDs to delete
+            where: Optional metadata filter dictionary to delete matching documents
+
+        Returns:
+            Number of documents deleted
+
+        Raises:
+            VectorStoreError: If deletion fails
+            ValueError: If neither ids nor where is provided
+        """
+        if ids is None and where is None:
+            raise ValueError("Either ids or where must be provided")
+        if ids is not None:
+            return sum(
+                self.shards[shard].delete_documents(ids=list(shard_ids))
+                for shard, shard_ids in self._owners(ids).items()
+            )
+        return sum(
+            self.shards[shard].delete_documents(where=where)
+            for shard in self.shards_for(where)
+        )
+
+    def update_documents(
+        self,
+        ids: List[str],
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+        documents: Optional[List[str]] = None,
+        embeddings: Optional[List[List[float]]] = None,
+    ) -> None:
+        """
+        Update documents in the shards that hold them.
+
+        Documents stay in their shard; metadata updates that would route a
+        document elsewhere are logged, re-add the document to move it.
+
+        Args:
+            ids: List of document IDs to update
+            metadatas: Optional list of metadata dictionaries
+            documents: Optional list of document texts
+            embeddings: Optional list of embedding vectors
+
+        Raises:
+            VectorStoreError: If update fails or an ID does not exist
+            ValueError: If ids is empty or lengths don't match
+        """
+        if not ids:
+            raise ValueError("ids cannot be empty")
+        for name, values in (
+            ("metadatas", metadatas),
+            ("documents", documents),
+            ("embeddings", embeddings),
+        ):
+            if values and len(values) != len(ids):
+                raise ValueError(
+                    f"{name} count ({len(values)}) does not match "
+                    f"ids count ({len(ids)})"
+                )
+
+        owners = self._owners(ids)
+        owner = {doc_id: shard for shard, stored in owners.items() for doc_id in stored}
+        missing = [doc_id for doc_id in ids if doc_id not in owner]
+        if missing:
+            raise VectorStoreError(f"Documents not found: {missing[:5]}")
+
+        for shard in dict.fromkeys(owner[doc_id] for doc_id in ids):
+            rows = [row for row, doc_id in enumerate(ids) if owner[doc_id] == shard]
+            if metadatas:
+                moved = [
+                    ids[row]
+                    for row in rows
+                    if self._route(
+                        {**(owners[shard][ids[row]] or {}), **(metadatas[row] or {})}
+                    )
+                    != shard
+                ]
+                if moved:
+                    logger.warning(
+                        f"Updated metadata routes {len(moved)} documents out of "
+                        f"shard '{shard}'; they stay in it"
+                    )
+            self.shards[shard].update_documents(
+                [ids[row] for row in rows],
+                metadatas=[metadatas[row] for row in rows] if metadatas else None,
+                documents=[documents[row] for row in rows] if documents else None,
+                embeddings=[embeddings[row] for row in rows] if embeddings else None,
+            )
+
+    def reset(self) -> None:
+        """
+        Reset every shard (delete all documents).
+
+        Raises:
+            VectorStoreError: If reset fails
+        """
+        for shard in self.shards_for(None):
+            self.shards[shard].reset()
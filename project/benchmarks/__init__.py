@@ -0,0 +1,13 @@
+"""
+Offline performance benchmarks.
+
+The benchmarks run the real RAG and ingestion code paths against
+deterministic local stand-ins for the external services (hash-based
+embeddings, a latency-configurable fake LLM and cross-encoder, and a
+synthetic corpus of filings and news), so results are reproducible
+without Ollama, OpenAI or network access.
+
+Run a benchmark with ``python -m benchmarks.rag_query`` from the project
+root; see the "Performance Benchmarks" section of
+docs/reference/testing.md.
+"""
@@ -0,0 +1,52 @@
+"""
+Compare benchmark results against a baseline.
+
+Exits with status 1 if any metric regressed beyond the tolerance, so it can
+gate CI or a rollout.
+
+Usage:
+    python -m benchmarks.compare results.json baseline.json
+    python -m benchmarks.compare results.json baseline.json --tolerance 0.05
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from benchmarks.harness import BenchmarkError, compare_reports, load_report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Compare two result files and report regressions."""
+    parser = argparse.ArgumentParser(
+        description="Compare benchmark results against a baseline"
+    )
+    parser.add_argument("results", help="Result file of the run under test")
+    parser.add_argument("baseline", help="Baseline result file")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.10,
+        help="Allowed relative change before a metric regresses (default: 0.10)",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        regressions = compare_reports(
+            load_report(args.results), load_report(args.baseline), args.tolerance
+        )
+    except BenchmarkError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    if not regressions:
+        print(f"No regressions beyond {args.tolerance:.0%}")
+        return 0
+    print(f"{len(regressions)} regression(s) beyond {args.tolerance:.0%}:")
+    for regression in regressions:
+        print(f"  {regression}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
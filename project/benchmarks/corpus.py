@@ -0,0 +1,236 @@
+"""
+Synthetic corpus of SEC filing and news chunks for benchmarks.
+
+Chunks are generated from templates with a seeded random generator, so the
+same size and seed always produce the same corpus. Metadata mirrors what
+the ingestion pipeline stores for EDGAR filings and news articles, so
+metadata filters and source prioritization behave as in production.
+"""
+
+import random
+from datetime import date, timedelta
+from typing import Iterator, List, Tuple
+
+from langchain_core.documents import Document
+
+COMPANIES: List[Tuple[str, str, str]] = [
+    ("AAPL", "Apple Inc.", "consumer electronics"),
+    ("MSFT", "Microsoft Corporation", "cloud software"),
+    ("GOOGL", "Alphabet Inc.", "digital advertising"),
+    ("AMZN", "Amazon.com Inc.", "e-commerce"),
+    ("NVDA", "NVIDIA Corporation", "semiconductors"),
+    ("META", "Meta Platforms Inc.", "social media"),
+    ("TSLA", "Tesla Inc.", "electric vehicles"),
+    ("JPM", "JPMorgan Chase & Co.", "banking"),
+    ("BAC", "Bank of America Corporation", "banking"),
+    ("GS", "Goldman Sachs Group Inc.", "investment banking"),
+    ("XOM", "Exxon Mobil Corporation", "oil and gas"),
+    ("CVX", "Chevron Corporation", "oil and gas"),
+    ("JNJ", "Johnson & Johnson", "pharmaceuticals"),
+    ("PFE", "Pfizer Inc.", "pharmaceuticals"),
+    ("UNH", "UnitedHealth Group Inc.", "health insurance"),
+    ("WMT", "Walmart Inc.", "retail"),
+    ("KO", "The Coca-Cola Company", "beverages"),
+    ("PG", "Procter & Gamble Company", "consumer goods"),
+    ("DIS", "The Walt Disney Company", "media"),
+    ("BA", "The Boeing Company", "aerospace"),
+]
+
+FORM_TYPES = ["10-K", "10-Q", "8-K"]
+
+SECTIONS = [
+    "Risk Factors",
+    "Management's Discussion and Analysis",
+    "Liquidity and Capital Resources",
+    "Results of Operations",
+    "Quantitative and Qualitative Disclosures About Market Risk",
+]
+
+METRICS = [
+    "revenue",
+    "net income",
+    "operating income",
+    "gross margin",
+    "free cash flow",
+    "earnings per share",
+    "capital expenditures",
+    "long-term debt",
+]
+
+RISKS = [
+    "supply chain disruptions",
+    "changes in interest rates",
+    "foreign currency fluctuations",
+    "cybersecurity incidents",
+    "regulatory investigations",
+    "competition in {sector}",
+    "inflationary pressure on input costs",
+    "litigation related to intellectual property",
+]
+
+NEWS_TOPICS = [
+    "quarterly earnings beat expectations",
+    "guidance cut amid weaker demand",
+    "announces share buyback program",
+    "faces antitrust scrutiny",
+    "expands into new markets",
+    "reports record {metric}",
+    "shares fall after analyst downgrade",
+    "raises dividend",
+]
+
+NEWS_SOURCES = ["reuters", "cnbc", "marketwatch", "yahoo_finance"]
+
+SENTIMENTS = ["positive", "negative", "neutral"]
+
+QUERY_TEMPLATES = [
+    "What was {company}'s {metric} in {year}?",
+    "What risk factors did {ticker} report in its {form}?",
+    "How did {metric} change for {company} year over year?",
+    "Summarize the liquidity position of {company}",
+    "What is the latest news about {company}?",
+    "Which companies mention {risk} as a risk?",
+    "Compare {metric} of {company} and {other}",
+    "What did {ticker} say about {sector} demand?",
+]
+
+_START_DATE = date(2019, 1, 1)
+
+
+def _filing_chunk(rng: random.Random, index: int) -> Document:
+    """Generate one filing chunk."""
+    ticker, company, sector = rng.choice(COMPANIES)
+    form_type = rng.choice(FORM_TYPES)
+    section = rng.choice(SECTIONS)
+    year = rng.randint(2019, 2024)
+    sentences = [f"{company} ({ticker}) {form_type} for fiscal {year}. {section}."]
+    for _ in range(rng.randint(4, 7)):
+        metric = rng.choice(METRICS)
+        value = rng.uniform(0.5, 250.0)
+        change = rng.uniform(-30.0, 45.0)
+        risk = rng.choice(RISKS).format(sector=sector)
+        sentences.append(
+            rng.choice(
+                [
+                    f"Total {metric} was ${value:.1f} billion, a change of "
+                    f"{change:+.1f}% compared with fiscal {year - 1}.",
+                    f"Our results could be adversely affected by {risk}.",
+                    f"Demand in {sector} drove {metric} of ${value:.1f} billion.",
+                    f"We expect {metric} to be affected by {risk} in {year + 1}.",
+                ]
+            )
+        )
+    filing_date = _START_DATE + timedelta(days=rng.randint(0, 6 * 365))
+    return Document(
+        page_content=" ".join(sentences),
+        metadata={
+            "type": "edgar_filing",
+            "source": "synthetic",
+            "ticker": ticker,
+            "company_name": company,
+            "form_type": form_type,
+            "filing_date": filing_date.isoformat(),
+            "fiscal_year": year,
+            "chunk_index": index,
+        },
+    )
+
+
+def _news_chunk(rng: random.Random, index: int) -> Document:
+    """Generate one news article chunk."""
+    ticker, company, sector = rng.choice(COMPANIES)
+    topic = rng.choice(NEWS_TOPICS).format(metric=rng.choice(METRICS))
+    published = _START_DATE + timedelta(days=rng.randint(0, 6 * 365))
+    body = [f"{company} {topic}."]
+    for _ in range(rng.randint(3, 5)):
+        body.append(
+            rng.choice(
+                [
+                    f"Analysts expect {rng.choice(METRICS)} growth of "
+                    f"{rng.uniform(-10, 25):.1f}% next quarter.",
+                    f"Shares of {ticker} moved {rng.uniform(-8, 8):+.1f}% in "
+                    f"trading.",
+                    f"The {sector} sector remains exposed to "
+                    f"{rng.choice(RISKS).format(sector=sector)}.",
+                ]
+            )
+        )
+    return Document(
+        page_content=" ".join(body),
+        metadata={
+            "type": "news",
+            "source": rng.choice(NEWS_SOURCES),
+            "tickers": ticker,
+            "title": f"{company} {topic}",
+            "published_date": published.isoformat(),
+            "sentiment": rng.choice(SENTIMENTS),
+            "chunk_index": index,
+        },
+    )
+
+
+def iter_corpus(
+    n_chunks: int,
+    seed: int = 0,
+    batch_size: int = 1000,
+    news_ratio: float = 0.3,
+) -> Iterator[List[Document]]:
+    """
+    Generate a synthetic corpus in batches.
+
+    Chunk i only depends on (seed, i), so corpora of different sizes share
+    their common prefix.
+
+    Args:
+        n_chunks: Number of chunks
+        seed: Random seed
+        batch_size: Chunks per yielded batch
+        news_ratio: Fraction of news chunks (the rest are filing chunks)
+
+    Yields:
+        Lists of Documents with a "chunk_id" metadata field
+    """
+    batch: List[Document] = []
+    for index in range(n_chunks):
+        rng = random.Random(seed * 1_000_003 + index)
+        if rng.random() < news_ratio:
+            document = _news_chunk(rng, index)
+        else:
+            document = _filing_chunk(rng, index)
+        document.metadata["chunk_id"] = f"chunk-{index}"
+        batch.append(document)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def generate_queries(n_queries: int, seed: int = 0) -> List[str]:
+    """
+    Generate benchmark questions about the synthetic corpus.
+
+    Args:
+        n_queries: Number of questions
+        seed: Random seed
+
+    Returns:
+        List of questions
+    """
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(n_queries):
+        (ticker, company, sector), (_, other, _) = rng.sample(COMPANIES, 2)
+        queries.append(
+            rng.choice(QUERY_TEMPLATES).format(
+                company=company,
+                other=other,
+                ticker=ticker,
+                sector=sector,
+                metric=rng.choice(METRICS),
+                form=rng.choice(FORM_TYPES),
+                year=rng.randint(2019, 2024),
+                risk=rng.choice(RISKS).format(sector=sector),
+            )
+        )
+    return queries
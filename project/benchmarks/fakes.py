@@ -0,0 +1,147 @@
+"""
+Deterministic stand-ins for embedding models, LLMs and rerankers.
+
+The stand-ins implement the interfaces the RAG pipeline uses (LangChain
+``Embeddings`` and ``LLM``, and ``CrossEncoder.predict``) and produce the
+same output for the same input on every run and machine.
+"""
+
+import re
+import time
+import zlib
+from typing import Any, List, Optional, Sequence
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models.llms import LLM
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase alphanumeric tokens."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+class HashEmbeddings(Embeddings):
+    """
+    Feature-hashing bag-of-words embeddings.
+
+    Each token is hashed (CRC32) to a signed dimension and the vector is
+    L2-normalized, so texts sharing words get similar vectors and retrieval
+    returns plausible neighbours. No model is loaded. ``latency_ms_per_text``
+    simulates the cost of an embedding model or API per embedded text.
+    """
+
+    def __init__(self, dimensions: int = 384, latency_ms_per_text: float = 0.0):
+        """
+        Initialize hash embeddings.
+
+        Args:
+            dimensions: Embedding dimensions
+            latency_ms_per_text: Simulated embedding time per text
+        """
+        if dimensions < 1:
+            raise ValueError("dimensions must be >= 1")
+        self.dimensions = dimensions
+        self.latency_ms_per_text = latency_ms_per_text
+
+    def _embed(self, text: str) -> List[float]:
+        """Embed one text."""
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        for token in tokenize(text):
+            digest = zlib.crc32(token.encode("utf-8"))
+            sign = 1.0 if digest & 0x80000000 else -1.0
+            vector[digest % self.dimensions] += sign
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            vector[0] = 1.0
+        else:
+            vector /= norm
+        return vector.tolist()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed a batch of texts."""
+        if self.latency_ms_per_text > 0:
+            time.sleep(self.latency_ms_per_text * len(texts) / 1000.0)
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a query text."""
+        return self._embed(text)
+
+
+class FakeLLM(LLM):
+    """
+    LLM stand-in with configurable latency and generation speed.
+
+    Each call sleeps for ``latency_ms`` (time to first token) plus
+    ``response_tokens / tokens_per_second`` (generation time), then returns
+    a fixed answer of ``response_tokens`` words. A rate of 0 disables the
+    generation delay.
+    """
+
+    latency_ms: float = 0.0
+    tokens_per_second: float = 0.0
+    response_tokens: int = 64
+
+    @property
+    def _llm_type(self) -> str:
+        """Return type of LLM."""
+        return "benchmark-fake"
+
+    def _call(
+        self,
+        prompt: str,
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> str:
+        """Sleep for the simulated latency and return the answer."""
+        delay = self.latency_ms / 1000.0
+        if self.tokens_per_second > 0:
+            delay += self.response_tokens / self.tokens_per_second
+        if delay > 0:
+            time.sleep(delay)
+        words = tokenize(prompt[-2000:]) or ["answer"]
+        return " ".join(words[i % len(words)] for i in range(self.response_tokens))
+
+
+class FakeReranker:
+    """
+    Cross-encoder stand-in scoring query/document pairs by token overlap.
+
+    Implements ``predict(pairs)`` like ``sentence_transformers.CrossEncoder``
+    and sleeps ``latency_ms_per_pair`` per pair to simulate model cost.
+    """
+
+    def __init__(self, latency_ms_per_pair: float = 0.0):
+        """
+        Initialize fake reranker.
+
+        Args:
+            latency_ms_per_pair: Simulated scoring time per pair
+        """
+        self.latency_ms_per_pair = latency_ms_per_pair
+
+    def predict(self, pairs: Sequence[Sequence[str]]) -> List[float]:
+        """
+        Score query/document pairs.
+
+        Args:
+            pairs: [query, document] pairs
+
+        Returns:
+            Fraction of query tokens found in each document
+        """
+        if self.latency_ms_per_pair > 0:
+            time.sleep(self.latency_ms_per_pair * len(pairs) / 1000.0)
+        scores = []
+        for query, document in pairs:
+            query_tokens = set(tokenize(query))
+            if not query_tokens:
+                scores.append(0.0)
+                continue
+            overlap = query_tokens & set(tokenize(document))
+            scores.append(len(overlap) / len(query_tokens))
+        return scores
@@ -0,0 +1,375 @@
+"""
+Recorded-payload fixtures for the ingestion benchmark.
+
+Payloads are generated deterministically in the shape the fetchers return
+from their APIs (news article dicts, transcript dicts, yfinance data dicts,
+FRED series dicts) and replayed by fixture fetchers. The fixture fetchers
+subclass the real fetchers and replace only the network call, so parsing,
+formatting and normalization run the production code.
+"""
+
+import random
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.ingestion.fred_fetcher import FREDFetcher
+from app.ingestion.news_fetcher import NewsFetcher
+from app.ingestion.transcript_fetcher import TranscriptFetcher
+from app.ingestion.yfinance_fetcher import YFinanceFetcher
+from benchmarks.corpus import COMPANIES, iter_corpus
+
+# Corpus chunks concatenated into one document file / news article
+CHUNKS_PER_FILE = 200
+CHUNKS_PER_ARTICLE = 8
+
+TRANSCRIPT_TURNS = 80
+STOCK_HISTORY_DAYS = 504  # ~2 years of daily bars
+FRED_OBSERVATIONS = 240  # 20 years of monthly observations
+
+_EXECUTIVES = ["Operator", "Chief Executive Officer", "Chief Financial Officer"]
+_ANALYSTS = ["Jane Miller", "Robert Chen", "Maria Garcia", "David Kim"]
+
+
+def payload_size(value: Any) -> int:
+    """
+    Approximate the size of a recorded payload in bytes.
+
+    Text is measured as UTF-8, pandas objects by their CSV form.
+
+    Args:
+        value: Payload (str, DataFrame, Series, dict or list)
+
+    Returns:
+        Size in bytes
+    """
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return len(value.to_csv().encode("utf-8"))
+    if isinstance(value, dict):
+        return sum(payload_size(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(payload_size(item) for item in value)
+    return len(str(value).encode("utf-8"))
+
+
+def _tickers(count: int) -> List[str]:
+    """Return count distinct ticker symbols, reusing known companies first."""
+    symbols = []
+    for index in range(count):
+        cycle, position = divmod(index, len(COMPANIES))
+        symbols.append(COMPANIES[position][0] + (str(cycle) if cycle else ""))
+    return symbols
+
+
+def write_documents(directory: Path, n_files: int, seed: int = 0) -> List[Path]:
+    """
+    Write Markdown filing documents built from the synthetic corpus.
+
+    Args:
+        directory: Output directory (created if missing)
+        n_files: Number of files
+        seed: Corpus seed
+
+    Returns:
+        Paths of the written files
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    corpus = iter_corpus(
+        n_files * CHUNKS_PER_FILE, seed=seed, batch_size=CHUNKS_PER_FILE, news_ratio=0
+    )
+    for index, chunks in enumerate(corpus):
+        first = chunks[0].metadata
+        lines = [f"# {first['company_name']} {first['form_type']}", ""]
+        for chunk in chunks:
+            lines.extend([chunk.page_content, ""])
+        path = directory / f"filing_{index:05d}.md"
+        path.write_text("\n".join(lines), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def news_articles(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Generate news article payloads as returned by NewsFetcher.fetch_news.
+
+    Args:
+        count: Number of articles
+        seed: Corpus seed
+
+    Returns:
+        Article dicts
+    """
+    articles = []
+    corpus = iter_corpus(
+        count * CHUNKS_PER_ARTICLE,
+        seed=seed,
+        batch_size=CHUNKS_PER_ARTICLE,
+        news_ratio=1,
+    )
+    for index, chunks in enumerate(corpus):
+        first = chunks[0].metadata
+        articles.append(
+            {
+                "title": first["title"],
+                "content": "\n\n".join(chunk.page_content for chunk in chunks),
+                "source": first["source"],
+                "url": f"https://news.example.com/{first['source']}/{index}",
+                "date": first["published_date"],
+                "author": "Staff Reporter",
+                "tickers": [first["tickers"]],
+                "category": "earnings",
+            }
+        )
+    return articles
+
+
+def transcripts(count: int, seed: int = 0) -> Dict[str, Dict[str, Any]]:
+    """
+    Generate earnings call transcript payloads.
+
+    Args:
+        count: Number of transcripts (one per ticker)
+        seed: Random seed
+
+    Returns:
+        Mapping of ticker to TranscriptFetcher.fetch_transcript payload
+    """
+    payloads = {}
+    corpus = iter_corpus(
+        count * TRANSCRIPT_TURNS, seed=seed, batch_size=TRANSCRIPT_TURNS, news_ratio=0
+    )
+    for ticker, chunks in zip(_tickers(count), corpus):
+        rng = random.Random(f"{seed}-{ticker}")
+        lines = ["Operator: Good afternoon and welcome to the earnings call."]
+        speakers = ["Operator"]
+        for turn, chunk in enumerate(chunks):
+            if turn % 4 == 3:
+                speaker = rng.choice(_ANALYSTS)
+            else:
+                speaker = rng.choice(_EXECUTIVES[1:])
+            if speaker not in speakers:
+                speakers.append(speaker)
+            lines.append(f"{speaker}: {chunk.page_content}")
+        quarter = rng.randint(1, 4)
+        fiscal_year = rng.randint(2019, 2024)
+        payloads[ticker] = {
+            "ticker": ticker,
+            "date": date(fiscal_year, quarter * 3, 28).isoformat(),
+            "transcript": "\n".join(lines),
+            "speakers": speakers,
+            "source": "fixture",
+            "url": f"https://transcripts.example.com/{ticker}",
+            "quarter": f"Q{quarter}",
+            "fiscal_year": fiscal_year,
+        }
+    return payloads
+
+
+def stock_data(count: int, seed: int = 0) -> Dict[str, Dict[str, Any]]:
+    """
+    Generate yfinance payloads as returned by YFinanceFetcher.fetch_bulk_data.
+
+    Args:
+        count: Number of tickers
+        seed: Random seed
+
+    Returns:
+        Mapping of ticker to info, history, dividends, earnings and
+        recommendations
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(
+        end="2024-12-31", periods=STOCK_HISTORY_DAYS, tz="America/New_York"
+    )
+    payloads = {}
+    for index, ticker in enumerate(_tickers(count)):
+        _, company, sector = COMPANIES[index % len(COMPANIES)]
+        closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, STOCK_HISTORY_DAYS)))
+        volumes = rng.integers(100_000, 50_000_000, STOCK_HISTORY_DAYS)
+        payloads[ticker] = {
+            "info": {
+                "longName": company,
+                "sector": sector.title(),
+                "industry": sector.title(),
+                "longBusinessSummary": (
+                    f"{company} operates in {sector} and reports in US dollars."
+                ),
+                "marketCap": float(closes[-1] * 1e9),
+                "currentPrice": float(closes[-1]),
+                "previousClose": float(closes[-2]),
+                "volume": int(volumes[-1]),
+                "trailingPE": float(rng.uniform(8, 40)),
+                "dividendYield": float(rng.uniform(0, 0.04)),
+                "totalRevenue": float(rng.uniform(1e9, 4e11)),
+                "totalCash": float(rng.uniform(1e8, 1e11)),
+                "totalDebt": float(rng.uniform(1e8, 1e11)),
+            },
+            "history": pd.DataFrame(
+                {
+                    "Open": closes * 0.99,
+                    "High": closes * 1.01,
+                    "Low": closes * 0.98,
+                    "Close": closes,
+                    "Volume": volumes,
+                },
+                index=dates,
+            ),
+            "dividends": pd.Series(
+                rng.uniform(0.1, 1.5, 8).round(2), index=dates[::63][:8]
+            ),
+            "earnings": pd.DataFrame(
+                {
+                    "Revenue": rng.uniform(1e9, 1e11, 4),
+                    "Earnings": rng.uniform(1e8, 1e10, 4),
+                },
+                index=[2021, 2022, 2023, 2024],
+            ),
+            "recommendations": pd.DataFrame(
+                {
+                    "Firm": rng.choice(["Morgan Stanley", "UBS", "Barclays"], 20),
+                    "To Grade": rng.choice(["Buy", "Hold", "Sell"], 20),
+                    "Action": rng.choice(["main", "up", "down"], 20),
+                },
+                index=dates[-20:],
+            ),
+        }
+    return payloads
+
+
+def fred_series(count: int, seed: int = 0) -> Dict[str, Dict[str, Any]]:
+    """
+    Generate FRED payloads as returned by FREDFetcher.fetch_multiple_series.
+
+    Args:
+        count: Number of series
+        seed: Random seed
+
+    Returns:
+        Mapping of series ID to series data
+    """
+    rng = np.random.default_rng(seed)
+    index = pd.date_range(end="2024-12-01", periods=FRED_OBSERVATIONS, freq="MS")
+    start = index[0].strftime("%Y-%m-%d")
+    end = index[-1].strftime("%Y-%m-%d")
+    payloads = {}
+    for number in range(count):
+        series_id = f"SERIES{number:04d}"
+        values = 100 + np.cumsum(rng.normal(0.2, 1.0, FRED_OBSERVATIONS))
+        payloads[series_id] = {
+            "series_id": series_id,
+            "data": pd.Series(values.round(3), index=index),
+            "metadata": {
+                "title": f"Synthetic Economic Indicator {number}",
+                "units": "Index 2015=100",
+                "frequency": "Monthly",
+                "seasonal_adjustment": "Seasonally Adjusted",
+                "observation_start": start,
+                "observation_end": end,
+                "last_updated": "2025-01-15",
+                "notes": "Generated for ingestion benchmarks.",
+            },
+            "start_date": start,
+            "end_date": end,
+        }
+    return payloads
+
+
+class FixtureNewsFetcher(NewsFetcher):
+    """NewsFetcher replaying recorded articles instead of RSS and scraping."""
+
+    def __init__(self, articles: List[Dict[str, Any]]):
+        """
+        Initialize fixture news fetcher.
+
+        Args:
+            articles: Article payloads returned by fetch_news
+        """
+        super().__init__(use_rss=False, use_scraping=False)
+        self.articles = articles
+
+    def fetch_news(self, *args: Any, **kwargs: Any) -> List[Dict[str, Any]]:
+        """Return the recorded articles."""
+        return [dict(article) for article in self.articles]
+
+
+class FixtureTranscriptFetcher(TranscriptFetcher):
+    """TranscriptFetcher replaying recorded transcripts instead of API Ninjas."""
+
+    def __init__(self, payloads: Dict[str, Dict[str, Any]]):
+        """
+        Initialize fixture transcript fetcher (no HTTP session is created).
+
+        Args:
+            payloads: Mapping of ticker to transcript payload
+        """
+        self.payloads = payloads
+
+    def fetch_transcript(
+        self,
+        ticker: str,
+        date: Optional[str] = None,
+        source: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Return the recorded transcript of a ticker."""
+        payload = self.payloads.get(ticker)
+        return dict(payload) if payload else None
+
+
+class FixtureYFinanceFetcher(YFinanceFetcher):
+    """YFinanceFetcher replaying recorded ticker data instead of Yahoo Finance."""
+
+    def __init__(self, payloads: Dict[str, Dict[str, Any]]):
+        """
+        Initialize fixture yfinance fetcher (no rate limiter or store).
+
+        Args:
+            payloads: Mapping of ticker to fetch_bulk_data entry
+        """
+        self.payloads = payloads
+
+    def fetch_bulk_data(
+        self, ticker_symbols: List[str], include_history: bool = True
+    ) -> Dict[str, Dict[str, Any]]:
+        """Return the recorded data of the requested tickers."""
+        data = {}
+        for ticker in ticker_symbols:
+            if ticker not in self.payloads:
+                continue
+            data[ticker] = {
+                key: value
+                for key, value in self.payloads[ticker].items()
+                if include_history or key != "history"
+            }
+        return data
+
+
+class FixtureFREDFetcher(FREDFetcher):
+    """FREDFetcher replaying recorded series instead of the FRED API."""
+
+    def __init__(self, payloads: Dict[str, Dict[str, Any]]):
+        """
+        Initialize fixture FRED fetcher (no API client is created).
+
+        Args:
+            payloads: Mapping of series ID to series data
+        """
+        self.payloads = payloads
+
+    def fetch_multiple_series(
+        self,
+        series_ids: List[str],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Return the recorded data of the requested series."""
+        return {
+            series_id: self.payloads[series_id]
+            for series_id in series_ids
+            if series_id in self.payloads
+        }
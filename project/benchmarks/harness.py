@@ -0,0 +1,251 @@
+"""
+Shared measurement, result and regression-comparison helpers.
+
+A benchmark run produces a JSON document:
+
+    {
+        "benchmark": "rag_query",
+        "created_at": "2026-01-01T00:00:00+00:00",
+        "environment": {"python": "3.11.9", "platform": "...", "cpu_count": 8},
+        "settings": {...},
+        "results": [
+            {"name": "hybrid@10000", "metrics": {"p50_ms": 4.1, "qps": 220.5}}
+        ]
+    }
+
+Results are matched by name when comparing against a baseline. Metrics whose
+name ends in ``_ms``, ``_seconds`` or ``_mb`` regress when they grow; metrics
+ending in ``qps``, ``_per_second`` or ``recall`` regress when they shrink.
+Other metrics are informational.
+"""
+
+import json
+import os
+import platform
+import sys
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from app.utils.config import config
+
+LOWER_IS_BETTER_SUFFIXES = ("_ms", "_seconds", "_mb")
+HIGHER_IS_BETTER_SUFFIXES = ("qps", "_per_second", "recall")
+
+
+class BenchmarkError(Exception):
+    """Custom exception for benchmark errors."""
+
+    pass
+
+
+@dataclass
+class Regression:
+    """A metric that is worse than its baseline beyond the tolerance."""
+
+    result: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """Relative change from the baseline (0.25 = 25% higher)."""
+        return (self.current - self.baseline) / self.baseline
+
+    def __str__(self) -> str:
+        return (
+            f"{self.result} {self.metric}: {self.baseline:.3f} -> "
+            f"{self.current:.3f} ({self.change:+.1%})"
+        )
+
+
+@contextmanager
+def config_overrides(**values: Any) -> Iterator[None]:
+    """Temporarily set configuration values."""
+    previous = {name: getattr(config, name) for name in values}
+    try:
+        for name, value in values.items():
+            setattr(config, name, value)
+        yield
+    finally:
+        for name, value in previous.items():
+            setattr(config, name, value)
+
+
+def latency_summary(latencies_ms: Sequence[float]) -> Dict[str, float]:
+    """
+    Summarize latencies.
+
+    Args:
+        latencies_ms: Latencies in milliseconds
+
+    Returns:
+        Dict with mean_ms, p50_ms, p95_ms, p99_ms and max_ms
+
+    Raises:
+        BenchmarkError: If no latencies were recorded
+    """
+    if not latencies_ms:
+        raise BenchmarkError("No latencies recorded")
+    values = np.asarray(latencies_ms, dtype=float)
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {
+        "mean_ms": round(float(values.mean()), 3),
+        "p50_ms": round(float(p50), 3),
+        "p95_ms": round(float(p95), 3),
+        "p99_ms": round(float(p99), 3),
+        "max_ms": round(float(values.max()), 3),
+    }
+
+
+def environment() -> Dict[str, Any]:
+    """Describe the machine results were measured on."""
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def build_report(
+    benchmark: str, settings: Dict[str, Any], results: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Build a result document.
+
+    Args:
+        benchmark: Benchmark name
+        settings: Parameters of the run
+        results: Result entries with "name" and "metrics"
+
+    Returns:
+        Result document
+    """
+    return {
+        "benchmark": benchmark,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "environment": environment(),
+        "settings": settings,
+        "results": results,
+    }
+
+
+def write_report(report: Dict[str, Any], path: str) -> Path:
+    """
+    Write a result document as JSON.
+
+    Args:
+        report: Result document
+        path: Output file
+
+    Returns:
+        Path written
+    """
+    output = Path(path)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    return output
+
+
+def load_report(path: str) -> Dict[str, Any]:
+    """
+    Load a result document.
+
+    Args:
+        path: JSON file written by write_report
+
+    Returns:
+        Result document
+
+    Raises:
+        BenchmarkError: If the file is missing or not a result document
+    """
+    try:
+        report = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        raise BenchmarkError(f"Failed to load benchmark results {path}: {e}") from e
+    if not isinstance(report, dict) or not isinstance(report.get("results"), list):
+        raise BenchmarkError(f"Not a benchmark result file: {path}")
+    return report
+
+
+def _direction(metric: str) -> Optional[int]:
+    """Return 1 if higher values are worse, -1 if lower are worse, else None."""
+    if metric.endswith(LOWER_IS_BETTER_SUFFIXES):
+        return 1
+    if metric.endswith(HIGHER_IS_BETTER_SUFFIXES):
+        return -1
+    return None
+
+
+def compare_reports(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    tolerance: float = 0.10,
+) -> List[Regression]:
+    """
+    Find metrics that regressed against a baseline.
+
+    Results missing from either document are skipped, as are metrics with a
+    baseline of 0.
+
+    Args:
+        current: Result document of the run under test
+        baseline: Stored baseline result document
+        tolerance: Allowed relative change (0.10 = 10%)
+
+    Returns:
+        Regressions, in result order
+    """
+    baseline_results = {
+        entry["name"]: entry.get("metrics", {}) for entry in baseline["results"]
+    }
+    regressions = []
+    for entry in current["results"]:
+        reference = baseline_results.get(entry["name"])
+        if reference is None:
+            continue
+        for metric, value in entry.get("metrics", {}).items():
+            direction = _direction(metric)
+            base = reference.get(metric)
+            if direction is None or not base or value is None:
+                continue
+            if direction * (value - base) > tolerance * abs(base):
+                regressions.append(
+                    Regression(
+                        result=entry["name"],
+                        metric=metric,
+                        baseline=float(base),
+                        current=float(value),
+                    )
+                )
+    return regressions
+
+
+def print_report(report: Dict[str, Any], file=sys.stdout) -> None:
+    """Print result metrics as a table."""
+    metrics: List[str] = []
+    for entry in report["results"]:
+        for metric in entry.get("metrics", {}):
+            if metric not in metrics:
+                metrics.append(metric)
+    width = max([len(entry["name"]) for entry in report["results"]] + [6])
+    columns = [max(14, len(metric) + 2) for metric in metrics]
+    print(
+        "result".ljust(width)
+        + "".join(metric.rjust(column) for metric, column in zip(metrics, columns)),
+        file=file,
+    )
+    for entry in report["results"]:
+        values = entry.get("metrics", {})
+        cells = []
+        for metric, column in zip(metrics, columns):
+            value = values.get(metric)
+            cells.append(("-" if value is None else f"{value:.3f}").rjust(column))
+        print(entry["name"].ljust(width) + "".join(cells), file=file)
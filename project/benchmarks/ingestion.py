@@ -0,0 +1,461 @@
+"""
+Ingestion throughput benchmark.
+
+Runs every ingestion processor end to end against recorded-payload fixtures
+(see ``benchmarks.fixtures``) with hash embeddings and a temporary vector store
+collection:
+
+- ``documents``: DocumentProcessor over Markdown filing files
+- ``news``: NewsProcessor over news article payloads
+- ``transcripts``: TranscriptProcessor over earnings call transcripts
+- ``stock``: StockProcessor over yfinance ticker data
+- ``economic``: EconomicDataProcessor over FRED series
+
+Each scenario is traced, so the report breaks the elapsed time down into the
+processor stages (load, fetch, parse, sentiment, chunk, embed, write), and
+runs in a fresh process by default so its peak RSS is measured in isolation.
+
+Usage:
+    python -m benchmarks.ingestion
+    python -m benchmarks.ingestion --scenarios news stock --scale 4
+    python -m benchmarks.ingestion --sentiment --embed-latency-ms 0.5
+    python -m benchmarks.ingestion --backend hnsw
+    python -m benchmarks.ingestion --baseline baseline.json --tolerance 0.1
+"""
+
+import argparse
+import multiprocessing
+import shutil
+import sys
+import tempfile
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from unittest.mock import patch
+
+from app.ingestion.document_loader import DocumentLoader
+from app.ingestion.processors import (
+    DocumentProcessor,
+    EconomicDataProcessor,
+    NewsProcessor,
+    StockProcessor,
+    TranscriptProcessor,
+)
+from app.ingestion.sentiment_analyzer import SentimentAnalyzer
+from app.ingestion.stock_data_normalizer import StockDataNormalizer
+from app.ingestion.transcript_parser import TranscriptParser
+from app.rag.embedding_factory import EmbeddingFactory, EmbeddingGenerator
+from app.utils.logger import get_logger, setup_logging
+from app.utils.tracing import TOTAL_STAGE, start_trace
+from app.vector_db import create_vector_store
+from benchmarks import fixtures
+from benchmarks.fakes import HashEmbeddings
+from benchmarks.harness import (
+    BenchmarkError,
+    build_report,
+    compare_reports,
+    config_overrides,
+    load_report,
+    print_report,
+    write_report,
+)
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = get_logger(__name__)
+
+# Fixture units per scenario at --scale 1 (files, articles, transcripts,
+# tickers, series)
+DEFAULT_UNITS: Dict[str, int] = {
+    "documents": 20,
+    "news": 500,
+    "transcripts": 20,
+    "stock": 100,
+    "economic": 100,
+}
+
+# Enable the processors and keep fetched data out of side stores
+_OVERRIDES = {
+    "news_enabled": True,
+    "news_alerts_enabled": False,
+    "news_summarization_deferred": False,
+    "transcript_enabled": True,
+    "yfinance_enabled": True,
+    "fred_enabled": True,
+    "timeseries_store_enabled": False,
+}
+
+_BYTES_PER_MB = 1024 * 1024
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Return the peak resident set size of this process in MB, if known."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    if sys.platform == "darwin":
+        peak /= 1024
+    return round(peak / 1024, 1)
+
+
+def _prepare(
+    scenario: str, units: int, work_dir: Path, seed: int
+) -> Tuple[int, Callable[[tuple], Any], Callable[[Any, bool], List[str]]]:
+    """
+    Build the fixtures of a scenario.
+
+    Processor factories take (document_loader, embedding_generator,
+    chroma_store, sentiment_analyzer).
+
+    Returns:
+        Tuple of (payload bytes, factory of the processor, function running
+        the processor and returning chunk IDs)
+    """
+    if scenario == "documents":
+        paths = fixtures.write_documents(work_dir / "documents", units, seed=seed)
+        size = sum(path.stat().st_size for path in paths)
+        return (
+            size,
+            lambda base: DocumentProcessor(*base),
+            lambda processor, store: processor.process_documents(
+                paths, store_embeddings=store
+            ),
+        )
+    if scenario == "news":
+        articles = fixtures.news_articles(units, seed=seed)
+        return (
+            fixtures.payload_size(articles),
+            lambda base: NewsProcessor(
+                *base[:3],
+                fixtures.FixtureNewsFetcher(articles),
+                sentiment_analyzer=base[3],
+            ),
+            lambda processor, store: processor.process_news(store_embeddings=store),
+        )
+    if scenario == "transcripts":
+        payloads = fixtures.transcripts(units, seed=seed)
+        return (
+            fixtures.payload_size(payloads),
+            lambda base: TranscriptProcessor(
+                *base[:3],
+                fixtures.FixtureTranscriptFetcher(payloads),
+                TranscriptParser(),
+                sentiment_analyzer=base[3],
+            ),
+            lambda processor, store: processor.process_transcripts(
+                list(payloads), store_embeddings=store
+            ),
+        )
+    if scenario == "stock":
+        payloads = fixtures.stock_data(units, seed=seed)
+        return (
+            fixtures.payload_size(payloads),
+            lambda base: StockProcessor(
+                *base[:3],
+                fixtures.FixtureYFinanceFetcher(payloads),
+                StockDataNormalizer(),
+                sentiment_analyzer=base[3],
+            ),
+            lambda processor, store: processor.process_stock_tickers(
+                list(payloads), store_embeddings=store
+            ),
+        )
+    if scenario == "economic":
+        payloads = fixtures.fred_series(units, seed=seed)
+        return (
+            fixtures.payload_size(payloads),
+            lambda base: EconomicDataProcessor(
+                *base[:3],
+                fred_fetcher=fixtures.FixtureFREDFetcher(payloads),
+                sentiment_analyzer=base[3],
+            ),
+            lambda processor, store: processor.process_fred_series(
+                list(payloads), store_embeddings=store
+            ),
+        )
+    raise BenchmarkError(
+        f"Unknown scenario '{scenario}', expected one of {list(DEFAULT_UNITS)}"
+    )
+
+
+def run_scenario(
+    scenario: str,
+    units: int,
+    data_dir: str,
+    seed: int = 0,
+    dimensions: int = 384,
+    embed_latency_ms: float = 0.0,
+    sentiment: bool = False,
+    store_embeddings: bool = True,
+    backend: str = "chroma",
+) -> Dict[str, Any]:
+    """
+    Ingest the fixtures of one scenario and measure it.
+
+    Fixtures are generated and the processor is built before the
+    measurement starts. Written chunks go to a temporary collection in
+    data_dir, which is removed afterwards.
+
+    Args:
+        scenario: Scenario name (key of DEFAULT_UNITS)
+        units: Fixture units to ingest (files, articles, tickers, ...)
+        data_dir: Directory for fixture files and the temporary store
+        seed: Fixture seed
+        dimensions: Embedding dimensions
+        embed_latency_ms: Simulated embedding time per chunk
+        sentiment: Enrich documents with lexicon sentiment (TextBlob/VADER)
+        store_embeddings: Write embeddings to the vector store
+        backend: Vector store backend ("chroma" or "hnsw")
+
+    Returns:
+        Result entry
+
+    Raises:
+        BenchmarkError: If the scenario is unknown or ingestion fails
+    """
+    Path(data_dir).mkdir(parents=True, exist_ok=True)
+    work_dir = Path(tempfile.mkdtemp(prefix=f"{scenario}_", dir=data_dir))
+    try:
+        with config_overrides(**_OVERRIDES):
+            size, build, ingest = _prepare(scenario, units, work_dir, seed)
+            embeddings = HashEmbeddings(
+                dimensions=dimensions, latency_ms_per_text=embed_latency_ms
+            )
+            with patch.object(
+                EmbeddingFactory, "create_embeddings", return_value=embeddings
+            ):
+                generator = EmbeddingGenerator(provider="benchmark")
+            store = create_vector_store(
+                collection_name=f"ingest_{scenario}_{uuid.uuid4().hex[:8]}",
+                persist_directory=work_dir / backend,
+                backend=backend,
+            )
+            analyzer = (
+                SentimentAnalyzer(use_finbert=False, use_textblob=True, use_vader=True)
+                if sentiment
+                else None
+            )
+            processor = build((DocumentLoader(), generator, store, analyzer))
+            rss_before = peak_rss_mb()
+
+            try:
+                with start_trace(f"ingestion.{scenario}", exporters=[]) as trace:
+                    ids = ingest(processor, store_embeddings)
+            except Exception as e:
+                raise BenchmarkError(f"Scenario '{scenario}' failed: {e}") from e
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    timings = trace.timings()
+    elapsed = timings.pop(TOTAL_STAGE) / 1000
+    if not ids:
+        raise BenchmarkError(f"Scenario '{scenario}' produced no chunks")
+    return {
+        "name": f"{scenario}@{units}",
+        "scenario": scenario,
+        "units": units,
+        "chunks": len(ids),
+        "payload_mb": round(size / _BYTES_PER_MB, 3),
+        "rss_before_mb": rss_before,
+        "metrics": {
+            "elapsed_seconds": round(elapsed, 3),
+            "units_per_second": round(units / elapsed, 3),
+            "chunks_per_second": round(len(ids) / elapsed, 3),
+            "mb_per_second": round(size / _BYTES_PER_MB / elapsed, 3),
+            "peak_rss_mb": peak_rss_mb(),
+        },
+        "stages_ms": timings,
+    }
+
+
+def _run_isolated(log_level: str, **kwargs: Any) -> Dict[str, Any]:
+    """Run a scenario in a worker process (entry point of the child)."""
+    setup_logging(log_level=log_level)
+    return run_scenario(**kwargs)
+
+
+def run_scenarios(
+    scenarios: List[str],
+    units: Dict[str, int],
+    isolated: bool = True,
+    log_level: str = "WARNING",
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+    **kwargs: Any,
+) -> List[Dict[str, Any]]:
+    """
+    Run scenarios one after another.
+
+    Args:
+        scenarios: Scenario names
+        units: Fixture units per scenario
+        isolated: Run each scenario in a fresh spawned process, so peak RSS
+            covers that scenario only
+        log_level: Log level of worker processes
+        on_result: Called with each result entry as it completes
+        **kwargs: Further run_scenario arguments
+
+    Returns:
+        Result entries, in scenario order
+    """
+    results = []
+    for scenario in scenarios:
+        if isolated:
+            with ProcessPoolExecutor(
+                max_workers=1, mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                result = executor.submit(
+                    _run_isolated,
+                    log_level,
+                    scenario=scenario,
+                    units=units[scenario],
+                    **kwargs,
+                ).result()
+        else:
+            result = run_scenario(scenario, units[scenario], **kwargs)
+        results.append(result)
+        if on_result is not None:
+            on_result(result)
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark and write the result document."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark ingestion throughput of every processor offline",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--scenarios",
+        nargs="+",
+        choices=list(DEFAULT_UNITS),
+        default=list(DEFAULT_UNITS),
+        help="Scenarios (default: all)",
+    )
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Multiplier of the default fixture units per scenario (default: 1)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Fixture seed")
+    parser.add_argument(
+        "--dimensions", type=int, default=384, help="Embedding dimensions"
+    )
+    parser.add_argument(
+        "--embed-latency-ms",
+        type=float,
+        default=0.0,
+        help="Simulated embedding time per chunk (default: 0)",
+    )
+    parser.add_argument(
+        "--sentiment",
+        action="store_true",
+        help="Enrich documents with TextBlob/VADER sentiment",
+    )
+    parser.add_argument(
+        "--no-write",
+        action="store_true",
+        help="Skip writing embeddings to the vector store",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["chroma", "hnsw"],
+        default="chroma",
+        help="Vector store backend (default: chroma)",
+    )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Run scenarios in this process (peak RSS is then cumulative)",
+    )
+    parser.add_argument(
+        "--data-dir",
+        default="./data/benchmarks/ingestion",
+        help="Directory for fixture files and temporary stores",
+    )
+    parser.add_argument(
+        "--output",
+        default="./data/benchmarks/ingestion.json",
+        help="Result file",
+    )
+    parser.add_argument("--baseline", help="Baseline result file to compare with")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.10,
+        help="Allowed relative change against the baseline (default: 0.10)",
+    )
+    parser.add_argument("--log-level", default="WARNING", help="Log level")
+    args = parser.parse_args(argv)
+
+    setup_logging(log_level=args.log_level)
+    units = {
+        scenario: max(1, round(count * args.scale))
+        for scenario, count in DEFAULT_UNITS.items()
+    }
+
+    def report_progress(result: Dict[str, Any]) -> None:
+        metrics = result["metrics"]
+        print(
+            f"{result['name']}: {result['chunks']} chunks in "
+            f"{metrics['elapsed_seconds']}s "
+            f"({metrics['chunks_per_second']} chunks/s, "
+            f"{metrics['mb_per_second']} MB/s, peak RSS {metrics['peak_rss_mb']} MB)",
+            flush=True,
+        )
+
+    try:
+        results = run_scenarios(
+            args.scenarios,
+            units,
+            isolated=not args.in_process,
+            log_level=args.log_level,
+            on_result=report_progress,
+            data_dir=args.data_dir,
+            seed=args.seed,
+            dimensions=args.dimensions,
+            embed_latency_ms=args.embed_latency_ms,
+            sentiment=args.sentiment,
+            store_embeddings=not args.no_write,
+            backend=args.backend,
+        )
+    except BenchmarkError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    settings = {
+        key: value
+        for key, value in vars(args).items()
+        if key not in ("output", "baseline", "log_level", "data_dir")
+    }
+    settings["units"] = {scenario: units[scenario] for scenario in args.scenarios}
+    report = build_report("ingestion", settings, results)
+    output = write_report(report, args.output)
+    print()
+    print_report(report)
+    print(f"\nResults written to {output}")
+
+    if args.baseline:
+        try:
+            regressions = compare_reports(
+                report, load_report(args.baseline), args.tolerance
+            )
+        except BenchmarkError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 2
+        if regressions:
+            print(f"{len(regressions)} regression(s) beyond {args.tolerance:.0%}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print(f"No regressions beyond {args.tolerance:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,421 @@
+"""
+RAG query latency and throughput benchmark.
+
+Indexes a synthetic corpus into a vector store and runs ``RAGQuerySystem.query``
+with deterministic stand-ins for the embedding model, LLM and cross-encoder.
+Each retrieval mode is measured at each corpus size:
+
+- ``basic``: semantic search only
+- ``hybrid``: semantic + BM25 search merged with reciprocal rank fusion
+- ``rerank``: hybrid search followed by cross-encoder reranking
+
+Indexed corpora are kept in ``--data-dir`` and reused by later runs with the
+same size and seed, so repeated runs only pay for indexing once.
+
+Usage:
+    python -m benchmarks.rag_query --sizes 10000 --queries 200
+    python -m benchmarks.rag_query --modes basic hybrid --concurrency 4
+    python -m benchmarks.rag_query --backend hnsw --baseline chroma.json
+    python -m benchmarks.rag_query --llm-latency-ms 300 --llm-tokens-per-second 40
+    python -m benchmarks.rag_query --baseline baseline.json --tolerance 0.1
+"""
+
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from unittest.mock import patch
+
+from app.rag.chain import RAGQuerySystem
+from app.rag.embedding_factory import EmbeddingFactory
+from app.utils.logger import get_logger, setup_logging
+from app.vector_db import VectorStore, create_vector_store
+from benchmarks.corpus import generate_queries, iter_corpus
+from benchmarks.fakes import FakeLLM, FakeReranker, HashEmbeddings
+from benchmarks.harness import (
+    BenchmarkError,
+    build_report,
+    compare_reports,
+    config_overrides,
+    latency_summary,
+    load_report,
+    print_report,
+    write_report,
+)
+
+logger = get_logger(__name__)
+
+# Configuration overrides per retrieval mode
+MODES: Dict[str, Dict[str, bool]] = {
+    "basic": {"rag_use_hybrid_search": False, "rag_use_reranking": False},
+    "hybrid": {"rag_use_hybrid_search": True, "rag_use_reranking": False},
+    "rerank": {"rag_use_hybrid_search": True, "rag_use_reranking": True},
+}
+
+# Features outside the retrieval path that would add unrelated work
+_BASE_OVERRIDES = {
+    "rag_numeric_lookup_enabled": False,
+    "conversation_use_langchain_memory": False,
+}
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+
+# Below ChromaDB's maximum batch size
+INDEX_BATCH_SIZE = 5000
+
+
+def build_index(
+    n_chunks: int,
+    data_dir: str,
+    embeddings: HashEmbeddings,
+    seed: int = 0,
+    backend: str = "chroma",
+) -> Tuple[VectorStore, Optional[float]]:
+    """
+    Index a synthetic corpus, reusing a previously built one.
+
+    Args:
+        n_chunks: Corpus size
+        data_dir: Directory for the benchmark indexes (one folder per backend)
+        embeddings: Embeddings used to index the chunks
+        seed: Corpus seed
+        backend: Vector store backend ("chroma" or "hnsw")
+
+    Returns:
+        Tuple of (store, indexing seconds or None if the index was reused)
+    """
+    store = create_vector_store(
+        collection_name=f"bench_{n_chunks}_{seed}_{embeddings.dimensions}",
+        persist_directory=Path(data_dir) / backend,
+        backend=backend,
+    )
+    existing = store.count()
+    if existing == n_chunks:
+        logger.info(f"Reusing benchmark index of {n_chunks} chunks")
+        return store, None
+    if existing:
+        store.reset()
+
+    start = time.perf_counter()
+    for batch in iter_corpus(n_chunks, seed=seed, batch_size=INDEX_BATCH_SIZE):
+        store.add_documents(
+            batch,
+            embeddings.embed_documents([doc.page_content for doc in batch]),
+            ids=[doc.metadata["chunk_id"] for doc in batch],
+        )
+    elapsed = time.perf_counter() - start
+    logger.info(f"Indexed {n_chunks} chunks in {elapsed:.1f}s")
+    return store, elapsed
+
+
+def build_system(
+    store: VectorStore,
+    embeddings: HashEmbeddings,
+    llm: FakeLLM,
+    reranker: FakeReranker,
+    top_k: int = 5,
+) -> RAGQuerySystem:
+    """
+    Create a RAGQuerySystem wired to the stand-ins and a benchmark store.
+
+    The system is built through its regular constructor with the current
+    configuration; only the LLM, embedding model, cross-encoder and store
+    are substituted.
+
+    Args:
+        store: Indexed benchmark store
+        embeddings: Embeddings matching the index
+        llm: LLM stand-in
+        reranker: Cross-encoder stand-in
+        top_k: Chunks per answer
+
+    Returns:
+        RAGQuerySystem instance
+    """
+    with ExitStack() as stack:
+        stack.enter_context(patch("app.rag.chain.get_llm", return_value=llm))
+        stack.enter_context(
+            patch("app.rag.chain.create_vector_store", return_value=store)
+        )
+        stack.enter_context(
+            patch.object(EmbeddingFactory, "create_embeddings", return_value=embeddings)
+        )
+        stack.enter_context(
+            patch("app.rag.retrieval_optimizer.CrossEncoder", return_value=reranker)
+        )
+        return RAGQuerySystem(
+            collection_name=store.collection_name,
+            top_k=top_k,
+            embedding_provider="benchmark",
+        )
+
+
+def run_queries(
+    system: RAGQuerySystem, queries: List[str], concurrency: int = 1
+) -> Dict[str, Any]:
+    """
+    Run queries and measure them.
+
+    Args:
+        system: RAG system under test
+        queries: Questions to ask
+        concurrency: Concurrent queries
+
+    Returns:
+        Dict with latencies_ms, stage timings per query, errors and
+        wall_seconds
+    """
+
+    def timed(question: str) -> Tuple[float, Dict[str, float], bool]:
+        start = time.perf_counter()
+        try:
+            result = system.query(question, include_timings=True)
+        except Exception as e:
+            logger.warning(f"Benchmark query failed: {str(e)}")
+            return (time.perf_counter() - start) * 1000, {}, False
+        return (time.perf_counter() - start) * 1000, result.get("timings", {}), True
+
+    start = time.perf_counter()
+    if concurrency > 1:
+        with ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="benchmark"
+        ) as executor:
+            outcomes = list(executor.map(timed, queries))
+    else:
+        outcomes = [timed(question) for question in queries]
+    wall_seconds = time.perf_counter() - start
+
+    return {
+        "latencies_ms": [latency for latency, _, ok in outcomes if ok],
+        "timings": [timings for _, timings, ok in outcomes if ok],
+        "errors": sum(1 for _, _, ok in outcomes if not ok),
+        "wall_seconds": wall_seconds,
+    }
+
+
+def _mean_stages(timings: List[Dict[str, float]]) -> Dict[str, float]:
+    """Average stage timings over queries (stages missing count as 0)."""
+    stages: Dict[str, float] = {}
+    for query_timings in timings:
+        for name, value in query_timings.items():
+            stages[name] = stages.get(name, 0.0) + value
+    return {name: round(total / len(timings), 3) for name, total in stages.items()}
+
+
+def benchmark_mode(
+    store: VectorStore,
+    mode: str,
+    queries: List[str],
+    embeddings: HashEmbeddings,
+    llm: FakeLLM,
+    reranker: FakeReranker,
+    warmup: int = 10,
+    concurrency: int = 1,
+    top_k: int = 5,
+) -> Dict[str, Any]:
+    """
+    Benchmark one retrieval mode against an indexed store.
+
+    Warmup queries (which also build the BM25 index in hybrid modes) are
+    excluded from the measurements.
+
+    Args:
+        store: Indexed benchmark store
+        mode: Retrieval mode (key of MODES)
+        queries: Measured questions
+        embeddings: Embeddings matching the index
+        llm: LLM stand-in
+        reranker: Cross-encoder stand-in
+        warmup: Warmup queries
+        concurrency: Concurrent queries
+        top_k: Chunks per answer
+
+    Returns:
+        Result entry
+
+    Raises:
+        BenchmarkError: If the mode is unknown or every query failed
+    """
+    if mode not in MODES:
+        raise BenchmarkError(f"Unknown mode '{mode}', expected one of {list(MODES)}")
+    n_chunks = store.count()
+    with config_overrides(**_BASE_OVERRIDES, **MODES[mode]):
+        system = build_system(store, embeddings, llm, reranker, top_k=top_k)
+        warmup_start = time.perf_counter()
+        run_queries(system, queries[:warmup])
+        warmup_seconds = time.perf_counter() - warmup_start
+        measured = run_queries(system, queries, concurrency=concurrency)
+
+    if not measured["latencies_ms"]:
+        raise BenchmarkError(f"All {len(queries)} queries failed in mode '{mode}'")
+    metrics = latency_summary(measured["latencies_ms"])
+    metrics["qps"] = round(len(measured["latencies_ms"]) / measured["wall_seconds"], 3)
+    return {
+        "name": f"{mode}@{n_chunks}",
+        "mode": mode,
+        "chunks": n_chunks,
+        "queries": len(queries),
+        "errors": measured["errors"],
+        "warmup_seconds": round(warmup_seconds, 3),
+        "metrics": metrics,
+        "stages_ms": _mean_stages(measured["timings"]),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark and write the result document."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark RAG query latency and throughput offline",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=DEFAULT_SIZES,
+        help="Corpus sizes in chunks (default: 10000 100000 1000000)",
+    )
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        choices=list(MODES),
+        default=list(MODES),
+        help="Retrieval modes (default: all)",
+    )
+    parser.add_argument("--queries", type=int, default=200, help="Measured queries")
+    parser.add_argument("--warmup", type=int, default=10, help="Warmup queries")
+    parser.add_argument("--concurrency", type=int, default=1, help="Parallel queries")
+    parser.add_argument("--top-k", type=int, default=5, help="Chunks per answer")
+    parser.add_argument("--seed", type=int, default=0, help="Corpus/query seed")
+    parser.add_argument(
+        "--dimensions", type=int, default=384, help="Embedding dimensions"
+    )
+    parser.add_argument(
+        "--llm-latency-ms",
+        type=float,
+        default=0.0,
+        help="Simulated LLM time to first token (default: 0)",
+    )
+    parser.add_argument(
+        "--llm-tokens-per-second",
+        type=float,
+        default=0.0,
+        help="Simulated LLM generation rate, 0 = instant (default: 0)",
+    )
+    parser.add_argument(
+        "--llm-response-tokens",
+        type=int,
+        default=64,
+        help="Tokens per simulated answer (default: 64)",
+    )
+    parser.add_argument(
+        "--rerank-latency-ms",
+        type=float,
+        default=0.0,
+        help="Simulated cross-encoder time per pair (default: 0)",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["chroma", "hnsw"],
+        default="chroma",
+        help="Vector store backend (default: chroma)",
+    )
+    parser.add_argument(
+        "--data-dir",
+        default="./data/benchmarks/indexes",
+        help="Directory for the benchmark indexes",
+    )
+    parser.add_argument(
+        "--output",
+        default="./data/benchmarks/rag_query.json",
+        help="Result file",
+    )
+    parser.add_argument("--baseline", help="Baseline result file to compare with")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.10,
+        help="Allowed relative change against the baseline (default: 0.10)",
+    )
+    parser.add_argument("--log-level", default="WARNING", help="Log level")
+    args = parser.parse_args(argv)
+
+    setup_logging(log_level=args.log_level)
+    embeddings = HashEmbeddings(dimensions=args.dimensions)
+    llm = FakeLLM(
+        latency_ms=args.llm_latency_ms,
+        tokens_per_second=args.llm_tokens_per_second,
+        response_tokens=args.llm_response_tokens,
+    )
+    reranker = FakeReranker(latency_ms_per_pair=args.rerank_latency_ms)
+    queries = generate_queries(args.queries, seed=args.seed)
+
+    results = []
+    try:
+        for size in args.sizes:
+            store, index_seconds = build_index(
+                size,
+                args.data_dir,
+                embeddings,
+                seed=args.seed,
+                backend=args.backend,
+            )
+            for mode in args.modes:
+                result = benchmark_mode(
+                    store,
+                    mode,
+                    queries,
+                    embeddings,
+                    llm,
+                    reranker,
+                    warmup=args.warmup,
+                    concurrency=args.concurrency,
+                    top_k=args.top_k,
+                )
+                result["index_seconds"] = (
+                    None if index_seconds is None else round(index_seconds, 3)
+                )
+                results.append(result)
+                print(
+                    f"{result['name']}: p50={result['metrics']['p50_ms']}ms "
+                    f"p99={result['metrics']['p99_ms']}ms "
+                    f"qps={result['metrics']['qps']}",
+                    flush=True,
+                )
+    except BenchmarkError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    settings = {
+        key: value
+        for key, value in vars(args).items()
+        if key not in ("output", "baseline", "log_level")
+    }
+    report = build_report("rag_query", settings, results)
+    output = write_report(report, args.output)
+    print()
+    print_report(report)
+    print(f"\nResults written to {output}")
+
+    if args.baseline:
+        try:
+            regressions = compare_reports(
+                report, load_report(args.baseline), args.tolerance
+            )
+        except BenchmarkError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 2
+        if regressions:
+            print(f"{len(regressions)} regression(s) beyond {args.tolerance:.0%}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print(f"No regressions beyond {args.tolerance:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,388 @@
+"""
+Vector search recall and latency benchmark.
+
+Indexes synthetic embeddings into HNSW store collections (requires the
+optional hnswlib package) with and without int8 quantization and measures,
+per search candidate list size (``ef_search``) and, for int8, per rescore
+factor:
+
+- ``recall``: recall@k against exact float32 brute-force search
+- latency percentiles and ``qps`` of ``query_by_embedding``
+- ``vector_mb``: size of the vectors the first search stage ranks (int8
+  codes or float16 vectors) next to ``float32_mb``, the size of the same
+  vectors as float32, as hnswlib holds them in each process
+
+Embeddings are drawn around random cluster centres, like the topical
+clusters of real chunk embeddings, so the nearest-neighbour structure is
+realistic without an embedding model. Collections are kept in
+``--data-dir`` and reused by later runs with the same parameters.
+
+Usage:
+    python -m benchmarks.vector_search
+    python -m benchmarks.vector_search --sizes 100000 --dimensions 1536
+    python -m benchmarks.vector_search --ef-search 16 32 64 128 --k 10
+    python -m benchmarks.vector_search --ef-search 64 --rescore-factors 1 2 4 8
+    python -m benchmarks.vector_search --baseline baseline.json --tolerance 0.1
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from langchain_core.documents import Document
+
+from app.utils.logger import get_logger, setup_logging
+from app.vector_db import HNSWStore, HNSWStoreError
+from benchmarks.harness import (
+    BenchmarkError,
+    build_report,
+    compare_reports,
+    latency_summary,
+    load_report,
+    print_report,
+    write_report,
+)
+
+logger = get_logger(__name__)
+
+DEFAULT_SIZES = [10_000, 100_000]
+
+DEFAULT_EF_SEARCH = [16, 32, 64, 128]
+
+DEFAULT_RESCORE_FACTORS = [1, 2, 4]
+
+# Vectors written per add_documents call while indexing
+INDEX_BATCH_SIZE = 1000
+
+_BYTES_PER_MB = 1024 * 1024
+
+
+def embedding_vectors(
+    n: int, dimensions: int, seed: int = 0, clusters: int = 100
+) -> np.ndarray:
+    """
+    Generate clustered unit-length embedding vectors.
+
+    Args:
+        n: Number of vectors
+        dimensions: Vector dimensions
+        seed: Random seed (centres depend only on dimensions and clusters)
+        clusters: Number of cluster centres
+
+    Returns:
+        Float32 array of shape (n, dimensions)
+    """
+    centres = np.random.default_rng(dimensions * 7919 + clusters).normal(
+        size=(clusters, dimensions)
+    )
+    rng = np.random.default_rng(seed)
+    vectors = centres[rng.integers(0, clusters, n)] + 0.5 * rng.normal(
+        size=(n, dimensions)
+    )
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors.astype(np.float32)
+
+
+def exact_neighbours(
+    vectors: np.ndarray, queries: np.ndarray, k: int, space: str = "cosine"
+) -> np.ndarray:
+    """
+    Find the exact k nearest neighbours by brute force.
+
+    Args:
+        vectors: Indexed vectors
+        queries: Query vectors
+        k: Neighbours per query
+        space: Distance space "l2", "cosine" or "ip"
+
+    Returns:
+        Integer array of shape (len(queries), k), nearest first
+    """
+    if space == "cosine":
+        vectors = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        queries = queries / np.linalg.norm(queries, axis=1, keepdims=True)
+    if space == "l2":
+        scores = (
+            (queries**2).sum(axis=1)[:, None]
+            - 2 * queries @ vectors.T
+            + (vectors**2).sum(axis=1)[None, :]
+        )
+    else:
+        scores = -(queries @ vectors.T)
+    nearest = np.argpartition(scores, k - 1, axis=1)[:, :k]
+    order = np.take_along_axis(scores, nearest, axis=1).argsort(axis=1)
+    return np.take_along_axis(nearest, order, axis=1)
+
+
+def recall_at_k(found: List[List[str]], truth: np.ndarray) -> float:
+    """
+    Mean fraction of the exact neighbours that a search found.
+
+    Args:
+        found: Result IDs per query (row numbers as strings)
+        truth: Exact neighbour rows per query
+
+    Returns:
+        Recall@k in [0, 1]
+    """
+    hits = sum(
+        len({int(doc_id) for doc_id in ids} & set(expected.tolist()))
+        for ids, expected in zip(found, truth)
+    )
+    return hits / truth.size
+
+
+def build_collection(
+    vectors: np.ndarray,
+    data_dir: str,
+    quantization: str = "none",
+    seed: int = 0,
+) -> HNSWStore:
+    """
+    Index vectors into an HNSW collection, reusing a previously built one.
+
+    Documents are stored with their row number as ID.
+
+    Args:
+        vectors: Vectors to index
+        data_dir: Directory for the benchmark collections
+        quantization: "none" or "int8"
+        seed: Seed the vectors were generated with (part of the name)
+
+    Returns:
+        HNSW store holding the vectors
+
+    Raises:
+        HNSWStoreError: If hnswlib is not installed
+    """
+    n, dimensions = vectors.shape
+    store = HNSWStore(
+        collection_name=f"bench_{n}_{dimensions}_{seed}_{quantization}",
+        persist_directory=Path(data_dir),
+        space="cosine",
+        quantization=quantization,
+    )
+    if store.count() == n:
+        logger.info(f"Reusing {quantization} collection of {n} vectors")
+        return store
+    if store.count():
+        store.reset()
+    start = time.perf_counter()
+    for first in range(0, n, INDEX_BATCH_SIZE):
+        batch = vectors[first : first + INDEX_BATCH_SIZE]
+        store.add_documents(
+            [Document(page_content="") for _ in batch],
+            batch.tolist(),
+            ids=[str(row) for row in range(first, first + len(batch))],
+        )
+    logger.info(
+        f"Indexed {n} vectors ({quantization}) in {time.perf_counter() - start:.1f}s"
+    )
+    return store
+
+
+def measure(
+    store: HNSWStore, queries: np.ndarray, truth: np.ndarray, k: int
+) -> Dict[str, Any]:
+    """
+    Run queries against a store and measure recall and latency.
+
+    Args:
+        store: Indexed store
+        queries: Query vectors
+        truth: Exact neighbour rows per query
+        k: Results per query
+
+    Returns:
+        Metrics dictionary
+    """
+    found = []
+    latencies = []
+    wall_start = time.perf_counter()
+    for query in queries:
+        start = time.perf_counter()
+        results = store.query_by_embedding(query.tolist(), n_results=k)
+        latencies.append((time.perf_counter() - start) * 1000)
+        found.append(results["ids"])
+    wall_seconds = time.perf_counter() - wall_start
+    metrics: Dict[str, Any] = {"recall": round(recall_at_k(found, truth), 4)}
+    metrics.update(latency_summary(latencies))
+    metrics["qps"] = round(len(queries) / wall_seconds, 3)
+    return metrics
+
+
+def benchmark_size(
+    n: int,
+    dimensions: int,
+    queries: np.ndarray,
+    k: int,
+    ef_search_values: List[int],
+    rescore_factors: List[int],
+    data_dir: str,
+    seed: int = 0,
+) -> List[Dict[str, Any]]:
+    """
+    Benchmark float16 and int8 HNSW search over one collection size.
+
+    Args:
+        n: Number of indexed vectors
+        dimensions: Vector dimensions
+        queries: Query vectors
+        k: Results per query
+        ef_search_values: Search candidate list sizes to measure
+        rescore_factors: Candidates per result rescored in int8 search
+        data_dir: Directory for the benchmark collections
+        seed: Vector seed
+
+    Returns:
+        Result entries
+    """
+    vectors = embedding_vectors(n, dimensions, seed=seed)
+    truth = exact_neighbours(vectors, queries, k)
+    float32_mb = round(n * dimensions * 4 / _BYTES_PER_MB, 3)
+    results = []
+    for quantization in ("none", "int8"):
+        store = build_collection(vectors, data_dir, quantization, seed=seed)
+        bytes_per_value = 1 if quantization == "int8" else 2
+        vector_mb = round(n * dimensions * bytes_per_value / _BYTES_PER_MB, 3)
+        factors = rescore_factors if quantization == "int8" else [1]
+        for ef_search in ef_search_values:
+            for factor in factors:
+                store.ef_search = ef_search
+                store.rescore_factor = factor
+                measure(store, queries[: min(10, len(queries))], truth, k)  # warmup
+                metrics = measure(store, queries, truth, k)
+                metrics["vector_mb"] = vector_mb
+                name = f"ef{ef_search}@{n}"
+                if quantization == "int8":
+                    name = f"int8x{factor}-{name}"
+                results.append(
+                    {
+                        "name": name,
+                        "quantization": quantization,
+                        "ef_search": ef_search,
+                        "rescore_factor": factor,
+                        "vectors": n,
+                        "float32_mb": float32_mb,
+                        "metrics": metrics,
+                    }
+                )
+                print(
+                    f"{name}: recall@{k}={metrics['recall']} "
+                    f"p50={metrics['p50_ms']}ms p99={metrics['p99_ms']}ms "
+                    f"vectors={vector_mb}MB (float32: {float32_mb}MB)",
+                    flush=True,
+                )
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark and write the result document."""
+    parser = argparse.ArgumentParser(
+        description=(
+            "Benchmark HNSW recall and latency per ef_search, with and without "
+            "int8 quantization"
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=DEFAULT_SIZES,
+        help="Collection sizes in vectors (default: 10000 100000)",
+    )
+    parser.add_argument(
+        "--dimensions", type=int, default=384, help="Embedding dimensions"
+    )
+    parser.add_argument("--queries", type=int, default=200, help="Measured queries")
+    parser.add_argument("--k", type=int, default=10, help="Results per query")
+    parser.add_argument(
+        "--ef-search",
+        type=int,
+        nargs="+",
+        default=DEFAULT_EF_SEARCH,
+        help="Search candidate list sizes (default: 16 32 64 128)",
+    )
+    parser.add_argument(
+        "--rescore-factors",
+        type=int,
+        nargs="+",
+        default=DEFAULT_RESCORE_FACTORS,
+        help="Candidates per result rescored in int8 search (default: 1 2 4)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Vector seed")
+    parser.add_argument(
+        "--data-dir",
+        default="./data/benchmarks/vector_search",
+        help="Directory for the benchmark collections",
+    )
+    parser.add_argument(
+        "--output",
+        default="./data/benchmarks/vector_search.json",
+        help="Result file",
+    )
+    parser.add_argument("--baseline", help="Baseline result file to compare with")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.10,
+        help="Allowed relative change against the baseline (default: 0.10)",
+    )
+    parser.add_argument("--log-level", default="WARNING", help="Log level")
+    args = parser.parse_args(argv)
+
+    setup_logging(log_level=args.log_level)
+    queries = embedding_vectors(args.queries, args.dimensions, seed=args.seed + 1)
+    results = []
+    try:
+        for size in args.sizes:
+            results.extend(
+                benchmark_size(
+                    size,
+                    args.dimensions,
+                    queries,
+                    args.k,
+                    args.ef_search,
+                    args.rescore_factors,
+                    args.data_dir,
+                    seed=args.seed,
+                )
+            )
+    except (BenchmarkError, HNSWStoreError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    settings = {
+        key: value
+        for key, value in vars(args).items()
+        if key not in ("output", "baseline", "log_level")
+    }
+    report = build_report("vector_search", settings, results)
+    output = write_report(report, args.output)
+    print()
+    print_report(report)
+    print(f"\nResults written to {output}")
+
+    if args.baseline:
+        try:
+            regressions = compare_reports(
+                report, load_report(args.baseline), args.tolerance
+            )
+        except BenchmarkError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 2
+        if regressions:
+            print(f"{len(regressions)} regression(s) beyond {args.tolerance:.0%}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print(f"No regressions beyond {args.tolerance:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
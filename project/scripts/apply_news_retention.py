@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Apply the news retention policy to the weekly news partitions.
+
+Rolls up news partitions older than the retention period into daily trend
+aggregates and weekly summaries, archives them if requested, and drops
+them. Requires NEWS_PARTITIONING=true. The news monitor runs the same job
+daily; this script is for cron jobs and one-off cleanups.
+
+Usage:
+    python scripts/apply_news_retention.py --list
+    python scripts/apply_news_retention.py --dry-run
+    python scripts/apply_news_retention.py --weeks 8 --action archive
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+# Imports after sys.path modification (required for scripts)
+from app.analysis.news_retention import (  # noqa: E402
+    NewsRetentionError,
+    NewsRetentionManager,
+)
+from app.utils.logger import get_logger  # noqa: E402
+from app.vector_db import create_vector_store  # noqa: E402
+from app.vector_db.partitioned_store import partition_bounds  # noqa: E402
+
+logger = get_logger(__name__)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Expire old news partitions."""
+    parser = argparse.ArgumentParser(
+        description="Roll up, archive and drop expired news partitions"
+    )
+    parser.add_argument(
+        "--collection",
+        default="documents",
+        help="Vector store collection name (default: documents)",
+    )
+    parser.add_argument(
+        "--weeks",
+        type=int,
+        help="Weeks of raw news to keep (default: NEWS_RETENTION_WEEKS)",
+    )
+    parser.add_argument(
+        "--action",
+        choices=["drop", "archive"],
+        help="Drop or archive expired partitions (default: NEWS_RETENTION_ACTION)",
+    )
+    parser.add_argument(
+        "--archive-dir",
+        help="Archive directory (default: NEWS_ARCHIVE_DIR)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only list the partitions that would expire",
+    )
+    parser.add_argument(
+        "--list",
+        action="store_true",
+        help="List the partitions and their document counts",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        manager = NewsRetentionManager(
+            create_vector_store(collection_name=args.collection),
+            retention_weeks=args.weeks,
+            action=args.action,
+            archive_dir=args.archive_dir,
+        )
+
+        if args.list:
+            for partition in manager.partitions.partitions():
+                start, _ = partition_bounds(partition)
+                count = manager.partitions.shards[partition].count()
+                print(f"{partition}  week of {start.date()}  {count} chunks")
+            return 0
+
+        expired = manager.apply_retention(dry_run=args.dry_run)
+    except NewsRetentionError as e:
+        logger.error(str(e))
+        return 1
+
+    verb = "Would expire" if args.dry_run else "Expired"
+    if expired:
+        print(f"{verb} {len(expired)} partitions: {', '.join(expired)}")
+    else:
+        print("No partitions older than the retention period")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -66,6 +66,11 @@ def main():
         action="store_true",
         help="Store fetched data in ChromaDB (default: False, just fetch and display)",
     )
+    parser.add_argument(
+        "--refetch",
+        action="store_true",
+        help="With --store, also re-fetch communications that were already ingested",
+    )
 
     args = parser.parse_args()
 
@@ -93,6 +98,7 @@ def main():
                 end_date=args.end_date,
                 limit=args.limit,
                 store_embeddings=True,
+                only_new=not args.refetch,
             )
             logger.info(f"Successfully stored {len(ids)} chunks in ChromaDB")
             print(f"\n✅ Stored {len(ids)} document chunks in ChromaDB")
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Script to profile module import time (startup cost) of the application.
+
+Runs ``python -X importtime -c "import <module>"`` in a fresh interpreter and
+reports the per-module breakdown, sorted by cumulative or self time. Exits
+with a non-zero status when the total import time exceeds a budget, so it can
+be used as a CI gate.
+
+Usage:
+    python scripts/profile_startup.py
+    python scripts/profile_startup.py --module app.ingestion.pipeline --top 40
+    python scripts/profile_startup.py --sort self --filter app.
+    python scripts/profile_startup.py --budget-ms 1500
+    python scripts/profile_startup.py --json
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import List, Optional
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+DEFAULT_MODULE = "app.api.main"
+
+# "import time:  self [us] | cumulative | imported package"
+_IMPORTTIME_LINE = re.compile(
+    r"^import time:\s+(?P<self>\d+)\s+\|\s+(?P<cumulative>\d+)\s+\|(?P<name>.*)$"
+)
+
+
+class StartupProfileError(Exception):
+    """Custom exception for startup profiling errors."""
+
+    pass
+
+
+@dataclass
+class ImportTiming:
+    """Import timing for a single module."""
+
+    module: str
+    self_ms: float
+    cumulative_ms: float
+    depth: int
+
+
+@dataclass
+class StartupProfile:
+    """Import timing breakdown for one top-level module."""
+
+    module: str
+    total_ms: float
+    timings: List[ImportTiming]
+
+    def top(
+        self, n: int = 25, sort_by: str = "cumulative", prefix: Optional[str] = None
+    ) -> List[ImportTiming]:
+        """
+        Return the N most expensive module imports.
+
+        Args:
+            n: Number of entries to return
+            sort_by: 'cumulative' or 'self'
+            prefix: Only include modules starting with this prefix
+
+        Returns:
+            List of ImportTiming sorted by the requested time, descending
+        """
+        key = "cumulative_ms" if sort_by == "cumulative" else "self_ms"
+        timings = self.timings
+        if prefix:
+            timings = [t for t in timings if t.module.startswith(prefix)]
+        return sorted(timings, key=lambda t: getattr(t, key), reverse=True)[:n]
+
+
+def parse_importtime(output: str) -> List[ImportTiming]:
+    """
+    Parse ``-X importtime`` stderr output.
+
+    Args:
+        output: Raw stderr of a ``python -X importtime`` run
+
+    Returns:
+        List of ImportTiming in the order modules finished importing
+    """
+    timings = []
+    for line in output.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        raw_name = match.group("name")
+        name = raw_name.strip()
+        # Nesting is encoded as two spaces per level after the separator
+        depth = (len(raw_name) - len(raw_name.lstrip(" ")) - 1) // 2
+        timings.append(
+            ImportTiming(
+                module=name,
+                self_ms=int(match.group("self")) / 1000.0,
+                cumulative_ms=int(match.group("cumulative")) / 1000.0,
+                depth=depth,
+            )
+        )
+    return timings
+
+
+def profile_import(
+    module: str = DEFAULT_MODULE, python: str = sys.executable, timeout: int = 300
+) -> StartupProfile:
+    """
+    Import a module in a fresh interpreter and collect import timings.
+
+    Args:
+        module: Module to import (e.g. 'app.api.main')
+        python: Python interpreter to use
+        timeout: Subprocess timeout in seconds
+
+    Returns:
+        StartupProfile for the module
+
+    Raises:
+        StartupProfileError: If the import fails
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (str(project_root), env.get("PYTHONPATH", "")) if p
+    )
+    result = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {module}"],
+        cwd=str(project_root),
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+    )
+    if result.returncode != 0:
+        raise StartupProfileError(
+            f"Importing {module} failed (exit {result.returncode}):\n"
+            f"{result.stderr[-2000:]}"
+        )
+
+    timings = parse_importtime(result.stderr)
+    # The requested module is the last top-level entry to finish importing
+    total_ms = max((t.cumulative_ms for t in timings if t.depth == 0), default=0.0)
+    return StartupProfile(module=module, total_ms=total_ms, timings=timings)
+
+
+def format_report(profile: StartupProfile, top_entries: List[ImportTiming]) -> str:
+    """
+    Format a human-readable import time report.
+
+    Args:
+        profile: Startup profile
+        top_entries: Entries to list
+
+    Returns:
+        Report text
+    """
+    lines = [
+        f"Import time for {profile.module}: {profile.total_ms:.1f} ms "
+        f"({len(profile.timings)} modules)",
+        "",
+        f"{'cumulative ms':>14} {'self ms':>10}  module",
+    ]
+    for timing in top_entries:
+        lines.append(
+            f"{timing.cumulative_ms:>14.1f} {timing.self_ms:>10.1f}  {timing.module}"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    """Main function to profile application import time."""
+    parser = argparse.ArgumentParser(
+        description="Report per-module import time for an application module"
+    )
+    parser.add_argument(
+        "--module",
+        default=DEFAULT_MODULE,
+        help=f"Module to import (default: {DEFAULT_MODULE})",
+    )
+    parser.add_argument(
+        "--top", type=int, default=25, help="Number of modules to list (default: 25)"
+    )
+    parser.add_argument(
+        "--sort",
+        choices=["cumulative", "self"],
+        default="cumulative",
+        help="Sort by cumulative or self time (default: cumulative)",
+    )
+    parser.add_argument(
+        "--filter", default=None, help="Only list modules with this prefix"
+    )
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=None,
+        help="Fail (exit 1) if total import time exceeds this budget",
+    )
+    parser.add_argument("--json", action="store_true", help="Output JSON")
+    args = parser.parse_args()
+
+    try:
+        profile = profile_import(args.module)
+    except StartupProfileError as e:
+        print(f"Error: {str(e)}", file=sys.stderr)
+        sys.exit(2)
+
+    top_entries = profile.top(args.top, sort_by=args.sort, prefix=args.filter)
+    over_budget = args.budget_ms is not None and profile.total_ms > args.budget_ms
+
+    if args.json:
+        print(
+            json.dumps(
+                {
+                    "module": profile.module,
+                    "total_ms": profile.total_ms,
+                    "budget_ms": args.budget_ms,
+                    "over_budget": over_budget,
+                    "top": [asdict(t) for t in top_entries],
+                },
+                indent=2,
+            )
+        )
+    else:
+        print(format_report(profile, top_entries))
+        if args.budget_ms is not None:
+            status = "OVER BUDGET" if over_budget else "within budget"
+            print(f"\nBudget: {args.budget_ms:.1f} ms ({status})")
+
+    if over_budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,473 @@
+#!/usr/bin/env python3
+"""
+Tune the HNSW index settings of a ChromaDB collection.
+
+Measures recall@k against exact brute-force search and query latency for a
+grid of index settings (distance space, M, construction ef, search ef) and
+prints the Pareto frontier of latency vs recall. Trial indexes are built in
+a temporary directory from the collection's stored embeddings; the
+collection itself is only changed with --rebuild, which rebuilds it with
+the recommended settings (the fastest frontier point reaching
+--target-recall).
+
+Queries are real questions from --queries-file, embedded with the
+configured embedding provider, or by default stored chunk embeddings held
+out of the trial indexes.
+
+Usage:
+    python scripts/tune_vector_index.py
+    python scripts/tune_vector_index.py --queries-file questions.txt --k 10
+    python scripts/tune_vector_index.py --m 8 16 32 --ef-search 10 20 40 80
+    python scripts/tune_vector_index.py --target-recall 0.98 --rebuild
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from chromadb.api.client import SharedSystemClient
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.utils.logger import get_logger, setup_logging  # noqa: E402
+from app.vector_db import ChromaStore, ChromaStoreError  # noqa: E402
+from benchmarks.harness import latency_summary  # noqa: E402
+from benchmarks.vector_search import exact_neighbours, recall_at_k  # noqa: E402
+
+logger = get_logger(__name__)
+
+# Embeddings fetched or indexed per call
+BATCH_SIZE = 1000
+
+
+def load_queries_from_file(filepath: str) -> List[str]:
+    """Load queries from a text file (one per line)."""
+    with open(filepath, "r") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def load_embeddings(store: ChromaStore, sample_size: int, seed: int = 0) -> np.ndarray:
+    """
+    Load a random sample of the collection's stored embeddings.
+
+    Args:
+        store: Collection to sample
+        sample_size: Maximum number of embeddings (0 = all)
+        seed: Random seed
+
+    Returns:
+        Float32 array of shape (rows, dimensions)
+    """
+    ids = store.collection.get(include=[])["ids"]  # type: ignore[union-attr]
+    if sample_size and len(ids) > sample_size:
+        rng = np.random.default_rng(seed)
+        rows = rng.choice(len(ids), sample_size, replace=False)
+        ids = [ids[row] for row in sorted(rows)]
+    batches = []
+    for first in range(0, len(ids), BATCH_SIZE):
+        batch = store.collection.get(  # type: ignore[union-attr]
+            ids=ids[first : first + BATCH_SIZE], include=["embeddings"]
+        )
+        batches.append(np.asarray(batch["embeddings"], dtype=np.float32))
+    if not batches:
+        return np.empty((0, 0), dtype=np.float32)
+    return np.concatenate(batches)
+
+
+def split_queries(
+    vectors: np.ndarray, n_queries: int, seed: int = 0
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Hold out stored embeddings as queries.
+
+    Args:
+        vectors: Stored embeddings
+        n_queries: Number of held-out queries
+        seed: Random seed
+
+    Returns:
+        Tuple of (indexed vectors, query vectors)
+    """
+    rows = np.random.default_rng(seed).choice(
+        len(vectors), min(n_queries, len(vectors) // 10), replace=False
+    )
+    held_out = np.zeros(len(vectors), dtype=bool)
+    held_out[rows] = True
+    return vectors[~held_out], vectors[held_out]
+
+
+def open_trial_index(
+    directory: Path,
+    space: str,
+    m: int,
+    ef_construction: int,
+    ef_search: Optional[int] = None,
+) -> ChromaStore:
+    """
+    Open (or create) the trial collection for a setting in a fresh client.
+
+    ChromaDB keeps loaded indexes per process and only applies a changed
+    search ef when an index is loaded, so every search ef is measured on a
+    newly opened collection.
+
+    Args:
+        directory: Directory for the trial collections
+        space: Distance space
+        m: Neighbours per HNSW node
+        ef_construction: Candidate list size while inserting
+        ef_search: Candidate list size while searching (default: config)
+
+    Returns:
+        Trial store
+    """
+    SharedSystemClient.clear_system_cache()
+    return ChromaStore(
+        collection_name=f"tune_{space}_m{m}_efc{ef_construction}",
+        persist_directory=directory,
+        space=space,
+        m=m,
+        ef_construction=ef_construction,
+        ef_search=ef_search,
+    )
+
+
+def build_trial_index(
+    vectors: np.ndarray,
+    directory: Path,
+    space: str,
+    m: int,
+    ef_construction: int,
+) -> Tuple[ChromaStore, float]:
+    """
+    Index vectors into a trial collection with the given settings.
+
+    Documents are stored with their row number as ID and no text.
+
+    Args:
+        vectors: Vectors to index
+        directory: Directory for the trial collections
+        space: Distance space
+        m: Neighbours per HNSW node
+        ef_construction: Candidate list size while inserting
+
+    Returns:
+        Tuple of (store, build seconds)
+    """
+    store = open_trial_index(directory, space, m, ef_construction)
+    start = time.perf_counter()
+    for first in range(0, len(vectors), BATCH_SIZE):
+        batch = vectors[first : first + BATCH_SIZE]
+        store.collection.add(  # type: ignore[union-attr]
+            ids=[str(row) for row in range(first, first + len(batch))],
+            embeddings=batch,
+        )
+    return store, time.perf_counter() - start
+
+
+def measure(
+    store: ChromaStore, queries: np.ndarray, truth: np.ndarray, k: int
+) -> Dict[str, Any]:
+    """
+    Run queries against a trial index and measure recall and latency.
+
+    Args:
+        store: Trial index
+        queries: Query vectors
+        truth: Exact neighbour rows per query
+        k: Results per query
+
+    Returns:
+        Metrics dictionary
+    """
+    found = []
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        results = store.query_by_embedding(query.tolist(), n_results=k)
+        latencies.append((time.perf_counter() - start) * 1000)
+        found.append(results["ids"])
+    metrics: Dict[str, Any] = {"recall": round(recall_at_k(found, truth), 4)}
+    metrics.update(latency_summary(latencies))
+    return metrics
+
+
+def evaluate_grid(
+    vectors: np.ndarray,
+    queries: np.ndarray,
+    k: int,
+    spaces: List[str],
+    m_values: List[int],
+    ef_construction_values: List[int],
+    ef_search_values: List[int],
+    directory: Path,
+) -> List[Dict[str, Any]]:
+    """
+    Measure every combination of index settings.
+
+    One trial index is built per (space, M, construction ef) and reopened
+    with each search ef.
+
+    Args:
+        vectors: Vectors to index
+        queries: Query vectors
+        k: Results per query
+        spaces: Distance spaces
+        m_values: Neighbours per HNSW node
+        ef_construction_values: Candidate list sizes while inserting
+        ef_search_values: Candidate list sizes while searching
+        directory: Directory for the trial collections
+
+    Returns:
+        One point per setting with its metrics
+    """
+    points = []
+    for space in spaces:
+        truth = exact_neighbours(vectors, queries, k, space=space)
+        for m in m_values:
+            for ef_construction in ef_construction_values:
+                store, build_seconds = build_trial_index(
+                    vectors, directory, space, m, ef_construction
+                )
+                for ef_search in ef_search_values:
+                    store = open_trial_index(
+                        directory, space, m, ef_construction, ef_search
+                    )
+                    measure(store, queries[: min(10, len(queries))], truth, k)
+                    point = {
+                        "space": space,
+                        "m": m,
+                        "ef_construction": ef_construction,
+                        "ef_search": ef_search,
+                        "build_seconds": round(build_seconds, 3),
+                    }
+                    point.update(measure(store, queries, truth, k))
+                    points.append(point)
+                    print(
+                        f"space={space} m={m} ef_construction={ef_construction} "
+                        f"ef_search={ef_search}: recall@{k}={point['recall']} "
+                        f"p50={point['p50_ms']}ms",
+                        flush=True,
+                    )
+                store.delete_collection()
+    return points
+
+
+def pareto_frontier(
+    points: List[Dict[str, Any]], latency: str = "p50_ms"
+) -> List[Dict[str, Any]]:
+    """
+    Select the settings no other setting beats on both latency and recall.
+
+    Args:
+        points: Measured settings
+        latency: Latency metric to trade off against recall
+
+    Returns:
+        Frontier points, fastest first
+    """
+    frontier = []
+    best_recall = -1.0
+    for point in sorted(points, key=lambda p: (p[latency], -p["recall"])):
+        if point["recall"] > best_recall:
+            frontier.append(point)
+            best_recall = point["recall"]
+    return frontier
+
+
+def recommend(
+    frontier: List[Dict[str, Any]], target_recall: float
+) -> Optional[Dict[str, Any]]:
+    """
+    Pick the fastest frontier point reaching the target recall.
+
+    Args:
+        frontier: Pareto frontier, fastest first
+        target_recall: Minimum recall@k
+
+    Returns:
+        Recommended point, the most accurate one if none reaches the
+        target, or None for an empty frontier
+    """
+    for point in frontier:
+        if point["recall"] >= target_recall:
+            return point
+    return frontier[-1] if frontier else None
+
+
+def print_frontier(frontier: List[Dict[str, Any]], k: int) -> None:
+    """Print the Pareto frontier as a table."""
+    print(f"\nPareto frontier (p50 latency vs recall@{k}):")
+    print(
+        f"  {'space':<7} {'m':>4} {'ef_constr':>9} {'ef_search':>9} "
+        f"{'recall':>7} {'p50_ms':>8} {'p99_ms':>8} {'build_s':>8}"
+    )
+    for point in frontier:
+        print(
+            f"  {point['space']:<7} {point['m']:>4} {point['ef_construction']:>9} "
+            f"{point['ef_search']:>9} {point['recall']:>7.4f} "
+            f"{point['p50_ms']:>8.3f} {point['p99_ms']:>8.3f} "
+            f"{point['build_seconds']:>8.1f}"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Tune the index settings and optionally rebuild the collection."""
+    parser = argparse.ArgumentParser(
+        description="Tune the HNSW index settings of a ChromaDB collection",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--collection",
+        type=str,
+        default="documents",
+        help="ChromaDB collection name (default: documents)",
+    )
+    parser.add_argument(
+        "--persist-directory",
+        type=Path,
+        help="ChromaDB directory (default: config CHROMA_DB_DIR)",
+    )
+    parser.add_argument(
+        "--sample-size",
+        type=int,
+        default=20_000,
+        help="Stored embeddings indexed per trial, 0 = all (default: 20000)",
+    )
+    parser.add_argument("--queries", type=int, default=200, help="Measured queries")
+    parser.add_argument(
+        "--queries-file",
+        type=str,
+        help="Real questions (one per line) instead of held-out chunks",
+    )
+    parser.add_argument("--k", type=int, default=10, help="Results per query")
+    parser.add_argument(
+        "--spaces",
+        nargs="+",
+        choices=["l2", "cosine", "ip"],
+        help="Distance spaces (default: the collection's)",
+    )
+    parser.add_argument(
+        "--m", type=int, nargs="+", default=[8, 16, 32], help="Neighbours per node"
+    )
+    parser.add_argument(
+        "--ef-construction",
+        type=int,
+        nargs="+",
+        default=[100, 200],
+        help="Candidate list sizes while inserting (default: 100 200)",
+    )
+    parser.add_argument(
+        "--ef-search",
+        type=int,
+        nargs="+",
+        default=[10, 20, 40, 80, 160],
+        help="Candidate list sizes while searching (default: 10 20 40 80 160)",
+    )
+    parser.add_argument(
+        "--target-recall",
+        type=float,
+        default=0.95,
+        help="Recall@k the recommended settings must reach (default: 0.95)",
+    )
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Rebuild the collection with the recommended settings",
+    )
+    parser.add_argument("--output", type=str, help="Write all points as JSON")
+    parser.add_argument("--seed", type=int, default=0, help="Sampling seed")
+    parser.add_argument("--log-level", default="WARNING", help="Log level")
+    args = parser.parse_args(argv)
+
+    setup_logging(log_level=args.log_level)
+    try:
+        store = ChromaStore(
+            collection_name=args.collection,
+            persist_directory=args.persist_directory,
+        )
+        current = store.index_settings()
+        print(f"Collection '{args.collection}': {store.count()} documents, {current}")
+        vectors = load_embeddings(store, args.sample_size, seed=args.seed)
+    except ChromaStoreError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    if args.queries_file:
+        from app.rag.embedding_factory import EmbeddingGenerator
+
+        questions = load_queries_from_file(args.queries_file)[: args.queries]
+        generator = EmbeddingGenerator()
+        queries = np.asarray(
+            [generator.embed_query(question) for question in questions],
+            dtype=np.float32,
+        )
+    else:
+        vectors, queries = split_queries(vectors, args.queries, seed=args.seed)
+    if len(vectors) <= args.k or not len(queries):
+        print(
+            f"Error: need more than {args.k} stored embeddings and at least one "
+            f"query (have {len(vectors)} and {len(queries)})",
+            file=sys.stderr,
+        )
+        return 2
+    if queries.shape[1] != vectors.shape[1]:
+        print(
+            f"Error: query embeddings have {queries.shape[1]} dimensions, the "
+            f"collection {vectors.shape[1]}; use the collection's embedding "
+            f"provider",
+            file=sys.stderr,
+        )
+        return 2
+    print(f"Indexing {len(vectors)} embeddings, measuring {len(queries)} queries\n")
+
+    with tempfile.TemporaryDirectory(prefix="tune_vector_index_") as directory:
+        points = evaluate_grid(
+            vectors,
+            queries,
+            args.k,
+            args.spaces or [current["space"]],
+            args.m,
+            args.ef_construction,
+            args.ef_search,
+            Path(directory),
+        )
+    frontier = pareto_frontier(points)
+    print_frontier(frontier, args.k)
+    if args.output:
+        Path(args.output).write_text(
+            json.dumps({"points": points, "frontier": frontier}, indent=2)
+        )
+        print(f"\nResults written to {args.output}")
+
+    chosen = recommend(frontier, args.target_recall)
+    if chosen is None:
+        return 1
+    if chosen["recall"] < args.target_recall:
+        print(f"\nNo setting reaches recall@{args.k} >= {args.target_recall}")
+    settings = {
+        key: chosen[key] for key in ("space", "m", "ef_construction", "ef_search")
+    }
+    print(f"\nRecommended: {settings}")
+    print("Configuration (.env):")
+    for key, value in settings.items():
+        print(f"  CHROMA_HNSW_{key.upper()}={value}")
+
+    if args.rebuild:
+        try:
+            copied = store.rebuild(**settings)
+        except ChromaStoreError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 2
+        print(f"\nRebuilt '{args.collection}' ({copied} documents) with {settings}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -225,3 +225,84 @@ def reset_paths():
         sys.path.insert(0, str(project_root))
     yield
     # Cleanup if needed
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_rate_limiters():
+    """Give each test fresh shared rate limiters.
+
+    Tests patch time.sleep, so limiter reservations made in one test would
+    otherwise turn into real waits in the next.
+    """
+    from app.utils.rate_limiter import reset_rate_limiters
+
+    reset_rate_limiters()
+    yield
+    reset_rate_limiters()
+
+
+@pytest.fixture(autouse=True)
+def isolated_http_cache(tmp_path, monkeypatch):
+    """Point the shared HTTP response cache at a per-test directory."""
+    from app.utils.config import config
+
+    monkeypatch.setattr(config, "http_cache_dir", str(tmp_path / "http_cache"))
+    monkeypatch.setattr(config, "http_cache_mode", "normal")
+
+
+@pytest.fixture(autouse=True)
+def isolated_company_directory(tmp_path, monkeypatch):
+    """Give each test a fresh SEC company directory in a per-test file."""
+    from app.ingestion.sec_company_directory import reset_company_directory
+    from app.utils.config import config
+
+    monkeypatch.setattr(
+        config,
+        "sec_company_directory_path",
+        str(tmp_path / "sec" / "company_tickers.json"),
+    )
+    reset_company_directory()
+    yield
+    reset_company_directory()
+
+
+@pytest.fixture(autouse=True)
+def isolated_xbrl_fact_store(tmp_path, monkeypatch):
+    """Point the XBRL fact store at a per-test database."""
+    from app.utils.config import config
+
+    monkeypatch.setattr(
+        config, "xbrl_fact_store_path", str(tmp_path / "xbrl" / "xbrl_facts.db")
+    )
+
+
+@pytest.fixture(autouse=True)
+def isolated_timeseries_store(tmp_path, monkeypatch):
+    """Point the time-series store at a per-test directory."""
+    from app.utils.config import config
+
+    monkeypatch.setattr(config, "timeseries_store_dir", str(tmp_path / "timeseries"))
+
+
+@pytest.fixture(autouse=True)
+def isolated_news_summary_cache(tmp_path, monkeypatch):
+    """Point the news summary cache at a per-test database."""
+    from app.utils.config import config
+
+    monkeypatch.setattr(
+        config,
+        "news_summarization_cache_path",
+        str(tmp_path / "news" / "summary_cache.db"),
+    )
+
+
+@pytest.fixture(autouse=True)
+def isolated_central_bank_index(tmp_path, monkeypatch):
+    """Point the central bank communication index at a per-test database."""
+    from app.utils.config import config
+
+    monkeypatch.setattr(
+        config,
+        "central_bank_index_path",
+        str(tmp_path / "central_bank" / "communications.db"),
+    )
@@ -0,0 +1,343 @@
+"""
+Tests for the offline benchmark suite.
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from benchmarks import compare, fixtures, ingestion, rag_query, vector_search
+from benchmarks.corpus import generate_queries, iter_corpus
+from benchmarks.fakes import FakeLLM, FakeReranker, HashEmbeddings
+from benchmarks.harness import (
+    BenchmarkError,
+    build_report,
+    compare_reports,
+    latency_summary,
+)
+
+
+class TestStandIns:
+    """Test the deterministic stand-ins and synthetic corpus."""
+
+    def test_hash_embeddings_are_deterministic_and_normalized(self):
+        """Test identical texts embed identically and vectors are unit length."""
+        embeddings = HashEmbeddings(dimensions=64)
+        first = embeddings.embed_query("Apple revenue in 2023")
+        second = embeddings.embed_documents(["Apple revenue in 2023"])[0]
+
+        assert first == second
+        assert len(first) == 64
+        assert np.linalg.norm(first) == pytest.approx(1.0, abs=1e-6)
+
+    def test_hash_embeddings_rank_overlapping_text_higher(self):
+        """Test texts sharing words are closer than unrelated texts."""
+        embeddings = HashEmbeddings()
+        query = np.array(embeddings.embed_query("Apple revenue growth"))
+        related = np.array(embeddings.embed_query("Apple reported revenue growth"))
+        unrelated = np.array(embeddings.embed_query("Boeing aircraft deliveries"))
+
+        assert query @ related > query @ unrelated
+
+    def test_fake_llm_returns_fixed_length_answer(self):
+        """Test the fake LLM answers with the configured number of tokens."""
+        llm = FakeLLM(response_tokens=5)
+
+        assert len(llm.invoke("What was revenue?").split()) == 5
+
+    def test_fake_reranker_scores_token_overlap(self):
+        """Test pairs sharing more query tokens score higher."""
+        scores = FakeReranker().predict(
+            [["apple revenue", "apple revenue rose"], ["apple revenue", "boeing"]]
+        )
+
+        assert scores == [1.0, 0.0]
+
+    def test_fixtures_match_fetcher_payloads(self):
+        """Test fixture fetchers replay deterministic, API-shaped payloads."""
+        payloads = fixtures.stock_data(3, seed=1)
+        fetcher = fixtures.FixtureYFinanceFetcher(payloads)
+
+        data = fetcher.fetch_bulk_data(["AAPL", "UNKNOWN"], include_history=False)
+
+        assert list(data) == ["AAPL"]
+        assert "history" not in data["AAPL"]
+        assert data["AAPL"]["info"]["longName"] == "Apple Inc."
+        assert fixtures.payload_size(fixtures.stock_data(3, seed=1)) == (
+            fixtures.payload_size(payloads)
+        )
+        assert fixtures.news_articles(2) == fixtures.news_articles(2)
+
+    def test_corpus_is_deterministic(self):
+        """Test corpora of different sizes share their common prefix."""
+        small = [doc for batch in iter_corpus(10, seed=3) for doc in batch]
+        large = [
+            doc for batch in iter_corpus(20, seed=3, batch_size=7) for doc in batch
+        ]
+
+        assert [d.page_content for d in small] == [d.page_content for d in large[:10]]
+        assert {d.metadata["type"] for d in large} <= {"edgar_filing", "news"}
+        assert generate_queries(5, seed=1) == generate_queries(5, seed=1)
+
+
+class TestResults:
+    """Test latency summaries and baseline comparison."""
+
+    def test_latency_summary(self):
+        """Test percentiles of a known distribution."""
+        summary = latency_summary(list(range(1, 101)))
+
+        assert summary["p50_ms"] == pytest.approx(50.5)
+        assert summary["p99_ms"] == pytest.approx(99.01)
+        assert summary["max_ms"] == 100
+
+        with pytest.raises(BenchmarkError):
+            latency_summary([])
+
+    def test_compare_reports(self):
+        """Test latency increases and throughput drops beyond tolerance regress."""
+        baseline = build_report(
+            "rag_query",
+            {},
+            [
+                {"name": "basic@10", "metrics": {"p95_ms": 10.0, "qps": 100.0}},
+                {"name": "hybrid@10", "metrics": {"p95_ms": 20.0, "qps": 50.0}},
+            ],
+        )
+        current = build_report(
+            "rag_query",
+            {},
+            [
+                {"name": "basic@10", "metrics": {"p95_ms": 10.5, "qps": 80.0}},
+                {"name": "hybrid@10", "metrics": {"p95_ms": 30.0, "qps": 60.0}},
+                {"name": "rerank@10", "metrics": {"p95_ms": 99.0}},
+            ],
+        )
+
+        regressions = compare_reports(current, baseline, tolerance=0.10)
+
+        assert [(r.result, r.metric) for r in regressions] == [
+            ("basic@10", "qps"),
+            ("hybrid@10", "p95_ms"),
+        ]
+        assert regressions[1].change == pytest.approx(0.5)
+
+    def test_compare_cli_exit_status(self, tmp_path):
+        """Test the comparator exits with 1 on regressions."""
+        baseline = tmp_path / "baseline.json"
+        results = tmp_path / "results.json"
+        baseline.write_text(
+            json.dumps({"results": [{"name": "a", "metrics": {"p50_ms": 1.0}}]})
+        )
+        results.write_text(
+            json.dumps({"results": [{"name": "a", "metrics": {"p50_ms": 2.0}}]})
+        )
+
+        assert compare.main([str(results), str(baseline)]) == 1
+        assert compare.main([str(baseline), str(baseline)]) == 0
+        assert compare.main([str(tmp_path / "missing.json"), str(baseline)]) == 2
+
+    def test_memory_regresses_when_it_grows(self):
+        """Test metrics ending in _mb are lower-is-better."""
+        baseline = build_report(
+            "ingestion", {}, [{"name": "news@5", "metrics": {"peak_rss_mb": 100.0}}]
+        )
+        current = build_report(
+            "ingestion", {}, [{"name": "news@5", "metrics": {"peak_rss_mb": 150.0}}]
+        )
+
+        regressions = compare_reports(current, baseline)
+
+        assert [r.metric for r in regressions] == ["peak_rss_mb"]
+
+
+class TestRagQueryBenchmark:
+    """Test the RAG query benchmark end to end on a small corpus."""
+
+    def test_benchmark_run(self, tmp_path):
+        """Test every mode is measured and the index is reused on rerun."""
+        output = tmp_path / "results.json"
+        args = [
+            "--sizes",
+            "150",
+            "--queries",
+            "6",
+            "--warmup",
+            "1",
+            "--dimensions",
+            "32",
+            "--data-dir",
+            str(tmp_path / "chroma"),
+            "--output",
+            str(output),
+        ]
+
+        assert rag_query.main(args) == 0
+        report = json.loads(output.read_text())
+        assert [r["name"] for r in report["results"]] == [
+            "basic@150",
+            "hybrid@150",
+            "rerank@150",
+        ]
+        for result in report["results"]:
+            assert result["errors"] == 0
+            assert result["metrics"]["qps"] > 0
+            assert "llm" in result["stages_ms"]
+        assert "bm25" in report["results"][1]["stages_ms"]
+        assert "rerank" in report["results"][2]["stages_ms"]
+        assert report["results"][0]["index_seconds"] is not None
+
+        rerun = tmp_path / "rerun.json"
+        assert rag_query.main(
+            args[:-1] + [str(rerun), "--modes", "basic", "--baseline", str(output)]
+        ) in (0, 1)
+        assert json.loads(rerun.read_text())["results"][0]["index_seconds"] is None
+
+    def test_hnsw_backend(self, tmp_path):
+        """Test the benchmark runs against the HNSW backend."""
+        pytest.importorskip("hnswlib")
+        output = tmp_path / "hnsw.json"
+        args = [
+            "--backend",
+            "hnsw",
+            "--modes",
+            "basic",
+            "--sizes",
+            "150",
+            "--queries",
+            "4",
+            "--warmup",
+            "1",
+            "--dimensions",
+            "32",
+            "--data-dir",
+            str(tmp_path / "indexes"),
+            "--output",
+            str(output),
+        ]
+
+        assert rag_query.main(args) == 0
+        report = json.loads(output.read_text())
+        assert report["settings"]["backend"] == "hnsw"
+        assert report["results"][0]["errors"] == 0
+        assert (tmp_path / "indexes" / "hnsw" / "bench_150_0_32").is_dir()
+
+
+class TestIngestionBenchmark:
+    """Test the ingestion benchmark end to end on small fixtures."""
+
+    def test_benchmark_run(self, tmp_path):
+        """Test every processor is measured with a per-stage breakdown."""
+        output = tmp_path / "results.json"
+
+        assert (
+            ingestion.main(
+                [
+                    "--scale",
+                    "0.05",
+                    "--dimensions",
+                    "32",
+                    "--in-process",
+                    "--data-dir",
+                    str(tmp_path / "data"),
+                    "--output",
+                    str(output),
+                ]
+            )
+            == 0
+        )
+
+        report = json.loads(output.read_text())
+        assert [r["scenario"] for r in report["results"]] == list(
+            ingestion.DEFAULT_UNITS
+        )
+        for result in report["results"]:
+            assert result["chunks"] > 0
+            assert result["metrics"]["chunks_per_second"] > 0
+            assert result["metrics"]["mb_per_second"] > 0
+            assert {"chunk", "embed", "write"} <= set(result["stages_ms"])
+        assert "load" in report["results"][0]["stages_ms"]
+        assert {"fetch", "parse"} <= set(report["results"][1]["stages_ms"])
+        # Temporary fixture files and collections are removed
+        assert list((tmp_path / "data").iterdir()) == []
+
+    def test_unknown_scenario(self, tmp_path):
+        """Test unknown scenarios raise BenchmarkError."""
+        with pytest.raises(BenchmarkError):
+            ingestion.run_scenario("unknown", 1, str(tmp_path))
+
+
+class TestVectorSearchBenchmark:
+    """Test the vector search benchmark on a small collection."""
+
+    def test_exact_neighbours_and_recall(self):
+        """Test brute-force neighbours and recall@k."""
+        vectors = vector_search.embedding_vectors(50, 8)
+        truth = vector_search.exact_neighbours(vectors, vectors[:3], 4)
+
+        assert truth[:, 0].tolist() == [0, 1, 2]
+        found = [["0", "-1"], [str(truth[1, 1])], []]
+        assert vector_search.recall_at_k(found, truth[:, :2]) == pytest.approx(2 / 6)
+
+    def test_benchmark_run(self, tmp_path, monkeypatch):
+        """Test float16 and int8 results with recall and vector sizes."""
+        pytest.importorskip("hnswlib")
+        monkeypatch.setattr("app.vector_db.hnsw_store.QUANTIZER_MIN_ROWS", 100)
+        output = tmp_path / "results.json"
+
+        assert (
+            vector_search.main(
+                [
+                    "--sizes",
+                    "400",
+                    "--dimensions",
+                    "16",
+                    "--queries",
+                    "20",
+                    "--ef-search",
+                    "16",
+                    "64",
+                    "--rescore-factors",
+                    "1",
+                    "4",
+                    "--data-dir",
+                    str(tmp_path / "collections"),
+                    "--output",
+                    str(output),
+                ]
+            )
+            == 0
+        )
+        results = json.loads(output.read_text())["results"]
+        assert [r["name"] for r in results] == [
+            "ef16@400",
+            "ef64@400",
+            "int8x1-ef16@400",
+            "int8x4-ef16@400",
+            "int8x1-ef64@400",
+            "int8x4-ef64@400",
+        ]
+        assert results[1]["metrics"]["recall"] >= 0.9
+        assert results[5]["metrics"]["recall"] >= 0.9
+        assert results[1]["metrics"]["recall"] >= results[0]["metrics"]["recall"]
+        assert results[2]["metrics"]["vector_mb"] == (
+            results[0]["metrics"]["vector_mb"] / 2
+        )
+        assert results[0]["float32_mb"] == results[0]["metrics"]["vector_mb"] * 2
+
+    def test_missing_hnswlib(self, tmp_path, monkeypatch, capsys):
+        """Test the benchmark exits cleanly without hnswlib."""
+        monkeypatch.setattr(
+            "app.vector_db.hnsw_store.is_available", lambda *names: False
+        )
+        output = tmp_path / "results.json"
+
+        assert (
+            vector_search.main(
+                ["--sizes", "10", "--dimensions", "4", "--output", str(output)]
+            )
+            == 2
+        )
+        assert "hnswlib is required" in capsys.readouterr().err
+        assert not output.exists()
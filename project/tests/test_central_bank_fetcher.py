@@ -11,6 +11,15 @@ from app.ingestion.central_bank_fetcher import (
     CentralBankFetcher,
     CentralBankFetcherError,
 )
+from app.ingestion.central_bank_index import CommunicationIndex
+
+INDEX_HTML = """
+<html><body>
+    <a href="/monetarypolicy/fomcstatement20250129.htm">1/29/2025 Statement</a>
+    <a href="/monetarypolicy/fomcstatement20241218.htm">12/18/2024 Statement</a>
+    <a href="/monetarypolicy/fomcstatement20241218.htm">12/18/2024 (again)</a>
+</body></html>
+"""
 
 
 class TestCentralBankFetcher:
@@ -31,14 +40,15 @@ class TestCentralBankFetcher:
             assert fetcher.rate_limit_delay == 2.0
 
     def test_apply_rate_limit(self):
-        """Test rate limiting."""
+        """Test rate limiting is applied per host by the shared session."""
         fetcher = CentralBankFetcher(rate_limit_delay=0.01)
         import time
 
         start = time.time()
-        fetcher._apply_rate_limit()
+        fetcher.session.throttle(fetcher.FOMC_BASE_URL)
+        fetcher.session.throttle(fetcher.FOMC_BASE_URL)
         elapsed = time.time() - start
-        assert elapsed >= 0.01
+        assert elapsed >= 0.01 * 0.9
 
     def test_make_request_success(self):
         """Test successful HTTP request."""
@@ -239,3 +249,218 @@ class TestCentralBankFetcher:
         metadata = fetcher.get_metadata(communication)
         assert metadata["has_forward_guidance"] is False
         assert metadata["forward_guidance_count"] == 0
+
+
+class TestIncrementalHarvest:
+    """Test only new central bank communications are fetched."""
+
+    @pytest.fixture
+    def pages(self):
+        """Map of URL to page HTML served by the mocked _make_request."""
+        base = CentralBankFetcher.FOMC_BASE_URL + "/monetarypolicy/"
+        return {
+            CentralBankFetcher.FOMC_STATEMENTS_URL: INDEX_HTML,
+            base
+            + "fomcstatement20250129.htm": (
+                '<div class="col"><p>January statement</p></div>'
+            ),
+            base
+            + "fomcstatement20241218.htm": (
+                '<div class="col"><p>December statement</p></div>'
+            ),
+        }
+
+    @pytest.fixture
+    def fetcher(self, pages, tmp_path):
+        """Fetcher with an index in tmp_path and mocked requests."""
+        fetcher = CentralBankFetcher(
+            rate_limit_delay=0.0,
+            index=CommunicationIndex(str(tmp_path / "index.db")),
+        )
+        fetcher._make_request = Mock(
+            side_effect=lambda url, headers=None: Mock(
+                text=pages[url],
+                status_code=200,
+                headers={"ETag": f'"{url[-12:-4]}"'},
+            )
+        )
+        return fetcher
+
+    def test_links_fetched_once_with_hashes(self, fetcher):
+        """Test duplicate links are fetched once and results keep link order."""
+        statements = fetcher.fetch_fomc_statements(only_new=True)
+
+        assert [s["date"] for s in statements] == ["1/29/2025", "12/18/2024"]
+        assert all(len(s["content_hash"]) == 64 for s in statements)
+        assert fetcher._make_request.call_count == 3
+
+    def test_refresh_revalidates_indexed_links(self, fetcher):
+        """Test a refresh sends conditional requests for indexed links."""
+        fetcher.mark_ingested(fetcher.fetch_fomc_statements(only_new=True))
+        fetcher._make_request.reset_mock()
+
+        assert fetcher.fetch_fomc_statements(only_new=True) == []
+        conditional = [
+            c.kwargs["headers"] for c in fetcher._make_request.call_args_list[1:]
+        ]
+        assert conditional == [
+            {"If-None-Match": '"20250129"'},
+            {"If-None-Match": '"20241218"'},
+        ]
+        assert len(fetcher.fetch_fomc_statements()) == 2
+
+    def test_revalidation_limited_to_recent_links(self, fetcher):
+        """Test only the most recent indexed links are revalidated."""
+        fetcher.mark_ingested(fetcher.fetch_fomc_statements(only_new=True))
+        fetcher.revalidate_limit = 1
+        fetcher._make_request.reset_mock()
+
+        assert fetcher.fetch_fomc_statements(only_new=True) == []
+        requested = [c.args[0] for c in fetcher._make_request.call_args_list[1:]]
+        assert requested == [
+            CentralBankFetcher.FOMC_BASE_URL
+            + "/monetarypolicy/fomcstatement20250129.htm"
+        ]
+
+        fetcher.revalidate_limit = 0
+        fetcher._make_request.reset_mock()
+        assert fetcher.fetch_fomc_statements(only_new=True) == []
+        assert fetcher._make_request.call_count == 1
+
+    def test_not_modified_link_skipped(self, fetcher):
+        """Test a 304 response for an indexed link is not parsed."""
+        fetcher.mark_ingested(fetcher.fetch_fomc_statements(only_new=True))
+        fetcher._make_request.side_effect = lambda url, headers=None: Mock(
+            text=INDEX_HTML if headers is None else "",
+            status_code=200 if headers is None else 304,
+        )
+
+        assert fetcher.fetch_fomc_statements(only_new=True) == []
+
+    def test_revised_document_at_same_url_refetched(self, fetcher, pages):
+        """Test changed content at an indexed URL is returned as a revision."""
+        fetcher.mark_ingested(fetcher.fetch_fomc_statements(only_new=True))
+        url = CentralBankFetcher.FOMC_BASE_URL + "/monetarypolicy/"
+        pages[url + "fomcstatement20250129.htm"] = (
+            '<div class="col"><p>January statement (corrected)</p></div>'
+        )
+
+        statements = fetcher.fetch_fomc_statements(only_new=True)
+
+        assert [s["url"] for s in statements] == [url + "fomcstatement20250129.htm"]
+        assert statements[0]["revised"] is True
+        fetcher.mark_ingested(statements)
+        assert fetcher.fetch_fomc_statements(only_new=True) == []
+
+    def test_only_new_links_fetched(self, fetcher):
+        """Test indexed URLs are skipped and limit applies to new links."""
+        fetcher.mark_ingested(fetcher.fetch_fomc_statements(limit=1))
+        fetcher._make_request.reset_mock()
+
+        statements = fetcher.fetch_fomc_statements(limit=1, only_new=True)
+
+        assert [s["date"] for s in statements] == ["12/18/2024"]
+        assert fetcher._make_request.call_count == 2
+
+    def test_known_content_under_new_url_dropped(self, fetcher, pages):
+        """Test documents whose content hash is indexed are not returned."""
+        fetcher.mark_ingested(fetcher.fetch_fomc_statements(limit=1))
+        base = CentralBankFetcher.FOMC_BASE_URL + "/monetarypolicy/"
+        pages[base + "fomcstatement20250129a.htm"] = pages[
+            base + "fomcstatement20250129.htm"
+        ]
+        pages[fetcher.FOMC_STATEMENTS_URL] = INDEX_HTML.replace(
+            "fomcstatement20250129.htm", "fomcstatement20250129a.htm"
+        )
+
+        statements = fetcher.fetch_fomc_statements(only_new=True)
+
+        assert [s["date"] for s in statements] == ["12/18/2024"]
+
+    def test_failed_document_skipped(self, fetcher, pages):
+        """Test a failing document does not fail the whole harvest."""
+        url = CentralBankFetcher.FOMC_BASE_URL + "/monetarypolicy/"
+        del pages[url + "fomcstatement20241218.htm"]
+
+        statements = fetcher.fetch_fomc_statements(only_new=True)
+
+        assert [s["url"] for s in statements] == [url + "fomcstatement20250129.htm"]
+
+    def test_mark_ingested_without_index(self):
+        """Test mark_ingested is a no-op when the index is disabled."""
+        with patch("app.ingestion.central_bank_fetcher.config") as mock_config:
+            mock_config.central_bank_rate_limit_seconds = 0.1
+            mock_config.central_bank_max_workers = 2
+            mock_config.central_bank_index_enabled = False
+            fetcher = CentralBankFetcher()
+
+        assert fetcher.index is None
+        assert fetcher.mark_ingested([{"url": "u", "content_hash": "h"}]) == 0
+
+    def test_processor_records_stored_communications(self):
+        """Test process_central_bank passes only_new and indexes stored items."""
+        from app.ingestion.processors.economic_data_processor import (
+            EconomicDataProcessor,
+        )
+
+        communications = [{"url": "u", "content_hash": "h", "type": "fomc_minutes"}]
+        processor = Mock(central_bank_fetcher=Mock())
+        fetcher = processor.central_bank_fetcher
+        fetcher.fetch_fomc_minutes.return_value = communications
+        processor._process_fetched_documents.return_value = ["chunk-1"]
+
+        ids = EconomicDataProcessor.process_central_bank(
+            processor, comm_types=["fomc_minutes"]
+        )
+
+        assert ids == ["chunk-1"]
+        assert fetcher.fetch_fomc_minutes.call_args[1]["only_new"] is True
+        fetcher.mark_ingested.assert_called_once_with(communications)
+        processor.chroma_store.delete_documents.assert_not_called()
+
+    def test_processor_replaces_chunks_of_revised_communications(self):
+        """Test the chunks of a revised communication are deleted first."""
+        from app.ingestion.processors.economic_data_processor import (
+            EconomicDataProcessor,
+        )
+
+        communications = [
+            {"url": "u", "content_hash": "h2", "type": "fomc_minutes", "revised": True}
+        ]
+        processor = Mock(central_bank_fetcher=Mock())
+        processor.central_bank_fetcher.fetch_fomc_minutes.return_value = communications
+        processor._process_fetched_documents.return_value = ["chunk-2"]
+
+        EconomicDataProcessor.process_central_bank(
+            processor, comm_types=["fomc_minutes"]
+        )
+
+        processor.chroma_store.delete_documents.assert_called_once_with(
+            where={"url": "u"}
+        )
+
+
+class TestCommunicationIndex:
+    """Test the persisted communication index."""
+
+    def test_lookup_returns_hash_and_validators(self, tmp_path):
+        """Test indexed URLs keep their content hash, ETag and Last-Modified."""
+        index = CommunicationIndex(str(tmp_path / "index.db"))
+        index.add(
+            [
+                {
+                    "url": "u",
+                    "content_hash": "h",
+                    "etag": '"v1"',
+                    "last_modified": "Wed, 29 Jan 2025 19:00:00 GMT",
+                }
+            ]
+        )
+
+        assert index.lookup(["u", "other"]) == {
+            "u": {
+                "content_hash": "h",
+                "etag": '"v1"',
+                "last_modified": "Wed, 29 Jan 2025 19:00:00 GMT",
+            }
+        }
@@ -88,7 +88,7 @@ class TestDef14AParserExtractCompanyInfo:
     def test_extract_company_name(self):
         """Test extracting company name."""
         parser = Def14AParser()
-        from bs4 import BeautifulSoup
+        from app.ingestion.html_extractor import extract_document
 
         html = """
         <html>
@@ -98,9 +98,9 @@ class TestDef14AParserExtractCompanyInfo:
         </body>
         </html>
         """
-        soup = BeautifulSoup(html, "html.parser")
+        document = extract_document(html)
 
-        result = parser._extract_company_info(soup)
+        result = parser._extract_company_info(document)
 
         assert "name" in result
         assert result["name"] != ""
@@ -108,7 +108,7 @@ class TestDef14AParserExtractCompanyInfo:
     def test_extract_meeting_date(self):
         """Test extracting meeting date."""
         parser = Def14AParser()
-        from bs4 import BeautifulSoup
+        from app.ingestion.html_extractor import extract_document
 
         html = """
         <html>
@@ -118,9 +118,9 @@ class TestDef14AParserExtractCompanyInfo:
         </body>
         </html>
         """
-        soup = BeautifulSoup(html, "html.parser")
+        document = extract_document(html)
 
-        result = parser._extract_company_info(soup)
+        result = parser._extract_company_info(document)
 
         assert "meeting_date" in result
         # May or may not extract meeting date depending on pattern
@@ -132,7 +132,7 @@ class TestDef14AParserExtractVotingItems:
     def test_extract_voting_items(self):
         """Test extracting voting items."""
         parser = Def14AParser()
-        from bs4 import BeautifulSoup
+        from app.ingestion.html_extractor import extract_document
 
         html = """
         <html>
@@ -145,9 +145,9 @@ class TestDef14AParserExtractVotingItems:
         </body>
         </html>
         """
-        soup = BeautifulSoup(html, "html.parser")
+        document = extract_document(html)
 
-        result = parser._extract_voting_items(soup)
+        result = parser._extract_voting_items(document)
 
         assert isinstance(result, list)
         # May or may not extract voting items depending on pattern
@@ -159,7 +159,7 @@ class TestDef14AParserExtractExecutiveCompensation:
     def test_extract_executive_compensation(self):
         """Test extracting executive compensation."""
         parser = Def14AParser()
-        from bs4 import BeautifulSoup
+        from app.ingestion.html_extractor import extract_document
 
         html = """
         <html>
@@ -170,9 +170,9 @@ class TestDef14AParserExtractExecutiveCompensation:
         </body>
         </html>
         """
-        soup = BeautifulSoup(html, "html.parser")
+        document = extract_document(html)
 
-        result = parser._extract_executive_compensation(soup)
+        result = parser._extract_executive_compensation(document)
 
         assert "ceo_total" in result
         assert "cfo_total" in result
@@ -185,7 +185,7 @@ class TestDef14AParserExtractBoardMembers:
     def test_extract_board_members(self):
         """Test extracting board members."""
         parser = Def14AParser()
-        from bs4 import BeautifulSoup
+        from app.ingestion.html_extractor import extract_document
 
         html = """
         <html>
@@ -196,9 +196,9 @@ class TestDef14AParserExtractBoardMembers:
         </body>
         </html>
         """
-        soup = BeautifulSoup(html, "html.parser")
+        document = extract_document(html)
 
-        result = parser._extract_board_members(soup)
+        result = parser._extract_board_members(document)
 
         assert isinstance(result, list)
         # May or may not extract board members depending on pattern
@@ -210,7 +210,7 @@ class TestDef14AParserExtractShareholderProposals:
     def test_extract_shareholder_proposals(self):
         """Test extracting shareholder proposals."""
         parser = Def14AParser()
-        from bs4 import BeautifulSoup
+        from app.ingestion.html_extractor import extract_document
 
         html = """
         <html>
@@ -220,9 +220,9 @@ class TestDef14AParserExtractShareholderProposals:
         </body>
         </html>
         """
-        soup = BeautifulSoup(html, "html.parser")
+        document = extract_document(html)
 
-        result = parser._extract_shareholder_proposals(soup)
+        result = parser._extract_shareholder_proposals(document)
 
         assert isinstance(result, list)
         # May or may not extract proposals depending on pattern
@@ -16,6 +16,7 @@ from unittest.mock import Mock, patch
 import pytest
 
 from app.ingestion.edgar_fetcher import EdgarFetcher
+from app.ingestion.html_extractor import extract_document
 
 
 class TestEnhancedEdgarFetcherInitialization:
@@ -39,7 +40,7 @@ class TestEnhancedEdgarFetcherInitialization:
 class TestEnhancedFormParsing:
     """Test enhanced form type parsing."""
 
-    @patch.object(EdgarFetcher, "download_filing_text")
+    @patch.object(EdgarFetcher, "download_filing")
     @patch.object(EdgarFetcher, "get_recent_filings")
     @patch.object(EdgarFetcher, "get_company_cik")
     def test_fetch_form4_with_enhanced_parsing(
@@ -69,7 +70,7 @@ class TestEnhancedFormParsing:
         </body>
         </html>
         """
-        mock_download.return_value = form4_html
+        mock_download.return_value = extract_document(form4_html)
 
         result = fetcher.fetch_filings_to_documents(
             ["AAPL"], form_types=["4"], max_filings_per_company=1
@@ -81,7 +82,7 @@ class TestEnhancedFormParsing:
             # Enhanced metadata may be present if parsing succeeded
             assert "enhanced" in result[0].metadata or True
 
-    @patch.object(EdgarFetcher, "download_filing_text")
+    @patch.object(EdgarFetcher, "download_filing")
     @patch.object(EdgarFetcher, "get_recent_filings")
     @patch.object(EdgarFetcher, "get_company_cik")
     def test_fetch_forms1_with_enhanced_parsing(
@@ -110,7 +111,7 @@ class TestEnhancedFormParsing:
         </body>
         </html>
         """
-        mock_download.return_value = forms1_html
+        mock_download.return_value = extract_document(forms1_html)
 
         result = fetcher.fetch_filings_to_documents(
             ["NEWCO"], form_types=["S-1"], max_filings_per_company=1
@@ -120,7 +121,7 @@ class TestEnhancedFormParsing:
         if result:
             assert result[0].metadata["form_type"] == "S-1"
 
-    @patch.object(EdgarFetcher, "download_filing_text")
+    @patch.object(EdgarFetcher, "download_filing")
     @patch.object(EdgarFetcher, "get_recent_filings")
     @patch.object(EdgarFetcher, "get_company_cik")
     def test_fetch_def14a_with_enhanced_parsing(
@@ -149,7 +150,7 @@ class TestEnhancedFormParsing:
         </body>
         </html>
         """
-        mock_download.return_value = def14a_html
+        mock_download.return_value = extract_document(def14a_html)
 
         result = fetcher.fetch_filings_to_documents(
             ["AAPL"], form_types=["DEF 14A"], max_filings_per_company=1
@@ -164,7 +165,7 @@ class TestEnhancedXBRLParsing:
     """Test XBRL parsing integration."""
 
     @patch.object(EdgarFetcher, "_download_xbrl_file")
-    @patch.object(EdgarFetcher, "download_filing_text")
+    @patch.object(EdgarFetcher, "download_filing")
     @patch.object(EdgarFetcher, "get_recent_filings")
     @patch.object(EdgarFetcher, "get_company_cik")
     def test_fetch_10k_with_xbrl_parsing(
@@ -184,7 +185,7 @@ class TestEnhancedXBRLParsing:
         ]
 
         html_content = "10-K HTML content" * 100
-        mock_download.return_value = html_content
+        mock_download.return_value = extract_document(html_content)
 
         # Mock XBRL content
         xbrl_content = b"""<?xml version="1.0"?>
@@ -220,7 +221,7 @@ class TestEnhancedXBRLParsing:
         result = fetcher._download_xbrl_file("0000320193", "0000320193-24-000096")
 
         assert result == b"XBRL content"
-        mock_sleep.assert_called()
+        fetcher.session.get.assert_called()
 
     @patch("time.sleep")
     def test_download_xbrl_file_not_found(self, mock_sleep):
@@ -239,7 +240,7 @@ class TestEnhancedXBRLParsing:
 class TestEnhancedParsingErrorHandling:
     """Test error handling in enhanced parsing."""
 
-    @patch.object(EdgarFetcher, "download_filing_text")
+    @patch.object(EdgarFetcher, "download_filing")
     @patch.object(EdgarFetcher, "get_recent_filings")
     @patch.object(EdgarFetcher, "get_company_cik")
     def test_enhanced_parsing_graceful_degradation(
@@ -259,7 +260,9 @@ class TestEnhancedParsingErrorHandling:
         ]
 
         # Content that might cause parsing issues
-        mock_download.return_value = "Invalid or malformed content" * 10
+        mock_download.return_value = extract_document(
+            "Invalid or malformed content" * 10
+        )
 
         # Should not raise error, should use basic content
         result = fetcher.fetch_filings_to_documents(
@@ -269,7 +272,7 @@ class TestEnhancedParsingErrorHandling:
         # Should still produce documents even if parsing fails
         assert len(result) >= 0
 
-    @patch.object(EdgarFetcher, "download_filing_text")
+    @patch.object(EdgarFetcher, "download_filing")
     @patch.object(EdgarFetcher, "get_recent_filings")
     @patch.object(EdgarFetcher, "get_company_cik")
     def test_enhanced_parsing_with_parser_error(
@@ -288,7 +291,7 @@ class TestEnhancedParsingErrorHandling:
             }
         ]
 
-        mock_download.return_value = "Content" * 100
+        mock_download.return_value = extract_document("Content" * 100)
 
         # Mock parser to raise error
         if fetcher.form4_parser:
@@ -306,7 +309,7 @@ class TestEnhancedParsingErrorHandling:
 class TestEnhancedMetadata:
     """Test enhanced metadata extraction."""
 
-    @patch.object(EdgarFetcher, "download_filing_text")
+    @patch.object(EdgarFetcher, "download_filing")
     @patch.object(EdgarFetcher, "get_recent_filings")
     @patch.object(EdgarFetcher, "get_company_cik")
     def test_enhanced_metadata_in_documents(
@@ -334,7 +337,7 @@ class TestEnhancedMetadata:
         </body>
         </html>
         """
-        mock_download.return_value = form4_html
+        mock_download.return_value = extract_document(form4_html)
 
         result = fetcher.fetch_filings_to_documents(
             ["AAPL"], form_types=["4"], max_filings_per_company=1
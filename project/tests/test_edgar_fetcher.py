@@ -12,12 +12,15 @@ Tests cover:
 """
 
 import json
+import threading
+import time
 from unittest.mock import Mock, patch
 
 import pytest
 from requests.exceptions import ConnectionError, HTTPError, Timeout
 
 from app.ingestion.edgar_fetcher import EdgarFetcher, EdgarFetcherError
+from app.ingestion.html_extractor import ExtractedDocument
 
 
 class TestEdgarFetcherInitialization:
@@ -53,7 +56,7 @@ class TestMakeRequest:
         result = fetcher._make_request("https://example.com/api")
 
         assert result == {"test": "data"}
-        mock_sleep.assert_called_once_with(0.1)
+        fetcher.session.get.assert_called_once()
         mock_response.raise_for_status.assert_called_once()
 
     @patch("time.sleep")
@@ -486,7 +489,7 @@ class TestDownloadFilingText:
 class TestFetchFilingsToDocuments:
     """Test fetching filings and converting to Document objects."""
 
-    @patch.object(EdgarFetcher, "download_filing_text")
+    @patch.object(EdgarFetcher, "download_filing")
     @patch.object(EdgarFetcher, "get_recent_filings")
     @patch.object(EdgarFetcher, "get_company_cik")
     def test_fetch_filings_to_documents_success(
@@ -504,7 +507,7 @@ class TestFetchFilingsToDocuments:
                 "cik": "0000320193",
             }
         ]
-        mock_download.return_value = "Filing content" * 100
+        mock_download.return_value = ExtractedDocument(text="Filing content" * 100)
 
         result = fetcher.fetch_filings_to_documents(["AAPL"], max_filings_per_company=1)
 
@@ -525,7 +528,7 @@ class TestFetchFilingsToDocuments:
 
         assert len(result) == 0
 
-    @patch.object(EdgarFetcher, "download_filing_text")
+    @patch.object(EdgarFetcher, "download_filing")
     @patch.object(EdgarFetcher, "get_recent_filings")
     @patch.object(EdgarFetcher, "get_company_cik")
     def test_fetch_filings_to_documents_no_filings(
@@ -541,7 +544,7 @@ class TestFetchFilingsToDocuments:
 
         assert len(result) == 0
 
-    @patch.object(EdgarFetcher, "download_filing_text")
+    @patch.object(EdgarFetcher, "download_filing")
     @patch.object(EdgarFetcher, "get_recent_filings")
     @patch.object(EdgarFetcher, "get_company_cik")
     def test_fetch_filings_to_documents_download_error(
@@ -566,7 +569,7 @@ class TestFetchFilingsToDocuments:
         # Should continue processing despite download error
         assert len(result) == 0
 
-    @patch.object(EdgarFetcher, "download_filing_text")
+    @patch.object(EdgarFetcher, "download_filing")
     @patch.object(EdgarFetcher, "get_recent_filings")
     @patch.object(EdgarFetcher, "get_company_cik")
     def test_fetch_filings_to_documents_insufficient_content(
@@ -584,7 +587,7 @@ class TestFetchFilingsToDocuments:
                 "cik": "0000320193",
             }
         ]
-        mock_download.return_value = "Short"  # < 100 chars
+        mock_download.return_value = ExtractedDocument(text="Short")  # < 100 chars
 
         result = fetcher.fetch_filings_to_documents(["AAPL"])
 
@@ -602,13 +605,71 @@ class TestFetchFilingsToDocuments:
         mock_get_cik.side_effect = cik_side_effect
 
         with patch.object(fetcher, "get_recent_filings", return_value=[]):
-            with patch.object(fetcher, "download_filing_text"):
+            with patch.object(fetcher, "download_filing"):
                 fetcher.fetch_filings_to_documents(["AAPL", "MSFT"])
 
                 # Both tickers processed (even if no filings)
                 assert mock_get_cik.call_count == 2
 
 
+class TestConcurrentHarvesting:
+    """Test concurrent multi-ticker harvesting."""
+
+    def test_shared_rate_limiter(self):
+        """Test all fetchers share one SEC limiter capped at 10 req/s."""
+        first = EdgarFetcher()
+        second = EdgarFetcher(rate_limit_delay=0.05)
+        assert first.rate_limiter is second.rate_limiter
+        assert first.rate_limiter.rate <= 10
+        assert first.session.rate_limiter is first.rate_limiter
+
+    def test_slower_delay_lowers_shared_rate(self):
+        """Test a larger rate_limit_delay slows the shared limiter."""
+        fetcher = EdgarFetcher(rate_limit_delay=0.5)
+        assert fetcher.rate_limiter.rate == pytest.approx(2.0)
+
+    def test_downloads_run_concurrently_in_order(self):
+        """Test filings download in parallel and results keep ticker order."""
+        fetcher = EdgarFetcher(use_enhanced_parsing=False, max_workers=4)
+        active = 0
+        max_active = 0
+        lock = threading.Lock()
+
+        def download(cik, accession_number, form_type):
+            nonlocal active, max_active
+            with lock:
+                active += 1
+                max_active = max(max_active, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            return ExtractedDocument(text=f"{accession_number} content " * 20)
+
+        def filings(cik, form_types=None, max_filings=10):
+            return [
+                {
+                    "form": "10-K",
+                    "date": f"2024-0{i + 1}-01",
+                    "accession_number": f"{cik}-{i}",
+                    "cik": cik,
+                }
+                for i in range(3)
+            ]
+
+        tickers = ["AAPL", "MSFT", "NVDA"]
+        with (
+            patch.object(fetcher, "get_company_cik", side_effect=lambda t: t),
+            patch.object(fetcher, "get_recent_filings", side_effect=filings),
+            patch.object(fetcher, "download_filing", side_effect=download),
+        ):
+            result = fetcher.fetch_filings_to_documents(tickers)
+
+        assert max_active > 1
+        assert [doc.metadata["accession_number"] for doc in result] == [
+            f"{ticker}-{i}" for ticker in tickers for i in range(3)
+        ]
+
+
 class TestSaveFilingsToFiles:
     """Test saving filings to files."""
 
@@ -0,0 +1,393 @@
+"""
+Tests for streaming uploads, incremental hashing, and streaming chunking.
+"""
+
+import asyncio
+import hashlib
+import io
+import tracemalloc
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.ingestion.document_loader import DocumentChunk, DocumentLoader
+from app.ingestion.pipeline import IngestionPipelineError
+from app.ingestion.processors.document_processor import DocumentProcessor
+from app.utils.config import config
+from app.utils.document_processors import generate_and_store_embeddings_streaming
+from app.utils.file_streaming import (
+    UploadTooLargeError,
+    hash_file,
+    safe_filename,
+    save_upload_stream,
+)
+from app.vector_db import VectorStoreError
+
+
+class _FakeUpload:
+    """Minimal async upload object with a read(size) method."""
+
+    def __init__(self, data: bytes, filename: str):
+        self.filename = filename
+        self._stream = io.BytesIO(data)
+        self.read_sizes = []
+
+    async def read(self, size: int = -1) -> bytes:
+        self.read_sizes.append(size)
+        return self._stream.read(size)
+
+
+class TestFileStreaming:
+    """Test upload streaming helpers."""
+
+    def test_hash_file(self, tmp_path):
+        """Test file hashing matches hashlib over the full content."""
+        path = tmp_path / "doc.txt"
+        path.write_bytes(b"revenue grew 7%" * 1000)
+        assert (
+            hash_file(path, chunk_bytes=64)
+            == hashlib.sha256(path.read_bytes()).hexdigest()
+        )
+
+    @pytest.mark.parametrize(
+        "filename,expected",
+        [
+            ("report.txt", "report.txt"),
+            ("../../etc/passwd", "passwd"),
+            ("..\\..\\win.ini", "win.ini"),
+            ("", "upload.txt"),
+            (None, "upload.txt"),
+        ],
+    )
+    def test_safe_filename(self, filename, expected):
+        """Test directory components are stripped from upload names."""
+        assert safe_filename(filename) == expected
+
+    def test_save_upload_stream_reads_in_chunks(self, tmp_path):
+        """Test uploads are streamed to disk and hashed incrementally."""
+        data = b"x" * 10_000
+        upload = _FakeUpload(data, "filing.txt")
+
+        stored = asyncio.run(save_upload_stream(upload, tmp_path, chunk_bytes=1024))
+
+        assert stored.path == tmp_path / "filing.txt"
+        assert stored.path.read_bytes() == data
+        assert stored.size_bytes == len(data)
+        assert stored.content_hash == hashlib.sha256(data).hexdigest()
+        assert set(upload.read_sizes) == {1024}
+        assert not list(tmp_path.glob("*.part"))
+
+    def test_save_upload_stream_too_large(self, tmp_path):
+        """Test oversized uploads abort and leave no partial file."""
+        upload = _FakeUpload(b"x" * 5000, "big.txt")
+
+        with pytest.raises(UploadTooLargeError):
+            asyncio.run(
+                save_upload_stream(upload, tmp_path, max_bytes=4096, chunk_bytes=1024)
+            )
+
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestStreamingChunker:
+    """Test DocumentLoader streaming splitter."""
+
+    @pytest.fixture
+    def long_text(self):
+        """Generate multi-paragraph text spanning several windows."""
+        paragraphs = [
+            f"Paragraph {i}. Revenue for segment {i} increased by {i % 13}% "
+            f"year over year, driven by services and product demand. " * 3
+            for i in range(400)
+        ]
+        return "\n\n".join(paragraphs)
+
+    def test_small_file_matches_whole_document_split(self, tmp_path, long_text):
+        """Test files smaller than one window split exactly as before."""
+        path = tmp_path / "doc.txt"
+        path.write_text(long_text)
+        loader = DocumentLoader(chunk_size=500, chunk_overlap=100)
+
+        expected = loader.text_splitter.split_text(long_text)
+        assert list(loader.iter_text_chunks(path)) == expected
+
+    def test_windowed_split_covers_document(self, tmp_path, long_text):
+        """Test multi-window splitting yields equivalent chunks."""
+        path = tmp_path / "doc.txt"
+        path.write_text(long_text)
+        loader = DocumentLoader(chunk_size=500, chunk_overlap=100)
+        loader.STREAM_WINDOW_CHARS = 4096
+
+        expected = loader.text_splitter.split_text(long_text)
+        chunks = list(loader.iter_text_chunks(path))
+
+        assert chunks == expected
+        assert all(len(chunk) <= 500 for chunk in chunks)
+
+    def test_iter_chunks_metadata(self, tmp_path, long_text):
+        """Test streamed chunks carry parent metadata and chunk_index."""
+        path = tmp_path / "doc.md"
+        path.write_text(long_text[:3000])
+        loader = DocumentLoader(chunk_size=500, chunk_overlap=100)
+
+        chunks = list(loader.iter_chunks(path, metadata={"content_hash": "abc"}))
+
+        assert [c.metadata["chunk_index"] for c in chunks] == list(range(len(chunks)))
+        assert all(c.metadata["content_hash"] == "abc" for c in chunks)
+        assert all(c.metadata["type"] == "markdown" for c in chunks)
+        assert all(c.metadata["source"] == str(path) for c in chunks)
+
+    def test_chunks_share_immutable_metadata(self, tmp_path, long_text):
+        """Test streamed chunks share one read-only parent metadata mapping."""
+        path = tmp_path / "doc.txt"
+        path.write_text(long_text)
+        loader = DocumentLoader(chunk_size=500, chunk_overlap=100)
+
+        chunks = list(loader.iter_document_chunks(path, metadata={"k": "v"}))
+
+        assert all(isinstance(c, DocumentChunk) for c in chunks)
+        assert len({id(c.parent_metadata) for c in chunks}) == 1
+        with pytest.raises(TypeError):
+            chunks[0].parent_metadata["k"] = "changed"
+        assert chunks[3].chunk_index == 3
+        assert chunks[3].metadata["chunk_index"] == 3
+        assert "chunk_index" not in chunks[3].parent_metadata
+
+    def test_max_file_size_is_configurable(self, tmp_path):
+        """Test the size limit comes from the constructor argument."""
+        from app.ingestion.document_loader import DocumentIngestionError
+
+        path = tmp_path / "doc.txt"
+        path.write_text("x" * 2048)
+        with pytest.raises(DocumentIngestionError):
+            DocumentLoader(max_file_size_bytes=1024).process_document(path)
+        assert DocumentLoader(max_file_size_bytes=4096).process_document(path)
+
+    def test_invalid_utf8_raises(self, tmp_path):
+        """Test undecodable files raise DocumentIngestionError."""
+        from app.ingestion.document_loader import DocumentIngestionError
+
+        path = tmp_path / "bad.txt"
+        path.write_bytes(b"\xff\xfe\xfa invalid")
+        with pytest.raises(DocumentIngestionError):
+            DocumentLoader().process_document(path)
+
+
+class TestContentHashDedup:
+    """Test content-hash deduplication in DocumentProcessor."""
+
+    def _processor(self, existing_ids):
+        chroma_store = MagicMock()
+        chroma_store.get_ids_by_metadata.return_value = existing_ids
+        embedding_generator = MagicMock()
+        embedding_generator.embed_documents.side_effect = lambda texts: [
+            [0.0] * 3 for _ in texts
+        ]
+        chroma_store.add_documents.side_effect = lambda docs, embs: [
+            f"id_{i}" for i in range(len(docs))
+        ]
+        return DocumentProcessor(
+            document_loader=DocumentLoader(chunk_size=200, chunk_overlap=20),
+            embedding_generator=embedding_generator,
+            chroma_store=chroma_store,
+        )
+
+    def test_duplicate_content_is_skipped(self, tmp_path):
+        """Test already-ingested content returns existing IDs."""
+        path = tmp_path / "doc.txt"
+        path.write_text("Revenue increased. " * 50)
+        processor = self._processor(existing_ids=["old_1", "old_2"])
+
+        ids = processor.process_document(path, skip_duplicates=True)
+
+        assert ids == ["old_1", "old_2"]
+        processor.chroma_store.get_ids_by_metadata.assert_called_once_with(
+            {"content_hash": hash_file(path)}
+        )
+        processor.embedding_generator.embed_documents.assert_not_called()
+
+    def test_new_content_is_tagged_with_hash(self, tmp_path):
+        """Test new content is ingested with content_hash metadata."""
+        path = tmp_path / "doc.txt"
+        path.write_text("Revenue increased. " * 50)
+        processor = self._processor(existing_ids=[])
+
+        ids = processor.process_document(path, skip_duplicates=True)
+
+        assert ids
+        stored_docs = processor.chroma_store.add_documents.call_args.args[0]
+        assert {d.metadata["content_hash"] for d in stored_docs} == {
+            hash_file(Path(path))
+        }
+
+
+class TestStreamingEmbedding:
+    """Test batched embedding of streamed chunks."""
+
+    def _stores(self):
+        embedding_generator = MagicMock()
+        embedding_generator.embed_documents.side_effect = lambda texts: [
+            [0.0] * 3 for _ in texts
+        ]
+        chroma_store = MagicMock()
+        chroma_store.add_documents.side_effect = lambda docs, embs: [
+            d.metadata["chunk_index"] for d in docs
+        ]
+        return embedding_generator, chroma_store
+
+    def test_batches_are_embedded_and_stored_incrementally(self):
+        """Test chunks are consumed lazily in fixed-size batches."""
+        embedding_generator, chroma_store = self._stores()
+        parent = {"source": "doc.txt"}
+        chunks = (DocumentChunk(f"text {i}", i, parent) for i in range(10))
+
+        ids = generate_and_store_embeddings_streaming(
+            chunks, embedding_generator, chroma_store, batch_size=4
+        )
+
+        assert ids == list(range(10))
+        batch_sizes = [
+            len(call.args[0])
+            for call in embedding_generator.embed_documents.call_args_list
+        ]
+        assert batch_sizes == [4, 4, 2]
+        assert chroma_store.add_documents.call_count == 3
+
+    def test_without_storage_returns_sequential_ids(self):
+        """Test store_embeddings=False numbers chunks across batches."""
+        embedding_generator, chroma_store = self._stores()
+        chunks = [DocumentChunk("t", i, {}) for i in range(5)]
+
+        ids = generate_and_store_embeddings_streaming(
+            chunks,
+            embedding_generator,
+            chroma_store,
+            store_embeddings=False,
+            batch_size=2,
+        )
+
+        assert ids == [f"chunk_{i}" for i in range(5)]
+        chroma_store.add_documents.assert_not_called()
+
+    def test_embedding_count_mismatch_raises(self):
+        """Test a short embedding batch raises ValueError."""
+        embedding_generator, chroma_store = self._stores()
+        embedding_generator.embed_documents.side_effect = lambda texts: []
+
+        with pytest.raises(ValueError):
+            generate_and_store_embeddings_streaming(
+                [DocumentChunk("t", 0, {})], embedding_generator, chroma_store
+            )
+
+    def test_failed_batch_rolls_back_stored_chunks(self):
+        """Test chunks stored before a failing batch are deleted again."""
+        embedding_generator, chroma_store = self._stores()
+        stored_batches = []
+
+        def add_documents(docs, embs):
+            if stored_batches:
+                raise VectorStoreError("disk full")
+            stored_batches.append(docs)
+            return [d.metadata["chunk_index"] for d in docs]
+
+        chroma_store.add_documents.side_effect = add_documents
+        chunks = [DocumentChunk(f"text {i}", i, {}) for i in range(6)]
+
+        with pytest.raises(VectorStoreError):
+            generate_and_store_embeddings_streaming(
+                chunks, embedding_generator, chroma_store, batch_size=3
+            )
+
+        chroma_store.delete_documents.assert_called_once_with(ids=[0, 1, 2])
+
+    def test_reingest_after_partial_failure_stores_whole_file(self, tmp_path):
+        """Test a file that failed partway is not skipped as a duplicate."""
+        path = tmp_path / "doc.txt"
+        path.write_text("Revenue increased in every segment. " * 60)
+        store = {}
+        fail_second_batch = [True]
+
+        def add_documents(docs, embs):
+            if fail_second_batch[0] and store:
+                raise VectorStoreError("connection reset")
+            ids = [f"id_{len(store) + i}" for i in range(len(docs))]
+            store.update(zip(ids, docs))
+            return ids
+
+        def get_ids_by_metadata(where):
+            return [
+                doc_id
+                for doc_id, doc in store.items()
+                if doc.metadata.get("content_hash") == where["content_hash"]
+            ]
+
+        def delete_documents(ids=None, where=None):
+            for doc_id in ids:
+                store.pop(doc_id)
+            return len(ids)
+
+        chroma_store = MagicMock()
+        chroma_store.add_documents.side_effect = add_documents
+        chroma_store.get_ids_by_metadata.side_effect = get_ids_by_metadata
+        chroma_store.delete_documents.side_effect = delete_documents
+        embedding_generator = MagicMock()
+        embedding_generator.embed_documents.side_effect = lambda texts: [
+            [0.0] * 3 for _ in texts
+        ]
+        processor = DocumentProcessor(
+            document_loader=DocumentLoader(chunk_size=200, chunk_overlap=20),
+            embedding_generator=embedding_generator,
+            chroma_store=chroma_store,
+        )
+        expected_chunks = len(
+            list(processor.document_loader.iter_document_chunks(path))
+        )
+
+        with patch.object(config, "ingestion_embedding_batch_size", 2):
+            with pytest.raises(IngestionPipelineError):
+                processor.process_document(path, skip_duplicates=True)
+            assert store == {}
+
+            fail_second_batch[0] = False
+            ids = processor.process_document(path, skip_duplicates=True)
+
+        assert expected_chunks > 2
+        assert len(ids) == expected_chunks
+        assert len(store) == expected_chunks
+
+    def test_large_file_memory_is_bounded(self, tmp_path):
+        """Test peak memory while ingesting is far below the file size."""
+        path = tmp_path / "filing.txt"
+        paragraph = (
+            "Net revenue increased due to higher services volume and pricing. " * 6
+        )
+        with open(path, "w") as f:
+            for i in range(24_000):
+                f.write(f"Item {i}. {paragraph}\n\n")
+        file_size = path.stat().st_size
+        # Plain callables: MagicMock would retain every batch in call_args_list
+        embedding_generator = SimpleNamespace(
+            embed_documents=lambda texts: [[0.0] * 3 for _ in texts]
+        )
+        chroma_store = SimpleNamespace(
+            add_documents=lambda docs, embs: [None] * len(docs)
+        )
+        loader = DocumentLoader(chunk_size=800, chunk_overlap=150)
+        loader.STREAM_WINDOW_CHARS = 256 * 1024
+
+        tracemalloc.start()
+        try:
+            ids = generate_and_store_embeddings_streaming(
+                loader.iter_document_chunks(path),
+                embedding_generator,
+                chroma_store,
+                batch_size=32,
+            )
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert len(ids) > 10_000
+        assert peak < file_size / 4
@@ -87,7 +87,7 @@ class TestFormS1ParserExtractCompanyInfo:
     def test_extract_company_name(self):
         """Test extracting company name."""
         parser = FormS1Parser()
-        from bs4 import BeautifulSoup
+        from app.ingestion.html_extractor import extract_document
 
         html = """
         <html>
@@ -97,9 +97,9 @@ class TestFormS1ParserExtractCompanyInfo:
         </body>
         </html>
         """
-        soup = BeautifulSoup(html, "html.parser")
+        document = extract_document(html)
 
-        result = parser._extract_company_info(soup)
+        result = parser._extract_company_info(document)
 
         assert "name" in result
         assert result["name"] != ""
@@ -107,7 +107,7 @@ class TestFormS1ParserExtractCompanyInfo:
     def test_extract_company_ticker(self):
         """Test extracting company ticker."""
         parser = FormS1Parser()
-        from bs4 import BeautifulSoup
+        from app.ingestion.html_extractor import extract_document
 
         html = """
         <html>
@@ -116,9 +116,9 @@ class TestFormS1ParserExtractCompanyInfo:
         </body>
         </html>
         """
-        soup = BeautifulSoup(html, "html.parser")
+        document = extract_document(html)
 
-        result = parser._extract_company_info(soup)
+        result = parser._extract_company_info(document)
 
         assert "ticker" in result
         assert result["ticker"] == "NEWCO" or result["ticker"] != ""
@@ -126,7 +126,7 @@ class TestFormS1ParserExtractCompanyInfo:
     def test_extract_company_cik(self):
         """Test extracting company CIK."""
         parser = FormS1Parser()
-        from bs4 import BeautifulSoup
+        from app.ingestion.html_extractor import extract_document
 
         html = """
         <html>
@@ -135,9 +135,9 @@ class TestFormS1ParserExtractCompanyInfo:
         </body>
         </html>
         """
-        soup = BeautifulSoup(html, "html.parser")
+        document = extract_document(html)
 
-        result = parser._extract_company_info(soup)
+        result = parser._extract_company_info(document)
 
         assert "cik" in result
         if result["cik"]:
@@ -150,7 +150,7 @@ class TestFormS1ParserExtractOfferingInfo:
     def test_extract_offering_type_ipo(self):
         """Test extracting IPO offering type."""
         parser = FormS1Parser()
-        from bs4 import BeautifulSoup
+        from app.ingestion.html_extractor import extract_document
 
         html = """
         <html>
@@ -159,9 +159,9 @@ class TestFormS1ParserExtractOfferingInfo:
         </body>
         </html>
         """
-        soup = BeautifulSoup(html, "html.parser")
+        document = extract_document(html)
 
-        result = parser._extract_offering_info(soup)
+        result = parser._extract_offering_info(document)
 
         assert "type" in result
         assert result["type"] == "IPO" or result["type"] != ""
@@ -169,7 +169,7 @@ class TestFormS1ParserExtractOfferingInfo:
     def test_extract_offering_amount(self):
         """Test extracting offering amount."""
         parser = FormS1Parser()
-        from bs4 import BeautifulSoup
+        from app.ingestion.html_extractor import extract_document
 
         html = """
         <html>
@@ -178,9 +178,9 @@ class TestFormS1ParserExtractOfferingInfo:
         </body>
         </html>
         """
-        soup = BeautifulSoup(html, "html.parser")
+        document = extract_document(html)
 
-        result = parser._extract_offering_info(soup)
+        result = parser._extract_offering_info(document)
 
         assert "amount" in result
         # May or may not extract amount depending on pattern
@@ -188,7 +188,7 @@ class TestFormS1ParserExtractOfferingInfo:
     def test_extract_price_range(self):
         """Test extracting price range."""
         parser = FormS1Parser()
-        from bs4 import BeautifulSoup
+        from app.ingestion.html_extractor import extract_document
 
         html = """
         <html>
@@ -197,9 +197,9 @@ class TestFormS1ParserExtractOfferingInfo:
         </body>
         </html>
         """
-        soup = BeautifulSoup(html, "html.parser")
+        document = extract_document(html)
 
-        result = parser._extract_offering_info(soup)
+        result = parser._extract_offering_info(document)
 
         assert "price_range" in result
         # May or may not extract price range depending on pattern
@@ -211,7 +211,7 @@ class TestFormS1ParserExtractRiskFactors:
     def test_extract_risk_factors(self):
         """Test extracting risk factors."""
         parser = FormS1Parser()
-        from bs4 import BeautifulSoup
+        from app.ingestion.html_extractor import extract_document
 
         html = """
         <html>
@@ -223,9 +223,9 @@ class TestFormS1ParserExtractRiskFactors:
         </body>
         </html>
         """
-        soup = BeautifulSoup(html, "html.parser")
+        document = extract_document(html)
 
-        result = parser._extract_risk_factors(soup)
+        result = parser._extract_risk_factors(document)
 
         assert isinstance(result, list)
         # May or may not extract risk factors depending on pattern
@@ -233,7 +233,7 @@ class TestFormS1ParserExtractRiskFactors:
     def test_extract_use_of_proceeds(self):
         """Test extracting use of proceeds."""
         parser = FormS1Parser()
-        from bs4 import BeautifulSoup
+        from app.ingestion.html_extractor import extract_document
 
         html = """
         <html>
@@ -243,9 +243,9 @@ class TestFormS1ParserExtractRiskFactors:
         </body>
         </html>
         """
-        soup = BeautifulSoup(html, "html.parser")
+        document = extract_document(html)
 
-        result = parser._extract_use_of_proceeds(soup)
+        result = parser._extract_use_of_proceeds(document)
 
         assert isinstance(result, str)
         # May or may not extract use of proceeds depending on pattern
@@ -4,10 +4,13 @@ Tests for health check module.
 Tests verify health check endpoints and component health status.
 """
 
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 from app.utils.health import (
     HealthCheckHandler,
+    HealthMonitor,
     get_health_status,
     start_health_check_server,
     stop_health_check_server,
@@ -102,3 +105,165 @@ class TestHealthCheckServer:
             pass  # Expected if port in use
         finally:
             stop_health_check_server()
+
+
+def _fake_store(count=3):
+    """Create a fake vector store."""
+    store = MagicMock()
+    store.count.return_value = count
+    store.collection_name = "documents"
+    return store
+
+
+class TestHealthMonitor:
+    """Test the cached, background-refreshed health monitor."""
+
+    def _create_monitor(self, **kwargs):
+        """Create a monitor whose Ollama check always succeeds."""
+        monitor = HealthMonitor(store=_fake_store(), **kwargs)
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"models": [{"name": "llama3.2"}]}
+        monitor._session = MagicMock()
+        monitor._session.get.return_value = response
+        return monitor
+
+    def test_snapshot_before_first_refresh(self):
+        """Test probes before any refresh report not ready."""
+        monitor = self._create_monitor()
+        health = monitor.snapshot()
+        assert health["status"] == "unhealthy"
+        assert health["checked_at"] is None
+        assert health["stale"] is True
+        assert monitor.readiness()["status"] == "not_ready"
+
+    @patch("app.vector_db.create_vector_store")
+    def test_refresh_reuses_store_and_session(self, mock_create):
+        """Test refreshes check the shared store instead of opening one."""
+        monitor = self._create_monitor()
+        monitor.refresh()
+        monitor.refresh()
+
+        mock_create.assert_not_called()
+        assert monitor._store.count.call_count == 2
+        assert monitor._session.get.call_count == 2
+        health = monitor.snapshot()
+        assert health["components"]["chromadb"]["document_count"] == 3
+        assert health["components"]["ollama"]["models_available"] == 1
+
+        store = _fake_store(count=7)
+        monitor.set_store(store)
+        monitor.refresh()
+        assert monitor.snapshot()["components"]["chromadb"]["document_count"] == 7
+
+    @patch("app.vector_db.create_vector_store")
+    def test_store_not_opened_by_monitor(self, mock_create):
+        """Test the check waits for set_store instead of opening a store."""
+        monitor = HealthMonitor()
+
+        assert monitor.check_chromadb() == {
+            "status": "unhealthy",
+            "error": "Vector store not initialized",
+        }
+        mock_create.assert_not_called()
+
+        monitor.set_store(_fake_store())
+        assert monitor.check_chromadb()["status"] == "healthy"
+
+    @patch("app.utils.health.config")
+    def test_probes_do_not_run_checks(self, mock_config):
+        """Test snapshots and readiness are served from the cache."""
+        mock_config.llm_provider = "ollama"
+        mock_config.embedding_provider = "ollama"
+        monitor = self._create_monitor(stale_seconds=60)
+        monitor.refresh()
+        monitor._store.count.side_effect = AssertionError("store queried")
+        monitor._session.get.side_effect = AssertionError("Ollama queried")
+
+        for _ in range(100):
+            health = monitor.snapshot()
+            readiness = monitor.readiness()
+        assert health["status"] == "healthy"
+        assert health["stale"] is False
+        assert health["age_seconds"] >= 0
+        assert readiness["status"] == "ready"
+
+    @patch("app.utils.health.config")
+    def test_unhealthy_components(self, mock_config):
+        """Test readiness reflects cached component failures."""
+        mock_config.llm_provider = "ollama"
+        mock_config.embedding_provider = "ollama"
+        monitor = self._create_monitor()
+        monitor._session.get.side_effect = ConnectionError("refused")
+        monitor.refresh()
+
+        health = monitor.snapshot()
+        assert health["status"] == "unhealthy"
+        assert health["components"]["ollama"]["error"] == "refused"
+        assert monitor.readiness()["reason"] == "Ollama service not available"
+
+        mock_config.llm_provider = "openai"
+        monitor.refresh()
+        assert monitor.readiness()["status"] == "ready"
+
+    def test_stale_snapshot(self):
+        """Test an old snapshot is reported stale and fails readiness."""
+        monitor = self._create_monitor(stale_seconds=30)
+        monitor.refresh()
+        monitor._snapshot["timestamp"] -= 120
+
+        health = monitor.snapshot()
+        assert health["stale"] is True
+        assert health["status"] == "unhealthy"
+        assert "stale" in health["reason"]
+        readiness = monitor.readiness()
+        assert readiness["status"] == "not_ready"
+        assert readiness["age_seconds"] >= 120
+
+    def test_slow_dependency_does_not_block_probes(self):
+        """Test probes return while a refresh is stuck on a dependency."""
+        monitor = self._create_monitor(interval_seconds=60)
+        release = threading.Event()
+        monitor._store.count.side_effect = lambda: release.wait(5) and 3
+        monitor.start()
+        try:
+            started = time.perf_counter()
+            health = monitor.snapshot()
+            assert time.perf_counter() - started < 0.1
+            assert health["checked_at"] is None
+        finally:
+            release.set()
+            monitor.stop()
+        assert not monitor.running
+
+    def test_background_refresh(self):
+        """Test the background thread refreshes the snapshot."""
+        monitor = self._create_monitor(interval_seconds=0.01)
+        monitor.start()
+        monitor.start()
+        try:
+            deadline = time.time() + 5
+            while monitor._store.count.call_count < 2 and time.time() < deadline:
+                time.sleep(0.01)
+        finally:
+            monitor.stop()
+        assert monitor._store.count.call_count >= 2
+        assert monitor.snapshot()["checked_at"] is not None
+
+    def test_handler_serves_cached_snapshot(self):
+        """Test the HTTP handler answers probes from the monitor."""
+        monitor = self._create_monitor()
+        monitor.refresh()
+        monitor.start = MagicMock()
+        handler = HealthCheckHandler.__new__(HealthCheckHandler)
+        handler.wfile = MagicMock()
+        handler.send_response = MagicMock()
+        handler.send_header = MagicMock()
+        handler.end_headers = MagicMock()
+
+        with patch("app.utils.health.get_health_monitor", return_value=monitor):
+            monitor._store.count.side_effect = AssertionError("store queried")
+            handler._handle_health_check()
+
+        payload = handler.wfile.write.call_args[0][0].decode("utf-8")
+        assert '"checked_at"' in payload
+        assert '"document_count": 3' in payload
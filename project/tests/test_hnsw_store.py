@@ -0,0 +1,409 @@
+"""
+Tests for the hnswlib-backed HNSW vector store and the vector store factory.
+"""
+
+import numpy as np
+import pytest
+from langchain_core.documents import Document
+
+from app.vector_db import (
+    ChromaStore,
+    HNSWStore,
+    HNSWStoreError,
+    VectorStore,
+    VectorStoreError,
+    create_vector_store,
+)
+from app.vector_db.hnsw_store import where_document_to_sql, where_to_sql
+
+pytest.importorskip("hnswlib")
+
+DIMENSIONS = 16
+
+
+def _vectors(n, seed=0):
+    """Clustered random vectors, like real embeddings."""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(10, DIMENSIONS))
+    return (
+        centers[rng.integers(0, 10, n)] + 0.3 * rng.normal(size=(n, DIMENSIONS))
+    ).astype(np.float32)
+
+
+def _documents(n):
+    return [
+        Document(
+            page_content=f"chunk {i} about {'rates' if i % 2 else 'earnings'}",
+            metadata={
+                "index": i,
+                "type": "news_article" if i % 2 else "stock_data",
+                "ticker": ["AAPL", "MSFT", "NVDA"][i % 3],
+            },
+        )
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def populated(tmp_path):
+    """HNSW store with 600 documents and their vectors."""
+    store = HNSWStore(
+        collection_name="test_hnsw", persist_directory=tmp_path, ef_search=32
+    )
+    vectors = _vectors(600)
+    documents = _documents(600)
+    for start in range(0, 600, 200):
+        store.add_documents(
+            documents[start : start + 200],
+            vectors[start : start + 200].tolist(),
+            ids=[f"doc_{i}" for i in range(start, start + 200)],
+        )
+    return store, vectors
+
+
+def _nearest(vectors, query, k, rows=None):
+    stored = vectors.astype(np.float16).astype(np.float32)
+    rows = np.arange(len(vectors)) if rows is None else np.asarray(rows)
+    distances = ((stored[rows] - query) ** 2).sum(axis=1)
+    return [f"doc_{rows[i]}" for i in np.argsort(distances)[:k]]
+
+
+class TestHNSWStore:
+    """Test cases for HNSWStore."""
+
+    def test_is_vector_store(self, populated):
+        store, _ = populated
+        assert isinstance(store, VectorStore)
+        assert issubclass(HNSWStoreError, VectorStoreError)
+        assert store.count() == 600
+
+    def test_recall_against_brute_force(self, populated):
+        store, vectors = populated
+        queries = _vectors(20, seed=1)
+        hits = 0
+        for query in queries:
+            results = store.query_by_embedding(query.tolist(), n_results=10)
+            assert results["distances"] == sorted(results["distances"])
+            hits += len(set(results["ids"]) & set(_nearest(vectors, query, 10)))
+        assert hits / 200 >= 0.95
+
+    def test_query_results_match_chroma_format(self, populated):
+        store, vectors = populated
+        results = store.query_by_embedding(vectors[5].tolist(), n_results=3)
+
+        assert set(results) == {"ids", "distances", "metadatas", "documents"}
+        assert results["ids"][0] == "doc_5"
+        assert results["distances"][0] == pytest.approx(0.0, abs=1e-3)
+        assert results["metadatas"][0]["index"] == 5
+        assert results["documents"][0] == "chunk 5 about rates"
+
+    def test_metadata_filter(self, populated):
+        store, vectors = populated
+        query = vectors[0]
+        results = store.query_by_embedding(
+            query.tolist(), n_results=5, where={"type": "news_article"}
+        )
+
+        odd_rows = list(range(1, 600, 2))
+        assert results["ids"] == _nearest(vectors, query, 5, rows=odd_rows)
+        assert all(m["type"] == "news_article" for m in results["metadatas"])
+
+    def test_compound_filters(self, populated):
+        store, vectors = populated
+        results = store.query_by_embedding(
+            vectors[0].tolist(),
+            n_results=50,
+            where={
+                "$and": [
+                    {"ticker": {"$in": ["AAPL", "MSFT"]}},
+                    {"index": {"$lt": 30}},
+                ]
+            },
+            where_document={"$contains": "earnings"},
+        )
+
+        indexes = sorted(m["index"] for m in results["metadatas"])
+        assert indexes == [i for i in range(0, 30, 2) if i % 3 != 2]
+
+    def test_filtered_graph_search(self, populated, monkeypatch):
+        monkeypatch.setattr("app.vector_db.hnsw_store.EXACT_SEARCH_MAX_ROWS", 0)
+        store, vectors = populated
+        results = store.query_by_embedding(
+            vectors[1].tolist(), n_results=5, where={"ticker": "MSFT"}
+        )
+
+        assert results["ids"][0] == "doc_1"
+        assert all(m["ticker"] == "MSFT" for m in results["metadatas"])
+
+    def test_duplicate_ids_are_skipped(self, populated):
+        store, vectors = populated
+        store.add_documents(
+            [Document(page_content="replacement")], [vectors[0].tolist()], ["doc_0"]
+        )
+
+        assert store.count() == 600
+        assert store.get_by_ids(["doc_0"])["documents"] == ["chunk 0 about earnings"]
+
+    def test_delete_documents(self, populated):
+        store, vectors = populated
+        assert store.delete_documents(ids=["doc_7", "missing"]) == 1
+        assert store.delete_documents(where={"ticker": "NVDA"}) == 200
+
+        results = store.query_by_embedding(vectors[7].tolist(), n_results=20)
+        assert "doc_7" not in results["ids"]
+        assert all(m["ticker"] != "NVDA" for m in results["metadatas"])
+        assert store.count() == 399
+        with pytest.raises(ValueError):
+            store.delete_documents()
+
+    def test_update_documents(self, populated):
+        store, vectors = populated
+        store.update_documents(
+            ["doc_3", "doc_4"],
+            metadatas=[{"ticker": "TSLA", "type": None}, {"reviewed": True}],
+            documents=["updated text", "chunk 4 reviewed"],
+            embeddings=[vectors[100].tolist(), vectors[4].tolist()],
+        )
+
+        updated = store.get_by_ids(["doc_3", "doc_4"])
+        assert updated["documents"] == ["updated text", "chunk 4 reviewed"]
+        assert updated["metadatas"][0] == {"index": 3, "ticker": "TSLA"}
+        assert updated["metadatas"][1]["reviewed"] is True
+        results = store.query_by_embedding(vectors[100].tolist(), n_results=2)
+        assert set(results["ids"]) == {"doc_3", "doc_100"}
+        assert store.count() == 600
+
+    def test_get_methods(self, populated):
+        store, _ = populated
+        assert store.get_ids_by_metadata({"index": {"$gte": 598}}) == [
+            "doc_598",
+            "doc_599",
+        ]
+        assert len(store.get_ids_by_metadata({"ticker": "AAPL"}, limit=3)) == 3
+        subset = store.get_all(where={"type": "stock_data"}, limit=4)
+        assert subset["ids"] == ["doc_0", "doc_2", "doc_4", "doc_6"]
+        assert store.get_by_ids(["doc_2", "missing", "doc_1"])["ids"] == [
+            "doc_2",
+            "doc_1",
+        ]
+
+    def test_persistence_and_read_only_reader(self, populated, tmp_path):
+        store, vectors = populated
+        reader = HNSWStore(
+            collection_name="test_hnsw", persist_directory=tmp_path, read_only=True
+        )
+        assert reader.count() == 600
+        assert reader.query_by_embedding(vectors[9].tolist(), 1)["ids"] == ["doc_9"]
+
+        new_vector = _vectors(1, seed=7)[0]
+        store.add_documents(
+            [Document(page_content="late", metadata={"index": 600})],
+            [new_vector.tolist()],
+            ids=["doc_600"],
+        )
+        assert reader.query_by_embedding(new_vector.tolist(), 1)["ids"] == ["doc_600"]
+        with pytest.raises(HNSWStoreError):
+            reader.add_documents([Document(page_content="x")], [[0.0] * DIMENSIONS])
+
+    def test_validation_errors(self, populated):
+        store, _ = populated
+        with pytest.raises(HNSWStoreError):
+            store.add_documents([], [])
+        with pytest.raises(HNSWStoreError):
+            store.add_documents([Document(page_content="x")], [[0.0] * 3])
+        with pytest.raises(HNSWStoreError):
+            store.query_by_embedding([0.0] * 3)
+        with pytest.raises(HNSWStoreError):
+            store.query_by_text("no embedding function")
+
+    def test_cosine_space(self, tmp_path):
+        store = HNSWStore(
+            collection_name="cosine", persist_directory=tmp_path, space="cosine"
+        )
+        store.add_documents(
+            [Document(page_content="a"), Document(page_content="b")],
+            [[1.0, 0.0], [0.0, 3.0]],
+            ids=["a", "b"],
+        )
+
+        results = store.query_by_embedding([0.0, 0.5], n_results=2)
+        assert results["ids"] == ["b", "a"]
+        assert results["distances"] == pytest.approx([0.0, 1.0], abs=1e-3)
+
+    def test_reset_and_delete_collection(self, populated, tmp_path):
+        store, vectors = populated
+        store.reset()
+        assert store.count() == 0
+        assert store.query_by_embedding(vectors[0].tolist())["ids"] == []
+
+        store.delete_collection()
+        assert not (tmp_path / "test_hnsw").exists()
+        with pytest.raises(HNSWStoreError, match="not initialized"):
+            store.count()
+
+    def test_sync_threshold(self, tmp_path):
+        store = HNSWStore(
+            collection_name="synced", persist_directory=tmp_path, sync_threshold=100
+        )
+        reader = None
+        vectors = _vectors(250)
+        documents = _documents(250)
+        for start in range(0, 250, 50):
+            store.add_documents(
+                documents[start : start + 50],
+                vectors[start : start + 50].tolist(),
+                ids=[f"doc_{i}" for i in range(start, start + 50)],
+            )
+            if reader is None:
+                reader = HNSWStore(
+                    collection_name="synced",
+                    persist_directory=tmp_path,
+                    read_only=True,
+                )
+            # The reader catches up before and after the index is saved
+            for row in (0, start, start + 49):
+                results = reader.query_by_embedding(vectors[row].tolist(), 1)
+                assert results["ids"] == [f"doc_{row}"]
+
+        # index.bin was saved at 200 rows; vectors.f16 holds all 250
+        assert (tmp_path / "synced" / "index.bin").exists()
+        assert (tmp_path / "synced" / "vectors.f16").stat().st_size == (
+            250 * DIMENSIONS * 2
+        )
+        assert store._state()["index_rows"] == "200"
+        store.delete_documents(ids=["doc_3"])
+        assert reader.query_by_embedding(vectors[3].tolist(), 1)["ids"] != ["doc_3"]
+
+        reopened = HNSWStore(
+            collection_name="synced", persist_directory=tmp_path, read_only=True
+        )
+        assert reopened.count() == 249
+        query = _vectors(1, seed=3)[0]
+        assert reopened.query_by_embedding(query.tolist(), 10)["ids"] == (
+            store.query_by_embedding(query.tolist(), 10)["ids"]
+        )
+
+    def test_vectors_are_memory_mapped(self, populated, tmp_path):
+        store, vectors = populated
+        reader = HNSWStore(
+            collection_name="test_hnsw", persist_directory=tmp_path, read_only=True
+        )
+
+        assert isinstance(reader._vectors, np.memmap)
+        assert reader._vectors.dtype == np.float16
+        np.testing.assert_array_equal(reader._vectors[:600], vectors.astype(np.float16))
+        results = reader.query_by_embedding(
+            vectors[8].tolist(), n_results=3, where={"ticker": "NVDA"}
+        )
+        assert results["ids"][0] == "doc_8"
+
+    def test_int8_quantization(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("app.vector_db.hnsw_store.QUANTIZER_MIN_ROWS", 300)
+        store = HNSWStore(
+            collection_name="quantized",
+            persist_directory=tmp_path,
+            quantization="int8",
+            rescore_factor=4,
+        )
+        vectors = _vectors(600)
+        documents = _documents(600)
+        store.add_documents(
+            documents[:200], vectors[:200].tolist(), [f"doc_{i}" for i in range(200)]
+        )
+        assert store._quantizer is None
+        reader = HNSWStore(
+            collection_name="quantized", persist_directory=tmp_path, read_only=True
+        )
+        store.add_documents(
+            documents[200:],
+            vectors[200:].tolist(),
+            [f"doc_{i}" for i in range(200, 600)],
+        )
+
+        assert store._quantizer is not None
+        assert (tmp_path / "quantized" / "codes.u8").stat().st_size == 600 * 16
+        queries = _vectors(20, seed=3)
+        hits = 0
+        for query in queries:
+            results = store.query_by_embedding(query.tolist(), n_results=10)
+            hits += len(set(results["ids"]) & set(_nearest(vectors, query, 10)))
+        assert hits / 200 >= 0.95
+        # Returned distances are float16 ones, not the first-stage ones
+        exact = _nearest(vectors, queries[0], 1)[0]
+        results = store.query_by_embedding(queries[0].tolist(), n_results=1)
+        stored = vectors[int(exact[4:])].astype(np.float16).astype(np.float32)
+        assert results["ids"] == [exact]
+        assert results["distances"][0] == pytest.approx(
+            ((stored - queries[0]) ** 2).sum(), rel=1e-3
+        )
+        # Filtered exact search ranks the codes too
+        filtered = store.query_by_embedding(
+            queries[0].tolist(), n_results=5, where={"ticker": "AAPL"}
+        )
+        assert filtered["ids"] == _nearest(
+            vectors, queries[0], 5, rows=range(0, 600, 3)
+        )
+
+        # A reader opened before the quantizer was fitted reloads the index
+        assert reader.query_by_embedding(queries[0].tolist(), 10)["ids"] == (
+            store.query_by_embedding(queries[0].tolist(), 10)["ids"]
+        )
+        assert reader._index_quantized
+        reopened = HNSWStore(
+            collection_name="quantized", persist_directory=tmp_path, read_only=True
+        )
+        assert reopened.quantization == "int8"
+        np.testing.assert_array_equal(reopened._quantizer, store._quantizer)
+        assert reopened.query_by_embedding(queries[0].tolist(), 10)["ids"] == (
+            store.query_by_embedding(queries[0].tolist(), 10)["ids"]
+        )
+
+    def test_invalid_quantization(self, tmp_path):
+        with pytest.raises(HNSWStoreError, match="Invalid quantization"):
+            HNSWStore(persist_directory=tmp_path, quantization="pq")
+
+    def test_requires_hnswlib(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            "app.vector_db.hnsw_store.is_available", lambda *names: False
+        )
+        with pytest.raises(HNSWStoreError, match="pip install hnswlib"):
+            HNSWStore(persist_directory=tmp_path)
+        with pytest.raises(HNSWStoreError, match="hnswlib is required"):
+            create_vector_store("factory", tmp_path, backend="hnsw")
+        assert not (tmp_path / "factory").exists()
+
+    def test_invalid_space(self, tmp_path):
+        with pytest.raises(HNSWStoreError, match="Invalid space"):
+            HNSWStore(persist_directory=tmp_path, space="hamming")
+
+    def test_filter_translation(self):
+        sql, params = where_to_sql({"ticker": "AAPL", "year": {"$gte": 2020}})
+        assert sql == "json_extract(metadata, ?) = ? AND json_extract(metadata, ?) >= ?"
+        assert params == ['$."ticker"', "AAPL", '$."year"', 2020]
+        assert where_to_sql({"ticker": {"$nin": []}}) == ("1", [])
+        sql, params = where_document_to_sql({"$not_contains": "draft"})
+        assert sql == "instr(document, ?) = 0"
+        with pytest.raises(HNSWStoreError):
+            where_to_sql({"ticker": {"$regex": "A.*"}})
+
+
+class TestCreateVectorStore:
+    """Test cases for create_vector_store."""
+
+    def test_backends(self, tmp_path):
+        assert isinstance(
+            create_vector_store("factory", tmp_path / "hnsw", backend="hnsw"),
+            HNSWStore,
+        )
+        assert isinstance(
+            create_vector_store("factory", tmp_path / "chroma", backend="chroma"),
+            ChromaStore,
+        )
+
+    def test_configured_backend(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("app.vector_db.factory.config.vector_store_backend", "hnsw")
+        assert isinstance(create_vector_store("factory", tmp_path), HNSWStore)
+
+    def test_unknown_backend(self):
+        with pytest.raises(VectorStoreError, match="Unknown vector store backend"):
+            create_vector_store(backend="pinecone")
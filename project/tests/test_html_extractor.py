@@ -0,0 +1,181 @@
+"""
+Tests for the shared structure-preserving HTML extraction engine.
+"""
+
+import pytest
+from langchain_core.documents import Document
+
+from app.ingestion.document_loader import SECTION_OFFSETS_KEY, DocumentLoader
+from app.ingestion.html_extractor import (
+    ExtractedDocument,
+    HtmlExtractionError,
+    HtmlTextExtractor,
+    extract_document,
+    extract_html,
+    looks_like_html,
+)
+
+FILING_HTML = """
+<html>
+<head><title>10-K</title><style>p { color: red; }</style></head>
+<body>
+<div style="display:none">
+<ix:header><ix:hidden>HIDDEN XBRL</ix:hidden></ix:header>
+</div>
+<p>Apple Inc. <b>Annual</b> Report&nbsp;2024</p>
+<table>
+  <tr><td>Item 1.</td><td>Business</td><td>1</td></tr>
+  <tr><td>Item 1A.</td><td>Risk Factors</td><td>5</td></tr>
+</table>
+<p><b>PART I</b></p>
+<div><span style="font-weight:bold">Item 1. Business</span></div>
+<p>We design <i>smartphones</i>.<br/>And services.</p>
+<script>var x = 1;</script>
+<div><span>Item 1A. Risk Factors</span></div>
+<p>Competition is intense.</p>
+<h3>Net Sales</h3>
+<table>
+  <tr><th>Year</th><th>Net sales</th></tr>
+  <tr><td>2024</td><td>$ <ix:nonFraction>391,035</ix:nonFraction></td></tr>
+</table>
+</body>
+</html>
+"""
+
+
+class TestHtmlExtraction:
+    """Test text layout of extracted HTML."""
+
+    def test_text_layout(self):
+        """Test paragraphs, entities and inline markup are normalized."""
+        document = extract_html(FILING_HTML)
+
+        assert "Apple Inc. Annual Report 2024\n\n" in document.text
+        assert "We design smartphones.\n\nAnd services." in document.text
+        assert "<" not in document.text
+
+    def test_hidden_content_is_dropped(self):
+        """Test scripts, styles, head and hidden XBRL headers are removed."""
+        text = extract_html(FILING_HTML).text
+
+        for dropped in ("HIDDEN XBRL", "var x", "color: red", "10-K\n"):
+            assert dropped not in text
+
+    def test_tables_keep_rows_and_columns(self):
+        """Test table rows become lines with cells joined by pipes."""
+        document = extract_html(FILING_HTML)
+
+        assert "Item 1A. | Risk Factors | 5\n" in document.text
+        assert "Year | Net sales\n2024 | $ 391,035\n" in document.text
+        assert document.table_count == 2
+
+    def test_sections(self):
+        """Test SEC item lines and <h*> tags start sections with offsets."""
+        document = extract_html(FILING_HTML)
+
+        titles = [(s.title, s.level) for s in document.sections]
+        # Table-of-contents rows are not sections
+        assert titles == [
+            ("PART I", 1),
+            ("Item 1. Business", 2),
+            ("Item 1A. Risk Factors", 2),
+            ("Net Sales", 3),
+        ]
+        for section in document.sections:
+            assert document.section_text(section).startswith(section.title)
+        risk = document.section_text(document.sections[2])
+        assert "Competition is intense." in risk
+        assert "Net sales" not in risk
+
+    def test_iter_sections_covers_text(self):
+        """Test the preamble and sections concatenate to the full text."""
+        document = extract_html(FILING_HTML)
+
+        parts = list(document.iter_sections())
+
+        assert parts[0][0] == ""
+        assert "".join(text for _, text in parts) == document.text
+
+    def test_streaming_matches_single_feed(self, monkeypatch):
+        """Test output does not depend on how the markup is chunked."""
+        expected = extract_html(FILING_HTML)
+        monkeypatch.setattr("app.ingestion.html_extractor.FEED_CHUNK_SIZE", 7)
+
+        chunked = extract_html(FILING_HTML)
+
+        assert chunked.text == expected.text
+        assert chunked.sections == expected.sections
+
+    def test_keep_tree(self):
+        """Test the parsed tree is only kept on request."""
+        html = "<html><body><transactionShares>100</transactionShares></body></html>"
+
+        assert list(extract_html(html).iter_elements("transactionShares")) == []
+        kept = extract_html(html, keep_tree=True)
+        elements = list(kept.iter_elements("transactionShares"))
+        assert [element.text for element in elements] == ["100"]
+
+    def test_empty_and_missing_markup(self):
+        """Test empty markup yields empty text and None raises."""
+        assert extract_html("").text == ""
+        with pytest.raises(HtmlExtractionError):
+            HtmlTextExtractor().extract(None)
+
+
+class TestExtractDocument:
+    """Test content sniffing and plain-text documents."""
+
+    def test_looks_like_html(self):
+        """Test HTML is detected by content rather than extension."""
+        assert looks_like_html("<SEC-DOCUMENT>\n<TEXT>\n<html><body>x</body>")
+        assert not looks_like_html("ITEM 1. BUSINESS\nPlain text filing")
+
+    def test_plain_text_sections(self):
+        """Test plain-text filings get line-based section offsets."""
+        text = "Cover\nPART I\nItem 1. Business\nWe sell.\nItem 7. MD&A\nResults.\n"
+
+        document = extract_document(text)
+
+        assert document.text == text
+        assert [s.title for s in document.sections] == [
+            "PART I",
+            "Item 1. Business",
+            "Item 7. MD&A",
+        ]
+        assert document.section_text(document.sections[2]) == "Item 7. MD&A\nResults.\n"
+
+
+class TestSectionChunking:
+    """Test chunking along extracted section boundaries."""
+
+    def test_chunks_do_not_cross_sections(self):
+        """Test each section is split separately and tagged with its title."""
+        document = ExtractedDocument.from_text(
+            "Cover page\n"
+            "Item 1. Business\n" + "We sell devices. " * 20 + "\n"
+            "Item 1A. Risk Factors\n" + "Risks abound. " * 20 + "\n"
+        )
+        loader = DocumentLoader(chunk_size=200, chunk_overlap=0)
+
+        chunks = loader.chunk_document(
+            Document(
+                page_content=document.text + "appended data",
+                metadata={
+                    "ticker": "AAPL",
+                    SECTION_OFFSETS_KEY: document.section_offsets(),
+                },
+            )
+        )
+
+        assert [c.metadata["chunk_index"] for c in chunks] == list(range(len(chunks)))
+        assert all(SECTION_OFFSETS_KEY not in c.metadata for c in chunks)
+        assert chunks[0].page_content == "Cover page"
+        assert "section" not in chunks[0].metadata
+        assert chunks[-1].page_content == "appended data"
+        for chunk in chunks[1:-1]:
+            section = chunk.metadata["section"]
+            if "devices" in chunk.page_content:
+                assert section == "Item 1. Business"
+                assert "Risks" not in chunk.page_content
+            if "Risks" in chunk.page_content:
+                assert section == "Item 1A. Risk Factors"
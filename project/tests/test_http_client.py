@@ -0,0 +1,211 @@
+"""
+Tests for the shared cached HTTP client.
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from app.utils.http_client import (
+    CACHE_MODE_RECORD,
+    CACHE_MODE_REPLAY,
+    CachedSession,
+    HttpCache,
+    HttpReplayMissError,
+    compile_patterns,
+    create_http_session,
+    parse_host_rate_limits,
+)
+from app.utils.rate_limiter import get_rate_limiter
+
+
+def _response(body=b"{}", status=200, headers=None, url="https://example.com"):
+    """Build a real requests.Response."""
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.headers.update(headers or {"Content-Type": "application/json"})
+    response.encoding = "utf-8"
+    response.url = url
+    return response
+
+
+@pytest.fixture
+def network():
+    """Patch the wrapped requests.Session and return its get mock."""
+    with patch("app.utils.http_client.requests.Session") as session_class:
+        session = MagicMock()
+        session.headers = {}
+        session_class.return_value = session
+        yield session.get
+
+
+def _session(tmp_path, **kwargs):
+    return CachedSession(cache=HttpCache(tmp_path / "cache"), **kwargs)
+
+
+class TestCachedSession:
+    """Test cache behavior of CachedSession."""
+
+    def test_miss_then_hit(self, tmp_path, network):
+        """Test a cached response is served without touching the network."""
+        network.return_value = _response(b'{"a": 1}')
+        session = _session(tmp_path)
+
+        first = session.get("https://example.com/data", params={"q": "x"})
+        second = session.get("https://example.com/data", params={"q": "x"})
+
+        assert network.call_count == 1
+        assert first.json() == second.json() == {"a": 1}
+        assert getattr(second, "from_cache", False) is True
+        assert second.url == "https://example.com/data?q=x"
+
+    def test_immutable_urls_never_expire(self, tmp_path, network):
+        """Test immutable URLs are served from cache even with ttl=0."""
+        network.return_value = _response(b"filing text")
+        session = _session(
+            tmp_path,
+            ttl_seconds=0,
+            immutable_patterns=compile_patterns(r"^https://www\.sec\.gov/Archives/"),
+        )
+        url = "https://www.sec.gov/Archives/edgar/data/1/2/doc.htm"
+
+        session.get(url)
+        assert session.get(url).text == "filing text"
+        assert network.call_count == 1
+
+    def test_stale_entry_revalidates_with_etag(self, tmp_path, network):
+        """Test stale entries send validators and 304 serves the cache."""
+        network.side_effect = [
+            _response(b"v1", headers={"ETag": '"abc"'}),
+            _response(b"", status=304),
+        ]
+        session = _session(tmp_path, ttl_seconds=0)
+
+        session.get("https://example.com/page")
+        response = session.get("https://example.com/page")
+
+        assert response.content == b"v1"
+        assert network.call_args.kwargs["headers"]["If-None-Match"] == '"abc"'
+
+    def test_errors_are_not_cached(self, tmp_path, network):
+        """Test non-200 responses always go to the network."""
+        network.return_value = _response(b"nope", status=500)
+        session = _session(tmp_path)
+
+        session.get("https://example.com/fail")
+        session.get("https://example.com/fail")
+
+        assert network.call_count == 2
+
+    def test_bodies_are_content_addressed(self, tmp_path, network):
+        """Test identical bodies from different URLs are stored once."""
+        network.return_value = _response(b"same body")
+        session = _session(tmp_path)
+
+        session.get("https://example.com/a")
+        session.get("https://example.com/b")
+
+        blobs = [p for p in (tmp_path / "cache" / "blobs").rglob("*") if p.is_file()]
+        assert len(blobs) == 1
+
+    def test_secret_params_are_redacted(self, tmp_path, network):
+        """Test API keys are not written to cache entries."""
+        network.return_value = _response()
+        session = _session(tmp_path)
+
+        session.get("https://example.com/api", params={"api_key": "s3cret", "q": 1})
+
+        entry_file = next((tmp_path / "cache" / "entries").rglob("*.json"))
+        stored_url = json.loads(entry_file.read_text())["url"]
+        assert "s3cret" not in stored_url
+        assert "q=1" in stored_url
+
+    def test_record_mode_always_fetches(self, tmp_path, network):
+        """Test record mode refreshes entries from the network."""
+        network.side_effect = [_response(b"old"), _response(b"new")]
+        session = _session(tmp_path, mode=CACHE_MODE_RECORD)
+
+        session.get("https://example.com/x")
+        session.get("https://example.com/x")
+
+        assert network.call_count == 2
+        replay = _session(tmp_path, mode=CACHE_MODE_REPLAY)
+        assert replay.get("https://example.com/x").content == b"new"
+
+    def test_replay_mode_is_offline(self, tmp_path, network):
+        """Test replay serves recorded responses and fails on misses."""
+        network.return_value = _response(b"recorded")
+        _session(tmp_path).get("https://example.com/r")
+        network.reset_mock()
+
+        replay = _session(tmp_path, mode=CACHE_MODE_REPLAY)
+        assert replay.get("https://example.com/r").content == b"recorded"
+        with pytest.raises(requests.exceptions.RequestException):
+            replay.get("https://example.com/missing")
+        with pytest.raises(HttpReplayMissError):
+            replay.get("https://example.com/missing")
+        network.assert_not_called()
+
+    def test_cache_hits_are_not_throttled(self, tmp_path, network):
+        """Test only network requests consume rate-limit tokens."""
+        network.return_value = _response()
+        session = _session(tmp_path, requests_per_second=1)
+
+        with patch.object(session, "throttle", return_value=0.0) as throttle:
+            session.get("https://example.com/t")
+            session.get("https://example.com/t")
+
+        throttle.assert_called_once()
+
+    def test_invalid_mode(self, tmp_path):
+        """Test unknown cache modes are rejected."""
+        with pytest.raises(ValueError):
+            _session(tmp_path, mode="sometimes")
+
+
+class TestRateLimits:
+    """Test per-host rate limit resolution."""
+
+    def test_parse_host_rate_limits(self):
+        """Test host=rate rules are parsed and invalid rules skipped."""
+        assert parse_host_rate_limits("sec.gov=10, api.x.com=2,bad") == {
+            "sec.gov": 10.0,
+            "api.x.com": 2.0,
+        }
+
+    def test_subdomains_share_host_limiter(self, tmp_path):
+        """Test www.sec.gov and data.sec.gov share the sec.gov limiter."""
+        session = _session(tmp_path, host_rate_limits={"sec.gov": 10})
+
+        www = session._limiter_for("https://www.sec.gov/Archives/x")
+        data = session._limiter_for("https://data.sec.gov/submissions/x.json")
+
+        assert www is data is get_rate_limiter("sec.gov", 10)
+        assert session._limiter_for("https://example.com/") is None
+
+    def test_unlisted_hosts_use_session_rate(self, tmp_path):
+        """Test hosts without a rule are limited at the session rate."""
+        session = _session(tmp_path, requests_per_second=2)
+        assert session._limiter_for("https://example.com/a").rate == 2
+
+
+class TestCreateHttpSession:
+    """Test the config-driven session factory."""
+
+    def test_uses_config(self, tmp_path, monkeypatch):
+        """Test the factory applies cache dir and mode from config."""
+        from app.utils.config import config
+
+        monkeypatch.setattr(config, "http_cache_dir", str(tmp_path / "c"))
+        monkeypatch.setattr(config, "http_cache_mode", "replay")
+        monkeypatch.setattr(config, "http_cache_enabled", False)
+
+        session = create_http_session()
+
+        # Replay forces the cache on
+        assert session.cache is not None
+        assert session.cache.root == tmp_path / "c"
+        assert session.mode == CACHE_MODE_REPLAY
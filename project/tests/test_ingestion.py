@@ -61,7 +61,7 @@ def test_markdown_file_loading(sample_markdown_file):
 @pytest.mark.unit
 def test_file_size_validation(test_documents_dir):
     """Test file size validation."""
-    loader = DocumentLoader()
+    loader = DocumentLoader(max_file_size_bytes=10 * 1024 * 1024)
 
     # Create a file that exceeds the size limit
     large_file = test_documents_dir / "large_file.txt"
@@ -0,0 +1,283 @@
+"""
+Tests for resumable bulk ingestion jobs and the job API.
+"""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.services.ingestion_jobs import (
+    STATUS_COMPLETED,
+    STATUS_COMPLETED_WITH_ERRORS,
+    STATUS_FAILED,
+    STATUS_PENDING,
+    STATUS_RUNNING,
+    IngestionJobError,
+    IngestionJobManager,
+    JobJournal,
+)
+from app.utils.config import config
+
+
+def _wait_for_job(manager, job_id, timeout=10.0):
+    """Poll until a job reaches a terminal state."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = manager.get_job(job_id)
+        if job["status"] not in (STATUS_PENDING, STATUS_RUNNING):
+            return job
+        time.sleep(0.02)
+    raise AssertionError(f"Job {job_id} did not finish: {job}")
+
+
+@pytest.fixture
+def journal(tmp_path):
+    """Create a job journal in a temporary directory."""
+    journal = JobJournal(db_path=str(tmp_path / "jobs.db"))
+    yield journal
+    journal.close()
+
+
+@pytest.fixture
+def mock_pipeline():
+    """Create a mock ingestion pipeline."""
+    pipeline = MagicMock()
+    pipeline.process_document.return_value = ["c1", "c2"]
+    pipeline.process_stock_data.return_value = ["s1"]
+    pipeline.process_news.return_value = ["n1", "n2", "n3"]
+    return pipeline
+
+
+class TestJobJournal:
+    """Test SQLite job journal."""
+
+    def test_create_and_get_job(self, journal):
+        """Test job creation and aggregated progress."""
+        job_id = journal.create_job(
+            [
+                {"kind": "document", "target": "a.txt"},
+                {"kind": "ticker", "target": "AAPL"},
+            ],
+            options={"store_embeddings": False},
+        )
+
+        job = journal.get_job(job_id)
+        assert job["status"] == STATUS_PENDING
+        assert job["total_items"] == 2
+        assert job["pending_items"] == 2
+        assert job["options"] == {"store_embeddings": False}
+
+    def test_checkpoint_item(self, journal):
+        """Test per-item checkpoints update progress."""
+        job_id = journal.create_job(
+            [{"kind": "document", "target": "a.txt"}] * 3, options={}
+        )
+        journal.checkpoint_item(job_id, 0, STATUS_COMPLETED, chunks_created=4)
+        journal.checkpoint_item(job_id, 1, STATUS_FAILED, error="boom")
+
+        job = journal.get_job(job_id)
+        assert job["completed_items"] == 1
+        assert job["failed_items"] == 1
+        assert job["pending_items"] == 1
+        assert job["chunks_created"] == 4
+        assert [item["seq"] for item in journal.next_items(job_id)] == [2]
+
+    def test_get_missing_job(self, journal):
+        """Test missing job returns None."""
+        assert journal.get_job("missing") is None
+
+
+class TestIngestionJobManager:
+    """Test background job execution."""
+
+    def test_submit_processes_all_items(self, journal, mock_pipeline):
+        """Test job dispatches each item kind to the pipeline."""
+        manager = IngestionJobManager(
+            journal=journal, pipeline_factory=lambda: mock_pipeline, max_workers=1
+        )
+        try:
+            job_id = manager.submit(
+                file_paths=[str(config.DOCUMENTS_DIR / "a.txt")],
+                tickers=["aapl"],
+                feed_urls=["http://feed"],
+            )
+            job = _wait_for_job(manager, job_id)
+        finally:
+            manager.shutdown()
+
+        assert job["status"] == STATUS_COMPLETED
+        assert job["completed_items"] == 3
+        assert job["chunks_created"] == 6
+        mock_pipeline.process_stock_data.assert_called_once_with(
+            "AAPL", store_embeddings=True
+        )
+        mock_pipeline.process_news.assert_called_once_with(
+            feed_urls=["http://feed"], store_embeddings=True
+        )
+        mock_pipeline.close.assert_called_once()
+
+    def test_failed_item_does_not_stop_job(self, journal, mock_pipeline):
+        """Test item failures are recorded and processing continues."""
+        mock_pipeline.process_document.side_effect = [
+            Exception("bad file"),
+            ["c1"],
+        ]
+        manager = IngestionJobManager(
+            journal=journal, pipeline_factory=lambda: mock_pipeline, max_workers=1
+        )
+        try:
+            job_id = manager.submit(
+                file_paths=[
+                    str(config.DOCUMENTS_DIR / "bad.txt"),
+                    str(config.DOCUMENTS_DIR / "good.txt"),
+                ]
+            )
+            job = _wait_for_job(manager, job_id)
+            items = manager.get_job(job_id, include_items=True)["items"]
+        finally:
+            manager.shutdown()
+
+        assert job["status"] == STATUS_COMPLETED_WITH_ERRORS
+        assert job["failed_items"] == 1
+        assert job["completed_items"] == 1
+        assert items[0]["error"] == "bad file"
+
+    def test_resume_skips_completed_items(self, journal, mock_pipeline):
+        """Test a restarted manager resumes from the first unfinished item."""
+        job_id = journal.create_job(
+            [{"kind": "document", "target": f"doc{i}.txt"} for i in range(4)],
+            options={"store_embeddings": True},
+        )
+        # Simulate a crash: two items done, one in flight, job still running
+        journal.set_job_status(job_id, STATUS_RUNNING)
+        journal.checkpoint_item(job_id, 0, STATUS_COMPLETED, chunks_created=2)
+        journal.checkpoint_item(job_id, 1, STATUS_COMPLETED, chunks_created=2)
+        journal.checkpoint_item(job_id, 2, STATUS_RUNNING)
+
+        manager = IngestionJobManager(
+            journal=journal, pipeline_factory=lambda: mock_pipeline, max_workers=1
+        )
+        try:
+            assert manager.resume_unfinished_jobs() == [job_id]
+            job = _wait_for_job(manager, job_id)
+        finally:
+            manager.shutdown()
+
+        processed = [
+            call.args[0].name for call in mock_pipeline.process_document.call_args_list
+        ]
+        assert processed == ["doc2.txt", "doc3.txt"]
+        assert job["status"] == STATUS_COMPLETED
+        assert job["completed_items"] == 4
+
+    def test_resume_fails_job_after_max_attempts(self, journal, mock_pipeline):
+        """Test a job whose item keeps crashing is failed instead of resumed."""
+        job_id = journal.create_job(
+            [{"kind": "document", "target": f"doc{i}.txt"} for i in range(3)],
+            options={"store_embeddings": True},
+        )
+        # Simulate three crashes while item 1 was in flight
+        journal.set_job_status(job_id, STATUS_RUNNING)
+        journal.checkpoint_item(job_id, 0, STATUS_COMPLETED, chunks_created=2)
+        for _ in range(3):
+            journal.checkpoint_item(job_id, 1, STATUS_RUNNING)
+
+        manager = IngestionJobManager(
+            journal=journal,
+            pipeline_factory=lambda: mock_pipeline,
+            max_workers=1,
+            max_attempts=3,
+        )
+        try:
+            assert manager.resume_unfinished_jobs() == []
+            job = manager.get_job(job_id, include_items=True)
+        finally:
+            manager.shutdown()
+
+        mock_pipeline.process_document.assert_not_called()
+        assert job["status"] == STATUS_FAILED
+        assert "exceeded max attempts" in job["error"]
+        assert job["items"][1]["status"] == STATUS_FAILED
+        assert journal.unfinished_job_ids() == []
+
+    def test_submit_empty_job_raises(self, journal):
+        """Test empty batches are rejected."""
+        manager = IngestionJobManager(journal=journal, pipeline_factory=MagicMock)
+        try:
+            with pytest.raises(IngestionJobError):
+                manager.submit()
+        finally:
+            manager.shutdown()
+
+    def test_submit_rejects_path_outside_documents_dir(self, journal):
+        """Test file paths escaping the documents directory are rejected."""
+        manager = IngestionJobManager(journal=journal, pipeline_factory=MagicMock)
+        try:
+            with pytest.raises(IngestionJobError):
+                manager.submit(file_paths=[str(config.DOCUMENTS_DIR / ".." / "x.txt")])
+            with pytest.raises(IngestionJobError):
+                manager.submit(file_paths=["/etc/passwd"])
+        finally:
+            manager.shutdown()
+
+    def test_get_missing_job_raises(self, journal):
+        """Test unknown job IDs raise IngestionJobError."""
+        manager = IngestionJobManager(journal=journal, pipeline_factory=MagicMock)
+        try:
+            with pytest.raises(IngestionJobError):
+                manager.get_job("missing")
+        finally:
+            manager.shutdown()
+
+
+class TestJobEndpoints:
+    """Test job API routes."""
+
+    @pytest.fixture
+    def api_client(self, journal, mock_pipeline):
+        """Create test client with a job manager backed by a temp journal."""
+        from app.api.main import app
+        from app.api.routes.jobs import get_job_manager
+
+        manager = IngestionJobManager(
+            journal=journal, pipeline_factory=lambda: mock_pipeline, max_workers=1
+        )
+        app.dependency_overrides[get_job_manager] = lambda: manager
+        headers = {"X-API-Key": config.api_key or "test-api-key-12345"}
+        yield TestClient(app), headers, manager
+        app.dependency_overrides.pop(get_job_manager, None)
+        manager.shutdown()
+
+    def test_submit_and_poll_job(self, api_client):
+        """Test submitting a job and polling its progress."""
+        client, headers, manager = api_client
+        response = client.post(
+            "/api/v1/jobs", json={"tickers": ["MSFT"]}, headers=headers
+        )
+        assert response.status_code == 202
+        job_id = response.json()["job_id"]
+
+        _wait_for_job(manager, job_id)
+        response = client.get(
+            f"/api/v1/jobs/{job_id}",
+            params={"include_items": True},
+            headers=headers,
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == STATUS_COMPLETED
+        assert data["items"][0]["target"] == "MSFT"
+
+    def test_submit_empty_job(self, api_client):
+        """Test empty job returns 400."""
+        client, headers, _ = api_client
+        response = client.post("/api/v1/jobs", json={}, headers=headers)
+        assert response.status_code == 400
+
+    def test_get_unknown_job(self, api_client):
+        """Test unknown job returns 404."""
+        client, headers, _ = api_client
+        response = client.get("/api/v1/jobs/unknown", headers=headers)
+        assert response.status_code == 404
@@ -5,11 +5,21 @@ Tests verify metrics are properly collected and exposed for monitoring.
 """
 
 import time
+from unittest.mock import Mock
 
+import pytest
 from prometheus_client import REGISTRY, generate_latest
 
 from app.utils.metrics import (
+    embedding_batch_size,
+    embedding_request_duration_seconds,
+    embedding_requests_total,
+    embedding_tokens_total,
+    estimate_tokens,
     initialize_metrics,
+    llm_request_duration_seconds,
+    llm_requests_total,
+    llm_tokens_total,
     rag_queries_total,
     rag_query_duration_seconds,
     system_health_status,
@@ -18,6 +28,9 @@ from app.utils.metrics import (
     track_error,
     track_success,
     update_uptime,
+    vector_db_collection_size,
+    vector_db_operation_duration_seconds,
+    vector_db_operations_total,
 )
 
 
@@ -94,3 +107,131 @@ class TestMetricsExposure:
         output = generate_latest(REGISTRY)
         assert b'status="success"' in output or b"status=success" in output
         assert b'status="error"' in output or b"status=error" in output
+
+
+def _sample(metric, suffix, **labels):
+    """Return the value of a metric sample (0 if not recorded yet)."""
+    for family in metric.collect():
+        for sample in family.samples:
+            if sample.name.endswith(suffix) and all(
+                sample.labels.get(key) == value for key, value in labels.items()
+            ):
+                return sample.value
+    return 0
+
+
+class TestComponentInstrumentation:
+    """Test vector DB, embedding and LLM calls record metrics."""
+
+    def test_estimate_tokens(self):
+        """Test token estimates use four characters per token."""
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("abc") == 1
+        assert estimate_tokens("a" * 400) == 100
+
+    def test_embedding_generator_metrics(self):
+        """Test embedding calls record batch size, tokens and status."""
+        from app.rag.embedding_factory import EmbeddingError, EmbeddingGenerator
+
+        generator = EmbeddingGenerator.__new__(EmbeddingGenerator)
+        generator.provider = "metrics-test"
+        generator.embeddings = Mock()
+        generator.embeddings.embed_documents.return_value = [[0.1, 0.2]] * 2
+        generator.embeddings.embed_query.side_effect = RuntimeError("down")
+        labels = {"provider": "metrics-test"}
+
+        generator.embed_documents(["a" * 40, "b" * 80])
+        with pytest.raises(EmbeddingError):
+            generator.embed_query("query")
+
+        assert _sample(embedding_requests_total, "_total", status="success", **labels)
+        assert _sample(embedding_requests_total, "_total", status="error", **labels)
+        assert _sample(embedding_tokens_total, "_total", **labels) == 31
+        assert _sample(embedding_batch_size, "_sum", **labels) == 3
+        assert _sample(embedding_request_duration_seconds, "_count", **labels) == 2
+
+    def test_chroma_store_metrics(self, tmp_path):
+        """Test store operations are counted and the size gauge follows writes."""
+        from langchain_core.documents import Document
+
+        from app.vector_db import ChromaStore, ChromaStoreError
+
+        store = ChromaStore(collection_name="metrics_test", persist_directory=tmp_path)
+        before = _sample(
+            vector_db_operations_total, "_total", operation="add", status="success"
+        )
+
+        store.add_documents(
+            [
+                Document(page_content="a", metadata={"n": 1}),
+                Document(page_content="b", metadata={"n": 2}),
+            ],
+            [[0.1, 0.2], [0.2, 0.1]],
+            ids=["1", "2"],
+        )
+        assert _sample(vector_db_collection_size, "", collection="metrics_test") == 2
+        store.query_by_embedding([0.1, 0.2], n_results=1)
+        store.delete_documents(ids=["1"])
+        with pytest.raises(ChromaStoreError):
+            store.add_documents([], [])
+
+        assert (
+            _sample(
+                vector_db_operations_total, "_total", operation="add", status="success"
+            )
+            == before + 1
+        )
+        assert _sample(
+            vector_db_operations_total, "_total", operation="add", status="error"
+        )
+        assert _sample(
+            vector_db_operation_duration_seconds, "_count", operation="query"
+        )
+        assert _sample(vector_db_collection_size, "", collection="metrics_test") == 1
+
+    def test_llm_callback_metrics(self):
+        """Test LLM invocations record requests, duration and tokens."""
+        from langchain_core.language_models.fake import FakeListLLM
+
+        from app.rag.llm_factory import _with_metrics
+
+        llm = _with_metrics(
+            FakeListLLM(responses=["a" * 20]), provider="test", model="fake-metrics"
+        )
+        labels = {"provider": "test", "model": "fake-metrics"}
+
+        llm.invoke("p" * 40)
+        llm.batch(["p" * 8, "p" * 8])
+
+        assert _sample(llm_requests_total, "_total", status="success", **labels) == 3
+        assert _sample(llm_request_duration_seconds, "_count", **labels) == 3
+        assert _sample(llm_tokens_total, "_total", type="input", **labels) == 14
+        assert _sample(llm_tokens_total, "_total", type="output", **labels) == 15
+
+    def test_llm_reported_usage_preferred(self):
+        """Test provider token usage is used instead of estimates."""
+        from langchain_core.outputs import Generation, LLMResult
+
+        from app.rag.llm_factory import _usage_from_result
+
+        openai_style = LLMResult(
+            generations=[[Generation(text="x")]],
+            llm_output={"token_usage": {"prompt_tokens": 7, "completion_tokens": 3}},
+        )
+        ollama_style = LLMResult(
+            generations=[
+                [
+                    Generation(
+                        text="x",
+                        generation_info={"prompt_eval_count": 11, "eval_count": 5},
+                    )
+                ]
+            ]
+        )
+
+        assert _usage_from_result(openai_style) == (7, 3)
+        assert _usage_from_result(ollama_style) == (11, 5)
+        assert _usage_from_result(LLMResult(generations=[[Generation(text="")]])) == (
+            None,
+            None,
+        )
@@ -126,7 +126,7 @@ class TestNewsFetcher:
         mock_llm = MagicMock()
         mock_response = MagicMock()
         mock_response.content = "This is a summary of the article."
-        mock_llm.invoke.return_value = mock_response
+        mock_llm.batch.return_value = [mock_response]
         mock_get_llm.return_value = mock_llm
 
         # Create summarizer and fetcher
@@ -150,7 +150,7 @@ class TestNewsFetcher:
         assert len(documents) == 1
         assert "summary" in documents[0].metadata
         assert documents[0].metadata["summary"] == "This is a summary of the article."
-        mock_llm.invoke.assert_called_once()
+        mock_llm.batch.assert_called_once()
 
     def test_to_documents_without_summarizer(self):
         """Test conversion to Document objects without summarization."""
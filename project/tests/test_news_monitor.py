@@ -25,9 +25,7 @@ class TestNewsMonitor:
     def mock_chroma_store(self):
         """Create a mock ChromaDB store."""
         store = MagicMock()
-        store.query_by_text = MagicMock(
-            return_value={"ids": [], "metadatas": [], "documents": []}
-        )
+        store.get_ids_by_metadata = MagicMock(return_value=[])
         return store
 
     @pytest.fixture
@@ -36,7 +34,7 @@ class TestNewsMonitor:
         return ["https://example.com/feed1", "https://example.com/feed2"]
 
     @patch("app.services.news_monitor.IngestionPipeline")
-    @patch("app.services.news_monitor.ChromaStore")
+    @patch("app.services.news_monitor.create_vector_store")
     def test_init(self, mock_chroma_store_class, mock_pipeline_class, sample_feeds):
         """Test NewsMonitor initialization."""
         mock_pipeline_class.return_value = MagicMock()
@@ -56,7 +54,7 @@ class TestNewsMonitor:
         assert len(monitor.processed_urls) == 0
 
     @patch("app.services.news_monitor.IngestionPipeline")
-    @patch("app.services.news_monitor.ChromaStore")
+    @patch("app.services.news_monitor.create_vector_store")
     def test_init_with_filters(
         self, mock_chroma_store_class, mock_pipeline_class, sample_feeds
     ):
@@ -76,40 +74,39 @@ class TestNewsMonitor:
         assert monitor.filter_categories == ["earnings"]
 
     @patch("app.services.news_monitor.IngestionPipeline")
-    @patch("app.services.news_monitor.ChromaStore")
+    @patch("app.services.news_monitor.create_vector_store")
     def test_check_article_exists_found(
         self, mock_chroma_store_class, mock_pipeline_class, sample_feeds
     ):
         """Test checking article existence when article is found."""
         mock_pipeline_class.return_value = MagicMock()
         mock_store = MagicMock()
-        mock_store.query_by_text.return_value = {
-            "ids": ["id1"],
-            "metadatas": [
-                {"url": "https://example.com/article", "source_type": "news"}
-            ],
-            "documents": [],
-        }
+        mock_store.get_ids_by_metadata.return_value = ["id1"]
         mock_chroma_store_class.return_value = mock_store
 
         monitor = NewsMonitor(feed_urls=sample_feeds)
         result = monitor._check_article_exists("https://example.com/article")
 
         assert result is True
+        mock_store.get_ids_by_metadata.assert_called_once_with(
+            where={
+                "$and": [
+                    {"type": "news_article"},
+                    {"url": "https://example.com/article"},
+                ]
+            },
+            limit=1,
+        )
 
     @patch("app.services.news_monitor.IngestionPipeline")
-    @patch("app.services.news_monitor.ChromaStore")
+    @patch("app.services.news_monitor.create_vector_store")
     def test_check_article_exists_not_found(
         self, mock_chroma_store_class, mock_pipeline_class, sample_feeds
     ):
         """Test checking article existence when article is not found."""
         mock_pipeline_class.return_value = MagicMock()
         mock_store = MagicMock()
-        mock_store.query_by_text.return_value = {
-            "ids": [],
-            "metadatas": [],
-            "documents": [],
-        }
+        mock_store.get_ids_by_metadata.return_value = []
         mock_chroma_store_class.return_value = mock_store
 
         monitor = NewsMonitor(feed_urls=sample_feeds)
@@ -118,7 +115,7 @@ class TestNewsMonitor:
         assert result is False
 
     @patch("app.services.news_monitor.IngestionPipeline")
-    @patch("app.services.news_monitor.ChromaStore")
+    @patch("app.services.news_monitor.create_vector_store")
     def test_should_process_article_no_filters(
         self, mock_chroma_store_class, mock_pipeline_class, sample_feeds
     ):
@@ -132,7 +129,7 @@ class TestNewsMonitor:
         assert monitor._should_process_article(article) is True
 
     @patch("app.services.news_monitor.IngestionPipeline")
-    @patch("app.services.news_monitor.ChromaStore")
+    @patch("app.services.news_monitor.create_vector_store")
     def test_should_process_article_ticker_filter_match(
         self, mock_chroma_store_class, mock_pipeline_class, sample_feeds
     ):
@@ -146,7 +143,7 @@ class TestNewsMonitor:
         assert monitor._should_process_article(article) is True
 
     @patch("app.services.news_monitor.IngestionPipeline")
-    @patch("app.services.news_monitor.ChromaStore")
+    @patch("app.services.news_monitor.create_vector_store")
     def test_should_process_article_ticker_filter_no_match(
         self, mock_chroma_store_class, mock_pipeline_class, sample_feeds
     ):
@@ -160,7 +157,7 @@ class TestNewsMonitor:
         assert monitor._should_process_article(article) is False
 
     @patch("app.services.news_monitor.IngestionPipeline")
-    @patch("app.services.news_monitor.ChromaStore")
+    @patch("app.services.news_monitor.create_vector_store")
     def test_should_process_article_keyword_filter_match(
         self, mock_chroma_store_class, mock_pipeline_class, sample_feeds
     ):
@@ -174,7 +171,7 @@ class TestNewsMonitor:
         assert monitor._should_process_article(article) is True
 
     @patch("app.services.news_monitor.IngestionPipeline")
-    @patch("app.services.news_monitor.ChromaStore")
+    @patch("app.services.news_monitor.create_vector_store")
     def test_should_process_article_keyword_filter_no_match(
         self, mock_chroma_store_class, mock_pipeline_class, sample_feeds
     ):
@@ -188,7 +185,7 @@ class TestNewsMonitor:
         assert monitor._should_process_article(article) is False
 
     @patch("app.services.news_monitor.IngestionPipeline")
-    @patch("app.services.news_monitor.ChromaStore")
+    @patch("app.services.news_monitor.create_vector_store")
     def test_start_success(
         self, mock_chroma_store_class, mock_pipeline_class, sample_feeds
     ):
@@ -210,7 +207,7 @@ class TestNewsMonitor:
             monitor.stop()
 
     @patch("app.services.news_monitor.IngestionPipeline")
-    @patch("app.services.news_monitor.ChromaStore")
+    @patch("app.services.news_monitor.create_vector_store")
     def test_start_no_feeds(self, mock_chroma_store_class, mock_pipeline_class):
         """Test starting the monitoring service with no feeds."""
         mock_pipeline_class.return_value = MagicMock()
@@ -222,7 +219,7 @@ class TestNewsMonitor:
             monitor.start()
 
     @patch("app.services.news_monitor.IngestionPipeline")
-    @patch("app.services.news_monitor.ChromaStore")
+    @patch("app.services.news_monitor.create_vector_store")
     def test_start_already_running(
         self, mock_chroma_store_class, mock_pipeline_class, sample_feeds
     ):
@@ -237,7 +234,7 @@ class TestNewsMonitor:
             monitor.start()
 
     @patch("app.services.news_monitor.IngestionPipeline")
-    @patch("app.services.news_monitor.ChromaStore")
+    @patch("app.services.news_monitor.create_vector_store")
     def test_stop(self, mock_chroma_store_class, mock_pipeline_class, sample_feeds):
         """Test stopping the monitoring service."""
         mock_pipeline_class.return_value = MagicMock()
@@ -252,7 +249,7 @@ class TestNewsMonitor:
         assert monitor.is_running is False
 
     @patch("app.services.news_monitor.IngestionPipeline")
-    @patch("app.services.news_monitor.ChromaStore")
+    @patch("app.services.news_monitor.create_vector_store")
     def test_pause_resume(
         self, mock_chroma_store_class, mock_pipeline_class, sample_feeds
     ):
@@ -270,7 +267,7 @@ class TestNewsMonitor:
         assert monitor.is_paused is False
 
     @patch("app.services.news_monitor.IngestionPipeline")
-    @patch("app.services.news_monitor.ChromaStore")
+    @patch("app.services.news_monitor.create_vector_store")
     def test_get_stats(
         self, mock_chroma_store_class, mock_pipeline_class, sample_feeds
     ):
@@ -291,7 +288,7 @@ class TestNewsMonitor:
         assert "uptime_seconds" in stats
 
     @patch("app.services.news_monitor.IngestionPipeline")
-    @patch("app.services.news_monitor.ChromaStore")
+    @patch("app.services.news_monitor.create_vector_store")
     def test_health_check(
         self, mock_chroma_store_class, mock_pipeline_class, sample_feeds
     ):
@@ -0,0 +1,280 @@
+"""
+Tests for time-partitioned news storage, retention and roll-ups.
+"""
+
+import gzip
+import json
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from langchain_core.documents import Document
+
+from app.analysis.news_retention import (
+    NewsRetentionError,
+    NewsRetentionManager,
+    NewsRollupStore,
+)
+from app.analysis.news_trends import NewsTrendsAnalyzer
+from app.vector_db import (
+    ShardedStore,
+    TimePartitionedStore,
+    create_vector_store,
+    news_partitions,
+)
+from app.vector_db.partitioned_store import (
+    _translate,
+    date_window,
+    partition_bounds,
+    partition_for,
+)
+
+DIMENSIONS = 8
+
+# Two articles in each of four weeks (ISO weeks 2026w01 - 2026w04)
+NEWS_DATES = [
+    "2026-01-01T09:00:00Z",
+    "2026-01-02T15:30:00+02:00",
+    "2026-01-06T10:00:00Z",
+    "2026-01-08T10:00:00Z",
+    "2026-01-13T08:00:00Z",
+    "2026-01-15T08:00:00Z",
+    "2026-01-20T12:00:00Z",
+    "2026-01-22T12:00:00Z",
+]
+
+
+@pytest.fixture
+def news_store(tmp_path, monkeypatch):
+    """Sharded HNSW store with weekly news partitions and one filing."""
+    pytest.importorskip("hnswlib")
+    monkeypatch.setattr(
+        "app.vector_db.partitioned_store.config.news_partition_db",
+        str(tmp_path / "partitions.db"),
+    )
+    store = create_vector_store(
+        "docs", tmp_path / "hnsw", backend="hnsw", partitioned=True
+    )
+    documents = [
+        Document(
+            page_content=f"Earnings growth surprise earnings growth story {i}",
+            metadata={
+                "type": "news_article",
+                "title": f"Headline {i}",
+                "date": date,
+                "source": "Reuters" if i % 2 else "Bloomberg",
+                "url": f"https://example.com/{i}",
+                "tickers": "AAPL,MSFT" if i % 2 else "AAPL",
+            },
+        )
+        for i, date in enumerate(NEWS_DATES)
+    ]
+    documents.append(
+        Document(page_content="Annual report", metadata={"type": "edgar_filing"})
+    )
+    vectors = np.random.default_rng(0).normal(size=(len(documents), DIMENSIONS))
+    store.add_documents(
+        documents,
+        vectors.tolist(),
+        ids=[f"doc_{i}" for i in range(len(documents))],
+    )
+    return store, vectors
+
+
+class TestPartitionRouting:
+    """Test cases for partition naming and date filters."""
+
+    def test_partition_for_and_bounds(self):
+        assert partition_for(datetime(2026, 1, 1)) == "2026w01"
+        # 2027-01-01 falls in the last ISO week of 2026
+        assert partition_for(datetime(2027, 1, 1)) == "2026w53"
+        assert partition_bounds("2026w01") == (
+            datetime(2025, 12, 29),
+            datetime(2026, 1, 5),
+        )
+
+    def test_date_window(self):
+        assert date_window(None) == (None, None)
+        assert date_window({"type": "news_article"}) == (None, None)
+        assert date_window(
+            {
+                "$and": [
+                    {"type": "news_article"},
+                    {"date": {"$gte": "2026-01-05"}},
+                    {"date": {"$lte": "2026-01-10T12:00:00+01:00"}},
+                ]
+            }
+        ) == (datetime(2026, 1, 5), datetime(2026, 1, 10, 11))
+        assert date_window(
+            {
+                "$or": [
+                    {"date": {"$gte": "2026-01-05", "$lt": "2026-01-06"}},
+                    {"date": {"$gte": "2026-01-20", "$lt": "2026-01-21"}},
+                ]
+            }
+        ) == (datetime(2026, 1, 5), datetime(2026, 1, 21))
+        assert date_window(
+            {"$or": [{"date": {"$gte": "2026-01-05"}}, {"ticker": "AAPL"}]}
+        ) == (None, None)
+
+    def test_translate(self):
+        assert _translate(
+            {"$and": [{"type": "news_article"}, {"date": {"$gte": "2026-01-05"}}]}
+        ) == {
+            "$and": [
+                {"type": "news_article"},
+                {"published_at": {"$gte": 1767571200}},
+            ]
+        }
+        # Equality and unparseable dates are left to the backend
+        assert _translate({"date": "2026-01-05"}) == {"date": "2026-01-05"}
+        assert _translate({"date": {"$gte": "recent"}}) == {"date": {"$gte": "recent"}}
+
+
+class TestTimePartitionedStore:
+    """Test cases for TimePartitionedStore."""
+
+    def test_writes_are_partitioned(self, news_store):
+        store, _ = news_store
+        partitions = news_partitions(store)
+
+        assert isinstance(store, ShardedStore)
+        assert isinstance(partitions, TimePartitionedStore)
+        assert partitions.partitions() == ["2026w01", "2026w02", "2026w03", "2026w04"]
+        assert partitions.shards["2026w02"].collection_name == "docs_news_2026w02"
+        assert store.count() == len(NEWS_DATES) + 1
+
+        metadata = store.get_by_ids(["doc_1"])["metadatas"][0]
+        # 15:30 at UTC+2 on 2026-01-02
+        assert metadata["published_at"] == 1767360600
+
+    def test_date_range_touches_overlapping_partitions(self, news_store):
+        store, vectors = news_store
+        partitions = news_partitions(store)
+        for name, partition in partitions.shards.items():
+            if name != "2026w02":
+                partition.query_by_embedding = MagicMock(
+                    side_effect=AssertionError(f"queried partition {name}")
+                )
+        where = {
+            "$and": [
+                {"type": "news_article"},
+                {"date": {"$gte": "2026-01-06"}},
+                {"date": {"$lte": "2026-01-07"}},
+            ]
+        }
+
+        assert partitions.shards_for(_translate(where)) == ["2026w02"]
+        results = store.query_by_embedding(
+            vectors[2].tolist(), n_results=5, where=where
+        )
+        assert results["ids"] == ["doc_2"]
+
+    def test_catalog_is_shared(self, news_store, tmp_path):
+        store, _ = news_store
+        other = create_vector_store(
+            "docs", tmp_path / "hnsw", backend="hnsw", partitioned=True
+        )
+
+        news_partitions(store).drop_partition("2026w01")
+        assert news_partitions(other).partitions() == ["2026w02", "2026w03", "2026w04"]
+        assert other.count() == len(NEWS_DATES) - 1
+
+        # A late article recreates its week
+        other.add_documents(
+            [
+                Document(
+                    page_content="Late story",
+                    metadata={"type": "news_article", "date": "2026-01-03"},
+                )
+            ],
+            [[0.0] * DIMENSIONS],
+        )
+        assert news_partitions(store).partitions()[0] == "2026w01"
+
+
+class TestNewsRetention:
+    """Test cases for news retention and roll-ups."""
+
+    def test_requires_partitioning(self, tmp_path):
+        pytest.importorskip("hnswlib")
+        store = create_vector_store("docs", tmp_path, backend="hnsw")
+        with pytest.raises(NewsRetentionError, match="not enabled"):
+            NewsRetentionManager(store)
+
+    def test_apply_retention(self, news_store, tmp_path):
+        store, _ = news_store
+        manager = NewsRetentionManager(
+            store, retention_weeks=2, action="archive", archive_dir=tmp_path / "arch"
+        )
+        now = datetime(2026, 1, 26, 12)
+
+        assert manager.apply_retention(now=now, dry_run=True) == [
+            "2026w01",
+            "2026w02",
+        ]
+        assert manager.apply_retention(now=now) == ["2026w01", "2026w02"]
+        assert manager.partitions.partitions() == ["2026w03", "2026w04"]
+        assert store.count() == 5
+
+        with gzip.open(tmp_path / "arch" / "docs_news_2026w02.jsonl.gz", "rt") as f:
+            records = [json.loads(line) for line in f]
+        assert sorted(record["id"] for record in records) == ["doc_2", "doc_3"]
+
+        rollups = manager.rollup_store.get_daily("docs_news")
+        assert [r["date"].date().isoformat() for r in rollups] == [
+            "2026-01-01",
+            "2026-01-02",
+            "2026-01-06",
+            "2026-01-08",
+        ]
+        assert rollups[1]["tickers"] == {"AAPL": 1, "MSFT": 1}
+        assert rollups[1]["keywords"] == {"earnings": 1, "growth": 1}
+
+        summaries = manager.rollup_store.get_summaries("docs_news", "2026-01-07")
+        assert [s["partition"] for s in summaries] == ["2026w02"]
+        assert summaries[0]["articles"] == 2
+        assert summaries[0]["top_tickers"] == [["AAPL", 2], ["MSFT", 1]]
+        assert summaries[0]["headlines"] == ["Headline 3", "Headline 2"]
+        assert "Top tickers: AAPL (2), MSFT (1)." in summaries[0]["summary"]
+
+    def test_rollups_accumulate(self, tmp_path):
+        rollup_store = NewsRollupStore(str(tmp_path / "rollups.db"))
+        day = {
+            "day": "2026-01-06",
+            "articles": 2,
+            "tickers": {"AAPL": 2},
+            "keywords": {},
+            "sources": {"Reuters": 2},
+        }
+        rollup_store.save_rollup("news", "2026w02", [day], ["First"])
+        late = {**day, "articles": 1, "tickers": {"TSLA": 1}}
+        rollup_store.save_rollup("news", "2026w02", [late], ["Late"])
+
+        [stored] = rollup_store.get_daily("news")
+        assert stored["articles"] == 3
+        assert stored["tickers"] == {"AAPL": 2, "TSLA": 1}
+        assert rollup_store.get_summaries("news")[0]["headlines"] == ["First", "Late"]
+        assert rollup_store.get_daily("news", exclude_partitions=["2026w02"]) == []
+
+    def test_trend_report_combines_rollups(self, news_store):
+        store, _ = news_store
+        NewsRetentionManager(store, retention_weeks=2).apply_retention(
+            now=datetime(2026, 1, 26, 12)
+        )
+        analyzer = NewsTrendsAnalyzer(chroma_store=store)
+
+        articles = analyzer.get_news_articles(date_from="2026-01-14")
+        assert len(articles) == 3
+        report = analyzer.generate_trend_report(period="weekly")
+
+        assert report["total_articles"] == len(NEWS_DATES)
+        assert report["rolled_up_articles"] == 4
+        assert [s["partition"] for s in report["period_summaries"]] == [
+            "2026w01",
+            "2026w02",
+        ]
+        assert report["volume_trends"]["volume"].tolist() == [2, 2, 2, 2]
+        aapl = next(t for t in report["trending_tickers"] if t["ticker"] == "AAPL")
+        assert aapl["total_count"] == len(NEWS_DATES)
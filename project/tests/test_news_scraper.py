@@ -21,7 +21,7 @@ class TestNewsScraper:
         assert scraper.timeout == 60
         assert scraper.max_retries == 5
         assert scraper.respect_robots_txt is False
-        assert scraper.last_request_time is None
+        assert scraper.session.requests_per_second == pytest.approx(1 / 3.0)
 
     @patch("app.ingestion.news_scraper.BeautifulSoup")
     @patch("app.ingestion.news_scraper.requests.Session")
@@ -2,6 +2,7 @@
 Unit tests for news summarizer module.
 """
 
+import threading
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
@@ -9,7 +10,9 @@ import pytest
 from app.ingestion.news_summarizer import (
     NewsSummarizer,
     NewsSummarizerError,
+    NewsSummaryCache,
 )
+from app.ingestion.processors.news_processor import NewsProcessor
 
 
 class TestNewsSummarizer:
@@ -164,10 +167,10 @@ class TestNewsSummarizer:
         mock_llm = MagicMock()
         mock_response = Mock()
         mock_response.content = "Summary"
-        mock_llm.invoke.return_value = mock_response
+        mock_llm.batch.return_value = [mock_response] * 3
 
         with patch("app.ingestion.news_summarizer.get_llm", return_value=mock_llm):
-            summarizer = NewsSummarizer(enabled=True)
+            summarizer = NewsSummarizer(enabled=True, max_concurrency=4)
             articles = [
                 {"title": "Article 1", "content": "Content 1"},
                 {"title": "Article 2", "content": "Content 2"},
@@ -177,7 +180,10 @@ class TestNewsSummarizer:
 
             assert len(result) == 3
             assert all("summary" in article for article in result)
-            assert mock_llm.invoke.call_count == 3
+            mock_llm.batch.assert_called_once()
+            assert len(mock_llm.batch.call_args[0][0]) == 3
+            assert mock_llm.batch.call_args[1]["config"] == {"max_concurrency": 4}
+            mock_llm.invoke.assert_not_called()
 
     def test_summarize_articles_disabled(self):
         """Test batch summarization when disabled."""
@@ -197,7 +203,7 @@ class TestNewsSummarizer:
         mock_response.content = "Summary"
 
         # First call succeeds, second fails, third succeeds
-        mock_llm.invoke.side_effect = [
+        mock_llm.batch.return_value = [
             mock_response,
             Exception("LLM error"),
             mock_response,
@@ -247,3 +253,156 @@ class TestNewsSummarizer:
             assert result is not None
             word_count = len(result.split())
             assert word_count <= 200
+
+
+def _summarizer(mock_llm, **kwargs):
+    """Create an enabled summarizer backed by a mock LLM."""
+    with patch("app.ingestion.news_summarizer.get_llm", return_value=mock_llm):
+        return NewsSummarizer(enabled=True, llm_provider="openai", **kwargs)
+
+
+def _batch_echo(prompts, **kwargs):
+    """Mock LLM batch returning one summary per prompt."""
+    return [f"Summary {idx}" for idx, _ in enumerate(prompts)]
+
+
+class TestSummaryCache:
+    """Test cached and deduplicated summarization."""
+
+    def test_syndicated_articles_summarized_once(self):
+        """Test identical articles share one LLM request."""
+        mock_llm = MagicMock()
+        mock_llm.batch.side_effect = _batch_echo
+        summarizer = _summarizer(mock_llm)
+        articles = [
+            {"title": "Fed holds rates", "content": "Same wire story", "url": "a"},
+            {"title": "Fed holds rates", "content": "Same wire story", "url": "b"},
+            {"title": "Other", "content": "Different story", "url": "c"},
+        ]
+
+        summarizer.summarize_articles(articles)
+
+        assert len(mock_llm.batch.call_args[0][0]) == 2
+        assert articles[0]["summary"] == articles[1]["summary"]
+
+    def test_cached_summaries_are_reused(self):
+        """Test a later poll reuses stored summaries without LLM calls."""
+        mock_llm = MagicMock()
+        mock_llm.batch.side_effect = _batch_echo
+        _summarizer(mock_llm).summarize_articles([{"title": "A", "content": "Story A"}])
+        mock_llm.batch.reset_mock()
+
+        article = {"title": "A", "content": "Story A"}
+        _summarizer(mock_llm).summarize_articles([article])
+        result = _summarizer(mock_llm).summarize_article(dict(article))
+
+        mock_llm.batch.assert_not_called()
+        mock_llm.invoke.assert_not_called()
+        assert article["summary"] == "Summary 0"
+        assert result == "Summary 0"
+
+    def test_cache_is_keyed_by_model(self, tmp_path):
+        """Test summaries of one model are not served for another."""
+        cache = NewsSummaryCache(str(tmp_path / "cache.db"))
+        cache.put_many({"hash": "summary"}, "openai:gpt-4o-mini")
+
+        assert cache.get_many(["hash"], "openai:gpt-4o-mini") == {"hash": "summary"}
+        assert cache.get_many(["hash"], "ollama:llama3.2") == {}
+        assert cache.count() == 1
+
+    def test_cache_disabled(self, monkeypatch):
+        """Test no cache is opened when caching is disabled."""
+        from app.utils.config import config
+
+        monkeypatch.setattr(config, "news_summarization_cache_enabled", False)
+
+        assert _summarizer(MagicMock()).cache is None
+
+
+class TestDeferredSummaries:
+    """Test storing news before summaries are attached."""
+
+    def _processor(self, summarizer):
+        """Create a news processor with mocked dependencies."""
+        news_fetcher = Mock()
+        news_fetcher.summarizer = summarizer
+        news_fetcher.fetch_news.return_value = [
+            {"title": "A", "content": "Story A", "url": "https://x/a"},
+        ]
+        news_fetcher.to_documents.return_value = [Mock()]
+        processor = NewsProcessor(
+            document_loader=Mock(),
+            embedding_generator=Mock(),
+            chroma_store=Mock(),
+            news_fetcher=news_fetcher,
+        )
+        processor.process_documents_to_chunks = Mock(return_value=["c1", "c2"])
+        return processor
+
+    def test_deferred_mode_stores_before_summarizing(self, monkeypatch):
+        """Test articles are stored unsummarized and updated afterwards."""
+        from app.utils.config import config
+
+        monkeypatch.setattr(config, "news_enabled", True)
+        monkeypatch.setattr(config, "news_alerts_enabled", False)
+        monkeypatch.setattr(config, "news_summarization_deferred", True)
+        mock_llm = MagicMock()
+        mock_llm.batch.side_effect = _batch_echo
+        processor = self._processor(_summarizer(mock_llm))
+        processor.chroma_store.get_by_ids.return_value = {
+            "ids": ["c1", "c2"],
+            "metadatas": [
+                {"url": "https://x/a", "chunk_index": 0},
+                {"url": "https://x/other", "chunk_index": 0},
+            ],
+        }
+
+        ids = processor.process_news(feed_urls=["https://x/feed"])
+
+        assert ids == ["c1", "c2"]
+        processor.news_fetcher.to_documents.assert_called_once()
+        assert processor.news_fetcher.to_documents.call_args[1] == {"summarize": False}
+        assert processor.summary_future.result(timeout=5) == 1
+        processor.chroma_store.update_documents.assert_called_once_with(
+            ["c1"],
+            metadatas=[
+                {"url": "https://x/a", "chunk_index": 0, "summary": "Summary 0"}
+            ],
+        )
+
+    def test_close_waits_for_pending_summaries(self, monkeypatch):
+        """Test close() finishes deferred summaries and stops the thread."""
+        from app.utils.config import config
+
+        monkeypatch.setattr(config, "news_enabled", True)
+        monkeypatch.setattr(config, "news_alerts_enabled", False)
+        monkeypatch.setattr(config, "news_summarization_deferred", True)
+        release = threading.Event()
+        summarizer = Mock()
+        summarizer.summarize_articles.side_effect = lambda articles: release.wait(5)
+        processor = self._processor(summarizer)
+
+        processor.process_news(feed_urls=["https://x/feed"])
+        future = processor.summary_future
+        assert not future.done()
+
+        threading.Timer(0.05, release.set).start()
+        processor.close()
+
+        assert future.done()
+        assert processor._summary_executor is None
+        summarizer.summarize_articles.assert_called_once()
+
+    def test_summaries_inline_by_default(self, monkeypatch):
+        """Test summaries are generated before storing unless deferred."""
+        from app.utils.config import config
+
+        monkeypatch.setattr(config, "news_enabled", True)
+        monkeypatch.setattr(config, "news_alerts_enabled", False)
+        monkeypatch.setattr(config, "news_summarization_deferred", False)
+        processor = self._processor(_summarizer(MagicMock()))
+
+        processor.process_news(feed_urls=["https://x/feed"])
+
+        assert processor.news_fetcher.to_documents.call_args[1] == {"summarize": True}
+        assert processor.summary_future is None
@@ -81,7 +81,7 @@ class TestNewsTrendsAnalyzer:
 
     def test_get_news_articles_success(self, mock_chroma_store, mock_chromadb_results):
         """Test successful retrieval of news articles."""
-        mock_chroma_store.collection.get.return_value = mock_chromadb_results
+        mock_chroma_store.get_all.return_value = mock_chromadb_results
 
         analyzer = NewsTrendsAnalyzer(chroma_store=mock_chroma_store)
         articles = analyzer.get_news_articles()
@@ -95,7 +95,7 @@ class TestNewsTrendsAnalyzer:
         self, mock_chroma_store, mock_chromadb_results
     ):
         """Test retrieval with date filters."""
-        mock_chroma_store.collection.get.return_value = mock_chromadb_results
+        mock_chroma_store.get_all.return_value = mock_chromadb_results
 
         analyzer = NewsTrendsAnalyzer(chroma_store=mock_chroma_store)
         date_from = datetime(2024, 1, 5).isoformat()
@@ -112,7 +112,7 @@ class TestNewsTrendsAnalyzer:
         self, mock_chroma_store, mock_chromadb_results
     ):
         """Test retrieval with limit."""
-        mock_chroma_store.collection.get.return_value = mock_chromadb_results
+        mock_chroma_store.get_all.return_value = mock_chromadb_results
 
         analyzer = NewsTrendsAnalyzer(chroma_store=mock_chroma_store)
         articles = analyzer.get_news_articles(limit=5)
@@ -121,7 +121,9 @@ class TestNewsTrendsAnalyzer:
 
     def test_get_news_articles_no_collection(self, mock_chroma_store):
         """Test retrieval when collection is not initialized."""
-        mock_chroma_store.collection = None
+        mock_chroma_store.get_all.side_effect = ChromaStoreError(
+            "Collection is not initialized"
+        )
 
         analyzer = NewsTrendsAnalyzer(chroma_store=mock_chroma_store)
 
@@ -130,7 +132,7 @@ class TestNewsTrendsAnalyzer:
 
     def test_get_news_articles_chromadb_error(self, mock_chroma_store):
         """Test handling of ChromaDB errors."""
-        mock_chroma_store.collection.get.side_effect = ChromaStoreError("DB error")
+        mock_chroma_store.get_all.side_effect = ChromaStoreError("DB error")
 
         analyzer = NewsTrendsAnalyzer(chroma_store=mock_chroma_store)
 
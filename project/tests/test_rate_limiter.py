@@ -0,0 +1,81 @@
+"""
+Tests for the shared token-bucket rate limiter.
+"""
+
+import threading
+import time
+
+import pytest
+
+from app.utils.rate_limiter import (
+    TokenBucketRateLimiter,
+    get_rate_limiter,
+)
+
+
+class TestTokenBucketRateLimiter:
+    """Test TokenBucketRateLimiter."""
+
+    def test_invalid_rate(self):
+        """Test non-positive rates are rejected."""
+        with pytest.raises(ValueError):
+            TokenBucketRateLimiter(rate=0)
+
+    def test_try_acquire_respects_capacity(self):
+        """Test bursts are limited to capacity."""
+        limiter = TokenBucketRateLimiter(rate=1, capacity=3)
+        assert [limiter.try_acquire() for _ in range(4)] == [True, True, True, False]
+
+    def test_acquire_paces_requests(self):
+        """Test sequential acquires are spaced at the configured rate."""
+        limiter = TokenBucketRateLimiter(rate=50)
+        start = time.monotonic()
+        for _ in range(6):
+            limiter.acquire()
+        # First token is free, the remaining 5 wait 1/50s each
+        assert time.monotonic() - start >= 5 / 50 * 0.9
+
+    def test_acquire_is_shared_across_threads(self):
+        """Test concurrent callers together stay under the rate."""
+        limiter = TokenBucketRateLimiter(rate=100)
+        stamps = []
+        lock = threading.Lock()
+
+        def worker():
+            for _ in range(5):
+                limiter.acquire()
+                with lock:
+                    stamps.append(time.monotonic())
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stamps.sort()
+        # 20 acquisitions at 100/s need at least ~19 intervals of 10ms
+        assert stamps[-1] - stamps[0] >= 19 / 100 * 0.9
+
+    def test_acquire_more_than_capacity_raises(self):
+        """Test requests larger than the bucket are rejected."""
+        with pytest.raises(ValueError):
+            TokenBucketRateLimiter(rate=10, capacity=2).acquire(3)
+
+
+class TestGetRateLimiter:
+    """Test the shared limiter registry."""
+
+    def test_same_key_returns_same_instance(self):
+        """Test limiters are shared per key."""
+        assert get_rate_limiter("example.com", 5) is get_rate_limiter("example.com", 5)
+        assert get_rate_limiter("example.com", 5) is not get_rate_limiter(
+            "other.com", 5
+        )
+
+    def test_lower_rate_wins(self):
+        """Test a later caller can only slow a shared limiter down."""
+        limiter = get_rate_limiter("example.com", 10)
+        get_rate_limiter("example.com", 2)
+        get_rate_limiter("example.com", 20)
+        assert limiter.rate == 2
@@ -0,0 +1,174 @@
+"""
+Tests for the SEC ticker/CIK/company-name directory.
+"""
+
+import json
+import time
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from app.ingestion.sec_company_directory import (
+    COMPANY_TICKERS_URL,
+    CompanyDirectoryError,
+    SECCompanyDirectory,
+    get_company_directory,
+)
+
+SEC_PAYLOAD = {
+    "0": {"cik_str": 320193, "ticker": "AAPL", "title": "Apple Inc."},
+    "1": {"cik_str": 1318605, "ticker": "TSLA", "title": "Tesla, Inc."},
+    "2": {"cik_str": 1067983, "ticker": "BRK-B", "title": "BERKSHIRE HATHAWAY INC"},
+    "3": {"cik_str": 1800, "ticker": "ABT", "title": "ABBOTT LABORATORIES"},
+}
+
+
+def _response(payload=None, status=200, headers=None):
+    """Build a mocked HTTP response."""
+    response = MagicMock()
+    response.status_code = status
+    response.headers = headers or {}
+    response.json.return_value = payload
+    if status >= 400:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            f"{status} Error"
+        )
+    return response
+
+
+@pytest.fixture
+def session():
+    """Mocked HTTP session."""
+    return MagicMock()
+
+
+@pytest.fixture
+def directory(tmp_path, session):
+    """Directory persisted to a temporary file."""
+    return SECCompanyDirectory(
+        path=tmp_path / "company_tickers.json", refresh_hours=24, session=session
+    )
+
+
+class TestLookups:
+    """Test in-memory lookups."""
+
+    def test_builtin_companies_resolve_offline(self, directory, session):
+        """Test built-in tickers resolve when SEC is unreachable."""
+        session.get.side_effect = requests.exceptions.ConnectionError("offline")
+        assert directory.get_cik("aapl") == "0000320193"
+        assert directory.get_company_name("MSFT") == "Microsoft Corporation"
+        assert directory.get("MSFT").cik == "0000789019"
+
+    def test_name_lookup_never_refreshes(self, directory, session):
+        """Test unknown names return None without a download."""
+        assert directory.get_company_name("ZZZZ") is None
+        session.get.assert_not_called()
+
+    def test_bulk_lookup_refreshes_once(self, directory, session):
+        """Test one download serves all unknown tickers."""
+        session.get.return_value = _response(SEC_PAYLOAD)
+
+        ciks = directory.get_ciks(["ABT", "BRK-B", "AAPL", "NOPE"])
+
+        assert ciks == {
+            "ABT": "0000001800",
+            "BRK-B": "0001067983",
+            "AAPL": "0000320193",
+            "NOPE": None,
+        }
+        assert directory.get_cik("NOPE2") is None
+        assert session.get.call_count == 1
+        assert session.get.call_args.args[0] == COMPANY_TICKERS_URL
+
+    def test_builtin_names_are_preferred(self, directory, session):
+        """Test built-in display names win over SEC's titles."""
+        session.get.return_value = _response(
+            {"0": {"cik_str": 320193, "ticker": "AAPL", "title": "APPLE INC"}}
+        )
+        directory.refresh(force=True)
+        assert directory.get_company_name("AAPL") == "Apple Inc."
+
+
+class TestRefresh:
+    """Test persistence and conditional refresh."""
+
+    def test_persisted_directory_is_reloaded(self, tmp_path, directory, session):
+        """Test a fresh persisted directory is used without a download."""
+        session.get.return_value = _response(SEC_PAYLOAD, headers={"ETag": '"v1"'})
+        directory.refresh()
+
+        other_session = MagicMock()
+        reloaded = SECCompanyDirectory(
+            path=tmp_path / "company_tickers.json", session=other_session
+        )
+
+        assert reloaded.get_cik("ABT") == "0000001800"
+        assert reloaded.get_company_name("BRK-B") == "BERKSHIRE HATHAWAY INC"
+        other_session.get.assert_not_called()
+
+    def test_conditional_get_not_modified(self, tmp_path, directory, session):
+        """Test stale directories revalidate with ETag and keep data on 304."""
+        session.get.return_value = _response(
+            SEC_PAYLOAD,
+            headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"},
+        )
+        directory.refresh()
+        directory._fetched_at = time.time() - 48 * 3600
+
+        session.get.return_value = _response(status=304)
+        assert directory.refresh() is True
+
+        headers = session.get.call_args.kwargs["headers"]
+        assert headers["If-None-Match"] == '"v1"'
+        assert headers["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+        assert not directory.is_stale
+        assert directory.get_cik("ABT") == "0000001800"
+        persisted = json.loads((tmp_path / "company_tickers.json").read_text())
+        assert persisted["fetched_at"] == directory._fetched_at
+
+    def test_fresh_directory_is_not_refreshed(self, directory, session):
+        """Test refresh is a no-op within the refresh interval."""
+        session.get.return_value = _response(SEC_PAYLOAD)
+        directory.refresh()
+        directory.refresh()
+        assert session.get.call_count == 1
+
+    def test_stale_directory_refreshes_known_tickers(self, directory, session):
+        """Test a changed CIK for a known ticker is picked up when stale."""
+        session.get.return_value = _response(SEC_PAYLOAD)
+        assert directory.get_cik("ABT") == "0000001800"
+        directory._fetched_at = time.time() - 48 * 3600
+
+        session.get.return_value = _response(
+            {"0": {"cik_str": 1800001, "ticker": "ABT", "title": "ABBOTT LABS"}}
+        )
+        assert directory.get_ciks(["ABT"]) == {"ABT": "0001800001"}
+        assert directory.get_cik("ABT") == "0001800001"
+        assert session.get.call_count == 2
+
+    def test_refresh_error(self, directory, session):
+        """Test download failures raise CompanyDirectoryError."""
+        session.get.return_value = _response(status=503)
+        with pytest.raises(CompanyDirectoryError):
+            directory.refresh()
+
+    def test_failed_refresh_falls_back_and_backs_off(self, directory, session):
+        """Test lookups survive failures without retrying every call."""
+        session.get.side_effect = requests.exceptions.ConnectionError("offline")
+
+        assert directory.get_ciks(["AAPL", "ABT"]) == {
+            "AAPL": "0000320193",
+            "ABT": None,
+        }
+        assert directory.get_cik("ABT") is None
+        assert session.get.call_count == 1
+
+
+def test_shared_directory_uses_config(tmp_path):
+    """Test the process-wide directory is a singleton using config paths."""
+    first = get_company_directory()
+    assert first is get_company_directory()
+    assert first.path.parent.name == "sec"
+    assert str(tmp_path) in str(first.path)
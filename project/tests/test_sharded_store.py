@@ -0,0 +1,268 @@
+"""
+Tests for the domain-sharded vector store and sharded retrieval.
+"""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from langchain_core.documents import Document
+
+from app.rag.retrieval_optimizer import RetrievalOptimizer
+from app.utils.tracing import stage, start_trace
+from app.vector_db import ShardedStore, VectorStoreError, create_vector_store
+from app.vector_db.sharded_store import (
+    DEFAULT_SHARD,
+    SHARDS,
+    metadata_matches,
+    shard_for,
+    shards_for,
+)
+
+DIMENSIONS = 8
+
+METADATAS = [
+    {"type": "edgar_filing", "ticker": "AAPL", "form_type": "10-K"},
+    {"type": "news_article", "ticker": "AAPL", "source": "Reuters"},
+    {"transcript_type": "earnings_call", "ticker": "MSFT", "source": "api_ninjas"},
+    {"source": "yfinance", "ticker": "MSFT", "data_type": "price"},
+    {"source": "fred", "series_id": "GDP"},
+    {"type": "esg_rating", "ticker": "AAPL", "source": "msci_esg"},
+    {"type": "pdf", "source": "data/documents/report.pdf"},
+]
+
+
+@pytest.fixture
+def sharded(tmp_path):
+    """Sharded HNSW store with one document per domain."""
+    pytest.importorskip("hnswlib")
+    store = create_vector_store("docs", tmp_path, backend="hnsw", sharded=True)
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(len(METADATAS), DIMENSIONS)).astype(np.float32)
+    documents = [
+        Document(page_content=f"revenue report {i}", metadata=m)
+        for i, m in enumerate(METADATAS)
+    ]
+    ids = store.add_documents(
+        documents, vectors.tolist(), ids=[f"doc_{i}" for i in range(len(METADATAS))]
+    )
+    return store, vectors, ids
+
+
+class TestShardRouting:
+    """Test cases for shard routing functions."""
+
+    def test_shard_for(self):
+        assert [shard_for(m) for m in METADATAS] == [
+            "filings",
+            "news",
+            "transcripts",
+            "market",
+            "economic",
+            "alternative",
+            DEFAULT_SHARD,
+        ]
+        assert shard_for(None) == DEFAULT_SHARD
+
+    def test_shards_for_routing_keys(self):
+        assert shards_for(None) == set(SHARDS)
+        assert shards_for({"type": "news_article"}) == {"news"}
+        assert shards_for({"type": {"$in": ["news_article", "xbrl_fact"]}}) == {
+            "news",
+            "filings",
+        }
+        assert shards_for({"$and": [{"type": "edgar_filing"}, {"ticker": "AAPL"}]}) == {
+            "filings"
+        }
+        assert shards_for(
+            {"$or": [{"type": "news_article"}, {"type": "esg_rating"}]}
+        ) == {"news", "alternative"}
+
+    def test_shards_for_unrouted_values(self):
+        # Other routes and the default shard can hold an unknown type
+        assert shards_for({"type": "pdf"}) == {
+            "transcripts",
+            "market",
+            "economic",
+            DEFAULT_SHARD,
+        }
+        assert shards_for({"source": "fred"}) == {
+            "filings",
+            "news",
+            "alternative",
+            "transcripts",
+            "economic",
+        }
+        assert shards_for({"ticker": "AAPL"}) == set(SHARDS)
+        assert shards_for({"type": {"$ne": "news_article"}}) == set(SHARDS)
+
+    def test_metadata_matches(self):
+        metadata = {"type": "news_article", "year": 2024, "ticker": "AAPL"}
+        assert metadata_matches(metadata, None)
+        assert metadata_matches(metadata, {"type": "news_article"})
+        assert metadata_matches(
+            metadata,
+            {"$and": [{"year": {"$gte": 2020}}, {"ticker": {"$in": ["AAPL"]}}]},
+        )
+        assert not metadata_matches(metadata, {"year": {"$lt": 2020}})
+        assert not metadata_matches(metadata, {"sector": {"$ne": "energy"}})
+        assert metadata_matches(
+            metadata, {"$or": [{"ticker": "MSFT"}, {"type": "news_article"}]}
+        )
+        with pytest.raises(VectorStoreError):
+            metadata_matches(metadata, {"ticker": {"$regex": "A.*"}})
+
+
+class TestShardedStore:
+    """Test cases for ShardedStore."""
+
+    def test_writes_are_routed(self, sharded):
+        store, _, ids = sharded
+        assert isinstance(store, ShardedStore)
+        assert ids == [f"doc_{i}" for i in range(len(METADATAS))]
+        assert store.count() == len(METADATAS)
+        assert {name: shard.count() for name, shard in store.shards.items()} == {
+            shard: 1 for shard in SHARDS
+        }
+        assert store.shards["news"].collection_name == "docs_news"
+
+    def test_focused_query_touches_one_shard(self, sharded):
+        store, vectors, _ = sharded
+        for name, shard in store.shards.items():
+            if name != "news":
+                shard.query_by_embedding = MagicMock(
+                    side_effect=AssertionError(f"queried shard {name}")
+                )
+
+        results = store.query_by_embedding(
+            vectors[0].tolist(), n_results=3, where={"type": "news_article"}
+        )
+        assert results["ids"] == ["doc_1"]
+
+    def test_fan_out_merges_by_distance(self, sharded):
+        store, vectors, _ = sharded
+        query = vectors[3] + 0.01
+        results = store.query_by_embedding(query.tolist(), n_results=len(METADATAS))
+
+        assert results["ids"][0] == "doc_3"
+        assert results["distances"] == sorted(results["distances"])
+        assert sorted(results["ids"]) == [f"doc_{i}" for i in range(len(METADATAS))]
+        filtered = store.query_by_embedding(
+            query.tolist(), n_results=5, where={"ticker": "AAPL"}
+        )
+        assert sorted(filtered["ids"]) == ["doc_0", "doc_1", "doc_5"]
+
+    def test_fan_out_spans_join_query_trace(self, sharded):
+        store, vectors, _ = sharded
+        for name, shard in store.shards.items():
+
+            def traced(*args, _query=shard.query_by_embedding, _name=name, **kwargs):
+                with stage("shard_search", shard=_name):
+                    return _query(*args, **kwargs)
+
+            shard.query_by_embedding = traced
+
+        with start_trace("rag.query", exporters=[]) as trace:
+            with stage("vector_search") as search:
+                store.query_by_embedding(vectors[0].tolist(), n_results=3)
+
+        shard_spans = [span for span in trace.spans if span.name == "shard_search"]
+        assert sorted(span.attributes["shard"] for span in shard_spans) == sorted(
+            SHARDS
+        )
+        assert all(span.parent_id == search.span_id for span in shard_spans)
+
+    def test_reads_and_deletes(self, sharded):
+        store, _, _ = sharded
+        assert store.get_by_ids(["doc_4", "missing", "doc_0"])["ids"] == [
+            "doc_4",
+            "doc_0",
+        ]
+        assert store.get_all(where={"type": "news_article"})["ids"] == ["doc_1"]
+        assert len(store.get_ids_by_metadata({"ticker": "AAPL"}, limit=2)) == 2
+
+        assert store.delete_documents(ids=["doc_2", "missing"]) == 1
+        assert store.delete_documents(where={"ticker": "MSFT"}) == 1
+        assert store.count() == len(METADATAS) - 2
+
+    def test_update_stays_in_shard(self, sharded, caplog):
+        store, _, _ = sharded
+        store.update_documents(["doc_1"], metadatas=[{"summary": "short"}])
+        metadata = store.shards["news"].get_by_ids(["doc_1"])["metadatas"][0]
+        assert metadata["summary"] == "short"
+        assert "routes" not in caplog.text
+
+        store.update_documents(["doc_1"], metadatas=[{"type": "esg_rating"}])
+        assert "routes 1 documents out of shard 'news'" in caplog.text
+        with pytest.raises(VectorStoreError, match="not found"):
+            store.update_documents(["missing"], documents=["text"])
+
+    def test_reset(self, sharded):
+        store, _, _ = sharded
+        store.reset()
+        assert store.count() == 0
+
+    def test_unsharded_by_default(self, tmp_path):
+        pytest.importorskip("hnswlib")
+        store = create_vector_store("docs", tmp_path, backend="hnsw")
+        assert not isinstance(store, ShardedStore)
+
+
+class TestShardedRetrieval:
+    """Test cases for RetrievalOptimizer over a sharded store."""
+
+    def test_filtered_hybrid_retrieval(self, sharded):
+        store, vectors, _ = sharded
+        embedding_generator = MagicMock()
+        embedding_generator.embed_query.return_value = vectors[1].tolist()
+        optimizer = RetrievalOptimizer(
+            chroma_store=store,
+            embedding_generator=embedding_generator,
+            use_hybrid_search=True,
+            use_reranking=False,
+            top_k_initial=5,
+            top_k_final=5,
+        )
+
+        documents = optimizer.retrieve("revenue report", where={"ticker": "AAPL"})
+        assert {doc.metadata["type"] for doc in documents} == {
+            "edgar_filing",
+            "news_article",
+            "esg_rating",
+        }
+        assert set(optimizer.bm25_indexes) == set(SHARDS)
+
+        optimizer.bm25_indexes.clear()
+        documents = optimizer.retrieve("revenue", where={"type": "news_article"})
+        assert [doc.metadata["type"] for doc in documents] == ["news_article"]
+        assert set(optimizer.bm25_indexes) == {"news"}
+
+    def test_bm25_scores_normalized_per_shard(self):
+        from rank_bm25 import BM25Okapi
+
+        def index(texts, domain):
+            documents = [
+                Document(page_content=text, metadata={"domain": domain})
+                for text in texts
+            ]
+            return BM25Okapi([t.split() for t in texts]), documents
+
+        store = MagicMock(spec=ShardedStore)
+        store.shards_for.return_value = ["news", "filings"]
+        optimizer = RetrievalOptimizer(
+            chroma_store=store,
+            embedding_generator=MagicMock(),
+            use_reranking=False,
+        )
+        # "revenue" is rare in news (high IDF) and common in filings (low IDF)
+        optimizer.bm25_indexes["news"] = index(
+            ["revenue rose", "revenue fell sharply today"]
+            + [f"market note {i}" for i in range(8)],
+            "news",
+        )
+        optimizer.bm25_indexes["filings"] = index(
+            ["revenue revenue table", "revenue note", "risk factors"], "filings"
+        )
+
+        documents = optimizer._bm25_retrieve("revenue", top_k=2)
+        assert [doc.metadata["domain"] for doc in documents] == ["news", "filings"]
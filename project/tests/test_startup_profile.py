@@ -0,0 +1,136 @@
+"""
+Tests for deferred imports and the startup import-time profiler.
+
+Verifies that heavy optional dependencies are not imported at module load
+time and that importing the API stays within the startup budget.
+"""
+
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.utils.lazy_imports import (
+    LazyAttribute,
+    LazyModule,
+    is_available,
+    lazy_attr,
+    lazy_import,
+)
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Generous default so slow CI machines pass; importing torch or
+# sentence-transformers eagerly blows well past it.
+STARTUP_IMPORT_BUDGET_MS = float(os.getenv("STARTUP_IMPORT_BUDGET_MS", "3000"))
+
+
+def _load_profile_script():
+    """Load scripts/profile_startup.py as a module."""
+    spec = importlib.util.spec_from_file_location(
+        "profile_startup", PROJECT_ROOT / "scripts" / "profile_startup.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _modules_loaded_by(module: str) -> set:
+    """Import a module in a fresh interpreter and return sys.modules keys."""
+    code = (
+        f"import json, sys, {module}; "
+        "print(json.dumps([k for k, v in sys.modules.items() if v is not None]))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=str(PROJECT_ROOT),
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+    assert result.returncode == 0, result.stderr
+    # Loggers also write to stdout; the module list is the last line
+    return set(json.loads(result.stdout.strip().splitlines()[-1]))
+
+
+class TestLazyImports:
+    """Test deferred import helpers."""
+
+    def test_is_available(self):
+        """Test availability check for present and missing modules."""
+        assert is_available("json") is True
+        assert is_available("json", "os") is True
+        assert is_available("definitely_not_a_real_module_xyz") is False
+
+    def test_lazy_import_defers_until_access(self):
+        """Test lazy module only imports on attribute access."""
+        module = lazy_import("json")
+        assert isinstance(module, LazyModule)
+        assert "deferred" in repr(module)
+        assert module.dumps({"a": 1}) == '{"a": 1}'
+        assert "loaded" in repr(module)
+
+    def test_lazy_attr_resolves_on_call(self):
+        """Test lazy attribute resolves and calls the target."""
+        ordered_dict = lazy_attr("collections", "OrderedDict")
+        assert isinstance(ordered_dict, LazyAttribute)
+        assert ordered_dict(a=1) == {"a": 1}
+
+    def test_lazy_attr_fallback(self):
+        """Test lazy attribute falls back to alternative modules."""
+        dumps = lazy_attr("definitely_not_a_real_module_xyz", "dumps", ("json",))
+        assert dumps([1]) == "[1]"
+
+    def test_lazy_attr_missing_raises_import_error(self):
+        """Test lazy attribute raises ImportError when unresolvable."""
+        missing = lazy_attr("definitely_not_a_real_module_xyz", "Thing")
+        with pytest.raises(ImportError):
+            missing()
+
+
+@pytest.mark.slow
+class TestStartupImports:
+    """Test import-time behaviour of application modules."""
+
+    def test_pipeline_import_defers_heavy_dependencies(self):
+        """Test importing the pipeline does not load heavy optional deps."""
+        loaded = _modules_loaded_by("app.ingestion.pipeline")
+        for heavy in (
+            "torch",
+            "transformers",
+            "sentence_transformers",
+            "arelle",
+            "yfinance",
+            "apscheduler",
+            "feedparser",
+            "pandas",
+        ):
+            assert heavy not in loaded, f"{heavy} imported eagerly"
+
+    def test_parse_importtime(self):
+        """Test parsing of -X importtime output."""
+        profile_startup = _load_profile_script()
+        output = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       100 |        100 |     json.decoder\n"
+            "import time:       200 |        300 |   json\n"
+            "import time:        50 |        350 | app\n"
+        )
+        timings = profile_startup.parse_importtime(output)
+        assert [t.module for t in timings] == ["json.decoder", "json", "app"]
+        assert [t.depth for t in timings] == [2, 1, 0]
+        assert timings[2].cumulative_ms == pytest.approx(0.35)
+
+    def test_api_import_within_budget(self):
+        """Test importing app.api.main stays within the startup budget."""
+        profile_startup = _load_profile_script()
+        profile = profile_startup.profile_import("app.api.main")
+        top = profile_startup.format_report(profile, profile.top(15))
+        assert profile.total_ms <= STARTUP_IMPORT_BUDGET_MS, (
+            f"app.api.main import took {profile.total_ms:.0f} ms "
+            f"(budget {STARTUP_IMPORT_BUDGET_MS:.0f} ms)\n{top}"
+        )
@@ -0,0 +1,153 @@
+"""
+Benchmark for bulk stock data normalization.
+
+Normalizes 10 years of daily bars for 500 tickers through the batch path
+used by bulk stock ingestion and checks it stays within a time budget, and
+checks the formatted text against fixed output of the original row-by-row
+implementation.
+"""
+
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.ingestion.stock_data_normalizer import StockDataNormalizer
+
+TICKER_COUNT = 500
+TRADING_DAYS = 2520  # ~10 years of daily bars
+
+# Generous default so slow CI machines pass; row-by-row formatting of the
+# same universe takes several times longer.
+NORMALIZE_BUDGET_S = float(os.getenv("STOCK_NORMALIZE_BUDGET_S", "10"))
+
+
+@pytest.fixture(scope="module")
+def universe():
+    """Build price histories for TICKER_COUNT tickers."""
+    rng = np.random.default_rng(42)
+    dates = pd.bdate_range(
+        end="2024-12-31", periods=TRADING_DAYS, tz="America/New_York"
+    )
+    closes = 100 * np.exp(
+        np.cumsum(rng.normal(0, 0.01, (TICKER_COUNT, TRADING_DAYS)), axis=1)
+    )
+    volumes = rng.integers(100_000, 50_000_000, (TICKER_COUNT, TRADING_DAYS))
+    return {
+        f"T{i:03d}": {
+            "history": pd.DataFrame(
+                {
+                    "Open": closes[i] * 0.99,
+                    "High": closes[i] * 1.01,
+                    "Low": closes[i] * 0.98,
+                    "Close": closes[i],
+                    "Volume": volumes[i],
+                },
+                index=dates,
+            )
+        }
+        for i in range(TICKER_COUNT)
+    }
+
+
+@pytest.mark.slow
+class TestStockNormalizerBenchmark:
+    """Benchmark batch normalization of a large universe."""
+
+    def test_normalize_batch_within_budget(self, universe):
+        """Test 500 tickers x 10 years of daily bars normalize within budget."""
+        start = time.perf_counter()
+        documents = StockDataNormalizer.normalize_batch(universe)
+        elapsed = time.perf_counter() - start
+
+        assert len(documents) == TICKER_COUNT
+        assert elapsed < NORMALIZE_BUDGET_S, (
+            f"Normalized {TICKER_COUNT} tickers x {TRADING_DAYS} bars in "
+            f"{elapsed:.2f}s (budget {NORMALIZE_BUDGET_S:.0f}s)"
+        )
+
+
+# Output of the original row-by-row normalize_historical_prices for
+# SAMPLE_HISTORIES with max_rows=3
+EXPECTED_HISTORY_TEXTS = {
+    "AAPL": (
+        "Historical Price Data for AAPL\n"
+        "Period: 2024-12-26 00:00:00-05:00 to 2024-12-31 00:00:00-05:00\n"
+        "Total Trading Days: 4\n"
+        "\n"
+        "Price Summary:\n"
+        "  Current Price: $249.00\n"
+        "  Highest Price: $254.49\n"
+        "  Lowest Price: $249.00\n"
+        "  Average Price: $251.53\n"
+        "\n"
+        "Volume Summary:\n"
+        "  Average Volume: 29,926,525\n"
+        "  Highest Volume: 55,740,700\n"
+        "\n"
+        "Recent Price History:\n"
+        "  2024-12-27: Close=$252.20, Volume=1,250,000\n"
+        "  2024-12-30: Close=$250.43, Volume=39,480,700\n"
+        "  2024-12-31: Close=$249.00, Volume=55,740,700"
+    ),
+    "MSFT": (
+        "Historical Price Data for MSFT\n"
+        "Period: 2024-12-26 00:00:00-05:00 to 2024-12-27 00:00:00-05:00\n"
+        "Total Trading Days: 2\n"
+        "\n"
+        "Price Summary:\n"
+        "  Current Price: $424.83\n"
+        "  Highest Price: $430.53\n"
+        "  Lowest Price: $424.83\n"
+        "  Average Price: $427.68\n"
+        "\n"
+        "Volume Summary:\n"
+        "  Average Volume: 19,662,500\n"
+        "  Highest Volume: 21,207,300\n"
+        "\n"
+        "Recent Price History:\n"
+        "  2024-12-26: Close=$430.53, Volume=18,117,700\n"
+        "  2024-12-27: Close=$424.83, Volume=21,207,300"
+    ),
+}
+
+
+def _sample_histories():
+    """Build small histories whose expected text is fixed above."""
+    dates = pd.bdate_range("2024-12-26", periods=4, tz="America/New_York")
+    return {
+        "AAPL": pd.DataFrame(
+            {
+                "Open": [250.1, 252.3, 251.0, 249.9],
+                "High": [255.0, 254.2, 253.3, 252.1],
+                "Low": [249.5, 250.0, 248.75, 247.0],
+                "Close": [254.49, 252.2, 250.425, 248.999],
+                "Volume": [23234700, 1250000, 39480700, 55740700],
+            },
+            index=dates,
+        ),
+        "MSFT": pd.DataFrame(
+            {"Close": [430.53, 424.83], "Volume": [18117700, 21207300]},
+            index=dates[:2],
+        ),
+    }
+
+
+def test_batch_matches_row_by_row_output():
+    """Test batch texts equal the original row-by-row formatting."""
+    texts = StockDataNormalizer.normalize_historical_prices_batch(
+        _sample_histories(), max_rows=3
+    )
+
+    assert texts == EXPECTED_HISTORY_TEXTS
+
+
+def test_single_ticker_matches_row_by_row_output():
+    """Test the single-ticker entry point keeps the original formatting."""
+    for ticker, history in _sample_histories().items():
+        text = StockDataNormalizer.normalize_historical_prices(
+            history, ticker, max_rows=3
+        )
+        assert text == EXPECTED_HISTORY_TEXTS[ticker]
@@ -0,0 +1,278 @@
+"""
+Tests for the local time-series store and incremental fetcher syncs.
+"""
+
+from unittest.mock import Mock, patch
+
+import pandas as pd
+import pytest
+
+from app.ingestion.fred_fetcher import FREDFetcher
+from app.ingestion.imf_fetcher import IMFFetcher
+from app.ingestion.timeseries_store import (
+    TimeSeriesStore,
+    TimeSeriesStoreError,
+    get_timeseries_store,
+    series_key,
+)
+from app.ingestion.world_bank_fetcher import WorldBankFetcher
+from app.ingestion.yfinance_fetcher import YFinanceFetcher, _period_start
+
+pytest.importorskip("pyarrow")
+
+
+def _series(start, periods, values=None, freq="D"):
+    """Build a date-indexed value series."""
+    index = pd.date_range(start, periods=periods, freq=freq)
+    return pd.Series(values or [float(i) for i in range(periods)], index=index)
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create a store in a temporary directory."""
+    return TimeSeriesStore(root=str(tmp_path / "store"))
+
+
+class TestTimeSeriesStore:
+    """Test storing, merging and syncing series."""
+
+    def test_series_key(self):
+        """Test keys are file-safe and skip missing parts."""
+        assert series_key("AAPL", "1d") == "AAPL_1d"
+        assert series_key("GDP", None, "avg") == "GDP_avg"
+        assert series_key("NY.GDP.MKTP.CD", "CHN/USA") == "NY.GDP.MKTP.CD_CHN-USA"
+
+    def test_merge_and_read(self, store):
+        """Test merged data is sorted, deduplicated and range-sliced."""
+        store.merge("fred", "UNRATE", _series("2024-01-03", 3))
+        store.merge("fred", "UNRATE", _series("2024-01-01", 3))
+
+        stored = store.read("fred", "UNRATE")
+        assert list(stored.index.day) == [1, 2, 3, 4, 5]
+        assert store.last_index("fred", "UNRATE") == pd.Timestamp("2024-01-05")
+        sliced = store.read("fred", "UNRATE", start="2024-01-02", end="2024-01-03")
+        assert len(sliced) == 2
+
+    def test_new_values_replace_revised_observations(self, store):
+        """Test re-fetched observations win over stored values."""
+        store.merge("fred", "GDP", _series("2024-01-01", 2, [1.0, 2.0]))
+        store.merge("fred", "GDP", _series("2024-01-02", 1, [2.5]))
+
+        assert store.read("fred", "GDP")["value"].tolist() == [1.0, 2.5]
+
+    def test_sync_fetches_only_new_observations(self, store):
+        """Test later syncs request data from the last stored date."""
+        fetch = Mock(return_value=_series("2024-01-01", 3))
+        store.sync("fred", "GDP", fetch, start="2024-01-01")
+        fetch.assert_called_once_with("2024-01-01")
+
+        fetch.return_value = _series("2024-01-03", 2, [9.0, 10.0])
+        stored, fetched = store.sync("fred", "GDP", fetch, start="2024-01-02")
+
+        assert fetch.call_args[0][0] == pd.Timestamp("2024-01-03")
+        assert fetched == 2
+        assert stored["value"].tolist() == [0.0, 1.0, 9.0, 10.0]
+
+    def test_plan_sync_flags_resume_even_when_since_is_start(self, store):
+        """Test resuming is reported explicitly, not inferred from identity."""
+        store.sync(
+            "fred",
+            "GDP",
+            Mock(return_value=_series("2024-01-01", 3)),
+            start="2024-01-01",
+        )
+        start = store.last_index("fred", "GDP")
+
+        with patch.object(store, "last_index", return_value=start):
+            since, needed, incremental = store.plan_sync("fred", "GDP", start=start)
+
+        assert since is start
+        assert needed
+        assert incremental
+
+    def test_sync_skips_fetch_when_range_is_stored(self, store):
+        """Test nothing is fetched when the stored series reaches end."""
+        store.sync("fred", "GDP", Mock(return_value=_series("2024-01-01", 5)))
+        fetch = Mock()
+
+        _, fetched = store.sync("fred", "GDP", fetch, end="2024-01-04")
+
+        fetch.assert_not_called()
+        assert fetched == 0
+
+    def test_sync_refetches_earlier_start(self, store):
+        """Test a start before the synced range triggers a full fetch."""
+        initial = Mock(return_value=_series("2024-01-05", 2))
+        store.sync("fred", "GDP", initial, start="2024-01-05")
+        fetch = Mock(return_value=_series("2024-01-01", 6))
+
+        store.sync("fred", "GDP", fetch, start="2024-01-01")
+
+        fetch.assert_called_once_with("2024-01-01")
+        assert store.read_metadata("fred", "GDP")["synced_from"] == "2024-01-01"
+
+    def test_unreadable_file_raises(self, store):
+        """Test a corrupt Parquet file raises TimeSeriesStoreError."""
+        data_path, _ = store._paths("fred", "GDP")
+        data_path.parent.mkdir(parents=True)
+        data_path.write_bytes(b"not parquet")
+
+        with pytest.raises(TimeSeriesStoreError):
+            store.read("fred", "GDP")
+
+    def test_shared_store_disabled(self, monkeypatch):
+        """Test the shared store is None when disabled."""
+        from app.utils.config import config
+
+        assert get_timeseries_store() is not None
+        monkeypatch.setattr(config, "timeseries_store_enabled", False)
+        assert get_timeseries_store() is None
+
+
+class TestFetcherSync:
+    """Test fetchers request only new observations."""
+
+    @patch("app.ingestion.fred_fetcher.Fred")
+    def test_fred_incremental_fetch(self, mock_fred_class, store):
+        """Test FRED refreshes start at the last stored observation."""
+        mock_fred = Mock()
+        mock_fred_class.return_value = mock_fred
+        mock_fred.get_series.return_value = _series("2024-01-01", 3, freq="MS")
+        mock_fred.get_series_info.return_value = {"title": "Unemployment Rate"}
+        fetcher = FREDFetcher(
+            api_key="test-key", rate_limit_delay=0, timeseries_store=store
+        )
+
+        fetcher.fetch_series("UNRATE", start_date="2024-01-01")
+        mock_fred.get_series.return_value = _series(
+            "2024-03-01", 2, [2.5, 3.0], freq="MS"
+        )
+        result = fetcher.fetch_series("UNRATE", start_date="2024-01-01")
+
+        assert mock_fred.get_series.call_args[1]["start"] == "2024-03-01"
+        assert result["data"].tolist() == [0.0, 1.0, 2.5, 3.0]
+        assert result["metadata"]["title"] == "Unemployment Rate"
+
+    @patch("app.ingestion.fred_fetcher.Fred")
+    def test_fred_falls_back_without_store(self, mock_fred_class, store):
+        """Test store errors fall back to a direct download."""
+        mock_fred = Mock()
+        mock_fred_class.return_value = mock_fred
+        mock_fred.get_series.return_value = _series("2024-01-01", 3)
+        mock_fred.get_series_info.return_value = {}
+        store.sync = Mock(side_effect=TimeSeriesStoreError("disk full"))
+        fetcher = FREDFetcher(
+            api_key="test-key", rate_limit_delay=0, timeseries_store=store
+        )
+
+        result = fetcher.fetch_series("UNRATE")
+
+        assert len(result["data"]) == 3
+
+    @patch("app.ingestion.world_bank_fetcher.wb")
+    def test_world_bank_incremental_fetch(self, mock_wb, store):
+        """Test World Bank refreshes request years from the last stored year."""
+        pytest.importorskip("world_bank_data")
+        mock_wb.get_series.return_value = pd.DataFrame(
+            {"USA": [1.0, 2.0], "CHN": [3.0, 4.0]}, index=[2020, 2021]
+        )
+        mock_wb.get_indicators.return_value = pd.DataFrame([{"name": "GDP"}])
+        fetcher = WorldBankFetcher(rate_limit_delay=0, timeseries_store=store)
+
+        fetcher.fetch_indicator("NY.GDP.MKTP.CD", country_codes=["USA", "CHN"])
+        mock_wb.get_series.return_value = pd.DataFrame(
+            {"USA": [2.5, 5.0], "CHN": [4.0, 6.0]}, index=[2021, 2022]
+        )
+        result = fetcher.fetch_indicator("NY.GDP.MKTP.CD", country_codes=["USA", "CHN"])
+
+        assert mock_wb.get_series.call_args[1]["date"].startswith("2021:")
+        assert result["data"]["USA"].tolist() == [1.0, 2.5, 5.0]
+        assert result["metadata"]["name"] == "GDP"
+
+    def test_world_bank_series_is_reshaped(self):
+        """Test get_series MultiIndex output becomes a year x country frame."""
+        from app.ingestion.world_bank_fetcher import _to_year_frame
+
+        data = pd.Series(
+            [1.0, 2.0, 3.0],
+            index=pd.MultiIndex.from_tuples(
+                [
+                    ("USA", "GDP", "2020"),
+                    ("USA", "GDP", "2021"),
+                    ("CHN", "GDP", "2021"),
+                ],
+                names=["Country", "Series", "Year"],
+            ),
+        )
+
+        frame = _to_year_frame(data)
+
+        assert list(frame.index) == [2020, 2021]
+        assert frame.loc[2021, "CHN"] == 3.0
+
+    @patch("app.ingestion.imf_fetcher.create_http_session")
+    def test_imf_incremental_fetch(self, mock_session_factory, store):
+        """Test IMF refreshes pass the last stored year as startPeriod."""
+        mock_session = Mock()
+        mock_session_factory.return_value = mock_session
+        responses = [
+            {"values": {"US": {"2020": 1.0, "2021": 2.0}}, "metadata": {"unit": "%"}},
+            {"values": {"US": {"2021": 2.5, "2022": 3.0}}, "metadata": {}},
+        ]
+        mock_session.get.return_value.json.side_effect = responses
+        fetcher = IMFFetcher(rate_limit_delay=0, timeseries_store=store)
+
+        fetcher.fetch_indicator("NGDP_RPCH")
+        result = fetcher.fetch_indicator("NGDP_RPCH")
+
+        assert mock_session.get.call_args[1]["params"]["startPeriod"] == "2021"
+        assert result["data"]["US"].tolist() == [1.0, 2.5, 3.0]
+        assert result["metadata"] == {"unit": "%"}
+
+    @patch("app.ingestion.yfinance_fetcher.yf")
+    def test_yfinance_incremental_fetch(self, mock_yf, store):
+        """Test daily price refreshes request bars from the last stored date."""
+        today = pd.Timestamp.today().normalize()
+        mock_ticker = Mock()
+        mock_ticker.history.return_value = pd.DataFrame(
+            {"Close": [1.0, 2.0, 3.0]},
+            index=pd.date_range(end=today - pd.Timedelta(days=1), periods=3),
+        )
+        mock_yf.Ticker.return_value = mock_ticker
+        fetcher = YFinanceFetcher(rate_limit_seconds=0.001, timeseries_store=store)
+
+        fetcher.fetch_historical_prices("AAPL", period="1mo", interval="1d")
+        mock_ticker.history.assert_called_with(period="1mo", interval="1d")
+        mock_ticker.history.return_value = pd.DataFrame(
+            {"Close": [3.5, 4.0]},
+            index=pd.date_range(end=today, periods=2),
+        )
+        result = fetcher.fetch_historical_prices("AAPL", period="1mo", interval="1d")
+
+        last_stored = (today - pd.Timedelta(days=1)).strftime("%Y-%m-%d")
+        assert mock_ticker.history.call_args[1]["start"] == last_stored
+        assert result["Close"].tolist() == [1.0, 2.0, 3.5, 4.0]
+
+    @patch("app.ingestion.yfinance_fetcher.yf")
+    def test_yfinance_intraday_not_stored(self, mock_yf, store):
+        """Test intraday intervals bypass the store."""
+        mock_ticker = Mock()
+        mock_ticker.history.return_value = pd.DataFrame(
+            {"Close": [1.0]}, index=pd.date_range("2024-01-01", periods=1)
+        )
+        mock_yf.Ticker.return_value = mock_ticker
+        fetcher = YFinanceFetcher(rate_limit_seconds=0.001, timeseries_store=store)
+
+        fetcher.fetch_historical_prices("AAPL", period="1d", interval="5m")
+
+        assert store.read("yfinance", "AAPL_5m") is None
+
+    def test_period_start(self):
+        """Test yfinance periods map to start dates."""
+        today = pd.Timestamp.today().normalize()
+
+        assert _period_start("max") is None
+        assert _period_start("ytd") == f"{today.year}-01-01"
+        assert _period_start("5d") == (today - pd.Timedelta(days=5)).strftime(
+            "%Y-%m-%d"
+        )
@@ -0,0 +1,225 @@
+"""
+Tests for RAG query latency tracing.
+"""
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, Mock
+
+import pytest
+from langchain_core.documents import Document
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import RunnableLambda
+
+from app.rag.chain import RAGQuerySystem
+from app.rag.filter_builder import FilterBuilder
+from app.rag.query_parser import QueryParser
+from app.utils.config import config
+from app.utils.metrics import rag_stage_duration_seconds
+from app.utils.tracing import (
+    OTLPFileSpanExporter,
+    PrometheusSpanExporter,
+    SpanExporter,
+    current_trace,
+    get_exporters,
+    map_in_context,
+    stage,
+    start_trace,
+    submit_in_context,
+)
+
+
+def _observations(stage_name):
+    """Return the number of observations of a stage histogram."""
+    for metric in rag_stage_duration_seconds.collect():
+        for sample in metric.samples:
+            if (
+                sample.name.endswith("_count")
+                and sample.labels.get("stage") == stage_name
+            ):
+                return sample.value
+    return 0
+
+
+class TestTracing:
+    """Test spans, timings and exporters."""
+
+    def test_stage_outside_trace_is_noop(self):
+        """Test stages without an active trace record nothing."""
+        with stage("embed_query") as span:
+            assert span is None
+        assert current_trace() is None
+
+    def test_timings_sum_repeated_stages(self):
+        """Test timings list stages in start order and sum repeats."""
+        with start_trace("rag.query", exporters=[]) as trace:
+            with stage("parse"):
+                pass
+            with stage("retrieve"):
+                with stage("embed_query"):
+                    pass
+                with stage("embed_query"):
+                    pass
+
+        timings = trace.timings()
+        assert list(timings) == ["parse", "retrieve", "embed_query", "total"]
+        assert timings["total"] >= timings["retrieve"] >= timings["embed_query"]
+        assert len(trace.spans) == 4
+        assert current_trace() is None
+
+    def test_nested_spans_have_parents(self):
+        """Test spans are parented to the enclosing span."""
+        with start_trace("rag.query", exporters=[]) as trace:
+            with stage("retrieve") as outer:
+                with stage("bm25", documents=3) as inner:
+                    pass
+
+        assert outer.parent_id == trace.root.span_id
+        assert inner.parent_id == outer.span_id
+        assert inner.attributes == {"documents": 3}
+
+    def test_worker_thread_spans_join_trace(self):
+        """Test stages run on pool threads are parented to the caller's span."""
+        barrier = threading.Barrier(2)
+
+        def search(shard):
+            with stage("shard_search", shard=shard) as span:
+                # Both spans are open at once
+                barrier.wait(timeout=5)
+            return span
+
+        with start_trace("rag.query", exporters=[]) as trace:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                with stage("vector_search") as outer:
+                    spans = map_in_context(executor, search, ["a", "b"])
+                fallback = submit_in_context(executor, search, "c")
+                barrier.wait(timeout=5)
+                late = fallback.result()
+
+        assert [span.attributes["shard"] for span in spans] == ["a", "b"]
+        assert all(span.parent_id == outer.span_id for span in spans)
+        assert late.parent_id == trace.root.span_id
+        assert len(trace.spans) == 4
+        assert trace.timings()["shard_search"] > 0
+
+    def test_plain_executor_does_not_join_trace(self):
+        """Test the trace is not visible to threads without a copied context."""
+        with start_trace("rag.query", exporters=[]):
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                assert executor.submit(current_trace).result() is None
+                assert submit_in_context(executor, current_trace).result()
+
+    def test_failed_stage_is_marked(self):
+        """Test a stage raising an error records the error and re-raises."""
+        with pytest.raises(ValueError):
+            with start_trace("rag.query", exporters=[]) as trace:
+                with stage("llm"):
+                    raise ValueError("boom")
+
+        assert trace.spans[0].attributes["error"] == "ValueError"
+        assert trace.root.end_ns > 0
+
+    def test_prometheus_exporter(self):
+        """Test span durations are observed per stage."""
+        before = _observations("rerank")
+
+        with start_trace("rag.query", exporters=[PrometheusSpanExporter()]):
+            with stage("rerank"):
+                pass
+
+        assert _observations("rerank") == before + 1
+
+    def test_otlp_file_exporter(self, tmp_path):
+        """Test traces are appended as OTLP/JSON resourceSpans lines."""
+        path = tmp_path / "spans.jsonl"
+        exporter = OTLPFileSpanExporter(str(path))
+
+        for _ in range(2):
+            with start_trace("rag.query", exporters=[exporter]) as trace:
+                with stage("vector_search", n_results=20):
+                    pass
+
+        lines = path.read_text().splitlines()
+        assert len(lines) == 2
+        spans = json.loads(lines[1])["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        root, child = spans
+        assert root["traceId"] == child["traceId"] == trace.trace_id
+        assert child["parentSpanId"] == root["spanId"]
+        assert int(child["endTimeUnixNano"]) >= int(child["startTimeUnixNano"])
+        assert child["attributes"] == [
+            {"key": "n_results", "value": {"intValue": "20"}}
+        ]
+
+    def test_exporter_errors_are_ignored(self):
+        """Test a failing exporter does not fail the traced block."""
+        exporter = Mock(spec=SpanExporter)
+        exporter.export.side_effect = OSError("disk full")
+
+        with start_trace("rag.query", exporters=[exporter]):
+            pass
+
+        exporter.export.assert_called_once()
+
+    def test_configured_exporters(self, monkeypatch, tmp_path):
+        """Test exporters are built from RAG_TRACING_EXPORTERS."""
+        monkeypatch.setattr(config, "rag_tracing_exporters", "prometheus, otlp_file")
+        monkeypatch.setattr(config, "rag_trace_file", str(tmp_path / "t.jsonl"))
+        exporters = get_exporters()
+        assert [type(e) for e in exporters] == [
+            PrometheusSpanExporter,
+            OTLPFileSpanExporter,
+        ]
+
+        monkeypatch.setattr(config, "rag_tracing_exporters", "unknown")
+        assert get_exporters() == []
+        monkeypatch.setattr(config, "rag_tracing_exporters", "prometheus")
+        monkeypatch.setattr(config, "rag_tracing_enabled", False)
+        assert get_exporters() == []
+
+
+class TestQueryTimings:
+    """Test RAGQuerySystem.query stage timings."""
+
+    def _system(self):
+        system = RAGQuerySystem.__new__(RAGQuerySystem)
+        system.query_parser = QueryParser()
+        system.filter_builder = FilterBuilder()
+        system.fact_lookup = None
+        system.prompt_engineer = None
+        system.memory = None
+        system.top_k = 5
+        system.embedding_generator = MagicMock(provider="test")
+        system._retrieve_context = MagicMock(
+            return_value=[Document(page_content="Revenue was $10B.", metadata={})]
+        )
+        system.prompt_template = ChatPromptTemplate.from_template(
+            "{conversation_history}{context}\n{question}"
+        )
+        system.llm = RunnableLambda(lambda prompt: "Answer")
+        system.chain = system._build_chain()
+        return system
+
+    def test_query_reports_timings(self):
+        """Test include_timings adds a breakdown of the query stages."""
+        system = self._system()
+
+        result = system.query("What was revenue in 2023?", include_timings=True)
+
+        assert result["answer"] == "Answer"
+        assert {"parse", "retrieve", "format_context", "llm", "total"} <= set(
+            result["timings"]
+        )
+        assert "timings" not in system.query("What was revenue?")
+
+    def test_context_is_retrieved_once(self):
+        """Test the chain uses the retrieved context instead of retrieving again."""
+        system = self._system()
+        prompts = []
+        system.llm = RunnableLambda(lambda prompt: prompts.append(prompt) or "ok")
+        system.chain = system._build_chain()
+
+        system.query("What was revenue?", enable_query_parsing=False)
+
+        system._retrieve_context.assert_called_once()
+        assert "Revenue was $10B." in prompts[0].to_string()
@@ -2,8 +2,11 @@
 Unit tests for transcript parser module.
 """
 
+import time
+
 import pytest
 
+from app.ingestion.processors.transcript_processor import _turn_sections
 from app.ingestion.transcript_parser import TranscriptParser, TranscriptParserError
 
 
@@ -179,3 +182,152 @@ class TestTranscriptParser:
 
         assert company is not None
         assert "Morgan" in company or "Stanley" in company
+
+
+def _long_call(speaker_count=32, turns_per_speaker=10):
+    """Build an earnings call with operator introductions and analyst turns."""
+    firms = sorted(TranscriptParser.ANALYST_COMPANIES)
+    lines = [
+        "Operator: Good day and welcome to the earnings call.",
+        "Tim Cook: Thank you. We expect revenue to grow in Q2. " * 4,
+        "Operator: We will now begin the question and answer session.",
+    ]
+    for turn in range(turns_per_speaker):
+        for idx in range(speaker_count):
+            name = f"Analyst {chr(65 + idx // 26)}{chr(97 + idx % 26)}"
+            if turn == 0:
+                firm = firms[idx % len(firms)].title()
+                lines.append(f"Operator: Next is {name} with {firm}.")
+            lines.append(f"{name}: Can you talk about margins in the quarter?")
+            lines.append("Tim Cook: Margins were strong and we anticipate more. " * 3)
+    return "\n".join(lines)
+
+
+class TestSpeakerTurns:
+    """Test single-pass turn segmentation and turn-based analysis."""
+
+    def test_segment_turns_offsets(self):
+        """Test turns span from one speaker label to the next."""
+        parser = TranscriptParser()
+        transcript = "Intro line\nJohn Smith: Welcome.\nJane Doe: Thank you."
+        turns = parser.segment_turns(transcript)
+
+        assert [turn.speaker for turn in turns] == ["John Smith", "Jane Doe"]
+        first, second = turns
+        assert transcript[first.start : first.end] == "John Smith: Welcome.\n"
+        assert transcript[first.text_start : first.end].strip() == "Welcome."
+        assert second.end == len(transcript)
+
+    def test_index_turns_groups_by_speaker(self):
+        """Test the index keeps first-seen names and merges case variants."""
+        parser = TranscriptParser()
+        transcript = "Tim Cook: One.\nOperator: Two.\nTim Cook: Three."
+        index = parser.index_turns(parser.segment_turns(transcript))
+
+        assert list(index) == ["Tim Cook", "Operator"]
+        assert len(index["Tim Cook"]) == 2
+
+    def test_operator_introduction_classifies_analyst(self):
+        """Test an analyst introduced by the operator gets role and firm."""
+        parser = TranscriptParser()
+        transcript = (
+            "Operator: Our next question comes from Erik Woodring with "
+            "Morgan Stanley.\n"
+            "Erik Woodring: Thanks for taking my question.\n"
+            "Luca Maestri: Thank you, Erik."
+        )
+        speakers = {s["name"]: s for s in parser.parse_speakers(transcript)}
+
+        assert speakers["Operator"]["role"] == "operator"
+        assert speakers["Erik Woodring"]["role"] == "analyst"
+        assert speakers["Erik Woodring"]["company"] == "Morgan Stanley"
+        assert speakers["Luca Maestri"]["role"] == "management"
+        assert speakers["Luca Maestri"]["company"] is None
+
+    def test_qa_pairs_from_turns(self):
+        """Test analyst turns become questions answered by management turns."""
+        parser = TranscriptParser()
+        transcript = (
+            "Tim Cook: Prepared remarks.\n"
+            "Operator: We will now take questions. First is Amit Daryanani "
+            "from Goldman Sachs.\n"
+            "Amit Daryanani: How is demand?\n"
+            "Tim Cook: Demand is strong.\n"
+            "Luca Maestri: Margins too.\n"
+            "Operator: That concludes the call."
+        )
+        turns = parser.segment_turns(transcript)
+        speakers = parser.parse_speakers(transcript, turns=turns)
+        qa = parser.extract_qa_from_turns(transcript, turns, speakers)
+
+        assert len(qa) == 1
+        assert qa[0]["question"] == "How is demand?"
+        assert qa[0]["analyst"] == "Amit Daryanani"
+        assert qa[0]["answer"] == (
+            "Tim Cook: Demand is strong.\nLuca Maestri: Margins too."
+        )
+
+    def test_commentary_covers_whole_turn(self):
+        """Test management commentary spans multi-line turns."""
+        parser = TranscriptParser()
+        transcript = (
+            "Tim Cook: We are pleased with our results this quarter.\n"
+            "revenue grew across every region and product line.\n"
+            "Operator: Thank you."
+        )
+        speakers = parser.parse_speakers(transcript)
+        commentary = parser.extract_management_commentary(transcript, speakers)
+
+        assert len(commentary) == 1
+        assert "every region" in commentary[0]["commentary"]
+
+    def test_parse_transcript_includes_turns(self):
+        """Test parsed transcripts carry turn offsets with roles."""
+        parser = TranscriptParser()
+        transcript = "Operator: Welcome.\nTim Cook: Thank you."
+        parsed = parser.parse_transcript({"ticker": "AAPL", "transcript": transcript})
+
+        assert parsed["turns"] == [
+            {"speaker": "Operator", "role": "operator", "start": 0, "end": 19},
+            {
+                "speaker": "Tim Cook",
+                "role": "management",
+                "start": 19,
+                "end": len(transcript),
+            },
+        ]
+        assert parsed["metadata"]["turn_count"] == 2
+
+    def test_long_call_parses_quickly(self):
+        """Test a call with 30+ speakers parses in well under a second."""
+        parser = TranscriptParser()
+        transcript = _long_call()
+
+        start = time.perf_counter()
+        parsed = parser.parse_transcript({"ticker": "AAPL", "transcript": transcript})
+        elapsed = time.perf_counter() - start
+
+        analysts = [s for s in parsed["speakers"] if s["role"] == "analyst"]
+        assert len(analysts) == 32
+        assert all(s["company"] for s in analysts)
+        assert parsed["metadata"]["qa_count"] == 320
+        assert elapsed < 0.5
+
+
+class TestTurnSections:
+    """Test turn-aware chunking sections for transcript documents."""
+
+    def test_short_turns_are_merged(self):
+        """Test consecutive turns are grouped up to the maximum length."""
+        turns = [
+            {"speaker": "Operator", "start": 0, "end": 20},
+            {"speaker": "Tim Cook", "start": 20, "end": 60},
+            {"speaker": "Operator", "start": 60, "end": 200},
+        ]
+
+        sections = _turn_sections(turns, offset=100, max_length=80)
+
+        assert sections == [
+            ("Operator, Tim Cook", 100, 160),
+            ("Operator", 160, 300),
+        ]
@@ -0,0 +1,175 @@
+"""
+Tests for ChromaDB index settings and the vector index tuning script.
+"""
+
+import importlib.util
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from chromadb.api.models.Collection import Collection
+
+from app.vector_db import ChromaStore, ChromaStoreError
+from benchmarks.vector_search import embedding_vectors
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+def _load_tuning_script():
+    """Load scripts/tune_vector_index.py as a module."""
+    spec = importlib.util.spec_from_file_location(
+        "tune_vector_index", PROJECT_ROOT / "scripts" / "tune_vector_index.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def populated(tmp_path):
+    """ChromaDB store with 300 documents and their vectors."""
+    store = ChromaStore(collection_name="tuning", persist_directory=tmp_path)
+    vectors = embedding_vectors(300, 16)
+    store.collection.add(
+        ids=[f"doc_{i}" for i in range(300)],
+        embeddings=vectors,
+        documents=[f"chunk {i}" for i in range(300)],
+        metadatas=[{"index": i} if i % 2 else None for i in range(300)],
+    )
+    return store, vectors
+
+
+class TestChromaStoreIndexSettings:
+    """Test cases for ChromaStore HNSW index settings."""
+
+    def test_configured_defaults(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("app.vector_db.chroma_store.config.chroma_hnsw_m", 24)
+        store = ChromaStore(collection_name="defaults", persist_directory=tmp_path)
+
+        assert store.index_settings() == {
+            "space": "l2",
+            "m": 24,
+            "ef_construction": 100,
+            "ef_search": 100,
+        }
+
+    def test_new_collection_settings(self, tmp_path):
+        store = ChromaStore(
+            collection_name="custom",
+            persist_directory=tmp_path,
+            space="cosine",
+            m=8,
+            ef_construction=50,
+            ef_search=20,
+        )
+
+        assert store.index_settings() == {
+            "space": "cosine",
+            "m": 8,
+            "ef_construction": 50,
+            "ef_search": 20,
+        }
+
+    def test_existing_collection(self, tmp_path, caplog):
+        ChromaStore(collection_name="existing", persist_directory=tmp_path, m=8)
+        reopened = ChromaStore(
+            collection_name="existing",
+            persist_directory=tmp_path,
+            m=32,
+            ef_search=40,
+        )
+
+        settings = reopened.index_settings()
+        assert settings["m"] == 8
+        assert settings["ef_search"] == 40
+        assert "m=8 (requested 32)" in caplog.text
+
+    def test_invalid_space(self, tmp_path):
+        with pytest.raises(ChromaStoreError, match="Invalid HNSW space"):
+            ChromaStore(persist_directory=tmp_path, space="hamming")
+
+    def test_rebuild(self, populated):
+        store, vectors = populated
+
+        assert store.rebuild(space="cosine", m=8, batch_size=64) == 300
+        assert store.index_settings() == {
+            "space": "cosine",
+            "m": 8,
+            "ef_construction": 100,
+            "ef_search": 100,
+        }
+        assert store.count() == 300
+        assert store.get_by_ids(["doc_3", "doc_4"])["metadatas"] == [
+            {"index": 3},
+            None,
+        ]
+        results = store.query_by_embedding(vectors[7].tolist(), n_results=1)
+        assert results["ids"] == ["doc_7"]
+        assert results["documents"] == ["chunk 7"]
+        names = {c.name for c in store.client.list_collections()}
+        assert names == {"tuning"}
+
+    def test_failed_rename_restores_collection(self, populated):
+        store, vectors = populated
+        original = store.collection
+        modify = Collection.modify
+
+        def fail_rename(collection, name=None, **kwargs):
+            if collection.name == "tuning__rebuild" and name == "tuning":
+                raise RuntimeError("rename failed")
+            return modify(collection, name=name, **kwargs)
+
+        with patch.object(Collection, "modify", fail_rename):
+            with pytest.raises(ChromaStoreError, match="rename failed"):
+                store.rebuild(m=8)
+
+        assert store.collection is original
+        assert store.collection.name == "tuning"
+        assert store.count() == 300
+        reopened = store.client.get_collection("tuning")
+        assert reopened.count() == 300
+
+
+class TestTuneVectorIndex:
+    """Test cases for scripts/tune_vector_index.py."""
+
+    def test_pareto_frontier(self):
+        tuning = _load_tuning_script()
+        points = [
+            {"name": "a", "recall": 0.80, "p50_ms": 1.0},
+            {"name": "b", "recall": 0.90, "p50_ms": 2.0},
+            {"name": "c", "recall": 0.85, "p50_ms": 3.0},
+            {"name": "d", "recall": 0.99, "p50_ms": 4.0},
+            {"name": "e", "recall": 0.80, "p50_ms": 1.0},
+        ]
+
+        frontier = tuning.pareto_frontier(points)
+        assert [p["name"] for p in frontier] == ["a", "b", "d"]
+        assert tuning.recommend(frontier, 0.85)["name"] == "b"
+        assert tuning.recommend(frontier, 0.999)["name"] == "d"
+        assert tuning.recommend([], 0.9) is None
+
+    def test_load_and_split_embeddings(self, populated):
+        tuning = _load_tuning_script()
+        store, vectors = populated
+
+        sample = tuning.load_embeddings(store, 100, seed=1)
+        assert sample.shape == (100, 16)
+        assert np.isin(sample[:, 0], vectors[:, 0]).all()
+        indexed, queries = tuning.split_queries(sample, 50)
+        assert indexed.shape == (90, 16)
+        assert queries.shape == (10, 16)
+
+    def test_evaluate_grid(self, tmp_path):
+        tuning = _load_tuning_script()
+        vectors = embedding_vectors(500, 16)
+        queries = embedding_vectors(20, 16, seed=1)
+
+        points = tuning.evaluate_grid(
+            vectors, queries, 5, ["l2"], [8], [50], [10, 100], tmp_path
+        )
+
+        assert [(p["m"], p["ef_search"]) for p in points] == [(8, 10), (8, 100)]
+        assert points[1]["recall"] >= 0.95
+        assert points[1]["p50_ms"] > 0
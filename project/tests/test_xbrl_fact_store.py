@@ -0,0 +1,374 @@
+"""
+Tests for streaming XBRL fact extraction, the fact store and numeric lookups.
+"""
+
+import io
+import zipfile
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.ingestion.edgar_fetcher import EdgarFetcher
+from app.ingestion.xbrl_fact_store import (
+    PERIOD_ANNUAL,
+    PERIOD_INSTANT,
+    PERIOD_QUARTERLY,
+    XBRLFactStore,
+)
+from app.ingestion.xbrl_parser import (
+    XBRLFact,
+    XBRLParser,
+    XBRLParserError,
+    iter_xbrl_facts,
+)
+from app.rag.chain import RAGQuerySystem
+from app.rag.fact_lookup import FactLookup
+from app.rag.filter_builder import FilterBuilder
+from app.rag.query_parser import QueryParser
+
+INSTANCE = b"""<?xml version="1.0" encoding="utf-8"?>
+<xbrli:xbrl xmlns:xbrli="http://www.xbrl.org/2003/instance"
+    xmlns:us-gaap="http://fasb.org/us-gaap/2024"
+    xmlns:iso4217="http://www.xbrl.org/2003/iso4217"
+    xmlns:xbrldi="http://xbrl.org/2006/xbrldi"
+    xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">
+  <us-gaap:Revenues contextRef="FY2024" unitRef="usd">391035000000</us-gaap:Revenues>
+  <xbrli:context id="FY2024">
+    <xbrli:entity>
+      <xbrli:identifier scheme="http://www.sec.gov/CIK">0000320193</xbrli:identifier>
+    </xbrli:entity>
+    <xbrli:period>
+      <xbrli:startDate>2023-10-01</xbrli:startDate>
+      <xbrli:endDate>2024-09-28</xbrli:endDate>
+    </xbrli:period>
+  </xbrli:context>
+  <xbrli:context id="Q4">
+    <xbrli:entity>
+      <xbrli:identifier scheme="http://www.sec.gov/CIK">0000320193</xbrli:identifier>
+    </xbrli:entity>
+    <xbrli:period>
+      <xbrli:startDate>2024-06-30</xbrli:startDate>
+      <xbrli:endDate>2024-09-28</xbrli:endDate>
+    </xbrli:period>
+  </xbrli:context>
+  <xbrli:context id="FY2024_iPhone">
+    <xbrli:entity>
+      <xbrli:identifier scheme="http://www.sec.gov/CIK">0000320193</xbrli:identifier>
+      <xbrli:segment>
+        <xbrldi:explicitMember dimension="srt:ProductOrServiceAxis"
+          >aapl:IPhoneMember</xbrldi:explicitMember>
+      </xbrli:segment>
+    </xbrli:entity>
+    <xbrli:period>
+      <xbrli:startDate>2023-10-01</xbrli:startDate>
+      <xbrli:endDate>2024-09-28</xbrli:endDate>
+    </xbrli:period>
+  </xbrli:context>
+  <xbrli:context id="I2024">
+    <xbrli:entity>
+      <xbrli:identifier scheme="http://www.sec.gov/CIK">0000320193</xbrli:identifier>
+    </xbrli:entity>
+    <xbrli:period><xbrli:instant>2024-09-28</xbrli:instant></xbrli:period>
+  </xbrli:context>
+  <xbrli:unit id="usd"><xbrli:measure>iso4217:USD</xbrli:measure></xbrli:unit>
+  <xbrli:unit id="usdPerShare">
+    <xbrli:divide>
+      <xbrli:unitNumerator><xbrli:measure>iso4217:USD</xbrli:measure></xbrli:unitNumerator>
+      <xbrli:unitDenominator><xbrli:measure>xbrli:shares</xbrli:measure></xbrli:unitDenominator>
+    </xbrli:divide>
+  </xbrli:unit>
+  <us-gaap:Revenues contextRef="Q4" unitRef="usd">94930000000</us-gaap:Revenues>
+  <us-gaap:Revenues contextRef="FY2024_iPhone" unitRef="usd"
+    >201183000000</us-gaap:Revenues>
+  <us-gaap:Assets contextRef="I2024" unitRef="usd">364980000000</us-gaap:Assets>
+  <us-gaap:EarningsPerShareDiluted contextRef="FY2024" unitRef="usdPerShare"
+    >6.08</us-gaap:EarningsPerShareDiluted>
+  <us-gaap:Liabilities contextRef="I2024" unitRef="usd" xsi:nil="true"/>
+  <us-gaap:DocumentType contextRef="FY2024">10-K</us-gaap:DocumentType>
+</xbrli:xbrl>
+"""
+
+
+def _zip(members):
+    """Build a zip archive from name -> bytes."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, content in members.items():
+            archive.writestr(name, content)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Fact store in a temporary database."""
+    fact_store = XBRLFactStore(db_path=str(tmp_path / "facts.db"))
+    yield fact_store
+    fact_store.close()
+
+
+@pytest.fixture
+def apple_store(store):
+    """Fact store holding Apple's FY2024 10-K facts."""
+    store.add_facts(
+        iter_xbrl_facts(INSTANCE),
+        cik="0000320193",
+        ticker="AAPL",
+        accession="0000320193-24-000123",
+        form_type="10-K",
+        filing_date="2024-11-01",
+    )
+    return store
+
+
+class TestIterXBRLFacts:
+    """Test the streaming XBRL instance parser."""
+
+    def test_numeric_facts(self):
+        """Test contexts and units are resolved, even when defined later."""
+        facts = list(iter_xbrl_facts(INSTANCE))
+
+        assert (
+            XBRLFact("Revenues", 391035000000.0, "USD", "2023-10-01", "2024-09-28")
+            in facts
+        )
+        assert XBRLFact("Assets", 364980000000.0, "USD", None, "2024-09-28") in facts
+        assert (
+            XBRLFact(
+                "EarningsPerShareDiluted",
+                6.08,
+                "USD/shares",
+                "2023-10-01",
+                "2024-09-28",
+            )
+            in facts
+        )
+
+    def test_skips_dimensional_nil_and_text_facts(self):
+        """Test segment facts, nil facts and non-numeric facts are dropped."""
+        facts = list(iter_xbrl_facts(INSTANCE))
+
+        assert len(facts) == 4
+        assert 201183000000.0 not in [fact.value for fact in facts]
+        concepts = {fact.concept for fact in facts}
+        assert "Liabilities" not in concepts
+        assert "DocumentType" not in concepts
+
+    def test_zip_archive(self):
+        """Test the instance is found among linkbases in a zip archive."""
+        archive = _zip(
+            {
+                "aapl-20240928.xsd": b"<schema/>",
+                "aapl-20240928_lab.xml": b"<linkbase/>",
+                "aapl-20240928_htm.xml": INSTANCE,
+            }
+        )
+
+        assert len(list(iter_xbrl_facts(archive))) == 4
+
+    def test_invalid_content(self):
+        """Test malformed instances raise XBRLParserError."""
+        with pytest.raises(XBRLParserError):
+            list(iter_xbrl_facts(b"<xbrl><unclosed"))
+        with pytest.raises(XBRLParserError):
+            XBRLParser().extract_facts(_zip({"readme.txt": b"no instance"}))
+
+
+class TestXBRLFactStore:
+    """Test fact storage and lookups."""
+
+    def test_lookup_by_period(self, apple_store):
+        """Test annual, quarterly and instant periods are told apart."""
+        annual = apple_store.get_facts("aapl", ["Revenues"], period=PERIOD_ANNUAL)
+        quarterly = apple_store.get_facts("AAPL", ["Revenues"], period=PERIOD_QUARTERLY)
+        instant = apple_store.get_facts("AAPL", ["Assets"], period=PERIOD_INSTANT)
+
+        assert [f["value"] for f in annual] == [391035000000.0]
+        assert annual[0]["duration_days"] == 363
+        assert [f["value"] for f in quarterly] == [94930000000.0]
+        assert instant[0]["period_start"] == ""
+        assert instant[0]["accession"] == "0000320193-24-000123"
+
+    def test_concept_fallback_and_year(self, apple_store):
+        """Test concepts are tried in order and years filter period ends."""
+        facts = apple_store.get_facts(
+            "AAPL", ["SalesRevenueNet", "Revenues"], period=PERIOD_ANNUAL, year=2024
+        )
+
+        assert facts[0]["concept"] == "Revenues"
+        assert apple_store.get_facts("AAPL", ["Revenues"], year=2023) == []
+
+    def test_reingestion_replaces_and_amendments_win(self, apple_store):
+        """Test re-adding a filing is idempotent and newer filings win."""
+        count = apple_store.count()
+        apple_store.add_facts(
+            iter_xbrl_facts(INSTANCE),
+            cik="0000320193",
+            ticker="AAPL",
+            accession="0000320193-24-000123",
+        )
+        assert apple_store.count() == count
+
+        apple_store.add_facts(
+            [XBRLFact("Assets", 365000000000.0, "USD", None, "2024-09-28")],
+            cik="0000320193",
+            ticker="AAPL",
+            accession="0000320193-25-000001",
+            form_type="10-K/A",
+            filing_date="2025-01-15",
+        )
+        facts = apple_store.get_facts("AAPL", ["Assets"], period=PERIOD_INSTANT)
+        assert [f["value"] for f in facts] == [365000000000.0]
+        assert apple_store.tickers() == {"AAPL"}
+
+
+class TestFactLookup:
+    """Test direct answers to numeric questions."""
+
+    @pytest.fixture
+    def lookup(self, apple_store):
+        return FactLookup(store=apple_store)
+
+    def test_answers_by_ticker_and_name(self, lookup):
+        """Test tickers and company names both resolve."""
+        by_ticker = lookup.answer("What was AAPL revenue in 2024?")
+        by_name = lookup.answer("apple's net sales")
+
+        assert by_ticker["numeric_lookup"] is True
+        assert by_ticker["chunks_used"] == 0
+        assert "$391,035,000,000 ($391.04 billion)" in by_ticker["answer"]
+        assert "fiscal year ended 2024-09-28" in by_ticker["answer"]
+        assert by_ticker["sources"][0]["type"] == "xbrl_fact"
+        assert by_ticker["sources"][0]["accession_number"] == "0000320193-24-000123"
+        assert by_name["answer"] == by_ticker["answer"]
+
+    def test_metric_kinds(self, lookup):
+        """Test per-share, instant and quarterly answers."""
+        assert "$6.08 per share" in lookup.answer("AAPL diluted EPS")["answer"]
+        assets = lookup.answer("Apple total assets")["answer"]
+        assert "as of 2024-09-28" in assets
+        quarter = lookup.answer("AAPL revenue last quarter")["answer"]
+        assert "$94,930,000,000" in quarter
+
+    def test_falls_through(self, lookup):
+        """Test questions that need retrieval or interpretation return None."""
+        assert lookup.answer("Why did AAPL revenue grow in 2024?") is None
+        assert lookup.answer("Compare Apple revenue to Microsoft") is None
+        assert lookup.answer("What are AAPL's main risk factors?") is None
+        assert lookup.answer("What was MSFT revenue?") is None
+        assert lookup.answer("AAPL total liabilities") is None
+        assert lookup.answer("AAPL revenue in 2019") is None
+
+    def test_company_names(self, apple_store):
+        """Test only distinctive or full names match, never ambiguous ones."""
+        names = {
+            "AAPL": "Apple Inc.",
+            "BAC": "BANK OF AMERICA CORP /DE/",
+            "AXP": "American Express Co",
+            "GM": "General Motors Co",
+            "JPM": "JPMorgan Chase & Co.",
+        }
+        directory = MagicMock()
+        directory.get_company_name.side_effect = names.get
+        lookup = FactLookup(store=apple_store, company_directory=directory)
+
+        stored = set(names)
+        assert lookup._find_tickers("Bank of America revenue", stored) == ["BAC"]
+        assert lookup._find_tickers("jpmorgan's net income", stored) == ["JPM"]
+        assert lookup._find_tickers("general motors assets", stored) == ["GM"]
+        assert lookup._find_tickers("Which bank had the most cash?", stored) == []
+        assert lookup._find_tickers("American revenue in general", stored) == []
+
+        names["APLE"] = "Apple Hospitality REIT, Inc."
+        stored.add("APLE")
+        assert lookup._find_tickers("apple revenue", stored) is None
+        assert lookup._find_tickers("AAPL revenue", stored) == ["AAPL"]
+
+    def test_missing_store_is_not_created(self, tmp_path):
+        """Test lookups without an ingested store do not create one."""
+        from app.utils.config import config
+
+        assert FactLookup().answer("AAPL revenue") is None
+        assert not (tmp_path / "xbrl").exists()
+        assert "xbrl" in config.xbrl_fact_store_path
+
+
+class TestRAGNumericLookup:
+    """Test the numeric lookup hook in RAGQuerySystem.query."""
+
+    def _system(self, lookup):
+        system = RAGQuerySystem.__new__(RAGQuerySystem)
+        system.query_parser = QueryParser()
+        system.filter_builder = FilterBuilder()
+        system.fact_lookup = lookup
+        system.memory = MagicMock()
+        system.top_k = 5
+        system.embedding_generator = MagicMock(provider="test")
+        system._retrieve_context = MagicMock(return_value=[])
+        return system
+
+    def test_numeric_question_skips_retrieval(self, apple_store):
+        """Test numeric questions are answered without retrieval or the LLM."""
+        system = self._system(FactLookup(store=apple_store))
+
+        result = system.query("What was AAPL revenue in 2024?")
+
+        assert result["numeric_lookup"] is True
+        assert "parsed_query" in result
+        system._retrieve_context.assert_not_called()
+        system.memory.save_context.assert_called_once_with(
+            inputs={"input": "What was AAPL revenue in 2024?"},
+            outputs={"output": result["answer"]},
+        )
+
+    def test_follow_ups_skip_lookup(self, apple_store):
+        """Test questions with conversation history go through retrieval."""
+        system = self._system(FactLookup(store=apple_store))
+        history = [{"role": "user", "content": "Tell me about Apple"}]
+
+        result = system.query(
+            "What was AAPL revenue in 2024?", conversation_history=history
+        )
+
+        assert "numeric_lookup" not in result
+        system._retrieve_context.assert_called_once()
+
+    def test_lookup_errors_fall_back(self):
+        """Test lookup failures continue with the regular pipeline."""
+        lookup = MagicMock()
+        lookup.answer.side_effect = RuntimeError("store unavailable")
+        system = self._system(lookup)
+
+        result = system.query("AAPL revenue")
+
+        assert "numeric_lookup" not in result
+        system._retrieve_context.assert_called_once()
+
+
+class TestEdgarFactIngestion:
+    """Test XBRL facts are stored during EDGAR ingestion."""
+
+    @patch.object(EdgarFetcher, "_download_xbrl_file")
+    def test_10k_facts_are_stored(self, mock_download_xbrl, store):
+        """Test the 10-K XBRL branch fills the fact store."""
+        mock_download_xbrl.return_value = INSTANCE
+        fetcher = EdgarFetcher(use_enhanced_parsing=True, fact_store=store)
+        metadata = {
+            "ticker": "AAPL",
+            "cik": "0000320193",
+            "form_type": "10-K",
+            "filing_date": "2024-11-01",
+            "accession_number": "0000320193-24-000123",
+        }
+
+        fetcher._parse_enhanced_form("10-K", "Annual report " * 20, metadata)
+
+        facts = store.get_facts("AAPL", ["Revenues"], period=PERIOD_ANNUAL)
+        assert facts[0]["value"] == 391035000000.0
+        assert facts[0]["form_type"] == "10-K"
+
+    def test_store_failures_are_logged(self, store):
+        """Test unparseable XBRL does not break ingestion."""
+        fetcher = EdgarFetcher(use_enhanced_parsing=True, fact_store=store)
+
+        assert fetcher._store_xbrl_facts(b"not xml", {"ticker": "AAPL"}) == 0
+        assert store.count() == 0
@@ -57,7 +57,8 @@ class TestYFinanceFetcher:
     def test_fetch_historical_prices_success(self, mock_yf, fetcher):
         """Test successful historical price fetching."""
         # Create mock DataFrame
-        dates = pd.date_range("2024-01-01", periods=5, freq="D")
+        # Recent bars: the requested period is read back from the store
+        dates = pd.date_range(end=pd.Timestamp.today().normalize(), periods=5, freq="D")
         mock_history = pd.DataFrame(
             {
                 "Open": [100.0, 101.0, 102.0, 103.0, 104.0],
@@ -162,7 +163,8 @@ class TestYFinanceFetcher:
         """Test fetching all data for a ticker."""
         # Mock all data sources
         mock_info = {"longName": "Apple Inc.", "currentPrice": 150.0}
-        dates = pd.date_range("2024-01-01", periods=5, freq="D")
+        # Recent bars: the requested period is read back from the store
+        dates = pd.date_range(end=pd.Timestamp.today().normalize(), periods=5, freq="D")
         mock_history = pd.DataFrame(
             {"Close": [150.0, 151.0, 152.0, 153.0, 154.0]}, index=dates
         )
@@ -201,6 +203,187 @@ class TestYFinanceFetcher:
         assert elapsed >= fetcher.rate_limit_seconds
 
 
+def _bulk_frame(symbols, dates):
+    """Build a yf.download(group_by="ticker") style frame."""
+    columns = pd.MultiIndex.from_product([symbols, ["Close", "Volume"]])
+    values = [[float(i)] * len(columns) for i in range(len(dates))]
+    return pd.DataFrame(values, index=dates, columns=columns)
+
+
+class TestBulkFetching:
+    """Tests for bulk multi-ticker fetching."""
+
+    @pytest.fixture
+    def dates(self):
+        """Recent daily dates (inside the default history period)."""
+        return pd.date_range(end=pd.Timestamp.today().normalize(), periods=3)
+
+    @patch("app.ingestion.yfinance_fetcher.yf")
+    def test_fetch_bulk_history_batches(self, mock_yf, dates, monkeypatch):
+        """Test tickers are downloaded in batches and split per ticker."""
+        monkeypatch.setattr("app.utils.config.config.yfinance_bulk_batch_size", 2)
+        monkeypatch.setattr("app.utils.config.config.timeseries_store_enabled", False)
+        mock_yf.download.side_effect = lambda batch, **kwargs: _bulk_frame(batch, dates)
+        fetcher = YFinanceFetcher(rate_limit_seconds=0.1)
+
+        histories = fetcher.fetch_bulk_history(["AAPL", "MSFT", "GOOGL"])
+
+        assert mock_yf.download.call_count == 2
+        assert list(histories) == ["AAPL", "MSFT", "GOOGL"]
+        assert list(histories["MSFT"].columns) == ["Close", "Volume"]
+        assert len(histories["GOOGL"]) == 3
+
+    @patch("app.ingestion.yfinance_fetcher.yf")
+    def test_fetch_bulk_history_is_incremental(self, mock_yf, dates, tmp_path):
+        """Test synced tickers only download bars from the last stored date."""
+        from app.ingestion.timeseries_store import TimeSeriesStore
+
+        store = TimeSeriesStore(root=str(tmp_path / "store"))
+        fetcher = YFinanceFetcher(timeseries_store=store, rate_limit_seconds=0.1)
+        mock_yf.download.return_value = _bulk_frame(["AAPL", "MSFT"], dates[:2])
+        fetcher.fetch_bulk_history(["AAPL", "MSFT"])
+        assert "period" in mock_yf.download.call_args[1]
+
+        mock_yf.download.return_value = _bulk_frame(["AAPL", "MSFT"], dates[1:])
+        histories = fetcher.fetch_bulk_history(["AAPL", "MSFT"])
+
+        assert mock_yf.download.call_count == 2
+        assert mock_yf.download.call_args[1]["start"] == dates[1].strftime("%Y-%m-%d")
+        assert len(histories["AAPL"]) == 3
+
+    @patch("app.ingestion.yfinance_fetcher.yf")
+    def test_failed_batch_falls_back_to_single_tickers(
+        self, mock_yf, dates, monkeypatch
+    ):
+        """Test a failing batch is retried per ticker and bad symbols skipped."""
+        monkeypatch.setattr("app.utils.config.config.timeseries_store_enabled", False)
+        mock_yf.download.side_effect = RuntimeError("batch rejected")
+
+        def make_ticker(symbol):
+            ticker = Mock()
+            if symbol == "BAD":
+                ticker.history.side_effect = RuntimeError("delisted")
+            else:
+                ticker.history.return_value = pd.DataFrame(
+                    {"Close": [1.0, 2.0, 3.0]}, index=dates
+                )
+            return ticker
+
+        mock_yf.Ticker.side_effect = make_ticker
+        fetcher = YFinanceFetcher(rate_limit_seconds=0.1)
+
+        histories = fetcher.fetch_bulk_history(["AAPL", "BAD", "MSFT"])
+
+        assert list(histories) == ["AAPL", "MSFT"]
+        assert len(histories["MSFT"]) == 3
+        assert [c.args[0] for c in mock_yf.Ticker.call_args_list] == [
+            "AAPL",
+            "BAD",
+            "MSFT",
+        ]
+
+    @patch("app.ingestion.yfinance_fetcher.yf")
+    def test_lowercase_tickers_match_uppercase_columns(
+        self, mock_yf, dates, monkeypatch
+    ):
+        """Test lower-case symbols are matched to yfinance's upper-case columns."""
+        monkeypatch.setattr("app.utils.config.config.timeseries_store_enabled", False)
+        mock_yf.download.return_value = _bulk_frame(["AAPL", "MSFT"], dates)
+        fetcher = YFinanceFetcher(rate_limit_seconds=0.1)
+
+        histories = fetcher.fetch_bulk_history(["aapl", "Msft"])
+
+        assert list(histories) == ["aapl", "Msft"]
+        assert len(histories["aapl"]) == 3
+
+    @patch("app.ingestion.yfinance_fetcher.yf")
+    def test_fetch_bulk_data(self, mock_yf, dates):
+        """Test per-ticker data is fetched concurrently and failures skipped."""
+        mock_yf.download.return_value = _bulk_frame(["AAPL", "BAD"], dates)
+
+        def make_ticker(symbol):
+            ticker = Mock()
+            ticker.info = {"longName": symbol} if symbol != "BAD" else {}
+            ticker.dividends = pd.Series([0.25], index=[dates[0]])
+            ticker.earnings = None
+            ticker.recommendations = pd.DataFrame()
+            return ticker
+
+        mock_yf.Ticker.side_effect = make_ticker
+        fetcher = YFinanceFetcher(rate_limit_seconds=0.1, max_workers=4)
+
+        results = fetcher.fetch_bulk_data(["AAPL", "BAD"])
+
+        assert list(results) == ["AAPL"]
+        data = results["AAPL"]
+        assert data["info"] == {"longName": "AAPL"}
+        assert len(data["history"]) == 3
+        assert len(data["dividends"]) == 1
+        assert data["earnings"].empty
+
+    def test_process_stock_tickers_uses_bulk_fetch(self, monkeypatch):
+        """Test the processor fetches and normalizes all tickers as one batch."""
+        from app.ingestion.processors.stock_processor import StockProcessor
+
+        monkeypatch.setattr("app.utils.config.config.yfinance_enabled", True)
+        fetcher = Mock()
+        fetcher.fetch_bulk_data.return_value = {
+            "AAPL": {"info": {"longName": "Apple Inc."}},
+            "MSFT": {"info": {"longName": "Microsoft"}},
+        }
+        loader = Mock()
+        loader.chunk_document.side_effect = lambda doc: [doc]
+        processor = StockProcessor(
+            loader, Mock(), Mock(), fetcher, StockDataNormalizer()
+        )
+
+        with patch(
+            "app.utils.document_processors.generate_and_store_embeddings",
+            return_value=["id1", "id2"],
+        ) as mock_store:
+            ids = processor.process_stock_tickers(["AAPL", "MSFT", "BAD"])
+
+        assert ids == ["id1", "id2"]
+        fetcher.fetch_bulk_data.assert_called_once_with(
+            ["AAPL", "MSFT", "BAD"], include_history=True
+        )
+        chunks = mock_store.call_args[1]["chunks"]
+        assert [c.metadata["ticker"] for c in chunks] == ["AAPL", "MSFT"]
+        fetcher.fetch_all_data.assert_not_called()
+
+    def test_process_stock_tickers_isolates_storage_failures(self, monkeypatch):
+        """Test a failing ticker does not lose the others when storing."""
+        from app.ingestion.processors.stock_processor import StockProcessor
+        from app.rag.embedding_factory import EmbeddingError
+
+        monkeypatch.setattr("app.utils.config.config.yfinance_enabled", True)
+        fetcher = Mock()
+        fetcher.fetch_bulk_data.return_value = {
+            "AAPL": {"info": {"longName": "Apple Inc."}},
+            "BAD": {"info": {"longName": "Bad Corp"}},
+            "MSFT": {"info": {"longName": "Microsoft"}},
+        }
+        loader = Mock()
+        loader.chunk_document.side_effect = lambda doc: [doc]
+        processor = StockProcessor(
+            loader, Mock(), Mock(), fetcher, StockDataNormalizer()
+        )
+
+        def store(chunks, **kwargs):
+            if any(c.metadata["ticker"] == "BAD" for c in chunks):
+                raise EmbeddingError("token limit exceeded")
+            return [f"id_{c.metadata['ticker']}" for c in chunks]
+
+        with patch(
+            "app.utils.document_processors.generate_and_store_embeddings",
+            side_effect=store,
+        ) as mock_store:
+            ids = processor.process_stock_tickers(["AAPL", "BAD", "MSFT"])
+
+        assert ids == ["id_AAPL", "id_MSFT"]
+        assert mock_store.call_count == 4
+
+
 class TestStockDataNormalizer:
     """Tests for StockDataNormalizer class."""
 